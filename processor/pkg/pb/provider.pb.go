@@ -21,6 +21,60 @@ const (
 	_ = protoimpl.EnforceVersion(protoimpl.MaxVersion - 20)
 )
 
+// How GetTickBars closes a bar.
+// 聚合K線類型
+type TickBarType int32
+
+const (
+	TickBarType_TICK_BAR_TYPE_UNSPECIFIED TickBarType = 0
+	TickBarType_TICK_BAR_TYPE_TIME        TickBarType = 1 // Clock-aligned bars of size seconds. 時間K線
+	TickBarType_TICK_BAR_TYPE_VOLUME      TickBarType = 2 // Bars of size traded volume. 成交量K線
+	TickBarType_TICK_BAR_TYPE_TICKS       TickBarType = 3 // Bars of size ticks. 筆數K線
+)
+
+// Enum value maps for TickBarType.
+var (
+	TickBarType_name = map[int32]string{
+		0: "TICK_BAR_TYPE_UNSPECIFIED",
+		1: "TICK_BAR_TYPE_TIME",
+		2: "TICK_BAR_TYPE_VOLUME",
+		3: "TICK_BAR_TYPE_TICKS",
+	}
+	TickBarType_value = map[string]int32{
+		"TICK_BAR_TYPE_UNSPECIFIED": 0,
+		"TICK_BAR_TYPE_TIME":        1,
+		"TICK_BAR_TYPE_VOLUME":      2,
+		"TICK_BAR_TYPE_TICKS":       3,
+	}
+)
+
+func (x TickBarType) Enum() *TickBarType {
+	p := new(TickBarType)
+	*p = x
+	return p
+}
+
+func (x TickBarType) String() string {
+	return protoimpl.X.EnumStringOf(x.Descriptor(), protoreflect.EnumNumber(x))
+}
+
+func (TickBarType) Descriptor() protoreflect.EnumDescriptor {
+	return file_provider_proto_enumTypes[0].Descriptor()
+}
+
+func (TickBarType) Type() protoreflect.EnumType {
+	return &file_provider_proto_enumTypes[0]
+}
+
+func (x TickBarType) Number() protoreflect.EnumNumber {
+	return protoreflect.EnumNumber(x)
+}
+
+// Deprecated: Use TickBarType.Descriptor instead.
+func (TickBarType) EnumDescriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{0}
+}
+
 // Action represents the side of the order (Buy/Sell).
 // 買賣別
 type Action int32
@@ -56,11 +110,11 @@ func (x Action) String() string {
 }
 
 func (Action) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[0].Descriptor()
+	return file_provider_proto_enumTypes[1].Descriptor()
 }
 
 func (Action) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[0]
+	return &file_provider_proto_enumTypes[1]
 }
 
 func (x Action) Number() protoreflect.EnumNumber {
@@ -69,7 +123,7 @@ func (x Action) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use Action.Descriptor instead.
 func (Action) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{0}
+	return file_provider_proto_rawDescGZIP(), []int{1}
 }
 
 // OrderType represents the time in force or order conditions.
@@ -110,11 +164,11 @@ func (x OrderType) String() string {
 }
 
 func (OrderType) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[1].Descriptor()
+	return file_provider_proto_enumTypes[2].Descriptor()
 }
 
 func (OrderType) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[1]
+	return &file_provider_proto_enumTypes[2]
 }
 
 func (x OrderType) Number() protoreflect.EnumNumber {
@@ -123,7 +177,7 @@ func (x OrderType) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use OrderType.Descriptor instead.
 func (OrderType) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{1}
+	return file_provider_proto_rawDescGZIP(), []int{2}
 }
 
 // StockPriceType represents the price setting method.
@@ -164,11 +218,11 @@ func (x StockPriceType) String() string {
 }
 
 func (StockPriceType) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[2].Descriptor()
+	return file_provider_proto_enumTypes[3].Descriptor()
 }
 
 func (StockPriceType) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[2]
+	return &file_provider_proto_enumTypes[3]
 }
 
 func (x StockPriceType) Number() protoreflect.EnumNumber {
@@ -177,7 +231,7 @@ func (x StockPriceType) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use StockPriceType.Descriptor instead.
 func (StockPriceType) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{2}
+	return file_provider_proto_rawDescGZIP(), []int{3}
 }
 
 // StockOrderLot represents the trading unit type for stocks.
@@ -224,11 +278,11 @@ func (x StockOrderLot) String() string {
 }
 
 func (StockOrderLot) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[3].Descriptor()
+	return file_provider_proto_enumTypes[4].Descriptor()
 }
 
 func (StockOrderLot) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[3]
+	return &file_provider_proto_enumTypes[4]
 }
 
 func (x StockOrderLot) Number() protoreflect.EnumNumber {
@@ -237,7 +291,7 @@ func (x StockOrderLot) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use StockOrderLot.Descriptor instead.
 func (StockOrderLot) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{3}
+	return file_provider_proto_rawDescGZIP(), []int{4}
 }
 
 // StockOrderCond represents the trading condition (Cash/Margin).
@@ -284,11 +338,11 @@ func (x StockOrderCond) String() string {
 }
 
 func (StockOrderCond) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[4].Descriptor()
+	return file_provider_proto_enumTypes[5].Descriptor()
 }
 
 func (StockOrderCond) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[4]
+	return &file_provider_proto_enumTypes[5]
 }
 
 func (x StockOrderCond) Number() protoreflect.EnumNumber {
@@ -297,7 +351,7 @@ func (x StockOrderCond) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use StockOrderCond.Descriptor instead.
 func (StockOrderCond) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{4}
+	return file_provider_proto_rawDescGZIP(), []int{5}
 }
 
 // FuturesPriceType represents the price setting method for futures.
@@ -338,11 +392,11 @@ func (x FuturesPriceType) String() string {
 }
 
 func (FuturesPriceType) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[5].Descriptor()
+	return file_provider_proto_enumTypes[6].Descriptor()
 }
 
 func (FuturesPriceType) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[5]
+	return &file_provider_proto_enumTypes[6]
 }
 
 func (x FuturesPriceType) Number() protoreflect.EnumNumber {
@@ -351,7 +405,7 @@ func (x FuturesPriceType) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use FuturesPriceType.Descriptor instead.
 func (FuturesPriceType) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{5}
+	return file_provider_proto_rawDescGZIP(), []int{6}
 }
 
 // FuturesOCType represents Open/Close position type for futures.
@@ -395,11 +449,11 @@ func (x FuturesOCType) String() string {
 }
 
 func (FuturesOCType) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[6].Descriptor()
+	return file_provider_proto_enumTypes[7].Descriptor()
 }
 
 func (FuturesOCType) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[6]
+	return &file_provider_proto_enumTypes[7]
 }
 
 func (x FuturesOCType) Number() protoreflect.EnumNumber {
@@ -408,7 +462,7 @@ func (x FuturesOCType) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use FuturesOCType.Descriptor instead.
 func (FuturesOCType) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{6}
+	return file_provider_proto_rawDescGZIP(), []int{7}
 }
 
 // SecurityType represents the financial instrument type.
@@ -452,11 +506,11 @@ func (x SecurityType) String() string {
 }
 
 func (SecurityType) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[7].Descriptor()
+	return file_provider_proto_enumTypes[8].Descriptor()
 }
 
 func (SecurityType) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[7]
+	return &file_provider_proto_enumTypes[8]
 }
 
 func (x SecurityType) Number() protoreflect.EnumNumber {
@@ -465,7 +519,7 @@ func (x SecurityType) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use SecurityType.Descriptor instead.
 func (SecurityType) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{7}
+	return file_provider_proto_rawDescGZIP(), []int{8}
 }
 
 // Exchange represents the trading venue.
@@ -509,11 +563,11 @@ func (x Exchange) String() string {
 }
 
 func (Exchange) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[8].Descriptor()
+	return file_provider_proto_enumTypes[9].Descriptor()
 }
 
 func (Exchange) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[8]
+	return &file_provider_proto_enumTypes[9]
 }
 
 func (x Exchange) Number() protoreflect.EnumNumber {
@@ -522,7 +576,7 @@ func (x Exchange) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use Exchange.Descriptor instead.
 func (Exchange) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{8}
+	return file_provider_proto_rawDescGZIP(), []int{9}
 }
 
 // Currency represents the trading currency.
@@ -614,11 +668,11 @@ func (x Currency) String() string {
 }
 
 func (Currency) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[9].Descriptor()
+	return file_provider_proto_enumTypes[10].Descriptor()
 }
 
 func (Currency) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[9]
+	return &file_provider_proto_enumTypes[10]
 }
 
 func (x Currency) Number() protoreflect.EnumNumber {
@@ -627,7 +681,7 @@ func (x Currency) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use Currency.Descriptor instead.
 func (Currency) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{9}
+	return file_provider_proto_rawDescGZIP(), []int{10}
 }
 
 // OptionRight represents Call or Put for options.
@@ -668,11 +722,11 @@ func (x OptionRight) String() string {
 }
 
 func (OptionRight) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[10].Descriptor()
+	return file_provider_proto_enumTypes[11].Descriptor()
 }
 
 func (OptionRight) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[10]
+	return &file_provider_proto_enumTypes[11]
 }
 
 func (x OptionRight) Number() protoreflect.EnumNumber {
@@ -681,7 +735,7 @@ func (x OptionRight) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use OptionRight.Descriptor instead.
 func (OptionRight) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{10}
+	return file_provider_proto_rawDescGZIP(), []int{11}
 }
 
 // Status represents the current state of an order.
@@ -737,11 +791,11 @@ func (x Status) String() string {
 }
 
 func (Status) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[11].Descriptor()
+	return file_provider_proto_enumTypes[12].Descriptor()
 }
 
 func (Status) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[11]
+	return &file_provider_proto_enumTypes[12]
 }
 
 func (x Status) Number() protoreflect.EnumNumber {
@@ -750,7 +804,7 @@ func (x Status) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use Status.Descriptor instead.
 func (Status) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{11}
+	return file_provider_proto_rawDescGZIP(), []int{12}
 }
 
 // OrderState represents the type of update in a callback.
@@ -794,11 +848,11 @@ func (x OrderState) String() string {
 }
 
 func (OrderState) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[12].Descriptor()
+	return file_provider_proto_enumTypes[13].Descriptor()
 }
 
 func (OrderState) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[12]
+	return &file_provider_proto_enumTypes[13]
 }
 
 func (x OrderState) Number() protoreflect.EnumNumber {
@@ -807,7 +861,7 @@ func (x OrderState) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use OrderState.Descriptor instead.
 func (OrderState) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{12}
+	return file_provider_proto_rawDescGZIP(), []int{13}
 }
 
 // QuoteType represents the type of market data.
@@ -848,11 +902,11 @@ func (x QuoteType) String() string {
 }
 
 func (QuoteType) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[13].Descriptor()
+	return file_provider_proto_enumTypes[14].Descriptor()
 }
 
 func (QuoteType) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[13]
+	return &file_provider_proto_enumTypes[14]
 }
 
 func (x QuoteType) Number() protoreflect.EnumNumber {
@@ -861,7 +915,7 @@ func (x QuoteType) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use QuoteType.Descriptor instead.
 func (QuoteType) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{13}
+	return file_provider_proto_rawDescGZIP(), []int{14}
 }
 
 // QuoteVersion represents the data version.
@@ -896,11 +950,11 @@ func (x QuoteVersion) String() string {
 }
 
 func (QuoteVersion) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[14].Descriptor()
+	return file_provider_proto_enumTypes[15].Descriptor()
 }
 
 func (QuoteVersion) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[14]
+	return &file_provider_proto_enumTypes[15]
 }
 
 func (x QuoteVersion) Number() protoreflect.EnumNumber {
@@ -909,7 +963,7 @@ func (x QuoteVersion) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use QuoteVersion.Descriptor instead.
 func (QuoteVersion) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{14}
+	return file_provider_proto_rawDescGZIP(), []int{15}
 }
 
 // DayTrade represents whether a stock is eligible for day trading.
@@ -950,11 +1004,11 @@ func (x DayTrade) String() string {
 }
 
 func (DayTrade) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[15].Descriptor()
+	return file_provider_proto_enumTypes[16].Descriptor()
 }
 
 func (DayTrade) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[15]
+	return &file_provider_proto_enumTypes[16]
 }
 
 func (x DayTrade) Number() protoreflect.EnumNumber {
@@ -963,7 +1017,7 @@ func (x DayTrade) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use DayTrade.Descriptor instead.
 func (DayTrade) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{15}
+	return file_provider_proto_rawDescGZIP(), []int{16}
 }
 
 // TickType represents the direction of the trade tick.
@@ -1004,11 +1058,11 @@ func (x TickType) String() string {
 }
 
 func (TickType) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[16].Descriptor()
+	return file_provider_proto_enumTypes[17].Descriptor()
 }
 
 func (TickType) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[16]
+	return &file_provider_proto_enumTypes[17]
 }
 
 func (x TickType) Number() protoreflect.EnumNumber {
@@ -1017,7 +1071,7 @@ func (x TickType) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use TickType.Descriptor instead.
 func (TickType) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{16}
+	return file_provider_proto_rawDescGZIP(), []int{17}
 }
 
 // ChangeType represents the price movement status (e.g., Limit Up).
@@ -1064,11 +1118,11 @@ func (x ChangeType) String() string {
 }
 
 func (ChangeType) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[17].Descriptor()
+	return file_provider_proto_enumTypes[18].Descriptor()
 }
 
 func (ChangeType) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[17]
+	return &file_provider_proto_enumTypes[18]
 }
 
 func (x ChangeType) Number() protoreflect.EnumNumber {
@@ -1077,7 +1131,7 @@ func (x ChangeType) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use ChangeType.Descriptor instead.
 func (ChangeType) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{17}
+	return file_provider_proto_rawDescGZIP(), []int{18}
 }
 
 // Unit represents the share unit.
@@ -1115,11 +1169,11 @@ func (x Unit) String() string {
 }
 
 func (Unit) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[18].Descriptor()
+	return file_provider_proto_enumTypes[19].Descriptor()
 }
 
 func (Unit) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[18]
+	return &file_provider_proto_enumTypes[19]
 }
 
 func (x Unit) Number() protoreflect.EnumNumber {
@@ -1128,7 +1182,7 @@ func (x Unit) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use Unit.Descriptor instead.
 func (Unit) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{18}
+	return file_provider_proto_rawDescGZIP(), []int{19}
 }
 
 // TradeType represents the type of trade (Common/DayTrade).
@@ -1166,11 +1220,11 @@ func (x TradeType) String() string {
 }
 
 func (TradeType) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[19].Descriptor()
+	return file_provider_proto_enumTypes[20].Descriptor()
 }
 
 func (TradeType) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[19]
+	return &file_provider_proto_enumTypes[20]
 }
 
 func (x TradeType) Number() protoreflect.EnumNumber {
@@ -1179,7 +1233,7 @@ func (x TradeType) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use TradeType.Descriptor instead.
 func (TradeType) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{19}
+	return file_provider_proto_rawDescGZIP(), []int{20}
 }
 
 // ScannerType represents the ranking criteria for the scanner.
@@ -1229,11 +1283,11 @@ func (x ScannerType) String() string {
 }
 
 func (ScannerType) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[20].Descriptor()
+	return file_provider_proto_enumTypes[21].Descriptor()
 }
 
 func (ScannerType) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[20]
+	return &file_provider_proto_enumTypes[21]
 }
 
 func (x ScannerType) Number() protoreflect.EnumNumber {
@@ -1242,7 +1296,7 @@ func (x ScannerType) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use ScannerType.Descriptor instead.
 func (ScannerType) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{20}
+	return file_provider_proto_rawDescGZIP(), []int{21}
 }
 
 // TicksQueryType represents the filter for tick queries.
@@ -1283,11 +1337,11 @@ func (x TicksQueryType) String() string {
 }
 
 func (TicksQueryType) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[21].Descriptor()
+	return file_provider_proto_enumTypes[22].Descriptor()
 }
 
 func (TicksQueryType) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[21]
+	return &file_provider_proto_enumTypes[22]
 }
 
 func (x TicksQueryType) Number() protoreflect.EnumNumber {
@@ -1296,7 +1350,7 @@ func (x TicksQueryType) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use TicksQueryType.Descriptor instead.
 func (TicksQueryType) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{21}
+	return file_provider_proto_rawDescGZIP(), []int{22}
 }
 
 // FetchStatus represents the success or failure of a data fetch.
@@ -1334,11 +1388,11 @@ func (x FetchStatus) String() string {
 }
 
 func (FetchStatus) Descriptor() protoreflect.EnumDescriptor {
-	return file_provider_proto_enumTypes[22].Descriptor()
+	return file_provider_proto_enumTypes[23].Descriptor()
 }
 
 func (FetchStatus) Type() protoreflect.EnumType {
-	return &file_provider_proto_enumTypes[22]
+	return &file_provider_proto_enumTypes[23]
 }
 
 func (x FetchStatus) Number() protoreflect.EnumNumber {
@@ -1347,7 +1401,7 @@ func (x FetchStatus) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use FetchStatus.Descriptor instead.
 func (FetchStatus) EnumDescriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{22}
+	return file_provider_proto_rawDescGZIP(), []int{23}
 }
 
 // Represents an empty message for requests/responses with no fields.
@@ -2961,29 +3015,29 @@ func (x *PlaceOrderRequest) GetOrder() *Order {
 	return nil
 }
 
-// Request to place a combination order.
-type PlaceComboOrderRequest struct {
+// Request to place a basket of orders.
+type PlaceOrdersRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	ComboContract *ComboContract         `protobuf:"bytes,1,opt,name=combo_contract,json=comboContract,proto3" json:"combo_contract,omitempty"`
-	Order         *ComboOrder            `protobuf:"bytes,2,opt,name=order,proto3" json:"order,omitempty"`
+	Orders        []*PlaceOrderRequest   `protobuf:"bytes,1,rep,name=orders,proto3" json:"orders,omitempty"`
+	Parallelism   int32                  `protobuf:"varint,2,opt,name=parallelism,proto3" json:"parallelism,omitempty"` // Max orders in flight (0 = server default; capped by the server).
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *PlaceComboOrderRequest) Reset() {
-	*x = PlaceComboOrderRequest{}
+func (x *PlaceOrdersRequest) Reset() {
+	*x = PlaceOrdersRequest{}
 	mi := &file_provider_proto_msgTypes[18]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *PlaceComboOrderRequest) String() string {
+func (x *PlaceOrdersRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*PlaceComboOrderRequest) ProtoMessage() {}
+func (*PlaceOrdersRequest) ProtoMessage() {}
 
-func (x *PlaceComboOrderRequest) ProtoReflect() protoreflect.Message {
+func (x *PlaceOrdersRequest) ProtoReflect() protoreflect.Message {
 	mi := &file_provider_proto_msgTypes[18]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -2995,49 +3049,48 @@ func (x *PlaceComboOrderRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use PlaceComboOrderRequest.ProtoReflect.Descriptor instead.
-func (*PlaceComboOrderRequest) Descriptor() ([]byte, []int) {
+// Deprecated: Use PlaceOrdersRequest.ProtoReflect.Descriptor instead.
+func (*PlaceOrdersRequest) Descriptor() ([]byte, []int) {
 	return file_provider_proto_rawDescGZIP(), []int{18}
 }
 
-func (x *PlaceComboOrderRequest) GetComboContract() *ComboContract {
+func (x *PlaceOrdersRequest) GetOrders() []*PlaceOrderRequest {
 	if x != nil {
-		return x.ComboContract
+		return x.Orders
 	}
 	return nil
 }
 
-func (x *PlaceComboOrderRequest) GetOrder() *ComboOrder {
+func (x *PlaceOrdersRequest) GetParallelism() int32 {
 	if x != nil {
-		return x.Order
+		return x.Parallelism
 	}
-	return nil
+	return 0
 }
 
-// Request to update an existing order's price and quantity.
-type UpdateOrderRequest struct {
+// Outcome of one order of a basket.
+type PlaceOrderResult struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Trade         *Trade                 `protobuf:"bytes,1,opt,name=trade,proto3" json:"trade,omitempty"`
-	Price         float64                `protobuf:"fixed64,2,opt,name=price,proto3" json:"price,omitempty"`
-	Quantity      int64                  `protobuf:"varint,3,opt,name=quantity,proto3" json:"quantity,omitempty"`
+	Trade         *Trade                 `protobuf:"bytes,1,opt,name=trade,proto3" json:"trade,omitempty"` // Resulting trade when the order was accepted.
+	Error         string                 `protobuf:"bytes,2,opt,name=error,proto3" json:"error,omitempty"` // Failure reason when it was not.
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *UpdateOrderRequest) Reset() {
-	*x = UpdateOrderRequest{}
+func (x *PlaceOrderResult) Reset() {
+	*x = PlaceOrderResult{}
 	mi := &file_provider_proto_msgTypes[19]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *UpdateOrderRequest) String() string {
+func (x *PlaceOrderResult) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*UpdateOrderRequest) ProtoMessage() {}
+func (*PlaceOrderResult) ProtoMessage() {}
 
-func (x *UpdateOrderRequest) ProtoReflect() protoreflect.Message {
+func (x *PlaceOrderResult) ProtoReflect() protoreflect.Message {
 	mi := &file_provider_proto_msgTypes[19]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -3049,54 +3102,47 @@ func (x *UpdateOrderRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use UpdateOrderRequest.ProtoReflect.Descriptor instead.
-func (*UpdateOrderRequest) Descriptor() ([]byte, []int) {
+// Deprecated: Use PlaceOrderResult.ProtoReflect.Descriptor instead.
+func (*PlaceOrderResult) Descriptor() ([]byte, []int) {
 	return file_provider_proto_rawDescGZIP(), []int{19}
 }
 
-func (x *UpdateOrderRequest) GetTrade() *Trade {
+func (x *PlaceOrderResult) GetTrade() *Trade {
 	if x != nil {
 		return x.Trade
 	}
 	return nil
 }
 
-func (x *UpdateOrderRequest) GetPrice() float64 {
-	if x != nil {
-		return x.Price
-	}
-	return 0
-}
-
-func (x *UpdateOrderRequest) GetQuantity() int64 {
+func (x *PlaceOrderResult) GetError() string {
 	if x != nil {
-		return x.Quantity
+		return x.Error
 	}
-	return 0
+	return ""
 }
 
-// Request to cancel a single order.
-type CancelOrderRequest struct {
+// Per-order results, in request order.
+type PlaceOrdersResponse struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Trade         *Trade                 `protobuf:"bytes,1,opt,name=trade,proto3" json:"trade,omitempty"`
+	Results       []*PlaceOrderResult    `protobuf:"bytes,1,rep,name=results,proto3" json:"results,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *CancelOrderRequest) Reset() {
-	*x = CancelOrderRequest{}
+func (x *PlaceOrdersResponse) Reset() {
+	*x = PlaceOrdersResponse{}
 	mi := &file_provider_proto_msgTypes[20]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *CancelOrderRequest) String() string {
+func (x *PlaceOrdersResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CancelOrderRequest) ProtoMessage() {}
+func (*PlaceOrdersResponse) ProtoMessage() {}
 
-func (x *CancelOrderRequest) ProtoReflect() protoreflect.Message {
+func (x *PlaceOrdersResponse) ProtoReflect() protoreflect.Message {
 	mi := &file_provider_proto_msgTypes[20]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -3108,40 +3154,41 @@ func (x *CancelOrderRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CancelOrderRequest.ProtoReflect.Descriptor instead.
-func (*CancelOrderRequest) Descriptor() ([]byte, []int) {
+// Deprecated: Use PlaceOrdersResponse.ProtoReflect.Descriptor instead.
+func (*PlaceOrdersResponse) Descriptor() ([]byte, []int) {
 	return file_provider_proto_rawDescGZIP(), []int{20}
 }
 
-func (x *CancelOrderRequest) GetTrade() *Trade {
+func (x *PlaceOrdersResponse) GetResults() []*PlaceOrderResult {
 	if x != nil {
-		return x.Trade
+		return x.Results
 	}
 	return nil
 }
 
-// Request to cancel a combination order.
-type CancelComboOrderRequest struct {
+// Request to place a combination order.
+type PlaceComboOrderRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Combotrade    *ComboTrade            `protobuf:"bytes,1,opt,name=combotrade,proto3" json:"combotrade,omitempty"`
+	ComboContract *ComboContract         `protobuf:"bytes,1,opt,name=combo_contract,json=comboContract,proto3" json:"combo_contract,omitempty"`
+	Order         *ComboOrder            `protobuf:"bytes,2,opt,name=order,proto3" json:"order,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *CancelComboOrderRequest) Reset() {
-	*x = CancelComboOrderRequest{}
+func (x *PlaceComboOrderRequest) Reset() {
+	*x = PlaceComboOrderRequest{}
 	mi := &file_provider_proto_msgTypes[21]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *CancelComboOrderRequest) String() string {
+func (x *PlaceComboOrderRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CancelComboOrderRequest) ProtoMessage() {}
+func (*PlaceComboOrderRequest) ProtoMessage() {}
 
-func (x *CancelComboOrderRequest) ProtoReflect() protoreflect.Message {
+func (x *PlaceComboOrderRequest) ProtoReflect() protoreflect.Message {
 	mi := &file_provider_proto_msgTypes[21]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -3153,40 +3200,49 @@ func (x *CancelComboOrderRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CancelComboOrderRequest.ProtoReflect.Descriptor instead.
-func (*CancelComboOrderRequest) Descriptor() ([]byte, []int) {
+// Deprecated: Use PlaceComboOrderRequest.ProtoReflect.Descriptor instead.
+func (*PlaceComboOrderRequest) Descriptor() ([]byte, []int) {
 	return file_provider_proto_rawDescGZIP(), []int{21}
 }
 
-func (x *CancelComboOrderRequest) GetCombotrade() *ComboTrade {
+func (x *PlaceComboOrderRequest) GetComboContract() *ComboContract {
 	if x != nil {
-		return x.Combotrade
+		return x.ComboContract
 	}
 	return nil
 }
 
-// Request to update the status of all orders in an account.
-type UpdateStatusRequest struct {
+func (x *PlaceComboOrderRequest) GetOrder() *ComboOrder {
+	if x != nil {
+		return x.Order
+	}
+	return nil
+}
+
+// Request to update an existing order's price and quantity.
+type UpdateOrderRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Account       *Account               `protobuf:"bytes,1,opt,name=account,proto3" json:"account,omitempty"`
+	Trade         *Trade                 `protobuf:"bytes,1,opt,name=trade,proto3" json:"trade,omitempty"`
+	Price         float64                `protobuf:"fixed64,2,opt,name=price,proto3" json:"price,omitempty"`
+	Quantity      int64                  `protobuf:"varint,3,opt,name=quantity,proto3" json:"quantity,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *UpdateStatusRequest) Reset() {
-	*x = UpdateStatusRequest{}
+func (x *UpdateOrderRequest) Reset() {
+	*x = UpdateOrderRequest{}
 	mi := &file_provider_proto_msgTypes[22]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *UpdateStatusRequest) String() string {
+func (x *UpdateOrderRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*UpdateStatusRequest) ProtoMessage() {}
+func (*UpdateOrderRequest) ProtoMessage() {}
 
-func (x *UpdateStatusRequest) ProtoReflect() protoreflect.Message {
+func (x *UpdateOrderRequest) ProtoReflect() protoreflect.Message {
 	mi := &file_provider_proto_msgTypes[22]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -3198,40 +3254,54 @@ func (x *UpdateStatusRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use UpdateStatusRequest.ProtoReflect.Descriptor instead.
-func (*UpdateStatusRequest) Descriptor() ([]byte, []int) {
+// Deprecated: Use UpdateOrderRequest.ProtoReflect.Descriptor instead.
+func (*UpdateOrderRequest) Descriptor() ([]byte, []int) {
 	return file_provider_proto_rawDescGZIP(), []int{22}
 }
 
-func (x *UpdateStatusRequest) GetAccount() *Account {
+func (x *UpdateOrderRequest) GetTrade() *Trade {
 	if x != nil {
-		return x.Account
+		return x.Trade
 	}
 	return nil
 }
 
-// Response containing a list of single trades.
-type ListTradesResponse struct {
+func (x *UpdateOrderRequest) GetPrice() float64 {
+	if x != nil {
+		return x.Price
+	}
+	return 0
+}
+
+func (x *UpdateOrderRequest) GetQuantity() int64 {
+	if x != nil {
+		return x.Quantity
+	}
+	return 0
+}
+
+// Request to cancel a single order.
+type CancelOrderRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Trades        []*Trade               `protobuf:"bytes,1,rep,name=trades,proto3" json:"trades,omitempty"`
+	Trade         *Trade                 `protobuf:"bytes,1,opt,name=trade,proto3" json:"trade,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *ListTradesResponse) Reset() {
-	*x = ListTradesResponse{}
+func (x *CancelOrderRequest) Reset() {
+	*x = CancelOrderRequest{}
 	mi := &file_provider_proto_msgTypes[23]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *ListTradesResponse) String() string {
+func (x *CancelOrderRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*ListTradesResponse) ProtoMessage() {}
+func (*CancelOrderRequest) ProtoMessage() {}
 
-func (x *ListTradesResponse) ProtoReflect() protoreflect.Message {
+func (x *CancelOrderRequest) ProtoReflect() protoreflect.Message {
 	mi := &file_provider_proto_msgTypes[23]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -3243,40 +3313,46 @@ func (x *ListTradesResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use ListTradesResponse.ProtoReflect.Descriptor instead.
-func (*ListTradesResponse) Descriptor() ([]byte, []int) {
+// Deprecated: Use CancelOrderRequest.ProtoReflect.Descriptor instead.
+func (*CancelOrderRequest) Descriptor() ([]byte, []int) {
 	return file_provider_proto_rawDescGZIP(), []int{23}
 }
 
-func (x *ListTradesResponse) GetTrades() []*Trade {
+func (x *CancelOrderRequest) GetTrade() *Trade {
 	if x != nil {
-		return x.Trades
+		return x.Trade
 	}
 	return nil
 }
 
-// Response containing a list of combination trades.
-type ListComboTradesResponse struct {
+// Filter of open orders to cancel. Filters combine with AND; at least one,
+// or all, must be set.
+type CancelOrdersRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	ComboTrades   []*ComboTrade          `protobuf:"bytes,1,rep,name=combo_trades,json=comboTrades,proto3" json:"combo_trades,omitempty"`
+	All           bool                   `protobuf:"varint,1,opt,name=all,proto3" json:"all,omitempty"`                                 // Cancel every open order; other filters are ignored.
+	Codes         []string               `protobuf:"bytes,2,rep,name=codes,proto3" json:"codes,omitempty"`                              // Only these contract codes.
+	Action        Action                 `protobuf:"varint,3,opt,name=action,proto3,enum=v1.Action" json:"action,omitempty"`            // Only this side (unspecified = both).
+	Statuses      []Status               `protobuf:"varint,4,rep,packed,name=statuses,proto3,enum=v1.Status" json:"statuses,omitempty"` // Only these open statuses (empty = any open status).
+	AccountId     string                 `protobuf:"bytes,5,opt,name=account_id,json=accountId,proto3" json:"account_id,omitempty"`     // Only this account.
+	Parallelism   int32                  `protobuf:"varint,6,opt,name=parallelism,proto3" json:"parallelism,omitempty"`                 // Max cancels in flight (0 = server default; capped by the server).
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *ListComboTradesResponse) Reset() {
-	*x = ListComboTradesResponse{}
+func (x *CancelOrdersRequest) Reset() {
+	*x = CancelOrdersRequest{}
 	mi := &file_provider_proto_msgTypes[24]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *ListComboTradesResponse) String() string {
+func (x *CancelOrdersRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*ListComboTradesResponse) ProtoMessage() {}
+func (*CancelOrdersRequest) ProtoMessage() {}
 
-func (x *ListComboTradesResponse) ProtoReflect() protoreflect.Message {
+func (x *CancelOrdersRequest) ProtoReflect() protoreflect.Message {
 	mi := &file_provider_proto_msgTypes[24]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -3288,40 +3364,76 @@ func (x *ListComboTradesResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use ListComboTradesResponse.ProtoReflect.Descriptor instead.
-func (*ListComboTradesResponse) Descriptor() ([]byte, []int) {
+// Deprecated: Use CancelOrdersRequest.ProtoReflect.Descriptor instead.
+func (*CancelOrdersRequest) Descriptor() ([]byte, []int) {
 	return file_provider_proto_rawDescGZIP(), []int{24}
 }
 
-func (x *ListComboTradesResponse) GetComboTrades() []*ComboTrade {
+func (x *CancelOrdersRequest) GetAll() bool {
 	if x != nil {
-		return x.ComboTrades
+		return x.All
+	}
+	return false
+}
+
+func (x *CancelOrdersRequest) GetCodes() []string {
+	if x != nil {
+		return x.Codes
 	}
 	return nil
 }
 
-// Request to get fill history (deal records) for an account.
-type GetOrderDealRecordsRequest struct {
+func (x *CancelOrdersRequest) GetAction() Action {
+	if x != nil {
+		return x.Action
+	}
+	return Action_ACTION_UNSPECIFIED
+}
+
+func (x *CancelOrdersRequest) GetStatuses() []Status {
+	if x != nil {
+		return x.Statuses
+	}
+	return nil
+}
+
+func (x *CancelOrdersRequest) GetAccountId() string {
+	if x != nil {
+		return x.AccountId
+	}
+	return ""
+}
+
+func (x *CancelOrdersRequest) GetParallelism() int32 {
+	if x != nil {
+		return x.Parallelism
+	}
+	return 0
+}
+
+// Outcome of one cancel.
+type CancelOrderResult struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Account       *Account               `protobuf:"bytes,1,opt,name=account,proto3" json:"account,omitempty"`
+	Trade         *Trade                 `protobuf:"bytes,1,opt,name=trade,proto3" json:"trade,omitempty"` // Trade after the cancel, or as it was when the cancel failed.
+	Error         string                 `protobuf:"bytes,2,opt,name=error,proto3" json:"error,omitempty"` // Failure reason, empty on success.
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *GetOrderDealRecordsRequest) Reset() {
-	*x = GetOrderDealRecordsRequest{}
+func (x *CancelOrderResult) Reset() {
+	*x = CancelOrderResult{}
 	mi := &file_provider_proto_msgTypes[25]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *GetOrderDealRecordsRequest) String() string {
+func (x *CancelOrderResult) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*GetOrderDealRecordsRequest) ProtoMessage() {}
+func (*CancelOrderResult) ProtoMessage() {}
 
-func (x *GetOrderDealRecordsRequest) ProtoReflect() protoreflect.Message {
+func (x *CancelOrderResult) ProtoReflect() protoreflect.Message {
 	mi := &file_provider_proto_msgTypes[25]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -3333,40 +3445,47 @@ func (x *GetOrderDealRecordsRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use GetOrderDealRecordsRequest.ProtoReflect.Descriptor instead.
-func (*GetOrderDealRecordsRequest) Descriptor() ([]byte, []int) {
+// Deprecated: Use CancelOrderResult.ProtoReflect.Descriptor instead.
+func (*CancelOrderResult) Descriptor() ([]byte, []int) {
 	return file_provider_proto_rawDescGZIP(), []int{25}
 }
 
-func (x *GetOrderDealRecordsRequest) GetAccount() *Account {
+func (x *CancelOrderResult) GetTrade() *Trade {
 	if x != nil {
-		return x.Account
+		return x.Trade
 	}
 	return nil
 }
 
-// Response containing deal records.
-type GetOrderDealRecordsResponse struct {
+func (x *CancelOrderResult) GetError() string {
+	if x != nil {
+		return x.Error
+	}
+	return ""
+}
+
+// Request to cancel a combination order.
+type CancelComboOrderRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Records       []*OrderDealRecord     `protobuf:"bytes,1,rep,name=records,proto3" json:"records,omitempty"`
+	Combotrade    *ComboTrade            `protobuf:"bytes,1,opt,name=combotrade,proto3" json:"combotrade,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *GetOrderDealRecordsResponse) Reset() {
-	*x = GetOrderDealRecordsResponse{}
+func (x *CancelComboOrderRequest) Reset() {
+	*x = CancelComboOrderRequest{}
 	mi := &file_provider_proto_msgTypes[26]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *GetOrderDealRecordsResponse) String() string {
+func (x *CancelComboOrderRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*GetOrderDealRecordsResponse) ProtoMessage() {}
+func (*CancelComboOrderRequest) ProtoMessage() {}
 
-func (x *GetOrderDealRecordsResponse) ProtoReflect() protoreflect.Message {
+func (x *CancelComboOrderRequest) ProtoReflect() protoreflect.Message {
 	mi := &file_provider_proto_msgTypes[26]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -3378,44 +3497,40 @@ func (x *GetOrderDealRecordsResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use GetOrderDealRecordsResponse.ProtoReflect.Descriptor instead.
-func (*GetOrderDealRecordsResponse) Descriptor() ([]byte, []int) {
+// Deprecated: Use CancelComboOrderRequest.ProtoReflect.Descriptor instead.
+func (*CancelComboOrderRequest) Descriptor() ([]byte, []int) {
 	return file_provider_proto_rawDescGZIP(), []int{26}
 }
 
-func (x *GetOrderDealRecordsResponse) GetRecords() []*OrderDealRecord {
+func (x *CancelComboOrderRequest) GetCombotrade() *ComboTrade {
 	if x != nil {
-		return x.Records
+		return x.Combotrade
 	}
 	return nil
 }
 
-// Represents a single fill/deal record.
-type OrderDealRecord struct {
+// Request to update the status of all orders in an account.
+type UpdateStatusRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Code          string                 `protobuf:"bytes,1,opt,name=code,proto3" json:"code,omitempty"`                     // Security code.
-	Action        Action                 `protobuf:"varint,2,opt,name=action,proto3,enum=v1.Action" json:"action,omitempty"` // Buy or Sell.
-	Price         float64                `protobuf:"fixed64,3,opt,name=price,proto3" json:"price,omitempty"`                 // Execution price.
-	Quantity      int64                  `protobuf:"varint,4,opt,name=quantity,proto3" json:"quantity,omitempty"`            // Execution quantity.
-	Ts            string                 `protobuf:"bytes,5,opt,name=ts,proto3" json:"ts,omitempty"`                         // Timestamp.
+	Account       *Account               `protobuf:"bytes,1,opt,name=account,proto3" json:"account,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *OrderDealRecord) Reset() {
-	*x = OrderDealRecord{}
+func (x *UpdateStatusRequest) Reset() {
+	*x = UpdateStatusRequest{}
 	mi := &file_provider_proto_msgTypes[27]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *OrderDealRecord) String() string {
+func (x *UpdateStatusRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*OrderDealRecord) ProtoMessage() {}
+func (*UpdateStatusRequest) ProtoMessage() {}
 
-func (x *OrderDealRecord) ProtoReflect() protoreflect.Message {
+func (x *UpdateStatusRequest) ProtoReflect() protoreflect.Message {
 	mi := &file_provider_proto_msgTypes[27]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -3427,70 +3542,104 @@ func (x *OrderDealRecord) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use OrderDealRecord.ProtoReflect.Descriptor instead.
-func (*OrderDealRecord) Descriptor() ([]byte, []int) {
+// Deprecated: Use UpdateStatusRequest.ProtoReflect.Descriptor instead.
+func (*UpdateStatusRequest) Descriptor() ([]byte, []int) {
 	return file_provider_proto_rawDescGZIP(), []int{27}
 }
 
-func (x *OrderDealRecord) GetCode() string {
+func (x *UpdateStatusRequest) GetAccount() *Account {
 	if x != nil {
-		return x.Code
+		return x.Account
 	}
-	return ""
+	return nil
 }
 
-func (x *OrderDealRecord) GetAction() Action {
+// Response containing a list of single trades.
+type ListTradesResponse struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Trades        []*Trade               `protobuf:"bytes,1,rep,name=trades,proto3" json:"trades,omitempty"`
+	Version       int64                  `protobuf:"varint,2,opt,name=version,proto3" json:"version,omitempty"` // Watermark for ListTradesDelta (delta calls only).
+	Epoch         string                 `protobuf:"bytes,3,opt,name=epoch,proto3" json:"epoch,omitempty"`      // Provider instance that issued version (delta calls only).
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *ListTradesResponse) Reset() {
+	*x = ListTradesResponse{}
+	mi := &file_provider_proto_msgTypes[28]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ListTradesResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ListTradesResponse) ProtoMessage() {}
+
+func (x *ListTradesResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[28]
 	if x != nil {
-		return x.Action
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
 	}
-	return Action_ACTION_UNSPECIFIED
+	return mi.MessageOf(x)
 }
 
-func (x *OrderDealRecord) GetPrice() float64 {
+// Deprecated: Use ListTradesResponse.ProtoReflect.Descriptor instead.
+func (*ListTradesResponse) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{28}
+}
+
+func (x *ListTradesResponse) GetTrades() []*Trade {
 	if x != nil {
-		return x.Price
+		return x.Trades
 	}
-	return 0
+	return nil
 }
 
-func (x *OrderDealRecord) GetQuantity() int64 {
+func (x *ListTradesResponse) GetVersion() int64 {
 	if x != nil {
-		return x.Quantity
+		return x.Version
 	}
 	return 0
 }
 
-func (x *OrderDealRecord) GetTs() string {
+func (x *ListTradesResponse) GetEpoch() string {
 	if x != nil {
-		return x.Ts
+		return x.Epoch
 	}
 	return ""
 }
 
-// Request to list current positions in an account.
-type ListPositionsRequest struct {
+// Response containing a list of combination trades.
+type ListComboTradesResponse struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Account       *Account               `protobuf:"bytes,1,opt,name=account,proto3" json:"account,omitempty"`
-	Unit          string                 `protobuf:"bytes,2,opt,name=unit,proto3" json:"unit,omitempty"` // Units (e.g., Common).
+	ComboTrades   []*ComboTrade          `protobuf:"bytes,1,rep,name=combo_trades,json=comboTrades,proto3" json:"combo_trades,omitempty"`
+	Version       int64                  `protobuf:"varint,2,opt,name=version,proto3" json:"version,omitempty"` // Watermark for ListComboTradesDelta (delta calls only).
+	Epoch         string                 `protobuf:"bytes,3,opt,name=epoch,proto3" json:"epoch,omitempty"`      // Provider instance that issued version (delta calls only).
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *ListPositionsRequest) Reset() {
-	*x = ListPositionsRequest{}
-	mi := &file_provider_proto_msgTypes[28]
+func (x *ListComboTradesResponse) Reset() {
+	*x = ListComboTradesResponse{}
+	mi := &file_provider_proto_msgTypes[29]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *ListPositionsRequest) String() string {
+func (x *ListComboTradesResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*ListPositionsRequest) ProtoMessage() {}
+func (*ListComboTradesResponse) ProtoMessage() {}
 
-func (x *ListPositionsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[28]
+func (x *ListComboTradesResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[29]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -3501,60 +3650,56 @@ func (x *ListPositionsRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use ListPositionsRequest.ProtoReflect.Descriptor instead.
-func (*ListPositionsRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{28}
+// Deprecated: Use ListComboTradesResponse.ProtoReflect.Descriptor instead.
+func (*ListComboTradesResponse) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{29}
 }
 
-func (x *ListPositionsRequest) GetAccount() *Account {
+func (x *ListComboTradesResponse) GetComboTrades() []*ComboTrade {
 	if x != nil {
-		return x.Account
+		return x.ComboTrades
 	}
 	return nil
 }
 
-func (x *ListPositionsRequest) GetUnit() string {
+func (x *ListComboTradesResponse) GetVersion() int64 {
 	if x != nil {
-		return x.Unit
+		return x.Version
+	}
+	return 0
+}
+
+func (x *ListComboTradesResponse) GetEpoch() string {
+	if x != nil {
+		return x.Epoch
 	}
 	return ""
 }
 
-// Represents an unrealized position in a stock.
-type StockPosition struct {
-	state                protoimpl.MessageState `protogen:"open.v1"`
-	Id                   int64                  `protobuf:"varint,1,opt,name=id,proto3" json:"id,omitempty"`                                                                    // Internal ID.
-	Code                 string                 `protobuf:"bytes,2,opt,name=code,proto3" json:"code,omitempty"`                                                                 // Stock code.
-	Direction            Action                 `protobuf:"varint,3,opt,name=direction,proto3,enum=v1.Action" json:"direction,omitempty"`                                       // Long (Buy) or Short (Sell).
-	Quantity             int64                  `protobuf:"varint,4,opt,name=quantity,proto3" json:"quantity,omitempty"`                                                        // Holding quantity.
-	Price                float64                `protobuf:"fixed64,5,opt,name=price,proto3" json:"price,omitempty"`                                                             // Average entry price.
-	LastPrice            float64                `protobuf:"fixed64,6,opt,name=last_price,json=lastPrice,proto3" json:"last_price,omitempty"`                                    // Current market price.
-	Pnl                  float64                `protobuf:"fixed64,7,opt,name=pnl,proto3" json:"pnl,omitempty"`                                                                 // Unrealized profit/loss.
-	YdQuantity           int64                  `protobuf:"varint,8,opt,name=yd_quantity,json=ydQuantity,proto3" json:"yd_quantity,omitempty"`                                  // Quantity held from yesterday.
-	Cond                 StockOrderCond         `protobuf:"varint,9,opt,name=cond,proto3,enum=v1.StockOrderCond" json:"cond,omitempty"`                                         // Trading condition (Cash, Margin).
-	MarginPurchaseAmount int64                  `protobuf:"varint,10,opt,name=margin_purchase_amount,json=marginPurchaseAmount,proto3" json:"margin_purchase_amount,omitempty"` // Borrowed amount for margin purchase.
-	Collateral           int64                  `protobuf:"varint,11,opt,name=collateral,proto3" json:"collateral,omitempty"`                                                   // Collateral provided.
-	ShortSaleMargin      int64                  `protobuf:"varint,12,opt,name=short_sale_margin,json=shortSaleMargin,proto3" json:"short_sale_margin,omitempty"`                // Margin for short selling.
-	Interest             int64                  `protobuf:"varint,13,opt,name=interest,proto3" json:"interest,omitempty"`                                                       // Accrued interest.
-	unknownFields        protoimpl.UnknownFields
-	sizeCache            protoimpl.SizeCache
+// Request for trades changed since a watermark.
+type ListTradesDeltaRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	SinceVersion  int64                  `protobuf:"varint,1,opt,name=since_version,json=sinceVersion,proto3" json:"since_version,omitempty"` // Version returned by the previous delta call (0 = everything).
+	Epoch         string                 `protobuf:"bytes,2,opt,name=epoch,proto3" json:"epoch,omitempty"`                                    // Epoch returned with since_version; another epoch returns everything.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
 }
 
-func (x *StockPosition) Reset() {
-	*x = StockPosition{}
-	mi := &file_provider_proto_msgTypes[29]
+func (x *ListTradesDeltaRequest) Reset() {
+	*x = ListTradesDeltaRequest{}
+	mi := &file_provider_proto_msgTypes[30]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *StockPosition) String() string {
+func (x *ListTradesDeltaRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*StockPosition) ProtoMessage() {}
+func (*ListTradesDeltaRequest) ProtoMessage() {}
 
-func (x *StockPosition) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[29]
+func (x *ListTradesDeltaRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[30]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -3565,131 +3710,142 @@ func (x *StockPosition) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use StockPosition.ProtoReflect.Descriptor instead.
-func (*StockPosition) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{29}
+// Deprecated: Use ListTradesDeltaRequest.ProtoReflect.Descriptor instead.
+func (*ListTradesDeltaRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{30}
 }
 
-func (x *StockPosition) GetId() int64 {
+func (x *ListTradesDeltaRequest) GetSinceVersion() int64 {
 	if x != nil {
-		return x.Id
+		return x.SinceVersion
 	}
 	return 0
 }
 
-func (x *StockPosition) GetCode() string {
+func (x *ListTradesDeltaRequest) GetEpoch() string {
 	if x != nil {
-		return x.Code
+		return x.Epoch
 	}
 	return ""
 }
 
-func (x *StockPosition) GetDirection() Action {
-	if x != nil {
-		return x.Direction
-	}
-	return Action_ACTION_UNSPECIFIED
+// Request to get fill history (deal records) for an account.
+type GetOrderDealRecordsRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Account       *Account               `protobuf:"bytes,1,opt,name=account,proto3" json:"account,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
 }
 
-func (x *StockPosition) GetQuantity() int64 {
-	if x != nil {
-		return x.Quantity
-	}
-	return 0
+func (x *GetOrderDealRecordsRequest) Reset() {
+	*x = GetOrderDealRecordsRequest{}
+	mi := &file_provider_proto_msgTypes[31]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
 }
 
-func (x *StockPosition) GetPrice() float64 {
-	if x != nil {
-		return x.Price
-	}
-	return 0
+func (x *GetOrderDealRecordsRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
 }
 
-func (x *StockPosition) GetLastPrice() float64 {
+func (*GetOrderDealRecordsRequest) ProtoMessage() {}
+
+func (x *GetOrderDealRecordsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[31]
 	if x != nil {
-		return x.LastPrice
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
 	}
-	return 0
+	return mi.MessageOf(x)
 }
 
-func (x *StockPosition) GetPnl() float64 {
-	if x != nil {
-		return x.Pnl
-	}
-	return 0
+// Deprecated: Use GetOrderDealRecordsRequest.ProtoReflect.Descriptor instead.
+func (*GetOrderDealRecordsRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{31}
 }
 
-func (x *StockPosition) GetYdQuantity() int64 {
+func (x *GetOrderDealRecordsRequest) GetAccount() *Account {
 	if x != nil {
-		return x.YdQuantity
+		return x.Account
 	}
-	return 0
+	return nil
 }
 
-func (x *StockPosition) GetCond() StockOrderCond {
-	if x != nil {
-		return x.Cond
-	}
-	return StockOrderCond_STOCK_ORDER_COND_UNSPECIFIED
+// Response containing deal records.
+type GetOrderDealRecordsResponse struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Records       []*OrderDealRecord     `protobuf:"bytes,1,rep,name=records,proto3" json:"records,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
 }
 
-func (x *StockPosition) GetMarginPurchaseAmount() int64 {
-	if x != nil {
-		return x.MarginPurchaseAmount
-	}
-	return 0
+func (x *GetOrderDealRecordsResponse) Reset() {
+	*x = GetOrderDealRecordsResponse{}
+	mi := &file_provider_proto_msgTypes[32]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
 }
 
-func (x *StockPosition) GetCollateral() int64 {
-	if x != nil {
-		return x.Collateral
-	}
-	return 0
+func (x *GetOrderDealRecordsResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
 }
 
-func (x *StockPosition) GetShortSaleMargin() int64 {
+func (*GetOrderDealRecordsResponse) ProtoMessage() {}
+
+func (x *GetOrderDealRecordsResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[32]
 	if x != nil {
-		return x.ShortSaleMargin
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
 	}
-	return 0
+	return mi.MessageOf(x)
 }
 
-func (x *StockPosition) GetInterest() int64 {
+// Deprecated: Use GetOrderDealRecordsResponse.ProtoReflect.Descriptor instead.
+func (*GetOrderDealRecordsResponse) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{32}
+}
+
+func (x *GetOrderDealRecordsResponse) GetRecords() []*OrderDealRecord {
 	if x != nil {
-		return x.Interest
+		return x.Records
 	}
-	return 0
+	return nil
 }
 
-// Represents an unrealized position in futures.
-type FuturePosition struct {
+// Represents a single fill/deal record.
+type OrderDealRecord struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Id            int64                  `protobuf:"varint,1,opt,name=id,proto3" json:"id,omitempty"`                                 // Internal ID.
-	Code          string                 `protobuf:"bytes,2,opt,name=code,proto3" json:"code,omitempty"`                              // Future code.
-	Direction     Action                 `protobuf:"varint,3,opt,name=direction,proto3,enum=v1.Action" json:"direction,omitempty"`    // Long or Short.
-	Quantity      int64                  `protobuf:"varint,4,opt,name=quantity,proto3" json:"quantity,omitempty"`                     // Holding quantity.
-	Price         float64                `protobuf:"fixed64,5,opt,name=price,proto3" json:"price,omitempty"`                          // Entry price.
-	LastPrice     float64                `protobuf:"fixed64,6,opt,name=last_price,json=lastPrice,proto3" json:"last_price,omitempty"` // Market price.
-	Pnl           float64                `protobuf:"fixed64,7,opt,name=pnl,proto3" json:"pnl,omitempty"`                              // Unrealized pnl.
+	Code          string                 `protobuf:"bytes,1,opt,name=code,proto3" json:"code,omitempty"`                     // Security code.
+	Action        Action                 `protobuf:"varint,2,opt,name=action,proto3,enum=v1.Action" json:"action,omitempty"` // Buy or Sell.
+	Price         float64                `protobuf:"fixed64,3,opt,name=price,proto3" json:"price,omitempty"`                 // Execution price.
+	Quantity      int64                  `protobuf:"varint,4,opt,name=quantity,proto3" json:"quantity,omitempty"`            // Execution quantity.
+	Ts            string                 `protobuf:"bytes,5,opt,name=ts,proto3" json:"ts,omitempty"`                         // Timestamp.
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *FuturePosition) Reset() {
-	*x = FuturePosition{}
-	mi := &file_provider_proto_msgTypes[30]
+func (x *OrderDealRecord) Reset() {
+	*x = OrderDealRecord{}
+	mi := &file_provider_proto_msgTypes[33]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *FuturePosition) String() string {
+func (x *OrderDealRecord) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*FuturePosition) ProtoMessage() {}
+func (*OrderDealRecord) ProtoMessage() {}
 
-func (x *FuturePosition) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[30]
+func (x *OrderDealRecord) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[33]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -3700,87 +3856,70 @@ func (x *FuturePosition) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use FuturePosition.ProtoReflect.Descriptor instead.
-func (*FuturePosition) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{30}
-}
-
-func (x *FuturePosition) GetId() int64 {
-	if x != nil {
-		return x.Id
-	}
-	return 0
+// Deprecated: Use OrderDealRecord.ProtoReflect.Descriptor instead.
+func (*OrderDealRecord) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{33}
 }
 
-func (x *FuturePosition) GetCode() string {
+func (x *OrderDealRecord) GetCode() string {
 	if x != nil {
 		return x.Code
 	}
 	return ""
 }
 
-func (x *FuturePosition) GetDirection() Action {
+func (x *OrderDealRecord) GetAction() Action {
 	if x != nil {
-		return x.Direction
+		return x.Action
 	}
 	return Action_ACTION_UNSPECIFIED
 }
 
-func (x *FuturePosition) GetQuantity() int64 {
-	if x != nil {
-		return x.Quantity
-	}
-	return 0
-}
-
-func (x *FuturePosition) GetPrice() float64 {
+func (x *OrderDealRecord) GetPrice() float64 {
 	if x != nil {
 		return x.Price
 	}
 	return 0
 }
 
-func (x *FuturePosition) GetLastPrice() float64 {
+func (x *OrderDealRecord) GetQuantity() int64 {
 	if x != nil {
-		return x.LastPrice
+		return x.Quantity
 	}
 	return 0
 }
 
-func (x *FuturePosition) GetPnl() float64 {
+func (x *OrderDealRecord) GetTs() string {
 	if x != nil {
-		return x.Pnl
+		return x.Ts
 	}
-	return 0
+	return ""
 }
 
-// Generic position container.
-type Position struct {
-	state protoimpl.MessageState `protogen:"open.v1"`
-	// Types that are valid to be assigned to Position:
-	//
-	//	*Position_StockPosition
-	//	*Position_FuturePosition
-	Position      isPosition_Position `protobuf_oneof:"position"`
+// Request to list current positions in an account.
+type ListPositionsRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Account       *Account               `protobuf:"bytes,1,opt,name=account,proto3" json:"account,omitempty"`
+	Unit          string                 `protobuf:"bytes,2,opt,name=unit,proto3" json:"unit,omitempty"` // Units (e.g., Common).
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *Position) Reset() {
-	*x = Position{}
-	mi := &file_provider_proto_msgTypes[31]
+func (x *ListPositionsRequest) Reset() {
+	*x = ListPositionsRequest{}
+	mi := &file_provider_proto_msgTypes[34]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *Position) String() string {
+func (x *ListPositionsRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*Position) ProtoMessage() {}
+func (*ListPositionsRequest) ProtoMessage() {}
 
-func (x *Position) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[31]
+func (x *ListPositionsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[34]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -3791,75 +3930,60 @@ func (x *Position) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use Position.ProtoReflect.Descriptor instead.
-func (*Position) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{31}
+// Deprecated: Use ListPositionsRequest.ProtoReflect.Descriptor instead.
+func (*ListPositionsRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{34}
 }
 
-func (x *Position) GetPosition() isPosition_Position {
+func (x *ListPositionsRequest) GetAccount() *Account {
 	if x != nil {
-		return x.Position
+		return x.Account
 	}
 	return nil
 }
 
-func (x *Position) GetStockPosition() *StockPosition {
+func (x *ListPositionsRequest) GetUnit() string {
 	if x != nil {
-		if x, ok := x.Position.(*Position_StockPosition); ok {
-			return x.StockPosition
-		}
+		return x.Unit
 	}
-	return nil
+	return ""
 }
 
-func (x *Position) GetFuturePosition() *FuturePosition {
-	if x != nil {
-		if x, ok := x.Position.(*Position_FuturePosition); ok {
-			return x.FuturePosition
-		}
-	}
-	return nil
-}
-
-type isPosition_Position interface {
-	isPosition_Position()
-}
-
-type Position_StockPosition struct {
-	StockPosition *StockPosition `protobuf:"bytes,1,opt,name=stock_position,json=stockPosition,proto3,oneof"`
-}
-
-type Position_FuturePosition struct {
-	FuturePosition *FuturePosition `protobuf:"bytes,2,opt,name=future_position,json=futurePosition,proto3,oneof"`
-}
-
-func (*Position_StockPosition) isPosition_Position() {}
-
-func (*Position_FuturePosition) isPosition_Position() {}
-
-// Response containing current holdings.
-type ListPositionsResponse struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Positions     []*Position            `protobuf:"bytes,1,rep,name=positions,proto3" json:"positions,omitempty"`
-	unknownFields protoimpl.UnknownFields
-	sizeCache     protoimpl.SizeCache
+// Represents an unrealized position in a stock.
+type StockPosition struct {
+	state                protoimpl.MessageState `protogen:"open.v1"`
+	Id                   int64                  `protobuf:"varint,1,opt,name=id,proto3" json:"id,omitempty"`                                                                    // Internal ID.
+	Code                 string                 `protobuf:"bytes,2,opt,name=code,proto3" json:"code,omitempty"`                                                                 // Stock code.
+	Direction            Action                 `protobuf:"varint,3,opt,name=direction,proto3,enum=v1.Action" json:"direction,omitempty"`                                       // Long (Buy) or Short (Sell).
+	Quantity             int64                  `protobuf:"varint,4,opt,name=quantity,proto3" json:"quantity,omitempty"`                                                        // Holding quantity.
+	Price                float64                `protobuf:"fixed64,5,opt,name=price,proto3" json:"price,omitempty"`                                                             // Average entry price.
+	LastPrice            float64                `protobuf:"fixed64,6,opt,name=last_price,json=lastPrice,proto3" json:"last_price,omitempty"`                                    // Current market price.
+	Pnl                  float64                `protobuf:"fixed64,7,opt,name=pnl,proto3" json:"pnl,omitempty"`                                                                 // Unrealized profit/loss.
+	YdQuantity           int64                  `protobuf:"varint,8,opt,name=yd_quantity,json=ydQuantity,proto3" json:"yd_quantity,omitempty"`                                  // Quantity held from yesterday.
+	Cond                 StockOrderCond         `protobuf:"varint,9,opt,name=cond,proto3,enum=v1.StockOrderCond" json:"cond,omitempty"`                                         // Trading condition (Cash, Margin).
+	MarginPurchaseAmount int64                  `protobuf:"varint,10,opt,name=margin_purchase_amount,json=marginPurchaseAmount,proto3" json:"margin_purchase_amount,omitempty"` // Borrowed amount for margin purchase.
+	Collateral           int64                  `protobuf:"varint,11,opt,name=collateral,proto3" json:"collateral,omitempty"`                                                   // Collateral provided.
+	ShortSaleMargin      int64                  `protobuf:"varint,12,opt,name=short_sale_margin,json=shortSaleMargin,proto3" json:"short_sale_margin,omitempty"`                // Margin for short selling.
+	Interest             int64                  `protobuf:"varint,13,opt,name=interest,proto3" json:"interest,omitempty"`                                                       // Accrued interest.
+	unknownFields        protoimpl.UnknownFields
+	sizeCache            protoimpl.SizeCache
 }
 
-func (x *ListPositionsResponse) Reset() {
-	*x = ListPositionsResponse{}
-	mi := &file_provider_proto_msgTypes[32]
+func (x *StockPosition) Reset() {
+	*x = StockPosition{}
+	mi := &file_provider_proto_msgTypes[35]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *ListPositionsResponse) String() string {
+func (x *StockPosition) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*ListPositionsResponse) ProtoMessage() {}
+func (*StockPosition) ProtoMessage() {}
 
-func (x *ListPositionsResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[32]
+func (x *StockPosition) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[35]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -3870,108 +3994,131 @@ func (x *ListPositionsResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use ListPositionsResponse.ProtoReflect.Descriptor instead.
-func (*ListPositionsResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{32}
+// Deprecated: Use StockPosition.ProtoReflect.Descriptor instead.
+func (*StockPosition) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{35}
 }
 
-func (x *ListPositionsResponse) GetPositions() []*Position {
+func (x *StockPosition) GetId() int64 {
 	if x != nil {
-		return x.Positions
+		return x.Id
 	}
-	return nil
+	return 0
 }
 
-// Request detailed breakdown for a position.
-type ListPositionDetailRequest struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Account       *Account               `protobuf:"bytes,1,opt,name=account,proto3" json:"account,omitempty"`
-	DetailId      int64                  `protobuf:"varint,2,opt,name=detail_id,json=detailId,proto3" json:"detail_id,omitempty"`
-	unknownFields protoimpl.UnknownFields
-	sizeCache     protoimpl.SizeCache
+func (x *StockPosition) GetCode() string {
+	if x != nil {
+		return x.Code
+	}
+	return ""
 }
 
-func (x *ListPositionDetailRequest) Reset() {
-	*x = ListPositionDetailRequest{}
-	mi := &file_provider_proto_msgTypes[33]
-	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
-	ms.StoreMessageInfo(mi)
+func (x *StockPosition) GetDirection() Action {
+	if x != nil {
+		return x.Direction
+	}
+	return Action_ACTION_UNSPECIFIED
 }
 
-func (x *ListPositionDetailRequest) String() string {
-	return protoimpl.X.MessageStringOf(x)
+func (x *StockPosition) GetQuantity() int64 {
+	if x != nil {
+		return x.Quantity
+	}
+	return 0
 }
 
-func (*ListPositionDetailRequest) ProtoMessage() {}
+func (x *StockPosition) GetPrice() float64 {
+	if x != nil {
+		return x.Price
+	}
+	return 0
+}
 
-func (x *ListPositionDetailRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[33]
+func (x *StockPosition) GetLastPrice() float64 {
 	if x != nil {
-		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
-		if ms.LoadMessageInfo() == nil {
-			ms.StoreMessageInfo(mi)
-		}
-		return ms
+		return x.LastPrice
 	}
-	return mi.MessageOf(x)
+	return 0
 }
 
-// Deprecated: Use ListPositionDetailRequest.ProtoReflect.Descriptor instead.
-func (*ListPositionDetailRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{33}
+func (x *StockPosition) GetPnl() float64 {
+	if x != nil {
+		return x.Pnl
+	}
+	return 0
 }
 
-func (x *ListPositionDetailRequest) GetAccount() *Account {
+func (x *StockPosition) GetYdQuantity() int64 {
 	if x != nil {
-		return x.Account
+		return x.YdQuantity
 	}
-	return nil
+	return 0
 }
 
-func (x *ListPositionDetailRequest) GetDetailId() int64 {
+func (x *StockPosition) GetCond() StockOrderCond {
 	if x != nil {
-		return x.DetailId
+		return x.Cond
+	}
+	return StockOrderCond_STOCK_ORDER_COND_UNSPECIFIED
+}
+
+func (x *StockPosition) GetMarginPurchaseAmount() int64 {
+	if x != nil {
+		return x.MarginPurchaseAmount
 	}
 	return 0
 }
 
-// Detailed fill history for a specific stock position.
-type StockPositionDetail struct {
-	state            protoimpl.MessageState `protogen:"open.v1"`
-	Date             string                 `protobuf:"bytes,1,opt,name=date,proto3" json:"date,omitempty"`
-	Code             string                 `protobuf:"bytes,2,opt,name=code,proto3" json:"code,omitempty"`
-	Quantity         int64                  `protobuf:"varint,3,opt,name=quantity,proto3" json:"quantity,omitempty"`
-	Price            float64                `protobuf:"fixed64,4,opt,name=price,proto3" json:"price,omitempty"`
-	LastPrice        float64                `protobuf:"fixed64,5,opt,name=last_price,json=lastPrice,proto3" json:"last_price,omitempty"`
-	Pnl              float64                `protobuf:"fixed64,6,opt,name=pnl,proto3" json:"pnl,omitempty"`
-	Dseq             string                 `protobuf:"bytes,7,opt,name=dseq,proto3" json:"dseq,omitempty"`
-	Direction        Action                 `protobuf:"varint,8,opt,name=direction,proto3,enum=v1.Action" json:"direction,omitempty"`
-	Currency         Currency               `protobuf:"varint,9,opt,name=currency,proto3,enum=v1.Currency" json:"currency,omitempty"`
-	Fee              float64                `protobuf:"fixed64,10,opt,name=fee,proto3" json:"fee,omitempty"`
-	Cond             StockOrderCond         `protobuf:"varint,11,opt,name=cond,proto3,enum=v1.StockOrderCond" json:"cond,omitempty"`
-	ExDividends      int64                  `protobuf:"varint,12,opt,name=ex_dividends,json=exDividends,proto3" json:"ex_dividends,omitempty"`
-	Interest         int64                  `protobuf:"varint,13,opt,name=interest,proto3" json:"interest,omitempty"`
-	MargintradingAmt int64                  `protobuf:"varint,14,opt,name=margintrading_amt,json=margintradingAmt,proto3" json:"margintrading_amt,omitempty"`
-	Collateral       int64                  `protobuf:"varint,15,opt,name=collateral,proto3" json:"collateral,omitempty"`
-	unknownFields    protoimpl.UnknownFields
-	sizeCache        protoimpl.SizeCache
+func (x *StockPosition) GetCollateral() int64 {
+	if x != nil {
+		return x.Collateral
+	}
+	return 0
 }
 
-func (x *StockPositionDetail) Reset() {
-	*x = StockPositionDetail{}
-	mi := &file_provider_proto_msgTypes[34]
+func (x *StockPosition) GetShortSaleMargin() int64 {
+	if x != nil {
+		return x.ShortSaleMargin
+	}
+	return 0
+}
+
+func (x *StockPosition) GetInterest() int64 {
+	if x != nil {
+		return x.Interest
+	}
+	return 0
+}
+
+// Represents an unrealized position in futures.
+type FuturePosition struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Id            int64                  `protobuf:"varint,1,opt,name=id,proto3" json:"id,omitempty"`                                 // Internal ID.
+	Code          string                 `protobuf:"bytes,2,opt,name=code,proto3" json:"code,omitempty"`                              // Future code.
+	Direction     Action                 `protobuf:"varint,3,opt,name=direction,proto3,enum=v1.Action" json:"direction,omitempty"`    // Long or Short.
+	Quantity      int64                  `protobuf:"varint,4,opt,name=quantity,proto3" json:"quantity,omitempty"`                     // Holding quantity.
+	Price         float64                `protobuf:"fixed64,5,opt,name=price,proto3" json:"price,omitempty"`                          // Entry price.
+	LastPrice     float64                `protobuf:"fixed64,6,opt,name=last_price,json=lastPrice,proto3" json:"last_price,omitempty"` // Market price.
+	Pnl           float64                `protobuf:"fixed64,7,opt,name=pnl,proto3" json:"pnl,omitempty"`                              // Unrealized pnl.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *FuturePosition) Reset() {
+	*x = FuturePosition{}
+	mi := &file_provider_proto_msgTypes[36]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *StockPositionDetail) String() string {
+func (x *FuturePosition) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*StockPositionDetail) ProtoMessage() {}
+func (*FuturePosition) ProtoMessage() {}
 
-func (x *StockPositionDetail) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[34]
+func (x *FuturePosition) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[36]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -3982,149 +4129,278 @@ func (x *StockPositionDetail) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use StockPositionDetail.ProtoReflect.Descriptor instead.
-func (*StockPositionDetail) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{34}
+// Deprecated: Use FuturePosition.ProtoReflect.Descriptor instead.
+func (*FuturePosition) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{36}
 }
 
-func (x *StockPositionDetail) GetDate() string {
+func (x *FuturePosition) GetId() int64 {
 	if x != nil {
-		return x.Date
+		return x.Id
 	}
-	return ""
+	return 0
 }
 
-func (x *StockPositionDetail) GetCode() string {
+func (x *FuturePosition) GetCode() string {
 	if x != nil {
 		return x.Code
 	}
 	return ""
 }
 
-func (x *StockPositionDetail) GetQuantity() int64 {
+func (x *FuturePosition) GetDirection() Action {
+	if x != nil {
+		return x.Direction
+	}
+	return Action_ACTION_UNSPECIFIED
+}
+
+func (x *FuturePosition) GetQuantity() int64 {
 	if x != nil {
 		return x.Quantity
 	}
 	return 0
 }
 
-func (x *StockPositionDetail) GetPrice() float64 {
+func (x *FuturePosition) GetPrice() float64 {
 	if x != nil {
 		return x.Price
 	}
 	return 0
 }
 
-func (x *StockPositionDetail) GetLastPrice() float64 {
+func (x *FuturePosition) GetLastPrice() float64 {
 	if x != nil {
 		return x.LastPrice
 	}
 	return 0
 }
 
-func (x *StockPositionDetail) GetPnl() float64 {
+func (x *FuturePosition) GetPnl() float64 {
 	if x != nil {
 		return x.Pnl
 	}
 	return 0
 }
 
-func (x *StockPositionDetail) GetDseq() string {
-	if x != nil {
-		return x.Dseq
-	}
-	return ""
+// Generic position container.
+type Position struct {
+	state protoimpl.MessageState `protogen:"open.v1"`
+	// Types that are valid to be assigned to Position:
+	//
+	//	*Position_StockPosition
+	//	*Position_FuturePosition
+	Position      isPosition_Position `protobuf_oneof:"position"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
 }
 
-func (x *StockPositionDetail) GetDirection() Action {
+func (x *Position) Reset() {
+	*x = Position{}
+	mi := &file_provider_proto_msgTypes[37]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *Position) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*Position) ProtoMessage() {}
+
+func (x *Position) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[37]
 	if x != nil {
-		return x.Direction
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
 	}
-	return Action_ACTION_UNSPECIFIED
+	return mi.MessageOf(x)
 }
 
-func (x *StockPositionDetail) GetCurrency() Currency {
+// Deprecated: Use Position.ProtoReflect.Descriptor instead.
+func (*Position) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{37}
+}
+
+func (x *Position) GetPosition() isPosition_Position {
 	if x != nil {
-		return x.Currency
+		return x.Position
 	}
-	return Currency_CURRENCY_UNSPECIFIED
+	return nil
 }
 
-func (x *StockPositionDetail) GetFee() float64 {
+func (x *Position) GetStockPosition() *StockPosition {
 	if x != nil {
-		return x.Fee
+		if x, ok := x.Position.(*Position_StockPosition); ok {
+			return x.StockPosition
+		}
 	}
-	return 0
+	return nil
 }
 
-func (x *StockPositionDetail) GetCond() StockOrderCond {
+func (x *Position) GetFuturePosition() *FuturePosition {
 	if x != nil {
-		return x.Cond
+		if x, ok := x.Position.(*Position_FuturePosition); ok {
+			return x.FuturePosition
+		}
 	}
-	return StockOrderCond_STOCK_ORDER_COND_UNSPECIFIED
+	return nil
 }
 
-func (x *StockPositionDetail) GetExDividends() int64 {
+type isPosition_Position interface {
+	isPosition_Position()
+}
+
+type Position_StockPosition struct {
+	StockPosition *StockPosition `protobuf:"bytes,1,opt,name=stock_position,json=stockPosition,proto3,oneof"`
+}
+
+type Position_FuturePosition struct {
+	FuturePosition *FuturePosition `protobuf:"bytes,2,opt,name=future_position,json=futurePosition,proto3,oneof"`
+}
+
+func (*Position_StockPosition) isPosition_Position() {}
+
+func (*Position_FuturePosition) isPosition_Position() {}
+
+// Response containing current holdings.
+type ListPositionsResponse struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Positions     []*Position            `protobuf:"bytes,1,rep,name=positions,proto3" json:"positions,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *ListPositionsResponse) Reset() {
+	*x = ListPositionsResponse{}
+	mi := &file_provider_proto_msgTypes[38]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ListPositionsResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ListPositionsResponse) ProtoMessage() {}
+
+func (x *ListPositionsResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[38]
 	if x != nil {
-		return x.ExDividends
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
 	}
-	return 0
+	return mi.MessageOf(x)
 }
 
-func (x *StockPositionDetail) GetInterest() int64 {
+// Deprecated: Use ListPositionsResponse.ProtoReflect.Descriptor instead.
+func (*ListPositionsResponse) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{38}
+}
+
+func (x *ListPositionsResponse) GetPositions() []*Position {
 	if x != nil {
-		return x.Interest
+		return x.Positions
 	}
-	return 0
+	return nil
 }
 
-func (x *StockPositionDetail) GetMargintradingAmt() int64 {
+// Request detailed breakdown for a position.
+type ListPositionDetailRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Account       *Account               `protobuf:"bytes,1,opt,name=account,proto3" json:"account,omitempty"`
+	DetailId      int64                  `protobuf:"varint,2,opt,name=detail_id,json=detailId,proto3" json:"detail_id,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *ListPositionDetailRequest) Reset() {
+	*x = ListPositionDetailRequest{}
+	mi := &file_provider_proto_msgTypes[39]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ListPositionDetailRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ListPositionDetailRequest) ProtoMessage() {}
+
+func (x *ListPositionDetailRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[39]
 	if x != nil {
-		return x.MargintradingAmt
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
 	}
-	return 0
+	return mi.MessageOf(x)
 }
 
-func (x *StockPositionDetail) GetCollateral() int64 {
+// Deprecated: Use ListPositionDetailRequest.ProtoReflect.Descriptor instead.
+func (*ListPositionDetailRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{39}
+}
+
+func (x *ListPositionDetailRequest) GetAccount() *Account {
 	if x != nil {
-		return x.Collateral
+		return x.Account
+	}
+	return nil
+}
+
+func (x *ListPositionDetailRequest) GetDetailId() int64 {
+	if x != nil {
+		return x.DetailId
 	}
 	return 0
 }
 
-// Detailed fill history for a specific future position.
-type FuturePositionDetail struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Date          string                 `protobuf:"bytes,1,opt,name=date,proto3" json:"date,omitempty"`
-	Code          string                 `protobuf:"bytes,2,opt,name=code,proto3" json:"code,omitempty"`
-	Quantity      int64                  `protobuf:"varint,3,opt,name=quantity,proto3" json:"quantity,omitempty"`
-	Price         float64                `protobuf:"fixed64,4,opt,name=price,proto3" json:"price,omitempty"`
-	LastPrice     float64                `protobuf:"fixed64,5,opt,name=last_price,json=lastPrice,proto3" json:"last_price,omitempty"`
-	Pnl           float64                `protobuf:"fixed64,6,opt,name=pnl,proto3" json:"pnl,omitempty"`
-	Dseq          string                 `protobuf:"bytes,7,opt,name=dseq,proto3" json:"dseq,omitempty"`
-	Direction     Action                 `protobuf:"varint,8,opt,name=direction,proto3,enum=v1.Action" json:"direction,omitempty"`
-	Currency      Currency               `protobuf:"varint,9,opt,name=currency,proto3,enum=v1.Currency" json:"currency,omitempty"`
-	Fee           float64                `protobuf:"fixed64,10,opt,name=fee,proto3" json:"fee,omitempty"`
-	EntryQuantity int64                  `protobuf:"varint,11,opt,name=entry_quantity,json=entryQuantity,proto3" json:"entry_quantity,omitempty"`
-	unknownFields protoimpl.UnknownFields
-	sizeCache     protoimpl.SizeCache
+// Detailed fill history for a specific stock position.
+type StockPositionDetail struct {
+	state            protoimpl.MessageState `protogen:"open.v1"`
+	Date             string                 `protobuf:"bytes,1,opt,name=date,proto3" json:"date,omitempty"`
+	Code             string                 `protobuf:"bytes,2,opt,name=code,proto3" json:"code,omitempty"`
+	Quantity         int64                  `protobuf:"varint,3,opt,name=quantity,proto3" json:"quantity,omitempty"`
+	Price            float64                `protobuf:"fixed64,4,opt,name=price,proto3" json:"price,omitempty"`
+	LastPrice        float64                `protobuf:"fixed64,5,opt,name=last_price,json=lastPrice,proto3" json:"last_price,omitempty"`
+	Pnl              float64                `protobuf:"fixed64,6,opt,name=pnl,proto3" json:"pnl,omitempty"`
+	Dseq             string                 `protobuf:"bytes,7,opt,name=dseq,proto3" json:"dseq,omitempty"`
+	Direction        Action                 `protobuf:"varint,8,opt,name=direction,proto3,enum=v1.Action" json:"direction,omitempty"`
+	Currency         Currency               `protobuf:"varint,9,opt,name=currency,proto3,enum=v1.Currency" json:"currency,omitempty"`
+	Fee              float64                `protobuf:"fixed64,10,opt,name=fee,proto3" json:"fee,omitempty"`
+	Cond             StockOrderCond         `protobuf:"varint,11,opt,name=cond,proto3,enum=v1.StockOrderCond" json:"cond,omitempty"`
+	ExDividends      int64                  `protobuf:"varint,12,opt,name=ex_dividends,json=exDividends,proto3" json:"ex_dividends,omitempty"`
+	Interest         int64                  `protobuf:"varint,13,opt,name=interest,proto3" json:"interest,omitempty"`
+	MargintradingAmt int64                  `protobuf:"varint,14,opt,name=margintrading_amt,json=margintradingAmt,proto3" json:"margintrading_amt,omitempty"`
+	Collateral       int64                  `protobuf:"varint,15,opt,name=collateral,proto3" json:"collateral,omitempty"`
+	unknownFields    protoimpl.UnknownFields
+	sizeCache        protoimpl.SizeCache
 }
 
-func (x *FuturePositionDetail) Reset() {
-	*x = FuturePositionDetail{}
-	mi := &file_provider_proto_msgTypes[35]
+func (x *StockPositionDetail) Reset() {
+	*x = StockPositionDetail{}
+	mi := &file_provider_proto_msgTypes[40]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *FuturePositionDetail) String() string {
+func (x *StockPositionDetail) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*FuturePositionDetail) ProtoMessage() {}
+func (*StockPositionDetail) ProtoMessage() {}
 
-func (x *FuturePositionDetail) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[35]
+func (x *StockPositionDetail) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[40]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -4135,103 +4411,256 @@ func (x *FuturePositionDetail) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use FuturePositionDetail.ProtoReflect.Descriptor instead.
-func (*FuturePositionDetail) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{35}
+// Deprecated: Use StockPositionDetail.ProtoReflect.Descriptor instead.
+func (*StockPositionDetail) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{40}
 }
 
-func (x *FuturePositionDetail) GetDate() string {
+func (x *StockPositionDetail) GetDate() string {
 	if x != nil {
 		return x.Date
 	}
 	return ""
 }
 
-func (x *FuturePositionDetail) GetCode() string {
+func (x *StockPositionDetail) GetCode() string {
 	if x != nil {
 		return x.Code
 	}
 	return ""
 }
 
-func (x *FuturePositionDetail) GetQuantity() int64 {
+func (x *StockPositionDetail) GetQuantity() int64 {
 	if x != nil {
 		return x.Quantity
 	}
 	return 0
 }
 
-func (x *FuturePositionDetail) GetPrice() float64 {
+func (x *StockPositionDetail) GetPrice() float64 {
 	if x != nil {
 		return x.Price
 	}
 	return 0
 }
 
-func (x *FuturePositionDetail) GetLastPrice() float64 {
+func (x *StockPositionDetail) GetLastPrice() float64 {
 	if x != nil {
 		return x.LastPrice
 	}
 	return 0
 }
 
-func (x *FuturePositionDetail) GetPnl() float64 {
+func (x *StockPositionDetail) GetPnl() float64 {
 	if x != nil {
 		return x.Pnl
 	}
 	return 0
 }
 
-func (x *FuturePositionDetail) GetDseq() string {
+func (x *StockPositionDetail) GetDseq() string {
 	if x != nil {
 		return x.Dseq
 	}
 	return ""
 }
 
-func (x *FuturePositionDetail) GetDirection() Action {
+func (x *StockPositionDetail) GetDirection() Action {
 	if x != nil {
 		return x.Direction
 	}
 	return Action_ACTION_UNSPECIFIED
 }
 
-func (x *FuturePositionDetail) GetCurrency() Currency {
+func (x *StockPositionDetail) GetCurrency() Currency {
 	if x != nil {
 		return x.Currency
 	}
 	return Currency_CURRENCY_UNSPECIFIED
 }
 
-func (x *FuturePositionDetail) GetFee() float64 {
+func (x *StockPositionDetail) GetFee() float64 {
 	if x != nil {
 		return x.Fee
 	}
 	return 0
 }
 
-func (x *FuturePositionDetail) GetEntryQuantity() int64 {
+func (x *StockPositionDetail) GetCond() StockOrderCond {
 	if x != nil {
-		return x.EntryQuantity
+		return x.Cond
 	}
-	return 0
+	return StockOrderCond_STOCK_ORDER_COND_UNSPECIFIED
 }
 
-// Generic container for position details.
-type PositionDetail struct {
-	state protoimpl.MessageState `protogen:"open.v1"`
-	// Types that are valid to be assigned to Detail:
-	//
-	//	*PositionDetail_StockDetail
-	//	*PositionDetail_FutureDetail
-	Detail        isPositionDetail_Detail `protobuf_oneof:"detail"`
-	unknownFields protoimpl.UnknownFields
-	sizeCache     protoimpl.SizeCache
+func (x *StockPositionDetail) GetExDividends() int64 {
+	if x != nil {
+		return x.ExDividends
+	}
+	return 0
+}
+
+func (x *StockPositionDetail) GetInterest() int64 {
+	if x != nil {
+		return x.Interest
+	}
+	return 0
+}
+
+func (x *StockPositionDetail) GetMargintradingAmt() int64 {
+	if x != nil {
+		return x.MargintradingAmt
+	}
+	return 0
+}
+
+func (x *StockPositionDetail) GetCollateral() int64 {
+	if x != nil {
+		return x.Collateral
+	}
+	return 0
+}
+
+// Detailed fill history for a specific future position.
+type FuturePositionDetail struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Date          string                 `protobuf:"bytes,1,opt,name=date,proto3" json:"date,omitempty"`
+	Code          string                 `protobuf:"bytes,2,opt,name=code,proto3" json:"code,omitempty"`
+	Quantity      int64                  `protobuf:"varint,3,opt,name=quantity,proto3" json:"quantity,omitempty"`
+	Price         float64                `protobuf:"fixed64,4,opt,name=price,proto3" json:"price,omitempty"`
+	LastPrice     float64                `protobuf:"fixed64,5,opt,name=last_price,json=lastPrice,proto3" json:"last_price,omitempty"`
+	Pnl           float64                `protobuf:"fixed64,6,opt,name=pnl,proto3" json:"pnl,omitempty"`
+	Dseq          string                 `protobuf:"bytes,7,opt,name=dseq,proto3" json:"dseq,omitempty"`
+	Direction     Action                 `protobuf:"varint,8,opt,name=direction,proto3,enum=v1.Action" json:"direction,omitempty"`
+	Currency      Currency               `protobuf:"varint,9,opt,name=currency,proto3,enum=v1.Currency" json:"currency,omitempty"`
+	Fee           float64                `protobuf:"fixed64,10,opt,name=fee,proto3" json:"fee,omitempty"`
+	EntryQuantity int64                  `protobuf:"varint,11,opt,name=entry_quantity,json=entryQuantity,proto3" json:"entry_quantity,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *FuturePositionDetail) Reset() {
+	*x = FuturePositionDetail{}
+	mi := &file_provider_proto_msgTypes[41]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *FuturePositionDetail) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*FuturePositionDetail) ProtoMessage() {}
+
+func (x *FuturePositionDetail) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[41]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use FuturePositionDetail.ProtoReflect.Descriptor instead.
+func (*FuturePositionDetail) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{41}
+}
+
+func (x *FuturePositionDetail) GetDate() string {
+	if x != nil {
+		return x.Date
+	}
+	return ""
+}
+
+func (x *FuturePositionDetail) GetCode() string {
+	if x != nil {
+		return x.Code
+	}
+	return ""
+}
+
+func (x *FuturePositionDetail) GetQuantity() int64 {
+	if x != nil {
+		return x.Quantity
+	}
+	return 0
+}
+
+func (x *FuturePositionDetail) GetPrice() float64 {
+	if x != nil {
+		return x.Price
+	}
+	return 0
+}
+
+func (x *FuturePositionDetail) GetLastPrice() float64 {
+	if x != nil {
+		return x.LastPrice
+	}
+	return 0
+}
+
+func (x *FuturePositionDetail) GetPnl() float64 {
+	if x != nil {
+		return x.Pnl
+	}
+	return 0
+}
+
+func (x *FuturePositionDetail) GetDseq() string {
+	if x != nil {
+		return x.Dseq
+	}
+	return ""
+}
+
+func (x *FuturePositionDetail) GetDirection() Action {
+	if x != nil {
+		return x.Direction
+	}
+	return Action_ACTION_UNSPECIFIED
+}
+
+func (x *FuturePositionDetail) GetCurrency() Currency {
+	if x != nil {
+		return x.Currency
+	}
+	return Currency_CURRENCY_UNSPECIFIED
+}
+
+func (x *FuturePositionDetail) GetFee() float64 {
+	if x != nil {
+		return x.Fee
+	}
+	return 0
+}
+
+func (x *FuturePositionDetail) GetEntryQuantity() int64 {
+	if x != nil {
+		return x.EntryQuantity
+	}
+	return 0
+}
+
+// Generic container for position details.
+type PositionDetail struct {
+	state protoimpl.MessageState `protogen:"open.v1"`
+	// Types that are valid to be assigned to Detail:
+	//
+	//	*PositionDetail_StockDetail
+	//	*PositionDetail_FutureDetail
+	Detail        isPositionDetail_Detail `protobuf_oneof:"detail"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
 }
 
 func (x *PositionDetail) Reset() {
 	*x = PositionDetail{}
-	mi := &file_provider_proto_msgTypes[36]
+	mi := &file_provider_proto_msgTypes[42]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -4243,7 +4672,7 @@ func (x *PositionDetail) String() string {
 func (*PositionDetail) ProtoMessage() {}
 
 func (x *PositionDetail) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[36]
+	mi := &file_provider_proto_msgTypes[42]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -4256,7 +4685,7 @@ func (x *PositionDetail) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use PositionDetail.ProtoReflect.Descriptor instead.
 func (*PositionDetail) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{36}
+	return file_provider_proto_rawDescGZIP(), []int{42}
 }
 
 func (x *PositionDetail) GetDetail() isPositionDetail_Detail {
@@ -4310,7 +4739,7 @@ type ListPositionDetailResponse struct {
 
 func (x *ListPositionDetailResponse) Reset() {
 	*x = ListPositionDetailResponse{}
-	mi := &file_provider_proto_msgTypes[37]
+	mi := &file_provider_proto_msgTypes[43]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -4322,7 +4751,7 @@ func (x *ListPositionDetailResponse) String() string {
 func (*ListPositionDetailResponse) ProtoMessage() {}
 
 func (x *ListPositionDetailResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[37]
+	mi := &file_provider_proto_msgTypes[43]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -4335,7 +4764,7 @@ func (x *ListPositionDetailResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ListPositionDetailResponse.ProtoReflect.Descriptor instead.
 func (*ListPositionDetailResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{37}
+	return file_provider_proto_rawDescGZIP(), []int{43}
 }
 
 func (x *ListPositionDetailResponse) GetDetails() []*PositionDetail {
@@ -4357,7 +4786,7 @@ type ListProfitLossRequest struct {
 
 func (x *ListProfitLossRequest) Reset() {
 	*x = ListProfitLossRequest{}
-	mi := &file_provider_proto_msgTypes[38]
+	mi := &file_provider_proto_msgTypes[44]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -4369,7 +4798,7 @@ func (x *ListProfitLossRequest) String() string {
 func (*ListProfitLossRequest) ProtoMessage() {}
 
 func (x *ListProfitLossRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[38]
+	mi := &file_provider_proto_msgTypes[44]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -4382,7 +4811,7 @@ func (x *ListProfitLossRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ListProfitLossRequest.ProtoReflect.Descriptor instead.
 func (*ListProfitLossRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{38}
+	return file_provider_proto_rawDescGZIP(), []int{44}
 }
 
 func (x *ListProfitLossRequest) GetAccount() *Account {
@@ -4425,7 +4854,7 @@ type StockProfitLoss struct {
 
 func (x *StockProfitLoss) Reset() {
 	*x = StockProfitLoss{}
-	mi := &file_provider_proto_msgTypes[39]
+	mi := &file_provider_proto_msgTypes[45]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -4437,7 +4866,7 @@ func (x *StockProfitLoss) String() string {
 func (*StockProfitLoss) ProtoMessage() {}
 
 func (x *StockProfitLoss) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[39]
+	mi := &file_provider_proto_msgTypes[45]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -4450,7 +4879,7 @@ func (x *StockProfitLoss) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use StockProfitLoss.ProtoReflect.Descriptor instead.
 func (*StockProfitLoss) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{39}
+	return file_provider_proto_rawDescGZIP(), []int{45}
 }
 
 func (x *StockProfitLoss) GetDseq() string {
@@ -4542,7 +4971,7 @@ type FutureProfitLoss struct {
 
 func (x *FutureProfitLoss) Reset() {
 	*x = FutureProfitLoss{}
-	mi := &file_provider_proto_msgTypes[40]
+	mi := &file_provider_proto_msgTypes[46]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -4554,7 +4983,7 @@ func (x *FutureProfitLoss) String() string {
 func (*FutureProfitLoss) ProtoMessage() {}
 
 func (x *FutureProfitLoss) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[40]
+	mi := &file_provider_proto_msgTypes[46]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -4567,7 +4996,7 @@ func (x *FutureProfitLoss) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use FutureProfitLoss.ProtoReflect.Descriptor instead.
 func (*FutureProfitLoss) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{40}
+	return file_provider_proto_rawDescGZIP(), []int{46}
 }
 
 func (x *FutureProfitLoss) GetDate() string {
@@ -4654,7 +5083,7 @@ type ProfitLoss struct {
 
 func (x *ProfitLoss) Reset() {
 	*x = ProfitLoss{}
-	mi := &file_provider_proto_msgTypes[41]
+	mi := &file_provider_proto_msgTypes[47]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -4666,7 +5095,7 @@ func (x *ProfitLoss) String() string {
 func (*ProfitLoss) ProtoMessage() {}
 
 func (x *ProfitLoss) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[41]
+	mi := &file_provider_proto_msgTypes[47]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -4679,7 +5108,7 @@ func (x *ProfitLoss) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ProfitLoss.ProtoReflect.Descriptor instead.
 func (*ProfitLoss) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{41}
+	return file_provider_proto_rawDescGZIP(), []int{47}
 }
 
 func (x *ProfitLoss) GetItem() isProfitLoss_Item {
@@ -4733,7 +5162,7 @@ type ListProfitLossResponse struct {
 
 func (x *ListProfitLossResponse) Reset() {
 	*x = ListProfitLossResponse{}
-	mi := &file_provider_proto_msgTypes[42]
+	mi := &file_provider_proto_msgTypes[48]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -4745,7 +5174,7 @@ func (x *ListProfitLossResponse) String() string {
 func (*ListProfitLossResponse) ProtoMessage() {}
 
 func (x *ListProfitLossResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[42]
+	mi := &file_provider_proto_msgTypes[48]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -4758,7 +5187,7 @@ func (x *ListProfitLossResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ListProfitLossResponse.ProtoReflect.Descriptor instead.
 func (*ListProfitLossResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{42}
+	return file_provider_proto_rawDescGZIP(), []int{48}
 }
 
 func (x *ListProfitLossResponse) GetProfitLosses() []*ProfitLoss {
@@ -4779,7 +5208,7 @@ type ListProfitLossDetailRequest struct {
 
 func (x *ListProfitLossDetailRequest) Reset() {
 	*x = ListProfitLossDetailRequest{}
-	mi := &file_provider_proto_msgTypes[43]
+	mi := &file_provider_proto_msgTypes[49]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -4791,7 +5220,7 @@ func (x *ListProfitLossDetailRequest) String() string {
 func (*ListProfitLossDetailRequest) ProtoMessage() {}
 
 func (x *ListProfitLossDetailRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[43]
+	mi := &file_provider_proto_msgTypes[49]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -4804,7 +5233,7 @@ func (x *ListProfitLossDetailRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ListProfitLossDetailRequest.ProtoReflect.Descriptor instead.
 func (*ListProfitLossDetailRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{43}
+	return file_provider_proto_rawDescGZIP(), []int{49}
 }
 
 func (x *ListProfitLossDetailRequest) GetAccount() *Account {
@@ -4847,7 +5276,7 @@ type StockProfitDetail struct {
 
 func (x *StockProfitDetail) Reset() {
 	*x = StockProfitDetail{}
-	mi := &file_provider_proto_msgTypes[44]
+	mi := &file_provider_proto_msgTypes[50]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -4859,7 +5288,7 @@ func (x *StockProfitDetail) String() string {
 func (*StockProfitDetail) ProtoMessage() {}
 
 func (x *StockProfitDetail) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[44]
+	mi := &file_provider_proto_msgTypes[50]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -4872,7 +5301,7 @@ func (x *StockProfitDetail) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use StockProfitDetail.ProtoReflect.Descriptor instead.
 func (*StockProfitDetail) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{44}
+	return file_provider_proto_rawDescGZIP(), []int{50}
 }
 
 func (x *StockProfitDetail) GetPrice() float64 {
@@ -5015,7 +5444,7 @@ type FutureProfitDetail struct {
 
 func (x *FutureProfitDetail) Reset() {
 	*x = FutureProfitDetail{}
-	mi := &file_provider_proto_msgTypes[45]
+	mi := &file_provider_proto_msgTypes[51]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -5027,7 +5456,7 @@ func (x *FutureProfitDetail) String() string {
 func (*FutureProfitDetail) ProtoMessage() {}
 
 func (x *FutureProfitDetail) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[45]
+	mi := &file_provider_proto_msgTypes[51]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -5040,7 +5469,7 @@ func (x *FutureProfitDetail) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use FutureProfitDetail.ProtoReflect.Descriptor instead.
 func (*FutureProfitDetail) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{45}
+	return file_provider_proto_rawDescGZIP(), []int{51}
 }
 
 func (x *FutureProfitDetail) GetDirection() Action {
@@ -5141,7 +5570,7 @@ type ProfitDetail struct {
 
 func (x *ProfitDetail) Reset() {
 	*x = ProfitDetail{}
-	mi := &file_provider_proto_msgTypes[46]
+	mi := &file_provider_proto_msgTypes[52]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -5153,7 +5582,7 @@ func (x *ProfitDetail) String() string {
 func (*ProfitDetail) ProtoMessage() {}
 
 func (x *ProfitDetail) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[46]
+	mi := &file_provider_proto_msgTypes[52]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -5166,7 +5595,7 @@ func (x *ProfitDetail) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ProfitDetail.ProtoReflect.Descriptor instead.
 func (*ProfitDetail) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{46}
+	return file_provider_proto_rawDescGZIP(), []int{52}
 }
 
 func (x *ProfitDetail) GetDetail() isProfitDetail_Detail {
@@ -5220,7 +5649,7 @@ type ListProfitLossDetailResponse struct {
 
 func (x *ListProfitLossDetailResponse) Reset() {
 	*x = ListProfitLossDetailResponse{}
-	mi := &file_provider_proto_msgTypes[47]
+	mi := &file_provider_proto_msgTypes[53]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -5232,7 +5661,7 @@ func (x *ListProfitLossDetailResponse) String() string {
 func (*ListProfitLossDetailResponse) ProtoMessage() {}
 
 func (x *ListProfitLossDetailResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[47]
+	mi := &file_provider_proto_msgTypes[53]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -5245,7 +5674,7 @@ func (x *ListProfitLossDetailResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ListProfitLossDetailResponse.ProtoReflect.Descriptor instead.
 func (*ListProfitLossDetailResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{47}
+	return file_provider_proto_rawDescGZIP(), []int{53}
 }
 
 func (x *ListProfitLossDetailResponse) GetDetails() []*ProfitDetail {
@@ -5265,7 +5694,7 @@ type ListProfitLossSummaryRequest struct {
 
 func (x *ListProfitLossSummaryRequest) Reset() {
 	*x = ListProfitLossSummaryRequest{}
-	mi := &file_provider_proto_msgTypes[48]
+	mi := &file_provider_proto_msgTypes[54]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -5277,7 +5706,7 @@ func (x *ListProfitLossSummaryRequest) String() string {
 func (*ListProfitLossSummaryRequest) ProtoMessage() {}
 
 func (x *ListProfitLossSummaryRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[48]
+	mi := &file_provider_proto_msgTypes[54]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -5290,7 +5719,7 @@ func (x *ListProfitLossSummaryRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ListProfitLossSummaryRequest.ProtoReflect.Descriptor instead.
 func (*ListProfitLossSummaryRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{48}
+	return file_provider_proto_rawDescGZIP(), []int{54}
 }
 
 func (x *ListProfitLossSummaryRequest) GetAccount() *Account {
@@ -5321,7 +5750,7 @@ type StockProfitLossSummary struct {
 
 func (x *StockProfitLossSummary) Reset() {
 	*x = StockProfitLossSummary{}
-	mi := &file_provider_proto_msgTypes[49]
+	mi := &file_provider_proto_msgTypes[55]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -5333,7 +5762,7 @@ func (x *StockProfitLossSummary) String() string {
 func (*StockProfitLossSummary) ProtoMessage() {}
 
 func (x *StockProfitLossSummary) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[49]
+	mi := &file_provider_proto_msgTypes[55]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -5346,7 +5775,7 @@ func (x *StockProfitLossSummary) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use StockProfitLossSummary.ProtoReflect.Descriptor instead.
 func (*StockProfitLossSummary) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{49}
+	return file_provider_proto_rawDescGZIP(), []int{55}
 }
 
 func (x *StockProfitLossSummary) GetEntryCost() int64 {
@@ -5451,7 +5880,7 @@ type FutureProfitLossSummary struct {
 
 func (x *FutureProfitLossSummary) Reset() {
 	*x = FutureProfitLossSummary{}
-	mi := &file_provider_proto_msgTypes[50]
+	mi := &file_provider_proto_msgTypes[56]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -5463,7 +5892,7 @@ func (x *FutureProfitLossSummary) String() string {
 func (*FutureProfitLossSummary) ProtoMessage() {}
 
 func (x *FutureProfitLossSummary) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[50]
+	mi := &file_provider_proto_msgTypes[56]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -5476,7 +5905,7 @@ func (x *FutureProfitLossSummary) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use FutureProfitLossSummary.ProtoReflect.Descriptor instead.
 func (*FutureProfitLossSummary) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{50}
+	return file_provider_proto_rawDescGZIP(), []int{56}
 }
 
 func (x *FutureProfitLossSummary) GetDirection() Action {
@@ -5556,7 +5985,7 @@ type ProfitLossSummary struct {
 
 func (x *ProfitLossSummary) Reset() {
 	*x = ProfitLossSummary{}
-	mi := &file_provider_proto_msgTypes[51]
+	mi := &file_provider_proto_msgTypes[57]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -5568,7 +5997,7 @@ func (x *ProfitLossSummary) String() string {
 func (*ProfitLossSummary) ProtoMessage() {}
 
 func (x *ProfitLossSummary) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[51]
+	mi := &file_provider_proto_msgTypes[57]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -5581,7 +6010,7 @@ func (x *ProfitLossSummary) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ProfitLossSummary.ProtoReflect.Descriptor instead.
 func (*ProfitLossSummary) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{51}
+	return file_provider_proto_rawDescGZIP(), []int{57}
 }
 
 func (x *ProfitLossSummary) GetSummary() isProfitLossSummary_Summary {
@@ -5635,7 +6064,7 @@ type ListProfitLossSummaryResponse struct {
 
 func (x *ListProfitLossSummaryResponse) Reset() {
 	*x = ListProfitLossSummaryResponse{}
-	mi := &file_provider_proto_msgTypes[52]
+	mi := &file_provider_proto_msgTypes[58]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -5647,7 +6076,7 @@ func (x *ListProfitLossSummaryResponse) String() string {
 func (*ListProfitLossSummaryResponse) ProtoMessage() {}
 
 func (x *ListProfitLossSummaryResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[52]
+	mi := &file_provider_proto_msgTypes[58]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -5660,7 +6089,7 @@ func (x *ListProfitLossSummaryResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ListProfitLossSummaryResponse.ProtoReflect.Descriptor instead.
 func (*ListProfitLossSummaryResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{52}
+	return file_provider_proto_rawDescGZIP(), []int{58}
 }
 
 func (x *ListProfitLossSummaryResponse) GetSummaries() []*ProfitLossSummary {
@@ -5680,7 +6109,7 @@ type GetSettlementsRequest struct {
 
 func (x *GetSettlementsRequest) Reset() {
 	*x = GetSettlementsRequest{}
-	mi := &file_provider_proto_msgTypes[53]
+	mi := &file_provider_proto_msgTypes[59]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -5692,7 +6121,7 @@ func (x *GetSettlementsRequest) String() string {
 func (*GetSettlementsRequest) ProtoMessage() {}
 
 func (x *GetSettlementsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[53]
+	mi := &file_provider_proto_msgTypes[59]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -5705,7 +6134,7 @@ func (x *GetSettlementsRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetSettlementsRequest.ProtoReflect.Descriptor instead.
 func (*GetSettlementsRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{53}
+	return file_provider_proto_rawDescGZIP(), []int{59}
 }
 
 func (x *GetSettlementsRequest) GetAccount() *Account {
@@ -5734,7 +6163,7 @@ type Settlement struct {
 
 func (x *Settlement) Reset() {
 	*x = Settlement{}
-	mi := &file_provider_proto_msgTypes[54]
+	mi := &file_provider_proto_msgTypes[60]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -5746,7 +6175,7 @@ func (x *Settlement) String() string {
 func (*Settlement) ProtoMessage() {}
 
 func (x *Settlement) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[54]
+	mi := &file_provider_proto_msgTypes[60]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -5759,7 +6188,7 @@ func (x *Settlement) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use Settlement.ProtoReflect.Descriptor instead.
 func (*Settlement) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{54}
+	return file_provider_proto_rawDescGZIP(), []int{60}
 }
 
 func (x *Settlement) GetDate() string {
@@ -5835,7 +6264,7 @@ type GetSettlementsResponse struct {
 
 func (x *GetSettlementsResponse) Reset() {
 	*x = GetSettlementsResponse{}
-	mi := &file_provider_proto_msgTypes[55]
+	mi := &file_provider_proto_msgTypes[61]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -5847,7 +6276,7 @@ func (x *GetSettlementsResponse) String() string {
 func (*GetSettlementsResponse) ProtoMessage() {}
 
 func (x *GetSettlementsResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[55]
+	mi := &file_provider_proto_msgTypes[61]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -5860,7 +6289,7 @@ func (x *GetSettlementsResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetSettlementsResponse.ProtoReflect.Descriptor instead.
 func (*GetSettlementsResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{55}
+	return file_provider_proto_rawDescGZIP(), []int{61}
 }
 
 func (x *GetSettlementsResponse) GetSettlements() []*Settlement {
@@ -5880,7 +6309,7 @@ type GetMarginRequest struct {
 
 func (x *GetMarginRequest) Reset() {
 	*x = GetMarginRequest{}
-	mi := &file_provider_proto_msgTypes[56]
+	mi := &file_provider_proto_msgTypes[62]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -5892,7 +6321,7 @@ func (x *GetMarginRequest) String() string {
 func (*GetMarginRequest) ProtoMessage() {}
 
 func (x *GetMarginRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[56]
+	mi := &file_provider_proto_msgTypes[62]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -5905,7 +6334,7 @@ func (x *GetMarginRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetMarginRequest.ProtoReflect.Descriptor instead.
 func (*GetMarginRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{56}
+	return file_provider_proto_rawDescGZIP(), []int{62}
 }
 
 func (x *GetMarginRequest) GetAccount() *Account {
@@ -5951,7 +6380,7 @@ type Margin struct {
 
 func (x *Margin) Reset() {
 	*x = Margin{}
-	mi := &file_provider_proto_msgTypes[57]
+	mi := &file_provider_proto_msgTypes[63]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -5963,7 +6392,7 @@ func (x *Margin) String() string {
 func (*Margin) ProtoMessage() {}
 
 func (x *Margin) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[57]
+	mi := &file_provider_proto_msgTypes[63]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -5976,7 +6405,7 @@ func (x *Margin) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use Margin.ProtoReflect.Descriptor instead.
 func (*Margin) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{57}
+	return file_provider_proto_rawDescGZIP(), []int{63}
 }
 
 func (x *Margin) GetEquity() float64 {
@@ -6171,7 +6600,7 @@ type GetTradingLimitsRequest struct {
 
 func (x *GetTradingLimitsRequest) Reset() {
 	*x = GetTradingLimitsRequest{}
-	mi := &file_provider_proto_msgTypes[58]
+	mi := &file_provider_proto_msgTypes[64]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -6183,7 +6612,7 @@ func (x *GetTradingLimitsRequest) String() string {
 func (*GetTradingLimitsRequest) ProtoMessage() {}
 
 func (x *GetTradingLimitsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[58]
+	mi := &file_provider_proto_msgTypes[64]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -6196,7 +6625,7 @@ func (x *GetTradingLimitsRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetTradingLimitsRequest.ProtoReflect.Descriptor instead.
 func (*GetTradingLimitsRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{58}
+	return file_provider_proto_rawDescGZIP(), []int{64}
 }
 
 func (x *GetTradingLimitsRequest) GetAccount() *Account {
@@ -6226,7 +6655,7 @@ type TradingLimits struct {
 
 func (x *TradingLimits) Reset() {
 	*x = TradingLimits{}
-	mi := &file_provider_proto_msgTypes[59]
+	mi := &file_provider_proto_msgTypes[65]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -6238,7 +6667,7 @@ func (x *TradingLimits) String() string {
 func (*TradingLimits) ProtoMessage() {}
 
 func (x *TradingLimits) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[59]
+	mi := &file_provider_proto_msgTypes[65]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -6251,7 +6680,7 @@ func (x *TradingLimits) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use TradingLimits.ProtoReflect.Descriptor instead.
 func (*TradingLimits) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{59}
+	return file_provider_proto_rawDescGZIP(), []int{65}
 }
 
 func (x *TradingLimits) GetTradingLimit() int64 {
@@ -6334,7 +6763,7 @@ type GetStockReserveSummaryRequest struct {
 
 func (x *GetStockReserveSummaryRequest) Reset() {
 	*x = GetStockReserveSummaryRequest{}
-	mi := &file_provider_proto_msgTypes[60]
+	mi := &file_provider_proto_msgTypes[66]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -6346,7 +6775,7 @@ func (x *GetStockReserveSummaryRequest) String() string {
 func (*GetStockReserveSummaryRequest) ProtoMessage() {}
 
 func (x *GetStockReserveSummaryRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[60]
+	mi := &file_provider_proto_msgTypes[66]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -6359,7 +6788,7 @@ func (x *GetStockReserveSummaryRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetStockReserveSummaryRequest.ProtoReflect.Descriptor instead.
 func (*GetStockReserveSummaryRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{60}
+	return file_provider_proto_rawDescGZIP(), []int{66}
 }
 
 func (x *GetStockReserveSummaryRequest) GetAccount() *Account {
@@ -6379,7 +6808,7 @@ type ReserveStocksSummaryResponse struct {
 
 func (x *ReserveStocksSummaryResponse) Reset() {
 	*x = ReserveStocksSummaryResponse{}
-	mi := &file_provider_proto_msgTypes[61]
+	mi := &file_provider_proto_msgTypes[67]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -6391,7 +6820,7 @@ func (x *ReserveStocksSummaryResponse) String() string {
 func (*ReserveStocksSummaryResponse) ProtoMessage() {}
 
 func (x *ReserveStocksSummaryResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[61]
+	mi := &file_provider_proto_msgTypes[67]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -6404,7 +6833,7 @@ func (x *ReserveStocksSummaryResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ReserveStocksSummaryResponse.ProtoReflect.Descriptor instead.
 func (*ReserveStocksSummaryResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{61}
+	return file_provider_proto_rawDescGZIP(), []int{67}
 }
 
 func (x *ReserveStocksSummaryResponse) GetResponseJson() string {
@@ -6424,7 +6853,7 @@ type GetStockReserveDetailRequest struct {
 
 func (x *GetStockReserveDetailRequest) Reset() {
 	*x = GetStockReserveDetailRequest{}
-	mi := &file_provider_proto_msgTypes[62]
+	mi := &file_provider_proto_msgTypes[68]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -6436,7 +6865,7 @@ func (x *GetStockReserveDetailRequest) String() string {
 func (*GetStockReserveDetailRequest) ProtoMessage() {}
 
 func (x *GetStockReserveDetailRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[62]
+	mi := &file_provider_proto_msgTypes[68]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -6449,7 +6878,7 @@ func (x *GetStockReserveDetailRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetStockReserveDetailRequest.ProtoReflect.Descriptor instead.
 func (*GetStockReserveDetailRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{62}
+	return file_provider_proto_rawDescGZIP(), []int{68}
 }
 
 func (x *GetStockReserveDetailRequest) GetAccount() *Account {
@@ -6469,7 +6898,7 @@ type ReserveStocksDetailResponse struct {
 
 func (x *ReserveStocksDetailResponse) Reset() {
 	*x = ReserveStocksDetailResponse{}
-	mi := &file_provider_proto_msgTypes[63]
+	mi := &file_provider_proto_msgTypes[69]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -6481,7 +6910,7 @@ func (x *ReserveStocksDetailResponse) String() string {
 func (*ReserveStocksDetailResponse) ProtoMessage() {}
 
 func (x *ReserveStocksDetailResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[63]
+	mi := &file_provider_proto_msgTypes[69]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -6494,7 +6923,7 @@ func (x *ReserveStocksDetailResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ReserveStocksDetailResponse.ProtoReflect.Descriptor instead.
 func (*ReserveStocksDetailResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{63}
+	return file_provider_proto_rawDescGZIP(), []int{69}
 }
 
 func (x *ReserveStocksDetailResponse) GetResponseJson() string {
@@ -6516,7 +6945,7 @@ type ReserveStockRequest struct {
 
 func (x *ReserveStockRequest) Reset() {
 	*x = ReserveStockRequest{}
-	mi := &file_provider_proto_msgTypes[64]
+	mi := &file_provider_proto_msgTypes[70]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -6528,7 +6957,7 @@ func (x *ReserveStockRequest) String() string {
 func (*ReserveStockRequest) ProtoMessage() {}
 
 func (x *ReserveStockRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[64]
+	mi := &file_provider_proto_msgTypes[70]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -6541,7 +6970,7 @@ func (x *ReserveStockRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ReserveStockRequest.ProtoReflect.Descriptor instead.
 func (*ReserveStockRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{64}
+	return file_provider_proto_rawDescGZIP(), []int{70}
 }
 
 func (x *ReserveStockRequest) GetAccount() *Account {
@@ -6575,7 +7004,7 @@ type ReserveStockResponse struct {
 
 func (x *ReserveStockResponse) Reset() {
 	*x = ReserveStockResponse{}
-	mi := &file_provider_proto_msgTypes[65]
+	mi := &file_provider_proto_msgTypes[71]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -6587,7 +7016,7 @@ func (x *ReserveStockResponse) String() string {
 func (*ReserveStockResponse) ProtoMessage() {}
 
 func (x *ReserveStockResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[65]
+	mi := &file_provider_proto_msgTypes[71]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -6600,7 +7029,7 @@ func (x *ReserveStockResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ReserveStockResponse.ProtoReflect.Descriptor instead.
 func (*ReserveStockResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{65}
+	return file_provider_proto_rawDescGZIP(), []int{71}
 }
 
 func (x *ReserveStockResponse) GetResponseJson() string {
@@ -6620,7 +7049,7 @@ type GetEarmarkingDetailRequest struct {
 
 func (x *GetEarmarkingDetailRequest) Reset() {
 	*x = GetEarmarkingDetailRequest{}
-	mi := &file_provider_proto_msgTypes[66]
+	mi := &file_provider_proto_msgTypes[72]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -6632,7 +7061,7 @@ func (x *GetEarmarkingDetailRequest) String() string {
 func (*GetEarmarkingDetailRequest) ProtoMessage() {}
 
 func (x *GetEarmarkingDetailRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[66]
+	mi := &file_provider_proto_msgTypes[72]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -6645,7 +7074,7 @@ func (x *GetEarmarkingDetailRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetEarmarkingDetailRequest.ProtoReflect.Descriptor instead.
 func (*GetEarmarkingDetailRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{66}
+	return file_provider_proto_rawDescGZIP(), []int{72}
 }
 
 func (x *GetEarmarkingDetailRequest) GetAccount() *Account {
@@ -6665,7 +7094,7 @@ type EarmarkStocksDetailResponse struct {
 
 func (x *EarmarkStocksDetailResponse) Reset() {
 	*x = EarmarkStocksDetailResponse{}
-	mi := &file_provider_proto_msgTypes[67]
+	mi := &file_provider_proto_msgTypes[73]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -6677,7 +7106,7 @@ func (x *EarmarkStocksDetailResponse) String() string {
 func (*EarmarkStocksDetailResponse) ProtoMessage() {}
 
 func (x *EarmarkStocksDetailResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[67]
+	mi := &file_provider_proto_msgTypes[73]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -6690,7 +7119,7 @@ func (x *EarmarkStocksDetailResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use EarmarkStocksDetailResponse.ProtoReflect.Descriptor instead.
 func (*EarmarkStocksDetailResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{67}
+	return file_provider_proto_rawDescGZIP(), []int{73}
 }
 
 func (x *EarmarkStocksDetailResponse) GetResponseJson() string {
@@ -6713,7 +7142,7 @@ type ReserveEarmarkingRequest struct {
 
 func (x *ReserveEarmarkingRequest) Reset() {
 	*x = ReserveEarmarkingRequest{}
-	mi := &file_provider_proto_msgTypes[68]
+	mi := &file_provider_proto_msgTypes[74]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -6725,7 +7154,7 @@ func (x *ReserveEarmarkingRequest) String() string {
 func (*ReserveEarmarkingRequest) ProtoMessage() {}
 
 func (x *ReserveEarmarkingRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[68]
+	mi := &file_provider_proto_msgTypes[74]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -6738,7 +7167,7 @@ func (x *ReserveEarmarkingRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ReserveEarmarkingRequest.ProtoReflect.Descriptor instead.
 func (*ReserveEarmarkingRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{68}
+	return file_provider_proto_rawDescGZIP(), []int{74}
 }
 
 func (x *ReserveEarmarkingRequest) GetAccount() *Account {
@@ -6779,7 +7208,7 @@ type ReserveEarmarkingResponse struct {
 
 func (x *ReserveEarmarkingResponse) Reset() {
 	*x = ReserveEarmarkingResponse{}
-	mi := &file_provider_proto_msgTypes[69]
+	mi := &file_provider_proto_msgTypes[75]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -6791,7 +7220,7 @@ func (x *ReserveEarmarkingResponse) String() string {
 func (*ReserveEarmarkingResponse) ProtoMessage() {}
 
 func (x *ReserveEarmarkingResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[69]
+	mi := &file_provider_proto_msgTypes[75]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -6804,7 +7233,7 @@ func (x *ReserveEarmarkingResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ReserveEarmarkingResponse.ProtoReflect.Descriptor instead.
 func (*ReserveEarmarkingResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{69}
+	return file_provider_proto_rawDescGZIP(), []int{75}
 }
 
 func (x *ReserveEarmarkingResponse) GetResponseJson() string {
@@ -6824,7 +7253,7 @@ type GetSnapshotsRequest struct {
 
 func (x *GetSnapshotsRequest) Reset() {
 	*x = GetSnapshotsRequest{}
-	mi := &file_provider_proto_msgTypes[70]
+	mi := &file_provider_proto_msgTypes[76]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -6836,7 +7265,7 @@ func (x *GetSnapshotsRequest) String() string {
 func (*GetSnapshotsRequest) ProtoMessage() {}
 
 func (x *GetSnapshotsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[70]
+	mi := &file_provider_proto_msgTypes[76]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -6849,7 +7278,7 @@ func (x *GetSnapshotsRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetSnapshotsRequest.ProtoReflect.Descriptor instead.
 func (*GetSnapshotsRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{70}
+	return file_provider_proto_rawDescGZIP(), []int{76}
 }
 
 func (x *GetSnapshotsRequest) GetContractCodes() []string {
@@ -6869,7 +7298,7 @@ type GetSnapshotsResponse struct {
 
 func (x *GetSnapshotsResponse) Reset() {
 	*x = GetSnapshotsResponse{}
-	mi := &file_provider_proto_msgTypes[71]
+	mi := &file_provider_proto_msgTypes[77]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -6881,7 +7310,7 @@ func (x *GetSnapshotsResponse) String() string {
 func (*GetSnapshotsResponse) ProtoMessage() {}
 
 func (x *GetSnapshotsResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[71]
+	mi := &file_provider_proto_msgTypes[77]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -6894,7 +7323,7 @@ func (x *GetSnapshotsResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetSnapshotsResponse.ProtoReflect.Descriptor instead.
 func (*GetSnapshotsResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{71}
+	return file_provider_proto_rawDescGZIP(), []int{77}
 }
 
 func (x *GetSnapshotsResponse) GetSnapshots() []*Snapshot {
@@ -6934,21 +7363,2204 @@ type Snapshot struct {
 	sizeCache       protoimpl.SizeCache
 }
 
-func (x *Snapshot) Reset() {
-	*x = Snapshot{}
-	mi := &file_provider_proto_msgTypes[72]
+func (x *Snapshot) Reset() {
+	*x = Snapshot{}
+	mi := &file_provider_proto_msgTypes[78]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *Snapshot) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*Snapshot) ProtoMessage() {}
+
+func (x *Snapshot) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[78]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use Snapshot.ProtoReflect.Descriptor instead.
+func (*Snapshot) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{78}
+}
+
+func (x *Snapshot) GetTs() int64 {
+	if x != nil {
+		return x.Ts
+	}
+	return 0
+}
+
+func (x *Snapshot) GetCode() string {
+	if x != nil {
+		return x.Code
+	}
+	return ""
+}
+
+func (x *Snapshot) GetExchange() Exchange {
+	if x != nil {
+		return x.Exchange
+	}
+	return Exchange_EXCHANGE_UNSPECIFIED
+}
+
+func (x *Snapshot) GetOpen() float64 {
+	if x != nil {
+		return x.Open
+	}
+	return 0
+}
+
+func (x *Snapshot) GetHigh() float64 {
+	if x != nil {
+		return x.High
+	}
+	return 0
+}
+
+func (x *Snapshot) GetLow() float64 {
+	if x != nil {
+		return x.Low
+	}
+	return 0
+}
+
+func (x *Snapshot) GetClose() float64 {
+	if x != nil {
+		return x.Close
+	}
+	return 0
+}
+
+func (x *Snapshot) GetChangePrice() float64 {
+	if x != nil {
+		return x.ChangePrice
+	}
+	return 0
+}
+
+func (x *Snapshot) GetChangeRate() float64 {
+	if x != nil {
+		return x.ChangeRate
+	}
+	return 0
+}
+
+func (x *Snapshot) GetAveragePrice() float64 {
+	if x != nil {
+		return x.AveragePrice
+	}
+	return 0
+}
+
+func (x *Snapshot) GetVolume() int64 {
+	if x != nil {
+		return x.Volume
+	}
+	return 0
+}
+
+func (x *Snapshot) GetTotalVolume() int64 {
+	if x != nil {
+		return x.TotalVolume
+	}
+	return 0
+}
+
+func (x *Snapshot) GetAmount() int64 {
+	if x != nil {
+		return x.Amount
+	}
+	return 0
+}
+
+func (x *Snapshot) GetTotalAmount() int64 {
+	if x != nil {
+		return x.TotalAmount
+	}
+	return 0
+}
+
+func (x *Snapshot) GetBuyPrice() float64 {
+	if x != nil {
+		return x.BuyPrice
+	}
+	return 0
+}
+
+func (x *Snapshot) GetBuyVolume() float64 {
+	if x != nil {
+		return x.BuyVolume
+	}
+	return 0
+}
+
+func (x *Snapshot) GetSellPrice() float64 {
+	if x != nil {
+		return x.SellPrice
+	}
+	return 0
+}
+
+func (x *Snapshot) GetSellVolume() int64 {
+	if x != nil {
+		return x.SellVolume
+	}
+	return 0
+}
+
+func (x *Snapshot) GetTickType() TickType {
+	if x != nil {
+		return x.TickType
+	}
+	return TickType_TICK_TYPE_UNSPECIFIED
+}
+
+func (x *Snapshot) GetChangeType() ChangeType {
+	if x != nil {
+		return x.ChangeType
+	}
+	return ChangeType_CHANGE_TYPE_UNSPECIFIED
+}
+
+func (x *Snapshot) GetYesterdayVolume() float64 {
+	if x != nil {
+		return x.YesterdayVolume
+	}
+	return 0
+}
+
+func (x *Snapshot) GetVolumeRatio() float64 {
+	if x != nil {
+		return x.VolumeRatio
+	}
+	return 0
+}
+
+// Request market ticks for a contract and date.
+type GetTicksRequest struct {
+	state        protoimpl.MessageState `protogen:"open.v1"`
+	ContractCode string                 `protobuf:"bytes,1,opt,name=contract_code,json=contractCode,proto3" json:"contract_code,omitempty"`
+	Date         string                 `protobuf:"bytes,2,opt,name=date,proto3" json:"date,omitempty"`        // Date YYYY-MM-DD.
+	Compact      bool                   `protobuf:"varint,3,opt,name=compact,proto3" json:"compact,omitempty"` // Optional: answer with the compact encoding of Ticks.
+	// Optional: return at most this many ticks (at least 4), keeping the first,
+	// last, lowest and highest tick of equal-sized buckets so charts keep their shape.
+	MaxPoints     int32 `protobuf:"varint,4,opt,name=max_points,json=maxPoints,proto3" json:"max_points,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetTicksRequest) Reset() {
+	*x = GetTicksRequest{}
+	mi := &file_provider_proto_msgTypes[79]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetTicksRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetTicksRequest) ProtoMessage() {}
+
+func (x *GetTicksRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[79]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetTicksRequest.ProtoReflect.Descriptor instead.
+func (*GetTicksRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{79}
+}
+
+func (x *GetTicksRequest) GetContractCode() string {
+	if x != nil {
+		return x.ContractCode
+	}
+	return ""
+}
+
+func (x *GetTicksRequest) GetDate() string {
+	if x != nil {
+		return x.Date
+	}
+	return ""
+}
+
+func (x *GetTicksRequest) GetCompact() bool {
+	if x != nil {
+		return x.Compact
+	}
+	return false
+}
+
+func (x *GetTicksRequest) GetMaxPoints() int32 {
+	if x != nil {
+		return x.MaxPoints
+	}
+	return 0
+}
+
+// Sequential trade-by-trade market data.
+// 逐筆報價
+type Ticks struct {
+	state     protoimpl.MessageState `protogen:"open.v1"`
+	Ts        []int64                `protobuf:"varint,1,rep,packed,name=ts,proto3" json:"ts,omitempty"`                                // Timestamps.
+	Close     []float64              `protobuf:"fixed64,2,rep,packed,name=close,proto3" json:"close,omitempty"`                         // Execution prices.
+	Volume    []int64                `protobuf:"varint,3,rep,packed,name=volume,proto3" json:"volume,omitempty"`                        // Execution volumes.
+	BidPrice  []float64              `protobuf:"fixed64,4,rep,packed,name=bid_price,json=bidPrice,proto3" json:"bid_price,omitempty"`   // Best bid at time of tick.
+	BidVolume []int64                `protobuf:"varint,5,rep,packed,name=bid_volume,json=bidVolume,proto3" json:"bid_volume,omitempty"` // Best bid volume.
+	AskPrice  []float64              `protobuf:"fixed64,6,rep,packed,name=ask_price,json=askPrice,proto3" json:"ask_price,omitempty"`   // Best ask at time of tick.
+	AskVolume []int64                `protobuf:"varint,7,rep,packed,name=ask_volume,json=askVolume,proto3" json:"ask_volume,omitempty"` // Best ask volume.
+	TickType  []int32                `protobuf:"varint,8,rep,packed,name=tick_type,json=tickType,proto3" json:"tick_type,omitempty"`    // Tick type indicators.
+	// Compact encoding, used instead of ts, close, bid_price and ask_price when
+	// the request sets compact. A running sum of ts_delta times ts_unit gives
+	// ts; a running sum of a price's delta gives its step count n on price_grid.
+	// If the prices fit no grid, price_grid is unset and they stay in their
+	// plain columns.
+	TsDelta       []int64    `protobuf:"zigzag64,9,rep,packed,name=ts_delta,json=tsDelta,proto3" json:"ts_delta,omitempty"`
+	PriceGrid     *PriceGrid `protobuf:"bytes,10,opt,name=price_grid,json=priceGrid,proto3" json:"price_grid,omitempty"`
+	CloseDelta    []int64    `protobuf:"zigzag64,11,rep,packed,name=close_delta,json=closeDelta,proto3" json:"close_delta,omitempty"`
+	BidPriceDelta []int64    `protobuf:"zigzag64,12,rep,packed,name=bid_price_delta,json=bidPriceDelta,proto3" json:"bid_price_delta,omitempty"`
+	AskPriceDelta []int64    `protobuf:"zigzag64,13,rep,packed,name=ask_price_delta,json=askPriceDelta,proto3" json:"ask_price_delta,omitempty"`
+	TsUnit        int64      `protobuf:"varint,14,opt,name=ts_unit,json=tsUnit,proto3" json:"ts_unit,omitempty"` // Nanoseconds per ts_delta step.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *Ticks) Reset() {
+	*x = Ticks{}
+	mi := &file_provider_proto_msgTypes[80]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *Ticks) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*Ticks) ProtoMessage() {}
+
+func (x *Ticks) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[80]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use Ticks.ProtoReflect.Descriptor instead.
+func (*Ticks) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{80}
+}
+
+func (x *Ticks) GetTs() []int64 {
+	if x != nil {
+		return x.Ts
+	}
+	return nil
+}
+
+func (x *Ticks) GetClose() []float64 {
+	if x != nil {
+		return x.Close
+	}
+	return nil
+}
+
+func (x *Ticks) GetVolume() []int64 {
+	if x != nil {
+		return x.Volume
+	}
+	return nil
+}
+
+func (x *Ticks) GetBidPrice() []float64 {
+	if x != nil {
+		return x.BidPrice
+	}
+	return nil
+}
+
+func (x *Ticks) GetBidVolume() []int64 {
+	if x != nil {
+		return x.BidVolume
+	}
+	return nil
+}
+
+func (x *Ticks) GetAskPrice() []float64 {
+	if x != nil {
+		return x.AskPrice
+	}
+	return nil
+}
+
+func (x *Ticks) GetAskVolume() []int64 {
+	if x != nil {
+		return x.AskVolume
+	}
+	return nil
+}
+
+func (x *Ticks) GetTickType() []int32 {
+	if x != nil {
+		return x.TickType
+	}
+	return nil
+}
+
+func (x *Ticks) GetTsDelta() []int64 {
+	if x != nil {
+		return x.TsDelta
+	}
+	return nil
+}
+
+func (x *Ticks) GetPriceGrid() *PriceGrid {
+	if x != nil {
+		return x.PriceGrid
+	}
+	return nil
+}
+
+func (x *Ticks) GetCloseDelta() []int64 {
+	if x != nil {
+		return x.CloseDelta
+	}
+	return nil
+}
+
+func (x *Ticks) GetBidPriceDelta() []int64 {
+	if x != nil {
+		return x.BidPriceDelta
+	}
+	return nil
+}
+
+func (x *Ticks) GetAskPriceDelta() []int64 {
+	if x != nil {
+		return x.AskPriceDelta
+	}
+	return nil
+}
+
+func (x *Ticks) GetTsUnit() int64 {
+	if x != nil {
+		return x.TsUnit
+	}
+	return 0
+}
+
+// Decimal grid of the prices in a compact Ticks or Kbars message:
+// price = (base + n * unit) / 10^decimals.
+type PriceGrid struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Decimals      int32                  `protobuf:"varint,1,opt,name=decimals,proto3" json:"decimals,omitempty"`
+	Base          int64                  `protobuf:"varint,2,opt,name=base,proto3" json:"base,omitempty"`
+	Unit          int64                  `protobuf:"varint,3,opt,name=unit,proto3" json:"unit,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *PriceGrid) Reset() {
+	*x = PriceGrid{}
+	mi := &file_provider_proto_msgTypes[81]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *PriceGrid) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*PriceGrid) ProtoMessage() {}
+
+func (x *PriceGrid) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[81]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use PriceGrid.ProtoReflect.Descriptor instead.
+func (*PriceGrid) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{81}
+}
+
+func (x *PriceGrid) GetDecimals() int32 {
+	if x != nil {
+		return x.Decimals
+	}
+	return 0
+}
+
+func (x *PriceGrid) GetBase() int64 {
+	if x != nil {
+		return x.Base
+	}
+	return 0
+}
+
+func (x *PriceGrid) GetUnit() int64 {
+	if x != nil {
+		return x.Unit
+	}
+	return 0
+}
+
+// Request K-bar data for a contract and date range.
+type GetKbarsRequest struct {
+	state        protoimpl.MessageState `protogen:"open.v1"`
+	ContractCode string                 `protobuf:"bytes,1,opt,name=contract_code,json=contractCode,proto3" json:"contract_code,omitempty"`
+	StartDate    string                 `protobuf:"bytes,2,opt,name=start_date,json=startDate,proto3" json:"start_date,omitempty"` // YYYY-MM-DD.
+	EndDate      string                 `protobuf:"bytes,3,opt,name=end_date,json=endDate,proto3" json:"end_date,omitempty"`       // YYYY-MM-DD.
+	StartTs      int64                  `protobuf:"varint,4,opt,name=start_ts,json=startTs,proto3" json:"start_ts,omitempty"`      // Optional: only bars at or after this timestamp (same clock as Kbars.ts).
+	EndTs        int64                  `protobuf:"varint,5,opt,name=end_ts,json=endTs,proto3" json:"end_ts,omitempty"`            // Optional: only bars at or before this timestamp.
+	Compact      bool                   `protobuf:"varint,6,opt,name=compact,proto3" json:"compact,omitempty"`                     // Optional: answer with the compact encoding of Kbars.
+	// Optional: aggregate the 1-minute bars into N-minute bars counted from each
+	// session's open (TAIFEX day and night sessions, TWSE); 1440 or more gives one
+	// bar per trading day, a TAIFEX night session joining the day it settles with.
+	ResampleMinutes int32 `protobuf:"varint,7,opt,name=resample_minutes,json=resampleMinutes,proto3" json:"resample_minutes,omitempty"`
+	// Optional: return at most this many bars, merging runs of consecutive bars
+	// (after resampling) into one bar with their OHLC envelope and total volume.
+	MaxPoints     int32 `protobuf:"varint,8,opt,name=max_points,json=maxPoints,proto3" json:"max_points,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetKbarsRequest) Reset() {
+	*x = GetKbarsRequest{}
+	mi := &file_provider_proto_msgTypes[82]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetKbarsRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetKbarsRequest) ProtoMessage() {}
+
+func (x *GetKbarsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[82]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetKbarsRequest.ProtoReflect.Descriptor instead.
+func (*GetKbarsRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{82}
+}
+
+func (x *GetKbarsRequest) GetContractCode() string {
+	if x != nil {
+		return x.ContractCode
+	}
+	return ""
+}
+
+func (x *GetKbarsRequest) GetStartDate() string {
+	if x != nil {
+		return x.StartDate
+	}
+	return ""
+}
+
+func (x *GetKbarsRequest) GetEndDate() string {
+	if x != nil {
+		return x.EndDate
+	}
+	return ""
+}
+
+func (x *GetKbarsRequest) GetStartTs() int64 {
+	if x != nil {
+		return x.StartTs
+	}
+	return 0
+}
+
+func (x *GetKbarsRequest) GetEndTs() int64 {
+	if x != nil {
+		return x.EndTs
+	}
+	return 0
+}
+
+func (x *GetKbarsRequest) GetCompact() bool {
+	if x != nil {
+		return x.Compact
+	}
+	return false
+}
+
+func (x *GetKbarsRequest) GetResampleMinutes() int32 {
+	if x != nil {
+		return x.ResampleMinutes
+	}
+	return 0
+}
+
+func (x *GetKbarsRequest) GetMaxPoints() int32 {
+	if x != nil {
+		return x.MaxPoints
+	}
+	return 0
+}
+
+// Request K-bars of many contracts.
+type GetKbarsBatchRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	ContractCodes []string               `protobuf:"bytes,1,rep,name=contract_codes,json=contractCodes,proto3" json:"contract_codes,omitempty"`
+	Query         *GetKbarsRequest       `protobuf:"bytes,2,opt,name=query,proto3" json:"query,omitempty"`              // Dates and options for every contract; contract_code is ignored.
+	Parallelism   int32                  `protobuf:"varint,3,opt,name=parallelism,proto3" json:"parallelism,omitempty"` // Max contracts fetched at once (0 = server default; capped by the server).
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetKbarsBatchRequest) Reset() {
+	*x = GetKbarsBatchRequest{}
+	mi := &file_provider_proto_msgTypes[83]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetKbarsBatchRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetKbarsBatchRequest) ProtoMessage() {}
+
+func (x *GetKbarsBatchRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[83]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetKbarsBatchRequest.ProtoReflect.Descriptor instead.
+func (*GetKbarsBatchRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{83}
+}
+
+func (x *GetKbarsBatchRequest) GetContractCodes() []string {
+	if x != nil {
+		return x.ContractCodes
+	}
+	return nil
+}
+
+func (x *GetKbarsBatchRequest) GetQuery() *GetKbarsRequest {
+	if x != nil {
+		return x.Query
+	}
+	return nil
+}
+
+func (x *GetKbarsBatchRequest) GetParallelism() int32 {
+	if x != nil {
+		return x.Parallelism
+	}
+	return 0
+}
+
+// K-bars of one contract of a batch.
+type KbarsBatchResult struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	ContractCode  string                 `protobuf:"bytes,1,opt,name=contract_code,json=contractCode,proto3" json:"contract_code,omitempty"`
+	Kbars         *Kbars                 `protobuf:"bytes,2,opt,name=kbars,proto3" json:"kbars,omitempty"`
+	Error         string                 `protobuf:"bytes,3,opt,name=error,proto3" json:"error,omitempty"` // Failure reason, empty on success.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *KbarsBatchResult) Reset() {
+	*x = KbarsBatchResult{}
+	mi := &file_provider_proto_msgTypes[84]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *KbarsBatchResult) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*KbarsBatchResult) ProtoMessage() {}
+
+func (x *KbarsBatchResult) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[84]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use KbarsBatchResult.ProtoReflect.Descriptor instead.
+func (*KbarsBatchResult) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{84}
+}
+
+func (x *KbarsBatchResult) GetContractCode() string {
+	if x != nil {
+		return x.ContractCode
+	}
+	return ""
+}
+
+func (x *KbarsBatchResult) GetKbars() *Kbars {
+	if x != nil {
+		return x.Kbars
+	}
+	return nil
+}
+
+func (x *KbarsBatchResult) GetError() string {
+	if x != nil {
+		return x.Error
+	}
+	return ""
+}
+
+// Request chunked historical ticks.
+type StreamHistoricalTicksRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Query         *GetTicksRequest       `protobuf:"bytes,1,opt,name=query,proto3" json:"query,omitempty"`
+	ChunkSize     int32                  `protobuf:"varint,2,opt,name=chunk_size,json=chunkSize,proto3" json:"chunk_size,omitempty"` // Optional: rows per message (default 10000).
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *StreamHistoricalTicksRequest) Reset() {
+	*x = StreamHistoricalTicksRequest{}
+	mi := &file_provider_proto_msgTypes[85]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *StreamHistoricalTicksRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*StreamHistoricalTicksRequest) ProtoMessage() {}
+
+func (x *StreamHistoricalTicksRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[85]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use StreamHistoricalTicksRequest.ProtoReflect.Descriptor instead.
+func (*StreamHistoricalTicksRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{85}
+}
+
+func (x *StreamHistoricalTicksRequest) GetQuery() *GetTicksRequest {
+	if x != nil {
+		return x.Query
+	}
+	return nil
+}
+
+func (x *StreamHistoricalTicksRequest) GetChunkSize() int32 {
+	if x != nil {
+		return x.ChunkSize
+	}
+	return 0
+}
+
+// Request chunked historical K-bars.
+type StreamHistoricalKbarsRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Query         *GetKbarsRequest       `protobuf:"bytes,1,opt,name=query,proto3" json:"query,omitempty"`
+	ChunkSize     int32                  `protobuf:"varint,2,opt,name=chunk_size,json=chunkSize,proto3" json:"chunk_size,omitempty"` // Optional: bars per message (default 10000).
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *StreamHistoricalKbarsRequest) Reset() {
+	*x = StreamHistoricalKbarsRequest{}
+	mi := &file_provider_proto_msgTypes[86]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *StreamHistoricalKbarsRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*StreamHistoricalKbarsRequest) ProtoMessage() {}
+
+func (x *StreamHistoricalKbarsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[86]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use StreamHistoricalKbarsRequest.ProtoReflect.Descriptor instead.
+func (*StreamHistoricalKbarsRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{86}
+}
+
+func (x *StreamHistoricalKbarsRequest) GetQuery() *GetKbarsRequest {
+	if x != nil {
+		return x.Query
+	}
+	return nil
+}
+
+func (x *StreamHistoricalKbarsRequest) GetChunkSize() int32 {
+	if x != nil {
+		return x.ChunkSize
+	}
+	return 0
+}
+
+// Candlestick market data (OHLCV).
+// K線資料
+type Kbars struct {
+	state  protoimpl.MessageState `protogen:"open.v1"`
+	Ts     []int64                `protobuf:"varint,1,rep,packed,name=ts,proto3" json:"ts,omitempty"`          // Period timestamps.
+	Open   []float64              `protobuf:"fixed64,2,rep,packed,name=open,proto3" json:"open,omitempty"`     // Open prices.
+	High   []float64              `protobuf:"fixed64,3,rep,packed,name=high,proto3" json:"high,omitempty"`     // High prices.
+	Low    []float64              `protobuf:"fixed64,4,rep,packed,name=low,proto3" json:"low,omitempty"`       // Low prices.
+	Close  []float64              `protobuf:"fixed64,5,rep,packed,name=close,proto3" json:"close,omitempty"`   // Close prices.
+	Volume []int64                `protobuf:"varint,6,rep,packed,name=volume,proto3" json:"volume,omitempty"`  // Total period volumes.
+	Amount []float64              `protobuf:"fixed64,7,rep,packed,name=amount,proto3" json:"amount,omitempty"` // Total period amounts.
+	// Compact encoding, used instead of ts, open, high, low and close when the
+	// request sets compact; decoded as in Ticks.
+	TsDelta       []int64    `protobuf:"zigzag64,8,rep,packed,name=ts_delta,json=tsDelta,proto3" json:"ts_delta,omitempty"`
+	PriceGrid     *PriceGrid `protobuf:"bytes,9,opt,name=price_grid,json=priceGrid,proto3" json:"price_grid,omitempty"`
+	OpenDelta     []int64    `protobuf:"zigzag64,10,rep,packed,name=open_delta,json=openDelta,proto3" json:"open_delta,omitempty"`
+	HighDelta     []int64    `protobuf:"zigzag64,11,rep,packed,name=high_delta,json=highDelta,proto3" json:"high_delta,omitempty"`
+	LowDelta      []int64    `protobuf:"zigzag64,12,rep,packed,name=low_delta,json=lowDelta,proto3" json:"low_delta,omitempty"`
+	CloseDelta    []int64    `protobuf:"zigzag64,13,rep,packed,name=close_delta,json=closeDelta,proto3" json:"close_delta,omitempty"`
+	TsUnit        int64      `protobuf:"varint,14,opt,name=ts_unit,json=tsUnit,proto3" json:"ts_unit,omitempty"` // Nanoseconds per ts_delta step.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *Kbars) Reset() {
+	*x = Kbars{}
+	mi := &file_provider_proto_msgTypes[87]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *Kbars) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*Kbars) ProtoMessage() {}
+
+func (x *Kbars) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[87]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use Kbars.ProtoReflect.Descriptor instead.
+func (*Kbars) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{87}
+}
+
+func (x *Kbars) GetTs() []int64 {
+	if x != nil {
+		return x.Ts
+	}
+	return nil
+}
+
+func (x *Kbars) GetOpen() []float64 {
+	if x != nil {
+		return x.Open
+	}
+	return nil
+}
+
+func (x *Kbars) GetHigh() []float64 {
+	if x != nil {
+		return x.High
+	}
+	return nil
+}
+
+func (x *Kbars) GetLow() []float64 {
+	if x != nil {
+		return x.Low
+	}
+	return nil
+}
+
+func (x *Kbars) GetClose() []float64 {
+	if x != nil {
+		return x.Close
+	}
+	return nil
+}
+
+func (x *Kbars) GetVolume() []int64 {
+	if x != nil {
+		return x.Volume
+	}
+	return nil
+}
+
+func (x *Kbars) GetAmount() []float64 {
+	if x != nil {
+		return x.Amount
+	}
+	return nil
+}
+
+func (x *Kbars) GetTsDelta() []int64 {
+	if x != nil {
+		return x.TsDelta
+	}
+	return nil
+}
+
+func (x *Kbars) GetPriceGrid() *PriceGrid {
+	if x != nil {
+		return x.PriceGrid
+	}
+	return nil
+}
+
+func (x *Kbars) GetOpenDelta() []int64 {
+	if x != nil {
+		return x.OpenDelta
+	}
+	return nil
+}
+
+func (x *Kbars) GetHighDelta() []int64 {
+	if x != nil {
+		return x.HighDelta
+	}
+	return nil
+}
+
+func (x *Kbars) GetLowDelta() []int64 {
+	if x != nil {
+		return x.LowDelta
+	}
+	return nil
+}
+
+func (x *Kbars) GetCloseDelta() []int64 {
+	if x != nil {
+		return x.CloseDelta
+	}
+	return nil
+}
+
+func (x *Kbars) GetTsUnit() int64 {
+	if x != nil {
+		return x.TsUnit
+	}
+	return 0
+}
+
+// Request bars aggregated from the ticks of a contract and date.
+type GetTickBarsRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	ContractCode  string                 `protobuf:"bytes,1,opt,name=contract_code,json=contractCode,proto3" json:"contract_code,omitempty"`
+	Date          string                 `protobuf:"bytes,2,opt,name=date,proto3" json:"date,omitempty"` // Date YYYY-MM-DD.
+	Type          TickBarType            `protobuf:"varint,3,opt,name=type,proto3,enum=v1.TickBarType" json:"type,omitempty"`
+	Size          int64                  `protobuf:"varint,4,opt,name=size,proto3" json:"size,omitempty"`       // Seconds (time), volume (volume) or ticks (tick count) per bar.
+	Compact       bool                   `protobuf:"varint,5,opt,name=compact,proto3" json:"compact,omitempty"` // Optional: answer with the compact encoding of Kbars.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetTickBarsRequest) Reset() {
+	*x = GetTickBarsRequest{}
+	mi := &file_provider_proto_msgTypes[88]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetTickBarsRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetTickBarsRequest) ProtoMessage() {}
+
+func (x *GetTickBarsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[88]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetTickBarsRequest.ProtoReflect.Descriptor instead.
+func (*GetTickBarsRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{88}
+}
+
+func (x *GetTickBarsRequest) GetContractCode() string {
+	if x != nil {
+		return x.ContractCode
+	}
+	return ""
+}
+
+func (x *GetTickBarsRequest) GetDate() string {
+	if x != nil {
+		return x.Date
+	}
+	return ""
+}
+
+func (x *GetTickBarsRequest) GetType() TickBarType {
+	if x != nil {
+		return x.Type
+	}
+	return TickBarType_TICK_BAR_TYPE_UNSPECIFIED
+}
+
+func (x *GetTickBarsRequest) GetSize() int64 {
+	if x != nil {
+		return x.Size
+	}
+	return 0
+}
+
+func (x *GetTickBarsRequest) GetCompact() bool {
+	if x != nil {
+		return x.Compact
+	}
+	return false
+}
+
+// Request a summary of the ticks of a contract and date.
+type GetTickAnalyticsRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	ContractCode  string                 `protobuf:"bytes,1,opt,name=contract_code,json=contractCode,proto3" json:"contract_code,omitempty"`
+	Date          string                 `protobuf:"bytes,2,opt,name=date,proto3" json:"date,omitempty"`                       // Date YYYY-MM-DD.
+	StartTs       int64                  `protobuf:"varint,3,opt,name=start_ts,json=startTs,proto3" json:"start_ts,omitempty"` // Optional: only ticks at or after this timestamp (same clock as Ticks.ts).
+	EndTs         int64                  `protobuf:"varint,4,opt,name=end_ts,json=endTs,proto3" json:"end_ts,omitempty"`       // Optional: only ticks at or before this timestamp.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetTickAnalyticsRequest) Reset() {
+	*x = GetTickAnalyticsRequest{}
+	mi := &file_provider_proto_msgTypes[89]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetTickAnalyticsRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetTickAnalyticsRequest) ProtoMessage() {}
+
+func (x *GetTickAnalyticsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[89]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetTickAnalyticsRequest.ProtoReflect.Descriptor instead.
+func (*GetTickAnalyticsRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{89}
+}
+
+func (x *GetTickAnalyticsRequest) GetContractCode() string {
+	if x != nil {
+		return x.ContractCode
+	}
+	return ""
+}
+
+func (x *GetTickAnalyticsRequest) GetDate() string {
+	if x != nil {
+		return x.Date
+	}
+	return ""
+}
+
+func (x *GetTickAnalyticsRequest) GetStartTs() int64 {
+	if x != nil {
+		return x.StartTs
+	}
+	return 0
+}
+
+func (x *GetTickAnalyticsRequest) GetEndTs() int64 {
+	if x != nil {
+		return x.EndTs
+	}
+	return 0
+}
+
+// Summary of the ticks in a range.
+// 逐筆資料統計
+type TickAnalytics struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Ticks         int64                  `protobuf:"varint,1,opt,name=ticks,proto3" json:"ticks,omitempty"`                             // Number of ticks.
+	Volume        int64                  `protobuf:"varint,2,opt,name=volume,proto3" json:"volume,omitempty"`                           // Total volume.
+	Vwap          float64                `protobuf:"fixed64,3,opt,name=vwap,proto3" json:"vwap,omitempty"`                              // Volume-weighted average price.
+	Open          float64                `protobuf:"fixed64,4,opt,name=open,proto3" json:"open,omitempty"`                              // First price.
+	High          float64                `protobuf:"fixed64,5,opt,name=high,proto3" json:"high,omitempty"`                              // Highest price.
+	Low           float64                `protobuf:"fixed64,6,opt,name=low,proto3" json:"low,omitempty"`                                // Lowest price.
+	Close         float64                `protobuf:"fixed64,7,opt,name=close,proto3" json:"close,omitempty"`                            // Last price.
+	BuyVolume     int64                  `protobuf:"varint,8,opt,name=buy_volume,json=buyVolume,proto3" json:"buy_volume,omitempty"`    // Volume traded at the ask (tick_type 1). 外盤量
+	SellVolume    int64                  `protobuf:"varint,9,opt,name=sell_volume,json=sellVolume,proto3" json:"sell_volume,omitempty"` // Volume traded at the bid (tick_type 2). 內盤量
+	FirstTs       int64                  `protobuf:"varint,10,opt,name=first_ts,json=firstTs,proto3" json:"first_ts,omitempty"`         // Timestamp of the first tick.
+	LastTs        int64                  `protobuf:"varint,11,opt,name=last_ts,json=lastTs,proto3" json:"last_ts,omitempty"`            // Timestamp of the last tick.
+	Levels        []*PriceVolume         `protobuf:"bytes,12,rep,name=levels,proto3" json:"levels,omitempty"`                           // Volume at each traded price, ascending.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *TickAnalytics) Reset() {
+	*x = TickAnalytics{}
+	mi := &file_provider_proto_msgTypes[90]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *TickAnalytics) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*TickAnalytics) ProtoMessage() {}
+
+func (x *TickAnalytics) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[90]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use TickAnalytics.ProtoReflect.Descriptor instead.
+func (*TickAnalytics) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{90}
+}
+
+func (x *TickAnalytics) GetTicks() int64 {
+	if x != nil {
+		return x.Ticks
+	}
+	return 0
+}
+
+func (x *TickAnalytics) GetVolume() int64 {
+	if x != nil {
+		return x.Volume
+	}
+	return 0
+}
+
+func (x *TickAnalytics) GetVwap() float64 {
+	if x != nil {
+		return x.Vwap
+	}
+	return 0
+}
+
+func (x *TickAnalytics) GetOpen() float64 {
+	if x != nil {
+		return x.Open
+	}
+	return 0
+}
+
+func (x *TickAnalytics) GetHigh() float64 {
+	if x != nil {
+		return x.High
+	}
+	return 0
+}
+
+func (x *TickAnalytics) GetLow() float64 {
+	if x != nil {
+		return x.Low
+	}
+	return 0
+}
+
+func (x *TickAnalytics) GetClose() float64 {
+	if x != nil {
+		return x.Close
+	}
+	return 0
+}
+
+func (x *TickAnalytics) GetBuyVolume() int64 {
+	if x != nil {
+		return x.BuyVolume
+	}
+	return 0
+}
+
+func (x *TickAnalytics) GetSellVolume() int64 {
+	if x != nil {
+		return x.SellVolume
+	}
+	return 0
+}
+
+func (x *TickAnalytics) GetFirstTs() int64 {
+	if x != nil {
+		return x.FirstTs
+	}
+	return 0
+}
+
+func (x *TickAnalytics) GetLastTs() int64 {
+	if x != nil {
+		return x.LastTs
+	}
+	return 0
+}
+
+func (x *TickAnalytics) GetLevels() []*PriceVolume {
+	if x != nil {
+		return x.Levels
+	}
+	return nil
+}
+
+// Volume traded at one price.
+type PriceVolume struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Price         float64                `protobuf:"fixed64,1,opt,name=price,proto3" json:"price,omitempty"`
+	Volume        int64                  `protobuf:"varint,2,opt,name=volume,proto3" json:"volume,omitempty"`
+	BuyVolume     int64                  `protobuf:"varint,3,opt,name=buy_volume,json=buyVolume,proto3" json:"buy_volume,omitempty"`    // Traded at the ask.
+	SellVolume    int64                  `protobuf:"varint,4,opt,name=sell_volume,json=sellVolume,proto3" json:"sell_volume,omitempty"` // Traded at the bid.
+	Ticks         int64                  `protobuf:"varint,5,opt,name=ticks,proto3" json:"ticks,omitempty"`                             // Number of ticks.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *PriceVolume) Reset() {
+	*x = PriceVolume{}
+	mi := &file_provider_proto_msgTypes[91]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *PriceVolume) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*PriceVolume) ProtoMessage() {}
+
+func (x *PriceVolume) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[91]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use PriceVolume.ProtoReflect.Descriptor instead.
+func (*PriceVolume) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{91}
+}
+
+func (x *PriceVolume) GetPrice() float64 {
+	if x != nil {
+		return x.Price
+	}
+	return 0
+}
+
+func (x *PriceVolume) GetVolume() int64 {
+	if x != nil {
+		return x.Volume
+	}
+	return 0
+}
+
+func (x *PriceVolume) GetBuyVolume() int64 {
+	if x != nil {
+		return x.BuyVolume
+	}
+	return 0
+}
+
+func (x *PriceVolume) GetSellVolume() int64 {
+	if x != nil {
+		return x.SellVolume
+	}
+	return 0
+}
+
+func (x *PriceVolume) GetTicks() int64 {
+	if x != nil {
+		return x.Ticks
+	}
+	return 0
+}
+
+// Request daily quotes for all securities.
+type GetDailyQuotesRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Date          string                 `protobuf:"bytes,1,opt,name=date,proto3" json:"date,omitempty"` // YYYY-MM-DD.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetDailyQuotesRequest) Reset() {
+	*x = GetDailyQuotesRequest{}
+	mi := &file_provider_proto_msgTypes[92]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetDailyQuotesRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetDailyQuotesRequest) ProtoMessage() {}
+
+func (x *GetDailyQuotesRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[92]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetDailyQuotesRequest.ProtoReflect.Descriptor instead.
+func (*GetDailyQuotesRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{92}
+}
+
+func (x *GetDailyQuotesRequest) GetDate() string {
+	if x != nil {
+		return x.Date
+	}
+	return ""
+}
+
+// Daily summary data for a set of securities.
+// 每日報價
+type DailyQuotes struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Code          []string               `protobuf:"bytes,1,rep,name=code,proto3" json:"code,omitempty"`                       // Security codes.
+	Open          []float64              `protobuf:"fixed64,2,rep,packed,name=open,proto3" json:"open,omitempty"`              // Daily open.
+	High          []float64              `protobuf:"fixed64,3,rep,packed,name=high,proto3" json:"high,omitempty"`              // Daily high.
+	Low           []float64              `protobuf:"fixed64,4,rep,packed,name=low,proto3" json:"low,omitempty"`                // Daily low.
+	Close         []float64              `protobuf:"fixed64,5,rep,packed,name=close,proto3" json:"close,omitempty"`            // Daily close.
+	Volume        []int64                `protobuf:"varint,6,rep,packed,name=volume,proto3" json:"volume,omitempty"`           // Daily volume.
+	Date          []string               `protobuf:"bytes,7,rep,name=date,proto3" json:"date,omitempty"`                       // Report dates.
+	Transaction   []int64                `protobuf:"varint,8,rep,packed,name=transaction,proto3" json:"transaction,omitempty"` // Transaction count.
+	Amount        []int64                `protobuf:"varint,9,rep,packed,name=amount,proto3" json:"amount,omitempty"`           // Daily amount.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *DailyQuotes) Reset() {
+	*x = DailyQuotes{}
+	mi := &file_provider_proto_msgTypes[93]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *DailyQuotes) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*DailyQuotes) ProtoMessage() {}
+
+func (x *DailyQuotes) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[93]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use DailyQuotes.ProtoReflect.Descriptor instead.
+func (*DailyQuotes) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{93}
+}
+
+func (x *DailyQuotes) GetCode() []string {
+	if x != nil {
+		return x.Code
+	}
+	return nil
+}
+
+func (x *DailyQuotes) GetOpen() []float64 {
+	if x != nil {
+		return x.Open
+	}
+	return nil
+}
+
+func (x *DailyQuotes) GetHigh() []float64 {
+	if x != nil {
+		return x.High
+	}
+	return nil
+}
+
+func (x *DailyQuotes) GetLow() []float64 {
+	if x != nil {
+		return x.Low
+	}
+	return nil
+}
+
+func (x *DailyQuotes) GetClose() []float64 {
+	if x != nil {
+		return x.Close
+	}
+	return nil
+}
+
+func (x *DailyQuotes) GetVolume() []int64 {
+	if x != nil {
+		return x.Volume
+	}
+	return nil
+}
+
+func (x *DailyQuotes) GetDate() []string {
+	if x != nil {
+		return x.Date
+	}
+	return nil
+}
+
+func (x *DailyQuotes) GetTransaction() []int64 {
+	if x != nil {
+		return x.Transaction
+	}
+	return nil
+}
+
+func (x *DailyQuotes) GetAmount() []int64 {
+	if x != nil {
+		return x.Amount
+	}
+	return nil
+}
+
+// Request credit enquiry for multiple contracts.
+type CreditEnquiresRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	ContractCodes []string               `protobuf:"bytes,1,rep,name=contract_codes,json=contractCodes,proto3" json:"contract_codes,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *CreditEnquiresRequest) Reset() {
+	*x = CreditEnquiresRequest{}
+	mi := &file_provider_proto_msgTypes[94]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *CreditEnquiresRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*CreditEnquiresRequest) ProtoMessage() {}
+
+func (x *CreditEnquiresRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[94]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use CreditEnquiresRequest.ProtoReflect.Descriptor instead.
+func (*CreditEnquiresRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{94}
+}
+
+func (x *CreditEnquiresRequest) GetContractCodes() []string {
+	if x != nil {
+		return x.ContractCodes
+	}
+	return nil
+}
+
+// Response containing credit information.
+type CreditEnquiresResponse struct {
+	state          protoimpl.MessageState `protogen:"open.v1"`
+	CreditEnquires []*CreditEnquire       `protobuf:"bytes,1,rep,name=credit_enquires,json=creditEnquires,proto3" json:"credit_enquires,omitempty"`
+	unknownFields  protoimpl.UnknownFields
+	sizeCache      protoimpl.SizeCache
+}
+
+func (x *CreditEnquiresResponse) Reset() {
+	*x = CreditEnquiresResponse{}
+	mi := &file_provider_proto_msgTypes[95]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *CreditEnquiresResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*CreditEnquiresResponse) ProtoMessage() {}
+
+func (x *CreditEnquiresResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[95]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use CreditEnquiresResponse.ProtoReflect.Descriptor instead.
+func (*CreditEnquiresResponse) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{95}
+}
+
+func (x *CreditEnquiresResponse) GetCreditEnquires() []*CreditEnquire {
+	if x != nil {
+		return x.CreditEnquires
+	}
+	return nil
+}
+
+// Credit availability for margin trading or short selling.
+// 信用交易查詢
+type CreditEnquire struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	StockId       string                 `protobuf:"bytes,1,opt,name=stock_id,json=stockId,proto3" json:"stock_id,omitempty"`           // Security code.
+	MarginUnit    int64                  `protobuf:"varint,2,opt,name=margin_unit,json=marginUnit,proto3" json:"margin_unit,omitempty"` // Available margin units.
+	ShortUnit     int64                  `protobuf:"varint,3,opt,name=short_unit,json=shortUnit,proto3" json:"short_unit,omitempty"`    // Available short selling units.
+	UpdateTime    string                 `protobuf:"bytes,4,opt,name=update_time,json=updateTime,proto3" json:"update_time,omitempty"`  // Update timestamp.
+	System        string                 `protobuf:"bytes,5,opt,name=system,proto3" json:"system,omitempty"`                            // System code.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *CreditEnquire) Reset() {
+	*x = CreditEnquire{}
+	mi := &file_provider_proto_msgTypes[96]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *CreditEnquire) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*CreditEnquire) ProtoMessage() {}
+
+func (x *CreditEnquire) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[96]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use CreditEnquire.ProtoReflect.Descriptor instead.
+func (*CreditEnquire) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{96}
+}
+
+func (x *CreditEnquire) GetStockId() string {
+	if x != nil {
+		return x.StockId
+	}
+	return ""
+}
+
+func (x *CreditEnquire) GetMarginUnit() int64 {
+	if x != nil {
+		return x.MarginUnit
+	}
+	return 0
+}
+
+func (x *CreditEnquire) GetShortUnit() int64 {
+	if x != nil {
+		return x.ShortUnit
+	}
+	return 0
+}
+
+func (x *CreditEnquire) GetUpdateTime() string {
+	if x != nil {
+		return x.UpdateTime
+	}
+	return ""
+}
+
+func (x *CreditEnquire) GetSystem() string {
+	if x != nil {
+		return x.System
+	}
+	return ""
+}
+
+// Request for short stock source availability.
+type GetShortStockSourcesRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	ContractCodes []string               `protobuf:"bytes,1,rep,name=contract_codes,json=contractCodes,proto3" json:"contract_codes,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetShortStockSourcesRequest) Reset() {
+	*x = GetShortStockSourcesRequest{}
+	mi := &file_provider_proto_msgTypes[97]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetShortStockSourcesRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetShortStockSourcesRequest) ProtoMessage() {}
+
+func (x *GetShortStockSourcesRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[97]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetShortStockSourcesRequest.ProtoReflect.Descriptor instead.
+func (*GetShortStockSourcesRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{97}
+}
+
+func (x *GetShortStockSourcesRequest) GetContractCodes() []string {
+	if x != nil {
+		return x.ContractCodes
+	}
+	return nil
+}
+
+// Response for short stock sources.
+type GetShortStockSourcesResponse struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Sources       []*ShortStockSource    `protobuf:"bytes,1,rep,name=sources,proto3" json:"sources,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetShortStockSourcesResponse) Reset() {
+	*x = GetShortStockSourcesResponse{}
+	mi := &file_provider_proto_msgTypes[98]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetShortStockSourcesResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetShortStockSourcesResponse) ProtoMessage() {}
+
+func (x *GetShortStockSourcesResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[98]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetShortStockSourcesResponse.ProtoReflect.Descriptor instead.
+func (*GetShortStockSourcesResponse) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{98}
+}
+
+func (x *GetShortStockSourcesResponse) GetSources() []*ShortStockSource {
+	if x != nil {
+		return x.Sources
+	}
+	return nil
+}
+
+// Information on available shares for shorting.
+// 借券水源
+type ShortStockSource struct {
+	state            protoimpl.MessageState `protogen:"open.v1"`
+	Code             string                 `protobuf:"bytes,1,opt,name=code,proto3" json:"code,omitempty"`                                                    // Security code.
+	ShortStockSource int64                  `protobuf:"varint,2,opt,name=short_stock_source,json=shortStockSource,proto3" json:"short_stock_source,omitempty"` // Available shorting source volume.
+	Ts               int64                  `protobuf:"varint,3,opt,name=ts,proto3" json:"ts,omitempty"`                                                       // Timestamp.
+	unknownFields    protoimpl.UnknownFields
+	sizeCache        protoimpl.SizeCache
+}
+
+func (x *ShortStockSource) Reset() {
+	*x = ShortStockSource{}
+	mi := &file_provider_proto_msgTypes[99]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ShortStockSource) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ShortStockSource) ProtoMessage() {}
+
+func (x *ShortStockSource) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[99]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ShortStockSource.ProtoReflect.Descriptor instead.
+func (*ShortStockSource) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{99}
+}
+
+func (x *ShortStockSource) GetCode() string {
+	if x != nil {
+		return x.Code
+	}
+	return ""
+}
+
+func (x *ShortStockSource) GetShortStockSource() int64 {
+	if x != nil {
+		return x.ShortStockSource
+	}
+	return 0
+}
+
+func (x *ShortStockSource) GetTs() int64 {
+	if x != nil {
+		return x.Ts
+	}
+	return 0
+}
+
+// Request to run a market scanner.
+type GetScannersRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	ScannerType   ScannerType            `protobuf:"varint,1,opt,name=scanner_type,json=scannerType,proto3,enum=v1.ScannerType" json:"scanner_type,omitempty"` // Ranking criteria (e.g., volume, change).
+	Ascending     bool                   `protobuf:"varint,2,opt,name=ascending,proto3" json:"ascending,omitempty"`                                            // Sort direction.
+	Date          string                 `protobuf:"bytes,3,opt,name=date,proto3" json:"date,omitempty"`                                                       // Date for scanning.
+	Count         int32                  `protobuf:"varint,4,opt,name=count,proto3" json:"count,omitempty"`                                                    // Max number of results.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetScannersRequest) Reset() {
+	*x = GetScannersRequest{}
+	mi := &file_provider_proto_msgTypes[100]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetScannersRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetScannersRequest) ProtoMessage() {}
+
+func (x *GetScannersRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[100]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetScannersRequest.ProtoReflect.Descriptor instead.
+func (*GetScannersRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{100}
+}
+
+func (x *GetScannersRequest) GetScannerType() ScannerType {
+	if x != nil {
+		return x.ScannerType
+	}
+	return ScannerType_SCANNER_TYPE_UNSPECIFIED
+}
+
+func (x *GetScannersRequest) GetAscending() bool {
+	if x != nil {
+		return x.Ascending
+	}
+	return false
+}
+
+func (x *GetScannersRequest) GetDate() string {
+	if x != nil {
+		return x.Date
+	}
+	return ""
+}
+
+func (x *GetScannersRequest) GetCount() int32 {
+	if x != nil {
+		return x.Count
+	}
+	return 0
+}
+
+// Response containing scanner results.
+type GetScannersResponse struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Scanners      []*ScannerItem         `protobuf:"bytes,1,rep,name=scanners,proto3" json:"scanners,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetScannersResponse) Reset() {
+	*x = GetScannersResponse{}
+	mi := &file_provider_proto_msgTypes[101]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetScannersResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetScannersResponse) ProtoMessage() {}
+
+func (x *GetScannersResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[101]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetScannersResponse.ProtoReflect.Descriptor instead.
+func (*GetScannersResponse) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{101}
+}
+
+func (x *GetScannersResponse) GetScanners() []*ScannerItem {
+	if x != nil {
+		return x.Scanners
+	}
+	return nil
+}
+
+// Represents a security matching scanner criteria.
+// 選股器結果
+type ScannerItem struct {
+	state           protoimpl.MessageState `protogen:"open.v1"`
+	Date            string                 `protobuf:"bytes,1,opt,name=date,proto3" json:"date,omitempty"`                                                    // Scan date.
+	Code            string                 `protobuf:"bytes,2,opt,name=code,proto3" json:"code,omitempty"`                                                    // Security code.
+	Name            string                 `protobuf:"bytes,3,opt,name=name,proto3" json:"name,omitempty"`                                                    // Name.
+	Ts              int64                  `protobuf:"varint,4,opt,name=ts,proto3" json:"ts,omitempty"`                                                       // Timestamp.
+	Open            float64                `protobuf:"fixed64,5,opt,name=open,proto3" json:"open,omitempty"`                                                  // Open price.
+	High            float64                `protobuf:"fixed64,6,opt,name=high,proto3" json:"high,omitempty"`                                                  // High.
+	Low             float64                `protobuf:"fixed64,7,opt,name=low,proto3" json:"low,omitempty"`                                                    // Low.
+	Close           float64                `protobuf:"fixed64,8,opt,name=close,proto3" json:"close,omitempty"`                                                // Last close.
+	PriceRange      float64                `protobuf:"fixed64,9,opt,name=price_range,json=priceRange,proto3" json:"price_range,omitempty"`                    // Daily price range.
+	TickType        TickType               `protobuf:"varint,10,opt,name=tick_type,json=tickType,proto3,enum=v1.TickType" json:"tick_type,omitempty"`         // Up/Down.
+	ChangePrice     float64                `protobuf:"fixed64,11,opt,name=change_price,json=changePrice,proto3" json:"change_price,omitempty"`                // Net change.
+	ChangeType      ChangeType             `protobuf:"varint,12,opt,name=change_type,json=changeType,proto3,enum=v1.ChangeType" json:"change_type,omitempty"` // Change indicator.
+	AveragePrice    float64                `protobuf:"fixed64,13,opt,name=average_price,json=averagePrice,proto3" json:"average_price,omitempty"`             // Avg price.
+	Volume          int64                  `protobuf:"varint,14,opt,name=volume,proto3" json:"volume,omitempty"`                                              // Tick volume.
+	TotalVolume     int64                  `protobuf:"varint,15,opt,name=total_volume,json=totalVolume,proto3" json:"total_volume,omitempty"`                 // Total volume.
+	Amount          int64                  `protobuf:"varint,16,opt,name=amount,proto3" json:"amount,omitempty"`                                              // Tick amount.
+	TotalAmount     int64                  `protobuf:"varint,17,opt,name=total_amount,json=totalAmount,proto3" json:"total_amount,omitempty"`                 // Total amount.
+	YesterdayVolume int64                  `protobuf:"varint,18,opt,name=yesterday_volume,json=yesterdayVolume,proto3" json:"yesterday_volume,omitempty"`     // Prev day volume.
+	VolumeRatio     float64                `protobuf:"fixed64,19,opt,name=volume_ratio,json=volumeRatio,proto3" json:"volume_ratio,omitempty"`                // Relative volume.
+	BuyPrice        float64                `protobuf:"fixed64,20,opt,name=buy_price,json=buyPrice,proto3" json:"buy_price,omitempty"`                         // Best bid.
+	BuyVolume       int64                  `protobuf:"varint,21,opt,name=buy_volume,json=buyVolume,proto3" json:"buy_volume,omitempty"`                       // Best bid vol.
+	SellPrice       float64                `protobuf:"fixed64,22,opt,name=sell_price,json=sellPrice,proto3" json:"sell_price,omitempty"`                      // Best ask.
+	SellVolume      int64                  `protobuf:"varint,23,opt,name=sell_volume,json=sellVolume,proto3" json:"sell_volume,omitempty"`                    // Best ask vol.
+	BidOrders       int64                  `protobuf:"varint,24,opt,name=bid_orders,json=bidOrders,proto3" json:"bid_orders,omitempty"`                       // Bid order count.
+	BidVolumes      int64                  `protobuf:"varint,25,opt,name=bid_volumes,json=bidVolumes,proto3" json:"bid_volumes,omitempty"`                    // Total bid vol.
+	AskOrders       int64                  `protobuf:"varint,26,opt,name=ask_orders,json=askOrders,proto3" json:"ask_orders,omitempty"`                       // Ask order count.
+	AskVolumes      int64                  `protobuf:"varint,27,opt,name=ask_volumes,json=askVolumes,proto3" json:"ask_volumes,omitempty"`                    // Total ask vol.
+	RankValue       float64                `protobuf:"fixed64,28,opt,name=rank_value,json=rankValue,proto3" json:"rank_value,omitempty"`                      // Ranking metric value.
+	unknownFields   protoimpl.UnknownFields
+	sizeCache       protoimpl.SizeCache
+}
+
+func (x *ScannerItem) Reset() {
+	*x = ScannerItem{}
+	mi := &file_provider_proto_msgTypes[102]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ScannerItem) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ScannerItem) ProtoMessage() {}
+
+func (x *ScannerItem) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[102]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ScannerItem.ProtoReflect.Descriptor instead.
+func (*ScannerItem) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{102}
+}
+
+func (x *ScannerItem) GetDate() string {
+	if x != nil {
+		return x.Date
+	}
+	return ""
+}
+
+func (x *ScannerItem) GetCode() string {
+	if x != nil {
+		return x.Code
+	}
+	return ""
+}
+
+func (x *ScannerItem) GetName() string {
+	if x != nil {
+		return x.Name
+	}
+	return ""
+}
+
+func (x *ScannerItem) GetTs() int64 {
+	if x != nil {
+		return x.Ts
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetOpen() float64 {
+	if x != nil {
+		return x.Open
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetHigh() float64 {
+	if x != nil {
+		return x.High
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetLow() float64 {
+	if x != nil {
+		return x.Low
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetClose() float64 {
+	if x != nil {
+		return x.Close
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetPriceRange() float64 {
+	if x != nil {
+		return x.PriceRange
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetTickType() TickType {
+	if x != nil {
+		return x.TickType
+	}
+	return TickType_TICK_TYPE_UNSPECIFIED
+}
+
+func (x *ScannerItem) GetChangePrice() float64 {
+	if x != nil {
+		return x.ChangePrice
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetChangeType() ChangeType {
+	if x != nil {
+		return x.ChangeType
+	}
+	return ChangeType_CHANGE_TYPE_UNSPECIFIED
+}
+
+func (x *ScannerItem) GetAveragePrice() float64 {
+	if x != nil {
+		return x.AveragePrice
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetVolume() int64 {
+	if x != nil {
+		return x.Volume
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetTotalVolume() int64 {
+	if x != nil {
+		return x.TotalVolume
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetAmount() int64 {
+	if x != nil {
+		return x.Amount
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetTotalAmount() int64 {
+	if x != nil {
+		return x.TotalAmount
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetYesterdayVolume() int64 {
+	if x != nil {
+		return x.YesterdayVolume
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetVolumeRatio() float64 {
+	if x != nil {
+		return x.VolumeRatio
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetBuyPrice() float64 {
+	if x != nil {
+		return x.BuyPrice
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetBuyVolume() int64 {
+	if x != nil {
+		return x.BuyVolume
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetSellPrice() float64 {
+	if x != nil {
+		return x.SellPrice
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetSellVolume() int64 {
+	if x != nil {
+		return x.SellVolume
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetBidOrders() int64 {
+	if x != nil {
+		return x.BidOrders
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetBidVolumes() int64 {
+	if x != nil {
+		return x.BidVolumes
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetAskOrders() int64 {
+	if x != nil {
+		return x.AskOrders
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetAskVolumes() int64 {
+	if x != nil {
+		return x.AskVolumes
+	}
+	return 0
+}
+
+func (x *ScannerItem) GetRankValue() float64 {
+	if x != nil {
+		return x.RankValue
+	}
+	return 0
+}
+
+// Detailed regulatory status for disposition stocks.
+// 處置股
+type Punish struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Code          []string               `protobuf:"bytes,1,rep,name=code,proto3" json:"code,omitempty"`                                        // Stock codes.
+	StartDate     []string               `protobuf:"bytes,2,rep,name=start_date,json=startDate,proto3" json:"start_date,omitempty"`             // Punishment start.
+	EndDate       []string               `protobuf:"bytes,3,rep,name=end_date,json=endDate,proto3" json:"end_date,omitempty"`                   // Punishment end.
+	Interval      []string               `protobuf:"bytes,4,rep,name=interval,proto3" json:"interval,omitempty"`                                // Trade interval.
+	UpdatedAt     []string               `protobuf:"bytes,5,rep,name=updated_at,json=updatedAt,proto3" json:"updated_at,omitempty"`             // Updated timestamp.
+	UnitLimit     []float64              `protobuf:"fixed64,6,rep,packed,name=unit_limit,json=unitLimit,proto3" json:"unit_limit,omitempty"`    // Order unit limit.
+	TotalLimit    []float64              `protobuf:"fixed64,7,rep,packed,name=total_limit,json=totalLimit,proto3" json:"total_limit,omitempty"` // Total limit.
+	Description   []string               `protobuf:"bytes,8,rep,name=description,proto3" json:"description,omitempty"`                          // Detail description.
+	AnnouncedDate []string               `protobuf:"bytes,9,rep,name=announced_date,json=announcedDate,proto3" json:"announced_date,omitempty"` // Announcement date.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *Punish) Reset() {
+	*x = Punish{}
+	mi := &file_provider_proto_msgTypes[103]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *Snapshot) String() string {
+func (x *Punish) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*Snapshot) ProtoMessage() {}
+func (*Punish) ProtoMessage() {}
 
-func (x *Snapshot) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[72]
+func (x *Punish) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[103]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -6959,189 +9571,225 @@ func (x *Snapshot) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use Snapshot.ProtoReflect.Descriptor instead.
-func (*Snapshot) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{72}
+// Deprecated: Use Punish.ProtoReflect.Descriptor instead.
+func (*Punish) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{103}
 }
 
-func (x *Snapshot) GetTs() int64 {
+func (x *Punish) GetCode() []string {
 	if x != nil {
-		return x.Ts
+		return x.Code
 	}
-	return 0
+	return nil
 }
 
-func (x *Snapshot) GetCode() string {
+func (x *Punish) GetStartDate() []string {
 	if x != nil {
-		return x.Code
+		return x.StartDate
 	}
-	return ""
+	return nil
 }
 
-func (x *Snapshot) GetExchange() Exchange {
+func (x *Punish) GetEndDate() []string {
 	if x != nil {
-		return x.Exchange
+		return x.EndDate
 	}
-	return Exchange_EXCHANGE_UNSPECIFIED
+	return nil
 }
 
-func (x *Snapshot) GetOpen() float64 {
+func (x *Punish) GetInterval() []string {
 	if x != nil {
-		return x.Open
+		return x.Interval
 	}
-	return 0
+	return nil
 }
 
-func (x *Snapshot) GetHigh() float64 {
+func (x *Punish) GetUpdatedAt() []string {
 	if x != nil {
-		return x.High
+		return x.UpdatedAt
 	}
-	return 0
+	return nil
 }
 
-func (x *Snapshot) GetLow() float64 {
+func (x *Punish) GetUnitLimit() []float64 {
 	if x != nil {
-		return x.Low
+		return x.UnitLimit
 	}
-	return 0
+	return nil
 }
 
-func (x *Snapshot) GetClose() float64 {
+func (x *Punish) GetTotalLimit() []float64 {
 	if x != nil {
-		return x.Close
+		return x.TotalLimit
 	}
-	return 0
+	return nil
 }
 
-func (x *Snapshot) GetChangePrice() float64 {
+func (x *Punish) GetDescription() []string {
 	if x != nil {
-		return x.ChangePrice
+		return x.Description
 	}
-	return 0
+	return nil
 }
 
-func (x *Snapshot) GetChangeRate() float64 {
+func (x *Punish) GetAnnouncedDate() []string {
 	if x != nil {
-		return x.ChangeRate
+		return x.AnnouncedDate
 	}
-	return 0
+	return nil
 }
 
-func (x *Snapshot) GetAveragePrice() float64 {
-	if x != nil {
-		return x.AveragePrice
-	}
-	return 0
+// Regulatory notice information for attention stocks.
+// 注意股
+type Notice struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Code          []string               `protobuf:"bytes,1,rep,name=code,proto3" json:"code,omitempty"`                                        // Stock codes.
+	Reason        []string               `protobuf:"bytes,2,rep,name=reason,proto3" json:"reason,omitempty"`                                    // Reason for notice.
+	UpdatedAt     []string               `protobuf:"bytes,3,rep,name=updated_at,json=updatedAt,proto3" json:"updated_at,omitempty"`             // Timestamp.
+	Close         []float64              `protobuf:"fixed64,4,rep,packed,name=close,proto3" json:"close,omitempty"`                             // Triggering close price.
+	AnnouncedDate []string               `protobuf:"bytes,5,rep,name=announced_date,json=announcedDate,proto3" json:"announced_date,omitempty"` // Date of notice.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
 }
 
-func (x *Snapshot) GetVolume() int64 {
-	if x != nil {
-		return x.Volume
-	}
-	return 0
+func (x *Notice) Reset() {
+	*x = Notice{}
+	mi := &file_provider_proto_msgTypes[104]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
 }
 
-func (x *Snapshot) GetTotalVolume() int64 {
-	if x != nil {
-		return x.TotalVolume
-	}
-	return 0
+func (x *Notice) String() string {
+	return protoimpl.X.MessageStringOf(x)
 }
 
-func (x *Snapshot) GetAmount() int64 {
+func (*Notice) ProtoMessage() {}
+
+func (x *Notice) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[104]
 	if x != nil {
-		return x.Amount
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
 	}
-	return 0
+	return mi.MessageOf(x)
 }
 
-func (x *Snapshot) GetTotalAmount() int64 {
-	if x != nil {
-		return x.TotalAmount
-	}
-	return 0
+// Deprecated: Use Notice.ProtoReflect.Descriptor instead.
+func (*Notice) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{104}
 }
 
-func (x *Snapshot) GetBuyPrice() float64 {
+func (x *Notice) GetCode() []string {
 	if x != nil {
-		return x.BuyPrice
+		return x.Code
 	}
-	return 0
+	return nil
 }
 
-func (x *Snapshot) GetBuyVolume() float64 {
+func (x *Notice) GetReason() []string {
 	if x != nil {
-		return x.BuyVolume
+		return x.Reason
 	}
-	return 0
+	return nil
 }
 
-func (x *Snapshot) GetSellPrice() float64 {
+func (x *Notice) GetUpdatedAt() []string {
 	if x != nil {
-		return x.SellPrice
+		return x.UpdatedAt
 	}
-	return 0
+	return nil
 }
 
-func (x *Snapshot) GetSellVolume() int64 {
+func (x *Notice) GetClose() []float64 {
 	if x != nil {
-		return x.SellVolume
+		return x.Close
 	}
-	return 0
+	return nil
 }
 
-func (x *Snapshot) GetTickType() TickType {
+func (x *Notice) GetAnnouncedDate() []string {
 	if x != nil {
-		return x.TickType
+		return x.AnnouncedDate
 	}
-	return TickType_TICK_TYPE_UNSPECIFIED
+	return nil
 }
 
-func (x *Snapshot) GetChangeType() ChangeType {
-	if x != nil {
-		return x.ChangeType
-	}
-	return ChangeType_CHANGE_TYPE_UNSPECIFIED
+// Request for fetching security contracts.
+type FetchContractsRequest struct {
+	state            protoimpl.MessageState `protogen:"open.v1"`
+	ContractDownload bool                   `protobuf:"varint,1,opt,name=contract_download,json=contractDownload,proto3" json:"contract_download,omitempty"` // Whether to perform a full download.
+	unknownFields    protoimpl.UnknownFields
+	sizeCache        protoimpl.SizeCache
 }
 
-func (x *Snapshot) GetYesterdayVolume() float64 {
+func (x *FetchContractsRequest) Reset() {
+	*x = FetchContractsRequest{}
+	mi := &file_provider_proto_msgTypes[105]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *FetchContractsRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*FetchContractsRequest) ProtoMessage() {}
+
+func (x *FetchContractsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[105]
 	if x != nil {
-		return x.YesterdayVolume
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
 	}
-	return 0
+	return mi.MessageOf(x)
 }
 
-func (x *Snapshot) GetVolumeRatio() float64 {
+// Deprecated: Use FetchContractsRequest.ProtoReflect.Descriptor instead.
+func (*FetchContractsRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{105}
+}
+
+func (x *FetchContractsRequest) GetContractDownload() bool {
 	if x != nil {
-		return x.VolumeRatio
+		return x.ContractDownload
 	}
-	return 0
+	return false
 }
 
-// Request market ticks for a contract and date.
-type GetTicksRequest struct {
+// Request for an option chain. Strike bounds of 0 are unbounded.
+type GetOptionChainRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	ContractCode  string                 `protobuf:"bytes,1,opt,name=contract_code,json=contractCode,proto3" json:"contract_code,omitempty"`
-	Date          string                 `protobuf:"bytes,2,opt,name=date,proto3" json:"date,omitempty"` // Date YYYY-MM-DD.
+	Underlying    string                 `protobuf:"bytes,1,opt,name=underlying,proto3" json:"underlying,omitempty"`                            // Option category (e.g., TXO) or underlying code (e.g., 2330).
+	DeliveryMonth string                 `protobuf:"bytes,2,opt,name=delivery_month,json=deliveryMonth,proto3" json:"delivery_month,omitempty"` // Delivery month YYYYMM; empty for every listed month.
+	StrikeMin     float64                `protobuf:"fixed64,3,opt,name=strike_min,json=strikeMin,proto3" json:"strike_min,omitempty"`           // Lowest strike to include.
+	StrikeMax     float64                `protobuf:"fixed64,4,opt,name=strike_max,json=strikeMax,proto3" json:"strike_max,omitempty"`           // Highest strike to include.
+	CenterStrike  float64                `protobuf:"fixed64,5,opt,name=center_strike,json=centerStrike,proto3" json:"center_strike,omitempty"`  // Strike to centre the window on when num_strikes is set.
+	NumStrikes    int32                  `protobuf:"varint,6,opt,name=num_strikes,json=numStrikes,proto3" json:"num_strikes,omitempty"`         // Strikes to include on each side of center_strike (0 = all).
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *GetTicksRequest) Reset() {
-	*x = GetTicksRequest{}
-	mi := &file_provider_proto_msgTypes[73]
+func (x *GetOptionChainRequest) Reset() {
+	*x = GetOptionChainRequest{}
+	mi := &file_provider_proto_msgTypes[106]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *GetTicksRequest) String() string {
+func (x *GetOptionChainRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*GetTicksRequest) ProtoMessage() {}
+func (*GetOptionChainRequest) ProtoMessage() {}
 
-func (x *GetTicksRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[73]
+func (x *GetOptionChainRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[106]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -7152,56 +9800,79 @@ func (x *GetTicksRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use GetTicksRequest.ProtoReflect.Descriptor instead.
-func (*GetTicksRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{73}
+// Deprecated: Use GetOptionChainRequest.ProtoReflect.Descriptor instead.
+func (*GetOptionChainRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{106}
 }
 
-func (x *GetTicksRequest) GetContractCode() string {
+func (x *GetOptionChainRequest) GetUnderlying() string {
 	if x != nil {
-		return x.ContractCode
+		return x.Underlying
 	}
 	return ""
 }
 
-func (x *GetTicksRequest) GetDate() string {
+func (x *GetOptionChainRequest) GetDeliveryMonth() string {
 	if x != nil {
-		return x.Date
+		return x.DeliveryMonth
 	}
 	return ""
 }
 
-// Sequential trade-by-trade market data.
-// 逐筆報價
-type Ticks struct {
+func (x *GetOptionChainRequest) GetStrikeMin() float64 {
+	if x != nil {
+		return x.StrikeMin
+	}
+	return 0
+}
+
+func (x *GetOptionChainRequest) GetStrikeMax() float64 {
+	if x != nil {
+		return x.StrikeMax
+	}
+	return 0
+}
+
+func (x *GetOptionChainRequest) GetCenterStrike() float64 {
+	if x != nil {
+		return x.CenterStrike
+	}
+	return 0
+}
+
+func (x *GetOptionChainRequest) GetNumStrikes() int32 {
+	if x != nil {
+		return x.NumStrikes
+	}
+	return 0
+}
+
+// One strike of an option chain.
+type OptionStrike struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Ts            []int64                `protobuf:"varint,1,rep,packed,name=ts,proto3" json:"ts,omitempty"`                                // Timestamps.
-	Close         []float64              `protobuf:"fixed64,2,rep,packed,name=close,proto3" json:"close,omitempty"`                         // Execution prices.
-	Volume        []int64                `protobuf:"varint,3,rep,packed,name=volume,proto3" json:"volume,omitempty"`                        // Execution volumes.
-	BidPrice      []float64              `protobuf:"fixed64,4,rep,packed,name=bid_price,json=bidPrice,proto3" json:"bid_price,omitempty"`   // Best bid at time of tick.
-	BidVolume     []int64                `protobuf:"varint,5,rep,packed,name=bid_volume,json=bidVolume,proto3" json:"bid_volume,omitempty"` // Best bid volume.
-	AskPrice      []float64              `protobuf:"fixed64,6,rep,packed,name=ask_price,json=askPrice,proto3" json:"ask_price,omitempty"`   // Best ask at time of tick.
-	AskVolume     []int64                `protobuf:"varint,7,rep,packed,name=ask_volume,json=askVolume,proto3" json:"ask_volume,omitempty"` // Best ask volume.
-	TickType      []int32                `protobuf:"varint,8,rep,packed,name=tick_type,json=tickType,proto3" json:"tick_type,omitempty"`    // Tick type indicators.
+	DeliveryMonth string                 `protobuf:"bytes,1,opt,name=delivery_month,json=deliveryMonth,proto3" json:"delivery_month,omitempty"` // Delivery month YYYYMM.
+	StrikePrice   float64                `protobuf:"fixed64,2,opt,name=strike_price,json=strikePrice,proto3" json:"strike_price,omitempty"`     // Strike price.
+	Call          *Contract              `protobuf:"bytes,3,opt,name=call,proto3" json:"call,omitempty"`                                        // Call contract (unset if not listed).
+	Put           *Contract              `protobuf:"bytes,4,opt,name=put,proto3" json:"put,omitempty"`                                          // Put contract (unset if not listed).
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *Ticks) Reset() {
-	*x = Ticks{}
-	mi := &file_provider_proto_msgTypes[74]
+func (x *OptionStrike) Reset() {
+	*x = OptionStrike{}
+	mi := &file_provider_proto_msgTypes[107]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *Ticks) String() string {
+func (x *OptionStrike) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*Ticks) ProtoMessage() {}
+func (*OptionStrike) ProtoMessage() {}
 
-func (x *Ticks) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[74]
+func (x *OptionStrike) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[107]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -7212,92 +9883,111 @@ func (x *Ticks) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use Ticks.ProtoReflect.Descriptor instead.
-func (*Ticks) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{74}
+// Deprecated: Use OptionStrike.ProtoReflect.Descriptor instead.
+func (*OptionStrike) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{107}
 }
 
-func (x *Ticks) GetTs() []int64 {
+func (x *OptionStrike) GetDeliveryMonth() string {
 	if x != nil {
-		return x.Ts
+		return x.DeliveryMonth
 	}
-	return nil
+	return ""
 }
 
-func (x *Ticks) GetClose() []float64 {
+func (x *OptionStrike) GetStrikePrice() float64 {
 	if x != nil {
-		return x.Close
+		return x.StrikePrice
 	}
-	return nil
+	return 0
 }
 
-func (x *Ticks) GetVolume() []int64 {
+func (x *OptionStrike) GetCall() *Contract {
 	if x != nil {
-		return x.Volume
+		return x.Call
 	}
 	return nil
 }
 
-func (x *Ticks) GetBidPrice() []float64 {
+func (x *OptionStrike) GetPut() *Contract {
 	if x != nil {
-		return x.BidPrice
+		return x.Put
 	}
 	return nil
 }
 
-func (x *Ticks) GetBidVolume() []int64 {
-	if x != nil {
-		return x.BidVolume
-	}
-	return nil
+// Option chain ordered by delivery month, then strike.
+// 選擇權鏈
+type OptionChain struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Strikes       []*OptionStrike        `protobuf:"bytes,1,rep,name=strikes,proto3" json:"strikes,omitempty"` // Chain rows.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
 }
 
-func (x *Ticks) GetAskPrice() []float64 {
-	if x != nil {
-		return x.AskPrice
-	}
-	return nil
+func (x *OptionChain) Reset() {
+	*x = OptionChain{}
+	mi := &file_provider_proto_msgTypes[108]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
 }
 
-func (x *Ticks) GetAskVolume() []int64 {
+func (x *OptionChain) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*OptionChain) ProtoMessage() {}
+
+func (x *OptionChain) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[108]
 	if x != nil {
-		return x.AskVolume
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
 	}
-	return nil
+	return mi.MessageOf(x)
 }
 
-func (x *Ticks) GetTickType() []int32 {
+// Deprecated: Use OptionChain.ProtoReflect.Descriptor instead.
+func (*OptionChain) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{108}
+}
+
+func (x *OptionChain) GetStrikes() []*OptionStrike {
 	if x != nil {
-		return x.TickType
+		return x.Strikes
 	}
 	return nil
 }
 
-// Request K-bar data for a contract and date range.
-type GetKbarsRequest struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	ContractCode  string                 `protobuf:"bytes,1,opt,name=contract_code,json=contractCode,proto3" json:"contract_code,omitempty"`
-	StartDate     string                 `protobuf:"bytes,2,opt,name=start_date,json=startDate,proto3" json:"start_date,omitempty"` // YYYY-MM-DD.
-	EndDate       string                 `protobuf:"bytes,3,opt,name=end_date,json=endDate,proto3" json:"end_date,omitempty"`       // YYYY-MM-DD.
-	unknownFields protoimpl.UnknownFields
-	sizeCache     protoimpl.SizeCache
+// Request for contracts matching every non-empty filter; at least one is required.
+type FindContractsRequest struct {
+	state          protoimpl.MessageState `protogen:"open.v1"`
+	Symbol         string                 `protobuf:"bytes,1,opt,name=symbol,proto3" json:"symbol,omitempty"`                                       // Contract symbol (e.g., TSE2330, TXFR1).
+	UnderlyingCode string                 `protobuf:"bytes,2,opt,name=underlying_code,json=underlyingCode,proto3" json:"underlying_code,omitempty"` // Underlying code of a derivative (e.g., 2330).
+	Category       string                 `protobuf:"bytes,3,opt,name=category,proto3" json:"category,omitempty"`                                   // Category (e.g., TXF, TXO, 24 for stocks).
+	DeliveryMonth  string                 `protobuf:"bytes,4,opt,name=delivery_month,json=deliveryMonth,proto3" json:"delivery_month,omitempty"`    // Delivery month YYYYMM of a derivative.
+	unknownFields  protoimpl.UnknownFields
+	sizeCache      protoimpl.SizeCache
 }
 
-func (x *GetKbarsRequest) Reset() {
-	*x = GetKbarsRequest{}
-	mi := &file_provider_proto_msgTypes[75]
+func (x *FindContractsRequest) Reset() {
+	*x = FindContractsRequest{}
+	mi := &file_provider_proto_msgTypes[109]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *GetKbarsRequest) String() string {
+func (x *FindContractsRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*GetKbarsRequest) ProtoMessage() {}
+func (*FindContractsRequest) ProtoMessage() {}
 
-func (x *GetKbarsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[75]
+func (x *FindContractsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[109]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -7308,62 +9998,63 @@ func (x *GetKbarsRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use GetKbarsRequest.ProtoReflect.Descriptor instead.
-func (*GetKbarsRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{75}
+// Deprecated: Use FindContractsRequest.ProtoReflect.Descriptor instead.
+func (*FindContractsRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{109}
 }
 
-func (x *GetKbarsRequest) GetContractCode() string {
+func (x *FindContractsRequest) GetSymbol() string {
 	if x != nil {
-		return x.ContractCode
+		return x.Symbol
 	}
 	return ""
 }
 
-func (x *GetKbarsRequest) GetStartDate() string {
+func (x *FindContractsRequest) GetUnderlyingCode() string {
 	if x != nil {
-		return x.StartDate
+		return x.UnderlyingCode
 	}
 	return ""
 }
 
-func (x *GetKbarsRequest) GetEndDate() string {
+func (x *FindContractsRequest) GetCategory() string {
 	if x != nil {
-		return x.EndDate
+		return x.Category
 	}
 	return ""
 }
 
-// Candlestick market data (OHLCV).
-// K線資料
-type Kbars struct {
+func (x *FindContractsRequest) GetDeliveryMonth() string {
+	if x != nil {
+		return x.DeliveryMonth
+	}
+	return ""
+}
+
+// Contracts matching a FindContractsRequest.
+// 商品查詢結果
+type FindContractsResponse struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Ts            []int64                `protobuf:"varint,1,rep,packed,name=ts,proto3" json:"ts,omitempty"`          // Period timestamps.
-	Open          []float64              `protobuf:"fixed64,2,rep,packed,name=open,proto3" json:"open,omitempty"`     // Open prices.
-	High          []float64              `protobuf:"fixed64,3,rep,packed,name=high,proto3" json:"high,omitempty"`     // High prices.
-	Low           []float64              `protobuf:"fixed64,4,rep,packed,name=low,proto3" json:"low,omitempty"`       // Low prices.
-	Close         []float64              `protobuf:"fixed64,5,rep,packed,name=close,proto3" json:"close,omitempty"`   // Close prices.
-	Volume        []int64                `protobuf:"varint,6,rep,packed,name=volume,proto3" json:"volume,omitempty"`  // Total period volumes.
-	Amount        []float64              `protobuf:"fixed64,7,rep,packed,name=amount,proto3" json:"amount,omitempty"` // Total period amounts.
+	Contracts     []*Contract            `protobuf:"bytes,1,rep,name=contracts,proto3" json:"contracts,omitempty"` // Matching contracts.
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *Kbars) Reset() {
-	*x = Kbars{}
-	mi := &file_provider_proto_msgTypes[76]
+func (x *FindContractsResponse) Reset() {
+	*x = FindContractsResponse{}
+	mi := &file_provider_proto_msgTypes[110]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *Kbars) String() string {
+func (x *FindContractsResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*Kbars) ProtoMessage() {}
+func (*FindContractsResponse) ProtoMessage() {}
 
-func (x *Kbars) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[76]
+func (x *FindContractsResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[110]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -7374,83 +10065,110 @@ func (x *Kbars) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use Kbars.ProtoReflect.Descriptor instead.
-func (*Kbars) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{76}
+// Deprecated: Use FindContractsResponse.ProtoReflect.Descriptor instead.
+func (*FindContractsResponse) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{110}
 }
 
-func (x *Kbars) GetTs() []int64 {
+func (x *FindContractsResponse) GetContracts() []*Contract {
 	if x != nil {
-		return x.Ts
+		return x.Contracts
 	}
 	return nil
 }
 
-func (x *Kbars) GetOpen() []float64 {
-	if x != nil {
-		return x.Open
-	}
-	return nil
+// Request coalescing counters for one RPC method.
+type SingleflightMethodStats struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Method        string                 `protobuf:"bytes,1,opt,name=method,proto3" json:"method,omitempty"`                       // RPC method name.
+	Calls         int64                  `protobuf:"varint,2,opt,name=calls,proto3" json:"calls,omitempty"`                        // Calls that went through the coalescing layer.
+	Shared        int64                  `protobuf:"varint,3,opt,name=shared,proto3" json:"shared,omitempty"`                      // Calls answered by another caller's in-flight request.
+	HitRatio      float64                `protobuf:"fixed64,4,opt,name=hit_ratio,json=hitRatio,proto3" json:"hit_ratio,omitempty"` // shared / calls.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
 }
 
-func (x *Kbars) GetHigh() []float64 {
+func (x *SingleflightMethodStats) Reset() {
+	*x = SingleflightMethodStats{}
+	mi := &file_provider_proto_msgTypes[111]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *SingleflightMethodStats) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SingleflightMethodStats) ProtoMessage() {}
+
+func (x *SingleflightMethodStats) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[111]
 	if x != nil {
-		return x.High
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
 	}
-	return nil
+	return mi.MessageOf(x)
 }
 
-func (x *Kbars) GetLow() []float64 {
+// Deprecated: Use SingleflightMethodStats.ProtoReflect.Descriptor instead.
+func (*SingleflightMethodStats) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{111}
+}
+
+func (x *SingleflightMethodStats) GetMethod() string {
 	if x != nil {
-		return x.Low
+		return x.Method
 	}
-	return nil
+	return ""
 }
 
-func (x *Kbars) GetClose() []float64 {
+func (x *SingleflightMethodStats) GetCalls() int64 {
 	if x != nil {
-		return x.Close
+		return x.Calls
 	}
-	return nil
+	return 0
 }
 
-func (x *Kbars) GetVolume() []int64 {
+func (x *SingleflightMethodStats) GetShared() int64 {
 	if x != nil {
-		return x.Volume
+		return x.Shared
 	}
-	return nil
+	return 0
 }
 
-func (x *Kbars) GetAmount() []float64 {
+func (x *SingleflightMethodStats) GetHitRatio() float64 {
 	if x != nil {
-		return x.Amount
+		return x.HitRatio
 	}
-	return nil
+	return 0
 }
 
-// Request daily quotes for all securities.
-type GetDailyQuotesRequest struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Date          string                 `protobuf:"bytes,1,opt,name=date,proto3" json:"date,omitempty"` // YYYY-MM-DD.
+// Request coalescing counters per method.
+type SingleflightStats struct {
+	state         protoimpl.MessageState     `protogen:"open.v1"`
+	Methods       []*SingleflightMethodStats `protobuf:"bytes,1,rep,name=methods,proto3" json:"methods,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *GetDailyQuotesRequest) Reset() {
-	*x = GetDailyQuotesRequest{}
-	mi := &file_provider_proto_msgTypes[77]
+func (x *SingleflightStats) Reset() {
+	*x = SingleflightStats{}
+	mi := &file_provider_proto_msgTypes[112]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *GetDailyQuotesRequest) String() string {
+func (x *SingleflightStats) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*GetDailyQuotesRequest) ProtoMessage() {}
+func (*SingleflightStats) ProtoMessage() {}
 
-func (x *GetDailyQuotesRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[77]
+func (x *SingleflightStats) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[112]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -7461,50 +10179,43 @@ func (x *GetDailyQuotesRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use GetDailyQuotesRequest.ProtoReflect.Descriptor instead.
-func (*GetDailyQuotesRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{77}
+// Deprecated: Use SingleflightStats.ProtoReflect.Descriptor instead.
+func (*SingleflightStats) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{112}
 }
 
-func (x *GetDailyQuotesRequest) GetDate() string {
+func (x *SingleflightStats) GetMethods() []*SingleflightMethodStats {
 	if x != nil {
-		return x.Date
+		return x.Methods
 	}
-	return ""
+	return nil
 }
 
-// Daily summary data for a set of securities.
-// 每日報價
-type DailyQuotes struct {
+// Request to activate a security certificate.
+type ActivateCARequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Code          []string               `protobuf:"bytes,1,rep,name=code,proto3" json:"code,omitempty"`                       // Security codes.
-	Open          []float64              `protobuf:"fixed64,2,rep,packed,name=open,proto3" json:"open,omitempty"`              // Daily open.
-	High          []float64              `protobuf:"fixed64,3,rep,packed,name=high,proto3" json:"high,omitempty"`              // Daily high.
-	Low           []float64              `protobuf:"fixed64,4,rep,packed,name=low,proto3" json:"low,omitempty"`                // Daily low.
-	Close         []float64              `protobuf:"fixed64,5,rep,packed,name=close,proto3" json:"close,omitempty"`            // Daily close.
-	Volume        []int64                `protobuf:"varint,6,rep,packed,name=volume,proto3" json:"volume,omitempty"`           // Daily volume.
-	Date          []string               `protobuf:"bytes,7,rep,name=date,proto3" json:"date,omitempty"`                       // Report dates.
-	Transaction   []int64                `protobuf:"varint,8,rep,packed,name=transaction,proto3" json:"transaction,omitempty"` // Transaction count.
-	Amount        []int64                `protobuf:"varint,9,rep,packed,name=amount,proto3" json:"amount,omitempty"`           // Daily amount.
+	CaPath        string                 `protobuf:"bytes,1,opt,name=ca_path,json=caPath,proto3" json:"ca_path,omitempty"`       // File path to CA.
+	CaPasswd      string                 `protobuf:"bytes,2,opt,name=ca_passwd,json=caPasswd,proto3" json:"ca_passwd,omitempty"` // CA password.
+	PersonId      string                 `protobuf:"bytes,3,opt,name=person_id,json=personId,proto3" json:"person_id,omitempty"` // Holder's person ID.
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *DailyQuotes) Reset() {
-	*x = DailyQuotes{}
-	mi := &file_provider_proto_msgTypes[78]
+func (x *ActivateCARequest) Reset() {
+	*x = ActivateCARequest{}
+	mi := &file_provider_proto_msgTypes[113]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *DailyQuotes) String() string {
+func (x *ActivateCARequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*DailyQuotes) ProtoMessage() {}
+func (*ActivateCARequest) ProtoMessage() {}
 
-func (x *DailyQuotes) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[78]
+func (x *ActivateCARequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[113]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -7515,97 +10226,55 @@ func (x *DailyQuotes) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use DailyQuotes.ProtoReflect.Descriptor instead.
-func (*DailyQuotes) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{78}
-}
-
-func (x *DailyQuotes) GetCode() []string {
-	if x != nil {
-		return x.Code
-	}
-	return nil
-}
-
-func (x *DailyQuotes) GetOpen() []float64 {
-	if x != nil {
-		return x.Open
-	}
-	return nil
-}
-
-func (x *DailyQuotes) GetHigh() []float64 {
-	if x != nil {
-		return x.High
-	}
-	return nil
-}
-
-func (x *DailyQuotes) GetLow() []float64 {
-	if x != nil {
-		return x.Low
-	}
-	return nil
-}
-
-func (x *DailyQuotes) GetClose() []float64 {
-	if x != nil {
-		return x.Close
-	}
-	return nil
-}
-
-func (x *DailyQuotes) GetVolume() []int64 {
-	if x != nil {
-		return x.Volume
-	}
-	return nil
+// Deprecated: Use ActivateCARequest.ProtoReflect.Descriptor instead.
+func (*ActivateCARequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{113}
 }
 
-func (x *DailyQuotes) GetDate() []string {
+func (x *ActivateCARequest) GetCaPath() string {
 	if x != nil {
-		return x.Date
+		return x.CaPath
 	}
-	return nil
+	return ""
 }
 
-func (x *DailyQuotes) GetTransaction() []int64 {
+func (x *ActivateCARequest) GetCaPasswd() string {
 	if x != nil {
-		return x.Transaction
+		return x.CaPasswd
 	}
-	return nil
+	return ""
 }
 
-func (x *DailyQuotes) GetAmount() []int64 {
+func (x *ActivateCARequest) GetPersonId() string {
 	if x != nil {
-		return x.Amount
+		return x.PersonId
 	}
-	return nil
+	return ""
 }
 
-// Request credit enquiry for multiple contracts.
-type CreditEnquiresRequest struct {
+// Response for CA activation.
+type ActivateCAResponse struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	ContractCodes []string               `protobuf:"bytes,1,rep,name=contract_codes,json=contractCodes,proto3" json:"contract_codes,omitempty"`
+	Success       bool                   `protobuf:"varint,1,opt,name=success,proto3" json:"success,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *CreditEnquiresRequest) Reset() {
-	*x = CreditEnquiresRequest{}
-	mi := &file_provider_proto_msgTypes[79]
+func (x *ActivateCAResponse) Reset() {
+	*x = ActivateCAResponse{}
+	mi := &file_provider_proto_msgTypes[114]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *CreditEnquiresRequest) String() string {
+func (x *ActivateCAResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CreditEnquiresRequest) ProtoMessage() {}
+func (*ActivateCAResponse) ProtoMessage() {}
 
-func (x *CreditEnquiresRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[79]
+func (x *ActivateCAResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[114]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -7616,41 +10285,41 @@ func (x *CreditEnquiresRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CreditEnquiresRequest.ProtoReflect.Descriptor instead.
-func (*CreditEnquiresRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{79}
+// Deprecated: Use ActivateCAResponse.ProtoReflect.Descriptor instead.
+func (*ActivateCAResponse) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{114}
 }
 
-func (x *CreditEnquiresRequest) GetContractCodes() []string {
+func (x *ActivateCAResponse) GetSuccess() bool {
 	if x != nil {
-		return x.ContractCodes
+		return x.Success
 	}
-	return nil
+	return false
 }
 
-// Response containing credit information.
-type CreditEnquiresResponse struct {
-	state          protoimpl.MessageState `protogen:"open.v1"`
-	CreditEnquires []*CreditEnquire       `protobuf:"bytes,1,rep,name=credit_enquires,json=creditEnquires,proto3" json:"credit_enquires,omitempty"`
-	unknownFields  protoimpl.UnknownFields
-	sizeCache      protoimpl.SizeCache
+// Request for checking CA expiration.
+type GetCAExpireTimeRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	PersonId      string                 `protobuf:"bytes,1,opt,name=person_id,json=personId,proto3" json:"person_id,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
 }
 
-func (x *CreditEnquiresResponse) Reset() {
-	*x = CreditEnquiresResponse{}
-	mi := &file_provider_proto_msgTypes[80]
+func (x *GetCAExpireTimeRequest) Reset() {
+	*x = GetCAExpireTimeRequest{}
+	mi := &file_provider_proto_msgTypes[115]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *CreditEnquiresResponse) String() string {
+func (x *GetCAExpireTimeRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CreditEnquiresResponse) ProtoMessage() {}
+func (*GetCAExpireTimeRequest) ProtoMessage() {}
 
-func (x *CreditEnquiresResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[80]
+func (x *GetCAExpireTimeRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[115]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -7661,46 +10330,41 @@ func (x *CreditEnquiresResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CreditEnquiresResponse.ProtoReflect.Descriptor instead.
-func (*CreditEnquiresResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{80}
+// Deprecated: Use GetCAExpireTimeRequest.ProtoReflect.Descriptor instead.
+func (*GetCAExpireTimeRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{115}
 }
 
-func (x *CreditEnquiresResponse) GetCreditEnquires() []*CreditEnquire {
+func (x *GetCAExpireTimeRequest) GetPersonId() string {
 	if x != nil {
-		return x.CreditEnquires
+		return x.PersonId
 	}
-	return nil
+	return ""
 }
 
-// Credit availability for margin trading or short selling.
-// 信用交易查詢
-type CreditEnquire struct {
+// Response containing CA expiration timestamp.
+type GetCAExpireTimeResponse struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	StockId       string                 `protobuf:"bytes,1,opt,name=stock_id,json=stockId,proto3" json:"stock_id,omitempty"`           // Security code.
-	MarginUnit    int64                  `protobuf:"varint,2,opt,name=margin_unit,json=marginUnit,proto3" json:"margin_unit,omitempty"` // Available margin units.
-	ShortUnit     int64                  `protobuf:"varint,3,opt,name=short_unit,json=shortUnit,proto3" json:"short_unit,omitempty"`    // Available short selling units.
-	UpdateTime    string                 `protobuf:"bytes,4,opt,name=update_time,json=updateTime,proto3" json:"update_time,omitempty"`  // Update timestamp.
-	System        string                 `protobuf:"bytes,5,opt,name=system,proto3" json:"system,omitempty"`                            // System code.
+	ExpireTime    string                 `protobuf:"bytes,1,opt,name=expire_time,json=expireTime,proto3" json:"expire_time,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *CreditEnquire) Reset() {
-	*x = CreditEnquire{}
-	mi := &file_provider_proto_msgTypes[81]
+func (x *GetCAExpireTimeResponse) Reset() {
+	*x = GetCAExpireTimeResponse{}
+	mi := &file_provider_proto_msgTypes[116]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *CreditEnquire) String() string {
+func (x *GetCAExpireTimeResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CreditEnquire) ProtoMessage() {}
+func (*GetCAExpireTimeResponse) ProtoMessage() {}
 
-func (x *CreditEnquire) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[81]
+func (x *GetCAExpireTimeResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[116]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -7711,69 +10375,41 @@ func (x *CreditEnquire) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CreditEnquire.ProtoReflect.Descriptor instead.
-func (*CreditEnquire) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{81}
-}
-
-func (x *CreditEnquire) GetStockId() string {
-	if x != nil {
-		return x.StockId
-	}
-	return ""
-}
-
-func (x *CreditEnquire) GetMarginUnit() int64 {
-	if x != nil {
-		return x.MarginUnit
-	}
-	return 0
-}
-
-func (x *CreditEnquire) GetShortUnit() int64 {
-	if x != nil {
-		return x.ShortUnit
-	}
-	return 0
-}
-
-func (x *CreditEnquire) GetUpdateTime() string {
-	if x != nil {
-		return x.UpdateTime
-	}
-	return ""
+// Deprecated: Use GetCAExpireTimeResponse.ProtoReflect.Descriptor instead.
+func (*GetCAExpireTimeResponse) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{116}
 }
 
-func (x *CreditEnquire) GetSystem() string {
+func (x *GetCAExpireTimeResponse) GetExpireTime() string {
 	if x != nil {
-		return x.System
+		return x.ExpireTime
 	}
 	return ""
 }
 
-// Request for short stock source availability.
-type GetShortStockSourcesRequest struct {
+// Request to subscribe to trade execution reports.
+type SubscribeTradeRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	ContractCodes []string               `protobuf:"bytes,1,rep,name=contract_codes,json=contractCodes,proto3" json:"contract_codes,omitempty"`
+	Account       *Account               `protobuf:"bytes,1,opt,name=account,proto3" json:"account,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *GetShortStockSourcesRequest) Reset() {
-	*x = GetShortStockSourcesRequest{}
-	mi := &file_provider_proto_msgTypes[82]
+func (x *SubscribeTradeRequest) Reset() {
+	*x = SubscribeTradeRequest{}
+	mi := &file_provider_proto_msgTypes[117]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *GetShortStockSourcesRequest) String() string {
+func (x *SubscribeTradeRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*GetShortStockSourcesRequest) ProtoMessage() {}
+func (*SubscribeTradeRequest) ProtoMessage() {}
 
-func (x *GetShortStockSourcesRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[82]
+func (x *SubscribeTradeRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[117]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -7784,41 +10420,41 @@ func (x *GetShortStockSourcesRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use GetShortStockSourcesRequest.ProtoReflect.Descriptor instead.
-func (*GetShortStockSourcesRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{82}
+// Deprecated: Use SubscribeTradeRequest.ProtoReflect.Descriptor instead.
+func (*SubscribeTradeRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{117}
 }
 
-func (x *GetShortStockSourcesRequest) GetContractCodes() []string {
+func (x *SubscribeTradeRequest) GetAccount() *Account {
 	if x != nil {
-		return x.ContractCodes
+		return x.Account
 	}
 	return nil
 }
 
-// Response for short stock sources.
-type GetShortStockSourcesResponse struct {
+// Response for trade subscription.
+type SubscribeTradeResponse struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Sources       []*ShortStockSource    `protobuf:"bytes,1,rep,name=sources,proto3" json:"sources,omitempty"`
+	Success       bool                   `protobuf:"varint,1,opt,name=success,proto3" json:"success,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *GetShortStockSourcesResponse) Reset() {
-	*x = GetShortStockSourcesResponse{}
-	mi := &file_provider_proto_msgTypes[83]
+func (x *SubscribeTradeResponse) Reset() {
+	*x = SubscribeTradeResponse{}
+	mi := &file_provider_proto_msgTypes[118]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *GetShortStockSourcesResponse) String() string {
+func (x *SubscribeTradeResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*GetShortStockSourcesResponse) ProtoMessage() {}
+func (*SubscribeTradeResponse) ProtoMessage() {}
 
-func (x *GetShortStockSourcesResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[83]
+func (x *SubscribeTradeResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[118]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -7829,44 +10465,41 @@ func (x *GetShortStockSourcesResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use GetShortStockSourcesResponse.ProtoReflect.Descriptor instead.
-func (*GetShortStockSourcesResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{83}
+// Deprecated: Use SubscribeTradeResponse.ProtoReflect.Descriptor instead.
+func (*SubscribeTradeResponse) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{118}
 }
 
-func (x *GetShortStockSourcesResponse) GetSources() []*ShortStockSource {
+func (x *SubscribeTradeResponse) GetSuccess() bool {
 	if x != nil {
-		return x.Sources
+		return x.Success
 	}
-	return nil
+	return false
 }
 
-// Information on available shares for shorting.
-// 借券水源
-type ShortStockSource struct {
-	state            protoimpl.MessageState `protogen:"open.v1"`
-	Code             string                 `protobuf:"bytes,1,opt,name=code,proto3" json:"code,omitempty"`                                                    // Security code.
-	ShortStockSource int64                  `protobuf:"varint,2,opt,name=short_stock_source,json=shortStockSource,proto3" json:"short_stock_source,omitempty"` // Available shorting source volume.
-	Ts               int64                  `protobuf:"varint,3,opt,name=ts,proto3" json:"ts,omitempty"`                                                       // Timestamp.
-	unknownFields    protoimpl.UnknownFields
-	sizeCache        protoimpl.SizeCache
+// Request to unsubscribe from trade execution reports.
+type UnsubscribeTradeRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Account       *Account               `protobuf:"bytes,1,opt,name=account,proto3" json:"account,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
 }
 
-func (x *ShortStockSource) Reset() {
-	*x = ShortStockSource{}
-	mi := &file_provider_proto_msgTypes[84]
+func (x *UnsubscribeTradeRequest) Reset() {
+	*x = UnsubscribeTradeRequest{}
+	mi := &file_provider_proto_msgTypes[119]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *ShortStockSource) String() string {
+func (x *UnsubscribeTradeRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*ShortStockSource) ProtoMessage() {}
+func (*UnsubscribeTradeRequest) ProtoMessage() {}
 
-func (x *ShortStockSource) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[84]
+func (x *UnsubscribeTradeRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[119]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -7877,58 +10510,41 @@ func (x *ShortStockSource) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use ShortStockSource.ProtoReflect.Descriptor instead.
-func (*ShortStockSource) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{84}
-}
-
-func (x *ShortStockSource) GetCode() string {
-	if x != nil {
-		return x.Code
-	}
-	return ""
-}
-
-func (x *ShortStockSource) GetShortStockSource() int64 {
-	if x != nil {
-		return x.ShortStockSource
-	}
-	return 0
+// Deprecated: Use UnsubscribeTradeRequest.ProtoReflect.Descriptor instead.
+func (*UnsubscribeTradeRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{119}
 }
 
-func (x *ShortStockSource) GetTs() int64 {
+func (x *UnsubscribeTradeRequest) GetAccount() *Account {
 	if x != nil {
-		return x.Ts
+		return x.Account
 	}
-	return 0
+	return nil
 }
 
-// Request to run a market scanner.
-type GetScannersRequest struct {
+// Response for trade unsubscription.
+type UnsubscribeTradeResponse struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	ScannerType   ScannerType            `protobuf:"varint,1,opt,name=scanner_type,json=scannerType,proto3,enum=v1.ScannerType" json:"scanner_type,omitempty"` // Ranking criteria (e.g., volume, change).
-	Ascending     bool                   `protobuf:"varint,2,opt,name=ascending,proto3" json:"ascending,omitempty"`                                            // Sort direction.
-	Date          string                 `protobuf:"bytes,3,opt,name=date,proto3" json:"date,omitempty"`                                                       // Date for scanning.
-	Count         int32                  `protobuf:"varint,4,opt,name=count,proto3" json:"count,omitempty"`                                                    // Max number of results.
+	Success       bool                   `protobuf:"varint,1,opt,name=success,proto3" json:"success,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *GetScannersRequest) Reset() {
-	*x = GetScannersRequest{}
-	mi := &file_provider_proto_msgTypes[85]
+func (x *UnsubscribeTradeResponse) Reset() {
+	*x = UnsubscribeTradeResponse{}
+	mi := &file_provider_proto_msgTypes[120]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *GetScannersRequest) String() string {
+func (x *UnsubscribeTradeResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*GetScannersRequest) ProtoMessage() {}
+func (*UnsubscribeTradeResponse) ProtoMessage() {}
 
-func (x *GetScannersRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[85]
+func (x *UnsubscribeTradeResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[120]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -7939,62 +10555,42 @@ func (x *GetScannersRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use GetScannersRequest.ProtoReflect.Descriptor instead.
-func (*GetScannersRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{85}
-}
-
-func (x *GetScannersRequest) GetScannerType() ScannerType {
-	if x != nil {
-		return x.ScannerType
-	}
-	return ScannerType_SCANNER_TYPE_UNSPECIFIED
+// Deprecated: Use UnsubscribeTradeResponse.ProtoReflect.Descriptor instead.
+func (*UnsubscribeTradeResponse) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{120}
 }
 
-func (x *GetScannersRequest) GetAscending() bool {
+func (x *UnsubscribeTradeResponse) GetSuccess() bool {
 	if x != nil {
-		return x.Ascending
+		return x.Success
 	}
 	return false
 }
 
-func (x *GetScannersRequest) GetDate() string {
-	if x != nil {
-		return x.Date
-	}
-	return ""
-}
-
-func (x *GetScannersRequest) GetCount() int32 {
-	if x != nil {
-		return x.Count
-	}
-	return 0
-}
-
-// Response containing scanner results.
-type GetScannersResponse struct {
+// Request to stream real-time ticks.
+type StreamTicksRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Scanners      []*ScannerItem         `protobuf:"bytes,1,rep,name=scanners,proto3" json:"scanners,omitempty"`
+	ContractCodes []string               `protobuf:"bytes,1,rep,name=contract_codes,json=contractCodes,proto3" json:"contract_codes,omitempty"` // List of security codes.
+	QueueSize     int32                  `protobuf:"varint,2,opt,name=queue_size,json=queueSize,proto3" json:"queue_size,omitempty"`            // Max ticks buffered for this stream before it is dropped (0 = server default).
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *GetScannersResponse) Reset() {
-	*x = GetScannersResponse{}
-	mi := &file_provider_proto_msgTypes[86]
+func (x *StreamTicksRequest) Reset() {
+	*x = StreamTicksRequest{}
+	mi := &file_provider_proto_msgTypes[121]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *GetScannersResponse) String() string {
+func (x *StreamTicksRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*GetScannersResponse) ProtoMessage() {}
+func (*StreamTicksRequest) ProtoMessage() {}
 
-func (x *GetScannersResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[86]
+func (x *StreamTicksRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[121]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -8005,69 +10601,70 @@ func (x *GetScannersResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use GetScannersResponse.ProtoReflect.Descriptor instead.
-func (*GetScannersResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{86}
+// Deprecated: Use StreamTicksRequest.ProtoReflect.Descriptor instead.
+func (*StreamTicksRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{121}
 }
 
-func (x *GetScannersResponse) GetScanners() []*ScannerItem {
+func (x *StreamTicksRequest) GetContractCodes() []string {
 	if x != nil {
-		return x.Scanners
+		return x.ContractCodes
 	}
 	return nil
 }
 
-// Represents a security matching scanner criteria.
-// 選股器結果
-type ScannerItem struct {
+func (x *StreamTicksRequest) GetQueueSize() int32 {
+	if x != nil {
+		return x.QueueSize
+	}
+	return 0
+}
+
+// A single real-time tick (stock or futures/options).
+// 即時逐筆
+type Tick struct {
 	state           protoimpl.MessageState `protogen:"open.v1"`
-	Date            string                 `protobuf:"bytes,1,opt,name=date,proto3" json:"date,omitempty"`                                                    // Scan date.
-	Code            string                 `protobuf:"bytes,2,opt,name=code,proto3" json:"code,omitempty"`                                                    // Security code.
-	Name            string                 `protobuf:"bytes,3,opt,name=name,proto3" json:"name,omitempty"`                                                    // Name.
-	Ts              int64                  `protobuf:"varint,4,opt,name=ts,proto3" json:"ts,omitempty"`                                                       // Timestamp.
-	Open            float64                `protobuf:"fixed64,5,opt,name=open,proto3" json:"open,omitempty"`                                                  // Open price.
-	High            float64                `protobuf:"fixed64,6,opt,name=high,proto3" json:"high,omitempty"`                                                  // High.
-	Low             float64                `protobuf:"fixed64,7,opt,name=low,proto3" json:"low,omitempty"`                                                    // Low.
-	Close           float64                `protobuf:"fixed64,8,opt,name=close,proto3" json:"close,omitempty"`                                                // Last close.
-	PriceRange      float64                `protobuf:"fixed64,9,opt,name=price_range,json=priceRange,proto3" json:"price_range,omitempty"`                    // Daily price range.
-	TickType        TickType               `protobuf:"varint,10,opt,name=tick_type,json=tickType,proto3,enum=v1.TickType" json:"tick_type,omitempty"`         // Up/Down.
-	ChangePrice     float64                `protobuf:"fixed64,11,opt,name=change_price,json=changePrice,proto3" json:"change_price,omitempty"`                // Net change.
-	ChangeType      ChangeType             `protobuf:"varint,12,opt,name=change_type,json=changeType,proto3,enum=v1.ChangeType" json:"change_type,omitempty"` // Change indicator.
-	AveragePrice    float64                `protobuf:"fixed64,13,opt,name=average_price,json=averagePrice,proto3" json:"average_price,omitempty"`             // Avg price.
-	Volume          int64                  `protobuf:"varint,14,opt,name=volume,proto3" json:"volume,omitempty"`                                              // Tick volume.
-	TotalVolume     int64                  `protobuf:"varint,15,opt,name=total_volume,json=totalVolume,proto3" json:"total_volume,omitempty"`                 // Total volume.
-	Amount          int64                  `protobuf:"varint,16,opt,name=amount,proto3" json:"amount,omitempty"`                                              // Tick amount.
-	TotalAmount     int64                  `protobuf:"varint,17,opt,name=total_amount,json=totalAmount,proto3" json:"total_amount,omitempty"`                 // Total amount.
-	YesterdayVolume int64                  `protobuf:"varint,18,opt,name=yesterday_volume,json=yesterdayVolume,proto3" json:"yesterday_volume,omitempty"`     // Prev day volume.
-	VolumeRatio     float64                `protobuf:"fixed64,19,opt,name=volume_ratio,json=volumeRatio,proto3" json:"volume_ratio,omitempty"`                // Relative volume.
-	BuyPrice        float64                `protobuf:"fixed64,20,opt,name=buy_price,json=buyPrice,proto3" json:"buy_price,omitempty"`                         // Best bid.
-	BuyVolume       int64                  `protobuf:"varint,21,opt,name=buy_volume,json=buyVolume,proto3" json:"buy_volume,omitempty"`                       // Best bid vol.
-	SellPrice       float64                `protobuf:"fixed64,22,opt,name=sell_price,json=sellPrice,proto3" json:"sell_price,omitempty"`                      // Best ask.
-	SellVolume      int64                  `protobuf:"varint,23,opt,name=sell_volume,json=sellVolume,proto3" json:"sell_volume,omitempty"`                    // Best ask vol.
-	BidOrders       int64                  `protobuf:"varint,24,opt,name=bid_orders,json=bidOrders,proto3" json:"bid_orders,omitempty"`                       // Bid order count.
-	BidVolumes      int64                  `protobuf:"varint,25,opt,name=bid_volumes,json=bidVolumes,proto3" json:"bid_volumes,omitempty"`                    // Total bid vol.
-	AskOrders       int64                  `protobuf:"varint,26,opt,name=ask_orders,json=askOrders,proto3" json:"ask_orders,omitempty"`                       // Ask order count.
-	AskVolumes      int64                  `protobuf:"varint,27,opt,name=ask_volumes,json=askVolumes,proto3" json:"ask_volumes,omitempty"`                    // Total ask vol.
-	RankValue       float64                `protobuf:"fixed64,28,opt,name=rank_value,json=rankValue,proto3" json:"rank_value,omitempty"`                      // Ranking metric value.
+	Code            string                 `protobuf:"bytes,1,opt,name=code,proto3" json:"code,omitempty"`                                                    // Security code.
+	Exchange        Exchange               `protobuf:"varint,2,opt,name=exchange,proto3,enum=v1.Exchange" json:"exchange,omitempty"`                          // Exchange.
+	Ts              int64                  `protobuf:"varint,3,opt,name=ts,proto3" json:"ts,omitempty"`                                                       // Timestamp (ns).
+	Open            float64                `protobuf:"fixed64,4,opt,name=open,proto3" json:"open,omitempty"`                                                  // Open price.
+	Close           float64                `protobuf:"fixed64,5,opt,name=close,proto3" json:"close,omitempty"`                                                // Deal price.
+	High            float64                `protobuf:"fixed64,6,opt,name=high,proto3" json:"high,omitempty"`                                                  // High since market open.
+	Low             float64                `protobuf:"fixed64,7,opt,name=low,proto3" json:"low,omitempty"`                                                    // Low since market open.
+	AvgPrice        float64                `protobuf:"fixed64,8,opt,name=avg_price,json=avgPrice,proto3" json:"avg_price,omitempty"`                          // Average price.
+	Volume          int64                  `protobuf:"varint,9,opt,name=volume,proto3" json:"volume,omitempty"`                                               // Deal volume.
+	TotalVolume     int64                  `protobuf:"varint,10,opt,name=total_volume,json=totalVolume,proto3" json:"total_volume,omitempty"`                 // Total daily volume.
+	Amount          float64                `protobuf:"fixed64,11,opt,name=amount,proto3" json:"amount,omitempty"`                                             // Deal amount.
+	TotalAmount     float64                `protobuf:"fixed64,12,opt,name=total_amount,json=totalAmount,proto3" json:"total_amount,omitempty"`                // Total daily amount.
+	TickType        TickType               `protobuf:"varint,13,opt,name=tick_type,json=tickType,proto3,enum=v1.TickType" json:"tick_type,omitempty"`         // Buy/Sell deal.
+	ChangeType      ChangeType             `protobuf:"varint,14,opt,name=change_type,json=changeType,proto3,enum=v1.ChangeType" json:"change_type,omitempty"` // Limit Up/Down etc.
+	PriceChg        float64                `protobuf:"fixed64,15,opt,name=price_chg,json=priceChg,proto3" json:"price_chg,omitempty"`                         // Price change.
+	PctChg          float64                `protobuf:"fixed64,16,opt,name=pct_chg,json=pctChg,proto3" json:"pct_chg,omitempty"`                               // Percentage change.
+	BidSideTotalVol int64                  `protobuf:"varint,17,opt,name=bid_side_total_vol,json=bidSideTotalVol,proto3" json:"bid_side_total_vol,omitempty"` // Total buy deal volume.
+	AskSideTotalVol int64                  `protobuf:"varint,18,opt,name=ask_side_total_vol,json=askSideTotalVol,proto3" json:"ask_side_total_vol,omitempty"` // Total sell deal volume.
+	UnderlyingPrice float64                `protobuf:"fixed64,19,opt,name=underlying_price,json=underlyingPrice,proto3" json:"underlying_price,omitempty"`    // Underlying price (futures/options).
+	Simtrade        bool                   `protobuf:"varint,20,opt,name=simtrade,proto3" json:"simtrade,omitempty"`                                          // Simulated trade.
+	Suspend         bool                   `protobuf:"varint,21,opt,name=suspend,proto3" json:"suspend,omitempty"`                                            // Trading suspended (stock).
+	IntradayOdd     bool                   `protobuf:"varint,22,opt,name=intraday_odd,json=intradayOdd,proto3" json:"intraday_odd,omitempty"`                 // Intraday odd lot (stock).
 	unknownFields   protoimpl.UnknownFields
 	sizeCache       protoimpl.SizeCache
 }
 
-func (x *ScannerItem) Reset() {
-	*x = ScannerItem{}
-	mi := &file_provider_proto_msgTypes[87]
+func (x *Tick) Reset() {
+	*x = Tick{}
+	mi := &file_provider_proto_msgTypes[122]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *ScannerItem) String() string {
+func (x *Tick) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*ScannerItem) ProtoMessage() {}
+func (*Tick) ProtoMessage() {}
 
-func (x *ScannerItem) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[87]
+func (x *Tick) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[122]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -8078,239 +10675,255 @@ func (x *ScannerItem) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use ScannerItem.ProtoReflect.Descriptor instead.
-func (*ScannerItem) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{87}
-}
-
-func (x *ScannerItem) GetDate() string {
-	if x != nil {
-		return x.Date
-	}
-	return ""
+// Deprecated: Use Tick.ProtoReflect.Descriptor instead.
+func (*Tick) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{122}
 }
 
-func (x *ScannerItem) GetCode() string {
+func (x *Tick) GetCode() string {
 	if x != nil {
 		return x.Code
 	}
 	return ""
 }
 
-func (x *ScannerItem) GetName() string {
+func (x *Tick) GetExchange() Exchange {
 	if x != nil {
-		return x.Name
+		return x.Exchange
 	}
-	return ""
+	return Exchange_EXCHANGE_UNSPECIFIED
 }
 
-func (x *ScannerItem) GetTs() int64 {
+func (x *Tick) GetTs() int64 {
 	if x != nil {
 		return x.Ts
 	}
 	return 0
 }
 
-func (x *ScannerItem) GetOpen() float64 {
+func (x *Tick) GetOpen() float64 {
 	if x != nil {
 		return x.Open
 	}
 	return 0
 }
 
-func (x *ScannerItem) GetHigh() float64 {
+func (x *Tick) GetClose() float64 {
 	if x != nil {
-		return x.High
+		return x.Close
 	}
 	return 0
 }
 
-func (x *ScannerItem) GetLow() float64 {
+func (x *Tick) GetHigh() float64 {
 	if x != nil {
-		return x.Low
+		return x.High
 	}
 	return 0
 }
 
-func (x *ScannerItem) GetClose() float64 {
+func (x *Tick) GetLow() float64 {
 	if x != nil {
-		return x.Close
+		return x.Low
 	}
 	return 0
 }
 
-func (x *ScannerItem) GetPriceRange() float64 {
+func (x *Tick) GetAvgPrice() float64 {
 	if x != nil {
-		return x.PriceRange
+		return x.AvgPrice
 	}
 	return 0
 }
 
-func (x *ScannerItem) GetTickType() TickType {
+func (x *Tick) GetVolume() int64 {
 	if x != nil {
-		return x.TickType
+		return x.Volume
 	}
-	return TickType_TICK_TYPE_UNSPECIFIED
+	return 0
 }
 
-func (x *ScannerItem) GetChangePrice() float64 {
+func (x *Tick) GetTotalVolume() int64 {
 	if x != nil {
-		return x.ChangePrice
+		return x.TotalVolume
 	}
 	return 0
 }
 
-func (x *ScannerItem) GetChangeType() ChangeType {
+func (x *Tick) GetAmount() float64 {
 	if x != nil {
-		return x.ChangeType
+		return x.Amount
 	}
-	return ChangeType_CHANGE_TYPE_UNSPECIFIED
+	return 0
 }
 
-func (x *ScannerItem) GetAveragePrice() float64 {
+func (x *Tick) GetTotalAmount() float64 {
 	if x != nil {
-		return x.AveragePrice
+		return x.TotalAmount
 	}
 	return 0
 }
 
-func (x *ScannerItem) GetVolume() int64 {
+func (x *Tick) GetTickType() TickType {
 	if x != nil {
-		return x.Volume
+		return x.TickType
 	}
-	return 0
+	return TickType_TICK_TYPE_UNSPECIFIED
 }
 
-func (x *ScannerItem) GetTotalVolume() int64 {
+func (x *Tick) GetChangeType() ChangeType {
 	if x != nil {
-		return x.TotalVolume
+		return x.ChangeType
 	}
-	return 0
+	return ChangeType_CHANGE_TYPE_UNSPECIFIED
 }
 
-func (x *ScannerItem) GetAmount() int64 {
+func (x *Tick) GetPriceChg() float64 {
 	if x != nil {
-		return x.Amount
+		return x.PriceChg
 	}
 	return 0
 }
 
-func (x *ScannerItem) GetTotalAmount() int64 {
+func (x *Tick) GetPctChg() float64 {
 	if x != nil {
-		return x.TotalAmount
+		return x.PctChg
 	}
 	return 0
 }
 
-func (x *ScannerItem) GetYesterdayVolume() int64 {
+func (x *Tick) GetBidSideTotalVol() int64 {
 	if x != nil {
-		return x.YesterdayVolume
+		return x.BidSideTotalVol
 	}
 	return 0
 }
 
-func (x *ScannerItem) GetVolumeRatio() float64 {
+func (x *Tick) GetAskSideTotalVol() int64 {
 	if x != nil {
-		return x.VolumeRatio
+		return x.AskSideTotalVol
 	}
 	return 0
 }
 
-func (x *ScannerItem) GetBuyPrice() float64 {
+func (x *Tick) GetUnderlyingPrice() float64 {
 	if x != nil {
-		return x.BuyPrice
+		return x.UnderlyingPrice
 	}
 	return 0
 }
 
-func (x *ScannerItem) GetBuyVolume() int64 {
+func (x *Tick) GetSimtrade() bool {
 	if x != nil {
-		return x.BuyVolume
+		return x.Simtrade
 	}
-	return 0
+	return false
 }
 
-func (x *ScannerItem) GetSellPrice() float64 {
+func (x *Tick) GetSuspend() bool {
 	if x != nil {
-		return x.SellPrice
+		return x.Suspend
 	}
-	return 0
+	return false
 }
 
-func (x *ScannerItem) GetSellVolume() int64 {
+func (x *Tick) GetIntradayOdd() bool {
 	if x != nil {
-		return x.SellVolume
+		return x.IntradayOdd
 	}
-	return 0
+	return false
 }
 
-func (x *ScannerItem) GetBidOrders() int64 {
-	if x != nil {
-		return x.BidOrders
-	}
-	return 0
+// Request to stream conflated real-time bid/ask books.
+type StreamBidAskRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	ContractCodes []string               `protobuf:"bytes,1,rep,name=contract_codes,json=contractCodes,proto3" json:"contract_codes,omitempty"` // List of security codes.
+	IntervalMs    int32                  `protobuf:"varint,2,opt,name=interval_ms,json=intervalMs,proto3" json:"interval_ms,omitempty"`         // Minimum interval between updates for this stream (0 = as fast as possible).
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
 }
 
-func (x *ScannerItem) GetBidVolumes() int64 {
-	if x != nil {
-		return x.BidVolumes
-	}
-	return 0
+func (x *StreamBidAskRequest) Reset() {
+	*x = StreamBidAskRequest{}
+	mi := &file_provider_proto_msgTypes[123]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
 }
 
-func (x *ScannerItem) GetAskOrders() int64 {
+func (x *StreamBidAskRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*StreamBidAskRequest) ProtoMessage() {}
+
+func (x *StreamBidAskRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[123]
 	if x != nil {
-		return x.AskOrders
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
 	}
-	return 0
+	return mi.MessageOf(x)
 }
 
-func (x *ScannerItem) GetAskVolumes() int64 {
+// Deprecated: Use StreamBidAskRequest.ProtoReflect.Descriptor instead.
+func (*StreamBidAskRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{123}
+}
+
+func (x *StreamBidAskRequest) GetContractCodes() []string {
 	if x != nil {
-		return x.AskVolumes
+		return x.ContractCodes
 	}
-	return 0
+	return nil
 }
 
-func (x *ScannerItem) GetRankValue() float64 {
+func (x *StreamBidAskRequest) GetIntervalMs() int32 {
 	if x != nil {
-		return x.RankValue
+		return x.IntervalMs
 	}
 	return 0
 }
 
-// Detailed regulatory status for disposition stocks.
-// 處置股
-type Punish struct {
+// Real-time top-of-book depth (stock or futures/options).
+// 即時五檔
+type BidAsk struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Code          []string               `protobuf:"bytes,1,rep,name=code,proto3" json:"code,omitempty"`                                        // Stock codes.
-	StartDate     []string               `protobuf:"bytes,2,rep,name=start_date,json=startDate,proto3" json:"start_date,omitempty"`             // Punishment start.
-	EndDate       []string               `protobuf:"bytes,3,rep,name=end_date,json=endDate,proto3" json:"end_date,omitempty"`                   // Punishment end.
-	Interval      []string               `protobuf:"bytes,4,rep,name=interval,proto3" json:"interval,omitempty"`                                // Trade interval.
-	UpdatedAt     []string               `protobuf:"bytes,5,rep,name=updated_at,json=updatedAt,proto3" json:"updated_at,omitempty"`             // Updated timestamp.
-	UnitLimit     []float64              `protobuf:"fixed64,6,rep,packed,name=unit_limit,json=unitLimit,proto3" json:"unit_limit,omitempty"`    // Order unit limit.
-	TotalLimit    []float64              `protobuf:"fixed64,7,rep,packed,name=total_limit,json=totalLimit,proto3" json:"total_limit,omitempty"` // Total limit.
-	Description   []string               `protobuf:"bytes,8,rep,name=description,proto3" json:"description,omitempty"`                          // Detail description.
-	AnnouncedDate []string               `protobuf:"bytes,9,rep,name=announced_date,json=announcedDate,proto3" json:"announced_date,omitempty"` // Announcement date.
+	Code          string                 `protobuf:"bytes,1,opt,name=code,proto3" json:"code,omitempty"`                                         // Security code.
+	Exchange      Exchange               `protobuf:"varint,2,opt,name=exchange,proto3,enum=v1.Exchange" json:"exchange,omitempty"`               // Exchange.
+	Ts            int64                  `protobuf:"varint,3,opt,name=ts,proto3" json:"ts,omitempty"`                                            // Timestamp (ns).
+	BidPrice      []float64              `protobuf:"fixed64,4,rep,packed,name=bid_price,json=bidPrice,proto3" json:"bid_price,omitempty"`        // Bid prices, best first.
+	BidVolume     []int64                `protobuf:"varint,5,rep,packed,name=bid_volume,json=bidVolume,proto3" json:"bid_volume,omitempty"`      // Bid volumes.
+	DiffBidVol    []int64                `protobuf:"varint,6,rep,packed,name=diff_bid_vol,json=diffBidVol,proto3" json:"diff_bid_vol,omitempty"` // Bid volume changes.
+	AskPrice      []float64              `protobuf:"fixed64,7,rep,packed,name=ask_price,json=askPrice,proto3" json:"ask_price,omitempty"`        // Ask prices, best first.
+	AskVolume     []int64                `protobuf:"varint,8,rep,packed,name=ask_volume,json=askVolume,proto3" json:"ask_volume,omitempty"`      // Ask volumes.
+	DiffAskVol    []int64                `protobuf:"varint,9,rep,packed,name=diff_ask_vol,json=diffAskVol,proto3" json:"diff_ask_vol,omitempty"` // Ask volume changes.
+	BidTotalVol   int64                  `protobuf:"varint,10,opt,name=bid_total_vol,json=bidTotalVol,proto3" json:"bid_total_vol,omitempty"`    // Total bid volume (futures/options).
+	AskTotalVol   int64                  `protobuf:"varint,11,opt,name=ask_total_vol,json=askTotalVol,proto3" json:"ask_total_vol,omitempty"`    // Total ask volume (futures/options).
+	Simtrade      bool                   `protobuf:"varint,12,opt,name=simtrade,proto3" json:"simtrade,omitempty"`                               // Simulated trade.
+	Suspend       bool                   `protobuf:"varint,13,opt,name=suspend,proto3" json:"suspend,omitempty"`                                 // Trading suspended (stock).
+	IntradayOdd   bool                   `protobuf:"varint,14,opt,name=intraday_odd,json=intradayOdd,proto3" json:"intraday_odd,omitempty"`      // Intraday odd lot (stock).
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *Punish) Reset() {
-	*x = Punish{}
-	mi := &file_provider_proto_msgTypes[88]
+func (x *BidAsk) Reset() {
+	*x = BidAsk{}
+	mi := &file_provider_proto_msgTypes[124]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *Punish) String() string {
+func (x *BidAsk) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*Punish) ProtoMessage() {}
+func (*BidAsk) ProtoMessage() {}
 
-func (x *Punish) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[88]
+func (x *BidAsk) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[124]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -8321,102 +10934,135 @@ func (x *Punish) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use Punish.ProtoReflect.Descriptor instead.
-func (*Punish) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{88}
+// Deprecated: Use BidAsk.ProtoReflect.Descriptor instead.
+func (*BidAsk) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{124}
+}
+
+func (x *BidAsk) GetCode() string {
+	if x != nil {
+		return x.Code
+	}
+	return ""
+}
+
+func (x *BidAsk) GetExchange() Exchange {
+	if x != nil {
+		return x.Exchange
+	}
+	return Exchange_EXCHANGE_UNSPECIFIED
+}
+
+func (x *BidAsk) GetTs() int64 {
+	if x != nil {
+		return x.Ts
+	}
+	return 0
+}
+
+func (x *BidAsk) GetBidPrice() []float64 {
+	if x != nil {
+		return x.BidPrice
+	}
+	return nil
+}
+
+func (x *BidAsk) GetBidVolume() []int64 {
+	if x != nil {
+		return x.BidVolume
+	}
+	return nil
 }
 
-func (x *Punish) GetCode() []string {
+func (x *BidAsk) GetDiffBidVol() []int64 {
 	if x != nil {
-		return x.Code
+		return x.DiffBidVol
 	}
 	return nil
 }
 
-func (x *Punish) GetStartDate() []string {
+func (x *BidAsk) GetAskPrice() []float64 {
 	if x != nil {
-		return x.StartDate
+		return x.AskPrice
 	}
 	return nil
 }
 
-func (x *Punish) GetEndDate() []string {
+func (x *BidAsk) GetAskVolume() []int64 {
 	if x != nil {
-		return x.EndDate
+		return x.AskVolume
 	}
 	return nil
 }
 
-func (x *Punish) GetInterval() []string {
+func (x *BidAsk) GetDiffAskVol() []int64 {
 	if x != nil {
-		return x.Interval
+		return x.DiffAskVol
 	}
 	return nil
 }
 
-func (x *Punish) GetUpdatedAt() []string {
+func (x *BidAsk) GetBidTotalVol() int64 {
 	if x != nil {
-		return x.UpdatedAt
+		return x.BidTotalVol
 	}
-	return nil
+	return 0
 }
 
-func (x *Punish) GetUnitLimit() []float64 {
+func (x *BidAsk) GetAskTotalVol() int64 {
 	if x != nil {
-		return x.UnitLimit
+		return x.AskTotalVol
 	}
-	return nil
+	return 0
 }
 
-func (x *Punish) GetTotalLimit() []float64 {
+func (x *BidAsk) GetSimtrade() bool {
 	if x != nil {
-		return x.TotalLimit
+		return x.Simtrade
 	}
-	return nil
+	return false
 }
 
-func (x *Punish) GetDescription() []string {
+func (x *BidAsk) GetSuspend() bool {
 	if x != nil {
-		return x.Description
+		return x.Suspend
 	}
-	return nil
+	return false
 }
 
-func (x *Punish) GetAnnouncedDate() []string {
+func (x *BidAsk) GetIntradayOdd() bool {
 	if x != nil {
-		return x.AnnouncedDate
+		return x.IntradayOdd
 	}
-	return nil
+	return false
 }
 
-// Regulatory notice information for attention stocks.
-// 注意股
-type Notice struct {
+// Request to stream order and deal events.
+type StreamOrderEventsRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Code          []string               `protobuf:"bytes,1,rep,name=code,proto3" json:"code,omitempty"`                                        // Stock codes.
-	Reason        []string               `protobuf:"bytes,2,rep,name=reason,proto3" json:"reason,omitempty"`                                    // Reason for notice.
-	UpdatedAt     []string               `protobuf:"bytes,3,rep,name=updated_at,json=updatedAt,proto3" json:"updated_at,omitempty"`             // Timestamp.
-	Close         []float64              `protobuf:"fixed64,4,rep,packed,name=close,proto3" json:"close,omitempty"`                             // Triggering close price.
-	AnnouncedDate []string               `protobuf:"bytes,5,rep,name=announced_date,json=announcedDate,proto3" json:"announced_date,omitempty"` // Date of notice.
+	SinceSeq      int64                  `protobuf:"varint,1,opt,name=since_seq,json=sinceSeq,proto3" json:"since_seq,omitempty"`    // Resume after this sequence number, replaying retained events (0 = new events only).
+	Replay        bool                   `protobuf:"varint,2,opt,name=replay,proto3" json:"replay,omitempty"`                        // With since_seq 0, replay every retained event first.
+	QueueSize     int32                  `protobuf:"varint,3,opt,name=queue_size,json=queueSize,proto3" json:"queue_size,omitempty"` // Max events buffered for this stream before it is dropped (0 = server default).
+	Epoch         string                 `protobuf:"bytes,4,opt,name=epoch,proto3" json:"epoch,omitempty"`                           // Epoch of the event that since_seq was taken from; a resume from another epoch fails with OUT_OF_RANGE.
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *Notice) Reset() {
-	*x = Notice{}
-	mi := &file_provider_proto_msgTypes[89]
+func (x *StreamOrderEventsRequest) Reset() {
+	*x = StreamOrderEventsRequest{}
+	mi := &file_provider_proto_msgTypes[125]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *Notice) String() string {
+func (x *StreamOrderEventsRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*Notice) ProtoMessage() {}
+func (*StreamOrderEventsRequest) ProtoMessage() {}
 
-func (x *Notice) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[89]
+func (x *StreamOrderEventsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[125]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -8427,69 +11073,71 @@ func (x *Notice) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use Notice.ProtoReflect.Descriptor instead.
-func (*Notice) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{89}
-}
-
-func (x *Notice) GetCode() []string {
-	if x != nil {
-		return x.Code
-	}
-	return nil
+// Deprecated: Use StreamOrderEventsRequest.ProtoReflect.Descriptor instead.
+func (*StreamOrderEventsRequest) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{125}
 }
 
-func (x *Notice) GetReason() []string {
+func (x *StreamOrderEventsRequest) GetSinceSeq() int64 {
 	if x != nil {
-		return x.Reason
+		return x.SinceSeq
 	}
-	return nil
+	return 0
 }
 
-func (x *Notice) GetUpdatedAt() []string {
+func (x *StreamOrderEventsRequest) GetReplay() bool {
 	if x != nil {
-		return x.UpdatedAt
+		return x.Replay
 	}
-	return nil
+	return false
 }
 
-func (x *Notice) GetClose() []float64 {
+func (x *StreamOrderEventsRequest) GetQueueSize() int32 {
 	if x != nil {
-		return x.Close
+		return x.QueueSize
 	}
-	return nil
+	return 0
 }
 
-func (x *Notice) GetAnnouncedDate() []string {
+func (x *StreamOrderEventsRequest) GetEpoch() string {
 	if x != nil {
-		return x.AnnouncedDate
+		return x.Epoch
 	}
-	return nil
+	return ""
 }
 
-// Request for fetching security contracts.
-type FetchContractsRequest struct {
-	state            protoimpl.MessageState `protogen:"open.v1"`
-	ContractDownload bool                   `protobuf:"varint,1,opt,name=contract_download,json=contractDownload,proto3" json:"contract_download,omitempty"` // Whether to perform a full download.
-	unknownFields    protoimpl.UnknownFields
-	sizeCache        protoimpl.SizeCache
+// An order or deal event from the order callback.
+// 委託成交回報
+type OrderEvent struct {
+	state protoimpl.MessageState `protogen:"open.v1"`
+	Seq   int64                  `protobuf:"varint,1,opt,name=seq,proto3" json:"seq,omitempty"`                        // Provider-assigned sequence number, strictly increasing within an epoch.
+	State OrderState             `protobuf:"varint,2,opt,name=state,proto3,enum=v1.OrderState" json:"state,omitempty"` // Kind of update.
+	Ts    int64                  `protobuf:"varint,3,opt,name=ts,proto3" json:"ts,omitempty"`                          // Time the provider received the event (ns).
+	// Types that are valid to be assigned to Event:
+	//
+	//	*OrderEvent_Order
+	//	*OrderEvent_Deal
+	Event         isOrderEvent_Event `protobuf_oneof:"event"`
+	Epoch         string             `protobuf:"bytes,6,opt,name=epoch,proto3" json:"epoch,omitempty"` // Provider instance that numbered the event; seq restarts from 1 in a new epoch.
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
 }
 
-func (x *FetchContractsRequest) Reset() {
-	*x = FetchContractsRequest{}
-	mi := &file_provider_proto_msgTypes[90]
+func (x *OrderEvent) Reset() {
+	*x = OrderEvent{}
+	mi := &file_provider_proto_msgTypes[126]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *FetchContractsRequest) String() string {
+func (x *OrderEvent) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*FetchContractsRequest) ProtoMessage() {}
+func (*OrderEvent) ProtoMessage() {}
 
-func (x *FetchContractsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[90]
+func (x *OrderEvent) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[126]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -8500,43 +11148,124 @@ func (x *FetchContractsRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use FetchContractsRequest.ProtoReflect.Descriptor instead.
-func (*FetchContractsRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{90}
+// Deprecated: Use OrderEvent.ProtoReflect.Descriptor instead.
+func (*OrderEvent) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{126}
 }
 
-func (x *FetchContractsRequest) GetContractDownload() bool {
+func (x *OrderEvent) GetSeq() int64 {
 	if x != nil {
-		return x.ContractDownload
+		return x.Seq
 	}
-	return false
+	return 0
 }
 
-// Request to activate a security certificate.
-type ActivateCARequest struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	CaPath        string                 `protobuf:"bytes,1,opt,name=ca_path,json=caPath,proto3" json:"ca_path,omitempty"`       // File path to CA.
-	CaPasswd      string                 `protobuf:"bytes,2,opt,name=ca_passwd,json=caPasswd,proto3" json:"ca_passwd,omitempty"` // CA password.
-	PersonId      string                 `protobuf:"bytes,3,opt,name=person_id,json=personId,proto3" json:"person_id,omitempty"` // Holder's person ID.
-	unknownFields protoimpl.UnknownFields
-	sizeCache     protoimpl.SizeCache
+func (x *OrderEvent) GetState() OrderState {
+	if x != nil {
+		return x.State
+	}
+	return OrderState_ORDER_STATE_UNSPECIFIED
 }
 
-func (x *ActivateCARequest) Reset() {
-	*x = ActivateCARequest{}
-	mi := &file_provider_proto_msgTypes[91]
+func (x *OrderEvent) GetTs() int64 {
+	if x != nil {
+		return x.Ts
+	}
+	return 0
+}
+
+func (x *OrderEvent) GetEvent() isOrderEvent_Event {
+	if x != nil {
+		return x.Event
+	}
+	return nil
+}
+
+func (x *OrderEvent) GetOrder() *OrderUpdate {
+	if x != nil {
+		if x, ok := x.Event.(*OrderEvent_Order); ok {
+			return x.Order
+		}
+	}
+	return nil
+}
+
+func (x *OrderEvent) GetDeal() *DealUpdate {
+	if x != nil {
+		if x, ok := x.Event.(*OrderEvent_Deal); ok {
+			return x.Deal
+		}
+	}
+	return nil
+}
+
+func (x *OrderEvent) GetEpoch() string {
+	if x != nil {
+		return x.Epoch
+	}
+	return ""
+}
+
+type isOrderEvent_Event interface {
+	isOrderEvent_Event()
+}
+
+type OrderEvent_Order struct {
+	Order *OrderUpdate `protobuf:"bytes,4,opt,name=order,proto3,oneof"` // Set for order updates.
+}
+
+type OrderEvent_Deal struct {
+	Deal *DealUpdate `protobuf:"bytes,5,opt,name=deal,proto3,oneof"` // Set for deals.
+}
+
+func (*OrderEvent_Order) isOrderEvent_Event() {}
+
+func (*OrderEvent_Deal) isOrderEvent_Event() {}
+
+// An order status update (new, amend, cancel) from the order callback.
+type OrderUpdate struct {
+	state          protoimpl.MessageState `protogen:"open.v1"`
+	OpType         string                 `protobuf:"bytes,1,opt,name=op_type,json=opType,proto3" json:"op_type,omitempty"`                                          // Operation type (New, Cancel, UpdatePrice, UpdateQty).
+	OpCode         string                 `protobuf:"bytes,2,opt,name=op_code,json=opCode,proto3" json:"op_code,omitempty"`                                          // Operation result code ("00" = success).
+	OpMsg          string                 `protobuf:"bytes,3,opt,name=op_msg,json=opMsg,proto3" json:"op_msg,omitempty"`                                             // Operation message.
+	Id             string                 `protobuf:"bytes,4,opt,name=id,proto3" json:"id,omitempty"`                                                                // Trade ID.
+	Seqno          string                 `protobuf:"bytes,5,opt,name=seqno,proto3" json:"seqno,omitempty"`                                                          // Platform sequence number.
+	Ordno          string                 `protobuf:"bytes,6,opt,name=ordno,proto3" json:"ordno,omitempty"`                                                          // Exchange order number.
+	BrokerId       string                 `protobuf:"bytes,7,opt,name=broker_id,json=brokerId,proto3" json:"broker_id,omitempty"`                                    // Broker ID.
+	AccountId      string                 `protobuf:"bytes,8,opt,name=account_id,json=accountId,proto3" json:"account_id,omitempty"`                                 // Account ID.
+	Action         Action                 `protobuf:"varint,9,opt,name=action,proto3,enum=v1.Action" json:"action,omitempty"`                                        // Buy or Sell.
+	Price          float64                `protobuf:"fixed64,10,opt,name=price,proto3" json:"price,omitempty"`                                                       // Order price.
+	Quantity       int64                  `protobuf:"varint,11,opt,name=quantity,proto3" json:"quantity,omitempty"`                                                  // Order quantity.
+	OrderType      OrderType              `protobuf:"varint,12,opt,name=order_type,json=orderType,proto3,enum=v1.OrderType" json:"order_type,omitempty"`             // ROD, IOC, FOK.
+	PriceType      string                 `protobuf:"bytes,13,opt,name=price_type,json=priceType,proto3" json:"price_type,omitempty"`                                // Limit, Market, etc.
+	CustomField    string                 `protobuf:"bytes,14,opt,name=custom_field,json=customField,proto3" json:"custom_field,omitempty"`                          // User-defined data.
+	Code           string                 `protobuf:"bytes,15,opt,name=code,proto3" json:"code,omitempty"`                                                           // Security code.
+	SecurityType   SecurityType           `protobuf:"varint,16,opt,name=security_type,json=securityType,proto3,enum=v1.SecurityType" json:"security_type,omitempty"` // Commodity category.
+	Exchange       Exchange               `protobuf:"varint,17,opt,name=exchange,proto3,enum=v1.Exchange" json:"exchange,omitempty"`                                 // Exchange.
+	ExchangeTs     float64                `protobuf:"fixed64,18,opt,name=exchange_ts,json=exchangeTs,proto3" json:"exchange_ts,omitempty"`                           // Exchange timestamp (seconds).
+	ModifiedPrice  float64                `protobuf:"fixed64,19,opt,name=modified_price,json=modifiedPrice,proto3" json:"modified_price,omitempty"`                  // Amended price.
+	CancelQuantity int64                  `protobuf:"varint,20,opt,name=cancel_quantity,json=cancelQuantity,proto3" json:"cancel_quantity,omitempty"`                // Quantity cancelled.
+	OrderQuantity  int64                  `protobuf:"varint,21,opt,name=order_quantity,json=orderQuantity,proto3" json:"order_quantity,omitempty"`                   // Remaining order quantity.
+	WebId          string                 `protobuf:"bytes,22,opt,name=web_id,json=webId,proto3" json:"web_id,omitempty"`                                            // Ordering platform code.
+	unknownFields  protoimpl.UnknownFields
+	sizeCache      protoimpl.SizeCache
+}
+
+func (x *OrderUpdate) Reset() {
+	*x = OrderUpdate{}
+	mi := &file_provider_proto_msgTypes[127]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *ActivateCARequest) String() string {
+func (x *OrderUpdate) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*ActivateCARequest) ProtoMessage() {}
+func (*OrderUpdate) ProtoMessage() {}
 
-func (x *ActivateCARequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[91]
+func (x *OrderUpdate) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[127]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -8547,190 +11276,204 @@ func (x *ActivateCARequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use ActivateCARequest.ProtoReflect.Descriptor instead.
-func (*ActivateCARequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{91}
+// Deprecated: Use OrderUpdate.ProtoReflect.Descriptor instead.
+func (*OrderUpdate) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{127}
 }
 
-func (x *ActivateCARequest) GetCaPath() string {
+func (x *OrderUpdate) GetOpType() string {
 	if x != nil {
-		return x.CaPath
+		return x.OpType
 	}
 	return ""
 }
 
-func (x *ActivateCARequest) GetCaPasswd() string {
+func (x *OrderUpdate) GetOpCode() string {
 	if x != nil {
-		return x.CaPasswd
+		return x.OpCode
 	}
 	return ""
 }
 
-func (x *ActivateCARequest) GetPersonId() string {
+func (x *OrderUpdate) GetOpMsg() string {
 	if x != nil {
-		return x.PersonId
+		return x.OpMsg
 	}
 	return ""
 }
 
-// Response for CA activation.
-type ActivateCAResponse struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Success       bool                   `protobuf:"varint,1,opt,name=success,proto3" json:"success,omitempty"`
-	unknownFields protoimpl.UnknownFields
-	sizeCache     protoimpl.SizeCache
+func (x *OrderUpdate) GetId() string {
+	if x != nil {
+		return x.Id
+	}
+	return ""
 }
 
-func (x *ActivateCAResponse) Reset() {
-	*x = ActivateCAResponse{}
-	mi := &file_provider_proto_msgTypes[92]
-	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
-	ms.StoreMessageInfo(mi)
+func (x *OrderUpdate) GetSeqno() string {
+	if x != nil {
+		return x.Seqno
+	}
+	return ""
 }
 
-func (x *ActivateCAResponse) String() string {
-	return protoimpl.X.MessageStringOf(x)
+func (x *OrderUpdate) GetOrdno() string {
+	if x != nil {
+		return x.Ordno
+	}
+	return ""
 }
 
-func (*ActivateCAResponse) ProtoMessage() {}
-
-func (x *ActivateCAResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[92]
+func (x *OrderUpdate) GetBrokerId() string {
 	if x != nil {
-		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
-		if ms.LoadMessageInfo() == nil {
-			ms.StoreMessageInfo(mi)
-		}
-		return ms
+		return x.BrokerId
 	}
-	return mi.MessageOf(x)
+	return ""
 }
 
-// Deprecated: Use ActivateCAResponse.ProtoReflect.Descriptor instead.
-func (*ActivateCAResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{92}
+func (x *OrderUpdate) GetAccountId() string {
+	if x != nil {
+		return x.AccountId
+	}
+	return ""
 }
 
-func (x *ActivateCAResponse) GetSuccess() bool {
+func (x *OrderUpdate) GetAction() Action {
 	if x != nil {
-		return x.Success
+		return x.Action
 	}
-	return false
+	return Action_ACTION_UNSPECIFIED
 }
 
-// Request for checking CA expiration.
-type GetCAExpireTimeRequest struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	PersonId      string                 `protobuf:"bytes,1,opt,name=person_id,json=personId,proto3" json:"person_id,omitempty"`
-	unknownFields protoimpl.UnknownFields
-	sizeCache     protoimpl.SizeCache
+func (x *OrderUpdate) GetPrice() float64 {
+	if x != nil {
+		return x.Price
+	}
+	return 0
 }
 
-func (x *GetCAExpireTimeRequest) Reset() {
-	*x = GetCAExpireTimeRequest{}
-	mi := &file_provider_proto_msgTypes[93]
-	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
-	ms.StoreMessageInfo(mi)
+func (x *OrderUpdate) GetQuantity() int64 {
+	if x != nil {
+		return x.Quantity
+	}
+	return 0
 }
 
-func (x *GetCAExpireTimeRequest) String() string {
-	return protoimpl.X.MessageStringOf(x)
+func (x *OrderUpdate) GetOrderType() OrderType {
+	if x != nil {
+		return x.OrderType
+	}
+	return OrderType_ORDER_TYPE_UNSPECIFIED
 }
 
-func (*GetCAExpireTimeRequest) ProtoMessage() {}
-
-func (x *GetCAExpireTimeRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[93]
+func (x *OrderUpdate) GetPriceType() string {
 	if x != nil {
-		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
-		if ms.LoadMessageInfo() == nil {
-			ms.StoreMessageInfo(mi)
-		}
-		return ms
+		return x.PriceType
 	}
-	return mi.MessageOf(x)
+	return ""
 }
 
-// Deprecated: Use GetCAExpireTimeRequest.ProtoReflect.Descriptor instead.
-func (*GetCAExpireTimeRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{93}
+func (x *OrderUpdate) GetCustomField() string {
+	if x != nil {
+		return x.CustomField
+	}
+	return ""
 }
 
-func (x *GetCAExpireTimeRequest) GetPersonId() string {
+func (x *OrderUpdate) GetCode() string {
 	if x != nil {
-		return x.PersonId
+		return x.Code
 	}
 	return ""
 }
 
-// Response containing CA expiration timestamp.
-type GetCAExpireTimeResponse struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	ExpireTime    string                 `protobuf:"bytes,1,opt,name=expire_time,json=expireTime,proto3" json:"expire_time,omitempty"`
-	unknownFields protoimpl.UnknownFields
-	sizeCache     protoimpl.SizeCache
+func (x *OrderUpdate) GetSecurityType() SecurityType {
+	if x != nil {
+		return x.SecurityType
+	}
+	return SecurityType_SECURITY_TYPE_UNSPECIFIED
 }
 
-func (x *GetCAExpireTimeResponse) Reset() {
-	*x = GetCAExpireTimeResponse{}
-	mi := &file_provider_proto_msgTypes[94]
-	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
-	ms.StoreMessageInfo(mi)
+func (x *OrderUpdate) GetExchange() Exchange {
+	if x != nil {
+		return x.Exchange
+	}
+	return Exchange_EXCHANGE_UNSPECIFIED
 }
 
-func (x *GetCAExpireTimeResponse) String() string {
-	return protoimpl.X.MessageStringOf(x)
+func (x *OrderUpdate) GetExchangeTs() float64 {
+	if x != nil {
+		return x.ExchangeTs
+	}
+	return 0
 }
 
-func (*GetCAExpireTimeResponse) ProtoMessage() {}
+func (x *OrderUpdate) GetModifiedPrice() float64 {
+	if x != nil {
+		return x.ModifiedPrice
+	}
+	return 0
+}
 
-func (x *GetCAExpireTimeResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[94]
+func (x *OrderUpdate) GetCancelQuantity() int64 {
 	if x != nil {
-		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
-		if ms.LoadMessageInfo() == nil {
-			ms.StoreMessageInfo(mi)
-		}
-		return ms
+		return x.CancelQuantity
 	}
-	return mi.MessageOf(x)
+	return 0
 }
 
-// Deprecated: Use GetCAExpireTimeResponse.ProtoReflect.Descriptor instead.
-func (*GetCAExpireTimeResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{94}
+func (x *OrderUpdate) GetOrderQuantity() int64 {
+	if x != nil {
+		return x.OrderQuantity
+	}
+	return 0
 }
 
-func (x *GetCAExpireTimeResponse) GetExpireTime() string {
+func (x *OrderUpdate) GetWebId() string {
 	if x != nil {
-		return x.ExpireTime
+		return x.WebId
 	}
 	return ""
 }
 
-// Request to subscribe to trade execution reports.
-type SubscribeTradeRequest struct {
+// A fill from the order callback.
+type DealUpdate struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	Account       *Account               `protobuf:"bytes,1,opt,name=account,proto3" json:"account,omitempty"`
+	TradeId       string                 `protobuf:"bytes,1,opt,name=trade_id,json=tradeId,proto3" json:"trade_id,omitempty"`                                       // Trade ID.
+	Seqno         string                 `protobuf:"bytes,2,opt,name=seqno,proto3" json:"seqno,omitempty"`                                                          // Platform sequence number.
+	Ordno         string                 `protobuf:"bytes,3,opt,name=ordno,proto3" json:"ordno,omitempty"`                                                          // Exchange order number.
+	ExchangeSeq   string                 `protobuf:"bytes,4,opt,name=exchange_seq,json=exchangeSeq,proto3" json:"exchange_seq,omitempty"`                           // Exchange deal sequence.
+	BrokerId      string                 `protobuf:"bytes,5,opt,name=broker_id,json=brokerId,proto3" json:"broker_id,omitempty"`                                    // Broker ID.
+	AccountId     string                 `protobuf:"bytes,6,opt,name=account_id,json=accountId,proto3" json:"account_id,omitempty"`                                 // Account ID.
+	Action        Action                 `protobuf:"varint,7,opt,name=action,proto3,enum=v1.Action" json:"action,omitempty"`                                        // Buy or Sell.
+	Code          string                 `protobuf:"bytes,8,opt,name=code,proto3" json:"code,omitempty"`                                                            // Security code.
+	Price         float64                `protobuf:"fixed64,9,opt,name=price,proto3" json:"price,omitempty"`                                                        // Fill price.
+	Quantity      int64                  `protobuf:"varint,10,opt,name=quantity,proto3" json:"quantity,omitempty"`                                                  // Fill quantity.
+	Ts            float64                `protobuf:"fixed64,11,opt,name=ts,proto3" json:"ts,omitempty"`                                                             // Fill timestamp (seconds).
+	WebId         string                 `protobuf:"bytes,12,opt,name=web_id,json=webId,proto3" json:"web_id,omitempty"`                                            // Ordering platform code.
+	CustomField   string                 `protobuf:"bytes,13,opt,name=custom_field,json=customField,proto3" json:"custom_field,omitempty"`                          // User-defined data.
+	SecurityType  SecurityType           `protobuf:"varint,14,opt,name=security_type,json=securityType,proto3,enum=v1.SecurityType" json:"security_type,omitempty"` // Commodity category (futures/options).
+	DeliveryMonth string                 `protobuf:"bytes,15,opt,name=delivery_month,json=deliveryMonth,proto3" json:"delivery_month,omitempty"`                    // Delivery month (futures/options).
+	StrikePrice   float64                `protobuf:"fixed64,16,opt,name=strike_price,json=strikePrice,proto3" json:"strike_price,omitempty"`                        // Strike price (options).
+	OptionRight   OptionRight            `protobuf:"varint,17,opt,name=option_right,json=optionRight,proto3,enum=v1.OptionRight" json:"option_right,omitempty"`     // Call or Put (options).
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *SubscribeTradeRequest) Reset() {
-	*x = SubscribeTradeRequest{}
-	mi := &file_provider_proto_msgTypes[95]
+func (x *DealUpdate) Reset() {
+	*x = DealUpdate{}
+	mi := &file_provider_proto_msgTypes[128]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *SubscribeTradeRequest) String() string {
+func (x *DealUpdate) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*SubscribeTradeRequest) ProtoMessage() {}
+func (*DealUpdate) ProtoMessage() {}
 
-func (x *SubscribeTradeRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[95]
+func (x *DealUpdate) ProtoReflect() protoreflect.Message {
+	mi := &file_provider_proto_msgTypes[128]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -8741,151 +11484,128 @@ func (x *SubscribeTradeRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use SubscribeTradeRequest.ProtoReflect.Descriptor instead.
-func (*SubscribeTradeRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{95}
+// Deprecated: Use DealUpdate.ProtoReflect.Descriptor instead.
+func (*DealUpdate) Descriptor() ([]byte, []int) {
+	return file_provider_proto_rawDescGZIP(), []int{128}
 }
 
-func (x *SubscribeTradeRequest) GetAccount() *Account {
+func (x *DealUpdate) GetTradeId() string {
 	if x != nil {
-		return x.Account
+		return x.TradeId
 	}
-	return nil
-}
-
-// Response for trade subscription.
-type SubscribeTradeResponse struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Success       bool                   `protobuf:"varint,1,opt,name=success,proto3" json:"success,omitempty"`
-	unknownFields protoimpl.UnknownFields
-	sizeCache     protoimpl.SizeCache
-}
-
-func (x *SubscribeTradeResponse) Reset() {
-	*x = SubscribeTradeResponse{}
-	mi := &file_provider_proto_msgTypes[96]
-	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
-	ms.StoreMessageInfo(mi)
+	return ""
 }
 
-func (x *SubscribeTradeResponse) String() string {
-	return protoimpl.X.MessageStringOf(x)
+func (x *DealUpdate) GetSeqno() string {
+	if x != nil {
+		return x.Seqno
+	}
+	return ""
 }
 
-func (*SubscribeTradeResponse) ProtoMessage() {}
-
-func (x *SubscribeTradeResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[96]
+func (x *DealUpdate) GetOrdno() string {
 	if x != nil {
-		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
-		if ms.LoadMessageInfo() == nil {
-			ms.StoreMessageInfo(mi)
-		}
-		return ms
+		return x.Ordno
 	}
-	return mi.MessageOf(x)
+	return ""
 }
 
-// Deprecated: Use SubscribeTradeResponse.ProtoReflect.Descriptor instead.
-func (*SubscribeTradeResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{96}
+func (x *DealUpdate) GetExchangeSeq() string {
+	if x != nil {
+		return x.ExchangeSeq
+	}
+	return ""
 }
 
-func (x *SubscribeTradeResponse) GetSuccess() bool {
+func (x *DealUpdate) GetBrokerId() string {
 	if x != nil {
-		return x.Success
+		return x.BrokerId
 	}
-	return false
+	return ""
 }
 
-// Request to unsubscribe from trade execution reports.
-type UnsubscribeTradeRequest struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Account       *Account               `protobuf:"bytes,1,opt,name=account,proto3" json:"account,omitempty"`
-	unknownFields protoimpl.UnknownFields
-	sizeCache     protoimpl.SizeCache
+func (x *DealUpdate) GetAccountId() string {
+	if x != nil {
+		return x.AccountId
+	}
+	return ""
 }
 
-func (x *UnsubscribeTradeRequest) Reset() {
-	*x = UnsubscribeTradeRequest{}
-	mi := &file_provider_proto_msgTypes[97]
-	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
-	ms.StoreMessageInfo(mi)
+func (x *DealUpdate) GetAction() Action {
+	if x != nil {
+		return x.Action
+	}
+	return Action_ACTION_UNSPECIFIED
 }
 
-func (x *UnsubscribeTradeRequest) String() string {
-	return protoimpl.X.MessageStringOf(x)
+func (x *DealUpdate) GetCode() string {
+	if x != nil {
+		return x.Code
+	}
+	return ""
 }
 
-func (*UnsubscribeTradeRequest) ProtoMessage() {}
-
-func (x *UnsubscribeTradeRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[97]
+func (x *DealUpdate) GetPrice() float64 {
 	if x != nil {
-		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
-		if ms.LoadMessageInfo() == nil {
-			ms.StoreMessageInfo(mi)
-		}
-		return ms
+		return x.Price
 	}
-	return mi.MessageOf(x)
+	return 0
 }
 
-// Deprecated: Use UnsubscribeTradeRequest.ProtoReflect.Descriptor instead.
-func (*UnsubscribeTradeRequest) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{97}
+func (x *DealUpdate) GetQuantity() int64 {
+	if x != nil {
+		return x.Quantity
+	}
+	return 0
 }
 
-func (x *UnsubscribeTradeRequest) GetAccount() *Account {
+func (x *DealUpdate) GetTs() float64 {
 	if x != nil {
-		return x.Account
+		return x.Ts
 	}
-	return nil
+	return 0
 }
 
-// Response for trade unsubscription.
-type UnsubscribeTradeResponse struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Success       bool                   `protobuf:"varint,1,opt,name=success,proto3" json:"success,omitempty"`
-	unknownFields protoimpl.UnknownFields
-	sizeCache     protoimpl.SizeCache
+func (x *DealUpdate) GetWebId() string {
+	if x != nil {
+		return x.WebId
+	}
+	return ""
 }
 
-func (x *UnsubscribeTradeResponse) Reset() {
-	*x = UnsubscribeTradeResponse{}
-	mi := &file_provider_proto_msgTypes[98]
-	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
-	ms.StoreMessageInfo(mi)
+func (x *DealUpdate) GetCustomField() string {
+	if x != nil {
+		return x.CustomField
+	}
+	return ""
 }
 
-func (x *UnsubscribeTradeResponse) String() string {
-	return protoimpl.X.MessageStringOf(x)
+func (x *DealUpdate) GetSecurityType() SecurityType {
+	if x != nil {
+		return x.SecurityType
+	}
+	return SecurityType_SECURITY_TYPE_UNSPECIFIED
 }
 
-func (*UnsubscribeTradeResponse) ProtoMessage() {}
-
-func (x *UnsubscribeTradeResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_provider_proto_msgTypes[98]
+func (x *DealUpdate) GetDeliveryMonth() string {
 	if x != nil {
-		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
-		if ms.LoadMessageInfo() == nil {
-			ms.StoreMessageInfo(mi)
-		}
-		return ms
+		return x.DeliveryMonth
 	}
-	return mi.MessageOf(x)
+	return ""
 }
 
-// Deprecated: Use UnsubscribeTradeResponse.ProtoReflect.Descriptor instead.
-func (*UnsubscribeTradeResponse) Descriptor() ([]byte, []int) {
-	return file_provider_proto_rawDescGZIP(), []int{98}
+func (x *DealUpdate) GetStrikePrice() float64 {
+	if x != nil {
+		return x.StrikePrice
+	}
+	return 0
 }
 
-func (x *UnsubscribeTradeResponse) GetSuccess() bool {
+func (x *DealUpdate) GetOptionRight() OptionRight {
 	if x != nil {
-		return x.Success
+		return x.OptionRight
 	}
-	return false
+	return OptionRight_OPTION_RIGHT_UNSPECIFIED
 }
 
 var File_provider_proto protoreflect.FileDescriptor
@@ -9059,7 +11779,15 @@ const file_provider_proto_rawDesc = "" +
 	"\x06status\x18\x03 \x01(\v2\x0f.v1.OrderStatusR\x06status\"^\n" +
 	"\x11PlaceOrderRequest\x12(\n" +
 	"\bcontract\x18\x01 \x01(\v2\f.v1.ContractR\bcontract\x12\x1f\n" +
-	"\x05order\x18\x02 \x01(\v2\t.v1.OrderR\x05order\"x\n" +
+	"\x05order\x18\x02 \x01(\v2\t.v1.OrderR\x05order\"e\n" +
+	"\x12PlaceOrdersRequest\x12-\n" +
+	"\x06orders\x18\x01 \x03(\v2\x15.v1.PlaceOrderRequestR\x06orders\x12 \n" +
+	"\vparallelism\x18\x02 \x01(\x05R\vparallelism\"I\n" +
+	"\x10PlaceOrderResult\x12\x1f\n" +
+	"\x05trade\x18\x01 \x01(\v2\t.v1.TradeR\x05trade\x12\x14\n" +
+	"\x05error\x18\x02 \x01(\tR\x05error\"E\n" +
+	"\x13PlaceOrdersResponse\x12.\n" +
+	"\aresults\x18\x01 \x03(\v2\x14.v1.PlaceOrderResultR\aresults\"x\n" +
 	"\x16PlaceComboOrderRequest\x128\n" +
 	"\x0ecombo_contract\x18\x01 \x01(\v2\x11.v1.ComboContractR\rcomboContract\x12$\n" +
 	"\x05order\x18\x02 \x01(\v2\x0e.v1.ComboOrderR\x05order\"g\n" +
@@ -9068,17 +11796,37 @@ const file_provider_proto_rawDesc = "" +
 	"\x05price\x18\x02 \x01(\x01R\x05price\x12\x1a\n" +
 	"\bquantity\x18\x03 \x01(\x03R\bquantity\"5\n" +
 	"\x12CancelOrderRequest\x12\x1f\n" +
-	"\x05trade\x18\x01 \x01(\v2\t.v1.TradeR\x05trade\"I\n" +
+	"\x05trade\x18\x01 \x01(\v2\t.v1.TradeR\x05trade\"\xca\x01\n" +
+	"\x13CancelOrdersRequest\x12\x10\n" +
+	"\x03all\x18\x01 \x01(\bR\x03all\x12\x14\n" +
+	"\x05codes\x18\x02 \x03(\tR\x05codes\x12\"\n" +
+	"\x06action\x18\x03 \x01(\x0e2\n" +
+	".v1.ActionR\x06action\x12&\n" +
+	"\bstatuses\x18\x04 \x03(\x0e2\n" +
+	".v1.StatusR\bstatuses\x12\x1d\n" +
+	"\n" +
+	"account_id\x18\x05 \x01(\tR\taccountId\x12 \n" +
+	"\vparallelism\x18\x06 \x01(\x05R\vparallelism\"J\n" +
+	"\x11CancelOrderResult\x12\x1f\n" +
+	"\x05trade\x18\x01 \x01(\v2\t.v1.TradeR\x05trade\x12\x14\n" +
+	"\x05error\x18\x02 \x01(\tR\x05error\"I\n" +
 	"\x17CancelComboOrderRequest\x12.\n" +
 	"\n" +
 	"combotrade\x18\x01 \x01(\v2\x0e.v1.ComboTradeR\n" +
 	"combotrade\"<\n" +
 	"\x13UpdateStatusRequest\x12%\n" +
-	"\aaccount\x18\x01 \x01(\v2\v.v1.AccountR\aaccount\"7\n" +
+	"\aaccount\x18\x01 \x01(\v2\v.v1.AccountR\aaccount\"g\n" +
 	"\x12ListTradesResponse\x12!\n" +
-	"\x06trades\x18\x01 \x03(\v2\t.v1.TradeR\x06trades\"L\n" +
+	"\x06trades\x18\x01 \x03(\v2\t.v1.TradeR\x06trades\x12\x18\n" +
+	"\aversion\x18\x02 \x01(\x03R\aversion\x12\x14\n" +
+	"\x05epoch\x18\x03 \x01(\tR\x05epoch\"|\n" +
 	"\x17ListComboTradesResponse\x121\n" +
-	"\fcombo_trades\x18\x01 \x03(\v2\x0e.v1.ComboTradeR\vcomboTrades\"C\n" +
+	"\fcombo_trades\x18\x01 \x03(\v2\x0e.v1.ComboTradeR\vcomboTrades\x12\x18\n" +
+	"\aversion\x18\x02 \x01(\x03R\aversion\x12\x14\n" +
+	"\x05epoch\x18\x03 \x01(\tR\x05epoch\"S\n" +
+	"\x16ListTradesDeltaRequest\x12#\n" +
+	"\rsince_version\x18\x01 \x01(\x03R\fsinceVersion\x12\x14\n" +
+	"\x05epoch\x18\x02 \x01(\tR\x05epoch\"C\n" +
 	"\x1aGetOrderDealRecordsRequest\x12%\n" +
 	"\aaccount\x18\x01 \x01(\v2\v.v1.AccountR\aaccount\"L\n" +
 	"\x1bGetOrderDealRecordsResponse\x12-\n" +
@@ -9423,10 +12171,13 @@ const file_provider_proto_rawDesc = "" +
 	"\vchange_type\x18\x14 \x01(\x0e2\x0e.v1.ChangeTypeR\n" +
 	"changeType\x12)\n" +
 	"\x10yesterday_volume\x18\x15 \x01(\x01R\x0fyesterdayVolume\x12!\n" +
-	"\fvolume_ratio\x18\x16 \x01(\x01R\vvolumeRatio\"J\n" +
+	"\fvolume_ratio\x18\x16 \x01(\x01R\vvolumeRatio\"\x83\x01\n" +
 	"\x0fGetTicksRequest\x12#\n" +
 	"\rcontract_code\x18\x01 \x01(\tR\fcontractCode\x12\x12\n" +
-	"\x04date\x18\x02 \x01(\tR\x04date\"\xda\x01\n" +
+	"\x04date\x18\x02 \x01(\tR\x04date\x12\x18\n" +
+	"\acompact\x18\x03 \x01(\bR\acompact\x12\x1d\n" +
+	"\n" +
+	"max_points\x18\x04 \x01(\x05R\tmaxPoints\"\xad\x03\n" +
 	"\x05Ticks\x12\x0e\n" +
 	"\x02ts\x18\x01 \x03(\x03R\x02ts\x12\x14\n" +
 	"\x05close\x18\x02 \x03(\x01R\x05close\x12\x16\n" +
@@ -9437,12 +12188,47 @@ const file_provider_proto_rawDesc = "" +
 	"\task_price\x18\x06 \x03(\x01R\baskPrice\x12\x1d\n" +
 	"\n" +
 	"ask_volume\x18\a \x03(\x03R\taskVolume\x12\x1b\n" +
-	"\ttick_type\x18\b \x03(\x05R\btickType\"p\n" +
+	"\ttick_type\x18\b \x03(\x05R\btickType\x12\x19\n" +
+	"\bts_delta\x18\t \x03(\x12R\atsDelta\x12,\n" +
+	"\n" +
+	"price_grid\x18\n" +
+	" \x01(\v2\r.v1.PriceGridR\tpriceGrid\x12\x1f\n" +
+	"\vclose_delta\x18\v \x03(\x12R\n" +
+	"closeDelta\x12&\n" +
+	"\x0fbid_price_delta\x18\f \x03(\x12R\rbidPriceDelta\x12&\n" +
+	"\x0fask_price_delta\x18\r \x03(\x12R\raskPriceDelta\x12\x17\n" +
+	"\ats_unit\x18\x0e \x01(\x03R\x06tsUnit\"O\n" +
+	"\tPriceGrid\x12\x1a\n" +
+	"\bdecimals\x18\x01 \x01(\x05R\bdecimals\x12\x12\n" +
+	"\x04base\x18\x02 \x01(\x03R\x04base\x12\x12\n" +
+	"\x04unit\x18\x03 \x01(\x03R\x04unit\"\x86\x02\n" +
 	"\x0fGetKbarsRequest\x12#\n" +
 	"\rcontract_code\x18\x01 \x01(\tR\fcontractCode\x12\x1d\n" +
 	"\n" +
 	"start_date\x18\x02 \x01(\tR\tstartDate\x12\x19\n" +
-	"\bend_date\x18\x03 \x01(\tR\aendDate\"\x97\x01\n" +
+	"\bend_date\x18\x03 \x01(\tR\aendDate\x12\x19\n" +
+	"\bstart_ts\x18\x04 \x01(\x03R\astartTs\x12\x15\n" +
+	"\x06end_ts\x18\x05 \x01(\x03R\x05endTs\x12\x18\n" +
+	"\acompact\x18\x06 \x01(\bR\acompact\x12)\n" +
+	"\x10resample_minutes\x18\a \x01(\x05R\x0fresampleMinutes\x12\x1d\n" +
+	"\n" +
+	"max_points\x18\b \x01(\x05R\tmaxPoints\"\x8a\x01\n" +
+	"\x14GetKbarsBatchRequest\x12%\n" +
+	"\x0econtract_codes\x18\x01 \x03(\tR\rcontractCodes\x12)\n" +
+	"\x05query\x18\x02 \x01(\v2\x13.v1.GetKbarsRequestR\x05query\x12 \n" +
+	"\vparallelism\x18\x03 \x01(\x05R\vparallelism\"n\n" +
+	"\x10KbarsBatchResult\x12#\n" +
+	"\rcontract_code\x18\x01 \x01(\tR\fcontractCode\x12\x1f\n" +
+	"\x05kbars\x18\x02 \x01(\v2\t.v1.KbarsR\x05kbars\x12\x14\n" +
+	"\x05error\x18\x03 \x01(\tR\x05error\"h\n" +
+	"\x1cStreamHistoricalTicksRequest\x12)\n" +
+	"\x05query\x18\x01 \x01(\v2\x13.v1.GetTicksRequestR\x05query\x12\x1d\n" +
+	"\n" +
+	"chunk_size\x18\x02 \x01(\x05R\tchunkSize\"h\n" +
+	"\x1cStreamHistoricalKbarsRequest\x12)\n" +
+	"\x05query\x18\x01 \x01(\v2\x13.v1.GetKbarsRequestR\x05query\x12\x1d\n" +
+	"\n" +
+	"chunk_size\x18\x02 \x01(\x05R\tchunkSize\"\xf5\x02\n" +
 	"\x05Kbars\x12\x0e\n" +
 	"\x02ts\x18\x01 \x03(\x03R\x02ts\x12\x12\n" +
 	"\x04open\x18\x02 \x03(\x01R\x04open\x12\x12\n" +
@@ -9450,7 +12236,54 @@ const file_provider_proto_rawDesc = "" +
 	"\x03low\x18\x04 \x03(\x01R\x03low\x12\x14\n" +
 	"\x05close\x18\x05 \x03(\x01R\x05close\x12\x16\n" +
 	"\x06volume\x18\x06 \x03(\x03R\x06volume\x12\x16\n" +
-	"\x06amount\x18\a \x03(\x01R\x06amount\"+\n" +
+	"\x06amount\x18\a \x03(\x01R\x06amount\x12\x19\n" +
+	"\bts_delta\x18\b \x03(\x12R\atsDelta\x12,\n" +
+	"\n" +
+	"price_grid\x18\t \x01(\v2\r.v1.PriceGridR\tpriceGrid\x12\x1d\n" +
+	"\n" +
+	"open_delta\x18\n" +
+	" \x03(\x12R\topenDelta\x12\x1d\n" +
+	"\n" +
+	"high_delta\x18\v \x03(\x12R\thighDelta\x12\x1b\n" +
+	"\tlow_delta\x18\f \x03(\x12R\blowDelta\x12\x1f\n" +
+	"\vclose_delta\x18\r \x03(\x12R\n" +
+	"closeDelta\x12\x17\n" +
+	"\ats_unit\x18\x0e \x01(\x03R\x06tsUnit\"\xa0\x01\n" +
+	"\x12GetTickBarsRequest\x12#\n" +
+	"\rcontract_code\x18\x01 \x01(\tR\fcontractCode\x12\x12\n" +
+	"\x04date\x18\x02 \x01(\tR\x04date\x12#\n" +
+	"\x04type\x18\x03 \x01(\x0e2\x0f.v1.TickBarTypeR\x04type\x12\x12\n" +
+	"\x04size\x18\x04 \x01(\x03R\x04size\x12\x18\n" +
+	"\acompact\x18\x05 \x01(\bR\acompact\"\x84\x01\n" +
+	"\x17GetTickAnalyticsRequest\x12#\n" +
+	"\rcontract_code\x18\x01 \x01(\tR\fcontractCode\x12\x12\n" +
+	"\x04date\x18\x02 \x01(\tR\x04date\x12\x19\n" +
+	"\bstart_ts\x18\x03 \x01(\x03R\astartTs\x12\x15\n" +
+	"\x06end_ts\x18\x04 \x01(\x03R\x05endTs\"\xbe\x02\n" +
+	"\rTickAnalytics\x12\x14\n" +
+	"\x05ticks\x18\x01 \x01(\x03R\x05ticks\x12\x16\n" +
+	"\x06volume\x18\x02 \x01(\x03R\x06volume\x12\x12\n" +
+	"\x04vwap\x18\x03 \x01(\x01R\x04vwap\x12\x12\n" +
+	"\x04open\x18\x04 \x01(\x01R\x04open\x12\x12\n" +
+	"\x04high\x18\x05 \x01(\x01R\x04high\x12\x10\n" +
+	"\x03low\x18\x06 \x01(\x01R\x03low\x12\x14\n" +
+	"\x05close\x18\a \x01(\x01R\x05close\x12\x1d\n" +
+	"\n" +
+	"buy_volume\x18\b \x01(\x03R\tbuyVolume\x12\x1f\n" +
+	"\vsell_volume\x18\t \x01(\x03R\n" +
+	"sellVolume\x12\x19\n" +
+	"\bfirst_ts\x18\n" +
+	" \x01(\x03R\afirstTs\x12\x17\n" +
+	"\alast_ts\x18\v \x01(\x03R\x06lastTs\x12'\n" +
+	"\x06levels\x18\f \x03(\v2\x0f.v1.PriceVolumeR\x06levels\"\x91\x01\n" +
+	"\vPriceVolume\x12\x14\n" +
+	"\x05price\x18\x01 \x01(\x01R\x05price\x12\x16\n" +
+	"\x06volume\x18\x02 \x01(\x03R\x06volume\x12\x1d\n" +
+	"\n" +
+	"buy_volume\x18\x03 \x01(\x03R\tbuyVolume\x12\x1f\n" +
+	"\vsell_volume\x18\x04 \x01(\x03R\n" +
+	"sellVolume\x12\x14\n" +
+	"\x05ticks\x18\x05 \x01(\x03R\x05ticks\"+\n" +
 	"\x15GetDailyQuotesRequest\x12\x12\n" +
 	"\x04date\x18\x01 \x01(\tR\x04date\"\xd7\x01\n" +
 	"\vDailyQuotes\x12\x12\n" +
@@ -9553,7 +12386,40 @@ const file_provider_proto_rawDesc = "" +
 	"\x05close\x18\x04 \x03(\x01R\x05close\x12%\n" +
 	"\x0eannounced_date\x18\x05 \x03(\tR\rannouncedDate\"D\n" +
 	"\x15FetchContractsRequest\x12+\n" +
-	"\x11contract_download\x18\x01 \x01(\bR\x10contractDownload\"f\n" +
+	"\x11contract_download\x18\x01 \x01(\bR\x10contractDownload\"\xe2\x01\n" +
+	"\x15GetOptionChainRequest\x12\x1e\n" +
+	"\n" +
+	"underlying\x18\x01 \x01(\tR\n" +
+	"underlying\x12%\n" +
+	"\x0edelivery_month\x18\x02 \x01(\tR\rdeliveryMonth\x12\x1d\n" +
+	"\n" +
+	"strike_min\x18\x03 \x01(\x01R\tstrikeMin\x12\x1d\n" +
+	"\n" +
+	"strike_max\x18\x04 \x01(\x01R\tstrikeMax\x12#\n" +
+	"\rcenter_strike\x18\x05 \x01(\x01R\fcenterStrike\x12\x1f\n" +
+	"\vnum_strikes\x18\x06 \x01(\x05R\n" +
+	"numStrikes\"\x9a\x01\n" +
+	"\fOptionStrike\x12%\n" +
+	"\x0edelivery_month\x18\x01 \x01(\tR\rdeliveryMonth\x12!\n" +
+	"\fstrike_price\x18\x02 \x01(\x01R\vstrikePrice\x12 \n" +
+	"\x04call\x18\x03 \x01(\v2\f.v1.ContractR\x04call\x12\x1e\n" +
+	"\x03put\x18\x04 \x01(\v2\f.v1.ContractR\x03put\"9\n" +
+	"\vOptionChain\x12*\n" +
+	"\astrikes\x18\x01 \x03(\v2\x10.v1.OptionStrikeR\astrikes\"\x9a\x01\n" +
+	"\x14FindContractsRequest\x12\x16\n" +
+	"\x06symbol\x18\x01 \x01(\tR\x06symbol\x12'\n" +
+	"\x0funderlying_code\x18\x02 \x01(\tR\x0eunderlyingCode\x12\x1a\n" +
+	"\bcategory\x18\x03 \x01(\tR\bcategory\x12%\n" +
+	"\x0edelivery_month\x18\x04 \x01(\tR\rdeliveryMonth\"C\n" +
+	"\x15FindContractsResponse\x12*\n" +
+	"\tcontracts\x18\x01 \x03(\v2\f.v1.ContractR\tcontracts\"|\n" +
+	"\x17SingleflightMethodStats\x12\x16\n" +
+	"\x06method\x18\x01 \x01(\tR\x06method\x12\x14\n" +
+	"\x05calls\x18\x02 \x01(\x03R\x05calls\x12\x16\n" +
+	"\x06shared\x18\x03 \x01(\x03R\x06shared\x12\x1b\n" +
+	"\thit_ratio\x18\x04 \x01(\x01R\bhitRatio\"J\n" +
+	"\x11SingleflightStats\x125\n" +
+	"\amethods\x18\x01 \x03(\v2\x1b.v1.SingleflightMethodStatsR\amethods\"f\n" +
 	"\x11ActivateCARequest\x12\x17\n" +
 	"\aca_path\x18\x01 \x01(\tR\x06caPath\x12\x1b\n" +
 	"\tca_passwd\x18\x02 \x01(\tR\bcaPasswd\x12\x1b\n" +
@@ -9572,7 +12438,131 @@ const file_provider_proto_rawDesc = "" +
 	"\x17UnsubscribeTradeRequest\x12%\n" +
 	"\aaccount\x18\x01 \x01(\v2\v.v1.AccountR\aaccount\"4\n" +
 	"\x18UnsubscribeTradeResponse\x12\x18\n" +
-	"\asuccess\x18\x01 \x01(\bR\asuccess*A\n" +
+	"\asuccess\x18\x01 \x01(\bR\asuccess\"Z\n" +
+	"\x12StreamTicksRequest\x12%\n" +
+	"\x0econtract_codes\x18\x01 \x03(\tR\rcontractCodes\x12\x1d\n" +
+	"\n" +
+	"queue_size\x18\x02 \x01(\x05R\tqueueSize\"\xa7\x05\n" +
+	"\x04Tick\x12\x12\n" +
+	"\x04code\x18\x01 \x01(\tR\x04code\x12(\n" +
+	"\bexchange\x18\x02 \x01(\x0e2\f.v1.ExchangeR\bexchange\x12\x0e\n" +
+	"\x02ts\x18\x03 \x01(\x03R\x02ts\x12\x12\n" +
+	"\x04open\x18\x04 \x01(\x01R\x04open\x12\x14\n" +
+	"\x05close\x18\x05 \x01(\x01R\x05close\x12\x12\n" +
+	"\x04high\x18\x06 \x01(\x01R\x04high\x12\x10\n" +
+	"\x03low\x18\a \x01(\x01R\x03low\x12\x1b\n" +
+	"\tavg_price\x18\b \x01(\x01R\bavgPrice\x12\x16\n" +
+	"\x06volume\x18\t \x01(\x03R\x06volume\x12!\n" +
+	"\ftotal_volume\x18\n" +
+	" \x01(\x03R\vtotalVolume\x12\x16\n" +
+	"\x06amount\x18\v \x01(\x01R\x06amount\x12!\n" +
+	"\ftotal_amount\x18\f \x01(\x01R\vtotalAmount\x12)\n" +
+	"\ttick_type\x18\r \x01(\x0e2\f.v1.TickTypeR\btickType\x12/\n" +
+	"\vchange_type\x18\x0e \x01(\x0e2\x0e.v1.ChangeTypeR\n" +
+	"changeType\x12\x1b\n" +
+	"\tprice_chg\x18\x0f \x01(\x01R\bpriceChg\x12\x17\n" +
+	"\apct_chg\x18\x10 \x01(\x01R\x06pctChg\x12+\n" +
+	"\x12bid_side_total_vol\x18\x11 \x01(\x03R\x0fbidSideTotalVol\x12+\n" +
+	"\x12ask_side_total_vol\x18\x12 \x01(\x03R\x0faskSideTotalVol\x12)\n" +
+	"\x10underlying_price\x18\x13 \x01(\x01R\x0funderlyingPrice\x12\x1a\n" +
+	"\bsimtrade\x18\x14 \x01(\bR\bsimtrade\x12\x18\n" +
+	"\asuspend\x18\x15 \x01(\bR\asuspend\x12!\n" +
+	"\fintraday_odd\x18\x16 \x01(\bR\vintradayOdd\"]\n" +
+	"\x13StreamBidAskRequest\x12%\n" +
+	"\x0econtract_codes\x18\x01 \x03(\tR\rcontractCodes\x12\x1f\n" +
+	"\vinterval_ms\x18\x02 \x01(\x05R\n" +
+	"intervalMs\"\xb3\x03\n" +
+	"\x06BidAsk\x12\x12\n" +
+	"\x04code\x18\x01 \x01(\tR\x04code\x12(\n" +
+	"\bexchange\x18\x02 \x01(\x0e2\f.v1.ExchangeR\bexchange\x12\x0e\n" +
+	"\x02ts\x18\x03 \x01(\x03R\x02ts\x12\x1b\n" +
+	"\tbid_price\x18\x04 \x03(\x01R\bbidPrice\x12\x1d\n" +
+	"\n" +
+	"bid_volume\x18\x05 \x03(\x03R\tbidVolume\x12 \n" +
+	"\fdiff_bid_vol\x18\x06 \x03(\x03R\n" +
+	"diffBidVol\x12\x1b\n" +
+	"\task_price\x18\a \x03(\x01R\baskPrice\x12\x1d\n" +
+	"\n" +
+	"ask_volume\x18\b \x03(\x03R\taskVolume\x12 \n" +
+	"\fdiff_ask_vol\x18\t \x03(\x03R\n" +
+	"diffAskVol\x12\"\n" +
+	"\rbid_total_vol\x18\n" +
+	" \x01(\x03R\vbidTotalVol\x12\"\n" +
+	"\rask_total_vol\x18\v \x01(\x03R\vaskTotalVol\x12\x1a\n" +
+	"\bsimtrade\x18\f \x01(\bR\bsimtrade\x12\x18\n" +
+	"\asuspend\x18\r \x01(\bR\asuspend\x12!\n" +
+	"\fintraday_odd\x18\x0e \x01(\bR\vintradayOdd\"\x84\x01\n" +
+	"\x18StreamOrderEventsRequest\x12\x1b\n" +
+	"\tsince_seq\x18\x01 \x01(\x03R\bsinceSeq\x12\x16\n" +
+	"\x06replay\x18\x02 \x01(\bR\x06replay\x12\x1d\n" +
+	"\n" +
+	"queue_size\x18\x03 \x01(\x05R\tqueueSize\x12\x14\n" +
+	"\x05epoch\x18\x04 \x01(\tR\x05epoch\"\xc2\x01\n" +
+	"\n" +
+	"OrderEvent\x12\x10\n" +
+	"\x03seq\x18\x01 \x01(\x03R\x03seq\x12$\n" +
+	"\x05state\x18\x02 \x01(\x0e2\x0e.v1.OrderStateR\x05state\x12\x0e\n" +
+	"\x02ts\x18\x03 \x01(\x03R\x02ts\x12'\n" +
+	"\x05order\x18\x04 \x01(\v2\x0f.v1.OrderUpdateH\x00R\x05order\x12$\n" +
+	"\x04deal\x18\x05 \x01(\v2\x0e.v1.DealUpdateH\x00R\x04deal\x12\x14\n" +
+	"\x05epoch\x18\x06 \x01(\tR\x05epochB\a\n" +
+	"\x05event\"\xb8\x05\n" +
+	"\vOrderUpdate\x12\x17\n" +
+	"\aop_type\x18\x01 \x01(\tR\x06opType\x12\x17\n" +
+	"\aop_code\x18\x02 \x01(\tR\x06opCode\x12\x15\n" +
+	"\x06op_msg\x18\x03 \x01(\tR\x05opMsg\x12\x0e\n" +
+	"\x02id\x18\x04 \x01(\tR\x02id\x12\x14\n" +
+	"\x05seqno\x18\x05 \x01(\tR\x05seqno\x12\x14\n" +
+	"\x05ordno\x18\x06 \x01(\tR\x05ordno\x12\x1b\n" +
+	"\tbroker_id\x18\a \x01(\tR\bbrokerId\x12\x1d\n" +
+	"\n" +
+	"account_id\x18\b \x01(\tR\taccountId\x12\"\n" +
+	"\x06action\x18\t \x01(\x0e2\n" +
+	".v1.ActionR\x06action\x12\x14\n" +
+	"\x05price\x18\n" +
+	" \x01(\x01R\x05price\x12\x1a\n" +
+	"\bquantity\x18\v \x01(\x03R\bquantity\x12,\n" +
+	"\n" +
+	"order_type\x18\f \x01(\x0e2\r.v1.OrderTypeR\torderType\x12\x1d\n" +
+	"\n" +
+	"price_type\x18\r \x01(\tR\tpriceType\x12!\n" +
+	"\fcustom_field\x18\x0e \x01(\tR\vcustomField\x12\x12\n" +
+	"\x04code\x18\x0f \x01(\tR\x04code\x125\n" +
+	"\rsecurity_type\x18\x10 \x01(\x0e2\x10.v1.SecurityTypeR\fsecurityType\x12(\n" +
+	"\bexchange\x18\x11 \x01(\x0e2\f.v1.ExchangeR\bexchange\x12\x1f\n" +
+	"\vexchange_ts\x18\x12 \x01(\x01R\n" +
+	"exchangeTs\x12%\n" +
+	"\x0emodified_price\x18\x13 \x01(\x01R\rmodifiedPrice\x12'\n" +
+	"\x0fcancel_quantity\x18\x14 \x01(\x03R\x0ecancelQuantity\x12%\n" +
+	"\x0eorder_quantity\x18\x15 \x01(\x03R\rorderQuantity\x12\x15\n" +
+	"\x06web_id\x18\x16 \x01(\tR\x05webId\"\x9b\x04\n" +
+	"\n" +
+	"DealUpdate\x12\x19\n" +
+	"\btrade_id\x18\x01 \x01(\tR\atradeId\x12\x14\n" +
+	"\x05seqno\x18\x02 \x01(\tR\x05seqno\x12\x14\n" +
+	"\x05ordno\x18\x03 \x01(\tR\x05ordno\x12!\n" +
+	"\fexchange_seq\x18\x04 \x01(\tR\vexchangeSeq\x12\x1b\n" +
+	"\tbroker_id\x18\x05 \x01(\tR\bbrokerId\x12\x1d\n" +
+	"\n" +
+	"account_id\x18\x06 \x01(\tR\taccountId\x12\"\n" +
+	"\x06action\x18\a \x01(\x0e2\n" +
+	".v1.ActionR\x06action\x12\x12\n" +
+	"\x04code\x18\b \x01(\tR\x04code\x12\x14\n" +
+	"\x05price\x18\t \x01(\x01R\x05price\x12\x1a\n" +
+	"\bquantity\x18\n" +
+	" \x01(\x03R\bquantity\x12\x0e\n" +
+	"\x02ts\x18\v \x01(\x01R\x02ts\x12\x15\n" +
+	"\x06web_id\x18\f \x01(\tR\x05webId\x12!\n" +
+	"\fcustom_field\x18\r \x01(\tR\vcustomField\x125\n" +
+	"\rsecurity_type\x18\x0e \x01(\x0e2\x10.v1.SecurityTypeR\fsecurityType\x12%\n" +
+	"\x0edelivery_month\x18\x0f \x01(\tR\rdeliveryMonth\x12!\n" +
+	"\fstrike_price\x18\x10 \x01(\x01R\vstrikePrice\x122\n" +
+	"\foption_right\x18\x11 \x01(\x0e2\x0f.v1.OptionRightR\voptionRight*w\n" +
+	"\vTickBarType\x12\x1d\n" +
+	"\x19TICK_BAR_TYPE_UNSPECIFIED\x10\x00\x12\x16\n" +
+	"\x12TICK_BAR_TYPE_TIME\x10\x01\x12\x18\n" +
+	"\x14TICK_BAR_TYPE_VOLUME\x10\x02\x12\x17\n" +
+	"\x13TICK_BAR_TYPE_TICKS\x10\x03*A\n" +
 	"\x06Action\x12\x16\n" +
 	"\x12ACTION_UNSPECIFIED\x10\x00\x12\x0e\n" +
 	"\n" +
@@ -9721,7 +12711,7 @@ const file_provider_proto_rawDesc = "" +
 	"\vFetchStatus\x12\x1c\n" +
 	"\x18FETCH_STATUS_UNSPECIFIED\x10\x00\x12\x18\n" +
 	"\x14FETCH_STATUS_SUCCESS\x10\x01\x12\x15\n" +
-	"\x11FETCH_STATUS_FAIL\x10\x022\xfe\x15\n" +
+	"\x11FETCH_STATUS_FAIL\x10\x022\xec\x1d\n" +
 	"\x0fShioajiProvider\x12.\n" +
 	"\x05Login\x12\x10.v1.LoginRequest\x1a\x11.v1.LoginResponse\"\x00\x12)\n" +
 	"\x06Logout\x12\t.v1.Empty\x1a\x12.v1.LogoutResponse\"\x00\x12(\n" +
@@ -9729,16 +12719,20 @@ const file_provider_proto_rawDesc = "" +
 	"\fListAccounts\x12\t.v1.Empty\x1a\x18.v1.ListAccountsResponse\"\x00\x124\n" +
 	"\x11GetAccountBalance\x12\t.v1.Empty\x1a\x12.v1.AccountBalance\"\x00\x120\n" +
 	"\n" +
-	"PlaceOrder\x12\x15.v1.PlaceOrderRequest\x1a\t.v1.Trade\"\x00\x12?\n" +
+	"PlaceOrder\x12\x15.v1.PlaceOrderRequest\x1a\t.v1.Trade\"\x00\x12@\n" +
+	"\vPlaceOrders\x12\x16.v1.PlaceOrdersRequest\x1a\x17.v1.PlaceOrdersResponse\"\x00\x12?\n" +
 	"\x0fPlaceComboOrder\x12\x1a.v1.PlaceComboOrderRequest\x1a\x0e.v1.ComboTrade\"\x00\x122\n" +
 	"\vUpdateOrder\x12\x16.v1.UpdateOrderRequest\x1a\t.v1.Trade\"\x00\x122\n" +
-	"\vCancelOrder\x12\x16.v1.CancelOrderRequest\x1a\t.v1.Trade\"\x00\x12A\n" +
+	"\vCancelOrder\x12\x16.v1.CancelOrderRequest\x1a\t.v1.Trade\"\x00\x12B\n" +
+	"\fCancelOrders\x12\x17.v1.CancelOrdersRequest\x1a\x15.v1.CancelOrderResult\"\x000\x01\x12A\n" +
 	"\x10CancelComboOrder\x12\x1b.v1.CancelComboOrderRequest\x1a\x0e.v1.ComboTrade\"\x00\x124\n" +
 	"\fUpdateStatus\x12\x17.v1.UpdateStatusRequest\x1a\t.v1.Empty\"\x00\x129\n" +
 	"\x11UpdateComboStatus\x12\x17.v1.UpdateStatusRequest\x1a\t.v1.Empty\"\x00\x121\n" +
 	"\n" +
 	"ListTrades\x12\t.v1.Empty\x1a\x16.v1.ListTradesResponse\"\x00\x12;\n" +
-	"\x0fListComboTrades\x12\t.v1.Empty\x1a\x1b.v1.ListComboTradesResponse\"\x00\x12X\n" +
+	"\x0fListComboTrades\x12\t.v1.Empty\x1a\x1b.v1.ListComboTradesResponse\"\x00\x12G\n" +
+	"\x0fListTradesDelta\x12\x1a.v1.ListTradesDeltaRequest\x1a\x16.v1.ListTradesResponse\"\x00\x12Q\n" +
+	"\x14ListComboTradesDelta\x12\x1a.v1.ListTradesDeltaRequest\x1a\x1b.v1.ListComboTradesResponse\"\x00\x12X\n" +
 	"\x13GetOrderDealRecords\x12\x1e.v1.GetOrderDealRecordsRequest\x1a\x1f.v1.GetOrderDealRecordsResponse\"\x00\x12F\n" +
 	"\rListPositions\x12\x18.v1.ListPositionsRequest\x1a\x19.v1.ListPositionsResponse\"\x00\x12U\n" +
 	"\x12ListPositionDetail\x12\x1d.v1.ListPositionDetailRequest\x1a\x1e.v1.ListPositionDetailResponse\"\x00\x12I\n" +
@@ -9757,7 +12751,12 @@ const file_provider_proto_rawDesc = "" +
 	"\x11ReserveEarmarking\x12\x1c.v1.ReserveEarmarkingRequest\x1a\x1d.v1.ReserveEarmarkingResponse\"\x00\x12C\n" +
 	"\fGetSnapshots\x12\x17.v1.GetSnapshotsRequest\x1a\x18.v1.GetSnapshotsResponse\"\x00\x12,\n" +
 	"\bGetTicks\x12\x13.v1.GetTicksRequest\x1a\t.v1.Ticks\"\x00\x12,\n" +
-	"\bGetKbars\x12\x13.v1.GetKbarsRequest\x1a\t.v1.Kbars\"\x00\x12>\n" +
+	"\bGetKbars\x12\x13.v1.GetKbarsRequest\x1a\t.v1.Kbars\"\x00\x12C\n" +
+	"\rGetKbarsBatch\x12\x18.v1.GetKbarsBatchRequest\x1a\x14.v1.KbarsBatchResult\"\x000\x01\x12H\n" +
+	"\x15StreamHistoricalTicks\x12 .v1.StreamHistoricalTicksRequest\x1a\t.v1.Ticks\"\x000\x01\x12H\n" +
+	"\x15StreamHistoricalKbars\x12 .v1.StreamHistoricalKbarsRequest\x1a\t.v1.Kbars\"\x000\x01\x122\n" +
+	"\vGetTickBars\x12\x16.v1.GetTickBarsRequest\x1a\t.v1.Kbars\"\x00\x12D\n" +
+	"\x10GetTickAnalytics\x12\x1b.v1.GetTickAnalyticsRequest\x1a\x11.v1.TickAnalytics\"\x00\x12>\n" +
 	"\x0eGetDailyQuotes\x12\x19.v1.GetDailyQuotesRequest\x1a\x0f.v1.DailyQuotes\"\x00\x12I\n" +
 	"\x0eCreditEnquires\x12\x19.v1.CreditEnquiresRequest\x1a\x1a.v1.CreditEnquiresResponse\"\x00\x12[\n" +
 	"\x14GetShortStockSources\x12\x1f.v1.GetShortStockSourcesRequest\x1a .v1.GetShortStockSourcesResponse\"\x00\x12@\n" +
@@ -9766,10 +12765,17 @@ const file_provider_proto_rawDesc = "" +
 	".v1.Punish\"\x00\x12$\n" +
 	"\tGetNotice\x12\t.v1.Empty\x1a\n" +
 	".v1.Notice\"\x00\x128\n" +
-	"\x0eFetchContracts\x12\x19.v1.FetchContractsRequest\x1a\t.v1.Empty\"\x00\x12L\n" +
+	"\x0eFetchContracts\x12\x19.v1.FetchContractsRequest\x1a\t.v1.Empty\"\x00\x12>\n" +
+	"\x0eGetOptionChain\x12\x19.v1.GetOptionChainRequest\x1a\x0f.v1.OptionChain\"\x00\x12F\n" +
+	"\rFindContracts\x12\x18.v1.FindContractsRequest\x1a\x19.v1.FindContractsResponse\"\x00\x12:\n" +
+	"\x14GetSingleflightStats\x12\t.v1.Empty\x1a\x15.v1.SingleflightStats\"\x00\x12L\n" +
 	"\x0fGetCAExpireTime\x12\x1a.v1.GetCAExpireTimeRequest\x1a\x1b.v1.GetCAExpireTimeResponse\"\x00\x12I\n" +
 	"\x0eSubscribeTrade\x12\x19.v1.SubscribeTradeRequest\x1a\x1a.v1.SubscribeTradeResponse\"\x00\x12O\n" +
-	"\x10UnsubscribeTrade\x12\x1b.v1.UnsubscribeTradeRequest\x1a\x1c.v1.UnsubscribeTradeResponse\"\x00B\x1aZ\x18phoenix/processor/pkg/pbb\x06proto3"
+	"\x10UnsubscribeTrade\x12\x1b.v1.UnsubscribeTradeRequest\x1a\x1c.v1.UnsubscribeTradeResponse\"\x00\x123\n" +
+	"\vStreamTicks\x12\x16.v1.StreamTicksRequest\x1a\b.v1.Tick\"\x000\x01\x127\n" +
+	"\fStreamBidAsk\x12\x17.v1.StreamBidAskRequest\x1a\n" +
+	".v1.BidAsk\"\x000\x01\x12E\n" +
+	"\x11StreamOrderEvents\x12\x1c.v1.StreamOrderEventsRequest\x1a\x0e.v1.OrderEvent\"\x000\x01B\x1aZ\x18phoenix/processor/pkg/pbb\x06proto3"
 
 var (
 	file_provider_proto_rawDescOnce sync.Once
@@ -9783,333 +12789,427 @@ func file_provider_proto_rawDescGZIP() []byte {
 	return file_provider_proto_rawDescData
 }
 
-var file_provider_proto_enumTypes = make([]protoimpl.EnumInfo, 23)
-var file_provider_proto_msgTypes = make([]protoimpl.MessageInfo, 99)
+var file_provider_proto_enumTypes = make([]protoimpl.EnumInfo, 24)
+var file_provider_proto_msgTypes = make([]protoimpl.MessageInfo, 129)
 var file_provider_proto_goTypes = []any{
-	(Action)(0),                           // 0: v1.Action
-	(OrderType)(0),                        // 1: v1.OrderType
-	(StockPriceType)(0),                   // 2: v1.StockPriceType
-	(StockOrderLot)(0),                    // 3: v1.StockOrderLot
-	(StockOrderCond)(0),                   // 4: v1.StockOrderCond
-	(FuturesPriceType)(0),                 // 5: v1.FuturesPriceType
-	(FuturesOCType)(0),                    // 6: v1.FuturesOCType
-	(SecurityType)(0),                     // 7: v1.SecurityType
-	(Exchange)(0),                         // 8: v1.Exchange
-	(Currency)(0),                         // 9: v1.Currency
-	(OptionRight)(0),                      // 10: v1.OptionRight
-	(Status)(0),                           // 11: v1.Status
-	(OrderState)(0),                       // 12: v1.OrderState
-	(QuoteType)(0),                        // 13: v1.QuoteType
-	(QuoteVersion)(0),                     // 14: v1.QuoteVersion
-	(DayTrade)(0),                         // 15: v1.DayTrade
-	(TickType)(0),                         // 16: v1.TickType
-	(ChangeType)(0),                       // 17: v1.ChangeType
-	(Unit)(0),                             // 18: v1.Unit
-	(TradeType)(0),                        // 19: v1.TradeType
-	(ScannerType)(0),                      // 20: v1.ScannerType
-	(TicksQueryType)(0),                   // 21: v1.TicksQueryType
-	(FetchStatus)(0),                      // 22: v1.FetchStatus
-	(*Empty)(nil),                         // 23: v1.Empty
-	(*LoginRequest)(nil),                  // 24: v1.LoginRequest
-	(*LoginResponse)(nil),                 // 25: v1.LoginResponse
-	(*LogoutResponse)(nil),                // 26: v1.LogoutResponse
-	(*Account)(nil),                       // 27: v1.Account
-	(*UsageStatus)(nil),                   // 28: v1.UsageStatus
-	(*ListAccountsResponse)(nil),          // 29: v1.ListAccountsResponse
-	(*AccountBalance)(nil),                // 30: v1.AccountBalance
-	(*Contract)(nil),                      // 31: v1.Contract
-	(*ComboContract)(nil),                 // 32: v1.ComboContract
-	(*ComboBase)(nil),                     // 33: v1.ComboBase
-	(*Order)(nil),                         // 34: v1.Order
-	(*ComboOrder)(nil),                    // 35: v1.ComboOrder
-	(*OrderStatus)(nil),                   // 36: v1.OrderStatus
-	(*Deal)(nil),                          // 37: v1.Deal
-	(*Trade)(nil),                         // 38: v1.Trade
-	(*ComboTrade)(nil),                    // 39: v1.ComboTrade
-	(*PlaceOrderRequest)(nil),             // 40: v1.PlaceOrderRequest
-	(*PlaceComboOrderRequest)(nil),        // 41: v1.PlaceComboOrderRequest
-	(*UpdateOrderRequest)(nil),            // 42: v1.UpdateOrderRequest
-	(*CancelOrderRequest)(nil),            // 43: v1.CancelOrderRequest
-	(*CancelComboOrderRequest)(nil),       // 44: v1.CancelComboOrderRequest
-	(*UpdateStatusRequest)(nil),           // 45: v1.UpdateStatusRequest
-	(*ListTradesResponse)(nil),            // 46: v1.ListTradesResponse
-	(*ListComboTradesResponse)(nil),       // 47: v1.ListComboTradesResponse
-	(*GetOrderDealRecordsRequest)(nil),    // 48: v1.GetOrderDealRecordsRequest
-	(*GetOrderDealRecordsResponse)(nil),   // 49: v1.GetOrderDealRecordsResponse
-	(*OrderDealRecord)(nil),               // 50: v1.OrderDealRecord
-	(*ListPositionsRequest)(nil),          // 51: v1.ListPositionsRequest
-	(*StockPosition)(nil),                 // 52: v1.StockPosition
-	(*FuturePosition)(nil),                // 53: v1.FuturePosition
-	(*Position)(nil),                      // 54: v1.Position
-	(*ListPositionsResponse)(nil),         // 55: v1.ListPositionsResponse
-	(*ListPositionDetailRequest)(nil),     // 56: v1.ListPositionDetailRequest
-	(*StockPositionDetail)(nil),           // 57: v1.StockPositionDetail
-	(*FuturePositionDetail)(nil),          // 58: v1.FuturePositionDetail
-	(*PositionDetail)(nil),                // 59: v1.PositionDetail
-	(*ListPositionDetailResponse)(nil),    // 60: v1.ListPositionDetailResponse
-	(*ListProfitLossRequest)(nil),         // 61: v1.ListProfitLossRequest
-	(*StockProfitLoss)(nil),               // 62: v1.StockProfitLoss
-	(*FutureProfitLoss)(nil),              // 63: v1.FutureProfitLoss
-	(*ProfitLoss)(nil),                    // 64: v1.ProfitLoss
-	(*ListProfitLossResponse)(nil),        // 65: v1.ListProfitLossResponse
-	(*ListProfitLossDetailRequest)(nil),   // 66: v1.ListProfitLossDetailRequest
-	(*StockProfitDetail)(nil),             // 67: v1.StockProfitDetail
-	(*FutureProfitDetail)(nil),            // 68: v1.FutureProfitDetail
-	(*ProfitDetail)(nil),                  // 69: v1.ProfitDetail
-	(*ListProfitLossDetailResponse)(nil),  // 70: v1.ListProfitLossDetailResponse
-	(*ListProfitLossSummaryRequest)(nil),  // 71: v1.ListProfitLossSummaryRequest
-	(*StockProfitLossSummary)(nil),        // 72: v1.StockProfitLossSummary
-	(*FutureProfitLossSummary)(nil),       // 73: v1.FutureProfitLossSummary
-	(*ProfitLossSummary)(nil),             // 74: v1.ProfitLossSummary
-	(*ListProfitLossSummaryResponse)(nil), // 75: v1.ListProfitLossSummaryResponse
-	(*GetSettlementsRequest)(nil),         // 76: v1.GetSettlementsRequest
-	(*Settlement)(nil),                    // 77: v1.Settlement
-	(*GetSettlementsResponse)(nil),        // 78: v1.GetSettlementsResponse
-	(*GetMarginRequest)(nil),              // 79: v1.GetMarginRequest
-	(*Margin)(nil),                        // 80: v1.Margin
-	(*GetTradingLimitsRequest)(nil),       // 81: v1.GetTradingLimitsRequest
-	(*TradingLimits)(nil),                 // 82: v1.TradingLimits
-	(*GetStockReserveSummaryRequest)(nil), // 83: v1.GetStockReserveSummaryRequest
-	(*ReserveStocksSummaryResponse)(nil),  // 84: v1.ReserveStocksSummaryResponse
-	(*GetStockReserveDetailRequest)(nil),  // 85: v1.GetStockReserveDetailRequest
-	(*ReserveStocksDetailResponse)(nil),   // 86: v1.ReserveStocksDetailResponse
-	(*ReserveStockRequest)(nil),           // 87: v1.ReserveStockRequest
-	(*ReserveStockResponse)(nil),          // 88: v1.ReserveStockResponse
-	(*GetEarmarkingDetailRequest)(nil),    // 89: v1.GetEarmarkingDetailRequest
-	(*EarmarkStocksDetailResponse)(nil),   // 90: v1.EarmarkStocksDetailResponse
-	(*ReserveEarmarkingRequest)(nil),      // 91: v1.ReserveEarmarkingRequest
-	(*ReserveEarmarkingResponse)(nil),     // 92: v1.ReserveEarmarkingResponse
-	(*GetSnapshotsRequest)(nil),           // 93: v1.GetSnapshotsRequest
-	(*GetSnapshotsResponse)(nil),          // 94: v1.GetSnapshotsResponse
-	(*Snapshot)(nil),                      // 95: v1.Snapshot
-	(*GetTicksRequest)(nil),               // 96: v1.GetTicksRequest
-	(*Ticks)(nil),                         // 97: v1.Ticks
-	(*GetKbarsRequest)(nil),               // 98: v1.GetKbarsRequest
-	(*Kbars)(nil),                         // 99: v1.Kbars
-	(*GetDailyQuotesRequest)(nil),         // 100: v1.GetDailyQuotesRequest
-	(*DailyQuotes)(nil),                   // 101: v1.DailyQuotes
-	(*CreditEnquiresRequest)(nil),         // 102: v1.CreditEnquiresRequest
-	(*CreditEnquiresResponse)(nil),        // 103: v1.CreditEnquiresResponse
-	(*CreditEnquire)(nil),                 // 104: v1.CreditEnquire
-	(*GetShortStockSourcesRequest)(nil),   // 105: v1.GetShortStockSourcesRequest
-	(*GetShortStockSourcesResponse)(nil),  // 106: v1.GetShortStockSourcesResponse
-	(*ShortStockSource)(nil),              // 107: v1.ShortStockSource
-	(*GetScannersRequest)(nil),            // 108: v1.GetScannersRequest
-	(*GetScannersResponse)(nil),           // 109: v1.GetScannersResponse
-	(*ScannerItem)(nil),                   // 110: v1.ScannerItem
-	(*Punish)(nil),                        // 111: v1.Punish
-	(*Notice)(nil),                        // 112: v1.Notice
-	(*FetchContractsRequest)(nil),         // 113: v1.FetchContractsRequest
-	(*ActivateCARequest)(nil),             // 114: v1.ActivateCARequest
-	(*ActivateCAResponse)(nil),            // 115: v1.ActivateCAResponse
-	(*GetCAExpireTimeRequest)(nil),        // 116: v1.GetCAExpireTimeRequest
-	(*GetCAExpireTimeResponse)(nil),       // 117: v1.GetCAExpireTimeResponse
-	(*SubscribeTradeRequest)(nil),         // 118: v1.SubscribeTradeRequest
-	(*SubscribeTradeResponse)(nil),        // 119: v1.SubscribeTradeResponse
-	(*UnsubscribeTradeRequest)(nil),       // 120: v1.UnsubscribeTradeRequest
-	(*UnsubscribeTradeResponse)(nil),      // 121: v1.UnsubscribeTradeResponse
+	(TickBarType)(0),                      // 0: v1.TickBarType
+	(Action)(0),                           // 1: v1.Action
+	(OrderType)(0),                        // 2: v1.OrderType
+	(StockPriceType)(0),                   // 3: v1.StockPriceType
+	(StockOrderLot)(0),                    // 4: v1.StockOrderLot
+	(StockOrderCond)(0),                   // 5: v1.StockOrderCond
+	(FuturesPriceType)(0),                 // 6: v1.FuturesPriceType
+	(FuturesOCType)(0),                    // 7: v1.FuturesOCType
+	(SecurityType)(0),                     // 8: v1.SecurityType
+	(Exchange)(0),                         // 9: v1.Exchange
+	(Currency)(0),                         // 10: v1.Currency
+	(OptionRight)(0),                      // 11: v1.OptionRight
+	(Status)(0),                           // 12: v1.Status
+	(OrderState)(0),                       // 13: v1.OrderState
+	(QuoteType)(0),                        // 14: v1.QuoteType
+	(QuoteVersion)(0),                     // 15: v1.QuoteVersion
+	(DayTrade)(0),                         // 16: v1.DayTrade
+	(TickType)(0),                         // 17: v1.TickType
+	(ChangeType)(0),                       // 18: v1.ChangeType
+	(Unit)(0),                             // 19: v1.Unit
+	(TradeType)(0),                        // 20: v1.TradeType
+	(ScannerType)(0),                      // 21: v1.ScannerType
+	(TicksQueryType)(0),                   // 22: v1.TicksQueryType
+	(FetchStatus)(0),                      // 23: v1.FetchStatus
+	(*Empty)(nil),                         // 24: v1.Empty
+	(*LoginRequest)(nil),                  // 25: v1.LoginRequest
+	(*LoginResponse)(nil),                 // 26: v1.LoginResponse
+	(*LogoutResponse)(nil),                // 27: v1.LogoutResponse
+	(*Account)(nil),                       // 28: v1.Account
+	(*UsageStatus)(nil),                   // 29: v1.UsageStatus
+	(*ListAccountsResponse)(nil),          // 30: v1.ListAccountsResponse
+	(*AccountBalance)(nil),                // 31: v1.AccountBalance
+	(*Contract)(nil),                      // 32: v1.Contract
+	(*ComboContract)(nil),                 // 33: v1.ComboContract
+	(*ComboBase)(nil),                     // 34: v1.ComboBase
+	(*Order)(nil),                         // 35: v1.Order
+	(*ComboOrder)(nil),                    // 36: v1.ComboOrder
+	(*OrderStatus)(nil),                   // 37: v1.OrderStatus
+	(*Deal)(nil),                          // 38: v1.Deal
+	(*Trade)(nil),                         // 39: v1.Trade
+	(*ComboTrade)(nil),                    // 40: v1.ComboTrade
+	(*PlaceOrderRequest)(nil),             // 41: v1.PlaceOrderRequest
+	(*PlaceOrdersRequest)(nil),            // 42: v1.PlaceOrdersRequest
+	(*PlaceOrderResult)(nil),              // 43: v1.PlaceOrderResult
+	(*PlaceOrdersResponse)(nil),           // 44: v1.PlaceOrdersResponse
+	(*PlaceComboOrderRequest)(nil),        // 45: v1.PlaceComboOrderRequest
+	(*UpdateOrderRequest)(nil),            // 46: v1.UpdateOrderRequest
+	(*CancelOrderRequest)(nil),            // 47: v1.CancelOrderRequest
+	(*CancelOrdersRequest)(nil),           // 48: v1.CancelOrdersRequest
+	(*CancelOrderResult)(nil),             // 49: v1.CancelOrderResult
+	(*CancelComboOrderRequest)(nil),       // 50: v1.CancelComboOrderRequest
+	(*UpdateStatusRequest)(nil),           // 51: v1.UpdateStatusRequest
+	(*ListTradesResponse)(nil),            // 52: v1.ListTradesResponse
+	(*ListComboTradesResponse)(nil),       // 53: v1.ListComboTradesResponse
+	(*ListTradesDeltaRequest)(nil),        // 54: v1.ListTradesDeltaRequest
+	(*GetOrderDealRecordsRequest)(nil),    // 55: v1.GetOrderDealRecordsRequest
+	(*GetOrderDealRecordsResponse)(nil),   // 56: v1.GetOrderDealRecordsResponse
+	(*OrderDealRecord)(nil),               // 57: v1.OrderDealRecord
+	(*ListPositionsRequest)(nil),          // 58: v1.ListPositionsRequest
+	(*StockPosition)(nil),                 // 59: v1.StockPosition
+	(*FuturePosition)(nil),                // 60: v1.FuturePosition
+	(*Position)(nil),                      // 61: v1.Position
+	(*ListPositionsResponse)(nil),         // 62: v1.ListPositionsResponse
+	(*ListPositionDetailRequest)(nil),     // 63: v1.ListPositionDetailRequest
+	(*StockPositionDetail)(nil),           // 64: v1.StockPositionDetail
+	(*FuturePositionDetail)(nil),          // 65: v1.FuturePositionDetail
+	(*PositionDetail)(nil),                // 66: v1.PositionDetail
+	(*ListPositionDetailResponse)(nil),    // 67: v1.ListPositionDetailResponse
+	(*ListProfitLossRequest)(nil),         // 68: v1.ListProfitLossRequest
+	(*StockProfitLoss)(nil),               // 69: v1.StockProfitLoss
+	(*FutureProfitLoss)(nil),              // 70: v1.FutureProfitLoss
+	(*ProfitLoss)(nil),                    // 71: v1.ProfitLoss
+	(*ListProfitLossResponse)(nil),        // 72: v1.ListProfitLossResponse
+	(*ListProfitLossDetailRequest)(nil),   // 73: v1.ListProfitLossDetailRequest
+	(*StockProfitDetail)(nil),             // 74: v1.StockProfitDetail
+	(*FutureProfitDetail)(nil),            // 75: v1.FutureProfitDetail
+	(*ProfitDetail)(nil),                  // 76: v1.ProfitDetail
+	(*ListProfitLossDetailResponse)(nil),  // 77: v1.ListProfitLossDetailResponse
+	(*ListProfitLossSummaryRequest)(nil),  // 78: v1.ListProfitLossSummaryRequest
+	(*StockProfitLossSummary)(nil),        // 79: v1.StockProfitLossSummary
+	(*FutureProfitLossSummary)(nil),       // 80: v1.FutureProfitLossSummary
+	(*ProfitLossSummary)(nil),             // 81: v1.ProfitLossSummary
+	(*ListProfitLossSummaryResponse)(nil), // 82: v1.ListProfitLossSummaryResponse
+	(*GetSettlementsRequest)(nil),         // 83: v1.GetSettlementsRequest
+	(*Settlement)(nil),                    // 84: v1.Settlement
+	(*GetSettlementsResponse)(nil),        // 85: v1.GetSettlementsResponse
+	(*GetMarginRequest)(nil),              // 86: v1.GetMarginRequest
+	(*Margin)(nil),                        // 87: v1.Margin
+	(*GetTradingLimitsRequest)(nil),       // 88: v1.GetTradingLimitsRequest
+	(*TradingLimits)(nil),                 // 89: v1.TradingLimits
+	(*GetStockReserveSummaryRequest)(nil), // 90: v1.GetStockReserveSummaryRequest
+	(*ReserveStocksSummaryResponse)(nil),  // 91: v1.ReserveStocksSummaryResponse
+	(*GetStockReserveDetailRequest)(nil),  // 92: v1.GetStockReserveDetailRequest
+	(*ReserveStocksDetailResponse)(nil),   // 93: v1.ReserveStocksDetailResponse
+	(*ReserveStockRequest)(nil),           // 94: v1.ReserveStockRequest
+	(*ReserveStockResponse)(nil),          // 95: v1.ReserveStockResponse
+	(*GetEarmarkingDetailRequest)(nil),    // 96: v1.GetEarmarkingDetailRequest
+	(*EarmarkStocksDetailResponse)(nil),   // 97: v1.EarmarkStocksDetailResponse
+	(*ReserveEarmarkingRequest)(nil),      // 98: v1.ReserveEarmarkingRequest
+	(*ReserveEarmarkingResponse)(nil),     // 99: v1.ReserveEarmarkingResponse
+	(*GetSnapshotsRequest)(nil),           // 100: v1.GetSnapshotsRequest
+	(*GetSnapshotsResponse)(nil),          // 101: v1.GetSnapshotsResponse
+	(*Snapshot)(nil),                      // 102: v1.Snapshot
+	(*GetTicksRequest)(nil),               // 103: v1.GetTicksRequest
+	(*Ticks)(nil),                         // 104: v1.Ticks
+	(*PriceGrid)(nil),                     // 105: v1.PriceGrid
+	(*GetKbarsRequest)(nil),               // 106: v1.GetKbarsRequest
+	(*GetKbarsBatchRequest)(nil),          // 107: v1.GetKbarsBatchRequest
+	(*KbarsBatchResult)(nil),              // 108: v1.KbarsBatchResult
+	(*StreamHistoricalTicksRequest)(nil),  // 109: v1.StreamHistoricalTicksRequest
+	(*StreamHistoricalKbarsRequest)(nil),  // 110: v1.StreamHistoricalKbarsRequest
+	(*Kbars)(nil),                         // 111: v1.Kbars
+	(*GetTickBarsRequest)(nil),            // 112: v1.GetTickBarsRequest
+	(*GetTickAnalyticsRequest)(nil),       // 113: v1.GetTickAnalyticsRequest
+	(*TickAnalytics)(nil),                 // 114: v1.TickAnalytics
+	(*PriceVolume)(nil),                   // 115: v1.PriceVolume
+	(*GetDailyQuotesRequest)(nil),         // 116: v1.GetDailyQuotesRequest
+	(*DailyQuotes)(nil),                   // 117: v1.DailyQuotes
+	(*CreditEnquiresRequest)(nil),         // 118: v1.CreditEnquiresRequest
+	(*CreditEnquiresResponse)(nil),        // 119: v1.CreditEnquiresResponse
+	(*CreditEnquire)(nil),                 // 120: v1.CreditEnquire
+	(*GetShortStockSourcesRequest)(nil),   // 121: v1.GetShortStockSourcesRequest
+	(*GetShortStockSourcesResponse)(nil),  // 122: v1.GetShortStockSourcesResponse
+	(*ShortStockSource)(nil),              // 123: v1.ShortStockSource
+	(*GetScannersRequest)(nil),            // 124: v1.GetScannersRequest
+	(*GetScannersResponse)(nil),           // 125: v1.GetScannersResponse
+	(*ScannerItem)(nil),                   // 126: v1.ScannerItem
+	(*Punish)(nil),                        // 127: v1.Punish
+	(*Notice)(nil),                        // 128: v1.Notice
+	(*FetchContractsRequest)(nil),         // 129: v1.FetchContractsRequest
+	(*GetOptionChainRequest)(nil),         // 130: v1.GetOptionChainRequest
+	(*OptionStrike)(nil),                  // 131: v1.OptionStrike
+	(*OptionChain)(nil),                   // 132: v1.OptionChain
+	(*FindContractsRequest)(nil),          // 133: v1.FindContractsRequest
+	(*FindContractsResponse)(nil),         // 134: v1.FindContractsResponse
+	(*SingleflightMethodStats)(nil),       // 135: v1.SingleflightMethodStats
+	(*SingleflightStats)(nil),             // 136: v1.SingleflightStats
+	(*ActivateCARequest)(nil),             // 137: v1.ActivateCARequest
+	(*ActivateCAResponse)(nil),            // 138: v1.ActivateCAResponse
+	(*GetCAExpireTimeRequest)(nil),        // 139: v1.GetCAExpireTimeRequest
+	(*GetCAExpireTimeResponse)(nil),       // 140: v1.GetCAExpireTimeResponse
+	(*SubscribeTradeRequest)(nil),         // 141: v1.SubscribeTradeRequest
+	(*SubscribeTradeResponse)(nil),        // 142: v1.SubscribeTradeResponse
+	(*UnsubscribeTradeRequest)(nil),       // 143: v1.UnsubscribeTradeRequest
+	(*UnsubscribeTradeResponse)(nil),      // 144: v1.UnsubscribeTradeResponse
+	(*StreamTicksRequest)(nil),            // 145: v1.StreamTicksRequest
+	(*Tick)(nil),                          // 146: v1.Tick
+	(*StreamBidAskRequest)(nil),           // 147: v1.StreamBidAskRequest
+	(*BidAsk)(nil),                        // 148: v1.BidAsk
+	(*StreamOrderEventsRequest)(nil),      // 149: v1.StreamOrderEventsRequest
+	(*OrderEvent)(nil),                    // 150: v1.OrderEvent
+	(*OrderUpdate)(nil),                   // 151: v1.OrderUpdate
+	(*DealUpdate)(nil),                    // 152: v1.DealUpdate
 }
 var file_provider_proto_depIdxs = []int32{
-	27,  // 0: v1.LoginResponse.accounts:type_name -> v1.Account
-	27,  // 1: v1.ListAccountsResponse.accounts:type_name -> v1.Account
-	22,  // 2: v1.AccountBalance.status:type_name -> v1.FetchStatus
-	7,   // 3: v1.Contract.security_type:type_name -> v1.SecurityType
-	8,   // 4: v1.Contract.exchange:type_name -> v1.Exchange
-	9,   // 5: v1.Contract.currency:type_name -> v1.Currency
-	10,  // 6: v1.Contract.option_right:type_name -> v1.OptionRight
-	15,  // 7: v1.Contract.day_trade:type_name -> v1.DayTrade
-	33,  // 8: v1.ComboContract.legs:type_name -> v1.ComboBase
-	7,   // 9: v1.ComboBase.security_type:type_name -> v1.SecurityType
-	8,   // 10: v1.ComboBase.exchange:type_name -> v1.Exchange
-	9,   // 11: v1.ComboBase.currency:type_name -> v1.Currency
-	10,  // 12: v1.ComboBase.option_right:type_name -> v1.OptionRight
-	15,  // 13: v1.ComboBase.day_trade:type_name -> v1.DayTrade
-	0,   // 14: v1.ComboBase.action:type_name -> v1.Action
-	0,   // 15: v1.Order.action:type_name -> v1.Action
-	27,  // 16: v1.Order.account:type_name -> v1.Account
-	1,   // 17: v1.Order.order_type:type_name -> v1.OrderType
-	6,   // 18: v1.Order.octype:type_name -> v1.FuturesOCType
-	3,   // 19: v1.Order.order_lot:type_name -> v1.StockOrderLot
-	4,   // 20: v1.Order.order_cond:type_name -> v1.StockOrderCond
-	0,   // 21: v1.ComboOrder.action:type_name -> v1.Action
-	27,  // 22: v1.ComboOrder.account:type_name -> v1.Account
-	1,   // 23: v1.ComboOrder.order_type:type_name -> v1.OrderType
-	6,   // 24: v1.ComboOrder.octype:type_name -> v1.FuturesOCType
-	11,  // 25: v1.OrderStatus.status:type_name -> v1.Status
-	37,  // 26: v1.OrderStatus.deals:type_name -> v1.Deal
-	31,  // 27: v1.Trade.contract:type_name -> v1.Contract
-	34,  // 28: v1.Trade.order:type_name -> v1.Order
-	36,  // 29: v1.Trade.status:type_name -> v1.OrderStatus
-	32,  // 30: v1.ComboTrade.contract:type_name -> v1.ComboContract
-	35,  // 31: v1.ComboTrade.order:type_name -> v1.ComboOrder
-	36,  // 32: v1.ComboTrade.status:type_name -> v1.OrderStatus
-	31,  // 33: v1.PlaceOrderRequest.contract:type_name -> v1.Contract
-	34,  // 34: v1.PlaceOrderRequest.order:type_name -> v1.Order
-	32,  // 35: v1.PlaceComboOrderRequest.combo_contract:type_name -> v1.ComboContract
-	35,  // 36: v1.PlaceComboOrderRequest.order:type_name -> v1.ComboOrder
-	38,  // 37: v1.UpdateOrderRequest.trade:type_name -> v1.Trade
-	38,  // 38: v1.CancelOrderRequest.trade:type_name -> v1.Trade
-	39,  // 39: v1.CancelComboOrderRequest.combotrade:type_name -> v1.ComboTrade
-	27,  // 40: v1.UpdateStatusRequest.account:type_name -> v1.Account
-	38,  // 41: v1.ListTradesResponse.trades:type_name -> v1.Trade
-	39,  // 42: v1.ListComboTradesResponse.combo_trades:type_name -> v1.ComboTrade
-	27,  // 43: v1.GetOrderDealRecordsRequest.account:type_name -> v1.Account
-	50,  // 44: v1.GetOrderDealRecordsResponse.records:type_name -> v1.OrderDealRecord
-	0,   // 45: v1.OrderDealRecord.action:type_name -> v1.Action
-	27,  // 46: v1.ListPositionsRequest.account:type_name -> v1.Account
-	0,   // 47: v1.StockPosition.direction:type_name -> v1.Action
-	4,   // 48: v1.StockPosition.cond:type_name -> v1.StockOrderCond
-	0,   // 49: v1.FuturePosition.direction:type_name -> v1.Action
-	52,  // 50: v1.Position.stock_position:type_name -> v1.StockPosition
-	53,  // 51: v1.Position.future_position:type_name -> v1.FuturePosition
-	54,  // 52: v1.ListPositionsResponse.positions:type_name -> v1.Position
-	27,  // 53: v1.ListPositionDetailRequest.account:type_name -> v1.Account
-	0,   // 54: v1.StockPositionDetail.direction:type_name -> v1.Action
-	9,   // 55: v1.StockPositionDetail.currency:type_name -> v1.Currency
-	4,   // 56: v1.StockPositionDetail.cond:type_name -> v1.StockOrderCond
-	0,   // 57: v1.FuturePositionDetail.direction:type_name -> v1.Action
-	9,   // 58: v1.FuturePositionDetail.currency:type_name -> v1.Currency
-	57,  // 59: v1.PositionDetail.stock_detail:type_name -> v1.StockPositionDetail
-	58,  // 60: v1.PositionDetail.future_detail:type_name -> v1.FuturePositionDetail
-	59,  // 61: v1.ListPositionDetailResponse.details:type_name -> v1.PositionDetail
-	27,  // 62: v1.ListProfitLossRequest.account:type_name -> v1.Account
-	4,   // 63: v1.StockProfitLoss.cond:type_name -> v1.StockOrderCond
-	0,   // 64: v1.FutureProfitLoss.direction:type_name -> v1.Action
-	62,  // 65: v1.ProfitLoss.stock_pnl:type_name -> v1.StockProfitLoss
-	63,  // 66: v1.ProfitLoss.future_pnl:type_name -> v1.FutureProfitLoss
-	64,  // 67: v1.ListProfitLossResponse.profit_losses:type_name -> v1.ProfitLoss
-	27,  // 68: v1.ListProfitLossDetailRequest.account:type_name -> v1.Account
-	9,   // 69: v1.StockProfitDetail.currency:type_name -> v1.Currency
-	19,  // 70: v1.StockProfitDetail.trade_type:type_name -> v1.TradeType
-	4,   // 71: v1.StockProfitDetail.cond:type_name -> v1.StockOrderCond
-	0,   // 72: v1.FutureProfitDetail.direction:type_name -> v1.Action
-	9,   // 73: v1.FutureProfitDetail.currency:type_name -> v1.Currency
-	67,  // 74: v1.ProfitDetail.stock_detail:type_name -> v1.StockProfitDetail
-	68,  // 75: v1.ProfitDetail.future_detail:type_name -> v1.FutureProfitDetail
-	69,  // 76: v1.ListProfitLossDetailResponse.details:type_name -> v1.ProfitDetail
-	27,  // 77: v1.ListProfitLossSummaryRequest.account:type_name -> v1.Account
-	9,   // 78: v1.StockProfitLossSummary.currency:type_name -> v1.Currency
-	4,   // 79: v1.StockProfitLossSummary.cond:type_name -> v1.StockOrderCond
-	0,   // 80: v1.FutureProfitLossSummary.direction:type_name -> v1.Action
-	9,   // 81: v1.FutureProfitLossSummary.currency:type_name -> v1.Currency
-	72,  // 82: v1.ProfitLossSummary.stock_summary:type_name -> v1.StockProfitLossSummary
-	73,  // 83: v1.ProfitLossSummary.future_summary:type_name -> v1.FutureProfitLossSummary
-	74,  // 84: v1.ListProfitLossSummaryResponse.summaries:type_name -> v1.ProfitLossSummary
-	27,  // 85: v1.GetSettlementsRequest.account:type_name -> v1.Account
-	22,  // 86: v1.Settlement.status:type_name -> v1.FetchStatus
-	77,  // 87: v1.GetSettlementsResponse.settlements:type_name -> v1.Settlement
-	27,  // 88: v1.GetMarginRequest.account:type_name -> v1.Account
-	22,  // 89: v1.Margin.status:type_name -> v1.FetchStatus
-	27,  // 90: v1.GetTradingLimitsRequest.account:type_name -> v1.Account
-	22,  // 91: v1.TradingLimits.status:type_name -> v1.FetchStatus
-	27,  // 92: v1.GetStockReserveSummaryRequest.account:type_name -> v1.Account
-	27,  // 93: v1.GetStockReserveDetailRequest.account:type_name -> v1.Account
-	27,  // 94: v1.ReserveStockRequest.account:type_name -> v1.Account
-	31,  // 95: v1.ReserveStockRequest.contract:type_name -> v1.Contract
-	27,  // 96: v1.GetEarmarkingDetailRequest.account:type_name -> v1.Account
-	27,  // 97: v1.ReserveEarmarkingRequest.account:type_name -> v1.Account
-	31,  // 98: v1.ReserveEarmarkingRequest.contract:type_name -> v1.Contract
-	95,  // 99: v1.GetSnapshotsResponse.snapshots:type_name -> v1.Snapshot
-	8,   // 100: v1.Snapshot.exchange:type_name -> v1.Exchange
-	16,  // 101: v1.Snapshot.tick_type:type_name -> v1.TickType
-	17,  // 102: v1.Snapshot.change_type:type_name -> v1.ChangeType
-	104, // 103: v1.CreditEnquiresResponse.credit_enquires:type_name -> v1.CreditEnquire
-	107, // 104: v1.GetShortStockSourcesResponse.sources:type_name -> v1.ShortStockSource
-	20,  // 105: v1.GetScannersRequest.scanner_type:type_name -> v1.ScannerType
-	110, // 106: v1.GetScannersResponse.scanners:type_name -> v1.ScannerItem
-	16,  // 107: v1.ScannerItem.tick_type:type_name -> v1.TickType
-	17,  // 108: v1.ScannerItem.change_type:type_name -> v1.ChangeType
-	27,  // 109: v1.SubscribeTradeRequest.account:type_name -> v1.Account
-	27,  // 110: v1.UnsubscribeTradeRequest.account:type_name -> v1.Account
-	24,  // 111: v1.ShioajiProvider.Login:input_type -> v1.LoginRequest
-	23,  // 112: v1.ShioajiProvider.Logout:input_type -> v1.Empty
-	23,  // 113: v1.ShioajiProvider.GetUsage:input_type -> v1.Empty
-	23,  // 114: v1.ShioajiProvider.ListAccounts:input_type -> v1.Empty
-	23,  // 115: v1.ShioajiProvider.GetAccountBalance:input_type -> v1.Empty
-	40,  // 116: v1.ShioajiProvider.PlaceOrder:input_type -> v1.PlaceOrderRequest
-	41,  // 117: v1.ShioajiProvider.PlaceComboOrder:input_type -> v1.PlaceComboOrderRequest
-	42,  // 118: v1.ShioajiProvider.UpdateOrder:input_type -> v1.UpdateOrderRequest
-	43,  // 119: v1.ShioajiProvider.CancelOrder:input_type -> v1.CancelOrderRequest
-	44,  // 120: v1.ShioajiProvider.CancelComboOrder:input_type -> v1.CancelComboOrderRequest
-	45,  // 121: v1.ShioajiProvider.UpdateStatus:input_type -> v1.UpdateStatusRequest
-	45,  // 122: v1.ShioajiProvider.UpdateComboStatus:input_type -> v1.UpdateStatusRequest
-	23,  // 123: v1.ShioajiProvider.ListTrades:input_type -> v1.Empty
-	23,  // 124: v1.ShioajiProvider.ListComboTrades:input_type -> v1.Empty
-	48,  // 125: v1.ShioajiProvider.GetOrderDealRecords:input_type -> v1.GetOrderDealRecordsRequest
-	51,  // 126: v1.ShioajiProvider.ListPositions:input_type -> v1.ListPositionsRequest
-	56,  // 127: v1.ShioajiProvider.ListPositionDetail:input_type -> v1.ListPositionDetailRequest
-	61,  // 128: v1.ShioajiProvider.ListProfitLoss:input_type -> v1.ListProfitLossRequest
-	66,  // 129: v1.ShioajiProvider.ListProfitLossDetail:input_type -> v1.ListProfitLossDetailRequest
-	71,  // 130: v1.ShioajiProvider.ListProfitLossSummary:input_type -> v1.ListProfitLossSummaryRequest
-	76,  // 131: v1.ShioajiProvider.GetSettlements:input_type -> v1.GetSettlementsRequest
-	76,  // 132: v1.ShioajiProvider.ListSettlements:input_type -> v1.GetSettlementsRequest
-	79,  // 133: v1.ShioajiProvider.GetMargin:input_type -> v1.GetMarginRequest
-	81,  // 134: v1.ShioajiProvider.GetTradingLimits:input_type -> v1.GetTradingLimitsRequest
-	83,  // 135: v1.ShioajiProvider.GetStockReserveSummary:input_type -> v1.GetStockReserveSummaryRequest
-	85,  // 136: v1.ShioajiProvider.GetStockReserveDetail:input_type -> v1.GetStockReserveDetailRequest
-	87,  // 137: v1.ShioajiProvider.ReserveStock:input_type -> v1.ReserveStockRequest
-	89,  // 138: v1.ShioajiProvider.GetEarmarkingDetail:input_type -> v1.GetEarmarkingDetailRequest
-	91,  // 139: v1.ShioajiProvider.ReserveEarmarking:input_type -> v1.ReserveEarmarkingRequest
-	93,  // 140: v1.ShioajiProvider.GetSnapshots:input_type -> v1.GetSnapshotsRequest
-	96,  // 141: v1.ShioajiProvider.GetTicks:input_type -> v1.GetTicksRequest
-	98,  // 142: v1.ShioajiProvider.GetKbars:input_type -> v1.GetKbarsRequest
-	100, // 143: v1.ShioajiProvider.GetDailyQuotes:input_type -> v1.GetDailyQuotesRequest
-	102, // 144: v1.ShioajiProvider.CreditEnquires:input_type -> v1.CreditEnquiresRequest
-	105, // 145: v1.ShioajiProvider.GetShortStockSources:input_type -> v1.GetShortStockSourcesRequest
-	108, // 146: v1.ShioajiProvider.GetScanners:input_type -> v1.GetScannersRequest
-	23,  // 147: v1.ShioajiProvider.GetPunish:input_type -> v1.Empty
-	23,  // 148: v1.ShioajiProvider.GetNotice:input_type -> v1.Empty
-	113, // 149: v1.ShioajiProvider.FetchContracts:input_type -> v1.FetchContractsRequest
-	116, // 150: v1.ShioajiProvider.GetCAExpireTime:input_type -> v1.GetCAExpireTimeRequest
-	118, // 151: v1.ShioajiProvider.SubscribeTrade:input_type -> v1.SubscribeTradeRequest
-	120, // 152: v1.ShioajiProvider.UnsubscribeTrade:input_type -> v1.UnsubscribeTradeRequest
-	25,  // 153: v1.ShioajiProvider.Login:output_type -> v1.LoginResponse
-	26,  // 154: v1.ShioajiProvider.Logout:output_type -> v1.LogoutResponse
-	28,  // 155: v1.ShioajiProvider.GetUsage:output_type -> v1.UsageStatus
-	29,  // 156: v1.ShioajiProvider.ListAccounts:output_type -> v1.ListAccountsResponse
-	30,  // 157: v1.ShioajiProvider.GetAccountBalance:output_type -> v1.AccountBalance
-	38,  // 158: v1.ShioajiProvider.PlaceOrder:output_type -> v1.Trade
-	39,  // 159: v1.ShioajiProvider.PlaceComboOrder:output_type -> v1.ComboTrade
-	38,  // 160: v1.ShioajiProvider.UpdateOrder:output_type -> v1.Trade
-	38,  // 161: v1.ShioajiProvider.CancelOrder:output_type -> v1.Trade
-	39,  // 162: v1.ShioajiProvider.CancelComboOrder:output_type -> v1.ComboTrade
-	23,  // 163: v1.ShioajiProvider.UpdateStatus:output_type -> v1.Empty
-	23,  // 164: v1.ShioajiProvider.UpdateComboStatus:output_type -> v1.Empty
-	46,  // 165: v1.ShioajiProvider.ListTrades:output_type -> v1.ListTradesResponse
-	47,  // 166: v1.ShioajiProvider.ListComboTrades:output_type -> v1.ListComboTradesResponse
-	49,  // 167: v1.ShioajiProvider.GetOrderDealRecords:output_type -> v1.GetOrderDealRecordsResponse
-	55,  // 168: v1.ShioajiProvider.ListPositions:output_type -> v1.ListPositionsResponse
-	60,  // 169: v1.ShioajiProvider.ListPositionDetail:output_type -> v1.ListPositionDetailResponse
-	65,  // 170: v1.ShioajiProvider.ListProfitLoss:output_type -> v1.ListProfitLossResponse
-	70,  // 171: v1.ShioajiProvider.ListProfitLossDetail:output_type -> v1.ListProfitLossDetailResponse
-	75,  // 172: v1.ShioajiProvider.ListProfitLossSummary:output_type -> v1.ListProfitLossSummaryResponse
-	78,  // 173: v1.ShioajiProvider.GetSettlements:output_type -> v1.GetSettlementsResponse
-	78,  // 174: v1.ShioajiProvider.ListSettlements:output_type -> v1.GetSettlementsResponse
-	80,  // 175: v1.ShioajiProvider.GetMargin:output_type -> v1.Margin
-	82,  // 176: v1.ShioajiProvider.GetTradingLimits:output_type -> v1.TradingLimits
-	84,  // 177: v1.ShioajiProvider.GetStockReserveSummary:output_type -> v1.ReserveStocksSummaryResponse
-	86,  // 178: v1.ShioajiProvider.GetStockReserveDetail:output_type -> v1.ReserveStocksDetailResponse
-	88,  // 179: v1.ShioajiProvider.ReserveStock:output_type -> v1.ReserveStockResponse
-	90,  // 180: v1.ShioajiProvider.GetEarmarkingDetail:output_type -> v1.EarmarkStocksDetailResponse
-	92,  // 181: v1.ShioajiProvider.ReserveEarmarking:output_type -> v1.ReserveEarmarkingResponse
-	94,  // 182: v1.ShioajiProvider.GetSnapshots:output_type -> v1.GetSnapshotsResponse
-	97,  // 183: v1.ShioajiProvider.GetTicks:output_type -> v1.Ticks
-	99,  // 184: v1.ShioajiProvider.GetKbars:output_type -> v1.Kbars
-	101, // 185: v1.ShioajiProvider.GetDailyQuotes:output_type -> v1.DailyQuotes
-	103, // 186: v1.ShioajiProvider.CreditEnquires:output_type -> v1.CreditEnquiresResponse
-	106, // 187: v1.ShioajiProvider.GetShortStockSources:output_type -> v1.GetShortStockSourcesResponse
-	109, // 188: v1.ShioajiProvider.GetScanners:output_type -> v1.GetScannersResponse
-	111, // 189: v1.ShioajiProvider.GetPunish:output_type -> v1.Punish
-	112, // 190: v1.ShioajiProvider.GetNotice:output_type -> v1.Notice
-	23,  // 191: v1.ShioajiProvider.FetchContracts:output_type -> v1.Empty
-	117, // 192: v1.ShioajiProvider.GetCAExpireTime:output_type -> v1.GetCAExpireTimeResponse
-	119, // 193: v1.ShioajiProvider.SubscribeTrade:output_type -> v1.SubscribeTradeResponse
-	121, // 194: v1.ShioajiProvider.UnsubscribeTrade:output_type -> v1.UnsubscribeTradeResponse
-	153, // [153:195] is the sub-list for method output_type
-	111, // [111:153] is the sub-list for method input_type
-	111, // [111:111] is the sub-list for extension type_name
-	111, // [111:111] is the sub-list for extension extendee
-	0,   // [0:111] is the sub-list for field type_name
+	28,  // 0: v1.LoginResponse.accounts:type_name -> v1.Account
+	28,  // 1: v1.ListAccountsResponse.accounts:type_name -> v1.Account
+	23,  // 2: v1.AccountBalance.status:type_name -> v1.FetchStatus
+	8,   // 3: v1.Contract.security_type:type_name -> v1.SecurityType
+	9,   // 4: v1.Contract.exchange:type_name -> v1.Exchange
+	10,  // 5: v1.Contract.currency:type_name -> v1.Currency
+	11,  // 6: v1.Contract.option_right:type_name -> v1.OptionRight
+	16,  // 7: v1.Contract.day_trade:type_name -> v1.DayTrade
+	34,  // 8: v1.ComboContract.legs:type_name -> v1.ComboBase
+	8,   // 9: v1.ComboBase.security_type:type_name -> v1.SecurityType
+	9,   // 10: v1.ComboBase.exchange:type_name -> v1.Exchange
+	10,  // 11: v1.ComboBase.currency:type_name -> v1.Currency
+	11,  // 12: v1.ComboBase.option_right:type_name -> v1.OptionRight
+	16,  // 13: v1.ComboBase.day_trade:type_name -> v1.DayTrade
+	1,   // 14: v1.ComboBase.action:type_name -> v1.Action
+	1,   // 15: v1.Order.action:type_name -> v1.Action
+	28,  // 16: v1.Order.account:type_name -> v1.Account
+	2,   // 17: v1.Order.order_type:type_name -> v1.OrderType
+	7,   // 18: v1.Order.octype:type_name -> v1.FuturesOCType
+	4,   // 19: v1.Order.order_lot:type_name -> v1.StockOrderLot
+	5,   // 20: v1.Order.order_cond:type_name -> v1.StockOrderCond
+	1,   // 21: v1.ComboOrder.action:type_name -> v1.Action
+	28,  // 22: v1.ComboOrder.account:type_name -> v1.Account
+	2,   // 23: v1.ComboOrder.order_type:type_name -> v1.OrderType
+	7,   // 24: v1.ComboOrder.octype:type_name -> v1.FuturesOCType
+	12,  // 25: v1.OrderStatus.status:type_name -> v1.Status
+	38,  // 26: v1.OrderStatus.deals:type_name -> v1.Deal
+	32,  // 27: v1.Trade.contract:type_name -> v1.Contract
+	35,  // 28: v1.Trade.order:type_name -> v1.Order
+	37,  // 29: v1.Trade.status:type_name -> v1.OrderStatus
+	33,  // 30: v1.ComboTrade.contract:type_name -> v1.ComboContract
+	36,  // 31: v1.ComboTrade.order:type_name -> v1.ComboOrder
+	37,  // 32: v1.ComboTrade.status:type_name -> v1.OrderStatus
+	32,  // 33: v1.PlaceOrderRequest.contract:type_name -> v1.Contract
+	35,  // 34: v1.PlaceOrderRequest.order:type_name -> v1.Order
+	41,  // 35: v1.PlaceOrdersRequest.orders:type_name -> v1.PlaceOrderRequest
+	39,  // 36: v1.PlaceOrderResult.trade:type_name -> v1.Trade
+	43,  // 37: v1.PlaceOrdersResponse.results:type_name -> v1.PlaceOrderResult
+	33,  // 38: v1.PlaceComboOrderRequest.combo_contract:type_name -> v1.ComboContract
+	36,  // 39: v1.PlaceComboOrderRequest.order:type_name -> v1.ComboOrder
+	39,  // 40: v1.UpdateOrderRequest.trade:type_name -> v1.Trade
+	39,  // 41: v1.CancelOrderRequest.trade:type_name -> v1.Trade
+	1,   // 42: v1.CancelOrdersRequest.action:type_name -> v1.Action
+	12,  // 43: v1.CancelOrdersRequest.statuses:type_name -> v1.Status
+	39,  // 44: v1.CancelOrderResult.trade:type_name -> v1.Trade
+	40,  // 45: v1.CancelComboOrderRequest.combotrade:type_name -> v1.ComboTrade
+	28,  // 46: v1.UpdateStatusRequest.account:type_name -> v1.Account
+	39,  // 47: v1.ListTradesResponse.trades:type_name -> v1.Trade
+	40,  // 48: v1.ListComboTradesResponse.combo_trades:type_name -> v1.ComboTrade
+	28,  // 49: v1.GetOrderDealRecordsRequest.account:type_name -> v1.Account
+	57,  // 50: v1.GetOrderDealRecordsResponse.records:type_name -> v1.OrderDealRecord
+	1,   // 51: v1.OrderDealRecord.action:type_name -> v1.Action
+	28,  // 52: v1.ListPositionsRequest.account:type_name -> v1.Account
+	1,   // 53: v1.StockPosition.direction:type_name -> v1.Action
+	5,   // 54: v1.StockPosition.cond:type_name -> v1.StockOrderCond
+	1,   // 55: v1.FuturePosition.direction:type_name -> v1.Action
+	59,  // 56: v1.Position.stock_position:type_name -> v1.StockPosition
+	60,  // 57: v1.Position.future_position:type_name -> v1.FuturePosition
+	61,  // 58: v1.ListPositionsResponse.positions:type_name -> v1.Position
+	28,  // 59: v1.ListPositionDetailRequest.account:type_name -> v1.Account
+	1,   // 60: v1.StockPositionDetail.direction:type_name -> v1.Action
+	10,  // 61: v1.StockPositionDetail.currency:type_name -> v1.Currency
+	5,   // 62: v1.StockPositionDetail.cond:type_name -> v1.StockOrderCond
+	1,   // 63: v1.FuturePositionDetail.direction:type_name -> v1.Action
+	10,  // 64: v1.FuturePositionDetail.currency:type_name -> v1.Currency
+	64,  // 65: v1.PositionDetail.stock_detail:type_name -> v1.StockPositionDetail
+	65,  // 66: v1.PositionDetail.future_detail:type_name -> v1.FuturePositionDetail
+	66,  // 67: v1.ListPositionDetailResponse.details:type_name -> v1.PositionDetail
+	28,  // 68: v1.ListProfitLossRequest.account:type_name -> v1.Account
+	5,   // 69: v1.StockProfitLoss.cond:type_name -> v1.StockOrderCond
+	1,   // 70: v1.FutureProfitLoss.direction:type_name -> v1.Action
+	69,  // 71: v1.ProfitLoss.stock_pnl:type_name -> v1.StockProfitLoss
+	70,  // 72: v1.ProfitLoss.future_pnl:type_name -> v1.FutureProfitLoss
+	71,  // 73: v1.ListProfitLossResponse.profit_losses:type_name -> v1.ProfitLoss
+	28,  // 74: v1.ListProfitLossDetailRequest.account:type_name -> v1.Account
+	10,  // 75: v1.StockProfitDetail.currency:type_name -> v1.Currency
+	20,  // 76: v1.StockProfitDetail.trade_type:type_name -> v1.TradeType
+	5,   // 77: v1.StockProfitDetail.cond:type_name -> v1.StockOrderCond
+	1,   // 78: v1.FutureProfitDetail.direction:type_name -> v1.Action
+	10,  // 79: v1.FutureProfitDetail.currency:type_name -> v1.Currency
+	74,  // 80: v1.ProfitDetail.stock_detail:type_name -> v1.StockProfitDetail
+	75,  // 81: v1.ProfitDetail.future_detail:type_name -> v1.FutureProfitDetail
+	76,  // 82: v1.ListProfitLossDetailResponse.details:type_name -> v1.ProfitDetail
+	28,  // 83: v1.ListProfitLossSummaryRequest.account:type_name -> v1.Account
+	10,  // 84: v1.StockProfitLossSummary.currency:type_name -> v1.Currency
+	5,   // 85: v1.StockProfitLossSummary.cond:type_name -> v1.StockOrderCond
+	1,   // 86: v1.FutureProfitLossSummary.direction:type_name -> v1.Action
+	10,  // 87: v1.FutureProfitLossSummary.currency:type_name -> v1.Currency
+	79,  // 88: v1.ProfitLossSummary.stock_summary:type_name -> v1.StockProfitLossSummary
+	80,  // 89: v1.ProfitLossSummary.future_summary:type_name -> v1.FutureProfitLossSummary
+	81,  // 90: v1.ListProfitLossSummaryResponse.summaries:type_name -> v1.ProfitLossSummary
+	28,  // 91: v1.GetSettlementsRequest.account:type_name -> v1.Account
+	23,  // 92: v1.Settlement.status:type_name -> v1.FetchStatus
+	84,  // 93: v1.GetSettlementsResponse.settlements:type_name -> v1.Settlement
+	28,  // 94: v1.GetMarginRequest.account:type_name -> v1.Account
+	23,  // 95: v1.Margin.status:type_name -> v1.FetchStatus
+	28,  // 96: v1.GetTradingLimitsRequest.account:type_name -> v1.Account
+	23,  // 97: v1.TradingLimits.status:type_name -> v1.FetchStatus
+	28,  // 98: v1.GetStockReserveSummaryRequest.account:type_name -> v1.Account
+	28,  // 99: v1.GetStockReserveDetailRequest.account:type_name -> v1.Account
+	28,  // 100: v1.ReserveStockRequest.account:type_name -> v1.Account
+	32,  // 101: v1.ReserveStockRequest.contract:type_name -> v1.Contract
+	28,  // 102: v1.GetEarmarkingDetailRequest.account:type_name -> v1.Account
+	28,  // 103: v1.ReserveEarmarkingRequest.account:type_name -> v1.Account
+	32,  // 104: v1.ReserveEarmarkingRequest.contract:type_name -> v1.Contract
+	102, // 105: v1.GetSnapshotsResponse.snapshots:type_name -> v1.Snapshot
+	9,   // 106: v1.Snapshot.exchange:type_name -> v1.Exchange
+	17,  // 107: v1.Snapshot.tick_type:type_name -> v1.TickType
+	18,  // 108: v1.Snapshot.change_type:type_name -> v1.ChangeType
+	105, // 109: v1.Ticks.price_grid:type_name -> v1.PriceGrid
+	106, // 110: v1.GetKbarsBatchRequest.query:type_name -> v1.GetKbarsRequest
+	111, // 111: v1.KbarsBatchResult.kbars:type_name -> v1.Kbars
+	103, // 112: v1.StreamHistoricalTicksRequest.query:type_name -> v1.GetTicksRequest
+	106, // 113: v1.StreamHistoricalKbarsRequest.query:type_name -> v1.GetKbarsRequest
+	105, // 114: v1.Kbars.price_grid:type_name -> v1.PriceGrid
+	0,   // 115: v1.GetTickBarsRequest.type:type_name -> v1.TickBarType
+	115, // 116: v1.TickAnalytics.levels:type_name -> v1.PriceVolume
+	120, // 117: v1.CreditEnquiresResponse.credit_enquires:type_name -> v1.CreditEnquire
+	123, // 118: v1.GetShortStockSourcesResponse.sources:type_name -> v1.ShortStockSource
+	21,  // 119: v1.GetScannersRequest.scanner_type:type_name -> v1.ScannerType
+	126, // 120: v1.GetScannersResponse.scanners:type_name -> v1.ScannerItem
+	17,  // 121: v1.ScannerItem.tick_type:type_name -> v1.TickType
+	18,  // 122: v1.ScannerItem.change_type:type_name -> v1.ChangeType
+	32,  // 123: v1.OptionStrike.call:type_name -> v1.Contract
+	32,  // 124: v1.OptionStrike.put:type_name -> v1.Contract
+	131, // 125: v1.OptionChain.strikes:type_name -> v1.OptionStrike
+	32,  // 126: v1.FindContractsResponse.contracts:type_name -> v1.Contract
+	135, // 127: v1.SingleflightStats.methods:type_name -> v1.SingleflightMethodStats
+	28,  // 128: v1.SubscribeTradeRequest.account:type_name -> v1.Account
+	28,  // 129: v1.UnsubscribeTradeRequest.account:type_name -> v1.Account
+	9,   // 130: v1.Tick.exchange:type_name -> v1.Exchange
+	17,  // 131: v1.Tick.tick_type:type_name -> v1.TickType
+	18,  // 132: v1.Tick.change_type:type_name -> v1.ChangeType
+	9,   // 133: v1.BidAsk.exchange:type_name -> v1.Exchange
+	13,  // 134: v1.OrderEvent.state:type_name -> v1.OrderState
+	151, // 135: v1.OrderEvent.order:type_name -> v1.OrderUpdate
+	152, // 136: v1.OrderEvent.deal:type_name -> v1.DealUpdate
+	1,   // 137: v1.OrderUpdate.action:type_name -> v1.Action
+	2,   // 138: v1.OrderUpdate.order_type:type_name -> v1.OrderType
+	8,   // 139: v1.OrderUpdate.security_type:type_name -> v1.SecurityType
+	9,   // 140: v1.OrderUpdate.exchange:type_name -> v1.Exchange
+	1,   // 141: v1.DealUpdate.action:type_name -> v1.Action
+	8,   // 142: v1.DealUpdate.security_type:type_name -> v1.SecurityType
+	11,  // 143: v1.DealUpdate.option_right:type_name -> v1.OptionRight
+	25,  // 144: v1.ShioajiProvider.Login:input_type -> v1.LoginRequest
+	24,  // 145: v1.ShioajiProvider.Logout:input_type -> v1.Empty
+	24,  // 146: v1.ShioajiProvider.GetUsage:input_type -> v1.Empty
+	24,  // 147: v1.ShioajiProvider.ListAccounts:input_type -> v1.Empty
+	24,  // 148: v1.ShioajiProvider.GetAccountBalance:input_type -> v1.Empty
+	41,  // 149: v1.ShioajiProvider.PlaceOrder:input_type -> v1.PlaceOrderRequest
+	42,  // 150: v1.ShioajiProvider.PlaceOrders:input_type -> v1.PlaceOrdersRequest
+	45,  // 151: v1.ShioajiProvider.PlaceComboOrder:input_type -> v1.PlaceComboOrderRequest
+	46,  // 152: v1.ShioajiProvider.UpdateOrder:input_type -> v1.UpdateOrderRequest
+	47,  // 153: v1.ShioajiProvider.CancelOrder:input_type -> v1.CancelOrderRequest
+	48,  // 154: v1.ShioajiProvider.CancelOrders:input_type -> v1.CancelOrdersRequest
+	50,  // 155: v1.ShioajiProvider.CancelComboOrder:input_type -> v1.CancelComboOrderRequest
+	51,  // 156: v1.ShioajiProvider.UpdateStatus:input_type -> v1.UpdateStatusRequest
+	51,  // 157: v1.ShioajiProvider.UpdateComboStatus:input_type -> v1.UpdateStatusRequest
+	24,  // 158: v1.ShioajiProvider.ListTrades:input_type -> v1.Empty
+	24,  // 159: v1.ShioajiProvider.ListComboTrades:input_type -> v1.Empty
+	54,  // 160: v1.ShioajiProvider.ListTradesDelta:input_type -> v1.ListTradesDeltaRequest
+	54,  // 161: v1.ShioajiProvider.ListComboTradesDelta:input_type -> v1.ListTradesDeltaRequest
+	55,  // 162: v1.ShioajiProvider.GetOrderDealRecords:input_type -> v1.GetOrderDealRecordsRequest
+	58,  // 163: v1.ShioajiProvider.ListPositions:input_type -> v1.ListPositionsRequest
+	63,  // 164: v1.ShioajiProvider.ListPositionDetail:input_type -> v1.ListPositionDetailRequest
+	68,  // 165: v1.ShioajiProvider.ListProfitLoss:input_type -> v1.ListProfitLossRequest
+	73,  // 166: v1.ShioajiProvider.ListProfitLossDetail:input_type -> v1.ListProfitLossDetailRequest
+	78,  // 167: v1.ShioajiProvider.ListProfitLossSummary:input_type -> v1.ListProfitLossSummaryRequest
+	83,  // 168: v1.ShioajiProvider.GetSettlements:input_type -> v1.GetSettlementsRequest
+	83,  // 169: v1.ShioajiProvider.ListSettlements:input_type -> v1.GetSettlementsRequest
+	86,  // 170: v1.ShioajiProvider.GetMargin:input_type -> v1.GetMarginRequest
+	88,  // 171: v1.ShioajiProvider.GetTradingLimits:input_type -> v1.GetTradingLimitsRequest
+	90,  // 172: v1.ShioajiProvider.GetStockReserveSummary:input_type -> v1.GetStockReserveSummaryRequest
+	92,  // 173: v1.ShioajiProvider.GetStockReserveDetail:input_type -> v1.GetStockReserveDetailRequest
+	94,  // 174: v1.ShioajiProvider.ReserveStock:input_type -> v1.ReserveStockRequest
+	96,  // 175: v1.ShioajiProvider.GetEarmarkingDetail:input_type -> v1.GetEarmarkingDetailRequest
+	98,  // 176: v1.ShioajiProvider.ReserveEarmarking:input_type -> v1.ReserveEarmarkingRequest
+	100, // 177: v1.ShioajiProvider.GetSnapshots:input_type -> v1.GetSnapshotsRequest
+	103, // 178: v1.ShioajiProvider.GetTicks:input_type -> v1.GetTicksRequest
+	106, // 179: v1.ShioajiProvider.GetKbars:input_type -> v1.GetKbarsRequest
+	107, // 180: v1.ShioajiProvider.GetKbarsBatch:input_type -> v1.GetKbarsBatchRequest
+	109, // 181: v1.ShioajiProvider.StreamHistoricalTicks:input_type -> v1.StreamHistoricalTicksRequest
+	110, // 182: v1.ShioajiProvider.StreamHistoricalKbars:input_type -> v1.StreamHistoricalKbarsRequest
+	112, // 183: v1.ShioajiProvider.GetTickBars:input_type -> v1.GetTickBarsRequest
+	113, // 184: v1.ShioajiProvider.GetTickAnalytics:input_type -> v1.GetTickAnalyticsRequest
+	116, // 185: v1.ShioajiProvider.GetDailyQuotes:input_type -> v1.GetDailyQuotesRequest
+	118, // 186: v1.ShioajiProvider.CreditEnquires:input_type -> v1.CreditEnquiresRequest
+	121, // 187: v1.ShioajiProvider.GetShortStockSources:input_type -> v1.GetShortStockSourcesRequest
+	124, // 188: v1.ShioajiProvider.GetScanners:input_type -> v1.GetScannersRequest
+	24,  // 189: v1.ShioajiProvider.GetPunish:input_type -> v1.Empty
+	24,  // 190: v1.ShioajiProvider.GetNotice:input_type -> v1.Empty
+	129, // 191: v1.ShioajiProvider.FetchContracts:input_type -> v1.FetchContractsRequest
+	130, // 192: v1.ShioajiProvider.GetOptionChain:input_type -> v1.GetOptionChainRequest
+	133, // 193: v1.ShioajiProvider.FindContracts:input_type -> v1.FindContractsRequest
+	24,  // 194: v1.ShioajiProvider.GetSingleflightStats:input_type -> v1.Empty
+	139, // 195: v1.ShioajiProvider.GetCAExpireTime:input_type -> v1.GetCAExpireTimeRequest
+	141, // 196: v1.ShioajiProvider.SubscribeTrade:input_type -> v1.SubscribeTradeRequest
+	143, // 197: v1.ShioajiProvider.UnsubscribeTrade:input_type -> v1.UnsubscribeTradeRequest
+	145, // 198: v1.ShioajiProvider.StreamTicks:input_type -> v1.StreamTicksRequest
+	147, // 199: v1.ShioajiProvider.StreamBidAsk:input_type -> v1.StreamBidAskRequest
+	149, // 200: v1.ShioajiProvider.StreamOrderEvents:input_type -> v1.StreamOrderEventsRequest
+	26,  // 201: v1.ShioajiProvider.Login:output_type -> v1.LoginResponse
+	27,  // 202: v1.ShioajiProvider.Logout:output_type -> v1.LogoutResponse
+	29,  // 203: v1.ShioajiProvider.GetUsage:output_type -> v1.UsageStatus
+	30,  // 204: v1.ShioajiProvider.ListAccounts:output_type -> v1.ListAccountsResponse
+	31,  // 205: v1.ShioajiProvider.GetAccountBalance:output_type -> v1.AccountBalance
+	39,  // 206: v1.ShioajiProvider.PlaceOrder:output_type -> v1.Trade
+	44,  // 207: v1.ShioajiProvider.PlaceOrders:output_type -> v1.PlaceOrdersResponse
+	40,  // 208: v1.ShioajiProvider.PlaceComboOrder:output_type -> v1.ComboTrade
+	39,  // 209: v1.ShioajiProvider.UpdateOrder:output_type -> v1.Trade
+	39,  // 210: v1.ShioajiProvider.CancelOrder:output_type -> v1.Trade
+	49,  // 211: v1.ShioajiProvider.CancelOrders:output_type -> v1.CancelOrderResult
+	40,  // 212: v1.ShioajiProvider.CancelComboOrder:output_type -> v1.ComboTrade
+	24,  // 213: v1.ShioajiProvider.UpdateStatus:output_type -> v1.Empty
+	24,  // 214: v1.ShioajiProvider.UpdateComboStatus:output_type -> v1.Empty
+	52,  // 215: v1.ShioajiProvider.ListTrades:output_type -> v1.ListTradesResponse
+	53,  // 216: v1.ShioajiProvider.ListComboTrades:output_type -> v1.ListComboTradesResponse
+	52,  // 217: v1.ShioajiProvider.ListTradesDelta:output_type -> v1.ListTradesResponse
+	53,  // 218: v1.ShioajiProvider.ListComboTradesDelta:output_type -> v1.ListComboTradesResponse
+	56,  // 219: v1.ShioajiProvider.GetOrderDealRecords:output_type -> v1.GetOrderDealRecordsResponse
+	62,  // 220: v1.ShioajiProvider.ListPositions:output_type -> v1.ListPositionsResponse
+	67,  // 221: v1.ShioajiProvider.ListPositionDetail:output_type -> v1.ListPositionDetailResponse
+	72,  // 222: v1.ShioajiProvider.ListProfitLoss:output_type -> v1.ListProfitLossResponse
+	77,  // 223: v1.ShioajiProvider.ListProfitLossDetail:output_type -> v1.ListProfitLossDetailResponse
+	82,  // 224: v1.ShioajiProvider.ListProfitLossSummary:output_type -> v1.ListProfitLossSummaryResponse
+	85,  // 225: v1.ShioajiProvider.GetSettlements:output_type -> v1.GetSettlementsResponse
+	85,  // 226: v1.ShioajiProvider.ListSettlements:output_type -> v1.GetSettlementsResponse
+	87,  // 227: v1.ShioajiProvider.GetMargin:output_type -> v1.Margin
+	89,  // 228: v1.ShioajiProvider.GetTradingLimits:output_type -> v1.TradingLimits
+	91,  // 229: v1.ShioajiProvider.GetStockReserveSummary:output_type -> v1.ReserveStocksSummaryResponse
+	93,  // 230: v1.ShioajiProvider.GetStockReserveDetail:output_type -> v1.ReserveStocksDetailResponse
+	95,  // 231: v1.ShioajiProvider.ReserveStock:output_type -> v1.ReserveStockResponse
+	97,  // 232: v1.ShioajiProvider.GetEarmarkingDetail:output_type -> v1.EarmarkStocksDetailResponse
+	99,  // 233: v1.ShioajiProvider.ReserveEarmarking:output_type -> v1.ReserveEarmarkingResponse
+	101, // 234: v1.ShioajiProvider.GetSnapshots:output_type -> v1.GetSnapshotsResponse
+	104, // 235: v1.ShioajiProvider.GetTicks:output_type -> v1.Ticks
+	111, // 236: v1.ShioajiProvider.GetKbars:output_type -> v1.Kbars
+	108, // 237: v1.ShioajiProvider.GetKbarsBatch:output_type -> v1.KbarsBatchResult
+	104, // 238: v1.ShioajiProvider.StreamHistoricalTicks:output_type -> v1.Ticks
+	111, // 239: v1.ShioajiProvider.StreamHistoricalKbars:output_type -> v1.Kbars
+	111, // 240: v1.ShioajiProvider.GetTickBars:output_type -> v1.Kbars
+	114, // 241: v1.ShioajiProvider.GetTickAnalytics:output_type -> v1.TickAnalytics
+	117, // 242: v1.ShioajiProvider.GetDailyQuotes:output_type -> v1.DailyQuotes
+	119, // 243: v1.ShioajiProvider.CreditEnquires:output_type -> v1.CreditEnquiresResponse
+	122, // 244: v1.ShioajiProvider.GetShortStockSources:output_type -> v1.GetShortStockSourcesResponse
+	125, // 245: v1.ShioajiProvider.GetScanners:output_type -> v1.GetScannersResponse
+	127, // 246: v1.ShioajiProvider.GetPunish:output_type -> v1.Punish
+	128, // 247: v1.ShioajiProvider.GetNotice:output_type -> v1.Notice
+	24,  // 248: v1.ShioajiProvider.FetchContracts:output_type -> v1.Empty
+	132, // 249: v1.ShioajiProvider.GetOptionChain:output_type -> v1.OptionChain
+	134, // 250: v1.ShioajiProvider.FindContracts:output_type -> v1.FindContractsResponse
+	136, // 251: v1.ShioajiProvider.GetSingleflightStats:output_type -> v1.SingleflightStats
+	140, // 252: v1.ShioajiProvider.GetCAExpireTime:output_type -> v1.GetCAExpireTimeResponse
+	142, // 253: v1.ShioajiProvider.SubscribeTrade:output_type -> v1.SubscribeTradeResponse
+	144, // 254: v1.ShioajiProvider.UnsubscribeTrade:output_type -> v1.UnsubscribeTradeResponse
+	146, // 255: v1.ShioajiProvider.StreamTicks:output_type -> v1.Tick
+	148, // 256: v1.ShioajiProvider.StreamBidAsk:output_type -> v1.BidAsk
+	150, // 257: v1.ShioajiProvider.StreamOrderEvents:output_type -> v1.OrderEvent
+	201, // [201:258] is the sub-list for method output_type
+	144, // [144:201] is the sub-list for method input_type
+	144, // [144:144] is the sub-list for extension type_name
+	144, // [144:144] is the sub-list for extension extendee
+	0,   // [0:144] is the sub-list for field type_name
 }
 
 func init() { file_provider_proto_init() }
@@ -10117,33 +13217,37 @@ func file_provider_proto_init() {
 	if File_provider_proto != nil {
 		return
 	}
-	file_provider_proto_msgTypes[31].OneofWrappers = []any{
+	file_provider_proto_msgTypes[37].OneofWrappers = []any{
 		(*Position_StockPosition)(nil),
 		(*Position_FuturePosition)(nil),
 	}
-	file_provider_proto_msgTypes[36].OneofWrappers = []any{
+	file_provider_proto_msgTypes[42].OneofWrappers = []any{
 		(*PositionDetail_StockDetail)(nil),
 		(*PositionDetail_FutureDetail)(nil),
 	}
-	file_provider_proto_msgTypes[41].OneofWrappers = []any{
+	file_provider_proto_msgTypes[47].OneofWrappers = []any{
 		(*ProfitLoss_StockPnl)(nil),
 		(*ProfitLoss_FuturePnl)(nil),
 	}
-	file_provider_proto_msgTypes[46].OneofWrappers = []any{
+	file_provider_proto_msgTypes[52].OneofWrappers = []any{
 		(*ProfitDetail_StockDetail)(nil),
 		(*ProfitDetail_FutureDetail)(nil),
 	}
-	file_provider_proto_msgTypes[51].OneofWrappers = []any{
+	file_provider_proto_msgTypes[57].OneofWrappers = []any{
 		(*ProfitLossSummary_StockSummary)(nil),
 		(*ProfitLossSummary_FutureSummary)(nil),
 	}
+	file_provider_proto_msgTypes[126].OneofWrappers = []any{
+		(*OrderEvent_Order)(nil),
+		(*OrderEvent_Deal)(nil),
+	}
 	type x struct{}
 	out := protoimpl.TypeBuilder{
 		File: protoimpl.DescBuilder{
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_provider_proto_rawDesc), len(file_provider_proto_rawDesc)),
-			NumEnums:      23,
-			NumMessages:   99,
+			NumEnums:      24,
+			NumMessages:   129,
 			NumExtensions: 0,
 			NumServices:   1,
 		},
@@ -25,14 +25,18 @@ const (
 	ShioajiProvider_ListAccounts_FullMethodName           = "/v1.ShioajiProvider/ListAccounts"
 	ShioajiProvider_GetAccountBalance_FullMethodName      = "/v1.ShioajiProvider/GetAccountBalance"
 	ShioajiProvider_PlaceOrder_FullMethodName             = "/v1.ShioajiProvider/PlaceOrder"
+	ShioajiProvider_PlaceOrders_FullMethodName            = "/v1.ShioajiProvider/PlaceOrders"
 	ShioajiProvider_PlaceComboOrder_FullMethodName        = "/v1.ShioajiProvider/PlaceComboOrder"
 	ShioajiProvider_UpdateOrder_FullMethodName            = "/v1.ShioajiProvider/UpdateOrder"
 	ShioajiProvider_CancelOrder_FullMethodName            = "/v1.ShioajiProvider/CancelOrder"
+	ShioajiProvider_CancelOrders_FullMethodName           = "/v1.ShioajiProvider/CancelOrders"
 	ShioajiProvider_CancelComboOrder_FullMethodName       = "/v1.ShioajiProvider/CancelComboOrder"
 	ShioajiProvider_UpdateStatus_FullMethodName           = "/v1.ShioajiProvider/UpdateStatus"
 	ShioajiProvider_UpdateComboStatus_FullMethodName      = "/v1.ShioajiProvider/UpdateComboStatus"
 	ShioajiProvider_ListTrades_FullMethodName             = "/v1.ShioajiProvider/ListTrades"
 	ShioajiProvider_ListComboTrades_FullMethodName        = "/v1.ShioajiProvider/ListComboTrades"
+	ShioajiProvider_ListTradesDelta_FullMethodName        = "/v1.ShioajiProvider/ListTradesDelta"
+	ShioajiProvider_ListComboTradesDelta_FullMethodName   = "/v1.ShioajiProvider/ListComboTradesDelta"
 	ShioajiProvider_GetOrderDealRecords_FullMethodName    = "/v1.ShioajiProvider/GetOrderDealRecords"
 	ShioajiProvider_ListPositions_FullMethodName          = "/v1.ShioajiProvider/ListPositions"
 	ShioajiProvider_ListPositionDetail_FullMethodName     = "/v1.ShioajiProvider/ListPositionDetail"
@@ -51,6 +55,11 @@ const (
 	ShioajiProvider_GetSnapshots_FullMethodName           = "/v1.ShioajiProvider/GetSnapshots"
 	ShioajiProvider_GetTicks_FullMethodName               = "/v1.ShioajiProvider/GetTicks"
 	ShioajiProvider_GetKbars_FullMethodName               = "/v1.ShioajiProvider/GetKbars"
+	ShioajiProvider_GetKbarsBatch_FullMethodName          = "/v1.ShioajiProvider/GetKbarsBatch"
+	ShioajiProvider_StreamHistoricalTicks_FullMethodName  = "/v1.ShioajiProvider/StreamHistoricalTicks"
+	ShioajiProvider_StreamHistoricalKbars_FullMethodName  = "/v1.ShioajiProvider/StreamHistoricalKbars"
+	ShioajiProvider_GetTickBars_FullMethodName            = "/v1.ShioajiProvider/GetTickBars"
+	ShioajiProvider_GetTickAnalytics_FullMethodName       = "/v1.ShioajiProvider/GetTickAnalytics"
 	ShioajiProvider_GetDailyQuotes_FullMethodName         = "/v1.ShioajiProvider/GetDailyQuotes"
 	ShioajiProvider_CreditEnquires_FullMethodName         = "/v1.ShioajiProvider/CreditEnquires"
 	ShioajiProvider_GetShortStockSources_FullMethodName   = "/v1.ShioajiProvider/GetShortStockSources"
@@ -58,9 +67,15 @@ const (
 	ShioajiProvider_GetPunish_FullMethodName              = "/v1.ShioajiProvider/GetPunish"
 	ShioajiProvider_GetNotice_FullMethodName              = "/v1.ShioajiProvider/GetNotice"
 	ShioajiProvider_FetchContracts_FullMethodName         = "/v1.ShioajiProvider/FetchContracts"
+	ShioajiProvider_GetOptionChain_FullMethodName         = "/v1.ShioajiProvider/GetOptionChain"
+	ShioajiProvider_FindContracts_FullMethodName          = "/v1.ShioajiProvider/FindContracts"
+	ShioajiProvider_GetSingleflightStats_FullMethodName   = "/v1.ShioajiProvider/GetSingleflightStats"
 	ShioajiProvider_GetCAExpireTime_FullMethodName        = "/v1.ShioajiProvider/GetCAExpireTime"
 	ShioajiProvider_SubscribeTrade_FullMethodName         = "/v1.ShioajiProvider/SubscribeTrade"
 	ShioajiProvider_UnsubscribeTrade_FullMethodName       = "/v1.ShioajiProvider/UnsubscribeTrade"
+	ShioajiProvider_StreamTicks_FullMethodName            = "/v1.ShioajiProvider/StreamTicks"
+	ShioajiProvider_StreamBidAsk_FullMethodName           = "/v1.ShioajiProvider/StreamBidAsk"
+	ShioajiProvider_StreamOrderEvents_FullMethodName      = "/v1.ShioajiProvider/StreamOrderEvents"
 )
 
 // ShioajiProviderClient is the client API for ShioajiProvider service.
@@ -89,6 +104,10 @@ type ShioajiProviderClient interface {
 	// Place a new order for a single contract.
 	// 下單
 	PlaceOrder(ctx context.Context, in *PlaceOrderRequest, opts ...grpc.CallOption) (*Trade, error)
+	// Place a basket of orders concurrently. The whole basket is validated before
+	// anything is sent; results come back in request order.
+	// 批次下單
+	PlaceOrders(ctx context.Context, in *PlaceOrdersRequest, opts ...grpc.CallOption) (*PlaceOrdersResponse, error)
 	// Place a combination order (e.g., multiple legs for futures or options).
 	// 組合單下單
 	PlaceComboOrder(ctx context.Context, in *PlaceComboOrderRequest, opts ...grpc.CallOption) (*ComboTrade, error)
@@ -98,6 +117,10 @@ type ShioajiProviderClient interface {
 	// Cancel an existing active order.
 	// 撤銷委託單
 	CancelOrder(ctx context.Context, in *CancelOrderRequest, opts ...grpc.CallOption) (*Trade, error)
+	// Cancel every open order matching a filter, streaming one result per order
+	// as its cancel completes.
+	// 批次撤銷委託單
+	CancelOrders(ctx context.Context, in *CancelOrdersRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[CancelOrderResult], error)
 	// Cancel an active combination order.
 	// 撤銷組合單委託
 	CancelComboOrder(ctx context.Context, in *CancelComboOrderRequest, opts ...grpc.CallOption) (*ComboTrade, error)
@@ -113,6 +136,14 @@ type ShioajiProviderClient interface {
 	// List all combination trades for the current session.
 	// 組合單委託列表
 	ListComboTrades(ctx context.Context, in *Empty, opts ...grpc.CallOption) (*ListComboTradesResponse, error)
+	// List only the trades whose status changed since a version watermark.
+	// Pass since_version 0 for every trade; keep the returned version and epoch for the next call.
+	// A watermark from another epoch (e.g. before a provider restart) returns every trade.
+	// 委託列表 (增量)
+	ListTradesDelta(ctx context.Context, in *ListTradesDeltaRequest, opts ...grpc.CallOption) (*ListTradesResponse, error)
+	// List only the combination trades whose status changed since a version watermark.
+	// 組合單委託列表 (增量)
+	ListComboTradesDelta(ctx context.Context, in *ListTradesDeltaRequest, opts ...grpc.CallOption) (*ListComboTradesResponse, error)
 	// Retrieve deal records for orders associated with a specific account.
 	// 委託成交紀錄
 	GetOrderDealRecords(ctx context.Context, in *GetOrderDealRecordsRequest, opts ...grpc.CallOption) (*GetOrderDealRecordsResponse, error)
@@ -167,6 +198,23 @@ type ShioajiProviderClient interface {
 	// Get K-bar (candlestick) data for a contract within a date range.
 	// 獲取K線資料
 	GetKbars(ctx context.Context, in *GetKbarsRequest, opts ...grpc.CallOption) (*Kbars, error)
+	// Fetch K-bars of many contracts for one date range, streaming one result per
+	// contract as it completes; upstream calls are paced by the quote rate limit.
+	// 批次獲取K線資料
+	GetKbarsBatch(ctx context.Context, in *GetKbarsBatchRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[KbarsBatchResult], error)
+	// Stream the ticks of a contract and date as Ticks messages of at most
+	// chunk_size rows each, so a full day never has to fit in one message.
+	// 分批串流逐筆報價
+	StreamHistoricalTicks(ctx context.Context, in *StreamHistoricalTicksRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[Ticks], error)
+	// Stream the K-bars of a contract and date range in chunks of at most chunk_size bars.
+	// 分批串流K線資料
+	StreamHistoricalKbars(ctx context.Context, in *StreamHistoricalKbarsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[Kbars], error)
+	// Build time, volume or tick-count bars from the ticks of a contract and date.
+	// 逐筆資料聚合K線
+	GetTickBars(ctx context.Context, in *GetTickBarsRequest, opts ...grpc.CallOption) (*Kbars, error)
+	// Summarize the ticks of a contract and date: VWAP, buy/sell volume and volume at price.
+	// 逐筆資料統計
+	GetTickAnalytics(ctx context.Context, in *GetTickAnalyticsRequest, opts ...grpc.CallOption) (*TickAnalytics, error)
 	// Get daily trading quotes (summary) for all contracts on a specific date.
 	// 每日報價
 	GetDailyQuotes(ctx context.Context, in *GetDailyQuotesRequest, opts ...grpc.CallOption) (*DailyQuotes, error)
@@ -188,6 +236,15 @@ type ShioajiProviderClient interface {
 	// Manually fetch and update security contracts from the server.
 	// 下載商品檔
 	FetchContracts(ctx context.Context, in *FetchContractsRequest, opts ...grpc.CallOption) (*Empty, error)
+	// Get the option chain (calls and puts by delivery month and strike) of an underlying.
+	// 選擇權鏈
+	GetOptionChain(ctx context.Context, in *GetOptionChainRequest, opts ...grpc.CallOption) (*OptionChain, error)
+	// Find contracts by symbol, underlying code, category and/or delivery month.
+	// 商品查詢
+	FindContracts(ctx context.Context, in *FindContractsRequest, opts ...grpc.CallOption) (*FindContractsResponse, error)
+	// Get request coalescing counters for the read RPCs that opt into it.
+	// 請求合併統計
+	GetSingleflightStats(ctx context.Context, in *Empty, opts ...grpc.CallOption) (*SingleflightStats, error)
 	// Get the expiration timestamp of the currently activated CA.
 	// 憑證過期時間
 	GetCAExpireTime(ctx context.Context, in *GetCAExpireTimeRequest, opts ...grpc.CallOption) (*GetCAExpireTimeResponse, error)
@@ -197,6 +254,20 @@ type ShioajiProviderClient interface {
 	// Unsubscribe from trade updates for an account.
 	// 取消訂閱交易回報
 	UnsubscribeTrade(ctx context.Context, in *UnsubscribeTradeRequest, opts ...grpc.CallOption) (*UnsubscribeTradeResponse, error)
+	// Stream real-time ticks for a list of contracts.
+	// The stream is aborted with RESOURCE_EXHAUSTED if the client falls behind.
+	// 即時逐筆報價
+	StreamTicks(ctx context.Context, in *StreamTicksRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[Tick], error)
+	// Stream real-time bid/ask books for a list of contracts, conflated per code:
+	// each update carries only the newest book for a code since the previous one.
+	// 即時五檔報價
+	StreamBidAsk(ctx context.Context, in *StreamBidAskRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[BidAsk], error)
+	// Stream order and deal events pushed by the order callback, each with a
+	// monotonically increasing sequence number. Reconnecting clients resume
+	// with since_seq and epoch of the last event; OUT_OF_RANGE means the gap is
+	// gone or the provider restarted, and ListTrades is needed.
+	// 委託成交回報
+	StreamOrderEvents(ctx context.Context, in *StreamOrderEventsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[OrderEvent], error)
 }
 
 type shioajiProviderClient struct {
@@ -267,6 +338,16 @@ func (c *shioajiProviderClient) PlaceOrder(ctx context.Context, in *PlaceOrderRe
 	return out, nil
 }
 
+func (c *shioajiProviderClient) PlaceOrders(ctx context.Context, in *PlaceOrdersRequest, opts ...grpc.CallOption) (*PlaceOrdersResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(PlaceOrdersResponse)
+	err := c.cc.Invoke(ctx, ShioajiProvider_PlaceOrders_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 func (c *shioajiProviderClient) PlaceComboOrder(ctx context.Context, in *PlaceComboOrderRequest, opts ...grpc.CallOption) (*ComboTrade, error) {
 	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
 	out := new(ComboTrade)
@@ -297,6 +378,25 @@ func (c *shioajiProviderClient) CancelOrder(ctx context.Context, in *CancelOrder
 	return out, nil
 }
 
+func (c *shioajiProviderClient) CancelOrders(ctx context.Context, in *CancelOrdersRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[CancelOrderResult], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &ShioajiProvider_ServiceDesc.Streams[0], ShioajiProvider_CancelOrders_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[CancelOrdersRequest, CancelOrderResult]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ShioajiProvider_CancelOrdersClient = grpc.ServerStreamingClient[CancelOrderResult]
+
 func (c *shioajiProviderClient) CancelComboOrder(ctx context.Context, in *CancelComboOrderRequest, opts ...grpc.CallOption) (*ComboTrade, error) {
 	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
 	out := new(ComboTrade)
@@ -347,6 +447,26 @@ func (c *shioajiProviderClient) ListComboTrades(ctx context.Context, in *Empty,
 	return out, nil
 }
 
+func (c *shioajiProviderClient) ListTradesDelta(ctx context.Context, in *ListTradesDeltaRequest, opts ...grpc.CallOption) (*ListTradesResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(ListTradesResponse)
+	err := c.cc.Invoke(ctx, ShioajiProvider_ListTradesDelta_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *shioajiProviderClient) ListComboTradesDelta(ctx context.Context, in *ListTradesDeltaRequest, opts ...grpc.CallOption) (*ListComboTradesResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(ListComboTradesResponse)
+	err := c.cc.Invoke(ctx, ShioajiProvider_ListComboTradesDelta_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 func (c *shioajiProviderClient) GetOrderDealRecords(ctx context.Context, in *GetOrderDealRecordsRequest, opts ...grpc.CallOption) (*GetOrderDealRecordsResponse, error) {
 	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
 	out := new(GetOrderDealRecordsResponse)
@@ -527,6 +647,83 @@ func (c *shioajiProviderClient) GetKbars(ctx context.Context, in *GetKbarsReques
 	return out, nil
 }
 
+func (c *shioajiProviderClient) GetKbarsBatch(ctx context.Context, in *GetKbarsBatchRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[KbarsBatchResult], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &ShioajiProvider_ServiceDesc.Streams[1], ShioajiProvider_GetKbarsBatch_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[GetKbarsBatchRequest, KbarsBatchResult]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ShioajiProvider_GetKbarsBatchClient = grpc.ServerStreamingClient[KbarsBatchResult]
+
+func (c *shioajiProviderClient) StreamHistoricalTicks(ctx context.Context, in *StreamHistoricalTicksRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[Ticks], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &ShioajiProvider_ServiceDesc.Streams[2], ShioajiProvider_StreamHistoricalTicks_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[StreamHistoricalTicksRequest, Ticks]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ShioajiProvider_StreamHistoricalTicksClient = grpc.ServerStreamingClient[Ticks]
+
+func (c *shioajiProviderClient) StreamHistoricalKbars(ctx context.Context, in *StreamHistoricalKbarsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[Kbars], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &ShioajiProvider_ServiceDesc.Streams[3], ShioajiProvider_StreamHistoricalKbars_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[StreamHistoricalKbarsRequest, Kbars]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ShioajiProvider_StreamHistoricalKbarsClient = grpc.ServerStreamingClient[Kbars]
+
+func (c *shioajiProviderClient) GetTickBars(ctx context.Context, in *GetTickBarsRequest, opts ...grpc.CallOption) (*Kbars, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(Kbars)
+	err := c.cc.Invoke(ctx, ShioajiProvider_GetTickBars_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *shioajiProviderClient) GetTickAnalytics(ctx context.Context, in *GetTickAnalyticsRequest, opts ...grpc.CallOption) (*TickAnalytics, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(TickAnalytics)
+	err := c.cc.Invoke(ctx, ShioajiProvider_GetTickAnalytics_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 func (c *shioajiProviderClient) GetDailyQuotes(ctx context.Context, in *GetDailyQuotesRequest, opts ...grpc.CallOption) (*DailyQuotes, error) {
 	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
 	out := new(DailyQuotes)
@@ -597,6 +794,36 @@ func (c *shioajiProviderClient) FetchContracts(ctx context.Context, in *FetchCon
 	return out, nil
 }
 
+func (c *shioajiProviderClient) GetOptionChain(ctx context.Context, in *GetOptionChainRequest, opts ...grpc.CallOption) (*OptionChain, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(OptionChain)
+	err := c.cc.Invoke(ctx, ShioajiProvider_GetOptionChain_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *shioajiProviderClient) FindContracts(ctx context.Context, in *FindContractsRequest, opts ...grpc.CallOption) (*FindContractsResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(FindContractsResponse)
+	err := c.cc.Invoke(ctx, ShioajiProvider_FindContracts_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *shioajiProviderClient) GetSingleflightStats(ctx context.Context, in *Empty, opts ...grpc.CallOption) (*SingleflightStats, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(SingleflightStats)
+	err := c.cc.Invoke(ctx, ShioajiProvider_GetSingleflightStats_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 func (c *shioajiProviderClient) GetCAExpireTime(ctx context.Context, in *GetCAExpireTimeRequest, opts ...grpc.CallOption) (*GetCAExpireTimeResponse, error) {
 	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
 	out := new(GetCAExpireTimeResponse)
@@ -627,6 +854,63 @@ func (c *shioajiProviderClient) UnsubscribeTrade(ctx context.Context, in *Unsubs
 	return out, nil
 }
 
+func (c *shioajiProviderClient) StreamTicks(ctx context.Context, in *StreamTicksRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[Tick], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &ShioajiProvider_ServiceDesc.Streams[4], ShioajiProvider_StreamTicks_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[StreamTicksRequest, Tick]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ShioajiProvider_StreamTicksClient = grpc.ServerStreamingClient[Tick]
+
+func (c *shioajiProviderClient) StreamBidAsk(ctx context.Context, in *StreamBidAskRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[BidAsk], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &ShioajiProvider_ServiceDesc.Streams[5], ShioajiProvider_StreamBidAsk_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[StreamBidAskRequest, BidAsk]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ShioajiProvider_StreamBidAskClient = grpc.ServerStreamingClient[BidAsk]
+
+func (c *shioajiProviderClient) StreamOrderEvents(ctx context.Context, in *StreamOrderEventsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[OrderEvent], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &ShioajiProvider_ServiceDesc.Streams[6], ShioajiProvider_StreamOrderEvents_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[StreamOrderEventsRequest, OrderEvent]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ShioajiProvider_StreamOrderEventsClient = grpc.ServerStreamingClient[OrderEvent]
+
 // ShioajiProviderServer is the server API for ShioajiProvider service.
 // All implementations must embed UnimplementedShioajiProviderServer
 // for forward compatibility.
@@ -653,6 +937,10 @@ type ShioajiProviderServer interface {
 	// Place a new order for a single contract.
 	// 下單
 	PlaceOrder(context.Context, *PlaceOrderRequest) (*Trade, error)
+	// Place a basket of orders concurrently. The whole basket is validated before
+	// anything is sent; results come back in request order.
+	// 批次下單
+	PlaceOrders(context.Context, *PlaceOrdersRequest) (*PlaceOrdersResponse, error)
 	// Place a combination order (e.g., multiple legs for futures or options).
 	// 組合單下單
 	PlaceComboOrder(context.Context, *PlaceComboOrderRequest) (*ComboTrade, error)
@@ -662,6 +950,10 @@ type ShioajiProviderServer interface {
 	// Cancel an existing active order.
 	// 撤銷委託單
 	CancelOrder(context.Context, *CancelOrderRequest) (*Trade, error)
+	// Cancel every open order matching a filter, streaming one result per order
+	// as its cancel completes.
+	// 批次撤銷委託單
+	CancelOrders(*CancelOrdersRequest, grpc.ServerStreamingServer[CancelOrderResult]) error
 	// Cancel an active combination order.
 	// 撤銷組合單委託
 	CancelComboOrder(context.Context, *CancelComboOrderRequest) (*ComboTrade, error)
@@ -677,6 +969,14 @@ type ShioajiProviderServer interface {
 	// List all combination trades for the current session.
 	// 組合單委託列表
 	ListComboTrades(context.Context, *Empty) (*ListComboTradesResponse, error)
+	// List only the trades whose status changed since a version watermark.
+	// Pass since_version 0 for every trade; keep the returned version and epoch for the next call.
+	// A watermark from another epoch (e.g. before a provider restart) returns every trade.
+	// 委託列表 (增量)
+	ListTradesDelta(context.Context, *ListTradesDeltaRequest) (*ListTradesResponse, error)
+	// List only the combination trades whose status changed since a version watermark.
+	// 組合單委託列表 (增量)
+	ListComboTradesDelta(context.Context, *ListTradesDeltaRequest) (*ListComboTradesResponse, error)
 	// Retrieve deal records for orders associated with a specific account.
 	// 委託成交紀錄
 	GetOrderDealRecords(context.Context, *GetOrderDealRecordsRequest) (*GetOrderDealRecordsResponse, error)
@@ -731,6 +1031,23 @@ type ShioajiProviderServer interface {
 	// Get K-bar (candlestick) data for a contract within a date range.
 	// 獲取K線資料
 	GetKbars(context.Context, *GetKbarsRequest) (*Kbars, error)
+	// Fetch K-bars of many contracts for one date range, streaming one result per
+	// contract as it completes; upstream calls are paced by the quote rate limit.
+	// 批次獲取K線資料
+	GetKbarsBatch(*GetKbarsBatchRequest, grpc.ServerStreamingServer[KbarsBatchResult]) error
+	// Stream the ticks of a contract and date as Ticks messages of at most
+	// chunk_size rows each, so a full day never has to fit in one message.
+	// 分批串流逐筆報價
+	StreamHistoricalTicks(*StreamHistoricalTicksRequest, grpc.ServerStreamingServer[Ticks]) error
+	// Stream the K-bars of a contract and date range in chunks of at most chunk_size bars.
+	// 分批串流K線資料
+	StreamHistoricalKbars(*StreamHistoricalKbarsRequest, grpc.ServerStreamingServer[Kbars]) error
+	// Build time, volume or tick-count bars from the ticks of a contract and date.
+	// 逐筆資料聚合K線
+	GetTickBars(context.Context, *GetTickBarsRequest) (*Kbars, error)
+	// Summarize the ticks of a contract and date: VWAP, buy/sell volume and volume at price.
+	// 逐筆資料統計
+	GetTickAnalytics(context.Context, *GetTickAnalyticsRequest) (*TickAnalytics, error)
 	// Get daily trading quotes (summary) for all contracts on a specific date.
 	// 每日報價
 	GetDailyQuotes(context.Context, *GetDailyQuotesRequest) (*DailyQuotes, error)
@@ -752,6 +1069,15 @@ type ShioajiProviderServer interface {
 	// Manually fetch and update security contracts from the server.
 	// 下載商品檔
 	FetchContracts(context.Context, *FetchContractsRequest) (*Empty, error)
+	// Get the option chain (calls and puts by delivery month and strike) of an underlying.
+	// 選擇權鏈
+	GetOptionChain(context.Context, *GetOptionChainRequest) (*OptionChain, error)
+	// Find contracts by symbol, underlying code, category and/or delivery month.
+	// 商品查詢
+	FindContracts(context.Context, *FindContractsRequest) (*FindContractsResponse, error)
+	// Get request coalescing counters for the read RPCs that opt into it.
+	// 請求合併統計
+	GetSingleflightStats(context.Context, *Empty) (*SingleflightStats, error)
 	// Get the expiration timestamp of the currently activated CA.
 	// 憑證過期時間
 	GetCAExpireTime(context.Context, *GetCAExpireTimeRequest) (*GetCAExpireTimeResponse, error)
@@ -761,6 +1087,20 @@ type ShioajiProviderServer interface {
 	// Unsubscribe from trade updates for an account.
 	// 取消訂閱交易回報
 	UnsubscribeTrade(context.Context, *UnsubscribeTradeRequest) (*UnsubscribeTradeResponse, error)
+	// Stream real-time ticks for a list of contracts.
+	// The stream is aborted with RESOURCE_EXHAUSTED if the client falls behind.
+	// 即時逐筆報價
+	StreamTicks(*StreamTicksRequest, grpc.ServerStreamingServer[Tick]) error
+	// Stream real-time bid/ask books for a list of contracts, conflated per code:
+	// each update carries only the newest book for a code since the previous one.
+	// 即時五檔報價
+	StreamBidAsk(*StreamBidAskRequest, grpc.ServerStreamingServer[BidAsk]) error
+	// Stream order and deal events pushed by the order callback, each with a
+	// monotonically increasing sequence number. Reconnecting clients resume
+	// with since_seq and epoch of the last event; OUT_OF_RANGE means the gap is
+	// gone or the provider restarted, and ListTrades is needed.
+	// 委託成交回報
+	StreamOrderEvents(*StreamOrderEventsRequest, grpc.ServerStreamingServer[OrderEvent]) error
 	mustEmbedUnimplementedShioajiProviderServer()
 }
 
@@ -789,6 +1129,9 @@ func (UnimplementedShioajiProviderServer) GetAccountBalance(context.Context, *Em
 func (UnimplementedShioajiProviderServer) PlaceOrder(context.Context, *PlaceOrderRequest) (*Trade, error) {
 	return nil, status.Error(codes.Unimplemented, "method PlaceOrder not implemented")
 }
+func (UnimplementedShioajiProviderServer) PlaceOrders(context.Context, *PlaceOrdersRequest) (*PlaceOrdersResponse, error) {
+	return nil, status.Error(codes.Unimplemented, "method PlaceOrders not implemented")
+}
 func (UnimplementedShioajiProviderServer) PlaceComboOrder(context.Context, *PlaceComboOrderRequest) (*ComboTrade, error) {
 	return nil, status.Error(codes.Unimplemented, "method PlaceComboOrder not implemented")
 }
@@ -798,6 +1141,9 @@ func (UnimplementedShioajiProviderServer) UpdateOrder(context.Context, *UpdateOr
 func (UnimplementedShioajiProviderServer) CancelOrder(context.Context, *CancelOrderRequest) (*Trade, error) {
 	return nil, status.Error(codes.Unimplemented, "method CancelOrder not implemented")
 }
+func (UnimplementedShioajiProviderServer) CancelOrders(*CancelOrdersRequest, grpc.ServerStreamingServer[CancelOrderResult]) error {
+	return status.Error(codes.Unimplemented, "method CancelOrders not implemented")
+}
 func (UnimplementedShioajiProviderServer) CancelComboOrder(context.Context, *CancelComboOrderRequest) (*ComboTrade, error) {
 	return nil, status.Error(codes.Unimplemented, "method CancelComboOrder not implemented")
 }
@@ -813,6 +1159,12 @@ func (UnimplementedShioajiProviderServer) ListTrades(context.Context, *Empty) (*
 func (UnimplementedShioajiProviderServer) ListComboTrades(context.Context, *Empty) (*ListComboTradesResponse, error) {
 	return nil, status.Error(codes.Unimplemented, "method ListComboTrades not implemented")
 }
+func (UnimplementedShioajiProviderServer) ListTradesDelta(context.Context, *ListTradesDeltaRequest) (*ListTradesResponse, error) {
+	return nil, status.Error(codes.Unimplemented, "method ListTradesDelta not implemented")
+}
+func (UnimplementedShioajiProviderServer) ListComboTradesDelta(context.Context, *ListTradesDeltaRequest) (*ListComboTradesResponse, error) {
+	return nil, status.Error(codes.Unimplemented, "method ListComboTradesDelta not implemented")
+}
 func (UnimplementedShioajiProviderServer) GetOrderDealRecords(context.Context, *GetOrderDealRecordsRequest) (*GetOrderDealRecordsResponse, error) {
 	return nil, status.Error(codes.Unimplemented, "method GetOrderDealRecords not implemented")
 }
@@ -867,6 +1219,21 @@ func (UnimplementedShioajiProviderServer) GetTicks(context.Context, *GetTicksReq
 func (UnimplementedShioajiProviderServer) GetKbars(context.Context, *GetKbarsRequest) (*Kbars, error) {
 	return nil, status.Error(codes.Unimplemented, "method GetKbars not implemented")
 }
+func (UnimplementedShioajiProviderServer) GetKbarsBatch(*GetKbarsBatchRequest, grpc.ServerStreamingServer[KbarsBatchResult]) error {
+	return status.Error(codes.Unimplemented, "method GetKbarsBatch not implemented")
+}
+func (UnimplementedShioajiProviderServer) StreamHistoricalTicks(*StreamHistoricalTicksRequest, grpc.ServerStreamingServer[Ticks]) error {
+	return status.Error(codes.Unimplemented, "method StreamHistoricalTicks not implemented")
+}
+func (UnimplementedShioajiProviderServer) StreamHistoricalKbars(*StreamHistoricalKbarsRequest, grpc.ServerStreamingServer[Kbars]) error {
+	return status.Error(codes.Unimplemented, "method StreamHistoricalKbars not implemented")
+}
+func (UnimplementedShioajiProviderServer) GetTickBars(context.Context, *GetTickBarsRequest) (*Kbars, error) {
+	return nil, status.Error(codes.Unimplemented, "method GetTickBars not implemented")
+}
+func (UnimplementedShioajiProviderServer) GetTickAnalytics(context.Context, *GetTickAnalyticsRequest) (*TickAnalytics, error) {
+	return nil, status.Error(codes.Unimplemented, "method GetTickAnalytics not implemented")
+}
 func (UnimplementedShioajiProviderServer) GetDailyQuotes(context.Context, *GetDailyQuotesRequest) (*DailyQuotes, error) {
 	return nil, status.Error(codes.Unimplemented, "method GetDailyQuotes not implemented")
 }
@@ -888,6 +1255,15 @@ func (UnimplementedShioajiProviderServer) GetNotice(context.Context, *Empty) (*N
 func (UnimplementedShioajiProviderServer) FetchContracts(context.Context, *FetchContractsRequest) (*Empty, error) {
 	return nil, status.Error(codes.Unimplemented, "method FetchContracts not implemented")
 }
+func (UnimplementedShioajiProviderServer) GetOptionChain(context.Context, *GetOptionChainRequest) (*OptionChain, error) {
+	return nil, status.Error(codes.Unimplemented, "method GetOptionChain not implemented")
+}
+func (UnimplementedShioajiProviderServer) FindContracts(context.Context, *FindContractsRequest) (*FindContractsResponse, error) {
+	return nil, status.Error(codes.Unimplemented, "method FindContracts not implemented")
+}
+func (UnimplementedShioajiProviderServer) GetSingleflightStats(context.Context, *Empty) (*SingleflightStats, error) {
+	return nil, status.Error(codes.Unimplemented, "method GetSingleflightStats not implemented")
+}
 func (UnimplementedShioajiProviderServer) GetCAExpireTime(context.Context, *GetCAExpireTimeRequest) (*GetCAExpireTimeResponse, error) {
 	return nil, status.Error(codes.Unimplemented, "method GetCAExpireTime not implemented")
 }
@@ -897,6 +1273,15 @@ func (UnimplementedShioajiProviderServer) SubscribeTrade(context.Context, *Subsc
 func (UnimplementedShioajiProviderServer) UnsubscribeTrade(context.Context, *UnsubscribeTradeRequest) (*UnsubscribeTradeResponse, error) {
 	return nil, status.Error(codes.Unimplemented, "method UnsubscribeTrade not implemented")
 }
+func (UnimplementedShioajiProviderServer) StreamTicks(*StreamTicksRequest, grpc.ServerStreamingServer[Tick]) error {
+	return status.Error(codes.Unimplemented, "method StreamTicks not implemented")
+}
+func (UnimplementedShioajiProviderServer) StreamBidAsk(*StreamBidAskRequest, grpc.ServerStreamingServer[BidAsk]) error {
+	return status.Error(codes.Unimplemented, "method StreamBidAsk not implemented")
+}
+func (UnimplementedShioajiProviderServer) StreamOrderEvents(*StreamOrderEventsRequest, grpc.ServerStreamingServer[OrderEvent]) error {
+	return status.Error(codes.Unimplemented, "method StreamOrderEvents not implemented")
+}
 func (UnimplementedShioajiProviderServer) mustEmbedUnimplementedShioajiProviderServer() {}
 func (UnimplementedShioajiProviderServer) testEmbeddedByValue()                         {}
 
@@ -1026,6 +1411,24 @@ func _ShioajiProvider_PlaceOrder_Handler(srv interface{}, ctx context.Context, d
 	return interceptor(ctx, in, info, handler)
 }
 
+func _ShioajiProvider_PlaceOrders_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(PlaceOrdersRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(ShioajiProviderServer).PlaceOrders(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: ShioajiProvider_PlaceOrders_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(ShioajiProviderServer).PlaceOrders(ctx, req.(*PlaceOrdersRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 func _ShioajiProvider_PlaceComboOrder_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(PlaceComboOrderRequest)
 	if err := dec(in); err != nil {
@@ -1080,6 +1483,17 @@ func _ShioajiProvider_CancelOrder_Handler(srv interface{}, ctx context.Context,
 	return interceptor(ctx, in, info, handler)
 }
 
+func _ShioajiProvider_CancelOrders_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(CancelOrdersRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(ShioajiProviderServer).CancelOrders(m, &grpc.GenericServerStream[CancelOrdersRequest, CancelOrderResult]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ShioajiProvider_CancelOrdersServer = grpc.ServerStreamingServer[CancelOrderResult]
+
 func _ShioajiProvider_CancelComboOrder_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(CancelComboOrderRequest)
 	if err := dec(in); err != nil {
@@ -1170,6 +1584,42 @@ func _ShioajiProvider_ListComboTrades_Handler(srv interface{}, ctx context.Conte
 	return interceptor(ctx, in, info, handler)
 }
 
+func _ShioajiProvider_ListTradesDelta_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(ListTradesDeltaRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(ShioajiProviderServer).ListTradesDelta(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: ShioajiProvider_ListTradesDelta_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(ShioajiProviderServer).ListTradesDelta(ctx, req.(*ListTradesDeltaRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _ShioajiProvider_ListComboTradesDelta_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(ListTradesDeltaRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(ShioajiProviderServer).ListComboTradesDelta(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: ShioajiProvider_ListComboTradesDelta_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(ShioajiProviderServer).ListComboTradesDelta(ctx, req.(*ListTradesDeltaRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 func _ShioajiProvider_GetOrderDealRecords_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(GetOrderDealRecordsRequest)
 	if err := dec(in); err != nil {
@@ -1494,6 +1944,75 @@ func _ShioajiProvider_GetKbars_Handler(srv interface{}, ctx context.Context, dec
 	return interceptor(ctx, in, info, handler)
 }
 
+func _ShioajiProvider_GetKbarsBatch_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(GetKbarsBatchRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(ShioajiProviderServer).GetKbarsBatch(m, &grpc.GenericServerStream[GetKbarsBatchRequest, KbarsBatchResult]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ShioajiProvider_GetKbarsBatchServer = grpc.ServerStreamingServer[KbarsBatchResult]
+
+func _ShioajiProvider_StreamHistoricalTicks_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(StreamHistoricalTicksRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(ShioajiProviderServer).StreamHistoricalTicks(m, &grpc.GenericServerStream[StreamHistoricalTicksRequest, Ticks]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ShioajiProvider_StreamHistoricalTicksServer = grpc.ServerStreamingServer[Ticks]
+
+func _ShioajiProvider_StreamHistoricalKbars_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(StreamHistoricalKbarsRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(ShioajiProviderServer).StreamHistoricalKbars(m, &grpc.GenericServerStream[StreamHistoricalKbarsRequest, Kbars]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ShioajiProvider_StreamHistoricalKbarsServer = grpc.ServerStreamingServer[Kbars]
+
+func _ShioajiProvider_GetTickBars_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(GetTickBarsRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(ShioajiProviderServer).GetTickBars(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: ShioajiProvider_GetTickBars_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(ShioajiProviderServer).GetTickBars(ctx, req.(*GetTickBarsRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _ShioajiProvider_GetTickAnalytics_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(GetTickAnalyticsRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(ShioajiProviderServer).GetTickAnalytics(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: ShioajiProvider_GetTickAnalytics_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(ShioajiProviderServer).GetTickAnalytics(ctx, req.(*GetTickAnalyticsRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 func _ShioajiProvider_GetDailyQuotes_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(GetDailyQuotesRequest)
 	if err := dec(in); err != nil {
@@ -1620,6 +2139,60 @@ func _ShioajiProvider_FetchContracts_Handler(srv interface{}, ctx context.Contex
 	return interceptor(ctx, in, info, handler)
 }
 
+func _ShioajiProvider_GetOptionChain_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(GetOptionChainRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(ShioajiProviderServer).GetOptionChain(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: ShioajiProvider_GetOptionChain_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(ShioajiProviderServer).GetOptionChain(ctx, req.(*GetOptionChainRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _ShioajiProvider_FindContracts_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(FindContractsRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(ShioajiProviderServer).FindContracts(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: ShioajiProvider_FindContracts_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(ShioajiProviderServer).FindContracts(ctx, req.(*FindContractsRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _ShioajiProvider_GetSingleflightStats_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(Empty)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(ShioajiProviderServer).GetSingleflightStats(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: ShioajiProvider_GetSingleflightStats_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(ShioajiProviderServer).GetSingleflightStats(ctx, req.(*Empty))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 func _ShioajiProvider_GetCAExpireTime_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(GetCAExpireTimeRequest)
 	if err := dec(in); err != nil {
@@ -1674,6 +2247,39 @@ func _ShioajiProvider_UnsubscribeTrade_Handler(srv interface{}, ctx context.Cont
 	return interceptor(ctx, in, info, handler)
 }
 
+func _ShioajiProvider_StreamTicks_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(StreamTicksRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(ShioajiProviderServer).StreamTicks(m, &grpc.GenericServerStream[StreamTicksRequest, Tick]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ShioajiProvider_StreamTicksServer = grpc.ServerStreamingServer[Tick]
+
+func _ShioajiProvider_StreamBidAsk_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(StreamBidAskRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(ShioajiProviderServer).StreamBidAsk(m, &grpc.GenericServerStream[StreamBidAskRequest, BidAsk]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ShioajiProvider_StreamBidAskServer = grpc.ServerStreamingServer[BidAsk]
+
+func _ShioajiProvider_StreamOrderEvents_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(StreamOrderEventsRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(ShioajiProviderServer).StreamOrderEvents(m, &grpc.GenericServerStream[StreamOrderEventsRequest, OrderEvent]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ShioajiProvider_StreamOrderEventsServer = grpc.ServerStreamingServer[OrderEvent]
+
 // ShioajiProvider_ServiceDesc is the grpc.ServiceDesc for ShioajiProvider service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -1705,6 +2311,10 @@ var ShioajiProvider_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "PlaceOrder",
 			Handler:    _ShioajiProvider_PlaceOrder_Handler,
 		},
+		{
+			MethodName: "PlaceOrders",
+			Handler:    _ShioajiProvider_PlaceOrders_Handler,
+		},
 		{
 			MethodName: "PlaceComboOrder",
 			Handler:    _ShioajiProvider_PlaceComboOrder_Handler,
@@ -1737,6 +2347,14 @@ var ShioajiProvider_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "ListComboTrades",
 			Handler:    _ShioajiProvider_ListComboTrades_Handler,
 		},
+		{
+			MethodName: "ListTradesDelta",
+			Handler:    _ShioajiProvider_ListTradesDelta_Handler,
+		},
+		{
+			MethodName: "ListComboTradesDelta",
+			Handler:    _ShioajiProvider_ListComboTradesDelta_Handler,
+		},
 		{
 			MethodName: "GetOrderDealRecords",
 			Handler:    _ShioajiProvider_GetOrderDealRecords_Handler,
@@ -1809,6 +2427,14 @@ var ShioajiProvider_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "GetKbars",
 			Handler:    _ShioajiProvider_GetKbars_Handler,
 		},
+		{
+			MethodName: "GetTickBars",
+			Handler:    _ShioajiProvider_GetTickBars_Handler,
+		},
+		{
+			MethodName: "GetTickAnalytics",
+			Handler:    _ShioajiProvider_GetTickAnalytics_Handler,
+		},
 		{
 			MethodName: "GetDailyQuotes",
 			Handler:    _ShioajiProvider_GetDailyQuotes_Handler,
@@ -1837,6 +2463,18 @@ var ShioajiProvider_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "FetchContracts",
 			Handler:    _ShioajiProvider_FetchContracts_Handler,
 		},
+		{
+			MethodName: "GetOptionChain",
+			Handler:    _ShioajiProvider_GetOptionChain_Handler,
+		},
+		{
+			MethodName: "FindContracts",
+			Handler:    _ShioajiProvider_FindContracts_Handler,
+		},
+		{
+			MethodName: "GetSingleflightStats",
+			Handler:    _ShioajiProvider_GetSingleflightStats_Handler,
+		},
 		{
 			MethodName: "GetCAExpireTime",
 			Handler:    _ShioajiProvider_GetCAExpireTime_Handler,
@@ -1850,6 +2488,42 @@ var ShioajiProvider_ServiceDesc = grpc.ServiceDesc{
 			Handler:    _ShioajiProvider_UnsubscribeTrade_Handler,
 		},
 	},
-	Streams:  []grpc.StreamDesc{},
+	Streams: []grpc.StreamDesc{
+		{
+			StreamName:    "CancelOrders",
+			Handler:       _ShioajiProvider_CancelOrders_Handler,
+			ServerStreams: true,
+		},
+		{
+			StreamName:    "GetKbarsBatch",
+			Handler:       _ShioajiProvider_GetKbarsBatch_Handler,
+			ServerStreams: true,
+		},
+		{
+			StreamName:    "StreamHistoricalTicks",
+			Handler:       _ShioajiProvider_StreamHistoricalTicks_Handler,
+			ServerStreams: true,
+		},
+		{
+			StreamName:    "StreamHistoricalKbars",
+			Handler:       _ShioajiProvider_StreamHistoricalKbars_Handler,
+			ServerStreams: true,
+		},
+		{
+			StreamName:    "StreamTicks",
+			Handler:       _ShioajiProvider_StreamTicks_Handler,
+			ServerStreams: true,
+		},
+		{
+			StreamName:    "StreamBidAsk",
+			Handler:       _ShioajiProvider_StreamBidAsk_Handler,
+			ServerStreams: true,
+		},
+		{
+			StreamName:    "StreamOrderEvents",
+			Handler:       _ShioajiProvider_StreamOrderEvents_Handler,
+			ServerStreams: true,
+		},
+	},
 	Metadata: "provider.proto",
 }
@@ -0,0 +1,54 @@
+"""
+provider.src.analytics -.
+"""
+
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+
+# Shioaji tick_type values.
+TICK_BUY = 1  # Traded at the ask (外盤).
+TICK_SELL = 2  # Traded at the bid (內盤).
+
+
+def tick_summary(ticks: Any, start_ts: int = 0, end_ts: int = 0) -> SimpleNamespace:
+    """
+    VWAP, OHLC, buy/sell volume split and volume at each price of the ticks
+    with start_ts <= ts <= end_ts (0 leaves a side open). levels holds one
+    (price, volume, buy_volume, sell_volume, ticks) row per traded price,
+    by ascending price.
+    """
+    ts = np.asarray(ticks.ts, dtype=np.int64)
+    lo = np.searchsorted(ts, start_ts, side="left") if start_ts else 0
+    hi = np.searchsorted(ts, end_ts, side="right") if end_ts else ts.size
+    close = np.asarray(ticks.close[lo:hi], dtype=np.float64)
+    volume = np.asarray(ticks.volume[lo:hi], dtype=np.int64)
+    side = np.asarray(ticks.tick_type[lo:hi], dtype=np.int64)
+    if close.size == 0:
+        return SimpleNamespace(ticks=0, volume=0, levels=[])
+    buy = np.where(side == TICK_BUY, volume, 0)
+    sell = np.where(side == TICK_SELL, volume, 0)
+    total = int(volume.sum())
+    prices, level = np.unique(close, return_inverse=True)
+    levels = zip(
+        prices.tolist(),
+        np.bincount(level, weights=volume).astype(np.int64).tolist(),
+        np.bincount(level, weights=buy).astype(np.int64).tolist(),
+        np.bincount(level, weights=sell).astype(np.int64).tolist(),
+        np.bincount(level).tolist(),
+    )
+    return SimpleNamespace(
+        ticks=int(close.size),
+        volume=total,
+        vwap=float((close * volume).sum() / total) if total else 0.0,
+        open=float(close[0]),
+        high=float(close.max()),
+        low=float(close.min()),
+        close=float(close[-1]),
+        buy_volume=int(buy.sum()),
+        sell_volume=int(sell.sum()),
+        first_ts=int(ts[lo]),
+        last_ts=int(ts[hi - 1]),
+        levels=list(levels),
+    )
@@ -0,0 +1,170 @@
+"""
+provider.src.batch -.
+"""
+
+import threading
+import time
+from concurrent import futures
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+
+def submit_bounded(
+    executor: futures.Executor,
+    func: Callable[[Any], Any],
+    items: Sequence[Any],
+    limit: int,
+) -> List[futures.Future]:
+    """
+    Run func over items on an executor with at most limit calls in flight.
+    Returns one future per item, in the order of items; the next item is
+    submitted as soon as any running call finishes.
+    """
+    results: List[futures.Future] = [futures.Future() for _ in items]
+    pending: Iterator[Tuple[int, Any]] = iter(enumerate(items))
+    lock = threading.Lock()
+
+    def launch():
+        with lock:
+            index, item = next(pending, (-1, None))
+        if index < 0:
+            return
+        inner = executor.submit(func, item)
+        inner.add_done_callback(lambda done: finish(index, done))
+
+    def finish(index: int, done: futures.Future):
+        error = done.exception()
+        if error is None:
+            results[index].set_result(done.result())
+        else:
+            results[index].set_exception(error)
+        launch()
+
+    for _ in range(min(max(limit, 1), len(items))):
+        launch()
+    return results
+
+
+class _Batch(NamedTuple):
+    """Lookups collected during one window."""
+
+    items: Dict[str, Any]
+    waiters: List[Tuple[List[str], futures.Future]]
+    deadlines: List[Optional[float]]
+
+
+class MicroBatcher:
+    """
+    MicroBatcher -.
+    Merges keyed lookups arriving within a short window into as few upstream
+    calls as possible. The first caller of a batch flushes it at once when
+    no fetch is in flight; otherwise it waits out the window, so callers
+    arriving during a fetch share the next one. A flush fetches the union
+    of every caller's items, deduplicated and split into chunks of at most
+    chunk_size that are fetched in parallel. Each caller gets back the
+    results for its own keys, in its own order, or TimeoutError once its
+    own deadline passes.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        fetch: Callable[[List[Any], Optional[float]], Iterable[Any]],
+        key: Callable[[Any], str],
+        window: float,
+        chunk_size: int,
+        workers: int,
+    ):
+        self.window = window
+        self.chunk_size = chunk_size
+        self._fetch = fetch
+        self._key = key
+        self._lock = threading.Lock()
+        self._pending: Optional[_Batch] = None
+        self._flushing = 0
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="micro-batch"
+        )
+
+    def get(self, items: Sequence[Any], deadline: Optional[float] = None) -> List[Any]:
+        """Fetch results for items, sharing upstream calls with concurrent callers."""
+        keys = [self._key(item) for item in items]
+        waiter: futures.Future = futures.Future()
+        with self._lock:
+            batch = self._pending
+            leader = batch is None
+            delay = self.window if self._flushing else 0.0
+            if batch is None:
+                batch = self._pending = _Batch({}, [], [])
+            for k, item in zip(keys, items):
+                batch.items.setdefault(k, item)
+            batch.waiters.append((keys, waiter))
+            batch.deadlines.append(deadline)
+        if leader:
+            if delay:
+                time.sleep(delay)
+            with self._lock:
+                self._pending = None
+                self._flushing += 1
+            try:
+                self._flush(batch)
+            except Exception as e:
+                # Fail every caller still waiting, or they would block forever.
+                for _, pending in batch.waiters:
+                    if not pending.done():
+                        pending.set_exception(e)
+            finally:
+                with self._lock:
+                    self._flushing -= 1
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+        return waiter.result(timeout)
+
+    def close(self):
+        """Stop the fetch workers once in-flight chunks are done."""
+        self._executor.shutdown(wait=True)
+
+    def _flush(self, batch: _Batch):
+        """
+        Fetch a closed batch and hand each caller its results. The fetch
+        runs until the latest deadline, as each caller enforces its own.
+        """
+        deadlines = [d for d in batch.deadlines if d is not None]
+        deadline = max(deadlines) if len(deadlines) == len(batch.deadlines) else None
+        found, failed = self._fetch_chunks(list(batch.items.values()), deadline)
+        for keys, waiter in batch.waiters:
+            errors = [failed[k] for k in keys if k in failed]
+            if errors:
+                waiter.set_exception(errors[0])
+            else:
+                waiter.set_result([found[k] for k in keys if k in found])
+
+    def _fetch_chunks(
+        self, items: List[Any], deadline: Optional[float]
+    ) -> Tuple[Dict[str, Any], Dict[str, BaseException]]:
+        """Fetch items in parallel chunks; results and errors by key."""
+        chunks = [
+            items[i : i + self.chunk_size]
+            for i in range(0, len(items), self.chunk_size)
+        ]
+        pending = [self._executor.submit(self._fetch, c, deadline) for c in chunks]
+        found: Dict[str, Any] = {}
+        failed: Dict[str, BaseException] = {}
+        for chunk, future in zip(chunks, pending):
+            error = future.exception()
+            if error is not None:
+                failed.update((self._key(item), error) for item in chunk)
+                continue
+            for result in future.result():
+                found[self._key(result)] = result
+        return found, failed
@@ -0,0 +1,261 @@
+"""
+provider.src.cache -.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from concurrent import futures
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class TTLCache:
+    """
+    TTLCache -.
+    Response cache with a time-to-live per method name. Methods without a
+    TTL are passed straight through. invalidate() drops a method's entries
+    and bumps its generation, so a load that was already in flight when
+    the data changed is returned to its caller but never stored.
+    """
+
+    def __init__(self, ttls: Dict[str, float]):
+        self.ttls = ttls
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, Hashable], Tuple[float, Any]] = {}
+        self._generations: Dict[str, int] = {}
+
+    def call(self, method: str, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Return the cached value for (method, key), loading it when stale."""
+        if not self.ttls.get(method):
+            return load()
+        hit, value, generation = self._lookup(method, key)
+        if hit:
+            return value
+        value = load()
+        self._store(method, key, generation, value)
+        return value
+
+    async def acall(
+        self, method: str, key: Hashable, load: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """call() for a coroutine load, awaited on the event loop."""
+        if not self.ttls.get(method):
+            return await load()
+        hit, value, generation = self._lookup(method, key)
+        if hit:
+            return value
+        value = await load()
+        self._store(method, key, generation, value)
+        return value
+
+    def invalidate(self, *methods: str):
+        """Drop every entry of the given methods."""
+        with self._lock:
+            for method in methods:
+                self._generations[method] = self._generations.get(method, 0) + 1
+            self._entries = {
+                k: v for k, v in self._entries.items() if k[0] not in methods
+            }
+
+    def _lookup(self, method: str, key: Hashable) -> Tuple[bool, Any, int]:
+        """(hit, value, generation) of a fresh entry."""
+        with self._lock:
+            entry = self._entries.get((method, key))
+            if entry is not None and entry[0] > time.monotonic():
+                return True, entry[1], 0
+            return False, None, self._generations.get(method, 0)
+
+    def _store(self, method: str, key: Hashable, generation: int, value: Any):
+        """Store a loaded value unless the method was invalidated meanwhile."""
+        with self._lock:
+            if self._generations.get(method, 0) == generation:
+                self._entries[(method, key)] = (
+                    time.monotonic() + self.ttls[method],
+                    value,
+                )
+
+
+def cached(method: Callable) -> Callable:
+    """
+    Decorate a unary servicer method of an object with a response_cache so
+    identical requests within the method's TTL share one response. The
+    wrapper's aio_layer does the same for a coroutine handler.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, request, context):
+        return self.response_cache.call(
+            method.__name__,
+            request.SerializeToString(deterministic=True),
+            lambda: method(self, request, context),
+        )
+
+    setattr(wrapper, "aio_layer", _aio_cached)
+    return wrapper
+
+
+def _aio_cached(service: Any, name: str, handler: Callable) -> Callable:
+    """Coroutine form of cached around an async handler(request, context)."""
+
+    async def wrapper(request, context):
+        return await service.response_cache.acall(
+            name,
+            request.SerializeToString(deterministic=True),
+            lambda: handler(request, context),
+        )
+
+    return wrapper
+
+
+class SharedAbort(Exception):
+    """An abort raised by a coalesced call, replayed on every caller's context."""
+
+    def __init__(self, code: Any, details: str):
+        super().__init__(details)
+        self.code = code
+        self.details = details
+
+
+class _RecordingContext:
+    """Servicer context proxy whose abort() raises SharedAbort instead."""
+
+    def __init__(self, context: Any):
+        self._context = context
+        self._aborted: Optional[SharedAbort] = None
+
+    def abort(self, code: Any, details: str):
+        """Raise the first abort so it can be shared with the other callers."""
+        if self._aborted is None:
+            self._aborted = SharedAbort(code, details)
+        raise self._aborted
+
+    def time_remaining(self) -> Any:
+        """Time left before the leading caller's deadline."""
+        return self._context.time_remaining()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._context, name)
+
+
+class _AsyncRecordingContext(_RecordingContext):
+    """grpc.aio servicer context proxy whose abort() raises SharedAbort instead."""
+
+    # pylint: disable=invalid-overridden-method
+
+    async def abort(self, code: Any, details: str):  # type: ignore[override]
+        """Raise the first abort so it can be shared with the other callers."""
+        if self._aborted is None:
+            self._aborted = SharedAbort(code, details)
+        raise self._aborted
+
+
+class SingleFlight:
+    """
+    SingleFlight -.
+    Coalesces identical concurrent calls: the first caller for a key runs
+    the load and every caller arriving while it is in flight waits for and
+    shares its result or exception. Counts calls and shared calls per
+    method for hit-ratio reporting.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: Dict[Tuple[str, Hashable], futures.Future] = {}
+        self._stats: Dict[str, List[int]] = {}
+
+    def call(self, method: str, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Run load, or join the identical call already in flight."""
+        flight, leader = self._join(method, key)
+        if not leader:
+            return flight.result()
+        try:
+            value = load()
+            flight.set_result(value)
+            return value
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        finally:
+            self._land(method, key)
+
+    async def acall(
+        self, method: str, key: Hashable, load: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """call() for a coroutine load; waiting callers do not hold a thread."""
+        flight, leader = self._join(method, key)
+        if not leader:
+            # A cancelled waiter must not cancel the shared flight.
+            return await asyncio.shield(asyncio.wrap_future(flight))
+        try:
+            value = await load()
+            flight.set_result(value)
+            return value
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        finally:
+            self._land(method, key)
+
+    def stats(self) -> Dict[str, Tuple[int, int]]:
+        """(calls, shared) per method."""
+        with self._lock:
+            return {method: (s[0], s[1]) for method, s in self._stats.items()}
+
+    def _join(self, method: str, key: Hashable) -> Tuple[futures.Future, bool]:
+        """The flight for a key and whether the caller leads it."""
+        with self._lock:
+            stats = self._stats.setdefault(method, [0, 0])
+            stats[0] += 1
+            flight = self._flights.get((method, key))
+            if flight is not None:
+                stats[1] += 1
+                return flight, False
+            flight = self._flights[(method, key)] = futures.Future()
+            return flight, True
+
+    def _land(self, method: str, key: Hashable):
+        """Forget a finished flight."""
+        with self._lock:
+            del self._flights[(method, key)]
+
+
+def coalesced(method: Callable) -> Callable:
+    """
+    Decorate a unary servicer method of an object with a singleflight so
+    identical concurrent requests share one upstream call. Aborts are
+    replayed on every waiting caller's context. The wrapper's aio_layer does
+    the same for a coroutine handler.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, request, context):
+        try:
+            return self.singleflight.call(
+                method.__name__,
+                request.SerializeToString(deterministic=True),
+                lambda: method(self, request, _RecordingContext(context)),
+            )
+        except SharedAbort as e:
+            context.abort(e.code, e.details)
+            raise
+
+    setattr(wrapper, "aio_layer", _aio_coalesced)
+    return wrapper
+
+
+def _aio_coalesced(service: Any, name: str, handler: Callable) -> Callable:
+    """Coroutine form of coalesced around an async handler(request, context)."""
+
+    async def wrapper(request, context):
+        try:
+            return await service.singleflight.acall(
+                name,
+                request.SerializeToString(deterministic=True),
+                lambda: handler(request, _AsyncRecordingContext(context)),
+            )
+        except SharedAbort as e:
+            await context.abort(e.code, e.details)
+            raise
+
+    return wrapper
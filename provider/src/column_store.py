@@ -0,0 +1,141 @@
+"""
+provider.src.column_store -.
+"""
+
+import os
+import struct
+import tempfile
+import zlib
+from array import array
+from types import SimpleNamespace
+from typing import Any, Collection, Dict, Optional, Sequence, Tuple
+
+MAGIC = b"PHXCOLS1"
+# magic, row count, column count
+_HEADER = struct.Struct("<8sQH")
+# column name, array typecode, offset from the end of the index, compressed length
+_ENTRY = struct.Struct("<16scQQ")
+
+# Columns of shioaji Ticks.
+TICK_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("ts", "q"),
+    ("close", "d"),
+    ("volume", "q"),
+    ("bid_price", "d"),
+    ("bid_volume", "q"),
+    ("ask_price", "d"),
+    ("ask_volume", "q"),
+    ("tick_type", "b"),
+)
+
+# Columns of shioaji Kbars.
+KBAR_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("ts", "q"),
+    ("Open", "d"),
+    ("High", "d"),
+    ("Low", "d"),
+    ("Close", "d"),
+    ("Volume", "q"),
+    ("Amount", "d"),
+)
+
+
+class ColumnStore:
+    """
+    ColumnStore -.
+    On-disk store of column-oriented market data keyed by (code, date), one
+    file per key under root/<code>/<date><suffix>. A file is a header, an
+    index of its columns (name, array typecode, offset, length) and one
+    zlib-compressed block per column, so get() only inflates the columns it
+    is asked for. Files are written atomically and never modified, which suits
+    data for completed trading days.
+    """
+
+    def __init__(
+        self, root: str, columns: Sequence[Tuple[str, str]], suffix: str = ".cols"
+    ):
+        self.root = root
+        self.columns = tuple(columns)
+        self.suffix = suffix
+
+    def path(self, code: str, date: str) -> str:
+        """File holding the columns of (code, date)."""
+        if os.sep in code or os.sep in date or code.startswith("."):
+            raise ValueError(f"invalid store key: {code!r}, {date!r}")
+        return os.path.join(self.root, code, f"{date}{self.suffix}")
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return os.path.exists(self.path(*key))
+
+    def get(
+        self, code: str, date: str, names: Optional[Collection[str]] = None
+    ) -> Optional[SimpleNamespace]:
+        """
+        Columns of (code, date) as arrays by name, only those in names if
+        given; None if not stored or unreadable.
+        """
+        path = self.path(code, date)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            data = f.read()
+        try:
+            columns = _decode(data, names)
+        except (struct.error, zlib.error, ValueError):
+            return None
+        return SimpleNamespace(**columns) if columns is not None else None
+
+    def put(self, code: str, date: str, source: Any) -> int:
+        """Store the column attributes of an object; returns the bytes written."""
+        blocks = [
+            zlib.compress(array(typecode, getattr(source, name)).tobytes())
+            for name, typecode in self.columns
+        ]
+        rows = len(getattr(source, self.columns[0][0]))
+        index = b""
+        offset = 0
+        for (name, typecode), block in zip(self.columns, blocks):
+            index += _ENTRY.pack(name.encode(), typecode.encode(), offset, len(block))
+            offset += len(block)
+        path = self.path(code, date)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f".{date}-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(MAGIC, rows, len(self.columns)) + index)
+                for block in blocks:
+                    f.write(block)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+        return _HEADER.size + len(index) + offset
+
+
+def _decode(
+    data: bytes, names: Optional[Collection[str]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Columns of a store file by name, only those in names if given; None if
+    it is not a complete store file.
+    """
+    magic, rows, count = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        return None
+    base = _HEADER.size + count * _ENTRY.size
+    columns: Dict[str, Any] = {}
+    for i in range(count):
+        name, typecode, offset, length = _ENTRY.unpack_from(
+            data, _HEADER.size + i * _ENTRY.size
+        )
+        if base + offset + length > len(data):
+            return None
+        column = name.rstrip(b"\0").decode()
+        if names is not None and column not in names:
+            continue
+        values = array(typecode.decode())
+        values.frombytes(zlib.decompress(data[base + offset : base + offset + length]))
+        if len(values) != rows:
+            return None
+        columns[column] = values
+    return columns
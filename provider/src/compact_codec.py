@@ -0,0 +1,65 @@
+"""
+provider.src.compact_codec -.
+"""
+
+from functools import reduce
+from itertools import chain
+from math import gcd
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import provider_pb2
+
+# Finest decimal grid tried for prices.
+MAX_DECIMALS = 6
+
+
+def delta_encode(values: Sequence[int]) -> List[int]:
+    """Each value minus the previous one (the first minus 0)."""
+    return [b - a for a, b in zip(chain((0,), values), values)]
+
+
+def price_grid(*columns: Sequence[float]) -> Optional[Tuple[int, int, int]]:
+    """
+    The coarsest grid (decimals, base, unit) on which every price lies, as
+    price = (base + n * unit) / 10^decimals for an integer n; None if the
+    prices need more than MAX_DECIMALS decimals.
+    """
+    prices = [p for column in columns for p in column]
+    for decimals in range(MAX_DECIMALS + 1):
+        scale = 10**decimals
+        if all(abs(p * scale - round(p * scale)) < 1e-6 for p in prices):
+            break
+    else:
+        return None
+    scaled = [round(p * scale) for p in prices]
+    base = scaled[0] if scaled else 0
+    unit = reduce(gcd, (s - base for s in scaled), 0) or 1
+    return decimals, base, unit
+
+
+def encode(ts: Sequence[int], prices: Mapping[str, Sequence[float]]) -> Dict[str, Any]:
+    """
+    Compact message fields for a timestamp column and named price columns:
+    ts_delta in multiples of ts_unit, price_grid and <name>_delta holding
+    the deltas of each price's grid step count. Prices that fit no grid are
+    kept as-is under their own name.
+    """
+    ts_delta = delta_encode(ts)
+    ts_unit = reduce(gcd, ts_delta, 0) or 1
+    fields: Dict[str, Any] = {
+        "ts_delta": [d // ts_unit for d in ts_delta],
+        "ts_unit": ts_unit,
+    }
+    grid = price_grid(*prices.values())
+    if grid is None:
+        fields.update(prices)
+        return fields
+    decimals, base, unit = grid
+    scale = 10**decimals
+    fields["price_grid"] = provider_pb2.PriceGrid(
+        decimals=decimals, base=base, unit=unit
+    )
+    for name, column in prices.items():
+        steps = [(round(p * scale) - base) // unit for p in column]
+        fields[f"{name}_delta"] = delta_encode(steps)
+    return fields
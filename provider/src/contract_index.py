@@ -0,0 +1,265 @@
+"""
+provider.src.contract_index -.
+"""
+
+import bisect
+import threading
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from shioaji.constant import OptionRight
+from shioaji.contracts import FetchStatus
+
+# Product groups in lookup priority order; the first group wins a code clash.
+PRODUCT_GROUPS = ("Stocks", "Futures", "Options", "Indexs")
+
+
+class _Chain(NamedTuple):
+    """Strikes of one underlying and delivery month, ascending."""
+
+    strikes: Tuple[float, ...]
+    calls: Tuple[Any, ...]
+    puts: Tuple[Any, ...]
+
+
+class _Tables(NamedTuple):
+    """Immutable snapshot of every index, swapped in as one reference."""
+
+    source: Any
+    complete: bool
+    codes: Dict[str, Any]
+    symbols: Dict[str, Any]
+    underlying: Dict[str, Tuple[Any, ...]]
+    category: Dict[str, Tuple[Any, ...]]
+    delivery_month: Dict[str, Tuple[Any, ...]]
+    chains: Dict[str, Dict[str, _Chain]]
+    converted: Dict[Tuple[Any, str], Any]
+
+
+_EMPTY = _Tables(None, False, {}, {}, {}, {}, {}, {}, {})
+
+
+class ContractIndex:
+    """
+    ContractIndex -.
+    Flat code -> contract index over every Shioaji product group, with
+    secondary indexes by symbol, underlying code, category and delivery
+    month, and an option chain per underlying and delivery month. find()
+    answers a filter on those fields from the smallest matching secondary
+    list instead of scanning every contract. Contracts are converted
+    by the given convert function on first use, chain rows included, and
+    memoized until the next rebuild, so a rebuild only groups contracts.
+    Each rebuild constructs a new set of tables and publishes them with a
+    single assignment, so readers never see a half-built index and never
+    take a lock.
+    """
+
+    def __init__(self, convert: Optional[Callable[[Any], Any]] = None):
+        self._convert = convert
+        self._lock = threading.Lock()
+        self._tables = _EMPTY
+
+    def __len__(self) -> int:
+        return len(self._tables.codes)
+
+    @property
+    def complete(self) -> bool:
+        """Whether the last rebuild saw a fully fetched contract set."""
+        return self._tables.complete
+
+    def rebuild(self, contracts: Any) -> int:
+        """Index a Shioaji Contracts object and swap it in; returns its size."""
+        with self._lock:
+            self._tables = self._build(contracts)
+            return len(self._tables.codes)
+
+    def sync(self, contracts: Any) -> bool:
+        """
+        Rebuild if contracts were refetched or were still loading last time.
+        A complete index is never replaced by a set that is still loading.
+        """
+        tables = self._tables
+        if tables.source is contracts and tables.complete:
+            return False
+        if tables.complete and not self._is_complete(contracts):
+            return False
+        self.rebuild(contracts)
+        return True
+
+    def get(self, code: str) -> Optional[Any]:
+        """Contract by code."""
+        return self._tables.codes.get(code)
+
+    def by_symbol(self, symbol: str) -> Optional[Any]:
+        """Contract by symbol (e.g. TSE2330, TXFR1)."""
+        return self._tables.symbols.get(symbol)
+
+    def find(
+        self,
+        symbol: str = "",
+        underlying_code: str = "",
+        category: str = "",
+        delivery_month: str = "",
+    ) -> List[Any]:
+        """
+        Contracts matching every non-empty filter, in index order. At least
+        one filter is required.
+        """
+        tables = self._tables
+        filters = [
+            (field, value, table)
+            for field, value, table in (
+                ("underlying_code", underlying_code, tables.underlying),
+                ("category", category, tables.category),
+                ("delivery_month", delivery_month, tables.delivery_month),
+            )
+            if value
+        ]
+        if symbol:
+            contract = tables.symbols.get(symbol)
+            candidates: Tuple[Any, ...] = (contract,) if contract else ()
+        elif filters:
+            candidates = min(
+                (table.get(value, ()) for _, value, table in filters), key=len
+            )
+        else:
+            raise ValueError("At least one contract filter is required")
+        return [
+            contract
+            for contract in candidates
+            if all(getattr(contract, field) == value for field, value, _ in filters)
+        ]
+
+    def to_pb(self, contract: Any) -> Any:
+        """Converted form of a contract, memoized until the next rebuild."""
+        if self._convert is None or contract is None:
+            return contract
+        converted = self._tables.converted
+        key = (contract.security_type, contract.code)
+        message = converted.get(key)
+        if message is None:
+            message = converted[key] = self._convert(contract)
+        return message
+
+    def option_chain(
+        self,
+        underlying: str,
+        delivery_month: str = "",
+        strike_min: float = 0.0,
+        strike_max: float = 0.0,
+        center_strike: float = 0.0,
+        num_strikes: int = 0,
+    ) -> List[Tuple[str, float, Any, Any]]:
+        """
+        (delivery_month, strike, call, put) rows for an underlying, by month
+        then strike. Strikes are bounded by [strike_min, strike_max] and/or
+        num_strikes on each side of center_strike; zero means unbounded.
+        """
+        months = self._tables.chains.get(underlying, {})
+        if delivery_month:
+            chain = months.get(delivery_month)
+            months = {delivery_month: chain} if chain else {}
+        rows = []
+        for month in sorted(months):
+            chain = months[month]
+            lo = bisect.bisect_left(chain.strikes, strike_min) if strike_min else 0
+            hi = (
+                bisect.bisect_right(chain.strikes, strike_max)
+                if strike_max
+                else len(chain.strikes)
+            )
+            if num_strikes > 0:
+                around = _around(chain.strikes, center_strike, num_strikes)
+                lo = max(lo, around[0])
+                hi = min(hi, around[1])
+            for i in range(lo, hi):
+                rows.append(
+                    (
+                        month,
+                        chain.strikes[i],
+                        self.to_pb(chain.calls[i]),
+                        self.to_pb(chain.puts[i]),
+                    )
+                )
+        return rows
+
+    @staticmethod
+    def _is_complete(contracts: Any) -> bool:
+        """Whether a Contracts object has finished fetching."""
+        return getattr(contracts, "status", None) == FetchStatus.Fetched
+
+    @staticmethod
+    def _build(contracts: Any) -> _Tables:
+        """Build fresh tables from a Shioaji Contracts object."""
+        codes: Dict[str, Any] = {}
+        symbols: Dict[str, Any] = {}
+        underlying: Dict[str, List[Any]] = {}
+        category: Dict[str, List[Any]] = {}
+        delivery_month: Dict[str, List[Any]] = {}
+        options: List[Any] = []
+        for group in PRODUCT_GROUPS:
+            product = getattr(contracts, group, None)
+            if product is None:
+                continue
+            for multi in product:
+                for contract in multi:
+                    if contract.code in codes:
+                        continue
+                    codes[contract.code] = contract
+                    symbols.setdefault(contract.symbol, contract)
+                    for table, key in (
+                        (underlying, contract.underlying_code),
+                        (category, contract.category),
+                        (delivery_month, contract.delivery_month),
+                    ):
+                        if key:
+                            table.setdefault(key, []).append(contract)
+                    if group == "Options":
+                        options.append(contract)
+        return _Tables(
+            source=contracts,
+            complete=ContractIndex._is_complete(contracts),
+            codes=codes,
+            symbols=symbols,
+            underlying={k: tuple(v) for k, v in underlying.items()},
+            category={k: tuple(v) for k, v in category.items()},
+            delivery_month={k: tuple(v) for k, v in delivery_month.items()},
+            chains=ContractIndex._build_chains(options),
+            converted={},
+        )
+
+    @staticmethod
+    def _build_chains(options: List[Any]) -> Dict[str, Dict[str, _Chain]]:
+        """
+        Group options into per-month strike ladders, keyed by option category
+        (e.g. TXO) and also by underlying code where the option has one.
+        """
+        legs: Dict[Tuple[str, str], Dict[float, List[Any]]] = {}
+        aliases: Dict[str, str] = {}
+        for contract in options:
+            pair = legs.setdefault(
+                (contract.category, contract.delivery_month), {}
+            ).setdefault(float(contract.strike_price), [None, None])
+            pair[0 if contract.option_right == OptionRight.Call else 1] = contract
+            if contract.underlying_code:
+                aliases.setdefault(contract.underlying_code, contract.category)
+        chains: Dict[str, Dict[str, _Chain]] = {}
+        for (name, month), ladder in legs.items():
+            strikes = sorted(ladder)
+            chains.setdefault(name, {})[month] = _Chain(
+                strikes=tuple(strikes),
+                calls=tuple(ladder[k][0] for k in strikes),
+                puts=tuple(ladder[k][1] for k in strikes),
+            )
+        for code, name in aliases.items():
+            chains.setdefault(code, chains[name])
+        return chains
+
+
+def _around(strikes: Tuple[float, ...], center: float, count: int) -> Tuple[int, int]:
+    """
+    Index range of count strikes below and count strikes above center, plus
+    center itself when it is a listed strike.
+    """
+    mid = bisect.bisect_left(strikes, center)
+    listed = mid < len(strikes) and strikes[mid] == center
+    return mid - count, mid + count + listed
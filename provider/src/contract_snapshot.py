@@ -0,0 +1,92 @@
+"""
+provider.src.contract_snapshot -.
+"""
+
+import json
+import os
+import struct
+import tempfile
+import time
+import zlib
+from types import SimpleNamespace
+from typing import Any, Optional
+
+import shioaji
+from contract_index import PRODUCT_GROUPS
+from shioaji.contracts import Contract, FetchStatus, Future, Index, Option, Stock
+
+MAGIC = b"PHXCONTR"
+FORMAT_VERSION = 2
+# magic, format version, created (ns since epoch), length of the Shioaji version
+_HEADER = struct.Struct("<8sHqH")
+# The header and the UTF-8 Shioaji version are followed by a zlib-compressed
+# UTF-8 JSON object: {"fields": [name, ...], "<group>": [[value, ...], ...]}.
+# Each row holds one contract's fields, in "fields" order, as plain strings
+# and numbers (enums by value). Loading rebuilds every row through its
+# group's shioaji model, so a snapshot is data only and is validated.
+_FIELDS = tuple(Contract.model_fields)
+_MODELS = {"Stocks": Stock, "Futures": Future, "Options": Option, "Indexs": Index}
+
+
+def save(path: str, contracts: Any) -> int:
+    """Write a snapshot of a fetched Contracts object; returns the contract count."""
+    payload: dict = {"fields": _FIELDS}
+    for group in PRODUCT_GROUPS:
+        product = getattr(contracts, group, None)
+        payload[group] = [
+            [getattr(c, field) for field in _FIELDS]
+            for multi in product or ()
+            for c in multi
+        ]
+    body = zlib.compress(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+    )
+    version = shioaji.__version__.encode()
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, time.time_ns(), len(version))
+    fd, tmp = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), prefix=".contracts-"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header + version)
+            f.write(body)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+    return sum(len(payload[group]) for group in PRODUCT_GROUPS)
+
+
+def load(path: str) -> Optional[SimpleNamespace]:
+    """
+    Read a snapshot; None if it is missing or written by another version.
+    The result is shaped like shioaji Contracts closely enough for
+    ContractIndex: one attribute per product group holding a single group.
+    The snapshot names the contracts orders are placed against, so it must
+    live where only the provider writes.
+    """
+    if not os.path.exists(path) or os.path.getsize(path) < _HEADER.size:
+        return None
+    with open(path, "rb") as f:
+        magic, version, created_ns, length = _HEADER.unpack(f.read(_HEADER.size))
+        if (
+            magic != MAGIC
+            or version != FORMAT_VERSION
+            or f.read(length) != shioaji.__version__.encode()
+        ):
+            return None
+        payload = json.loads(zlib.decompress(f.read()))
+    fields = payload["fields"]
+    return SimpleNamespace(
+        status=FetchStatus.Fetched,
+        created_ns=created_ns,
+        **{
+            group: (
+                tuple(
+                    _MODELS[group].model_validate(dict(zip(fields, row)))
+                    for row in payload.get(group, ())
+                ),
+            )
+            for group in PRODUCT_GROUPS
+        },
+    )
@@ -0,0 +1,162 @@
+"""
+provider.src.kbar_cache -.
+"""
+
+from bisect import bisect_left, bisect_right
+from concurrent import futures
+from datetime import date, datetime, time, timedelta, timezone
+from itertools import chain
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from column_store import KBAR_COLUMNS, ColumnStore
+from log import logger
+
+TAIPEI = timezone(timedelta(hours=8))
+_EPOCH = date(1970, 1, 1)
+_DAY_NS = 86_400 * 10**9
+_HOUR_NS = 3_600 * 10**9
+# The TAIFEX night session opens at 15:00 and its last bar ends at 05:00 on
+# the next calendar day; its bars belong to the next trading day.
+_NIGHT_SESSION_START = time(15, 0)
+_NIGHT_START_NS = _NIGHT_SESSION_START.hour * _HOUR_NS
+_NIGHT_END_NS = 5 * _HOUR_NS
+
+
+def is_settled(day: date) -> bool:
+    """
+    Whether every bar of a trading day is final: its day session is over and
+    the night session that opens next belongs to the following trading day.
+    """
+    settled_at = datetime.combine(day, _NIGHT_SESSION_START, TAIPEI)
+    return datetime.now(TAIPEI) >= settled_at
+
+
+def trading_days(ts: Sequence[int]) -> List[int]:
+    """
+    Trading day of each bar of sorted kbar timestamps, in days since the
+    epoch, as Shioaji files them: a day session bar belongs to its own date
+    and a night session bar (ending from 15:00 to 05:00) to the next day
+    session in ts, or failing that the first weekday after its session opened.
+    """
+    days = [0] * len(ts)
+    following = None
+    for i in range(len(ts) - 1, -1, -1):
+        day, clock = divmod(ts[i], _DAY_NS)
+        if _NIGHT_END_NS < clock < _NIGHT_START_NS:
+            following = day
+        elif following is None:
+            opened = _EPOCH + timedelta(
+                days=day if clock >= _NIGHT_START_NS else day - 1
+            )
+            days[i] = (_next_weekday(opened) - _EPOCH).days
+            continue
+        days[i] = following
+    return days
+
+
+def slice_bars(bars: Any, start_ts: int = 0, end_ts: int = 0) -> SimpleNamespace:
+    """Bars with start_ts <= ts <= end_ts (0 leaves a side open), by binary search."""
+    lo = bisect_left(bars.ts, start_ts) if start_ts else 0
+    hi = bisect_right(bars.ts, end_ts) if end_ts else len(bars.ts)
+    return _take(bars, lo, hi)
+
+
+class KbarCache:
+    """
+    KbarCache -.
+    1-minute kbars cached per (code, trading day) in a ColumnStore. A range
+    query reads the days it has and fetches each run of consecutive missing
+    days with one upstream call, runs in parallel, then assembles the days in
+    order. Only settled days with bars are stored, so today's bars are
+    always fetched, and so is a day that came back empty: it may be a
+    holiday, but it may as well be an upstream gap that must not stick.
+    Days are trading days as in api.kbars(start, end): a night session is
+    filed under the trading day that follows it, so a run is fetched for
+    exactly its own days and split with trading_days().
+    """
+
+    def __init__(
+        self,
+        store: Optional[ColumnStore],
+        fetch: Callable[[Any, str, str, Optional[float]], Any],
+        executor: futures.Executor,
+    ):
+        self.store = store
+        self._fetch = fetch
+        self._executor = executor
+
+    def get(
+        self, contract: Any, start: date, end: date, deadline: Optional[float] = None
+    ) -> SimpleNamespace:
+        """Kbars of a contract from start to end (inclusive trading days)."""
+        days = [start + timedelta(days=n) for n in range((end - start).days + 1)]
+        parts = self.cached_days(contract.code, days)
+        pending = [
+            self._executor.submit(self._fetch_run, contract, run, deadline)
+            for run in _runs([day for day in days if day not in parts])
+        ]
+        for future in pending:
+            parts.update(future.result())
+        return SimpleNamespace(
+            **{
+                name: list(chain.from_iterable(getattr(parts[d], name) for d in days))
+                for name, _ in KBAR_COLUMNS
+            }
+        )
+
+    def cached_days(self, code: str, days: List[date]) -> Dict[date, Any]:
+        """The stored kbars of those days the cache already holds."""
+        parts: Dict[date, Any] = {}
+        if self.store is not None:
+            for day in days:
+                part = self.store.get(code, day.isoformat())
+                if part is not None:
+                    parts[day] = part
+        return parts
+
+    def _fetch_run(
+        self, contract: Any, run: List[date], deadline: Optional[float]
+    ) -> Dict[date, SimpleNamespace]:
+        """Fetch consecutive days with one upstream call and store the settled ones."""
+        kbars = self._fetch(contract, run[0].isoformat(), run[-1].isoformat(), deadline)
+        days = trading_days(kbars.ts)
+        parts = {}
+        for day in run:
+            number = (day - _EPOCH).days
+            part = _take(kbars, bisect_left(days, number), bisect_right(days, number))
+            parts[day] = part
+            if self.store is not None and part.ts and is_settled(day):
+                try:
+                    self.store.put(contract.code, day.isoformat(), part)
+                except OSError as e:
+                    logger.warning(
+                        "Could not store kbars of %s %s: %s", contract.code, day, e
+                    )
+        return parts
+
+
+def _take(bars: Any, lo: int, hi: int) -> SimpleNamespace:
+    """Rows lo to hi (exclusive) of every kbar column."""
+    return SimpleNamespace(
+        **{name: getattr(bars, name)[lo:hi] for name, _ in KBAR_COLUMNS}
+    )
+
+
+def _next_weekday(day: date) -> date:
+    """The first Monday to Friday after a day."""
+    day += timedelta(days=1)
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    return day
+
+
+def _runs(days: List[date]) -> List[List[date]]:
+    """Split sorted days into runs of consecutive days."""
+    runs: List[List[date]] = []
+    for day in days:
+        if runs and runs[-1][-1] + timedelta(days=1) == day:
+            runs[-1].append(day)
+        else:
+            runs.append([day])
+    return runs
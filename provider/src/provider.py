@@ -2,17 +2,38 @@
 provider.src.server -.
 """
 
+import asyncio
 import os
 import signal
+import threading
+import time
 from concurrent import futures
-from datetime import datetime
-from typing import Any, Optional, cast
+from datetime import date as dt_date
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, cast
 
+import compact_codec
+import contract_snapshot
 import grpc
+import resample
+from analytics import tick_summary
+from batch import MicroBatcher, submit_bounded
+from cache import SingleFlight, TTLCache, cached, coalesced
+from column_store import KBAR_COLUMNS, TICK_COLUMNS, ColumnStore
+from contract_index import ContractIndex
+from kbar_cache import TAIPEI, KbarCache, slice_bars
 from log import logger
+from ratelimit import (
+    RateLimiter,
+    RateLimitExceeded,
+    TokenBucket,
+    deadline_of,
+    rate_limited,
+)
 from shioaji import constant as sj_constant
 from shioaji.account import Account
-from shioaji.contracts import ComboBase, ComboContract, Contract
+from shioaji.contracts import ComboBase, ComboContract, Contract, FetchStatus
 from shioaji.order import (
     ComboOrder,
     ComboTrade,
@@ -34,6 +55,14 @@ from shioaji.position import (
     StockProfitLossSummary,
 )
 from shioaji_client import ShioajiClient
+from streaming import (
+    Broadcaster,
+    ConflatedSubscription,
+    EventLog,
+    ReplayGapError,
+    Subscription,
+)
+from trade_index import TradeIndex
 
 try:
     import provider_pb2
@@ -50,6 +79,8 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
     ShioajiService -.
     """
 
+    # pylint: disable=too-many-instance-attributes
+
     _SECURITY_TYPE_MAP = {
         sj_constant.SecurityType.Index: provider_pb2.SECURITY_TYPE_IND,
         sj_constant.SecurityType.Stock: provider_pb2.SECURITY_TYPE_STK,
@@ -145,9 +176,183 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
         sj_constant.TradeType.DayTrade: provider_pb2.TRADE_TYPE_DAYTRADE,
     }
 
+    # Real-time tick v1 callbacks use integer codes rather than enums.
+    _TICK_V1_TYPE_MAP = {
+        0: provider_pb2.TICK_TYPE_NO,
+        1: provider_pb2.TICK_TYPE_BUY,
+        2: provider_pb2.TICK_TYPE_SELL,
+    }
+
+    _CHANGE_V1_TYPE_MAP = {
+        1: provider_pb2.CHANGE_TYPE_LIMITUP,
+        2: provider_pb2.CHANGE_TYPE_UP,
+        3: provider_pb2.CHANGE_TYPE_UNCHANGED,
+        4: provider_pb2.CHANGE_TYPE_DOWN,
+        5: provider_pb2.CHANGE_TYPE_LIMITDOWN,
+    }
+
+    _ORDER_STATE_MAP = {
+        sj_constant.OrderState.StockDeal: provider_pb2.ORDER_STATE_STOCKDEAL,
+        sj_constant.OrderState.StockOrder: provider_pb2.ORDER_STATE_STOCKORDER,
+        sj_constant.OrderState.FuturesOrder: provider_pb2.ORDER_STATE_FUTURESORDER,
+        sj_constant.OrderState.FuturesDeal: provider_pb2.ORDER_STATE_FUTURESDEAL,
+    }
+
+    _EPOCH = datetime(1970, 1, 1)
+
+    # Default per-stream buffer and how often idle streams re-check liveness.
+    STREAM_QUEUE_SIZE = 4096
+    STREAM_POLL_INTERVAL = 1.0
+    # GetSnapshots requests arriving within this window share upstream calls
+    # of at most SNAPSHOT_CHUNK_SIZE contracts.
+    SNAPSHOT_BATCH_MS = 3
+    SNAPSHOT_CHUNK_SIZE = 500
+    SNAPSHOT_WORKERS = 4
+
+    _TICK_BAR_TYPES = {
+        provider_pb2.TICK_BAR_TYPE_TIME: resample.TIME,
+        provider_pb2.TICK_BAR_TYPE_VOLUME: resample.VOLUME,
+        provider_pb2.TICK_BAR_TYPE_TICKS: resample.TICKS,
+    }
+
+    # Workers fetching historical data (kbar day runs) in parallel.
+    HISTORY_WORKERS = 4
+    # Contracts of one GetKbarsBatch fetched at the same time; upstream calls
+    # are further paced by the quote rate limit.
+    KBARS_BATCH_PARALLELISM = 8
+    # Default rows per message of the historical streaming RPCs.
+    HISTORY_CHUNK_SIZE = 10000
+
+    # Statuses in which an order can still be cancelled.
+    _OPEN_STATUSES = frozenset(
+        {
+            provider_pb2.STATUS_PENDINGSUBMIT,
+            provider_pb2.STATUS_PRESUBMITTED,
+            provider_pb2.STATUS_SUBMITTED,
+            provider_pb2.STATUS_PARTFILLED,
+        }
+    )
+
+    # Seconds an account query response is reused, and which cached methods
+    # an order or a deal callback makes stale.
+    ACCOUNT_CACHE_TTLS = {
+        "ListPositions": 2.0,
+        "GetAccountBalance": 5.0,
+        "GetMargin": 2.0,
+        "GetTradingLimits": 2.0,
+        "GetSettlements": 10.0,
+    }
+    _ORDER_INVALIDATES = ("GetMargin", "GetTradingLimits")
+    _DEAL_INVALIDATES = tuple(ACCOUNT_CACHE_TTLS)
+
+    # Order events retained for replay to reconnecting streams.
+    ORDER_EVENT_CAPACITY = 10000
+    # How long a background reconcile waits for the contract download.
+    CONTRACTS_RECONCILE_TIMEOUT = 300.0
+    # Default cap on orders of one batch submitted at the same time.
+    ORDER_PARALLELISM = 8
+    # Default token buckets ("rate/burst" per second) per call class, set so
+    # burst + 10s (orders) or 5s (others) of refill stays within Shioaji's
+    # 250/10s order, 25/5s account and 50/5s quote query limits.
+    RATE_LIMITS = {"orders": "20/50", "account": "4/5", "quote": "8/10"}
+
     def __init__(self):
         self.client = ShioajiClient(simulation=True)
         self.logged_in = False
+        self.tick_hub = Broadcaster(
+            on_first=lambda code: self._quote_subscribe(
+                code, sj_constant.QuoteType.Tick
+            ),
+            on_last=lambda code: self._quote_unsubscribe(
+                code, sj_constant.QuoteType.Tick
+            ),
+        )
+        self.bidask_hub = Broadcaster(
+            on_first=lambda code: self._quote_subscribe(
+                code, sj_constant.QuoteType.BidAsk
+            ),
+            on_last=lambda code: self._quote_unsubscribe(
+                code, sj_constant.QuoteType.BidAsk
+            ),
+        )
+        self.client.on_tick_stk_v1()(self._on_tick)
+        self.client.on_tick_fop_v1()(self._on_tick)
+        self.client.on_bidask_stk_v1()(self._on_bidask)
+        self.client.on_bidask_fop_v1()(self._on_bidask)
+        self.contracts = ContractIndex(convert=self._to_pb_contract)
+        self.snapshot_path = os.getenv(
+            "PROVIDER_CONTRACT_SNAPSHOT",
+            os.path.join(
+                os.path.dirname(os.path.abspath(__file__)),
+                "..",
+                "data",
+                "contracts.snapshot",
+            ),
+        )
+        self._load_contract_snapshot()
+        data_dir = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "..", "data"
+        )
+        tick_store = os.getenv("PROVIDER_TICK_STORE", os.path.join(data_dir, "ticks"))
+        self.tick_store = (
+            ColumnStore(tick_store, TICK_COLUMNS, ".ticks") if tick_store else None
+        )
+        kbar_store = os.getenv("PROVIDER_KBAR_STORE", os.path.join(data_dir, "kbars"))
+        self.history_executor = futures.ThreadPoolExecutor(
+            max_workers=self.HISTORY_WORKERS, thread_name_prefix="history"
+        )
+        self.kbars_batch_executor = futures.ThreadPoolExecutor(
+            max_workers=self.KBARS_BATCH_PARALLELISM, thread_name_prefix="kbars-batch"
+        )
+        self.kbars = KbarCache(
+            ColumnStore(kbar_store, KBAR_COLUMNS, ".kbars") if kbar_store else None,
+            self._fetch_kbars,
+            self.history_executor,
+        )
+        # Caps the subscription streams of the sync server, each of which
+        # holds a worker thread for its lifetime; set by serve().
+        self.stream_slots: Optional[threading.BoundedSemaphore] = None
+        self.trades = TradeIndex(self.client.list_trades)
+        self.combo_trades = TradeIndex(self.client.list_combotrades)
+        self.order_events = EventLog(self.ORDER_EVENT_CAPACITY)
+        self.order_parallelism = (
+            _env_int("PROVIDER_ORDER_PARALLELISM", None) or self.ORDER_PARALLELISM
+        )
+        self.response_cache = TTLCache(dict(self.ACCOUNT_CACHE_TTLS))
+        self.singleflight = SingleFlight()
+        self.rate_limiter = RateLimiter(
+            {
+                call_class: TokenBucket.from_spec(
+                    os.getenv(f"PROVIDER_RATE_LIMIT_{call_class.upper()}", spec)
+                )
+                for call_class, spec in self.RATE_LIMITS.items()
+            }
+        )
+        logger.info("Rate limits: %s", self.rate_limiter.describe())
+        self.snapshot_batcher = MicroBatcher(
+            self._fetch_snapshots,
+            key=lambda item: item.code,
+            window=(
+                _env_int("PROVIDER_SNAPSHOT_BATCH_MS", None) or self.SNAPSHOT_BATCH_MS
+            )
+            / 1000,
+            chunk_size=self.SNAPSHOT_CHUNK_SIZE,
+            workers=self.SNAPSHOT_WORKERS,
+        )
+        self.batch_executor = futures.ThreadPoolExecutor(
+            max_workers=self.order_parallelism, thread_name_prefix="order-batch"
+        )
+        self.client.set_order_callback(self._on_order)
+
+    def close(self):
+        """Release the service's own workers on shutdown."""
+        self.snapshot_batcher.close()
+        for executor in (
+            self.history_executor,
+            self.kbars_batch_executor,
+            self.batch_executor,
+        ):
+            executor.shutdown(wait=False)
 
     def _get_enum(self, mapping: dict, value: Any) -> Any:
         """Helper to look up enum values safely."""
@@ -160,30 +365,78 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
         return str(value) if value is not None else ""
 
     def _lookup_contract(self, code: str):
-        """Helper to find a contract by code across all categories."""
-        # Check if contracts are loaded; if not, they might need to be fetched,
-        # but here we just check what's available in memory.
-        if (
-            hasattr(self.client.api.Contracts, "Stocks")
-            and code in self.client.api.Contracts.Stocks
-        ):
-            return self.client.api.Contracts.Stocks[code]
+        """Helper to find a contract by code, then by symbol, across all categories."""
+        contract = self.contracts.get(code) or self.contracts.by_symbol(code)
+        live = self._live_contracts
+        # While contracts are loading, _on_contracts_fetched re-indexes each
+        # group as it lands; a miss only rebuilds once the download is done.
         if (
-            hasattr(self.client.api.Contracts, "Futures")
-            and code in self.client.api.Contracts.Futures
+            contract is None
+            and getattr(live, "status", None) == FetchStatus.Fetched
+            and self.contracts.sync(live)
         ):
-            return self.client.api.Contracts.Futures[code]
-        if (
-            hasattr(self.client.api.Contracts, "Options")
-            and code in self.client.api.Contracts.Options
-        ):
-            return self.client.api.Contracts.Options[code]
-        if (
-            hasattr(self.client.api.Contracts, "Indexs")
-            and code in self.client.api.Contracts.Indexs
-        ):
-            return self.client.api.Contracts.Indexs[code]
-        raise KeyError(f"Contract code not found: {code}")
+            contract = self.contracts.get(code) or self.contracts.by_symbol(code)
+        if contract is None:
+            raise KeyError(f"Contract code not found: {code}")
+        return contract
+
+    @property
+    def _live_contracts(self) -> Any:
+        """The client's Contracts object; None before the first login or fetch."""
+        return getattr(self.client.api, "Contracts", None)
+
+    def _on_contracts_fetched(self, security_type: sj_constant.SecurityType):
+        """Shioaji contracts callback; re-indexes once a product group lands."""
+        try:
+            if self.contracts.sync(self._live_contracts):
+                logger.info(
+                    "Contract index rebuilt after %s: %d contracts",
+                    security_type,
+                    len(self.contracts),
+                )
+        except Exception as e:
+            logger.error("Error indexing contracts: %s", e, exc_info=True)
+
+    def _load_contract_snapshot(self):
+        """Serve lookups from the last persisted contract set until login fetches."""
+        if not self.snapshot_path:
+            return
+        try:
+            snapshot = contract_snapshot.load(self.snapshot_path)
+            if snapshot is None:
+                return
+            count = self.contracts.rebuild(snapshot)
+            logger.info(
+                "Loaded %d contracts from snapshot %s (written %s)",
+                count,
+                self.snapshot_path,
+                datetime.fromtimestamp(snapshot.created_ns / 1e9),
+            )
+        except Exception as e:
+            logger.warning("Ignoring unreadable contract snapshot: %s", e)
+
+    def _start_contract_reconcile(self):
+        """Reconcile the index with the live download without blocking the RPC."""
+        threading.Thread(
+            target=self._reconcile_contracts, name="contracts-reconcile", daemon=True
+        ).start()
+
+    def _reconcile_contracts(self):
+        """Wait for the contract download, swap it into the index and persist it."""
+        deadline = time.monotonic() + self.CONTRACTS_RECONCILE_TIMEOUT
+        while getattr(self._live_contracts, "status", None) != FetchStatus.Fetched:
+            if time.monotonic() > deadline:
+                logger.warning("Contract download did not finish; keeping snapshot")
+                return
+            time.sleep(0.2)
+        contracts = self._live_contracts
+        try:
+            self.contracts.sync(contracts)
+            if self.snapshot_path:
+                count = contract_snapshot.save(self.snapshot_path, contracts)
+                logger.info("Saved %d contracts to %s", count, self.snapshot_path)
+        except Exception as e:
+            logger.error("Error reconciling contracts: %s", e, exc_info=True)
 
     @property
     def _stock_account(self) -> Account:
@@ -197,6 +450,130 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             raise ValueError("No future/option account available")
         return cast(Account, self.client.api.futopt_account)
 
+    def _quote_subscribe(self, code: str, quote_type: sj_constant.QuoteType):
+        """Subscribe upstream quotes for the first stream on a code."""
+        try:
+            self.client.subscribe(self._lookup_contract(code), quote_type)
+        except Exception as e:
+            logger.error("Error subscribing %s %s: %s", quote_type, code, e)
+
+    def _quote_unsubscribe(self, code: str, quote_type: sj_constant.QuoteType):
+        """Unsubscribe upstream quotes once the last stream on a code ends."""
+        try:
+            self.client.unsubscribe(self._lookup_contract(code), quote_type)
+        except Exception as e:
+            logger.error("Error unsubscribing %s %s: %s", quote_type, code, e)
+
+    def _to_ns(self, value: datetime) -> int:
+        """Convert a quote datetime to nanoseconds, matching historical tick ts."""
+        return (value - self._EPOCH) // timedelta(microseconds=1) * 1000
+
+    def _on_tick(self, exchange: sj_constant.Exchange, tick: Any):
+        """Shioaji tick callback; converts once and fans out to streams."""
+        if not self.tick_hub.has_subscribers(tick.code):
+            return
+        try:
+            self.tick_hub.publish(tick.code, self._to_pb_tick(exchange, tick))
+        except Exception as e:
+            logger.error("Error in tick callback: %s", e, exc_info=True)
+
+    def _on_bidask(self, exchange: sj_constant.Exchange, bidask: Any):
+        """Shioaji bid/ask callback; converts once and fans out to streams."""
+        if not self.bidask_hub.has_subscribers(bidask.code):
+            return
+        try:
+            self.bidask_hub.publish(bidask.code, self._to_pb_bidask(exchange, bidask))
+        except Exception as e:
+            logger.error("Error in bidask callback: %s", e, exc_info=True)
+
+    def _on_order(self, state: sj_constant.OrderState, msg: dict):
+        """
+        Shioaji order callback; invalidates cached account queries, bumps the
+        trade's version and pushes the sequenced event to streams.
+        """
+        try:
+            if "order" in msg:
+                keys = (msg["order"].get("seqno", ""), msg["order"].get("id", ""))
+                self.response_cache.invalidate(*self._ORDER_INVALIDATES)
+            else:
+                keys = (msg.get("seqno", ""), msg.get("trade_id", ""))
+                self.response_cache.invalidate(*self._DEAL_INVALIDATES)
+            if not self.trades.touch(*keys):
+                # Placed outside this provider; pick it up from the client.
+                self.trades.refresh()
+                self.trades.touch(*keys)
+            self.order_events.append(
+                lambda seq: self._to_pb_order_event(seq, state, msg)
+            )
+        except Exception as e:
+            logger.error("Error in order callback: %s", e, exc_info=True)
+
+    def open_subscription(
+        self, hub: Broadcaster, codes: Any, subscription: Subscription
+    ) -> Subscription:
+        """Resolve stream codes or symbols and attach a subscription to a hub."""
+        if not codes:
+            raise ValueError("contract_codes is required")
+        hub.subscribe([self._lookup_contract(c).code for c in codes], subscription)
+        return subscription
+
+    def _stream(
+        self,
+        subscription: Subscription,
+        attach: Callable[[Subscription], Any],
+        detach: Callable[[Subscription], Any],
+        context: grpc.ServicerContext,
+    ):
+        """Serve a subscription-backed stream until the client leaves or it closes."""
+        slots = self.stream_slots
+        if slots is not None and not slots.acquire(blocking=False):  # pylint: disable=consider-using-with
+            context.abort(
+                grpc.StatusCode.RESOURCE_EXHAUSTED,
+                "Too many concurrent streams for the sync server; "
+                "serve streams with PROVIDER_SERVER_MODE=aio",
+            )
+            return
+        try:
+            yield from self._serve_subscription(subscription, attach, detach, context)
+        finally:
+            if slots is not None:
+                slots.release()
+
+    def _serve_subscription(
+        self,
+        subscription: Subscription,
+        attach: Callable[[Subscription], Any],
+        detach: Callable[[Subscription], Any],
+        context: grpc.ServicerContext,
+    ):
+        """Attach a subscription and yield its items on the calling thread."""
+        try:
+            attach(subscription)
+        except KeyError as e:
+            context.abort(grpc.StatusCode.NOT_FOUND, f"Contract not found: {e}")
+            return
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            return
+        except ReplayGapError as e:
+            context.abort(grpc.StatusCode.OUT_OF_RANGE, str(e))
+            return
+        context.add_callback(subscription.close)
+        try:
+            while not subscription.closed:
+                items = subscription.get(self.STREAM_POLL_INTERVAL)
+                yield from items
+                if not items and not context.is_active():
+                    break
+            if subscription.overflowed:
+                logger.warning("Stream subscriber too slow, dropping stream")
+                context.abort(
+                    grpc.StatusCode.RESOURCE_EXHAUSTED,
+                    "Subscriber too slow, stream dropped",
+                )
+        finally:
+            detach(subscription)
+
     def Login(
         self, request: provider_pb2.LoginRequest, context: grpc.ServicerContext
     ) -> provider_pb2.LoginResponse:
@@ -204,7 +581,11 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
         try:
             # get current folder path
             current_folder = os.path.dirname(os.path.abspath(__file__))
-            accounts = self.client.login(request.api_key, request.secret_key)
+            accounts = self.client.login(
+                request.api_key,
+                request.secret_key,
+                contracts_cb=self._on_contracts_fetched,
+            )
             activated = self.client.activate_ca(
                 ca_path=os.path.join(current_folder, "..", "data", "ca.pfx"),
                 person_id="F127522501",
@@ -216,6 +597,7 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             logger.info("Login successful")
 
             self.logged_in = True
+            self._start_contract_reconcile()
             return provider_pb2.LoginResponse(
                 accounts=[self._to_pb_account(acc) for acc in accounts]
             )
@@ -268,6 +650,9 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.ListAccountsResponse()
 
+    @cached
+    @coalesced
+    @rate_limited("account")
     def GetAccountBalance(
         self, request: provider_pb2.Empty, context: grpc.ServicerContext
     ) -> provider_pb2.AccountBalance:
@@ -421,7 +806,7 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
     def _to_pb_trade(self, trade: Trade):
         """Convert Shioaji Trade to Protobuf Trade."""
         return provider_pb2.Trade(
-            contract=self._to_pb_contract(trade.contract),
+            contract=self.contracts.to_pb(trade.contract),
             order=self._to_pb_order(cast(Order, trade.order)),
             status=self._to_pb_order_status(trade.status),
         )
@@ -446,8 +831,139 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             ts=str(data.get("ts", "")),
         )
 
+    def _to_pb_tick(self, exchange: sj_constant.Exchange, tick: Any):
+        """Convert a Shioaji TickSTKv1/TickFOPv1 to Protobuf Tick."""
+        return provider_pb2.Tick(
+            code=tick.code,
+            exchange=self._get_enum(self._EXCHANGE_MAP, exchange),
+            ts=self._to_ns(tick.datetime),
+            open=float(tick.open),
+            close=float(tick.close),
+            high=float(tick.high),
+            low=float(tick.low),
+            avg_price=float(tick.avg_price),
+            volume=tick.volume,
+            total_volume=tick.total_volume,
+            amount=float(tick.amount),
+            total_amount=float(tick.total_amount),
+            tick_type=self._get_enum(self._TICK_V1_TYPE_MAP, tick.tick_type),
+            change_type=self._get_enum(self._CHANGE_V1_TYPE_MAP, tick.chg_type),
+            price_chg=float(tick.price_chg),
+            pct_chg=float(tick.pct_chg),
+            bid_side_total_vol=tick.bid_side_total_vol,
+            ask_side_total_vol=tick.ask_side_total_vol,
+            underlying_price=float(getattr(tick, "underlying_price", 0)),
+            simtrade=bool(tick.simtrade),
+            suspend=bool(getattr(tick, "suspend", False)),
+            intraday_odd=bool(getattr(tick, "intraday_odd", False)),
+        )
+
+    def _to_pb_bidask(self, exchange: sj_constant.Exchange, bidask: Any):
+        """Convert a Shioaji BidAskSTKv1/BidAskFOPv1 to Protobuf BidAsk."""
+        return provider_pb2.BidAsk(
+            code=bidask.code,
+            exchange=self._get_enum(self._EXCHANGE_MAP, exchange),
+            ts=self._to_ns(bidask.datetime),
+            bid_price=[float(p) for p in bidask.bid_price],
+            bid_volume=bidask.bid_volume,
+            diff_bid_vol=bidask.diff_bid_vol,
+            ask_price=[float(p) for p in bidask.ask_price],
+            ask_volume=bidask.ask_volume,
+            diff_ask_vol=bidask.diff_ask_vol,
+            bid_total_vol=getattr(bidask, "bid_total_vol", 0),
+            ask_total_vol=getattr(bidask, "ask_total_vol", 0),
+            simtrade=bool(bidask.simtrade),
+            suspend=bool(getattr(bidask, "suspend", False)),
+            intraday_odd=bool(getattr(bidask, "intraday_odd", False)),
+        )
+
+    def _to_pb_order_event(
+        self, seq: int, state: sj_constant.OrderState, msg: dict
+    ) -> provider_pb2.OrderEvent:
+        """Convert a Shioaji order callback message to Protobuf OrderEvent."""
+        event = provider_pb2.OrderEvent(
+            seq=seq,
+            epoch=self.order_events.epoch,
+            state=self._get_enum(self._ORDER_STATE_MAP, state),
+            ts=self._to_ns(datetime.now()),
+        )
+        if state in (
+            sj_constant.OrderState.StockDeal,
+            sj_constant.OrderState.FuturesDeal,
+        ):
+            event.deal.CopyFrom(self._to_pb_deal_update(msg))
+        else:
+            event.order.CopyFrom(self._to_pb_order_update(msg))
+        return event
+
+    def _to_pb_order_update(self, msg: dict) -> provider_pb2.OrderUpdate:
+        """Convert an order callback message to Protobuf OrderUpdate."""
+        operation = msg.get("operation", {})
+        order = msg.get("order", {})
+        status = msg.get("status", {})
+        contract = msg.get("contract", {})
+        account = order.get("account", {})
+        return provider_pb2.OrderUpdate(
+            op_type=self._safe_str(operation.get("op_type")),
+            op_code=self._safe_str(operation.get("op_code")),
+            op_msg=self._safe_str(operation.get("op_msg")),
+            id=self._safe_str(order.get("id")),
+            seqno=self._safe_str(order.get("seqno")),
+            ordno=self._safe_str(order.get("ordno")),
+            broker_id=self._safe_str(account.get("broker_id")),
+            account_id=self._safe_str(account.get("account_id")),
+            action=self._get_enum(self._ACTION_MAP, order.get("action")),
+            price=float(order.get("price", 0.0)),
+            quantity=int(order.get("quantity", 0)),
+            order_type=self._get_enum(self._ORDER_TYPE_MAP, order.get("order_type")),
+            price_type=self._safe_str(order.get("price_type")),
+            custom_field=self._safe_str(order.get("custom_field")),
+            code=self._safe_str(contract.get("code")),
+            security_type=self._get_enum(
+                self._SECURITY_TYPE_MAP, contract.get("security_type")
+            ),
+            exchange=self._get_enum(self._EXCHANGE_MAP, contract.get("exchange")),
+            exchange_ts=float(status.get("exchange_ts", 0.0)),
+            modified_price=float(status.get("modified_price", 0.0)),
+            cancel_quantity=int(status.get("cancel_quantity", 0)),
+            order_quantity=int(status.get("order_quantity", 0)),
+            web_id=self._safe_str(status.get("web_id")),
+        )
+
+    def _to_pb_deal_update(self, msg: dict) -> provider_pb2.DealUpdate:
+        """Convert a deal callback message to Protobuf DealUpdate."""
+        return provider_pb2.DealUpdate(
+            trade_id=self._safe_str(msg.get("trade_id")),
+            seqno=self._safe_str(msg.get("seqno")),
+            ordno=self._safe_str(msg.get("ordno")),
+            exchange_seq=self._safe_str(msg.get("exchange_seq")),
+            broker_id=self._safe_str(msg.get("broker_id")),
+            account_id=self._safe_str(msg.get("account_id")),
+            action=self._get_enum(self._ACTION_MAP, msg.get("action")),
+            code=self._safe_str(msg.get("code")),
+            price=float(msg.get("price", 0.0)),
+            quantity=int(msg.get("quantity", 0)),
+            ts=float(msg.get("ts", 0.0)),
+            web_id=self._safe_str(msg.get("web_id")),
+            custom_field=self._safe_str(msg.get("custom_field")),
+            security_type=self._get_enum(
+                self._SECURITY_TYPE_MAP, msg.get("security_type")
+            ),
+            delivery_month=self._safe_str(msg.get("delivery_month")),
+            strike_price=float(msg.get("strike_price") or 0.0),
+            option_right=self._get_enum(
+                self._OPTION_RIGHT_MAP, msg.get("option_right")
+            ),
+        )
+
     def _to_sj_contract(self, proto_contract: provider_pb2.Contract):
         """Convert Protobuf Contract to Shioaji Contract."""
+        contract = self.contracts.get(proto_contract.code)
+        if contract is not None and proto_contract.security_type in (
+            provider_pb2.SECURITY_TYPE_UNSPECIFIED,
+            self._get_enum(self._SECURITY_TYPE_MAP, contract.security_type),
+        ):
+            return contract
         if proto_contract.security_type == provider_pb2.SECURITY_TYPE_STK:
             return self.client.api.Contracts.Stocks[proto_contract.code]
         if proto_contract.security_type == provider_pb2.SECURITY_TYPE_FUT:
@@ -539,32 +1055,15 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
 
     def _find_trade(self, proto_trade: provider_pb2.Trade) -> Optional[Trade]:
         """Find a Shioaji Trade object based on Protobuf Trade info."""
-        trades = self.client.list_trades()
-        target_seqno = proto_trade.order.seqno
-        target_id = proto_trade.order.id
-
-        for trade in trades:
-            if target_seqno and trade.order.seqno == target_seqno:
-                return trade
-            if target_id and trade.order.id == target_id:
-                return trade
-        return None
+        return self.trades.find(proto_trade.order.seqno, proto_trade.order.id)
 
     def _find_combo_trade(
         self, proto_trade: provider_pb2.ComboTrade
     ) -> Optional[ComboTrade]:
         """Find a Shioaji ComboTrade object based on Protobuf ComboTrade info."""
-        trades = self.client.list_combotrades()
-        target_seqno = proto_trade.order.seqno
-        target_id = proto_trade.order.id
-
-        for trade in trades:
-            if target_seqno and trade.order.seqno == target_seqno:
-                return trade
-            if target_id and trade.order.id == target_id:
-                return trade
-        return None
+        return self.combo_trades.find(proto_trade.order.seqno, proto_trade.order.id)
 
+    @rate_limited("orders")
     def PlaceOrder(
         self, request: provider_pb2.PlaceOrderRequest, context: grpc.ServicerContext
     ) -> provider_pb2.Trade:
@@ -573,6 +1072,7 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             contract = self._to_sj_contract(request.contract)
             order = self._to_sj_order(request.order)
             trade = self.client.place_order(contract, order)
+            self.trades.add(trade)
             return self._to_pb_trade(trade)
         except KeyError as e:
             logger.error("KeyError in PlaceOrder: %s", e, exc_info=True)
@@ -583,6 +1083,70 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.Trade()
 
+    def _prepare_orders(self, requests: Any) -> list:
+        """Convert every order of a basket up front, naming the first bad one."""
+        legs = []
+        for i, leg in enumerate(requests):
+            try:
+                legs.append(
+                    (self._to_sj_contract(leg.contract), self._to_sj_order(leg.order))
+                )
+            except KeyError as e:
+                raise KeyError(f"order {i}: {e}") from e
+            except Exception as e:
+                raise ValueError(f"order {i}: {e}") from e
+        if not legs:
+            raise ValueError("no orders given")
+        return legs
+
+    def _place_leg(self, leg: tuple, deadline: Optional[float] = None) -> Trade:
+        """Place one prepared order of a basket once the order rate allows."""
+        self.rate_limiter.acquire("orders", deadline)
+        trade = self.client.place_order(*leg)
+        self.trades.add(trade)
+        return trade
+
+    def PlaceOrders(
+        self, request: provider_pb2.PlaceOrdersRequest, context: grpc.ServicerContext
+    ) -> provider_pb2.PlaceOrdersResponse:
+        """Place a basket of orders concurrently."""
+        try:
+            legs = self._prepare_orders(request.orders)
+            limit = min(
+                request.parallelism or self.order_parallelism, self.order_parallelism
+            )
+            placed = submit_bounded(
+                self.batch_executor,
+                partial(self._place_leg, deadline=deadline_of(context)),
+                legs,
+                limit,
+            )
+            results = []
+            for future in placed:
+                error = future.exception()
+                if error is None:
+                    results.append(
+                        provider_pb2.PlaceOrderResult(
+                            trade=self._to_pb_trade(future.result())
+                        )
+                    )
+                else:
+                    logger.error("Error placing basket order: %s", error)
+                    results.append(provider_pb2.PlaceOrderResult(error=str(error)))
+            return provider_pb2.PlaceOrdersResponse(results=results)
+        except KeyError as e:
+            logger.error("KeyError in PlaceOrders: %s", e, exc_info=True)
+            context.abort(grpc.StatusCode.NOT_FOUND, f"Contract not found: {e}")
+            return provider_pb2.PlaceOrdersResponse()
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            return provider_pb2.PlaceOrdersResponse()
+        except Exception as e:
+            logger.error("Error in PlaceOrders: %s", e, exc_info=True)
+            context.abort(grpc.StatusCode.INTERNAL, str(e))
+            return provider_pb2.PlaceOrdersResponse()
+
+    @rate_limited("orders")
     def PlaceComboOrder(
         self,
         request: provider_pb2.PlaceComboOrderRequest,
@@ -593,6 +1157,7 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             combo_contract = self._to_sj_combo_contract(request.combo_contract)
             order = self._to_sj_combo_order(request.order)
             trade = self.client.place_comboorder(combo_contract, order)
+            self.combo_trades.add(trade)
             return self._to_pb_combo_trade(trade)
         except KeyError as e:
             logger.error("KeyError in PlaceComboOrder: %s", e, exc_info=True)
@@ -603,6 +1168,7 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.ComboTrade()
 
+    @rate_limited("orders")
     def UpdateOrder(
         self, request: provider_pb2.UpdateOrderRequest, context: grpc.ServicerContext
     ) -> provider_pb2.Trade:
@@ -623,6 +1189,7 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.Trade()
 
+    @rate_limited("orders")
     def CancelOrder(
         self, request: provider_pb2.CancelOrderRequest, context: grpc.ServicerContext
     ) -> provider_pb2.Trade:
@@ -640,6 +1207,110 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.Trade()
 
+    def _matches_cancel_filter(
+        self, trade: Trade, request: provider_pb2.CancelOrdersRequest, codes: set
+    ) -> bool:
+        """Whether a trade matches the code/action/account part of a cancel filter."""
+        if request.all:
+            return True
+        if codes and trade.contract.code not in codes:
+            return False
+        if (
+            request.action
+            and self._get_enum(self._ACTION_MAP, trade.order.action) != request.action
+        ):
+            return False
+        return (
+            not request.account_id
+            or trade.order.account.account_id == request.account_id
+        )
+
+    def start_batch(
+        self,
+        name: str,
+        start: Callable[[Any, Optional[float]], Dict[futures.Future, Any]],
+        request: Any,
+        context: grpc.ServicerContext,
+    ) -> Dict[futures.Future, Any]:
+        """
+        Start the calls of a batch streaming RPC, aborting with INVALID_ARGUMENT
+        on a bad request. Shared by the sync and aio servers.
+        """
+        try:
+            return start(request, deadline_of(context))
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        except Exception as e:
+            logger.error("Error in %s: %s", name, e, exc_info=True)
+            context.abort(grpc.StatusCode.INTERNAL, str(e))
+        return {}
+
+    def _cancel_leg(self, trade: Trade, deadline: Optional[float] = None) -> Trade:
+        """Cancel one order of a bulk cancel once the order rate allows."""
+        self.rate_limiter.acquire("orders", deadline)
+        return self.client.cancel_order(trade)
+
+    def start_cancel_orders(
+        self,
+        request: provider_pb2.CancelOrdersRequest,
+        deadline: Optional[float] = None,
+    ) -> Dict[futures.Future, Trade]:
+        """Resolve the open trades matching a filter and start cancelling them."""
+        if not (
+            request.all
+            or request.codes
+            or request.action
+            or request.statuses
+            or request.account_id
+        ):
+            raise ValueError("empty filter; set all to cancel every open order")
+        codes = set(request.codes)
+        statuses = (
+            set(request.statuses) & self._OPEN_STATUSES
+            if request.statuses
+            else self._OPEN_STATUSES
+        )
+        matches = [
+            trade
+            for trade in self.client.list_trades()
+            if self._get_enum(self._STATUS_MAP, trade.status.status) in statuses
+            and self._matches_cancel_filter(trade, request, codes)
+        ]
+        limit = min(
+            request.parallelism or self.order_parallelism, self.order_parallelism
+        )
+        logger.info("Cancelling %d open orders", len(matches))
+        pending = submit_bounded(
+            self.batch_executor,
+            partial(self._cancel_leg, deadline=deadline),
+            matches,
+            limit,
+        )
+        return dict(zip(pending, matches))
+
+    def cancel_result(
+        self, future: futures.Future, trade: Trade
+    ) -> provider_pb2.CancelOrderResult:
+        """Convert a finished cancel into a CancelOrderResult."""
+        error = future.exception()
+        if error is not None:
+            logger.error("Error cancelling order %s: %s", trade.order.id, error)
+            return provider_pb2.CancelOrderResult(
+                trade=self._to_pb_trade(trade), error=str(error)
+            )
+        return provider_pb2.CancelOrderResult(trade=self._to_pb_trade(future.result()))
+
+    def CancelOrders(
+        self, request: provider_pb2.CancelOrdersRequest, context: grpc.ServicerContext
+    ):
+        """Cancel every open order matching a filter, streaming results."""
+        pending = self.start_batch(
+            "CancelOrders", self.start_cancel_orders, request, context
+        )
+        for future in futures.as_completed(pending):
+            yield self.cancel_result(future, pending[future])
+
+    @rate_limited("orders")
     def CancelComboOrder(
         self,
         request: provider_pb2.CancelComboOrderRequest,
@@ -659,24 +1330,28 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.ComboTrade()
 
+    @rate_limited("orders")
     def UpdateStatus(
         self, request: provider_pb2.UpdateStatusRequest, context: grpc.ServicerContext
     ) -> provider_pb2.Empty:
         """Update the status of orders and trades for an account."""
         try:
             self.client.update_status(self._stock_account)
+            self.trades.refresh()
             return provider_pb2.Empty()
         except Exception as e:
             logger.error("Error in UpdateStatus: %s", e, exc_info=True)
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.Empty()
 
+    @rate_limited("orders")
     def UpdateComboStatus(
         self, request: provider_pb2.UpdateStatusRequest, context: grpc.ServicerContext
     ) -> provider_pb2.Empty:
         """Update the status of combination orders for an account."""
         try:
             self.client.update_combostatus(self._stock_account)
+            self.combo_trades.refresh()
             return provider_pb2.Empty()
         except Exception as e:
             logger.error("Error in UpdateComboStatus: %s", e, exc_info=True)
@@ -711,6 +1386,47 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.ListComboTradesResponse()
 
+    def ListTradesDelta(
+        self,
+        request: provider_pb2.ListTradesDeltaRequest,
+        context: grpc.ServicerContext,
+    ) -> provider_pb2.ListTradesResponse:
+        """List trades changed since a version watermark."""
+        try:
+            trades, version = self.trades.changed_since(
+                request.since_version, request.epoch
+            )
+            return provider_pb2.ListTradesResponse(
+                trades=[self._to_pb_trade(t) for t in trades],
+                version=version,
+                epoch=self.trades.epoch,
+            )
+        except Exception as e:
+            logger.error("Error in ListTradesDelta: %s", e, exc_info=True)
+            context.abort(grpc.StatusCode.INTERNAL, str(e))
+            return provider_pb2.ListTradesResponse()
+
+    def ListComboTradesDelta(
+        self,
+        request: provider_pb2.ListTradesDeltaRequest,
+        context: grpc.ServicerContext,
+    ) -> provider_pb2.ListComboTradesResponse:
+        """List combination trades changed since a version watermark."""
+        try:
+            trades, version = self.combo_trades.changed_since(
+                request.since_version, request.epoch
+            )
+            return provider_pb2.ListComboTradesResponse(
+                combo_trades=[self._to_pb_combo_trade(t) for t in trades],
+                version=version,
+                epoch=self.combo_trades.epoch,
+            )
+        except Exception as e:
+            logger.error("Error in ListComboTradesDelta: %s", e, exc_info=True)
+            context.abort(grpc.StatusCode.INTERNAL, str(e))
+            return provider_pb2.ListComboTradesResponse()
+
+    @rate_limited("account")
     def GetOrderDealRecords(
         self,
         request: provider_pb2.GetOrderDealRecordsRequest,
@@ -727,6 +1443,9 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.GetOrderDealRecordsResponse()
 
+    @cached
+    @coalesced
+    @rate_limited("account")
     def ListPositions(
         self, request: provider_pb2.ListPositionsRequest, context: grpc.ServicerContext
     ) -> provider_pb2.ListPositionsResponse:
@@ -778,6 +1497,8 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.ListPositionsResponse()
 
+    @coalesced
+    @rate_limited("account")
     def ListPositionDetail(
         self,
         request: provider_pb2.ListPositionDetailRequest,
@@ -839,6 +1560,8 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.ListPositionDetailResponse()
 
+    @coalesced
+    @rate_limited("account")
     def ListProfitLoss(
         self, request: provider_pb2.ListProfitLossRequest, context: grpc.ServicerContext
     ) -> provider_pb2.ListProfitLossResponse:
@@ -890,6 +1613,7 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.ListProfitLossResponse()
 
+    @rate_limited("account")
     def ListProfitLossDetail(
         self,
         request: provider_pb2.ListProfitLossDetailRequest,
@@ -956,6 +1680,7 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.ListProfitLossDetailResponse()
 
+    @rate_limited("account")
     def ListProfitLossSummary(
         self,
         request: provider_pb2.ListProfitLossSummaryRequest,
@@ -1010,6 +1735,9 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.ListProfitLossSummaryResponse()
 
+    @cached
+    @coalesced
+    @rate_limited("account")
     def GetSettlements(
         self, request: provider_pb2.GetSettlementsRequest, context: grpc.ServicerContext
     ) -> provider_pb2.GetSettlementsResponse:
@@ -1042,6 +1770,9 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
         """List settlement information (Alias)."""
         return self.GetSettlements(request, context)
 
+    @cached
+    @coalesced
+    @rate_limited("account")
     def GetMargin(
         self, request: provider_pb2.GetMarginRequest, context: grpc.ServicerContext
     ) -> provider_pb2.Margin:
@@ -1074,6 +1805,9 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.Margin()
 
+    @cached
+    @coalesced
+    @rate_limited("account")
     def GetTradingLimits(
         self,
         request: provider_pb2.GetTradingLimitsRequest,
@@ -1098,6 +1832,7 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.TradingLimits()
 
+    @rate_limited("account")
     def GetStockReserveSummary(
         self,
         request: provider_pb2.GetStockReserveSummaryRequest,
@@ -1112,6 +1847,7 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.ReserveStocksSummaryResponse()
 
+    @rate_limited("account")
     def GetStockReserveDetail(
         self,
         request: provider_pb2.GetStockReserveDetailRequest,
@@ -1146,6 +1882,7 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.ReserveStockResponse()
 
+    @rate_limited("account")
     def GetEarmarkingDetail(
         self,
         request: provider_pb2.GetEarmarkingDetailRequest,
@@ -1181,13 +1918,19 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.ReserveEarmarkingResponse()
 
+    def _fetch_snapshots(self, contracts: list, deadline: Optional[float]) -> list:
+        """One upstream snapshots call for a chunk of a merged batch."""
+        self.rate_limiter.acquire("quote", deadline)
+        return self.client.snapshots(contracts)
+
+    @coalesced
     def GetSnapshots(
         self, request: provider_pb2.GetSnapshotsRequest, context: grpc.ServicerContext
     ) -> provider_pb2.GetSnapshotsResponse:
         """Get market snapshots for a list of contracts."""
         try:
             contracts = [self._lookup_contract(code) for code in request.contract_codes]
-            snapshots = self.client.snapshots(contracts)
+            snapshots = self.snapshot_batcher.get(contracts, deadline_of(context))
             return provider_pb2.GetSnapshotsResponse(
                 snapshots=[
                     provider_pb2.Snapshot(
@@ -1223,62 +1966,352 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             logger.error("KeyError in GetSnapshots: %s", e, exc_info=True)
             context.abort(grpc.StatusCode.NOT_FOUND, f"Contract not found: {e}")
             return provider_pb2.GetSnapshotsResponse()
+        except RateLimitExceeded as e:
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(e))
+            return provider_pb2.GetSnapshotsResponse()
+        except TimeoutError:
+            context.abort(
+                grpc.StatusCode.DEADLINE_EXCEEDED, "Snapshots did not arrive in time"
+            )
+            return provider_pb2.GetSnapshotsResponse()
         except Exception as e:
             logger.error("Error in GetSnapshots: %s", e, exc_info=True)
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.GetSnapshotsResponse()
 
-    def GetTicks(
+    def _fetch_ticks(self, contract: Any, date: str, deadline: Optional[float]) -> Any:
+        """
+        Ticks of a contract for a date. Ticks of a completed trading day never
+        change, so they are served from the tick store and only fetched from
+        Shioaji (and written back) on a miss.
+        """
+        store = self.tick_store if _is_past_trading_date(date) else None
+        if store is not None:
+            ticks = store.get(contract.code, date)
+            if ticks is not None:
+                return ticks
+        self.rate_limiter.acquire("quote", deadline)
+        ticks = self.client.ticks(contract, date)
+        if store is not None and ticks.ts:
+            try:
+                store.put(contract.code, date, ticks)
+            except OSError as e:
+                logger.warning(
+                    "Could not store ticks of %s %s: %s", contract.code, date, e
+                )
+        return ticks
+
+    def _fetch_kbars(
+        self, contract: Any, start: str, end: str, deadline: Optional[float]
+    ) -> Any:
+        """One upstream kbars call for a run of days missing from the kbar cache."""
+        self.rate_limiter.acquire("quote", deadline)
+        return self.client.kbars(contract, start, end)
+
+    def load_ticks(
         self, request: provider_pb2.GetTicksRequest, context: grpc.ServicerContext
-    ) -> provider_pb2.Ticks:
-        """Get tick data for a specific contract and date."""
+    ) -> Any:
+        """Fetch the ticks of a tick query, aborting the RPC on failure."""
         try:
             contract = self._lookup_contract(request.contract_code)
-            ticks = self.client.ticks(contract, request.date)
-            return provider_pb2.Ticks(
-                ts=ticks.ts,
-                close=ticks.close,
-                volume=ticks.volume,
-                bid_price=ticks.bid_price,
-                bid_volume=ticks.bid_volume,
-                ask_price=ticks.ask_price,
-                ask_volume=ticks.ask_volume,
-                tick_type=ticks.tick_type,
+            ticks = self._fetch_ticks(contract, request.date, deadline_of(context))
+            if request.max_points:
+                ticks = resample.downsample_ticks(ticks, request.max_points)
+            return ticks
+        except KeyError as e:
+            logger.error("KeyError loading ticks: %s", e, exc_info=True)
+            context.abort(grpc.StatusCode.NOT_FOUND, f"Contract not found: {e}")
+        except RateLimitExceeded as e:
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(e))
+        except Exception as e:
+            logger.error("Error loading ticks: %s", e, exc_info=True)
+            context.abort(grpc.StatusCode.INTERNAL, str(e))
+        return None
+
+    @staticmethod
+    def _date_range(request: provider_pb2.GetKbarsRequest) -> Tuple[dt_date, dt_date]:
+        """Parse the dates of a kbar query; ValueError if they are malformed."""
+        try:
+            return (
+                datetime.strptime(request.start_date, "%Y-%m-%d").date(),
+                datetime.strptime(request.end_date, "%Y-%m-%d").date(),
+            )
+        except ValueError as e:
+            raise ValueError(
+                f"Invalid date range: {request.start_date} - {request.end_date}. "
+                "Expected YYYY-MM-DD"
+            ) from e
+
+    def _query_kbars(
+        self,
+        code: str,
+        dates: Tuple[dt_date, dt_date],
+        request: provider_pb2.GetKbarsRequest,
+        deadline: Optional[float],
+    ) -> Any:
+        """Kbars of one contract for the dates and options of a kbar query."""
+        contract = self._lookup_contract(code)
+        kbars = self.kbars.get(contract, dates[0], dates[1], deadline)
+        if request.start_ts or request.end_ts:
+            kbars = slice_bars(kbars, request.start_ts, request.end_ts)
+        if request.resample_minutes > 1:
+            kbars = resample.resample_kbars(
+                kbars, request.resample_minutes, self._session_opens(contract)
+            )
+        if request.max_points:
+            kbars = resample.downsample_kbars(kbars, request.max_points)
+        return kbars
+
+    def load_kbars(
+        self, request: provider_pb2.GetKbarsRequest, context: grpc.ServicerContext
+    ) -> Any:
+        """Fetch the kbars of a kbar query, aborting the RPC on failure."""
+        try:
+            dates = self._date_range(request)
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            return None
+        try:
+            return self._query_kbars(
+                request.contract_code, dates, request, deadline_of(context)
             )
         except KeyError as e:
-            logger.error("KeyError in GetTicks: %s", e, exc_info=True)
+            logger.error("KeyError loading kbars: %s", e, exc_info=True)
             context.abort(grpc.StatusCode.NOT_FOUND, f"Contract not found: {e}")
-            return provider_pb2.Ticks()
+        except RateLimitExceeded as e:
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(e))
         except Exception as e:
-            logger.error("Error in GetTicks: %s", e, exc_info=True)
+            logger.error("Error loading kbars: %s", e, exc_info=True)
             context.abort(grpc.StatusCode.INTERNAL, str(e))
+        return None
+
+    def start_kbars_batch(
+        self,
+        request: provider_pb2.GetKbarsBatchRequest,
+        deadline: Optional[float] = None,
+    ) -> Dict[futures.Future, str]:
+        """Start one kbar query per contract of a batch; futures map to codes."""
+        dates = self._date_range(request.query)
+        codes = list(dict.fromkeys(request.contract_codes))
+        if not codes:
+            raise ValueError("contract_codes is empty")
+        limit = min(
+            request.parallelism or self.KBARS_BATCH_PARALLELISM,
+            self.KBARS_BATCH_PARALLELISM,
+        )
+        logger.info("Fetching kbars of %d contracts", len(codes))
+        pending = submit_bounded(
+            self.kbars_batch_executor,
+            lambda code: self._to_pb_kbars(
+                self._query_kbars(code, dates, request.query, deadline),
+                compact=request.query.compact,
+            ),
+            codes,
+            limit,
+        )
+        return dict(zip(pending, codes))
+
+    @staticmethod
+    def kbars_batch_result(
+        future: futures.Future, code: str
+    ) -> provider_pb2.KbarsBatchResult:
+        """Convert a finished kbar query of a batch into a KbarsBatchResult."""
+        error = future.exception()
+        if error is None:
+            return provider_pb2.KbarsBatchResult(
+                contract_code=code, kbars=future.result()
+            )
+        logger.error("Error fetching kbars of %s: %s", code, error)
+        if isinstance(error, KeyError):
+            return provider_pb2.KbarsBatchResult(
+                contract_code=code, error=f"Contract not found: {error}"
+            )
+        return provider_pb2.KbarsBatchResult(contract_code=code, error=str(error))
+
+    def GetKbarsBatch(
+        self, request: provider_pb2.GetKbarsBatchRequest, context: grpc.ServicerContext
+    ):
+        """Fetch the kbars of many contracts, streaming each as it completes."""
+        pending = self.start_batch(
+            "GetKbarsBatch", self.start_kbars_batch, request, context
+        )
+        for future in futures.as_completed(pending):
+            yield self.kbars_batch_result(future, pending[future])
+
+    @staticmethod
+    def _session_opens(contract: Any) -> tuple:
+        """Session opens of the market a contract trades on."""
+        if contract.security_type in (
+            sj_constant.SecurityType.Future,
+            sj_constant.SecurityType.Option,
+        ):
+            return resample.TAIFEX_SESSIONS
+        return resample.TWSE_SESSIONS
+
+    @staticmethod
+    def _to_pb_ticks(
+        ticks: Any, start: int = 0, stop: Optional[int] = None, compact: bool = False
+    ) -> provider_pb2.Ticks:
+        """Convert rows [start, stop) of Shioaji ticks to a Ticks message."""
+        rows = slice(start, stop)
+        fields = {
+            "volume": ticks.volume[rows],
+            "bid_volume": ticks.bid_volume[rows],
+            "ask_volume": ticks.ask_volume[rows],
+            "tick_type": ticks.tick_type[rows],
+        }
+        prices = {
+            "close": ticks.close[rows],
+            "bid_price": ticks.bid_price[rows],
+            "ask_price": ticks.ask_price[rows],
+        }
+        if compact:
+            fields.update(compact_codec.encode(ticks.ts[rows], prices))
+        else:
+            fields.update(prices, ts=ticks.ts[rows])
+        return provider_pb2.Ticks(**fields)
+
+    @staticmethod
+    def _to_pb_kbars(
+        kbars: Any, start: int = 0, stop: Optional[int] = None, compact: bool = False
+    ) -> provider_pb2.Kbars:
+        """Convert rows [start, stop) of Shioaji kbars to a Kbars message."""
+        rows = slice(start, stop)
+        fields = {"volume": kbars.Volume[rows], "amount": kbars.Amount[rows]}
+        prices = {
+            "open": kbars.Open[rows],
+            "high": kbars.High[rows],
+            "low": kbars.Low[rows],
+            "close": kbars.Close[rows],
+        }
+        if compact:
+            fields.update(compact_codec.encode(kbars.ts[rows], prices))
+        else:
+            fields.update(prices, ts=kbars.ts[rows])
+        return provider_pb2.Kbars(**fields)
+
+    def tick_chunks(self, ticks: Any, chunk_size: int = 0, compact: bool = False):
+        """Ticks messages of at most chunk_size rows, converted one at a time."""
+        size = chunk_size if chunk_size > 0 else self.HISTORY_CHUNK_SIZE
+        for start in range(0, len(ticks.ts), size):
+            yield self._to_pb_ticks(ticks, start, start + size, compact)
+
+    def kbar_chunks(self, kbars: Any, chunk_size: int = 0, compact: bool = False):
+        """Kbars messages of at most chunk_size rows, converted one at a time."""
+        size = chunk_size if chunk_size > 0 else self.HISTORY_CHUNK_SIZE
+        for start in range(0, len(kbars.ts), size):
+            yield self._to_pb_kbars(kbars, start, start + size, compact)
+
+    @coalesced
+    def GetTicks(
+        self, request: provider_pb2.GetTicksRequest, context: grpc.ServicerContext
+    ) -> provider_pb2.Ticks:
+        """Get tick data for a specific contract and date."""
+        ticks = self.load_ticks(request, context)
+        if ticks is None:
             return provider_pb2.Ticks()
+        return self._to_pb_ticks(ticks, compact=request.compact)
 
+    @coalesced
     def GetKbars(
         self, request: provider_pb2.GetKbarsRequest, context: grpc.ServicerContext
     ) -> provider_pb2.Kbars:
         """Get K-bar (candlestick) data for a specific contract and date range."""
+        kbars = self.load_kbars(request, context)
+        if kbars is None:
+            return provider_pb2.Kbars()
+        return self._to_pb_kbars(kbars, compact=request.compact)
+
+    @coalesced
+    def GetTickBars(
+        self, request: provider_pb2.GetTickBarsRequest, context: grpc.ServicerContext
+    ) -> provider_pb2.Kbars:
+        """Build time, volume or tick-count bars from the ticks of a contract and date."""
+        kind = self._TICK_BAR_TYPES.get(request.type)
+        if kind is None or request.size <= 0:
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "A bar type and a positive size are required",
+            )
+            return provider_pb2.Kbars()
+        ticks = self.load_ticks(
+            provider_pb2.GetTicksRequest(
+                contract_code=request.contract_code, date=request.date
+            ),
+            context,
+        )
+        if ticks is None:
+            return provider_pb2.Kbars()
         try:
             contract = self._lookup_contract(request.contract_code)
-            kbars = self.client.kbars(contract, request.start_date, request.end_date)
-            return provider_pb2.Kbars(
-                ts=kbars.ts,
-                open=kbars.Open,
-                high=kbars.High,
-                low=kbars.Low,
-                close=kbars.Close,
-                volume=kbars.Volume,
-                amount=kbars.Amount,
+            bars = resample.tick_bars(
+                ticks, kind, request.size, self._session_opens(contract)
             )
-        except KeyError as e:
-            logger.error("KeyError in GetKbars: %s", e, exc_info=True)
-            context.abort(grpc.StatusCode.NOT_FOUND, f"Contract not found: {e}")
-            return provider_pb2.Kbars()
+            return self._to_pb_kbars(bars, compact=request.compact)
         except Exception as e:
-            logger.error("Error in GetKbars: %s", e, exc_info=True)
+            logger.error("Error in GetTickBars: %s", e, exc_info=True)
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.Kbars()
 
+    @coalesced
+    def GetTickAnalytics(
+        self,
+        request: provider_pb2.GetTickAnalyticsRequest,
+        context: grpc.ServicerContext,
+    ) -> provider_pb2.TickAnalytics:
+        """Summarize the ticks of a contract and date."""
+        ticks = self.load_ticks(
+            provider_pb2.GetTicksRequest(
+                contract_code=request.contract_code, date=request.date
+            ),
+            context,
+        )
+        if ticks is None:
+            return provider_pb2.TickAnalytics()
+        try:
+            summary = tick_summary(ticks, request.start_ts, request.end_ts)
+            levels = [
+                provider_pb2.PriceVolume(
+                    price=price,
+                    volume=volume,
+                    buy_volume=buy_volume,
+                    sell_volume=sell_volume,
+                    ticks=count,
+                )
+                for price, volume, buy_volume, sell_volume, count in summary.levels
+            ]
+            return provider_pb2.TickAnalytics(**{**vars(summary), "levels": levels})
+        except Exception as e:
+            logger.error("Error in GetTickAnalytics: %s", e, exc_info=True)
+            context.abort(grpc.StatusCode.INTERNAL, str(e))
+            return provider_pb2.TickAnalytics()
+
+    def StreamHistoricalTicks(
+        self,
+        request: provider_pb2.StreamHistoricalTicksRequest,
+        context: grpc.ServicerContext,
+    ):
+        """Stream the ticks of a contract and date in fixed-size chunks."""
+        ticks = self.load_ticks(request.query, context)
+        if ticks is not None:
+            yield from self.tick_chunks(
+                ticks, request.chunk_size, request.query.compact
+            )
+
+    def StreamHistoricalKbars(
+        self,
+        request: provider_pb2.StreamHistoricalKbarsRequest,
+        context: grpc.ServicerContext,
+    ):
+        """Stream the kbars of a contract and date range in fixed-size chunks."""
+        kbars = self.load_kbars(request.query, context)
+        if kbars is not None:
+            yield from self.kbar_chunks(
+                kbars, request.chunk_size, request.query.compact
+            )
+
+    @coalesced
+    @rate_limited("quote")
     def GetDailyQuotes(
         self, request: provider_pb2.GetDailyQuotesRequest, context: grpc.ServicerContext
     ) -> provider_pb2.DailyQuotes:
@@ -1311,6 +2344,7 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.DailyQuotes()
 
+    @rate_limited("quote")
     def CreditEnquires(
         self, request: provider_pb2.CreditEnquiresRequest, context: grpc.ServicerContext
     ) -> provider_pb2.CreditEnquiresResponse:
@@ -1342,6 +2376,7 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.CreditEnquiresResponse()
 
+    @rate_limited("quote")
     def GetShortStockSources(
         self,
         request: provider_pb2.GetShortStockSourcesRequest,
@@ -1371,6 +2406,7 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.GetShortStockSourcesResponse()
 
+    @rate_limited("quote")
     def GetScanners(
         self, request: provider_pb2.GetScannersRequest, context: grpc.ServicerContext
     ) -> provider_pb2.GetScannersResponse:
@@ -1490,13 +2526,95 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
     ) -> provider_pb2.Empty:
         """Manually fetch contracts."""
         try:
-            self.client.fetch_contracts(request.contract_download)
+            self.client.fetch_contracts(
+                request.contract_download, contracts_cb=self._on_contracts_fetched
+            )
+            self._start_contract_reconcile()
             return provider_pb2.Empty()
         except Exception as e:
             logger.error("Error in FetchContracts: %s", e, exc_info=True)
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.Empty()
 
+    def GetSingleflightStats(
+        self, request: provider_pb2.Empty, context: grpc.ServicerContext
+    ) -> provider_pb2.SingleflightStats:
+        """Report how many read calls were served by a coalesced request."""
+        return provider_pb2.SingleflightStats(
+            methods=[
+                provider_pb2.SingleflightMethodStats(
+                    method=method,
+                    calls=calls,
+                    shared=shared,
+                    hit_ratio=shared / calls if calls else 0.0,
+                )
+                for method, (calls, shared) in sorted(self.singleflight.stats().items())
+            ]
+        )
+
+    def GetOptionChain(
+        self,
+        request: provider_pb2.GetOptionChainRequest,
+        context: grpc.ServicerContext,
+    ) -> provider_pb2.OptionChain:
+        """Get the option chain of an underlying from the contract index."""
+        try:
+            query = partial(
+                self.contracts.option_chain,
+                request.underlying,
+                delivery_month=request.delivery_month,
+                strike_min=request.strike_min,
+                strike_max=request.strike_max,
+                center_strike=request.center_strike,
+                num_strikes=request.num_strikes,
+            )
+            rows = query()
+            if not rows and self.contracts.sync(self._live_contracts):
+                rows = query()
+            return provider_pb2.OptionChain(
+                strikes=[
+                    provider_pb2.OptionStrike(
+                        delivery_month=month,
+                        strike_price=strike,
+                        call=call,
+                        put=put,
+                    )
+                    for month, strike, call, put in rows
+                ]
+            )
+        except Exception as e:
+            logger.error("Error in GetOptionChain: %s", e, exc_info=True)
+            context.abort(grpc.StatusCode.INTERNAL, str(e))
+            return provider_pb2.OptionChain()
+
+    def FindContracts(
+        self,
+        request: provider_pb2.FindContractsRequest,
+        context: grpc.ServicerContext,
+    ) -> provider_pb2.FindContractsResponse:
+        """Find contracts by symbol, underlying, category and delivery month."""
+        try:
+            query = partial(
+                self.contracts.find,
+                symbol=request.symbol,
+                underlying_code=request.underlying_code,
+                category=request.category,
+                delivery_month=request.delivery_month,
+            )
+            found = query()
+            if not found and self.contracts.sync(self._live_contracts):
+                found = query()
+            return provider_pb2.FindContractsResponse(
+                contracts=[self.contracts.to_pb(c) for c in found]
+            )
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            return provider_pb2.FindContractsResponse()
+        except Exception as e:
+            logger.error("Error in FindContracts: %s", e, exc_info=True)
+            context.abort(grpc.StatusCode.INTERNAL, str(e))
+            return provider_pb2.FindContractsResponse()
+
     def GetCAExpireTime(
         self,
         request: provider_pb2.GetCAExpireTimeRequest,
@@ -1537,10 +2655,441 @@ class ShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return provider_pb2.UnsubscribeTradeResponse()
 
+    def StreamTicks(
+        self, request: provider_pb2.StreamTicksRequest, context: grpc.ServicerContext
+    ):
+        """Stream real-time ticks for a list of contracts."""
+        yield from self._stream(
+            Subscription(request.queue_size or self.STREAM_QUEUE_SIZE),
+            partial(self.open_subscription, self.tick_hub, request.contract_codes),
+            self.tick_hub.unsubscribe,
+            context,
+        )
 
-def serve():
-    """Start the gRPC server."""
-    addr = os.getenv("PROVIDER_ADDR", "localhost:50051")
+    def StreamBidAsk(
+        self, request: provider_pb2.StreamBidAskRequest, context: grpc.ServicerContext
+    ):
+        """Stream conflated bid/ask books for a list of contracts."""
+        yield from self._stream(
+            ConflatedSubscription(request.interval_ms / 1000),
+            partial(self.open_subscription, self.bidask_hub, request.contract_codes),
+            self.bidask_hub.unsubscribe,
+            context,
+        )
+
+    def StreamOrderEvents(
+        self,
+        request: provider_pb2.StreamOrderEventsRequest,
+        context: grpc.ServicerContext,
+    ):
+        """Stream order and deal events pushed by the order callback."""
+        yield from self._stream(
+            Subscription(request.queue_size or self.ORDER_EVENT_CAPACITY),
+            partial(
+                self.order_events.subscribe,
+                since_seq=request.since_seq,
+                replay=request.replay,
+                epoch=request.epoch,
+            ),
+            self.order_events.unsubscribe,
+            context,
+        )
+
+
+class _AbortError(Exception):
+    """Carries an abort status out of a handler running on the executor."""
+
+    def __init__(self, code: grpc.StatusCode, details: str):
+        super().__init__(details)
+        self.code = code
+        self.details = details
+
+
+class _ExecutorContext:
+    """
+    _ExecutorContext -.
+    Synchronous stand-in for a grpc.aio.ServicerContext, handed to the shared
+    ShioajiService handlers while they run on an executor thread.
+    """
+
+    def __init__(self, context: grpc.aio.ServicerContext):
+        self._context = context
+        self.aborted: Optional[_AbortError] = None
+
+    def abort(self, code: grpc.StatusCode, details: str):
+        """Record the first abort status and unwind the handler."""
+        if self.aborted is None:
+            self.aborted = _AbortError(code, details)
+        raise self.aborted
+
+    def time_remaining(self) -> Optional[float]:
+        """Time remaining before the RPC deadline, in seconds."""
+        return self._context.time_remaining()
+
+    def invocation_metadata(self):
+        """Metadata sent by the client."""
+        return self._context.invocation_metadata()
+
+    def peer(self) -> str:
+        """Identity of the client."""
+        return self._context.peer()
+
+    def is_active(self) -> bool:
+        """Whether the RPC is still in flight."""
+        return not self._context.done()
+
+
+class _SyncContext:
+    """
+    _SyncContext -.
+    Proxy of a sync grpc.ServicerContext whose abort() keeps the first
+    status, as _ExecutorContext does in aio mode. grpc's own abort()
+    overwrites it, so a handler aborting inside its own try block would
+    otherwise report its except clause's INTERNAL in sync mode only.
+    """
+
+    def __init__(self, context: grpc.ServicerContext):
+        self._context = context
+        self._aborted: Optional[Exception] = None
+
+    def abort(self, code: grpc.StatusCode, details: str):
+        """Abort with the first status and unwind the handler."""
+        if self._aborted is None:
+            try:
+                self._context.abort(code, details)
+            except Exception as e:  # grpc raises a bare Exception
+                self._aborted = e
+        raise cast(Exception, self._aborted)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._context, name)
+
+    @classmethod
+    def wrap(cls, context: grpc.ServicerContext) -> grpc.ServicerContext:
+        """A proxy of context, typed as the context it stands in for."""
+        return cast(grpc.ServicerContext, cls(context))
+
+
+class _SyncContextInterceptor(grpc.ServerInterceptor):
+    """Hands every sync handler a _SyncContext."""
+
+    # pylint: disable=too-few-public-methods
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+        if handler.unary_unary is not None:
+            behavior = handler.unary_unary
+            return grpc.unary_unary_rpc_method_handler(
+                lambda request, context: behavior(request, _SyncContext.wrap(context)),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.unary_stream is not None:
+            stream = handler.unary_stream
+            return grpc.unary_stream_rpc_method_handler(
+                lambda request, context: stream(request, _SyncContext.wrap(context)),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        return handler
+
+
+class AsyncShioajiService(provider_pb2_grpc.ShioajiProviderServicer):
+    """
+    AsyncShioajiService -.
+    grpc.aio front end for ShioajiService. Unary handlers are the synchronous
+    ShioajiService methods, awaited on a bounded executor so idle or slow RPCs
+    do not hold a thread. Their cached, coalesced and rate_limited layers are
+    rebuilt as coroutines, so cache hits, waits for a shared call and rate
+    limit queueing happen on the event loop and only the Shioaji call itself
+    takes an executor thread. Order RPCs get their own executor so
+    long-running market data pulls can never starve them. Streaming RPCs are
+    defined here and await their subscriptions on the event loop directly.
+    """
+
+    # pylint: disable=invalid-overridden-method
+
+    _ORDER_METHODS = frozenset(
+        {
+            "PlaceOrder",
+            "PlaceOrders",
+            "PlaceComboOrder",
+            "UpdateOrder",
+            "CancelOrder",
+            "CancelComboOrder",
+        }
+    )
+
+    def __init__(
+        self,
+        service: ShioajiService,
+        executor: futures.Executor,
+        order_executor: futures.Executor,
+    ):
+        self.service = service
+        self._executor = executor
+        self._order_executor = order_executor
+        for name in dir(provider_pb2_grpc.ShioajiProviderServicer):
+            if name.startswith("_") or name in AsyncShioajiService.__dict__:
+                continue
+            setattr(self, name, self._wrap(name))
+
+    def _wrap(self, name: str) -> Callable:
+        """Build the coroutine handler for a unary ShioajiService method."""
+        method = getattr(type(self.service), name)
+        layers = []
+        while getattr(method, "aio_layer", None) is not None:
+            layers.append(method.aio_layer)
+            method = method.__wrapped__
+        handler = partial(method, self.service)
+        executor = (
+            self._order_executor if name in self._ORDER_METHODS else self._executor
+        )
+
+        async def call(request: Any, context: grpc.aio.ServicerContext) -> Any:
+            return await self._run(executor, handler, request, context)
+
+        for layer in reversed(layers):
+            call = layer(self.service, name, call)
+        return call
+
+    async def _run(
+        self,
+        executor: futures.Executor,
+        handler: Callable,
+        request: Any,
+        context: grpc.aio.ServicerContext,
+    ) -> Any:
+        """Run a synchronous handler on the executor and relay its abort status."""
+        loop = asyncio.get_running_loop()
+        executor_context = _ExecutorContext(context)
+        try:
+            return await loop.run_in_executor(
+                executor, handler, request, executor_context
+            )
+        except _AbortError:
+            aborted = cast(_AbortError, executor_context.aborted)
+            await context.abort(aborted.code, aborted.details)
+            raise
+
+    async def _stream(
+        self,
+        subscription: Subscription,
+        attach: Callable[[Subscription], Any],
+        detach: Callable[[Subscription], Any],
+        context: grpc.aio.ServicerContext,
+    ):
+        """Serve a subscription-backed stream without holding an executor thread."""
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._executor, attach, subscription)
+        except KeyError as e:
+            await context.abort(grpc.StatusCode.NOT_FOUND, f"Contract not found: {e}")
+            return
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            return
+        except ReplayGapError as e:
+            await context.abort(grpc.StatusCode.OUT_OF_RANGE, str(e))
+            return
+        try:
+            while not subscription.closed:
+                items = await subscription.aget(self.service.STREAM_POLL_INTERVAL)
+                for item in items:
+                    yield item
+                if not items and context.done():
+                    break
+            if subscription.overflowed:
+                logger.warning("Stream subscriber too slow, dropping stream")
+                await context.abort(
+                    grpc.StatusCode.RESOURCE_EXHAUSTED,
+                    "Subscriber too slow, stream dropped",
+                )
+        finally:
+            subscription.close()
+            await loop.run_in_executor(self._executor, detach, subscription)
+
+    async def StreamTicks(
+        self,
+        request: provider_pb2.StreamTicksRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        """Stream real-time ticks for a list of contracts."""
+        hub = self.service.tick_hub
+        async for tick in self._stream(
+            Subscription(request.queue_size or self.service.STREAM_QUEUE_SIZE),
+            partial(self.service.open_subscription, hub, list(request.contract_codes)),
+            hub.unsubscribe,
+            context,
+        ):
+            yield tick
+
+    async def StreamBidAsk(
+        self,
+        request: provider_pb2.StreamBidAskRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        """Stream conflated bid/ask books for a list of contracts."""
+        hub = self.service.bidask_hub
+        async for bidask in self._stream(
+            ConflatedSubscription(request.interval_ms / 1000),
+            partial(self.service.open_subscription, hub, list(request.contract_codes)),
+            hub.unsubscribe,
+            context,
+        ):
+            yield bidask
+
+    async def StreamOrderEvents(
+        self,
+        request: provider_pb2.StreamOrderEventsRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        """Stream order and deal events pushed by the order callback."""
+        events = self.service.order_events
+        async for event in self._stream(
+            Subscription(request.queue_size or self.service.ORDER_EVENT_CAPACITY),
+            partial(
+                events.subscribe,
+                since_seq=request.since_seq,
+                replay=request.replay,
+                epoch=request.epoch,
+            ),
+            events.unsubscribe,
+            context,
+        ):
+            yield event
+
+    async def StreamHistoricalTicks(
+        self,
+        request: provider_pb2.StreamHistoricalTicksRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        """Stream the ticks of a contract and date in fixed-size chunks."""
+        ticks = await self._run(
+            self._executor, self.service.load_ticks, request.query, context
+        )
+        if ticks is not None:
+            async for chunk in self._chunks(
+                self.service.tick_chunks(
+                    ticks, request.chunk_size, request.query.compact
+                )
+            ):
+                yield chunk
+
+    async def StreamHistoricalKbars(
+        self,
+        request: provider_pb2.StreamHistoricalKbarsRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        """Stream the kbars of a contract and date range in fixed-size chunks."""
+        kbars = await self._run(
+            self._executor, self.service.load_kbars, request.query, context
+        )
+        if kbars is not None:
+            async for chunk in self._chunks(
+                self.service.kbar_chunks(
+                    kbars, request.chunk_size, request.query.compact
+                )
+            ):
+                yield chunk
+
+    async def _chunks(self, chunks: Iterator[Any]):
+        """
+        Yield the messages of a chunk generator, converting each one on the
+        executor so a large history never blocks the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            chunk = await loop.run_in_executor(self._executor, next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+    async def _stream_batch(
+        self,
+        executor: futures.Executor,
+        start: Callable,
+        result: Callable[[futures.Future, Any], Any],
+        request: Any,
+        context: grpc.aio.ServicerContext,
+    ):
+        """
+        Start a batch with ShioajiService.start_batch on the executor, then
+        stream each result as its call completes without holding a thread.
+        """
+        pending = await self._run(executor, start, request, context)
+        waiting = {asyncio.wrap_future(f): f for f in pending}
+        while waiting:
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            for wrapped in done:
+                future = waiting.pop(wrapped)
+                yield result(future, pending[future])
+
+    async def GetKbarsBatch(
+        self,
+        request: provider_pb2.GetKbarsBatchRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        """Fetch the kbars of many contracts, streaming each as it completes."""
+        async for result in self._stream_batch(
+            self._executor,
+            partial(
+                self.service.start_batch,
+                "GetKbarsBatch",
+                self.service.start_kbars_batch,
+            ),
+            self.service.kbars_batch_result,
+            request,
+            context,
+        ):
+            yield result
+
+    async def CancelOrders(
+        self,
+        request: provider_pb2.CancelOrdersRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        """Cancel every open order matching a filter, streaming results."""
+        async for result in self._stream_batch(
+            self._order_executor,
+            partial(
+                self.service.start_batch,
+                "CancelOrders",
+                self.service.start_cancel_orders,
+            ),
+            self.service.cancel_result,
+            request,
+            context,
+        ):
+            yield result
+
+
+def _env_int(name: str, default: Optional[int]) -> Optional[int]:
+    """Read a positive integer from the environment."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%s", name, value)
+        return default
+    return parsed if parsed > 0 else default
+
+
+def _is_past_trading_date(date: str) -> bool:
+    """Whether a YYYY-MM-DD date is before today in Taipei, i.e. its data is final."""
+    try:
+        day = datetime.strptime(date, "%Y-%m-%d").date()
+    except ValueError:
+        return False
+    return day < datetime.now(TAIPEI).date()
+
+
+def _prepare_addr(addr: str):
+    """Remove a stale unix socket file left behind by a previous run."""
     if addr.startswith("unix:"):
         # Extract the path from the unix address
         # unix:///tmp/phoenix.sock -> /tmp/phoenix.sock
@@ -1556,22 +3105,83 @@ def serve():
             except OSError as e:
                 logger.error("Error removing socket file: %s", e)
 
-    server = grpc.server(futures.ThreadPoolExecutor())
+
+def _logout(service: ShioajiService):
+    """Logout from Shioaji if a session is active."""
+    if service.logged_in:
+        try:
+            logger.info("Logout from Shioaji...")
+            service.client.logout()
+            logger.info("Shioaji logout successful.")
+        except Exception as e:
+            logger.error("Error during Shioaji logout: %s", e)
+
+
+async def serve_aio(addr: str):
+    """Start the grpc.aio server."""
+    executor = futures.ThreadPoolExecutor(
+        max_workers=_env_int("PROVIDER_MAX_WORKERS", 16),
+        thread_name_prefix="shioaji",
+    )
+    order_executor = futures.ThreadPoolExecutor(
+        max_workers=_env_int("PROVIDER_ORDER_WORKERS", 4),
+        thread_name_prefix="shioaji-order",
+    )
+    server = grpc.aio.server()
+    service = ShioajiService()
+    provider_pb2_grpc.add_ShioajiProviderServicer_to_server(
+        AsyncShioajiService(service, executor, order_executor),
+        server,
+    )
+    server.add_insecure_port(addr)
+    await server.start()
+    logger.info("Server started (aio), listening on %s", addr)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGQUIT):
+        loop.add_signal_handler(sig, stop.set)
+
+    await stop.wait()
+    logger.info("Received signal. Starting graceful shutdown...")
+    await loop.run_in_executor(executor, _logout, service)
+    await server.stop(0)
+    await loop.run_in_executor(executor, service.close)
+    executor.shutdown(wait=False)
+    order_executor.shutdown(wait=False)
+    logger.info("Server stopped.")
+
+
+def serve():
+    """Start the gRPC server."""
+    addr = os.getenv("PROVIDER_ADDR", "localhost:50051")
+    _prepare_addr(addr)
+
+    if os.getenv("PROVIDER_SERVER_MODE", "sync").lower() == "aio":
+        asyncio.run(serve_aio(addr))
+        return
+
+    # ThreadPoolExecutor's own default, so the stream cap can be derived.
+    workers = _env_int("PROVIDER_MAX_WORKERS", None) or min(
+        32, (os.cpu_count() or 1) + 4
+    )
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=workers),
+        interceptors=[_SyncContextInterceptor()],
+    )
     service = ShioajiService()
+    service.stream_slots = threading.BoundedSemaphore(
+        _env_int("PROVIDER_SYNC_MAX_STREAMS", None) or max(1, workers // 2)
+    )
     provider_pb2_grpc.add_ShioajiProviderServicer_to_server(service, server)
     server.add_insecure_port(addr)
     logger.info("Server started, listening on %s", addr)
 
     def shutdown_handler(signum, _):
         logger.info("Received signal %s. Starting graceful shutdown...", signum)
-        if service.logged_in:
-            try:
-                logger.info("Logout from Shioaji...")
-                service.client.logout()
-                logger.info("Shioaji logout successful.")
-            except Exception as e:
-                logger.error("Error during Shioaji logout: %s", e)
+        _logout(service)
         server.stop(0)
+        service.close()
         logger.info("Server stopped.")
 
     # Register signals
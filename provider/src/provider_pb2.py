@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0eprovider.proto\x12\x02v1\"\x07\n\x05\x45mpty\"3\n\x0cLoginRequest\x12\x0f\n\x07\x61pi_key\x18\x01 \x01(\t\x12\x12\n\nsecret_key\x18\x02 \x01(\t\".\n\rLoginResponse\x12\x1d\n\x08\x61\x63\x63ounts\x18\x01 \x03(\x0b\x32\x0b.v1.Account\"!\n\x0eLogoutResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"{\n\x07\x41\x63\x63ount\x12\x14\n\x0c\x61\x63\x63ount_type\x18\x01 \x01(\t\x12\x11\n\tperson_id\x18\x02 \x01(\t\x12\x11\n\tbroker_id\x18\x03 \x01(\t\x12\x12\n\naccount_id\x18\x04 \x01(\t\x12\x10\n\x08username\x18\x05 \x01(\t\x12\x0e\n\x06signed\x18\x06 \x01(\x08\"_\n\x0bUsageStatus\x12\x13\n\x0b\x63onnections\x18\x01 \x01(\x03\x12\r\n\x05\x62ytes\x18\x02 \x01(\x03\x12\x13\n\x0blimit_bytes\x18\x03 \x01(\x03\x12\x17\n\x0fremaining_bytes\x18\x04 \x01(\x03\"5\n\x14ListAccountsResponse\x12\x1d\n\x08\x61\x63\x63ounts\x18\x01 \x03(\x0b\x32\x0b.v1.Account\"d\n\x0e\x41\x63\x63ountBalance\x12\x13\n\x0b\x61\x63\x63_balance\x18\x01 \x01(\x01\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\x12\x0e\n\x06\x65rrmsg\x18\x03 \x01(\t\x12\x1f\n\x06status\x18\x04 \x01(\x0e\x32\x0f.v1.FetchStatus\"\xb4\x04\n\x08\x43ontract\x12\'\n\rsecurity_type\x18\x01 \x01(\x0e\x32\x10.v1.SecurityType\x12\x1e\n\x08\x65xchange\x18\x02 \x01(\x0e\x32\x0c.v1.Exchange\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x0e\n\x06symbol\x18\x04 \x01(\t\x12\x0c\n\x04name\x18\x05 \x01(\t\x12\x1e\n\x08\x63urrency\x18\x06 \x01(\x0e\x32\x0c.v1.Currency\x12\x10\n\x08\x63\x61tegory\x18\x07 \x01(\t\x12\x16\n\x0e\x64\x65livery_month\x18\x08 \x01(\t\x12\x15\n\rdelivery_date\x18\t \x01(\t\x12\x14\n\x0cstrike_price\x18\n \x01(\x01\x12%\n\x0coption_right\x18\x0b \x01(\x0e\x32\x0f.v1.OptionRight\x12\x17\n\x0funderlying_kind\x18\x0c \x01(\t\x12\x17\n\x0funderlying_code\x18\r \x01(\t\x12\x0c\n\x04unit\x18\x0e \x01(\x01\x12\x12\n\nmultiplier\x18\x0f \x01(\x03\x12\x10\n\x08limit_up\x18\x10 \x01(\x01\x12\x12\n\nlimit_down\x18\x11 \x01(\x01\x12\x11\n\treference\x18\x12 \x01(\x01\x12\x13\n\x0bupdate_date\x18\x13 \x01(\t\x12\x1e\n\x16margin_trading_balance\x18\x14 \x01(\x03\x12\x1d\n\x15short_selling_balance\x18\x15 \x01(\x03\x12\x1f\n\tday_trade\x18\x16 \x01(\x0e\x32\x0c.v1.DayTrade\x12\x13\n\x0btarget_code\x18\x17 \x01(\t\",\n\rComboContract\x12\x1b\n\x04legs\x18\x01 \x03(\x0b\x32\r.v1.ComboBase\"\xd1\x04\n\tComboBase\x12\'\n\rsecurity_type\x18\x01 \x01(\x0e\x32\x10.v1.SecurityType\x12\x1e\n\x08\x65xchange\x18\x02 \x01(\x0e\x32\x0c.v1.Exchange\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x0e\n\x06symbol\x18\x04 \x01(\t\x12\x0c\n\x04name\x18\x05 \x01(\t\x12\x1e\n\x08\x63urrency\x18\x06 \x01(\x0e\x32\x0c.v1.Currency\x12\x10\n\x08\x63\x61tegory\x18\x07 \x01(\t\x12\x16\n\x0e\x64\x65livery_month\x18\x08 \x01(\t\x12\x15\n\rdelivery_date\x18\t \x01(\t\x12\x14\n\x0cstrike_price\x18\n \x01(\x01\x12%\n\x0coption_right\x18\x0b \x01(\x0e\x32\x0f.v1.OptionRight\x12\x17\n\x0funderlying_kind\x18\x0c \x01(\t\x12\x17\n\x0funderlying_code\x18\r \x01(\t\x12\x0c\n\x04unit\x18\x0e \x01(\x01\x12\x12\n\nmultiplier\x18\x0f \x01(\x03\x12\x10\n\x08limit_up\x18\x10 \x01(\x01\x12\x12\n\nlimit_down\x18\x11 \x01(\x01\x12\x11\n\treference\x18\x12 \x01(\x01\x12\x13\n\x0bupdate_date\x18\x13 \x01(\t\x12\x1e\n\x16margin_trading_balance\x18\x14 \x01(\x03\x12\x1d\n\x15short_selling_balance\x18\x15 \x01(\x03\x12\x1f\n\tday_trade\x18\x16 \x01(\x0e\x32\x0c.v1.DayTrade\x12\x13\n\x0btarget_code\x18\x17 \x01(\t\x12\x1a\n\x06\x61\x63tion\x18\x18 \x01(\x0e\x32\n.v1.Action\"\xee\x02\n\x05Order\x12\x1a\n\x06\x61\x63tion\x18\x01 \x01(\x0e\x32\n.v1.Action\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x10\n\x08quantity\x18\x03 \x01(\x03\x12\n\n\x02id\x18\x04 \x01(\t\x12\r\n\x05seqno\x18\x05 \x01(\t\x12\r\n\x05ordno\x18\x06 \x01(\t\x12\x1c\n\x07\x61\x63\x63ount\x18\x07 \x01(\x0b\x32\x0b.v1.Account\x12\x12\n\nprice_type\x18\x08 \x01(\t\x12!\n\norder_type\x18\t \x01(\x0e\x32\r.v1.OrderType\x12!\n\x06octype\x18\n \x01(\x0e\x32\x11.v1.FuturesOCType\x12$\n\torder_lot\x18\x0b \x01(\x0e\x32\x11.v1.StockOrderLot\x12&\n\norder_cond\x18\x0c \x01(\x0e\x32\x12.v1.StockOrderCond\x12\x16\n\x0e\x64\x61ytrade_short\x18\r \x01(\x08\x12\x14\n\x0c\x63ustom_field\x18\x0e \x01(\t\x12\n\n\x02\x63\x61\x18\x0f \x01(\t\"\x8d\x02\n\nComboOrder\x12\x1a\n\x06\x61\x63tion\x18\x01 \x01(\x0e\x32\n.v1.Action\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x10\n\x08quantity\x18\x03 \x01(\x03\x12\n\n\x02id\x18\x04 \x01(\t\x12\r\n\x05seqno\x18\x05 \x01(\t\x12\r\n\x05ordno\x18\x06 \x01(\t\x12\x1c\n\x07\x61\x63\x63ount\x18\x07 \x01(\x0b\x32\x0b.v1.Account\x12\x12\n\nprice_type\x18\x08 \x01(\t\x12!\n\norder_type\x18\t \x01(\x0e\x32\r.v1.OrderType\x12!\n\x06octype\x18\n \x01(\x0e\x32\x11.v1.FuturesOCType\x12\x14\n\x0c\x63ustom_field\x18\x0b \x01(\t\x12\n\n\x02\x63\x61\x18\x0c \x01(\t\"\x8f\x02\n\x0bOrderStatus\x12\n\n\x02id\x18\x01 \x01(\t\x12\x1a\n\x06status\x18\x02 \x01(\x0e\x32\n.v1.Status\x12\x13\n\x0bstatus_code\x18\x03 \x01(\t\x12\x16\n\x0eorder_datetime\x18\x04 \x01(\t\x12\x15\n\rdeal_quantity\x18\x05 \x01(\x03\x12\x17\n\x0f\x63\x61ncel_quantity\x18\x06 \x01(\x03\x12\x0e\n\x06web_id\x18\x07 \x01(\t\x12\x0b\n\x03msg\x18\x08 \x01(\t\x12\x15\n\rmodified_time\x18\t \x01(\t\x12\x16\n\x0emodified_price\x18\n \x01(\x01\x12\x16\n\x0eorder_quantity\x18\x0b \x01(\x03\x12\x17\n\x05\x64\x65\x61ls\x18\x0c \x03(\x0b\x32\x08.v1.Deal\"@\n\x04\x44\x65\x61l\x12\x0b\n\x03seq\x18\x01 \x01(\t\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x10\n\x08quantity\x18\x03 \x01(\x03\x12\n\n\x02ts\x18\x04 \x01(\x01\"b\n\x05Trade\x12\x1e\n\x08\x63ontract\x18\x01 \x01(\x0b\x32\x0c.v1.Contract\x12\x18\n\x05order\x18\x02 \x01(\x0b\x32\t.v1.Order\x12\x1f\n\x06status\x18\x03 \x01(\x0b\x32\x0f.v1.OrderStatus\"q\n\nComboTrade\x12#\n\x08\x63ontract\x18\x01 \x01(\x0b\x32\x11.v1.ComboContract\x12\x1d\n\x05order\x18\x02 \x01(\x0b\x32\x0e.v1.ComboOrder\x12\x1f\n\x06status\x18\x03 \x01(\x0b\x32\x0f.v1.OrderStatus\"M\n\x11PlaceOrderRequest\x12\x1e\n\x08\x63ontract\x18\x01 \x01(\x0b\x32\x0c.v1.Contract\x12\x18\n\x05order\x18\x02 \x01(\x0b\x32\t.v1.Order\"b\n\x16PlaceComboOrderRequest\x12)\n\x0e\x63ombo_contract\x18\x01 \x01(\x0b\x32\x11.v1.ComboContract\x12\x1d\n\x05order\x18\x02 \x01(\x0b\x32\x0e.v1.ComboOrder\"O\n\x12UpdateOrderRequest\x12\x18\n\x05trade\x18\x01 \x01(\x0b\x32\t.v1.Trade\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x10\n\x08quantity\x18\x03 \x01(\x03\".\n\x12\x43\x61ncelOrderRequest\x12\x18\n\x05trade\x18\x01 \x01(\x0b\x32\t.v1.Trade\"=\n\x17\x43\x61ncelComboOrderRequest\x12\"\n\ncombotrade\x18\x01 \x01(\x0b\x32\x0e.v1.ComboTrade\"3\n\x13UpdateStatusRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"/\n\x12ListTradesResponse\x12\x19\n\x06trades\x18\x01 \x03(\x0b\x32\t.v1.Trade\"?\n\x17ListComboTradesResponse\x12$\n\x0c\x63ombo_trades\x18\x01 \x03(\x0b\x32\x0e.v1.ComboTrade\":\n\x1aGetOrderDealRecordsRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"C\n\x1bGetOrderDealRecordsResponse\x12$\n\x07records\x18\x01 \x03(\x0b\x32\x13.v1.OrderDealRecord\"h\n\x0fOrderDealRecord\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x1a\n\x06\x61\x63tion\x18\x02 \x01(\x0e\x32\n.v1.Action\x12\r\n\x05price\x18\x03 \x01(\x01\x12\x10\n\x08quantity\x18\x04 \x01(\x03\x12\n\n\x02ts\x18\x05 \x01(\t\"B\n\x14ListPositionsRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\x12\x0c\n\x04unit\x18\x02 \x01(\t\"\xa2\x02\n\rStockPosition\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x1d\n\tdirection\x18\x03 \x01(\x0e\x32\n.v1.Action\x12\x10\n\x08quantity\x18\x04 \x01(\x03\x12\r\n\x05price\x18\x05 \x01(\x01\x12\x12\n\nlast_price\x18\x06 \x01(\x01\x12\x0b\n\x03pnl\x18\x07 \x01(\x01\x12\x13\n\x0byd_quantity\x18\x08 \x01(\x03\x12 \n\x04\x63ond\x18\t \x01(\x0e\x32\x12.v1.StockOrderCond\x12\x1e\n\x16margin_purchase_amount\x18\n \x01(\x03\x12\x12\n\ncollateral\x18\x0b \x01(\x03\x12\x19\n\x11short_sale_margin\x18\x0c \x01(\x03\x12\x10\n\x08interest\x18\r \x01(\x03\"\x8b\x01\n\x0e\x46uturePosition\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x1d\n\tdirection\x18\x03 \x01(\x0e\x32\n.v1.Action\x12\x10\n\x08quantity\x18\x04 \x01(\x03\x12\r\n\x05price\x18\x05 \x01(\x01\x12\x12\n\nlast_price\x18\x06 \x01(\x01\x12\x0b\n\x03pnl\x18\x07 \x01(\x01\"r\n\x08Position\x12+\n\x0estock_position\x18\x01 \x01(\x0b\x32\x11.v1.StockPositionH\x00\x12-\n\x0f\x66uture_position\x18\x02 \x01(\x0b\x32\x12.v1.FuturePositionH\x00\x42\n\n\x08position\"8\n\x15ListPositionsResponse\x12\x1f\n\tpositions\x18\x01 \x03(\x0b\x32\x0c.v1.Position\"L\n\x19ListPositionDetailRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\x12\x11\n\tdetail_id\x18\x02 \x01(\x03\"\xc6\x02\n\x13StockPositionDetail\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x10\n\x08quantity\x18\x03 \x01(\x03\x12\r\n\x05price\x18\x04 \x01(\x01\x12\x12\n\nlast_price\x18\x05 \x01(\x01\x12\x0b\n\x03pnl\x18\x06 \x01(\x01\x12\x0c\n\x04\x64seq\x18\x07 \x01(\t\x12\x1d\n\tdirection\x18\x08 \x01(\x0e\x32\n.v1.Action\x12\x1e\n\x08\x63urrency\x18\t \x01(\x0e\x32\x0c.v1.Currency\x12\x0b\n\x03\x66\x65\x65\x18\n \x01(\x01\x12 \n\x04\x63ond\x18\x0b \x01(\x0e\x32\x12.v1.StockOrderCond\x12\x14\n\x0c\x65x_dividends\x18\x0c \x01(\x03\x12\x10\n\x08interest\x18\r \x01(\x03\x12\x19\n\x11margintrading_amt\x18\x0e \x01(\x03\x12\x12\n\ncollateral\x18\x0f \x01(\x03\"\xe6\x01\n\x14\x46uturePositionDetail\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x10\n\x08quantity\x18\x03 \x01(\x03\x12\r\n\x05price\x18\x04 \x01(\x01\x12\x12\n\nlast_price\x18\x05 \x01(\x01\x12\x0b\n\x03pnl\x18\x06 \x01(\x01\x12\x0c\n\x04\x64seq\x18\x07 \x01(\t\x12\x1d\n\tdirection\x18\x08 \x01(\x0e\x32\n.v1.Action\x12\x1e\n\x08\x63urrency\x18\t \x01(\x0e\x32\x0c.v1.Currency\x12\x0b\n\x03\x66\x65\x65\x18\n \x01(\x01\x12\x16\n\x0e\x65ntry_quantity\x18\x0b \x01(\x03\"~\n\x0ePositionDetail\x12/\n\x0cstock_detail\x18\x01 \x01(\x0b\x32\x17.v1.StockPositionDetailH\x00\x12\x31\n\rfuture_detail\x18\x02 \x01(\x0b\x32\x18.v1.FuturePositionDetailH\x00\x42\x08\n\x06\x64\x65tail\"A\n\x1aListPositionDetailResponse\x12#\n\x07\x64\x65tails\x18\x01 \x03(\x0b\x32\x12.v1.PositionDetail\"[\n\x15ListProfitLossRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\x12\x12\n\nbegin_date\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x03 \x01(\t\"\xb8\x01\n\x0fStockProfitLoss\x12\x0c\n\x04\x64seq\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x10\n\x08quantity\x18\x03 \x01(\x03\x12\r\n\x05price\x18\x04 \x01(\x01\x12\x0b\n\x03pnl\x18\x05 \x01(\x01\x12\x10\n\x08pr_ratio\x18\x06 \x01(\x01\x12 \n\x04\x63ond\x18\x07 \x01(\x0e\x32\x12.v1.StockOrderCond\x12\x0c\n\x04\x64\x61te\x18\x08 \x01(\t\x12\r\n\x05seqno\x18\t \x01(\t\x12\n\n\x02id\x18\n \x01(\x03\"\xbc\x01\n\x10\x46utureProfitLoss\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x10\n\x08quantity\x18\x03 \x01(\x03\x12\x13\n\x0b\x65ntry_price\x18\x04 \x01(\x01\x12\x13\n\x0b\x63over_price\x18\x05 \x01(\x01\x12\x1d\n\tdirection\x18\x06 \x01(\x0e\x32\n.v1.Action\x12\x0b\n\x03pnl\x18\x07 \x01(\x01\x12\x0b\n\x03tax\x18\x08 \x01(\x03\x12\x0b\n\x03\x66\x65\x65\x18\t \x01(\x03\x12\n\n\x02id\x18\n \x01(\x03\"j\n\nProfitLoss\x12(\n\tstock_pnl\x18\x01 \x01(\x0b\x32\x13.v1.StockProfitLossH\x00\x12*\n\nfuture_pnl\x18\x02 \x01(\x0b\x32\x14.v1.FutureProfitLossH\x00\x42\x06\n\x04item\"?\n\x16ListProfitLossResponse\x12%\n\rprofit_losses\x18\x01 \x03(\x0b\x32\x0e.v1.ProfitLoss\"N\n\x1bListProfitLossDetailRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\x12\x11\n\tdetail_id\x18\x02 \x01(\x03\"\xfb\x02\n\x11StockProfitDetail\x12\r\n\x05price\x18\x01 \x01(\x01\x12\x0c\n\x04\x63ost\x18\x02 \x01(\x03\x12\x10\n\x08interest\x18\x03 \x01(\x03\x12\x0c\n\x04\x64\x61te\x18\x04 \x01(\t\x12\x0c\n\x04\x63ode\x18\x05 \x01(\t\x12\x10\n\x08quantity\x18\x06 \x01(\x03\x12\x0c\n\x04\x64seq\x18\x07 \x01(\t\x12\x0b\n\x03\x66\x65\x65\x18\x08 \x01(\x03\x12\x0b\n\x03tax\x18\t \x01(\x03\x12\x1e\n\x08\x63urrency\x18\n \x01(\x0e\x32\x0c.v1.Currency\x12\x1d\n\x15rep_margintrading_amt\x18\x0b \x01(\x03\x12\x16\n\x0erep_collateral\x18\x0c \x01(\x03\x12\x12\n\nrep_margin\x18\r \x01(\x03\x12\x18\n\x10shortselling_fee\x18\x0e \x01(\x03\x12\x17\n\x0f\x65x_dividend_amt\x18\x0f \x01(\x03\x12!\n\ntrade_type\x18\x10 \x01(\x0e\x32\r.v1.TradeType\x12 \n\x04\x63ond\x18\x11 \x01(\x0e\x32\x12.v1.StockOrderCond\"\xf4\x01\n\x12\x46utureProfitDetail\x12\x1d\n\tdirection\x18\x01 \x01(\x0e\x32\n.v1.Action\x12\x12\n\nentry_date\x18\x02 \x01(\t\x12\x13\n\x0b\x65ntry_price\x18\x03 \x01(\x01\x12\x13\n\x0b\x63over_price\x18\x04 \x01(\x01\x12\x0b\n\x03pnl\x18\x05 \x01(\x03\x12\x0c\n\x04\x64\x61te\x18\x06 \x01(\t\x12\x0c\n\x04\x63ode\x18\x07 \x01(\t\x12\x10\n\x08quantity\x18\x08 \x01(\x03\x12\x0c\n\x04\x64seq\x18\t \x01(\t\x12\x0b\n\x03\x66\x65\x65\x18\n \x01(\x03\x12\x0b\n\x03tax\x18\x0b \x01(\x03\x12\x1e\n\x08\x63urrency\x18\x0c \x01(\x0e\x32\x0c.v1.Currency\"x\n\x0cProfitDetail\x12-\n\x0cstock_detail\x18\x01 \x01(\x0b\x32\x15.v1.StockProfitDetailH\x00\x12/\n\rfuture_detail\x18\x02 \x01(\x0b\x32\x16.v1.FutureProfitDetailH\x00\x42\x08\n\x06\x64\x65tail\"A\n\x1cListProfitLossDetailResponse\x12!\n\x07\x64\x65tails\x18\x01 \x03(\x0b\x32\x10.v1.ProfitDetail\"<\n\x1cListProfitLossSummaryRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"\x90\x02\n\x16StockProfitLossSummary\x12\x12\n\nentry_cost\x18\x01 \x01(\x03\x12\x12\n\ncover_cost\x18\x02 \x01(\x03\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x10\n\x08quantity\x18\x04 \x01(\x03\x12\x13\n\x0b\x65ntry_price\x18\x05 \x01(\x01\x12\x13\n\x0b\x63over_price\x18\x06 \x01(\x01\x12\x0b\n\x03pnl\x18\x07 \x01(\x01\x12\x1e\n\x08\x63urrency\x18\x08 \x01(\x0e\x32\x0c.v1.Currency\x12\x10\n\x08\x62uy_cost\x18\t \x01(\x03\x12\x11\n\tsell_cost\x18\n \x01(\x03\x12\x10\n\x08pr_ratio\x18\x0b \x01(\x01\x12 \n\x04\x63ond\x18\x0c \x01(\x0e\x32\x12.v1.StockOrderCond\"\xc9\x01\n\x17\x46utureProfitLossSummary\x12\x1d\n\tdirection\x18\x01 \x01(\x0e\x32\n.v1.Action\x12\x0b\n\x03tax\x18\x02 \x01(\x03\x12\x0b\n\x03\x66\x65\x65\x18\x03 \x01(\x03\x12\x0c\n\x04\x63ode\x18\x04 \x01(\t\x12\x10\n\x08quantity\x18\x05 \x01(\x03\x12\x13\n\x0b\x65ntry_price\x18\x06 \x01(\x01\x12\x13\n\x0b\x63over_price\x18\x07 \x01(\x01\x12\x0b\n\x03pnl\x18\x08 \x01(\x01\x12\x1e\n\x08\x63urrency\x18\t \x01(\x0e\x32\x0c.v1.Currency\"\x8a\x01\n\x11ProfitLossSummary\x12\x33\n\rstock_summary\x18\x01 \x01(\x0b\x32\x1a.v1.StockProfitLossSummaryH\x00\x12\x35\n\x0e\x66uture_summary\x18\x02 \x01(\x0b\x32\x1b.v1.FutureProfitLossSummaryH\x00\x42\t\n\x07summary\"I\n\x1dListProfitLossSummaryResponse\x12(\n\tsummaries\x18\x01 \x03(\x0b\x32\x15.v1.ProfitLossSummary\"5\n\x15GetSettlementsRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"\xaf\x01\n\nSettlement\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x01\x12\x0f\n\x07t_money\x18\x03 \x01(\x01\x12\r\n\x05t_day\x18\x04 \x01(\t\x12\x10\n\x08t1_money\x18\x05 \x01(\x01\x12\x0e\n\x06t1_day\x18\x06 \x01(\t\x12\x10\n\x08t2_money\x18\x07 \x01(\x01\x12\x0e\n\x06t2_day\x18\x08 \x01(\t\x12\x1f\n\x06status\x18\t \x01(\x0e\x32\x0f.v1.FetchStatus\"=\n\x16GetSettlementsResponse\x12#\n\x0bsettlements\x18\x01 \x03(\x0b\x32\x0e.v1.Settlement\"0\n\x10GetMarginRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"\xd8\x05\n\x06Margin\x12\x0e\n\x06\x65quity\x18\x01 \x01(\x01\x12\x18\n\x10\x61vailable_margin\x18\x02 \x01(\x01\x12\x16\n\x0einitial_margin\x18\x03 \x01(\x01\x12\x1a\n\x12maintenance_margin\x18\x04 \x01(\x01\x12\x19\n\x11yesterday_balance\x18\x05 \x01(\x01\x12\x15\n\rtoday_balance\x18\x06 \x01(\x01\x12\x1a\n\x12\x64\x65posit_withdrawal\x18\x07 \x01(\x01\x12\x0b\n\x03\x66\x65\x65\x18\x08 \x01(\x01\x12\x0b\n\x03tax\x18\t \x01(\x01\x12\x13\n\x0bmargin_call\x18\n \x01(\x01\x12\x16\n\x0erisk_indicator\x18\x0b \x01(\x01\x12#\n\x1broyalty_revenue_expenditure\x18\x0c \x01(\x01\x12\x15\n\requity_amount\x18\r \x01(\x01\x12#\n\x1boption_openbuy_market_value\x18\x0e \x01(\x01\x12$\n\x1coption_opensell_market_value\x18\x0f \x01(\x01\x12\x1c\n\x14option_open_position\x18\x10 \x01(\x01\x12 \n\x18option_settle_profitloss\x18\x11 \x01(\x01\x12\x1c\n\x14\x66uture_open_position\x18\x12 \x01(\x01\x12\"\n\x1atoday_future_open_position\x18\x13 \x01(\x01\x12 \n\x18\x66uture_settle_profitloss\x18\x14 \x01(\x01\x12\x13\n\x0bplus_margin\x18\x15 \x01(\x01\x12\x1d\n\x15plus_margin_indicator\x18\x16 \x01(\x01\x12\"\n\x1asecurity_collateral_amount\x18\x17 \x01(\x01\x12\x1c\n\x14order_margin_premium\x18\x18 \x01(\x01\x12\x19\n\x11\x63ollateral_amount\x18\x19 \x01(\x01\x12\x1f\n\x06status\x18\x1a \x01(\x0e\x32\x0f.v1.FetchStatus\"7\n\x17GetTradingLimitsRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"\xff\x01\n\rTradingLimits\x12\x15\n\rtrading_limit\x18\x01 \x01(\x03\x12\x14\n\x0ctrading_used\x18\x02 \x01(\x03\x12\x19\n\x11trading_available\x18\x03 \x01(\x03\x12\x14\n\x0cmargin_limit\x18\x04 \x01(\x03\x12\x13\n\x0bmargin_used\x18\x05 \x01(\x03\x12\x18\n\x10margin_available\x18\x06 \x01(\x03\x12\x13\n\x0bshort_limit\x18\x07 \x01(\x03\x12\x12\n\nshort_used\x18\x08 \x01(\x03\x12\x17\n\x0fshort_available\x18\t \x01(\x03\x12\x1f\n\x06status\x18\n \x01(\x0e\x32\x0f.v1.FetchStatus\"=\n\x1dGetStockReserveSummaryRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"5\n\x1cReserveStocksSummaryResponse\x12\x15\n\rresponse_json\x18\x01 \x01(\t\"<\n\x1cGetStockReserveDetailRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"4\n\x1bReserveStocksDetailResponse\x12\x15\n\rresponse_json\x18\x01 \x01(\t\"b\n\x13ReserveStockRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\x12\x1e\n\x08\x63ontract\x18\x02 \x01(\x0b\x32\x0c.v1.Contract\x12\r\n\x05share\x18\x03 \x01(\x03\"-\n\x14ReserveStockResponse\x12\x15\n\rresponse_json\x18\x01 \x01(\t\":\n\x1aGetEarmarkingDetailRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"4\n\x1b\x45\x61rmarkStocksDetailResponse\x12\x15\n\rresponse_json\x18\x01 \x01(\t\"v\n\x18ReserveEarmarkingRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\x12\x1e\n\x08\x63ontract\x18\x02 \x01(\x0b\x32\x0c.v1.Contract\x12\r\n\x05share\x18\x03 \x01(\x03\x12\r\n\x05price\x18\x04 \x01(\x01\"2\n\x19ReserveEarmarkingResponse\x12\x15\n\rresponse_json\x18\x01 \x01(\t\"-\n\x13GetSnapshotsRequest\x12\x16\n\x0e\x63ontract_codes\x18\x01 \x03(\t\"7\n\x14GetSnapshotsResponse\x12\x1f\n\tsnapshots\x18\x01 \x03(\x0b\x32\x0c.v1.Snapshot\"\xd0\x03\n\x08Snapshot\x12\n\n\x02ts\x18\x01 \x01(\x03\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x1e\n\x08\x65xchange\x18\x03 \x01(\x0e\x32\x0c.v1.Exchange\x12\x0c\n\x04open\x18\x04 \x01(\x01\x12\x0c\n\x04high\x18\x05 \x01(\x01\x12\x0b\n\x03low\x18\x06 \x01(\x01\x12\r\n\x05\x63lose\x18\x07 \x01(\x01\x12\x14\n\x0c\x63hange_price\x18\x08 \x01(\x01\x12\x13\n\x0b\x63hange_rate\x18\t \x01(\x01\x12\x15\n\raverage_price\x18\n \x01(\x01\x12\x0e\n\x06volume\x18\x0b \x01(\x03\x12\x14\n\x0ctotal_volume\x18\x0c \x01(\x03\x12\x0e\n\x06\x61mount\x18\r \x01(\x03\x12\x14\n\x0ctotal_amount\x18\x0e \x01(\x03\x12\x11\n\tbuy_price\x18\x0f \x01(\x01\x12\x12\n\nbuy_volume\x18\x10 \x01(\x01\x12\x12\n\nsell_price\x18\x11 \x01(\x01\x12\x13\n\x0bsell_volume\x18\x12 \x01(\x03\x12\x1f\n\ttick_type\x18\x13 \x01(\x0e\x32\x0c.v1.TickType\x12#\n\x0b\x63hange_type\x18\x14 \x01(\x0e\x32\x0e.v1.ChangeType\x12\x18\n\x10yesterday_volume\x18\x15 \x01(\x01\x12\x14\n\x0cvolume_ratio\x18\x16 \x01(\x01\"6\n\x0fGetTicksRequest\x12\x15\n\rcontract_code\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\"\x93\x01\n\x05Ticks\x12\n\n\x02ts\x18\x01 \x03(\x03\x12\r\n\x05\x63lose\x18\x02 \x03(\x01\x12\x0e\n\x06volume\x18\x03 \x03(\x03\x12\x11\n\tbid_price\x18\x04 \x03(\x01\x12\x12\n\nbid_volume\x18\x05 \x03(\x03\x12\x11\n\task_price\x18\x06 \x03(\x01\x12\x12\n\nask_volume\x18\x07 \x03(\x03\x12\x11\n\ttick_type\x18\x08 \x03(\x05\"N\n\x0fGetKbarsRequest\x12\x15\n\rcontract_code\x18\x01 \x01(\t\x12\x12\n\nstart_date\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x03 \x01(\t\"k\n\x05Kbars\x12\n\n\x02ts\x18\x01 \x03(\x03\x12\x0c\n\x04open\x18\x02 \x03(\x01\x12\x0c\n\x04high\x18\x03 \x03(\x01\x12\x0b\n\x03low\x18\x04 \x03(\x01\x12\r\n\x05\x63lose\x18\x05 \x03(\x01\x12\x0e\n\x06volume\x18\x06 \x03(\x03\x12\x0e\n\x06\x61mount\x18\x07 \x03(\x01\"%\n\x15GetDailyQuotesRequest\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\"\x96\x01\n\x0b\x44\x61ilyQuotes\x12\x0c\n\x04\x63ode\x18\x01 \x03(\t\x12\x0c\n\x04open\x18\x02 \x03(\x01\x12\x0c\n\x04high\x18\x03 \x03(\x01\x12\x0b\n\x03low\x18\x04 \x03(\x01\x12\r\n\x05\x63lose\x18\x05 \x03(\x01\x12\x0e\n\x06volume\x18\x06 \x03(\x03\x12\x0c\n\x04\x64\x61te\x18\x07 \x03(\t\x12\x13\n\x0btransaction\x18\x08 \x03(\x03\x12\x0e\n\x06\x61mount\x18\t \x03(\x03\"/\n\x15\x43reditEnquiresRequest\x12\x16\n\x0e\x63ontract_codes\x18\x01 \x03(\t\"D\n\x16\x43reditEnquiresResponse\x12*\n\x0f\x63redit_enquires\x18\x01 \x03(\x0b\x32\x11.v1.CreditEnquire\"o\n\rCreditEnquire\x12\x10\n\x08stock_id\x18\x01 \x01(\t\x12\x13\n\x0bmargin_unit\x18\x02 \x01(\x03\x12\x12\n\nshort_unit\x18\x03 \x01(\x03\x12\x13\n\x0bupdate_time\x18\x04 \x01(\t\x12\x0e\n\x06system\x18\x05 \x01(\t\"5\n\x1bGetShortStockSourcesRequest\x12\x16\n\x0e\x63ontract_codes\x18\x01 \x03(\t\"E\n\x1cGetShortStockSourcesResponse\x12%\n\x07sources\x18\x01 \x03(\x0b\x32\x14.v1.ShortStockSource\"H\n\x10ShortStockSource\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x1a\n\x12short_stock_source\x18\x02 \x01(\x03\x12\n\n\x02ts\x18\x03 \x01(\x03\"k\n\x12GetScannersRequest\x12%\n\x0cscanner_type\x18\x01 \x01(\x0e\x32\x0f.v1.ScannerType\x12\x11\n\tascending\x18\x02 \x01(\x08\x12\x0c\n\x04\x64\x61te\x18\x03 \x01(\t\x12\r\n\x05\x63ount\x18\x04 \x01(\x05\"8\n\x13GetScannersResponse\x12!\n\x08scanners\x18\x01 \x03(\x0b\x32\x0f.v1.ScannerItem\"\xb5\x04\n\x0bScannerItem\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\n\n\x02ts\x18\x04 \x01(\x03\x12\x0c\n\x04open\x18\x05 \x01(\x01\x12\x0c\n\x04high\x18\x06 \x01(\x01\x12\x0b\n\x03low\x18\x07 \x01(\x01\x12\r\n\x05\x63lose\x18\x08 \x01(\x01\x12\x13\n\x0bprice_range\x18\t \x01(\x01\x12\x1f\n\ttick_type\x18\n \x01(\x0e\x32\x0c.v1.TickType\x12\x14\n\x0c\x63hange_price\x18\x0b \x01(\x01\x12#\n\x0b\x63hange_type\x18\x0c \x01(\x0e\x32\x0e.v1.ChangeType\x12\x15\n\raverage_price\x18\r \x01(\x01\x12\x0e\n\x06volume\x18\x0e \x01(\x03\x12\x14\n\x0ctotal_volume\x18\x0f \x01(\x03\x12\x0e\n\x06\x61mount\x18\x10 \x01(\x03\x12\x14\n\x0ctotal_amount\x18\x11 \x01(\x03\x12\x18\n\x10yesterday_volume\x18\x12 \x01(\x03\x12\x14\n\x0cvolume_ratio\x18\x13 \x01(\x01\x12\x11\n\tbuy_price\x18\x14 \x01(\x01\x12\x12\n\nbuy_volume\x18\x15 \x01(\x03\x12\x12\n\nsell_price\x18\x16 \x01(\x01\x12\x13\n\x0bsell_volume\x18\x17 \x01(\x03\x12\x12\n\nbid_orders\x18\x18 \x01(\x03\x12\x13\n\x0b\x62id_volumes\x18\x19 \x01(\x03\x12\x12\n\nask_orders\x18\x1a \x01(\x03\x12\x13\n\x0b\x61sk_volumes\x18\x1b \x01(\x03\x12\x12\n\nrank_value\x18\x1c \x01(\x01\"\xb8\x01\n\x06Punish\x12\x0c\n\x04\x63ode\x18\x01 \x03(\t\x12\x12\n\nstart_date\x18\x02 \x03(\t\x12\x10\n\x08\x65nd_date\x18\x03 \x03(\t\x12\x10\n\x08interval\x18\x04 \x03(\t\x12\x12\n\nupdated_at\x18\x05 \x03(\t\x12\x12\n\nunit_limit\x18\x06 \x03(\x01\x12\x13\n\x0btotal_limit\x18\x07 \x03(\x01\x12\x13\n\x0b\x64\x65scription\x18\x08 \x03(\t\x12\x16\n\x0e\x61nnounced_date\x18\t \x03(\t\"a\n\x06Notice\x12\x0c\n\x04\x63ode\x18\x01 \x03(\t\x12\x0e\n\x06reason\x18\x02 \x03(\t\x12\x12\n\nupdated_at\x18\x03 \x03(\t\x12\r\n\x05\x63lose\x18\x04 \x03(\x01\x12\x16\n\x0e\x61nnounced_date\x18\x05 \x03(\t\"2\n\x15\x46\x65tchContractsRequest\x12\x19\n\x11\x63ontract_download\x18\x01 \x01(\x08\"J\n\x11\x41\x63tivateCARequest\x12\x0f\n\x07\x63\x61_path\x18\x01 \x01(\t\x12\x11\n\tca_passwd\x18\x02 \x01(\t\x12\x11\n\tperson_id\x18\x03 \x01(\t\"%\n\x12\x41\x63tivateCAResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"+\n\x16GetCAExpireTimeRequest\x12\x11\n\tperson_id\x18\x01 \x01(\t\".\n\x17GetCAExpireTimeResponse\x12\x13\n\x0b\x65xpire_time\x18\x01 \x01(\t\"5\n\x15SubscribeTradeRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\")\n\x16SubscribeTradeResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"7\n\x17UnsubscribeTradeRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"+\n\x18UnsubscribeTradeResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08*A\n\x06\x41\x63tion\x12\x16\n\x12\x41\x43TION_UNSPECIFIED\x10\x00\x12\x0e\n\nACTION_BUY\x10\x01\x12\x0f\n\x0b\x41\x43TION_SELL\x10\x02*c\n\tOrderType\x12\x1a\n\x16ORDER_TYPE_UNSPECIFIED\x10\x00\x12\x12\n\x0eORDER_TYPE_ROD\x10\x01\x12\x12\n\x0eORDER_TYPE_IOC\x10\x02\x12\x12\n\x0eORDER_TYPE_FOK\x10\x03*\x82\x01\n\x0eStockPriceType\x12 \n\x1cSTOCK_PRICE_TYPE_UNSPECIFIED\x10\x00\x12\x18\n\x14STOCK_PRICE_TYPE_LMT\x10\x01\x12\x18\n\x14STOCK_PRICE_TYPE_MKT\x10\x02\x12\x1a\n\x16STOCK_PRICE_TYPE_CLOSE\x10\x03*\xc3\x01\n\rStockOrderLot\x12\x1f\n\x1bSTOCK_ORDER_LOT_UNSPECIFIED\x10\x00\x12\x1a\n\x16STOCK_ORDER_LOT_COMMON\x10\x01\x12\x1e\n\x1aSTOCK_ORDER_LOT_BLOCKTRADE\x10\x02\x12\x1a\n\x16STOCK_ORDER_LOT_FIXING\x10\x03\x12\x17\n\x13STOCK_ORDER_LOT_ODD\x10\x04\x12 \n\x1cSTOCK_ORDER_LOT_INTRADAY_ODD\x10\x05*\xd1\x01\n\x0eStockOrderCond\x12 \n\x1cSTOCK_ORDER_COND_UNSPECIFIED\x10\x00\x12\x19\n\x15STOCK_ORDER_COND_CASH\x10\x01\x12\x1c\n\x18STOCK_ORDER_COND_NETTING\x10\x02\x12\"\n\x1eSTOCK_ORDER_COND_MARGINTRADING\x10\x03\x12!\n\x1dSTOCK_ORDER_COND_SHORTSELLING\x10\x04\x12\x1d\n\x19STOCK_ORDER_COND_EMERGING\x10\x05*\x8a\x01\n\x10\x46uturesPriceType\x12\"\n\x1e\x46UTURES_PRICE_TYPE_UNSPECIFIED\x10\x00\x12\x1a\n\x16\x46UTURES_PRICE_TYPE_LMT\x10\x01\x12\x1a\n\x16\x46UTURES_PRICE_TYPE_MKT\x10\x02\x12\x1a\n\x16\x46UTURES_PRICE_TYPE_MKP\x10\x03*\x97\x01\n\rFuturesOCType\x12\x1e\n\x1a\x46UTURES_OCTYPE_UNSPECIFIED\x10\x00\x12\x17\n\x13\x46UTURES_OCTYPE_AUTO\x10\x01\x12\x16\n\x12\x46UTURES_OCTYPE_NEW\x10\x02\x12\x18\n\x14\x46UTURES_OCTYPE_COVER\x10\x03\x12\x1b\n\x17\x46UTURES_OCTYPE_DAYTRADE\x10\x04*\x89\x01\n\x0cSecurityType\x12\x1d\n\x19SECURITY_TYPE_UNSPECIFIED\x10\x00\x12\x15\n\x11SECURITY_TYPE_IND\x10\x01\x12\x15\n\x11SECURITY_TYPE_STK\x10\x02\x12\x15\n\x11SECURITY_TYPE_FUT\x10\x03\x12\x15\n\x11SECURITY_TYPE_OPT\x10\x04*o\n\x08\x45xchange\x12\x18\n\x14\x45XCHANGE_UNSPECIFIED\x10\x00\x12\x10\n\x0c\x45XCHANGE_TSE\x10\x01\x12\x10\n\x0c\x45XCHANGE_OTC\x10\x02\x12\x10\n\x0c\x45XCHANGE_OES\x10\x03\x12\x13\n\x0f\x45XCHANGE_TAIFEX\x10\x04*\x8c\x03\n\x08\x43urrency\x12\x18\n\x14\x43URRENCY_UNSPECIFIED\x10\x00\x12\x10\n\x0c\x43URRENCY_TWD\x10\x01\x12\x10\n\x0c\x43URRENCY_USD\x10\x02\x12\x10\n\x0c\x43URRENCY_HKD\x10\x03\x12\x10\n\x0c\x43URRENCY_GBP\x10\x04\x12\x10\n\x0c\x43URRENCY_AUD\x10\x05\x12\x10\n\x0c\x43URRENCY_CAD\x10\x06\x12\x10\n\x0c\x43URRENCY_SGD\x10\x07\x12\x10\n\x0c\x43URRENCY_CHF\x10\x08\x12\x10\n\x0c\x43URRENCY_JPY\x10\t\x12\x10\n\x0c\x43URRENCY_ZAR\x10\n\x12\x10\n\x0c\x43URRENCY_SEK\x10\x0b\x12\x10\n\x0c\x43URRENCY_NZD\x10\x0c\x12\x10\n\x0c\x43URRENCY_THB\x10\r\x12\x10\n\x0c\x43URRENCY_PHP\x10\x0e\x12\x10\n\x0c\x43URRENCY_IDR\x10\x0f\x12\x10\n\x0c\x43URRENCY_EUR\x10\x10\x12\x10\n\x0c\x43URRENCY_KRW\x10\x11\x12\x10\n\x0c\x43URRENCY_VND\x10\x12\x12\x10\n\x0c\x43URRENCY_MYR\x10\x13\x12\x10\n\x0c\x43URRENCY_CNY\x10\x14*m\n\x0bOptionRight\x12\x1c\n\x18OPTION_RIGHT_UNSPECIFIED\x10\x00\x12\x13\n\x0fOPTION_RIGHT_NO\x10\x01\x12\x15\n\x11OPTION_RIGHT_CALL\x10\x02\x12\x14\n\x10OPTION_RIGHT_PUT\x10\x03*\xd1\x01\n\x06Status\x12\x16\n\x12STATUS_UNSPECIFIED\x10\x00\x12\x14\n\x10STATUS_CANCELLED\x10\x01\x12\x11\n\rSTATUS_FILLED\x10\x02\x12\x15\n\x11STATUS_PARTFILLED\x10\x03\x12\x13\n\x0fSTATUS_INACTIVE\x10\x04\x12\x11\n\rSTATUS_FAILED\x10\x05\x12\x18\n\x14STATUS_PENDINGSUBMIT\x10\x06\x12\x17\n\x13STATUS_PRESUBMITTED\x10\x07\x12\x14\n\x10STATUS_SUBMITTED\x10\x08*\x9b\x01\n\nOrderState\x12\x1b\n\x17ORDER_STATE_UNSPECIFIED\x10\x00\x12\x19\n\x15ORDER_STATE_STOCKDEAL\x10\x01\x12\x1a\n\x16ORDER_STATE_STOCKORDER\x10\x02\x12\x1c\n\x18ORDER_STATE_FUTURESORDER\x10\x03\x12\x1b\n\x17ORDER_STATE_FUTURESDEAL\x10\x04*i\n\tQuoteType\x12\x1a\n\x16QUOTE_TYPE_UNSPECIFIED\x10\x00\x12\x13\n\x0fQUOTE_TYPE_TICK\x10\x01\x12\x15\n\x11QUOTE_TYPE_BIDASK\x10\x02\x12\x14\n\x10QUOTE_TYPE_QUOTE\x10\x03*C\n\x0cQuoteVersion\x12\x1d\n\x19QUOTE_VERSION_UNSPECIFIED\x10\x00\x12\x14\n\x10QUOTE_VERSION_V1\x10\x01*a\n\x08\x44\x61yTrade\x12\x19\n\x15\x44\x41Y_TRADE_UNSPECIFIED\x10\x00\x12\x11\n\rDAY_TRADE_YES\x10\x01\x12\x15\n\x11\x44\x41Y_TRADE_ONLYBUY\x10\x02\x12\x10\n\x0c\x44\x41Y_TRADE_NO\x10\x03*^\n\x08TickType\x12\x19\n\x15TICK_TYPE_UNSPECIFIED\x10\x00\x12\x10\n\x0cTICK_TYPE_NO\x10\x01\x12\x11\n\rTICK_TYPE_BUY\x10\x02\x12\x12\n\x0eTICK_TYPE_SELL\x10\x03*\xa2\x01\n\nChangeType\x12\x1b\n\x17\x43HANGE_TYPE_UNSPECIFIED\x10\x00\x12\x17\n\x13\x43HANGE_TYPE_LIMITUP\x10\x01\x12\x12\n\x0e\x43HANGE_TYPE_UP\x10\x02\x12\x19\n\x15\x43HANGE_TYPE_UNCHANGED\x10\x03\x12\x14\n\x10\x43HANGE_TYPE_DOWN\x10\x04\x12\x19\n\x15\x43HANGE_TYPE_LIMITDOWN\x10\x05*=\n\x04Unit\x12\x14\n\x10UNIT_UNSPECIFIED\x10\x00\x12\x0f\n\x0bUNIT_COMMON\x10\x01\x12\x0e\n\nUNIT_SHARE\x10\x02*W\n\tTradeType\x12\x1a\n\x16TRADE_TYPE_UNSPECIFIED\x10\x00\x12\x15\n\x11TRADE_TYPE_COMMON\x10\x01\x12\x17\n\x13TRADE_TYPE_DAYTRADE\x10\x02*\xea\x01\n\x0bScannerType\x12\x1c\n\x18SCANNER_TYPE_UNSPECIFIED\x10\x00\x12\"\n\x1eSCANNER_TYPE_CHANGEPERCENTRANK\x10\x01\x12 \n\x1cSCANNER_TYPE_CHANGEPRICERANK\x10\x02\x12\x1d\n\x19SCANNER_TYPE_DAYRANGERANK\x10\x03\x12\x1b\n\x17SCANNER_TYPE_VOLUMERANK\x10\x04\x12\x1b\n\x17SCANNER_TYPE_AMOUNTRANK\x10\x05\x12\x1e\n\x1aSCANNER_TYPE_TICKCOUNTRANK\x10\x06*\x8f\x01\n\x0eTicksQueryType\x12 \n\x1cTICKS_QUERY_TYPE_UNSPECIFIED\x10\x00\x12\x1b\n\x17TICKS_QUERY_TYPE_ALLDAY\x10\x01\x12\x1e\n\x1aTICKS_QUERY_TYPE_RANGETIME\x10\x02\x12\x1e\n\x1aTICKS_QUERY_TYPE_LASTCOUNT\x10\x03*\\\n\x0b\x46\x65tchStatus\x12\x1c\n\x18\x46\x45TCH_STATUS_UNSPECIFIED\x10\x00\x12\x18\n\x14\x46\x45TCH_STATUS_SUCCESS\x10\x01\x12\x15\n\x11\x46\x45TCH_STATUS_FAIL\x10\x02\x32\xfe\x15\n\x0fShioajiProvider\x12.\n\x05Login\x12\x10.v1.LoginRequest\x1a\x11.v1.LoginResponse\"\x00\x12)\n\x06Logout\x12\t.v1.Empty\x1a\x12.v1.LogoutResponse\"\x00\x12(\n\x08GetUsage\x12\t.v1.Empty\x1a\x0f.v1.UsageStatus\"\x00\x12\x35\n\x0cListAccounts\x12\t.v1.Empty\x1a\x18.v1.ListAccountsResponse\"\x00\x12\x34\n\x11GetAccountBalance\x12\t.v1.Empty\x1a\x12.v1.AccountBalance\"\x00\x12\x30\n\nPlaceOrder\x12\x15.v1.PlaceOrderRequest\x1a\t.v1.Trade\"\x00\x12?\n\x0fPlaceComboOrder\x12\x1a.v1.PlaceComboOrderRequest\x1a\x0e.v1.ComboTrade\"\x00\x12\x32\n\x0bUpdateOrder\x12\x16.v1.UpdateOrderRequest\x1a\t.v1.Trade\"\x00\x12\x32\n\x0b\x43\x61ncelOrder\x12\x16.v1.CancelOrderRequest\x1a\t.v1.Trade\"\x00\x12\x41\n\x10\x43\x61ncelComboOrder\x12\x1b.v1.CancelComboOrderRequest\x1a\x0e.v1.ComboTrade\"\x00\x12\x34\n\x0cUpdateStatus\x12\x17.v1.UpdateStatusRequest\x1a\t.v1.Empty\"\x00\x12\x39\n\x11UpdateComboStatus\x12\x17.v1.UpdateStatusRequest\x1a\t.v1.Empty\"\x00\x12\x31\n\nListTrades\x12\t.v1.Empty\x1a\x16.v1.ListTradesResponse\"\x00\x12;\n\x0fListComboTrades\x12\t.v1.Empty\x1a\x1b.v1.ListComboTradesResponse\"\x00\x12X\n\x13GetOrderDealRecords\x12\x1e.v1.GetOrderDealRecordsRequest\x1a\x1f.v1.GetOrderDealRecordsResponse\"\x00\x12\x46\n\rListPositions\x12\x18.v1.ListPositionsRequest\x1a\x19.v1.ListPositionsResponse\"\x00\x12U\n\x12ListPositionDetail\x12\x1d.v1.ListPositionDetailRequest\x1a\x1e.v1.ListPositionDetailResponse\"\x00\x12I\n\x0eListProfitLoss\x12\x19.v1.ListProfitLossRequest\x1a\x1a.v1.ListProfitLossResponse\"\x00\x12[\n\x14ListProfitLossDetail\x12\x1f.v1.ListProfitLossDetailRequest\x1a .v1.ListProfitLossDetailResponse\"\x00\x12^\n\x15ListProfitLossSummary\x12 .v1.ListProfitLossSummaryRequest\x1a!.v1.ListProfitLossSummaryResponse\"\x00\x12I\n\x0eGetSettlements\x12\x19.v1.GetSettlementsRequest\x1a\x1a.v1.GetSettlementsResponse\"\x00\x12J\n\x0fListSettlements\x12\x19.v1.GetSettlementsRequest\x1a\x1a.v1.GetSettlementsResponse\"\x00\x12/\n\tGetMargin\x12\x14.v1.GetMarginRequest\x1a\n.v1.Margin\"\x00\x12\x44\n\x10GetTradingLimits\x12\x1b.v1.GetTradingLimitsRequest\x1a\x11.v1.TradingLimits\"\x00\x12_\n\x16GetStockReserveSummary\x12!.v1.GetStockReserveSummaryRequest\x1a .v1.ReserveStocksSummaryResponse\"\x00\x12\\\n\x15GetStockReserveDetail\x12 .v1.GetStockReserveDetailRequest\x1a\x1f.v1.ReserveStocksDetailResponse\"\x00\x12\x43\n\x0cReserveStock\x12\x17.v1.ReserveStockRequest\x1a\x18.v1.ReserveStockResponse\"\x00\x12X\n\x13GetEarmarkingDetail\x12\x1e.v1.GetEarmarkingDetailRequest\x1a\x1f.v1.EarmarkStocksDetailResponse\"\x00\x12R\n\x11ReserveEarmarking\x12\x1c.v1.ReserveEarmarkingRequest\x1a\x1d.v1.ReserveEarmarkingResponse\"\x00\x12\x43\n\x0cGetSnapshots\x12\x17.v1.GetSnapshotsRequest\x1a\x18.v1.GetSnapshotsResponse\"\x00\x12,\n\x08GetTicks\x12\x13.v1.GetTicksRequest\x1a\t.v1.Ticks\"\x00\x12,\n\x08GetKbars\x12\x13.v1.GetKbarsRequest\x1a\t.v1.Kbars\"\x00\x12>\n\x0eGetDailyQuotes\x12\x19.v1.GetDailyQuotesRequest\x1a\x0f.v1.DailyQuotes\"\x00\x12I\n\x0e\x43reditEnquires\x12\x19.v1.CreditEnquiresRequest\x1a\x1a.v1.CreditEnquiresResponse\"\x00\x12[\n\x14GetShortStockSources\x12\x1f.v1.GetShortStockSourcesRequest\x1a .v1.GetShortStockSourcesResponse\"\x00\x12@\n\x0bGetScanners\x12\x16.v1.GetScannersRequest\x1a\x17.v1.GetScannersResponse\"\x00\x12$\n\tGetPunish\x12\t.v1.Empty\x1a\n.v1.Punish\"\x00\x12$\n\tGetNotice\x12\t.v1.Empty\x1a\n.v1.Notice\"\x00\x12\x38\n\x0e\x46\x65tchContracts\x12\x19.v1.FetchContractsRequest\x1a\t.v1.Empty\"\x00\x12L\n\x0fGetCAExpireTime\x12\x1a.v1.GetCAExpireTimeRequest\x1a\x1b.v1.GetCAExpireTimeResponse\"\x00\x12I\n\x0eSubscribeTrade\x12\x19.v1.SubscribeTradeRequest\x1a\x1a.v1.SubscribeTradeResponse\"\x00\x12O\n\x10UnsubscribeTrade\x12\x1b.v1.UnsubscribeTradeRequest\x1a\x1c.v1.UnsubscribeTradeResponse\"\x00\x42\x1aZ\x18phoenix/processor/pkg/pbb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0eprovider.proto\x12\x02v1\"\x07\n\x05\x45mpty\"3\n\x0cLoginRequest\x12\x0f\n\x07\x61pi_key\x18\x01 \x01(\t\x12\x12\n\nsecret_key\x18\x02 \x01(\t\".\n\rLoginResponse\x12\x1d\n\x08\x61\x63\x63ounts\x18\x01 \x03(\x0b\x32\x0b.v1.Account\"!\n\x0eLogoutResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"{\n\x07\x41\x63\x63ount\x12\x14\n\x0c\x61\x63\x63ount_type\x18\x01 \x01(\t\x12\x11\n\tperson_id\x18\x02 \x01(\t\x12\x11\n\tbroker_id\x18\x03 \x01(\t\x12\x12\n\naccount_id\x18\x04 \x01(\t\x12\x10\n\x08username\x18\x05 \x01(\t\x12\x0e\n\x06signed\x18\x06 \x01(\x08\"_\n\x0bUsageStatus\x12\x13\n\x0b\x63onnections\x18\x01 \x01(\x03\x12\r\n\x05\x62ytes\x18\x02 \x01(\x03\x12\x13\n\x0blimit_bytes\x18\x03 \x01(\x03\x12\x17\n\x0fremaining_bytes\x18\x04 \x01(\x03\"5\n\x14ListAccountsResponse\x12\x1d\n\x08\x61\x63\x63ounts\x18\x01 \x03(\x0b\x32\x0b.v1.Account\"d\n\x0e\x41\x63\x63ountBalance\x12\x13\n\x0b\x61\x63\x63_balance\x18\x01 \x01(\x01\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\x12\x0e\n\x06\x65rrmsg\x18\x03 \x01(\t\x12\x1f\n\x06status\x18\x04 \x01(\x0e\x32\x0f.v1.FetchStatus\"\xb4\x04\n\x08\x43ontract\x12\'\n\rsecurity_type\x18\x01 \x01(\x0e\x32\x10.v1.SecurityType\x12\x1e\n\x08\x65xchange\x18\x02 \x01(\x0e\x32\x0c.v1.Exchange\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x0e\n\x06symbol\x18\x04 \x01(\t\x12\x0c\n\x04name\x18\x05 \x01(\t\x12\x1e\n\x08\x63urrency\x18\x06 \x01(\x0e\x32\x0c.v1.Currency\x12\x10\n\x08\x63\x61tegory\x18\x07 \x01(\t\x12\x16\n\x0e\x64\x65livery_month\x18\x08 \x01(\t\x12\x15\n\rdelivery_date\x18\t \x01(\t\x12\x14\n\x0cstrike_price\x18\n \x01(\x01\x12%\n\x0coption_right\x18\x0b \x01(\x0e\x32\x0f.v1.OptionRight\x12\x17\n\x0funderlying_kind\x18\x0c \x01(\t\x12\x17\n\x0funderlying_code\x18\r \x01(\t\x12\x0c\n\x04unit\x18\x0e \x01(\x01\x12\x12\n\nmultiplier\x18\x0f \x01(\x03\x12\x10\n\x08limit_up\x18\x10 \x01(\x01\x12\x12\n\nlimit_down\x18\x11 \x01(\x01\x12\x11\n\treference\x18\x12 \x01(\x01\x12\x13\n\x0bupdate_date\x18\x13 \x01(\t\x12\x1e\n\x16margin_trading_balance\x18\x14 \x01(\x03\x12\x1d\n\x15short_selling_balance\x18\x15 \x01(\x03\x12\x1f\n\tday_trade\x18\x16 \x01(\x0e\x32\x0c.v1.DayTrade\x12\x13\n\x0btarget_code\x18\x17 \x01(\t\",\n\rComboContract\x12\x1b\n\x04legs\x18\x01 \x03(\x0b\x32\r.v1.ComboBase\"\xd1\x04\n\tComboBase\x12\'\n\rsecurity_type\x18\x01 \x01(\x0e\x32\x10.v1.SecurityType\x12\x1e\n\x08\x65xchange\x18\x02 \x01(\x0e\x32\x0c.v1.Exchange\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x0e\n\x06symbol\x18\x04 \x01(\t\x12\x0c\n\x04name\x18\x05 \x01(\t\x12\x1e\n\x08\x63urrency\x18\x06 \x01(\x0e\x32\x0c.v1.Currency\x12\x10\n\x08\x63\x61tegory\x18\x07 \x01(\t\x12\x16\n\x0e\x64\x65livery_month\x18\x08 \x01(\t\x12\x15\n\rdelivery_date\x18\t \x01(\t\x12\x14\n\x0cstrike_price\x18\n \x01(\x01\x12%\n\x0coption_right\x18\x0b \x01(\x0e\x32\x0f.v1.OptionRight\x12\x17\n\x0funderlying_kind\x18\x0c \x01(\t\x12\x17\n\x0funderlying_code\x18\r \x01(\t\x12\x0c\n\x04unit\x18\x0e \x01(\x01\x12\x12\n\nmultiplier\x18\x0f \x01(\x03\x12\x10\n\x08limit_up\x18\x10 \x01(\x01\x12\x12\n\nlimit_down\x18\x11 \x01(\x01\x12\x11\n\treference\x18\x12 \x01(\x01\x12\x13\n\x0bupdate_date\x18\x13 \x01(\t\x12\x1e\n\x16margin_trading_balance\x18\x14 \x01(\x03\x12\x1d\n\x15short_selling_balance\x18\x15 \x01(\x03\x12\x1f\n\tday_trade\x18\x16 \x01(\x0e\x32\x0c.v1.DayTrade\x12\x13\n\x0btarget_code\x18\x17 \x01(\t\x12\x1a\n\x06\x61\x63tion\x18\x18 \x01(\x0e\x32\n.v1.Action\"\xee\x02\n\x05Order\x12\x1a\n\x06\x61\x63tion\x18\x01 \x01(\x0e\x32\n.v1.Action\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x10\n\x08quantity\x18\x03 \x01(\x03\x12\n\n\x02id\x18\x04 \x01(\t\x12\r\n\x05seqno\x18\x05 \x01(\t\x12\r\n\x05ordno\x18\x06 \x01(\t\x12\x1c\n\x07\x61\x63\x63ount\x18\x07 \x01(\x0b\x32\x0b.v1.Account\x12\x12\n\nprice_type\x18\x08 \x01(\t\x12!\n\norder_type\x18\t \x01(\x0e\x32\r.v1.OrderType\x12!\n\x06octype\x18\n \x01(\x0e\x32\x11.v1.FuturesOCType\x12$\n\torder_lot\x18\x0b \x01(\x0e\x32\x11.v1.StockOrderLot\x12&\n\norder_cond\x18\x0c \x01(\x0e\x32\x12.v1.StockOrderCond\x12\x16\n\x0e\x64\x61ytrade_short\x18\r \x01(\x08\x12\x14\n\x0c\x63ustom_field\x18\x0e \x01(\t\x12\n\n\x02\x63\x61\x18\x0f \x01(\t\"\x8d\x02\n\nComboOrder\x12\x1a\n\x06\x61\x63tion\x18\x01 \x01(\x0e\x32\n.v1.Action\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x10\n\x08quantity\x18\x03 \x01(\x03\x12\n\n\x02id\x18\x04 \x01(\t\x12\r\n\x05seqno\x18\x05 \x01(\t\x12\r\n\x05ordno\x18\x06 \x01(\t\x12\x1c\n\x07\x61\x63\x63ount\x18\x07 \x01(\x0b\x32\x0b.v1.Account\x12\x12\n\nprice_type\x18\x08 \x01(\t\x12!\n\norder_type\x18\t \x01(\x0e\x32\r.v1.OrderType\x12!\n\x06octype\x18\n \x01(\x0e\x32\x11.v1.FuturesOCType\x12\x14\n\x0c\x63ustom_field\x18\x0b \x01(\t\x12\n\n\x02\x63\x61\x18\x0c \x01(\t\"\x8f\x02\n\x0bOrderStatus\x12\n\n\x02id\x18\x01 \x01(\t\x12\x1a\n\x06status\x18\x02 \x01(\x0e\x32\n.v1.Status\x12\x13\n\x0bstatus_code\x18\x03 \x01(\t\x12\x16\n\x0eorder_datetime\x18\x04 \x01(\t\x12\x15\n\rdeal_quantity\x18\x05 \x01(\x03\x12\x17\n\x0f\x63\x61ncel_quantity\x18\x06 \x01(\x03\x12\x0e\n\x06web_id\x18\x07 \x01(\t\x12\x0b\n\x03msg\x18\x08 \x01(\t\x12\x15\n\rmodified_time\x18\t \x01(\t\x12\x16\n\x0emodified_price\x18\n \x01(\x01\x12\x16\n\x0eorder_quantity\x18\x0b \x01(\x03\x12\x17\n\x05\x64\x65\x61ls\x18\x0c \x03(\x0b\x32\x08.v1.Deal\"@\n\x04\x44\x65\x61l\x12\x0b\n\x03seq\x18\x01 \x01(\t\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x10\n\x08quantity\x18\x03 \x01(\x03\x12\n\n\x02ts\x18\x04 \x01(\x01\"b\n\x05Trade\x12\x1e\n\x08\x63ontract\x18\x01 \x01(\x0b\x32\x0c.v1.Contract\x12\x18\n\x05order\x18\x02 \x01(\x0b\x32\t.v1.Order\x12\x1f\n\x06status\x18\x03 \x01(\x0b\x32\x0f.v1.OrderStatus\"q\n\nComboTrade\x12#\n\x08\x63ontract\x18\x01 \x01(\x0b\x32\x11.v1.ComboContract\x12\x1d\n\x05order\x18\x02 \x01(\x0b\x32\x0e.v1.ComboOrder\x12\x1f\n\x06status\x18\x03 \x01(\x0b\x32\x0f.v1.OrderStatus\"M\n\x11PlaceOrderRequest\x12\x1e\n\x08\x63ontract\x18\x01 \x01(\x0b\x32\x0c.v1.Contract\x12\x18\n\x05order\x18\x02 \x01(\x0b\x32\t.v1.Order\"P\n\x12PlaceOrdersRequest\x12%\n\x06orders\x18\x01 \x03(\x0b\x32\x15.v1.PlaceOrderRequest\x12\x13\n\x0bparallelism\x18\x02 \x01(\x05\";\n\x10PlaceOrderResult\x12\x18\n\x05trade\x18\x01 \x01(\x0b\x32\t.v1.Trade\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"<\n\x13PlaceOrdersResponse\x12%\n\x07results\x18\x01 \x03(\x0b\x32\x14.v1.PlaceOrderResult\"b\n\x16PlaceComboOrderRequest\x12)\n\x0e\x63ombo_contract\x18\x01 \x01(\x0b\x32\x11.v1.ComboContract\x12\x1d\n\x05order\x18\x02 \x01(\x0b\x32\x0e.v1.ComboOrder\"O\n\x12UpdateOrderRequest\x12\x18\n\x05trade\x18\x01 \x01(\x0b\x32\t.v1.Trade\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x10\n\x08quantity\x18\x03 \x01(\x03\".\n\x12\x43\x61ncelOrderRequest\x12\x18\n\x05trade\x18\x01 \x01(\x0b\x32\t.v1.Trade\"\x94\x01\n\x13\x43\x61ncelOrdersRequest\x12\x0b\n\x03\x61ll\x18\x01 \x01(\x08\x12\r\n\x05\x63odes\x18\x02 \x03(\t\x12\x1a\n\x06\x61\x63tion\x18\x03 \x01(\x0e\x32\n.v1.Action\x12\x1c\n\x08statuses\x18\x04 \x03(\x0e\x32\n.v1.Status\x12\x12\n\naccount_id\x18\x05 \x01(\t\x12\x13\n\x0bparallelism\x18\x06 \x01(\x05\"<\n\x11\x43\x61ncelOrderResult\x12\x18\n\x05trade\x18\x01 \x01(\x0b\x32\t.v1.Trade\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"=\n\x17\x43\x61ncelComboOrderRequest\x12\"\n\ncombotrade\x18\x01 \x01(\x0b\x32\x0e.v1.ComboTrade\"3\n\x13UpdateStatusRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"O\n\x12ListTradesResponse\x12\x19\n\x06trades\x18\x01 \x03(\x0b\x32\t.v1.Trade\x12\x0f\n\x07version\x18\x02 \x01(\x03\x12\r\n\x05\x65poch\x18\x03 \x01(\t\"_\n\x17ListComboTradesResponse\x12$\n\x0c\x63ombo_trades\x18\x01 \x03(\x0b\x32\x0e.v1.ComboTrade\x12\x0f\n\x07version\x18\x02 \x01(\x03\x12\r\n\x05\x65poch\x18\x03 \x01(\t\">\n\x16ListTradesDeltaRequest\x12\x15\n\rsince_version\x18\x01 \x01(\x03\x12\r\n\x05\x65poch\x18\x02 \x01(\t\":\n\x1aGetOrderDealRecordsRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"C\n\x1bGetOrderDealRecordsResponse\x12$\n\x07records\x18\x01 \x03(\x0b\x32\x13.v1.OrderDealRecord\"h\n\x0fOrderDealRecord\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x1a\n\x06\x61\x63tion\x18\x02 \x01(\x0e\x32\n.v1.Action\x12\r\n\x05price\x18\x03 \x01(\x01\x12\x10\n\x08quantity\x18\x04 \x01(\x03\x12\n\n\x02ts\x18\x05 \x01(\t\"B\n\x14ListPositionsRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\x12\x0c\n\x04unit\x18\x02 \x01(\t\"\xa2\x02\n\rStockPosition\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x1d\n\tdirection\x18\x03 \x01(\x0e\x32\n.v1.Action\x12\x10\n\x08quantity\x18\x04 \x01(\x03\x12\r\n\x05price\x18\x05 \x01(\x01\x12\x12\n\nlast_price\x18\x06 \x01(\x01\x12\x0b\n\x03pnl\x18\x07 \x01(\x01\x12\x13\n\x0byd_quantity\x18\x08 \x01(\x03\x12 \n\x04\x63ond\x18\t \x01(\x0e\x32\x12.v1.StockOrderCond\x12\x1e\n\x16margin_purchase_amount\x18\n \x01(\x03\x12\x12\n\ncollateral\x18\x0b \x01(\x03\x12\x19\n\x11short_sale_margin\x18\x0c \x01(\x03\x12\x10\n\x08interest\x18\r \x01(\x03\"\x8b\x01\n\x0e\x46uturePosition\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x1d\n\tdirection\x18\x03 \x01(\x0e\x32\n.v1.Action\x12\x10\n\x08quantity\x18\x04 \x01(\x03\x12\r\n\x05price\x18\x05 \x01(\x01\x12\x12\n\nlast_price\x18\x06 \x01(\x01\x12\x0b\n\x03pnl\x18\x07 \x01(\x01\"r\n\x08Position\x12+\n\x0estock_position\x18\x01 \x01(\x0b\x32\x11.v1.StockPositionH\x00\x12-\n\x0f\x66uture_position\x18\x02 \x01(\x0b\x32\x12.v1.FuturePositionH\x00\x42\n\n\x08position\"8\n\x15ListPositionsResponse\x12\x1f\n\tpositions\x18\x01 \x03(\x0b\x32\x0c.v1.Position\"L\n\x19ListPositionDetailRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\x12\x11\n\tdetail_id\x18\x02 \x01(\x03\"\xc6\x02\n\x13StockPositionDetail\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x10\n\x08quantity\x18\x03 \x01(\x03\x12\r\n\x05price\x18\x04 \x01(\x01\x12\x12\n\nlast_price\x18\x05 \x01(\x01\x12\x0b\n\x03pnl\x18\x06 \x01(\x01\x12\x0c\n\x04\x64seq\x18\x07 \x01(\t\x12\x1d\n\tdirection\x18\x08 \x01(\x0e\x32\n.v1.Action\x12\x1e\n\x08\x63urrency\x18\t \x01(\x0e\x32\x0c.v1.Currency\x12\x0b\n\x03\x66\x65\x65\x18\n \x01(\x01\x12 \n\x04\x63ond\x18\x0b \x01(\x0e\x32\x12.v1.StockOrderCond\x12\x14\n\x0c\x65x_dividends\x18\x0c \x01(\x03\x12\x10\n\x08interest\x18\r \x01(\x03\x12\x19\n\x11margintrading_amt\x18\x0e \x01(\x03\x12\x12\n\ncollateral\x18\x0f \x01(\x03\"\xe6\x01\n\x14\x46uturePositionDetail\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x10\n\x08quantity\x18\x03 \x01(\x03\x12\r\n\x05price\x18\x04 \x01(\x01\x12\x12\n\nlast_price\x18\x05 \x01(\x01\x12\x0b\n\x03pnl\x18\x06 \x01(\x01\x12\x0c\n\x04\x64seq\x18\x07 \x01(\t\x12\x1d\n\tdirection\x18\x08 \x01(\x0e\x32\n.v1.Action\x12\x1e\n\x08\x63urrency\x18\t \x01(\x0e\x32\x0c.v1.Currency\x12\x0b\n\x03\x66\x65\x65\x18\n \x01(\x01\x12\x16\n\x0e\x65ntry_quantity\x18\x0b \x01(\x03\"~\n\x0ePositionDetail\x12/\n\x0cstock_detail\x18\x01 \x01(\x0b\x32\x17.v1.StockPositionDetailH\x00\x12\x31\n\rfuture_detail\x18\x02 \x01(\x0b\x32\x18.v1.FuturePositionDetailH\x00\x42\x08\n\x06\x64\x65tail\"A\n\x1aListPositionDetailResponse\x12#\n\x07\x64\x65tails\x18\x01 \x03(\x0b\x32\x12.v1.PositionDetail\"[\n\x15ListProfitLossRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\x12\x12\n\nbegin_date\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x03 \x01(\t\"\xb8\x01\n\x0fStockProfitLoss\x12\x0c\n\x04\x64seq\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x10\n\x08quantity\x18\x03 \x01(\x03\x12\r\n\x05price\x18\x04 \x01(\x01\x12\x0b\n\x03pnl\x18\x05 \x01(\x01\x12\x10\n\x08pr_ratio\x18\x06 \x01(\x01\x12 \n\x04\x63ond\x18\x07 \x01(\x0e\x32\x12.v1.StockOrderCond\x12\x0c\n\x04\x64\x61te\x18\x08 \x01(\t\x12\r\n\x05seqno\x18\t \x01(\t\x12\n\n\x02id\x18\n \x01(\x03\"\xbc\x01\n\x10\x46utureProfitLoss\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x10\n\x08quantity\x18\x03 \x01(\x03\x12\x13\n\x0b\x65ntry_price\x18\x04 \x01(\x01\x12\x13\n\x0b\x63over_price\x18\x05 \x01(\x01\x12\x1d\n\tdirection\x18\x06 \x01(\x0e\x32\n.v1.Action\x12\x0b\n\x03pnl\x18\x07 \x01(\x01\x12\x0b\n\x03tax\x18\x08 \x01(\x03\x12\x0b\n\x03\x66\x65\x65\x18\t \x01(\x03\x12\n\n\x02id\x18\n \x01(\x03\"j\n\nProfitLoss\x12(\n\tstock_pnl\x18\x01 \x01(\x0b\x32\x13.v1.StockProfitLossH\x00\x12*\n\nfuture_pnl\x18\x02 \x01(\x0b\x32\x14.v1.FutureProfitLossH\x00\x42\x06\n\x04item\"?\n\x16ListProfitLossResponse\x12%\n\rprofit_losses\x18\x01 \x03(\x0b\x32\x0e.v1.ProfitLoss\"N\n\x1bListProfitLossDetailRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\x12\x11\n\tdetail_id\x18\x02 \x01(\x03\"\xfb\x02\n\x11StockProfitDetail\x12\r\n\x05price\x18\x01 \x01(\x01\x12\x0c\n\x04\x63ost\x18\x02 \x01(\x03\x12\x10\n\x08interest\x18\x03 \x01(\x03\x12\x0c\n\x04\x64\x61te\x18\x04 \x01(\t\x12\x0c\n\x04\x63ode\x18\x05 \x01(\t\x12\x10\n\x08quantity\x18\x06 \x01(\x03\x12\x0c\n\x04\x64seq\x18\x07 \x01(\t\x12\x0b\n\x03\x66\x65\x65\x18\x08 \x01(\x03\x12\x0b\n\x03tax\x18\t \x01(\x03\x12\x1e\n\x08\x63urrency\x18\n \x01(\x0e\x32\x0c.v1.Currency\x12\x1d\n\x15rep_margintrading_amt\x18\x0b \x01(\x03\x12\x16\n\x0erep_collateral\x18\x0c \x01(\x03\x12\x12\n\nrep_margin\x18\r \x01(\x03\x12\x18\n\x10shortselling_fee\x18\x0e \x01(\x03\x12\x17\n\x0f\x65x_dividend_amt\x18\x0f \x01(\x03\x12!\n\ntrade_type\x18\x10 \x01(\x0e\x32\r.v1.TradeType\x12 \n\x04\x63ond\x18\x11 \x01(\x0e\x32\x12.v1.StockOrderCond\"\xf4\x01\n\x12\x46utureProfitDetail\x12\x1d\n\tdirection\x18\x01 \x01(\x0e\x32\n.v1.Action\x12\x12\n\nentry_date\x18\x02 \x01(\t\x12\x13\n\x0b\x65ntry_price\x18\x03 \x01(\x01\x12\x13\n\x0b\x63over_price\x18\x04 \x01(\x01\x12\x0b\n\x03pnl\x18\x05 \x01(\x03\x12\x0c\n\x04\x64\x61te\x18\x06 \x01(\t\x12\x0c\n\x04\x63ode\x18\x07 \x01(\t\x12\x10\n\x08quantity\x18\x08 \x01(\x03\x12\x0c\n\x04\x64seq\x18\t \x01(\t\x12\x0b\n\x03\x66\x65\x65\x18\n \x01(\x03\x12\x0b\n\x03tax\x18\x0b \x01(\x03\x12\x1e\n\x08\x63urrency\x18\x0c \x01(\x0e\x32\x0c.v1.Currency\"x\n\x0cProfitDetail\x12-\n\x0cstock_detail\x18\x01 \x01(\x0b\x32\x15.v1.StockProfitDetailH\x00\x12/\n\rfuture_detail\x18\x02 \x01(\x0b\x32\x16.v1.FutureProfitDetailH\x00\x42\x08\n\x06\x64\x65tail\"A\n\x1cListProfitLossDetailResponse\x12!\n\x07\x64\x65tails\x18\x01 \x03(\x0b\x32\x10.v1.ProfitDetail\"<\n\x1cListProfitLossSummaryRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"\x90\x02\n\x16StockProfitLossSummary\x12\x12\n\nentry_cost\x18\x01 \x01(\x03\x12\x12\n\ncover_cost\x18\x02 \x01(\x03\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x10\n\x08quantity\x18\x04 \x01(\x03\x12\x13\n\x0b\x65ntry_price\x18\x05 \x01(\x01\x12\x13\n\x0b\x63over_price\x18\x06 \x01(\x01\x12\x0b\n\x03pnl\x18\x07 \x01(\x01\x12\x1e\n\x08\x63urrency\x18\x08 \x01(\x0e\x32\x0c.v1.Currency\x12\x10\n\x08\x62uy_cost\x18\t \x01(\x03\x12\x11\n\tsell_cost\x18\n \x01(\x03\x12\x10\n\x08pr_ratio\x18\x0b \x01(\x01\x12 \n\x04\x63ond\x18\x0c \x01(\x0e\x32\x12.v1.StockOrderCond\"\xc9\x01\n\x17\x46utureProfitLossSummary\x12\x1d\n\tdirection\x18\x01 \x01(\x0e\x32\n.v1.Action\x12\x0b\n\x03tax\x18\x02 \x01(\x03\x12\x0b\n\x03\x66\x65\x65\x18\x03 \x01(\x03\x12\x0c\n\x04\x63ode\x18\x04 \x01(\t\x12\x10\n\x08quantity\x18\x05 \x01(\x03\x12\x13\n\x0b\x65ntry_price\x18\x06 \x01(\x01\x12\x13\n\x0b\x63over_price\x18\x07 \x01(\x01\x12\x0b\n\x03pnl\x18\x08 \x01(\x01\x12\x1e\n\x08\x63urrency\x18\t \x01(\x0e\x32\x0c.v1.Currency\"\x8a\x01\n\x11ProfitLossSummary\x12\x33\n\rstock_summary\x18\x01 \x01(\x0b\x32\x1a.v1.StockProfitLossSummaryH\x00\x12\x35\n\x0e\x66uture_summary\x18\x02 \x01(\x0b\x32\x1b.v1.FutureProfitLossSummaryH\x00\x42\t\n\x07summary\"I\n\x1dListProfitLossSummaryResponse\x12(\n\tsummaries\x18\x01 \x03(\x0b\x32\x15.v1.ProfitLossSummary\"5\n\x15GetSettlementsRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"\xaf\x01\n\nSettlement\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x01\x12\x0f\n\x07t_money\x18\x03 \x01(\x01\x12\r\n\x05t_day\x18\x04 \x01(\t\x12\x10\n\x08t1_money\x18\x05 \x01(\x01\x12\x0e\n\x06t1_day\x18\x06 \x01(\t\x12\x10\n\x08t2_money\x18\x07 \x01(\x01\x12\x0e\n\x06t2_day\x18\x08 \x01(\t\x12\x1f\n\x06status\x18\t \x01(\x0e\x32\x0f.v1.FetchStatus\"=\n\x16GetSettlementsResponse\x12#\n\x0bsettlements\x18\x01 \x03(\x0b\x32\x0e.v1.Settlement\"0\n\x10GetMarginRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"\xd8\x05\n\x06Margin\x12\x0e\n\x06\x65quity\x18\x01 \x01(\x01\x12\x18\n\x10\x61vailable_margin\x18\x02 \x01(\x01\x12\x16\n\x0einitial_margin\x18\x03 \x01(\x01\x12\x1a\n\x12maintenance_margin\x18\x04 \x01(\x01\x12\x19\n\x11yesterday_balance\x18\x05 \x01(\x01\x12\x15\n\rtoday_balance\x18\x06 \x01(\x01\x12\x1a\n\x12\x64\x65posit_withdrawal\x18\x07 \x01(\x01\x12\x0b\n\x03\x66\x65\x65\x18\x08 \x01(\x01\x12\x0b\n\x03tax\x18\t \x01(\x01\x12\x13\n\x0bmargin_call\x18\n \x01(\x01\x12\x16\n\x0erisk_indicator\x18\x0b \x01(\x01\x12#\n\x1broyalty_revenue_expenditure\x18\x0c \x01(\x01\x12\x15\n\requity_amount\x18\r \x01(\x01\x12#\n\x1boption_openbuy_market_value\x18\x0e \x01(\x01\x12$\n\x1coption_opensell_market_value\x18\x0f \x01(\x01\x12\x1c\n\x14option_open_position\x18\x10 \x01(\x01\x12 \n\x18option_settle_profitloss\x18\x11 \x01(\x01\x12\x1c\n\x14\x66uture_open_position\x18\x12 \x01(\x01\x12\"\n\x1atoday_future_open_position\x18\x13 \x01(\x01\x12 \n\x18\x66uture_settle_profitloss\x18\x14 \x01(\x01\x12\x13\n\x0bplus_margin\x18\x15 \x01(\x01\x12\x1d\n\x15plus_margin_indicator\x18\x16 \x01(\x01\x12\"\n\x1asecurity_collateral_amount\x18\x17 \x01(\x01\x12\x1c\n\x14order_margin_premium\x18\x18 \x01(\x01\x12\x19\n\x11\x63ollateral_amount\x18\x19 \x01(\x01\x12\x1f\n\x06status\x18\x1a \x01(\x0e\x32\x0f.v1.FetchStatus\"7\n\x17GetTradingLimitsRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"\xff\x01\n\rTradingLimits\x12\x15\n\rtrading_limit\x18\x01 \x01(\x03\x12\x14\n\x0ctrading_used\x18\x02 \x01(\x03\x12\x19\n\x11trading_available\x18\x03 \x01(\x03\x12\x14\n\x0cmargin_limit\x18\x04 \x01(\x03\x12\x13\n\x0bmargin_used\x18\x05 \x01(\x03\x12\x18\n\x10margin_available\x18\x06 \x01(\x03\x12\x13\n\x0bshort_limit\x18\x07 \x01(\x03\x12\x12\n\nshort_used\x18\x08 \x01(\x03\x12\x17\n\x0fshort_available\x18\t \x01(\x03\x12\x1f\n\x06status\x18\n \x01(\x0e\x32\x0f.v1.FetchStatus\"=\n\x1dGetStockReserveSummaryRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"5\n\x1cReserveStocksSummaryResponse\x12\x15\n\rresponse_json\x18\x01 \x01(\t\"<\n\x1cGetStockReserveDetailRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"4\n\x1bReserveStocksDetailResponse\x12\x15\n\rresponse_json\x18\x01 \x01(\t\"b\n\x13ReserveStockRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\x12\x1e\n\x08\x63ontract\x18\x02 \x01(\x0b\x32\x0c.v1.Contract\x12\r\n\x05share\x18\x03 \x01(\x03\"-\n\x14ReserveStockResponse\x12\x15\n\rresponse_json\x18\x01 \x01(\t\":\n\x1aGetEarmarkingDetailRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"4\n\x1b\x45\x61rmarkStocksDetailResponse\x12\x15\n\rresponse_json\x18\x01 \x01(\t\"v\n\x18ReserveEarmarkingRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\x12\x1e\n\x08\x63ontract\x18\x02 \x01(\x0b\x32\x0c.v1.Contract\x12\r\n\x05share\x18\x03 \x01(\x03\x12\r\n\x05price\x18\x04 \x01(\x01\"2\n\x19ReserveEarmarkingResponse\x12\x15\n\rresponse_json\x18\x01 \x01(\t\"-\n\x13GetSnapshotsRequest\x12\x16\n\x0e\x63ontract_codes\x18\x01 \x03(\t\"7\n\x14GetSnapshotsResponse\x12\x1f\n\tsnapshots\x18\x01 \x03(\x0b\x32\x0c.v1.Snapshot\"\xd0\x03\n\x08Snapshot\x12\n\n\x02ts\x18\x01 \x01(\x03\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x1e\n\x08\x65xchange\x18\x03 \x01(\x0e\x32\x0c.v1.Exchange\x12\x0c\n\x04open\x18\x04 \x01(\x01\x12\x0c\n\x04high\x18\x05 \x01(\x01\x12\x0b\n\x03low\x18\x06 \x01(\x01\x12\r\n\x05\x63lose\x18\x07 \x01(\x01\x12\x14\n\x0c\x63hange_price\x18\x08 \x01(\x01\x12\x13\n\x0b\x63hange_rate\x18\t \x01(\x01\x12\x15\n\raverage_price\x18\n \x01(\x01\x12\x0e\n\x06volume\x18\x0b \x01(\x03\x12\x14\n\x0ctotal_volume\x18\x0c \x01(\x03\x12\x0e\n\x06\x61mount\x18\r \x01(\x03\x12\x14\n\x0ctotal_amount\x18\x0e \x01(\x03\x12\x11\n\tbuy_price\x18\x0f \x01(\x01\x12\x12\n\nbuy_volume\x18\x10 \x01(\x01\x12\x12\n\nsell_price\x18\x11 \x01(\x01\x12\x13\n\x0bsell_volume\x18\x12 \x01(\x03\x12\x1f\n\ttick_type\x18\x13 \x01(\x0e\x32\x0c.v1.TickType\x12#\n\x0b\x63hange_type\x18\x14 \x01(\x0e\x32\x0e.v1.ChangeType\x12\x18\n\x10yesterday_volume\x18\x15 \x01(\x01\x12\x14\n\x0cvolume_ratio\x18\x16 \x01(\x01\"[\n\x0fGetTicksRequest\x12\x15\n\rcontract_code\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\x12\x0f\n\x07\x63ompact\x18\x03 \x01(\x08\x12\x12\n\nmax_points\x18\x04 \x01(\x05\"\xa0\x02\n\x05Ticks\x12\n\n\x02ts\x18\x01 \x03(\x03\x12\r\n\x05\x63lose\x18\x02 \x03(\x01\x12\x0e\n\x06volume\x18\x03 \x03(\x03\x12\x11\n\tbid_price\x18\x04 \x03(\x01\x12\x12\n\nbid_volume\x18\x05 \x03(\x03\x12\x11\n\task_price\x18\x06 \x03(\x01\x12\x12\n\nask_volume\x18\x07 \x03(\x03\x12\x11\n\ttick_type\x18\x08 \x03(\x05\x12\x10\n\x08ts_delta\x18\t \x03(\x12\x12!\n\nprice_grid\x18\n \x01(\x0b\x32\r.v1.PriceGrid\x12\x13\n\x0b\x63lose_delta\x18\x0b \x03(\x12\x12\x17\n\x0f\x62id_price_delta\x18\x0c \x03(\x12\x12\x17\n\x0f\x61sk_price_delta\x18\r \x03(\x12\x12\x0f\n\x07ts_unit\x18\x0e \x01(\x03\"9\n\tPriceGrid\x12\x10\n\x08\x64\x65\x63imals\x18\x01 \x01(\x05\x12\x0c\n\x04\x62\x61se\x18\x02 \x01(\x03\x12\x0c\n\x04unit\x18\x03 \x01(\x03\"\xaf\x01\n\x0fGetKbarsRequest\x12\x15\n\rcontract_code\x18\x01 \x01(\t\x12\x12\n\nstart_date\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x03 \x01(\t\x12\x10\n\x08start_ts\x18\x04 \x01(\x03\x12\x0e\n\x06\x65nd_ts\x18\x05 \x01(\x03\x12\x0f\n\x07\x63ompact\x18\x06 \x01(\x08\x12\x18\n\x10resample_minutes\x18\x07 \x01(\x05\x12\x12\n\nmax_points\x18\x08 \x01(\x05\"g\n\x14GetKbarsBatchRequest\x12\x16\n\x0e\x63ontract_codes\x18\x01 \x03(\t\x12\"\n\x05query\x18\x02 \x01(\x0b\x32\x13.v1.GetKbarsRequest\x12\x13\n\x0bparallelism\x18\x03 \x01(\x05\"R\n\x10KbarsBatchResult\x12\x15\n\rcontract_code\x18\x01 \x01(\t\x12\x18\n\x05kbars\x18\x02 \x01(\x0b\x32\t.v1.Kbars\x12\r\n\x05\x65rror\x18\x03 \x01(\t\"V\n\x1cStreamHistoricalTicksRequest\x12\"\n\x05query\x18\x01 \x01(\x0b\x32\x13.v1.GetTicksRequest\x12\x12\n\nchunk_size\x18\x02 \x01(\x05\"V\n\x1cStreamHistoricalKbarsRequest\x12\"\n\x05query\x18\x01 \x01(\x0b\x32\x13.v1.GetKbarsRequest\x12\x12\n\nchunk_size\x18\x02 \x01(\x05\"\x81\x02\n\x05Kbars\x12\n\n\x02ts\x18\x01 \x03(\x03\x12\x0c\n\x04open\x18\x02 \x03(\x01\x12\x0c\n\x04high\x18\x03 \x03(\x01\x12\x0b\n\x03low\x18\x04 \x03(\x01\x12\r\n\x05\x63lose\x18\x05 \x03(\x01\x12\x0e\n\x06volume\x18\x06 \x03(\x03\x12\x0e\n\x06\x61mount\x18\x07 \x03(\x01\x12\x10\n\x08ts_delta\x18\x08 \x03(\x12\x12!\n\nprice_grid\x18\t \x01(\x0b\x32\r.v1.PriceGrid\x12\x12\n\nopen_delta\x18\n \x03(\x12\x12\x12\n\nhigh_delta\x18\x0b \x03(\x12\x12\x11\n\tlow_delta\x18\x0c \x03(\x12\x12\x13\n\x0b\x63lose_delta\x18\r \x03(\x12\x12\x0f\n\x07ts_unit\x18\x0e \x01(\x03\"w\n\x12GetTickBarsRequest\x12\x15\n\rcontract_code\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\x12\x1d\n\x04type\x18\x03 \x01(\x0e\x32\x0f.v1.TickBarType\x12\x0c\n\x04size\x18\x04 \x01(\x03\x12\x0f\n\x07\x63ompact\x18\x05 \x01(\x08\"`\n\x17GetTickAnalyticsRequest\x12\x15\n\rcontract_code\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\x12\x10\n\x08start_ts\x18\x03 \x01(\x03\x12\x0e\n\x06\x65nd_ts\x18\x04 \x01(\x03\"\xe1\x01\n\rTickAnalytics\x12\r\n\x05ticks\x18\x01 \x01(\x03\x12\x0e\n\x06volume\x18\x02 \x01(\x03\x12\x0c\n\x04vwap\x18\x03 \x01(\x01\x12\x0c\n\x04open\x18\x04 \x01(\x01\x12\x0c\n\x04high\x18\x05 \x01(\x01\x12\x0b\n\x03low\x18\x06 \x01(\x01\x12\r\n\x05\x63lose\x18\x07 \x01(\x01\x12\x12\n\nbuy_volume\x18\x08 \x01(\x03\x12\x13\n\x0bsell_volume\x18\t \x01(\x03\x12\x10\n\x08\x66irst_ts\x18\n \x01(\x03\x12\x0f\n\x07last_ts\x18\x0b \x01(\x03\x12\x1f\n\x06levels\x18\x0c \x03(\x0b\x32\x0f.v1.PriceVolume\"d\n\x0bPriceVolume\x12\r\n\x05price\x18\x01 \x01(\x01\x12\x0e\n\x06volume\x18\x02 \x01(\x03\x12\x12\n\nbuy_volume\x18\x03 \x01(\x03\x12\x13\n\x0bsell_volume\x18\x04 \x01(\x03\x12\r\n\x05ticks\x18\x05 \x01(\x03\"%\n\x15GetDailyQuotesRequest\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\"\x96\x01\n\x0b\x44\x61ilyQuotes\x12\x0c\n\x04\x63ode\x18\x01 \x03(\t\x12\x0c\n\x04open\x18\x02 \x03(\x01\x12\x0c\n\x04high\x18\x03 \x03(\x01\x12\x0b\n\x03low\x18\x04 \x03(\x01\x12\r\n\x05\x63lose\x18\x05 \x03(\x01\x12\x0e\n\x06volume\x18\x06 \x03(\x03\x12\x0c\n\x04\x64\x61te\x18\x07 \x03(\t\x12\x13\n\x0btransaction\x18\x08 \x03(\x03\x12\x0e\n\x06\x61mount\x18\t \x03(\x03\"/\n\x15\x43reditEnquiresRequest\x12\x16\n\x0e\x63ontract_codes\x18\x01 \x03(\t\"D\n\x16\x43reditEnquiresResponse\x12*\n\x0f\x63redit_enquires\x18\x01 \x03(\x0b\x32\x11.v1.CreditEnquire\"o\n\rCreditEnquire\x12\x10\n\x08stock_id\x18\x01 \x01(\t\x12\x13\n\x0bmargin_unit\x18\x02 \x01(\x03\x12\x12\n\nshort_unit\x18\x03 \x01(\x03\x12\x13\n\x0bupdate_time\x18\x04 \x01(\t\x12\x0e\n\x06system\x18\x05 \x01(\t\"5\n\x1bGetShortStockSourcesRequest\x12\x16\n\x0e\x63ontract_codes\x18\x01 \x03(\t\"E\n\x1cGetShortStockSourcesResponse\x12%\n\x07sources\x18\x01 \x03(\x0b\x32\x14.v1.ShortStockSource\"H\n\x10ShortStockSource\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x1a\n\x12short_stock_source\x18\x02 \x01(\x03\x12\n\n\x02ts\x18\x03 \x01(\x03\"k\n\x12GetScannersRequest\x12%\n\x0cscanner_type\x18\x01 \x01(\x0e\x32\x0f.v1.ScannerType\x12\x11\n\tascending\x18\x02 \x01(\x08\x12\x0c\n\x04\x64\x61te\x18\x03 \x01(\t\x12\r\n\x05\x63ount\x18\x04 \x01(\x05\"8\n\x13GetScannersResponse\x12!\n\x08scanners\x18\x01 \x03(\x0b\x32\x0f.v1.ScannerItem\"\xb5\x04\n\x0bScannerItem\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\n\n\x02ts\x18\x04 \x01(\x03\x12\x0c\n\x04open\x18\x05 \x01(\x01\x12\x0c\n\x04high\x18\x06 \x01(\x01\x12\x0b\n\x03low\x18\x07 \x01(\x01\x12\r\n\x05\x63lose\x18\x08 \x01(\x01\x12\x13\n\x0bprice_range\x18\t \x01(\x01\x12\x1f\n\ttick_type\x18\n \x01(\x0e\x32\x0c.v1.TickType\x12\x14\n\x0c\x63hange_price\x18\x0b \x01(\x01\x12#\n\x0b\x63hange_type\x18\x0c \x01(\x0e\x32\x0e.v1.ChangeType\x12\x15\n\raverage_price\x18\r \x01(\x01\x12\x0e\n\x06volume\x18\x0e \x01(\x03\x12\x14\n\x0ctotal_volume\x18\x0f \x01(\x03\x12\x0e\n\x06\x61mount\x18\x10 \x01(\x03\x12\x14\n\x0ctotal_amount\x18\x11 \x01(\x03\x12\x18\n\x10yesterday_volume\x18\x12 \x01(\x03\x12\x14\n\x0cvolume_ratio\x18\x13 \x01(\x01\x12\x11\n\tbuy_price\x18\x14 \x01(\x01\x12\x12\n\nbuy_volume\x18\x15 \x01(\x03\x12\x12\n\nsell_price\x18\x16 \x01(\x01\x12\x13\n\x0bsell_volume\x18\x17 \x01(\x03\x12\x12\n\nbid_orders\x18\x18 \x01(\x03\x12\x13\n\x0b\x62id_volumes\x18\x19 \x01(\x03\x12\x12\n\nask_orders\x18\x1a \x01(\x03\x12\x13\n\x0b\x61sk_volumes\x18\x1b \x01(\x03\x12\x12\n\nrank_value\x18\x1c \x01(\x01\"\xb8\x01\n\x06Punish\x12\x0c\n\x04\x63ode\x18\x01 \x03(\t\x12\x12\n\nstart_date\x18\x02 \x03(\t\x12\x10\n\x08\x65nd_date\x18\x03 \x03(\t\x12\x10\n\x08interval\x18\x04 \x03(\t\x12\x12\n\nupdated_at\x18\x05 \x03(\t\x12\x12\n\nunit_limit\x18\x06 \x03(\x01\x12\x13\n\x0btotal_limit\x18\x07 \x03(\x01\x12\x13\n\x0b\x64\x65scription\x18\x08 \x03(\t\x12\x16\n\x0e\x61nnounced_date\x18\t \x03(\t\"a\n\x06Notice\x12\x0c\n\x04\x63ode\x18\x01 \x03(\t\x12\x0e\n\x06reason\x18\x02 \x03(\t\x12\x12\n\nupdated_at\x18\x03 \x03(\t\x12\r\n\x05\x63lose\x18\x04 \x03(\x01\x12\x16\n\x0e\x61nnounced_date\x18\x05 \x03(\t\"2\n\x15\x46\x65tchContractsRequest\x12\x19\n\x11\x63ontract_download\x18\x01 \x01(\x08\"\x97\x01\n\x15GetOptionChainRequest\x12\x12\n\nunderlying\x18\x01 \x01(\t\x12\x16\n\x0e\x64\x65livery_month\x18\x02 \x01(\t\x12\x12\n\nstrike_min\x18\x03 \x01(\x01\x12\x12\n\nstrike_max\x18\x04 \x01(\x01\x12\x15\n\rcenter_strike\x18\x05 \x01(\x01\x12\x13\n\x0bnum_strikes\x18\x06 \x01(\x05\"s\n\x0cOptionStrike\x12\x16\n\x0e\x64\x65livery_month\x18\x01 \x01(\t\x12\x14\n\x0cstrike_price\x18\x02 \x01(\x01\x12\x1a\n\x04\x63\x61ll\x18\x03 \x01(\x0b\x32\x0c.v1.Contract\x12\x19\n\x03put\x18\x04 \x01(\x0b\x32\x0c.v1.Contract\"0\n\x0bOptionChain\x12!\n\x07strikes\x18\x01 \x03(\x0b\x32\x10.v1.OptionStrike\"i\n\x14\x46indContractsRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x17\n\x0funderlying_code\x18\x02 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x03 \x01(\t\x12\x16\n\x0e\x64\x65livery_month\x18\x04 \x01(\t\"8\n\x15\x46indContractsResponse\x12\x1f\n\tcontracts\x18\x01 \x03(\x0b\x32\x0c.v1.Contract\"[\n\x17SingleflightMethodStats\x12\x0e\n\x06method\x18\x01 \x01(\t\x12\r\n\x05\x63\x61lls\x18\x02 \x01(\x03\x12\x0e\n\x06shared\x18\x03 \x01(\x03\x12\x11\n\thit_ratio\x18\x04 \x01(\x01\"A\n\x11SingleflightStats\x12,\n\x07methods\x18\x01 \x03(\x0b\x32\x1b.v1.SingleflightMethodStats\"J\n\x11\x41\x63tivateCARequest\x12\x0f\n\x07\x63\x61_path\x18\x01 \x01(\t\x12\x11\n\tca_passwd\x18\x02 \x01(\t\x12\x11\n\tperson_id\x18\x03 \x01(\t\"%\n\x12\x41\x63tivateCAResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"+\n\x16GetCAExpireTimeRequest\x12\x11\n\tperson_id\x18\x01 \x01(\t\".\n\x17GetCAExpireTimeResponse\x12\x13\n\x0b\x65xpire_time\x18\x01 \x01(\t\"5\n\x15SubscribeTradeRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\")\n\x16SubscribeTradeResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"7\n\x17UnsubscribeTradeRequest\x12\x1c\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x0b.v1.Account\"+\n\x18UnsubscribeTradeResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"@\n\x12StreamTicksRequest\x12\x16\n\x0e\x63ontract_codes\x18\x01 \x03(\t\x12\x12\n\nqueue_size\x18\x02 \x01(\x05\"\xcc\x03\n\x04Tick\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x1e\n\x08\x65xchange\x18\x02 \x01(\x0e\x32\x0c.v1.Exchange\x12\n\n\x02ts\x18\x03 \x01(\x03\x12\x0c\n\x04open\x18\x04 \x01(\x01\x12\r\n\x05\x63lose\x18\x05 \x01(\x01\x12\x0c\n\x04high\x18\x06 \x01(\x01\x12\x0b\n\x03low\x18\x07 \x01(\x01\x12\x11\n\tavg_price\x18\x08 \x01(\x01\x12\x0e\n\x06volume\x18\t \x01(\x03\x12\x14\n\x0ctotal_volume\x18\n \x01(\x03\x12\x0e\n\x06\x61mount\x18\x0b \x01(\x01\x12\x14\n\x0ctotal_amount\x18\x0c \x01(\x01\x12\x1f\n\ttick_type\x18\r \x01(\x0e\x32\x0c.v1.TickType\x12#\n\x0b\x63hange_type\x18\x0e \x01(\x0e\x32\x0e.v1.ChangeType\x12\x11\n\tprice_chg\x18\x0f \x01(\x01\x12\x0f\n\x07pct_chg\x18\x10 \x01(\x01\x12\x1a\n\x12\x62id_side_total_vol\x18\x11 \x01(\x03\x12\x1a\n\x12\x61sk_side_total_vol\x18\x12 \x01(\x03\x12\x18\n\x10underlying_price\x18\x13 \x01(\x01\x12\x10\n\x08simtrade\x18\x14 \x01(\x08\x12\x0f\n\x07suspend\x18\x15 \x01(\x08\x12\x14\n\x0cintraday_odd\x18\x16 \x01(\x08\"B\n\x13StreamBidAskRequest\x12\x16\n\x0e\x63ontract_codes\x18\x01 \x03(\t\x12\x13\n\x0binterval_ms\x18\x02 \x01(\x05\"\xa3\x02\n\x06\x42idAsk\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x1e\n\x08\x65xchange\x18\x02 \x01(\x0e\x32\x0c.v1.Exchange\x12\n\n\x02ts\x18\x03 \x01(\x03\x12\x11\n\tbid_price\x18\x04 \x03(\x01\x12\x12\n\nbid_volume\x18\x05 \x03(\x03\x12\x14\n\x0c\x64iff_bid_vol\x18\x06 \x03(\x03\x12\x11\n\task_price\x18\x07 \x03(\x01\x12\x12\n\nask_volume\x18\x08 \x03(\x03\x12\x14\n\x0c\x64iff_ask_vol\x18\t \x03(\x03\x12\x15\n\rbid_total_vol\x18\n \x01(\x03\x12\x15\n\rask_total_vol\x18\x0b \x01(\x03\x12\x10\n\x08simtrade\x18\x0c \x01(\x08\x12\x0f\n\x07suspend\x18\r \x01(\x08\x12\x14\n\x0cintraday_odd\x18\x0e \x01(\x08\"`\n\x18StreamOrderEventsRequest\x12\x11\n\tsince_seq\x18\x01 \x01(\x03\x12\x0e\n\x06replay\x18\x02 \x01(\x08\x12\x12\n\nqueue_size\x18\x03 \x01(\x05\x12\r\n\x05\x65poch\x18\x04 \x01(\t\"\x9e\x01\n\nOrderEvent\x12\x0b\n\x03seq\x18\x01 \x01(\x03\x12\x1d\n\x05state\x18\x02 \x01(\x0e\x32\x0e.v1.OrderState\x12\n\n\x02ts\x18\x03 \x01(\x03\x12 \n\x05order\x18\x04 \x01(\x0b\x32\x0f.v1.OrderUpdateH\x00\x12\x1e\n\x04\x64\x65\x61l\x18\x05 \x01(\x0b\x32\x0e.v1.DealUpdateH\x00\x12\r\n\x05\x65poch\x18\x06 \x01(\tB\x07\n\x05\x65vent\"\xdf\x03\n\x0bOrderUpdate\x12\x0f\n\x07op_type\x18\x01 \x01(\t\x12\x0f\n\x07op_code\x18\x02 \x01(\t\x12\x0e\n\x06op_msg\x18\x03 \x01(\t\x12\n\n\x02id\x18\x04 \x01(\t\x12\r\n\x05seqno\x18\x05 \x01(\t\x12\r\n\x05ordno\x18\x06 \x01(\t\x12\x11\n\tbroker_id\x18\x07 \x01(\t\x12\x12\n\naccount_id\x18\x08 \x01(\t\x12\x1a\n\x06\x61\x63tion\x18\t \x01(\x0e\x32\n.v1.Action\x12\r\n\x05price\x18\n \x01(\x01\x12\x10\n\x08quantity\x18\x0b \x01(\x03\x12!\n\norder_type\x18\x0c \x01(\x0e\x32\r.v1.OrderType\x12\x12\n\nprice_type\x18\r \x01(\t\x12\x14\n\x0c\x63ustom_field\x18\x0e \x01(\t\x12\x0c\n\x04\x63ode\x18\x0f \x01(\t\x12\'\n\rsecurity_type\x18\x10 \x01(\x0e\x32\x10.v1.SecurityType\x12\x1e\n\x08\x65xchange\x18\x11 \x01(\x0e\x32\x0c.v1.Exchange\x12\x13\n\x0b\x65xchange_ts\x18\x12 \x01(\x01\x12\x16\n\x0emodified_price\x18\x13 \x01(\x01\x12\x17\n\x0f\x63\x61ncel_quantity\x18\x14 \x01(\x03\x12\x16\n\x0eorder_quantity\x18\x15 \x01(\x03\x12\x0e\n\x06web_id\x18\x16 \x01(\t\"\xf4\x02\n\nDealUpdate\x12\x10\n\x08trade_id\x18\x01 \x01(\t\x12\r\n\x05seqno\x18\x02 \x01(\t\x12\r\n\x05ordno\x18\x03 \x01(\t\x12\x14\n\x0c\x65xchange_seq\x18\x04 \x01(\t\x12\x11\n\tbroker_id\x18\x05 \x01(\t\x12\x12\n\naccount_id\x18\x06 \x01(\t\x12\x1a\n\x06\x61\x63tion\x18\x07 \x01(\x0e\x32\n.v1.Action\x12\x0c\n\x04\x63ode\x18\x08 \x01(\t\x12\r\n\x05price\x18\t \x01(\x01\x12\x10\n\x08quantity\x18\n \x01(\x03\x12\n\n\x02ts\x18\x0b \x01(\x01\x12\x0e\n\x06web_id\x18\x0c \x01(\t\x12\x14\n\x0c\x63ustom_field\x18\r \x01(\t\x12\'\n\rsecurity_type\x18\x0e \x01(\x0e\x32\x10.v1.SecurityType\x12\x16\n\x0e\x64\x65livery_month\x18\x0f \x01(\t\x12\x14\n\x0cstrike_price\x18\x10 \x01(\x01\x12%\n\x0coption_right\x18\x11 \x01(\x0e\x32\x0f.v1.OptionRight*w\n\x0bTickBarType\x12\x1d\n\x19TICK_BAR_TYPE_UNSPECIFIED\x10\x00\x12\x16\n\x12TICK_BAR_TYPE_TIME\x10\x01\x12\x18\n\x14TICK_BAR_TYPE_VOLUME\x10\x02\x12\x17\n\x13TICK_BAR_TYPE_TICKS\x10\x03*A\n\x06\x41\x63tion\x12\x16\n\x12\x41\x43TION_UNSPECIFIED\x10\x00\x12\x0e\n\nACTION_BUY\x10\x01\x12\x0f\n\x0b\x41\x43TION_SELL\x10\x02*c\n\tOrderType\x12\x1a\n\x16ORDER_TYPE_UNSPECIFIED\x10\x00\x12\x12\n\x0eORDER_TYPE_ROD\x10\x01\x12\x12\n\x0eORDER_TYPE_IOC\x10\x02\x12\x12\n\x0eORDER_TYPE_FOK\x10\x03*\x82\x01\n\x0eStockPriceType\x12 \n\x1cSTOCK_PRICE_TYPE_UNSPECIFIED\x10\x00\x12\x18\n\x14STOCK_PRICE_TYPE_LMT\x10\x01\x12\x18\n\x14STOCK_PRICE_TYPE_MKT\x10\x02\x12\x1a\n\x16STOCK_PRICE_TYPE_CLOSE\x10\x03*\xc3\x01\n\rStockOrderLot\x12\x1f\n\x1bSTOCK_ORDER_LOT_UNSPECIFIED\x10\x00\x12\x1a\n\x16STOCK_ORDER_LOT_COMMON\x10\x01\x12\x1e\n\x1aSTOCK_ORDER_LOT_BLOCKTRADE\x10\x02\x12\x1a\n\x16STOCK_ORDER_LOT_FIXING\x10\x03\x12\x17\n\x13STOCK_ORDER_LOT_ODD\x10\x04\x12 \n\x1cSTOCK_ORDER_LOT_INTRADAY_ODD\x10\x05*\xd1\x01\n\x0eStockOrderCond\x12 \n\x1cSTOCK_ORDER_COND_UNSPECIFIED\x10\x00\x12\x19\n\x15STOCK_ORDER_COND_CASH\x10\x01\x12\x1c\n\x18STOCK_ORDER_COND_NETTING\x10\x02\x12\"\n\x1eSTOCK_ORDER_COND_MARGINTRADING\x10\x03\x12!\n\x1dSTOCK_ORDER_COND_SHORTSELLING\x10\x04\x12\x1d\n\x19STOCK_ORDER_COND_EMERGING\x10\x05*\x8a\x01\n\x10\x46uturesPriceType\x12\"\n\x1e\x46UTURES_PRICE_TYPE_UNSPECIFIED\x10\x00\x12\x1a\n\x16\x46UTURES_PRICE_TYPE_LMT\x10\x01\x12\x1a\n\x16\x46UTURES_PRICE_TYPE_MKT\x10\x02\x12\x1a\n\x16\x46UTURES_PRICE_TYPE_MKP\x10\x03*\x97\x01\n\rFuturesOCType\x12\x1e\n\x1a\x46UTURES_OCTYPE_UNSPECIFIED\x10\x00\x12\x17\n\x13\x46UTURES_OCTYPE_AUTO\x10\x01\x12\x16\n\x12\x46UTURES_OCTYPE_NEW\x10\x02\x12\x18\n\x14\x46UTURES_OCTYPE_COVER\x10\x03\x12\x1b\n\x17\x46UTURES_OCTYPE_DAYTRADE\x10\x04*\x89\x01\n\x0cSecurityType\x12\x1d\n\x19SECURITY_TYPE_UNSPECIFIED\x10\x00\x12\x15\n\x11SECURITY_TYPE_IND\x10\x01\x12\x15\n\x11SECURITY_TYPE_STK\x10\x02\x12\x15\n\x11SECURITY_TYPE_FUT\x10\x03\x12\x15\n\x11SECURITY_TYPE_OPT\x10\x04*o\n\x08\x45xchange\x12\x18\n\x14\x45XCHANGE_UNSPECIFIED\x10\x00\x12\x10\n\x0c\x45XCHANGE_TSE\x10\x01\x12\x10\n\x0c\x45XCHANGE_OTC\x10\x02\x12\x10\n\x0c\x45XCHANGE_OES\x10\x03\x12\x13\n\x0f\x45XCHANGE_TAIFEX\x10\x04*\x8c\x03\n\x08\x43urrency\x12\x18\n\x14\x43URRENCY_UNSPECIFIED\x10\x00\x12\x10\n\x0c\x43URRENCY_TWD\x10\x01\x12\x10\n\x0c\x43URRENCY_USD\x10\x02\x12\x10\n\x0c\x43URRENCY_HKD\x10\x03\x12\x10\n\x0c\x43URRENCY_GBP\x10\x04\x12\x10\n\x0c\x43URRENCY_AUD\x10\x05\x12\x10\n\x0c\x43URRENCY_CAD\x10\x06\x12\x10\n\x0c\x43URRENCY_SGD\x10\x07\x12\x10\n\x0c\x43URRENCY_CHF\x10\x08\x12\x10\n\x0c\x43URRENCY_JPY\x10\t\x12\x10\n\x0c\x43URRENCY_ZAR\x10\n\x12\x10\n\x0c\x43URRENCY_SEK\x10\x0b\x12\x10\n\x0c\x43URRENCY_NZD\x10\x0c\x12\x10\n\x0c\x43URRENCY_THB\x10\r\x12\x10\n\x0c\x43URRENCY_PHP\x10\x0e\x12\x10\n\x0c\x43URRENCY_IDR\x10\x0f\x12\x10\n\x0c\x43URRENCY_EUR\x10\x10\x12\x10\n\x0c\x43URRENCY_KRW\x10\x11\x12\x10\n\x0c\x43URRENCY_VND\x10\x12\x12\x10\n\x0c\x43URRENCY_MYR\x10\x13\x12\x10\n\x0c\x43URRENCY_CNY\x10\x14*m\n\x0bOptionRight\x12\x1c\n\x18OPTION_RIGHT_UNSPECIFIED\x10\x00\x12\x13\n\x0fOPTION_RIGHT_NO\x10\x01\x12\x15\n\x11OPTION_RIGHT_CALL\x10\x02\x12\x14\n\x10OPTION_RIGHT_PUT\x10\x03*\xd1\x01\n\x06Status\x12\x16\n\x12STATUS_UNSPECIFIED\x10\x00\x12\x14\n\x10STATUS_CANCELLED\x10\x01\x12\x11\n\rSTATUS_FILLED\x10\x02\x12\x15\n\x11STATUS_PARTFILLED\x10\x03\x12\x13\n\x0fSTATUS_INACTIVE\x10\x04\x12\x11\n\rSTATUS_FAILED\x10\x05\x12\x18\n\x14STATUS_PENDINGSUBMIT\x10\x06\x12\x17\n\x13STATUS_PRESUBMITTED\x10\x07\x12\x14\n\x10STATUS_SUBMITTED\x10\x08*\x9b\x01\n\nOrderState\x12\x1b\n\x17ORDER_STATE_UNSPECIFIED\x10\x00\x12\x19\n\x15ORDER_STATE_STOCKDEAL\x10\x01\x12\x1a\n\x16ORDER_STATE_STOCKORDER\x10\x02\x12\x1c\n\x18ORDER_STATE_FUTURESORDER\x10\x03\x12\x1b\n\x17ORDER_STATE_FUTURESDEAL\x10\x04*i\n\tQuoteType\x12\x1a\n\x16QUOTE_TYPE_UNSPECIFIED\x10\x00\x12\x13\n\x0fQUOTE_TYPE_TICK\x10\x01\x12\x15\n\x11QUOTE_TYPE_BIDASK\x10\x02\x12\x14\n\x10QUOTE_TYPE_QUOTE\x10\x03*C\n\x0cQuoteVersion\x12\x1d\n\x19QUOTE_VERSION_UNSPECIFIED\x10\x00\x12\x14\n\x10QUOTE_VERSION_V1\x10\x01*a\n\x08\x44\x61yTrade\x12\x19\n\x15\x44\x41Y_TRADE_UNSPECIFIED\x10\x00\x12\x11\n\rDAY_TRADE_YES\x10\x01\x12\x15\n\x11\x44\x41Y_TRADE_ONLYBUY\x10\x02\x12\x10\n\x0c\x44\x41Y_TRADE_NO\x10\x03*^\n\x08TickType\x12\x19\n\x15TICK_TYPE_UNSPECIFIED\x10\x00\x12\x10\n\x0cTICK_TYPE_NO\x10\x01\x12\x11\n\rTICK_TYPE_BUY\x10\x02\x12\x12\n\x0eTICK_TYPE_SELL\x10\x03*\xa2\x01\n\nChangeType\x12\x1b\n\x17\x43HANGE_TYPE_UNSPECIFIED\x10\x00\x12\x17\n\x13\x43HANGE_TYPE_LIMITUP\x10\x01\x12\x12\n\x0e\x43HANGE_TYPE_UP\x10\x02\x12\x19\n\x15\x43HANGE_TYPE_UNCHANGED\x10\x03\x12\x14\n\x10\x43HANGE_TYPE_DOWN\x10\x04\x12\x19\n\x15\x43HANGE_TYPE_LIMITDOWN\x10\x05*=\n\x04Unit\x12\x14\n\x10UNIT_UNSPECIFIED\x10\x00\x12\x0f\n\x0bUNIT_COMMON\x10\x01\x12\x0e\n\nUNIT_SHARE\x10\x02*W\n\tTradeType\x12\x1a\n\x16TRADE_TYPE_UNSPECIFIED\x10\x00\x12\x15\n\x11TRADE_TYPE_COMMON\x10\x01\x12\x17\n\x13TRADE_TYPE_DAYTRADE\x10\x02*\xea\x01\n\x0bScannerType\x12\x1c\n\x18SCANNER_TYPE_UNSPECIFIED\x10\x00\x12\"\n\x1eSCANNER_TYPE_CHANGEPERCENTRANK\x10\x01\x12 \n\x1cSCANNER_TYPE_CHANGEPRICERANK\x10\x02\x12\x1d\n\x19SCANNER_TYPE_DAYRANGERANK\x10\x03\x12\x1b\n\x17SCANNER_TYPE_VOLUMERANK\x10\x04\x12\x1b\n\x17SCANNER_TYPE_AMOUNTRANK\x10\x05\x12\x1e\n\x1aSCANNER_TYPE_TICKCOUNTRANK\x10\x06*\x8f\x01\n\x0eTicksQueryType\x12 \n\x1cTICKS_QUERY_TYPE_UNSPECIFIED\x10\x00\x12\x1b\n\x17TICKS_QUERY_TYPE_ALLDAY\x10\x01\x12\x1e\n\x1aTICKS_QUERY_TYPE_RANGETIME\x10\x02\x12\x1e\n\x1aTICKS_QUERY_TYPE_LASTCOUNT\x10\x03*\\\n\x0b\x46\x65tchStatus\x12\x1c\n\x18\x46\x45TCH_STATUS_UNSPECIFIED\x10\x00\x12\x18\n\x14\x46\x45TCH_STATUS_SUCCESS\x10\x01\x12\x15\n\x11\x46\x45TCH_STATUS_FAIL\x10\x02\x32\xec\x1d\n\x0fShioajiProvider\x12.\n\x05Login\x12\x10.v1.LoginRequest\x1a\x11.v1.LoginResponse\"\x00\x12)\n\x06Logout\x12\t.v1.Empty\x1a\x12.v1.LogoutResponse\"\x00\x12(\n\x08GetUsage\x12\t.v1.Empty\x1a\x0f.v1.UsageStatus\"\x00\x12\x35\n\x0cListAccounts\x12\t.v1.Empty\x1a\x18.v1.ListAccountsResponse\"\x00\x12\x34\n\x11GetAccountBalance\x12\t.v1.Empty\x1a\x12.v1.AccountBalance\"\x00\x12\x30\n\nPlaceOrder\x12\x15.v1.PlaceOrderRequest\x1a\t.v1.Trade\"\x00\x12@\n\x0bPlaceOrders\x12\x16.v1.PlaceOrdersRequest\x1a\x17.v1.PlaceOrdersResponse\"\x00\x12?\n\x0fPlaceComboOrder\x12\x1a.v1.PlaceComboOrderRequest\x1a\x0e.v1.ComboTrade\"\x00\x12\x32\n\x0bUpdateOrder\x12\x16.v1.UpdateOrderRequest\x1a\t.v1.Trade\"\x00\x12\x32\n\x0b\x43\x61ncelOrder\x12\x16.v1.CancelOrderRequest\x1a\t.v1.Trade\"\x00\x12\x42\n\x0c\x43\x61ncelOrders\x12\x17.v1.CancelOrdersRequest\x1a\x15.v1.CancelOrderResult\"\x00\x30\x01\x12\x41\n\x10\x43\x61ncelComboOrder\x12\x1b.v1.CancelComboOrderRequest\x1a\x0e.v1.ComboTrade\"\x00\x12\x34\n\x0cUpdateStatus\x12\x17.v1.UpdateStatusRequest\x1a\t.v1.Empty\"\x00\x12\x39\n\x11UpdateComboStatus\x12\x17.v1.UpdateStatusRequest\x1a\t.v1.Empty\"\x00\x12\x31\n\nListTrades\x12\t.v1.Empty\x1a\x16.v1.ListTradesResponse\"\x00\x12;\n\x0fListComboTrades\x12\t.v1.Empty\x1a\x1b.v1.ListComboTradesResponse\"\x00\x12G\n\x0fListTradesDelta\x12\x1a.v1.ListTradesDeltaRequest\x1a\x16.v1.ListTradesResponse\"\x00\x12Q\n\x14ListComboTradesDelta\x12\x1a.v1.ListTradesDeltaRequest\x1a\x1b.v1.ListComboTradesResponse\"\x00\x12X\n\x13GetOrderDealRecords\x12\x1e.v1.GetOrderDealRecordsRequest\x1a\x1f.v1.GetOrderDealRecordsResponse\"\x00\x12\x46\n\rListPositions\x12\x18.v1.ListPositionsRequest\x1a\x19.v1.ListPositionsResponse\"\x00\x12U\n\x12ListPositionDetail\x12\x1d.v1.ListPositionDetailRequest\x1a\x1e.v1.ListPositionDetailResponse\"\x00\x12I\n\x0eListProfitLoss\x12\x19.v1.ListProfitLossRequest\x1a\x1a.v1.ListProfitLossResponse\"\x00\x12[\n\x14ListProfitLossDetail\x12\x1f.v1.ListProfitLossDetailRequest\x1a .v1.ListProfitLossDetailResponse\"\x00\x12^\n\x15ListProfitLossSummary\x12 .v1.ListProfitLossSummaryRequest\x1a!.v1.ListProfitLossSummaryResponse\"\x00\x12I\n\x0eGetSettlements\x12\x19.v1.GetSettlementsRequest\x1a\x1a.v1.GetSettlementsResponse\"\x00\x12J\n\x0fListSettlements\x12\x19.v1.GetSettlementsRequest\x1a\x1a.v1.GetSettlementsResponse\"\x00\x12/\n\tGetMargin\x12\x14.v1.GetMarginRequest\x1a\n.v1.Margin\"\x00\x12\x44\n\x10GetTradingLimits\x12\x1b.v1.GetTradingLimitsRequest\x1a\x11.v1.TradingLimits\"\x00\x12_\n\x16GetStockReserveSummary\x12!.v1.GetStockReserveSummaryRequest\x1a .v1.ReserveStocksSummaryResponse\"\x00\x12\\\n\x15GetStockReserveDetail\x12 .v1.GetStockReserveDetailRequest\x1a\x1f.v1.ReserveStocksDetailResponse\"\x00\x12\x43\n\x0cReserveStock\x12\x17.v1.ReserveStockRequest\x1a\x18.v1.ReserveStockResponse\"\x00\x12X\n\x13GetEarmarkingDetail\x12\x1e.v1.GetEarmarkingDetailRequest\x1a\x1f.v1.EarmarkStocksDetailResponse\"\x00\x12R\n\x11ReserveEarmarking\x12\x1c.v1.ReserveEarmarkingRequest\x1a\x1d.v1.ReserveEarmarkingResponse\"\x00\x12\x43\n\x0cGetSnapshots\x12\x17.v1.GetSnapshotsRequest\x1a\x18.v1.GetSnapshotsResponse\"\x00\x12,\n\x08GetTicks\x12\x13.v1.GetTicksRequest\x1a\t.v1.Ticks\"\x00\x12,\n\x08GetKbars\x12\x13.v1.GetKbarsRequest\x1a\t.v1.Kbars\"\x00\x12\x43\n\rGetKbarsBatch\x12\x18.v1.GetKbarsBatchRequest\x1a\x14.v1.KbarsBatchResult\"\x00\x30\x01\x12H\n\x15StreamHistoricalTicks\x12 .v1.StreamHistoricalTicksRequest\x1a\t.v1.Ticks\"\x00\x30\x01\x12H\n\x15StreamHistoricalKbars\x12 .v1.StreamHistoricalKbarsRequest\x1a\t.v1.Kbars\"\x00\x30\x01\x12\x32\n\x0bGetTickBars\x12\x16.v1.GetTickBarsRequest\x1a\t.v1.Kbars\"\x00\x12\x44\n\x10GetTickAnalytics\x12\x1b.v1.GetTickAnalyticsRequest\x1a\x11.v1.TickAnalytics\"\x00\x12>\n\x0eGetDailyQuotes\x12\x19.v1.GetDailyQuotesRequest\x1a\x0f.v1.DailyQuotes\"\x00\x12I\n\x0e\x43reditEnquires\x12\x19.v1.CreditEnquiresRequest\x1a\x1a.v1.CreditEnquiresResponse\"\x00\x12[\n\x14GetShortStockSources\x12\x1f.v1.GetShortStockSourcesRequest\x1a .v1.GetShortStockSourcesResponse\"\x00\x12@\n\x0bGetScanners\x12\x16.v1.GetScannersRequest\x1a\x17.v1.GetScannersResponse\"\x00\x12$\n\tGetPunish\x12\t.v1.Empty\x1a\n.v1.Punish\"\x00\x12$\n\tGetNotice\x12\t.v1.Empty\x1a\n.v1.Notice\"\x00\x12\x38\n\x0e\x46\x65tchContracts\x12\x19.v1.FetchContractsRequest\x1a\t.v1.Empty\"\x00\x12>\n\x0eGetOptionChain\x12\x19.v1.GetOptionChainRequest\x1a\x0f.v1.OptionChain\"\x00\x12\x46\n\rFindContracts\x12\x18.v1.FindContractsRequest\x1a\x19.v1.FindContractsResponse\"\x00\x12:\n\x14GetSingleflightStats\x12\t.v1.Empty\x1a\x15.v1.SingleflightStats\"\x00\x12L\n\x0fGetCAExpireTime\x12\x1a.v1.GetCAExpireTimeRequest\x1a\x1b.v1.GetCAExpireTimeResponse\"\x00\x12I\n\x0eSubscribeTrade\x12\x19.v1.SubscribeTradeRequest\x1a\x1a.v1.SubscribeTradeResponse\"\x00\x12O\n\x10UnsubscribeTrade\x12\x1b.v1.UnsubscribeTradeRequest\x1a\x1c.v1.UnsubscribeTradeResponse\"\x00\x12\x33\n\x0bStreamTicks\x12\x16.v1.StreamTicksRequest\x1a\x08.v1.Tick\"\x00\x30\x01\x12\x37\n\x0cStreamBidAsk\x12\x17.v1.StreamBidAskRequest\x1a\n.v1.BidAsk\"\x00\x30\x01\x12\x45\n\x11StreamOrderEvents\x12\x1c.v1.StreamOrderEventsRequest\x1a\x0e.v1.OrderEvent\"\x00\x30\x01\x42\x1aZ\x18phoenix/processor/pkg/pbb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -32,52 +32,54 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'provider_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'Z\030phoenix/processor/pkg/pb'
-  _globals['_ACTION']._serialized_start=12665
-  _globals['_ACTION']._serialized_end=12730
-  _globals['_ORDERTYPE']._serialized_start=12732
-  _globals['_ORDERTYPE']._serialized_end=12831
-  _globals['_STOCKPRICETYPE']._serialized_start=12834
-  _globals['_STOCKPRICETYPE']._serialized_end=12964
-  _globals['_STOCKORDERLOT']._serialized_start=12967
-  _globals['_STOCKORDERLOT']._serialized_end=13162
-  _globals['_STOCKORDERCOND']._serialized_start=13165
-  _globals['_STOCKORDERCOND']._serialized_end=13374
-  _globals['_FUTURESPRICETYPE']._serialized_start=13377
-  _globals['_FUTURESPRICETYPE']._serialized_end=13515
-  _globals['_FUTURESOCTYPE']._serialized_start=13518
-  _globals['_FUTURESOCTYPE']._serialized_end=13669
-  _globals['_SECURITYTYPE']._serialized_start=13672
-  _globals['_SECURITYTYPE']._serialized_end=13809
-  _globals['_EXCHANGE']._serialized_start=13811
-  _globals['_EXCHANGE']._serialized_end=13922
-  _globals['_CURRENCY']._serialized_start=13925
-  _globals['_CURRENCY']._serialized_end=14321
-  _globals['_OPTIONRIGHT']._serialized_start=14323
-  _globals['_OPTIONRIGHT']._serialized_end=14432
-  _globals['_STATUS']._serialized_start=14435
-  _globals['_STATUS']._serialized_end=14644
-  _globals['_ORDERSTATE']._serialized_start=14647
-  _globals['_ORDERSTATE']._serialized_end=14802
-  _globals['_QUOTETYPE']._serialized_start=14804
-  _globals['_QUOTETYPE']._serialized_end=14909
-  _globals['_QUOTEVERSION']._serialized_start=14911
-  _globals['_QUOTEVERSION']._serialized_end=14978
-  _globals['_DAYTRADE']._serialized_start=14980
-  _globals['_DAYTRADE']._serialized_end=15077
-  _globals['_TICKTYPE']._serialized_start=15079
-  _globals['_TICKTYPE']._serialized_end=15173
-  _globals['_CHANGETYPE']._serialized_start=15176
-  _globals['_CHANGETYPE']._serialized_end=15338
-  _globals['_UNIT']._serialized_start=15340
-  _globals['_UNIT']._serialized_end=15401
-  _globals['_TRADETYPE']._serialized_start=15403
-  _globals['_TRADETYPE']._serialized_end=15490
-  _globals['_SCANNERTYPE']._serialized_start=15493
-  _globals['_SCANNERTYPE']._serialized_end=15727
-  _globals['_TICKSQUERYTYPE']._serialized_start=15730
-  _globals['_TICKSQUERYTYPE']._serialized_end=15873
-  _globals['_FETCHSTATUS']._serialized_start=15875
-  _globals['_FETCHSTATUS']._serialized_end=15967
+  _globals['_TICKBARTYPE']._serialized_start=17264
+  _globals['_TICKBARTYPE']._serialized_end=17383
+  _globals['_ACTION']._serialized_start=17385
+  _globals['_ACTION']._serialized_end=17450
+  _globals['_ORDERTYPE']._serialized_start=17452
+  _globals['_ORDERTYPE']._serialized_end=17551
+  _globals['_STOCKPRICETYPE']._serialized_start=17554
+  _globals['_STOCKPRICETYPE']._serialized_end=17684
+  _globals['_STOCKORDERLOT']._serialized_start=17687
+  _globals['_STOCKORDERLOT']._serialized_end=17882
+  _globals['_STOCKORDERCOND']._serialized_start=17885
+  _globals['_STOCKORDERCOND']._serialized_end=18094
+  _globals['_FUTURESPRICETYPE']._serialized_start=18097
+  _globals['_FUTURESPRICETYPE']._serialized_end=18235
+  _globals['_FUTURESOCTYPE']._serialized_start=18238
+  _globals['_FUTURESOCTYPE']._serialized_end=18389
+  _globals['_SECURITYTYPE']._serialized_start=18392
+  _globals['_SECURITYTYPE']._serialized_end=18529
+  _globals['_EXCHANGE']._serialized_start=18531
+  _globals['_EXCHANGE']._serialized_end=18642
+  _globals['_CURRENCY']._serialized_start=18645
+  _globals['_CURRENCY']._serialized_end=19041
+  _globals['_OPTIONRIGHT']._serialized_start=19043
+  _globals['_OPTIONRIGHT']._serialized_end=19152
+  _globals['_STATUS']._serialized_start=19155
+  _globals['_STATUS']._serialized_end=19364
+  _globals['_ORDERSTATE']._serialized_start=19367
+  _globals['_ORDERSTATE']._serialized_end=19522
+  _globals['_QUOTETYPE']._serialized_start=19524
+  _globals['_QUOTETYPE']._serialized_end=19629
+  _globals['_QUOTEVERSION']._serialized_start=19631
+  _globals['_QUOTEVERSION']._serialized_end=19698
+  _globals['_DAYTRADE']._serialized_start=19700
+  _globals['_DAYTRADE']._serialized_end=19797
+  _globals['_TICKTYPE']._serialized_start=19799
+  _globals['_TICKTYPE']._serialized_end=19893
+  _globals['_CHANGETYPE']._serialized_start=19896
+  _globals['_CHANGETYPE']._serialized_end=20058
+  _globals['_UNIT']._serialized_start=20060
+  _globals['_UNIT']._serialized_end=20121
+  _globals['_TRADETYPE']._serialized_start=20123
+  _globals['_TRADETYPE']._serialized_end=20210
+  _globals['_SCANNERTYPE']._serialized_start=20213
+  _globals['_SCANNERTYPE']._serialized_end=20447
+  _globals['_TICKSQUERYTYPE']._serialized_start=20450
+  _globals['_TICKSQUERYTYPE']._serialized_end=20593
+  _globals['_FETCHSTATUS']._serialized_start=20595
+  _globals['_FETCHSTATUS']._serialized_end=20687
   _globals['_EMPTY']._serialized_start=22
   _globals['_EMPTY']._serialized_end=29
   _globals['_LOGINREQUEST']._serialized_start=31
@@ -114,168 +116,228 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_COMBOTRADE']._serialized_end=2949
   _globals['_PLACEORDERREQUEST']._serialized_start=2951
   _globals['_PLACEORDERREQUEST']._serialized_end=3028
-  _globals['_PLACECOMBOORDERREQUEST']._serialized_start=3030
-  _globals['_PLACECOMBOORDERREQUEST']._serialized_end=3128
-  _globals['_UPDATEORDERREQUEST']._serialized_start=3130
-  _globals['_UPDATEORDERREQUEST']._serialized_end=3209
-  _globals['_CANCELORDERREQUEST']._serialized_start=3211
-  _globals['_CANCELORDERREQUEST']._serialized_end=3257
-  _globals['_CANCELCOMBOORDERREQUEST']._serialized_start=3259
-  _globals['_CANCELCOMBOORDERREQUEST']._serialized_end=3320
-  _globals['_UPDATESTATUSREQUEST']._serialized_start=3322
-  _globals['_UPDATESTATUSREQUEST']._serialized_end=3373
-  _globals['_LISTTRADESRESPONSE']._serialized_start=3375
-  _globals['_LISTTRADESRESPONSE']._serialized_end=3422
-  _globals['_LISTCOMBOTRADESRESPONSE']._serialized_start=3424
-  _globals['_LISTCOMBOTRADESRESPONSE']._serialized_end=3487
-  _globals['_GETORDERDEALRECORDSREQUEST']._serialized_start=3489
-  _globals['_GETORDERDEALRECORDSREQUEST']._serialized_end=3547
-  _globals['_GETORDERDEALRECORDSRESPONSE']._serialized_start=3549
-  _globals['_GETORDERDEALRECORDSRESPONSE']._serialized_end=3616
-  _globals['_ORDERDEALRECORD']._serialized_start=3618
-  _globals['_ORDERDEALRECORD']._serialized_end=3722
-  _globals['_LISTPOSITIONSREQUEST']._serialized_start=3724
-  _globals['_LISTPOSITIONSREQUEST']._serialized_end=3790
-  _globals['_STOCKPOSITION']._serialized_start=3793
-  _globals['_STOCKPOSITION']._serialized_end=4083
-  _globals['_FUTUREPOSITION']._serialized_start=4086
-  _globals['_FUTUREPOSITION']._serialized_end=4225
-  _globals['_POSITION']._serialized_start=4227
-  _globals['_POSITION']._serialized_end=4341
-  _globals['_LISTPOSITIONSRESPONSE']._serialized_start=4343
-  _globals['_LISTPOSITIONSRESPONSE']._serialized_end=4399
-  _globals['_LISTPOSITIONDETAILREQUEST']._serialized_start=4401
-  _globals['_LISTPOSITIONDETAILREQUEST']._serialized_end=4477
-  _globals['_STOCKPOSITIONDETAIL']._serialized_start=4480
-  _globals['_STOCKPOSITIONDETAIL']._serialized_end=4806
-  _globals['_FUTUREPOSITIONDETAIL']._serialized_start=4809
-  _globals['_FUTUREPOSITIONDETAIL']._serialized_end=5039
-  _globals['_POSITIONDETAIL']._serialized_start=5041
-  _globals['_POSITIONDETAIL']._serialized_end=5167
-  _globals['_LISTPOSITIONDETAILRESPONSE']._serialized_start=5169
-  _globals['_LISTPOSITIONDETAILRESPONSE']._serialized_end=5234
-  _globals['_LISTPROFITLOSSREQUEST']._serialized_start=5236
-  _globals['_LISTPROFITLOSSREQUEST']._serialized_end=5327
-  _globals['_STOCKPROFITLOSS']._serialized_start=5330
-  _globals['_STOCKPROFITLOSS']._serialized_end=5514
-  _globals['_FUTUREPROFITLOSS']._serialized_start=5517
-  _globals['_FUTUREPROFITLOSS']._serialized_end=5705
-  _globals['_PROFITLOSS']._serialized_start=5707
-  _globals['_PROFITLOSS']._serialized_end=5813
-  _globals['_LISTPROFITLOSSRESPONSE']._serialized_start=5815
-  _globals['_LISTPROFITLOSSRESPONSE']._serialized_end=5878
-  _globals['_LISTPROFITLOSSDETAILREQUEST']._serialized_start=5880
-  _globals['_LISTPROFITLOSSDETAILREQUEST']._serialized_end=5958
-  _globals['_STOCKPROFITDETAIL']._serialized_start=5961
-  _globals['_STOCKPROFITDETAIL']._serialized_end=6340
-  _globals['_FUTUREPROFITDETAIL']._serialized_start=6343
-  _globals['_FUTUREPROFITDETAIL']._serialized_end=6587
-  _globals['_PROFITDETAIL']._serialized_start=6589
-  _globals['_PROFITDETAIL']._serialized_end=6709
-  _globals['_LISTPROFITLOSSDETAILRESPONSE']._serialized_start=6711
-  _globals['_LISTPROFITLOSSDETAILRESPONSE']._serialized_end=6776
-  _globals['_LISTPROFITLOSSSUMMARYREQUEST']._serialized_start=6778
-  _globals['_LISTPROFITLOSSSUMMARYREQUEST']._serialized_end=6838
-  _globals['_STOCKPROFITLOSSSUMMARY']._serialized_start=6841
-  _globals['_STOCKPROFITLOSSSUMMARY']._serialized_end=7113
-  _globals['_FUTUREPROFITLOSSSUMMARY']._serialized_start=7116
-  _globals['_FUTUREPROFITLOSSSUMMARY']._serialized_end=7317
-  _globals['_PROFITLOSSSUMMARY']._serialized_start=7320
-  _globals['_PROFITLOSSSUMMARY']._serialized_end=7458
-  _globals['_LISTPROFITLOSSSUMMARYRESPONSE']._serialized_start=7460
-  _globals['_LISTPROFITLOSSSUMMARYRESPONSE']._serialized_end=7533
-  _globals['_GETSETTLEMENTSREQUEST']._serialized_start=7535
-  _globals['_GETSETTLEMENTSREQUEST']._serialized_end=7588
-  _globals['_SETTLEMENT']._serialized_start=7591
-  _globals['_SETTLEMENT']._serialized_end=7766
-  _globals['_GETSETTLEMENTSRESPONSE']._serialized_start=7768
-  _globals['_GETSETTLEMENTSRESPONSE']._serialized_end=7829
-  _globals['_GETMARGINREQUEST']._serialized_start=7831
-  _globals['_GETMARGINREQUEST']._serialized_end=7879
-  _globals['_MARGIN']._serialized_start=7882
-  _globals['_MARGIN']._serialized_end=8610
-  _globals['_GETTRADINGLIMITSREQUEST']._serialized_start=8612
-  _globals['_GETTRADINGLIMITSREQUEST']._serialized_end=8667
-  _globals['_TRADINGLIMITS']._serialized_start=8670
-  _globals['_TRADINGLIMITS']._serialized_end=8925
-  _globals['_GETSTOCKRESERVESUMMARYREQUEST']._serialized_start=8927
-  _globals['_GETSTOCKRESERVESUMMARYREQUEST']._serialized_end=8988
-  _globals['_RESERVESTOCKSSUMMARYRESPONSE']._serialized_start=8990
-  _globals['_RESERVESTOCKSSUMMARYRESPONSE']._serialized_end=9043
-  _globals['_GETSTOCKRESERVEDETAILREQUEST']._serialized_start=9045
-  _globals['_GETSTOCKRESERVEDETAILREQUEST']._serialized_end=9105
-  _globals['_RESERVESTOCKSDETAILRESPONSE']._serialized_start=9107
-  _globals['_RESERVESTOCKSDETAILRESPONSE']._serialized_end=9159
-  _globals['_RESERVESTOCKREQUEST']._serialized_start=9161
-  _globals['_RESERVESTOCKREQUEST']._serialized_end=9259
-  _globals['_RESERVESTOCKRESPONSE']._serialized_start=9261
-  _globals['_RESERVESTOCKRESPONSE']._serialized_end=9306
-  _globals['_GETEARMARKINGDETAILREQUEST']._serialized_start=9308
-  _globals['_GETEARMARKINGDETAILREQUEST']._serialized_end=9366
-  _globals['_EARMARKSTOCKSDETAILRESPONSE']._serialized_start=9368
-  _globals['_EARMARKSTOCKSDETAILRESPONSE']._serialized_end=9420
-  _globals['_RESERVEEARMARKINGREQUEST']._serialized_start=9422
-  _globals['_RESERVEEARMARKINGREQUEST']._serialized_end=9540
-  _globals['_RESERVEEARMARKINGRESPONSE']._serialized_start=9542
-  _globals['_RESERVEEARMARKINGRESPONSE']._serialized_end=9592
-  _globals['_GETSNAPSHOTSREQUEST']._serialized_start=9594
-  _globals['_GETSNAPSHOTSREQUEST']._serialized_end=9639
-  _globals['_GETSNAPSHOTSRESPONSE']._serialized_start=9641
-  _globals['_GETSNAPSHOTSRESPONSE']._serialized_end=9696
-  _globals['_SNAPSHOT']._serialized_start=9699
-  _globals['_SNAPSHOT']._serialized_end=10163
-  _globals['_GETTICKSREQUEST']._serialized_start=10165
-  _globals['_GETTICKSREQUEST']._serialized_end=10219
-  _globals['_TICKS']._serialized_start=10222
-  _globals['_TICKS']._serialized_end=10369
-  _globals['_GETKBARSREQUEST']._serialized_start=10371
-  _globals['_GETKBARSREQUEST']._serialized_end=10449
-  _globals['_KBARS']._serialized_start=10451
-  _globals['_KBARS']._serialized_end=10558
-  _globals['_GETDAILYQUOTESREQUEST']._serialized_start=10560
-  _globals['_GETDAILYQUOTESREQUEST']._serialized_end=10597
-  _globals['_DAILYQUOTES']._serialized_start=10600
-  _globals['_DAILYQUOTES']._serialized_end=10750
-  _globals['_CREDITENQUIRESREQUEST']._serialized_start=10752
-  _globals['_CREDITENQUIRESREQUEST']._serialized_end=10799
-  _globals['_CREDITENQUIRESRESPONSE']._serialized_start=10801
-  _globals['_CREDITENQUIRESRESPONSE']._serialized_end=10869
-  _globals['_CREDITENQUIRE']._serialized_start=10871
-  _globals['_CREDITENQUIRE']._serialized_end=10982
-  _globals['_GETSHORTSTOCKSOURCESREQUEST']._serialized_start=10984
-  _globals['_GETSHORTSTOCKSOURCESREQUEST']._serialized_end=11037
-  _globals['_GETSHORTSTOCKSOURCESRESPONSE']._serialized_start=11039
-  _globals['_GETSHORTSTOCKSOURCESRESPONSE']._serialized_end=11108
-  _globals['_SHORTSTOCKSOURCE']._serialized_start=11110
-  _globals['_SHORTSTOCKSOURCE']._serialized_end=11182
-  _globals['_GETSCANNERSREQUEST']._serialized_start=11184
-  _globals['_GETSCANNERSREQUEST']._serialized_end=11291
-  _globals['_GETSCANNERSRESPONSE']._serialized_start=11293
-  _globals['_GETSCANNERSRESPONSE']._serialized_end=11349
-  _globals['_SCANNERITEM']._serialized_start=11352
-  _globals['_SCANNERITEM']._serialized_end=11917
-  _globals['_PUNISH']._serialized_start=11920
-  _globals['_PUNISH']._serialized_end=12104
-  _globals['_NOTICE']._serialized_start=12106
-  _globals['_NOTICE']._serialized_end=12203
-  _globals['_FETCHCONTRACTSREQUEST']._serialized_start=12205
-  _globals['_FETCHCONTRACTSREQUEST']._serialized_end=12255
-  _globals['_ACTIVATECAREQUEST']._serialized_start=12257
-  _globals['_ACTIVATECAREQUEST']._serialized_end=12331
-  _globals['_ACTIVATECARESPONSE']._serialized_start=12333
-  _globals['_ACTIVATECARESPONSE']._serialized_end=12370
-  _globals['_GETCAEXPIRETIMEREQUEST']._serialized_start=12372
-  _globals['_GETCAEXPIRETIMEREQUEST']._serialized_end=12415
-  _globals['_GETCAEXPIRETIMERESPONSE']._serialized_start=12417
-  _globals['_GETCAEXPIRETIMERESPONSE']._serialized_end=12463
-  _globals['_SUBSCRIBETRADEREQUEST']._serialized_start=12465
-  _globals['_SUBSCRIBETRADEREQUEST']._serialized_end=12518
-  _globals['_SUBSCRIBETRADERESPONSE']._serialized_start=12520
-  _globals['_SUBSCRIBETRADERESPONSE']._serialized_end=12561
-  _globals['_UNSUBSCRIBETRADEREQUEST']._serialized_start=12563
-  _globals['_UNSUBSCRIBETRADEREQUEST']._serialized_end=12618
-  _globals['_UNSUBSCRIBETRADERESPONSE']._serialized_start=12620
-  _globals['_UNSUBSCRIBETRADERESPONSE']._serialized_end=12663
-  _globals['_SHIOAJIPROVIDER']._serialized_start=15970
-  _globals['_SHIOAJIPROVIDER']._serialized_end=18784
+  _globals['_PLACEORDERSREQUEST']._serialized_start=3030
+  _globals['_PLACEORDERSREQUEST']._serialized_end=3110
+  _globals['_PLACEORDERRESULT']._serialized_start=3112
+  _globals['_PLACEORDERRESULT']._serialized_end=3171
+  _globals['_PLACEORDERSRESPONSE']._serialized_start=3173
+  _globals['_PLACEORDERSRESPONSE']._serialized_end=3233
+  _globals['_PLACECOMBOORDERREQUEST']._serialized_start=3235
+  _globals['_PLACECOMBOORDERREQUEST']._serialized_end=3333
+  _globals['_UPDATEORDERREQUEST']._serialized_start=3335
+  _globals['_UPDATEORDERREQUEST']._serialized_end=3414
+  _globals['_CANCELORDERREQUEST']._serialized_start=3416
+  _globals['_CANCELORDERREQUEST']._serialized_end=3462
+  _globals['_CANCELORDERSREQUEST']._serialized_start=3465
+  _globals['_CANCELORDERSREQUEST']._serialized_end=3613
+  _globals['_CANCELORDERRESULT']._serialized_start=3615
+  _globals['_CANCELORDERRESULT']._serialized_end=3675
+  _globals['_CANCELCOMBOORDERREQUEST']._serialized_start=3677
+  _globals['_CANCELCOMBOORDERREQUEST']._serialized_end=3738
+  _globals['_UPDATESTATUSREQUEST']._serialized_start=3740
+  _globals['_UPDATESTATUSREQUEST']._serialized_end=3791
+  _globals['_LISTTRADESRESPONSE']._serialized_start=3793
+  _globals['_LISTTRADESRESPONSE']._serialized_end=3872
+  _globals['_LISTCOMBOTRADESRESPONSE']._serialized_start=3874
+  _globals['_LISTCOMBOTRADESRESPONSE']._serialized_end=3969
+  _globals['_LISTTRADESDELTAREQUEST']._serialized_start=3971
+  _globals['_LISTTRADESDELTAREQUEST']._serialized_end=4033
+  _globals['_GETORDERDEALRECORDSREQUEST']._serialized_start=4035
+  _globals['_GETORDERDEALRECORDSREQUEST']._serialized_end=4093
+  _globals['_GETORDERDEALRECORDSRESPONSE']._serialized_start=4095
+  _globals['_GETORDERDEALRECORDSRESPONSE']._serialized_end=4162
+  _globals['_ORDERDEALRECORD']._serialized_start=4164
+  _globals['_ORDERDEALRECORD']._serialized_end=4268
+  _globals['_LISTPOSITIONSREQUEST']._serialized_start=4270
+  _globals['_LISTPOSITIONSREQUEST']._serialized_end=4336
+  _globals['_STOCKPOSITION']._serialized_start=4339
+  _globals['_STOCKPOSITION']._serialized_end=4629
+  _globals['_FUTUREPOSITION']._serialized_start=4632
+  _globals['_FUTUREPOSITION']._serialized_end=4771
+  _globals['_POSITION']._serialized_start=4773
+  _globals['_POSITION']._serialized_end=4887
+  _globals['_LISTPOSITIONSRESPONSE']._serialized_start=4889
+  _globals['_LISTPOSITIONSRESPONSE']._serialized_end=4945
+  _globals['_LISTPOSITIONDETAILREQUEST']._serialized_start=4947
+  _globals['_LISTPOSITIONDETAILREQUEST']._serialized_end=5023
+  _globals['_STOCKPOSITIONDETAIL']._serialized_start=5026
+  _globals['_STOCKPOSITIONDETAIL']._serialized_end=5352
+  _globals['_FUTUREPOSITIONDETAIL']._serialized_start=5355
+  _globals['_FUTUREPOSITIONDETAIL']._serialized_end=5585
+  _globals['_POSITIONDETAIL']._serialized_start=5587
+  _globals['_POSITIONDETAIL']._serialized_end=5713
+  _globals['_LISTPOSITIONDETAILRESPONSE']._serialized_start=5715
+  _globals['_LISTPOSITIONDETAILRESPONSE']._serialized_end=5780
+  _globals['_LISTPROFITLOSSREQUEST']._serialized_start=5782
+  _globals['_LISTPROFITLOSSREQUEST']._serialized_end=5873
+  _globals['_STOCKPROFITLOSS']._serialized_start=5876
+  _globals['_STOCKPROFITLOSS']._serialized_end=6060
+  _globals['_FUTUREPROFITLOSS']._serialized_start=6063
+  _globals['_FUTUREPROFITLOSS']._serialized_end=6251
+  _globals['_PROFITLOSS']._serialized_start=6253
+  _globals['_PROFITLOSS']._serialized_end=6359
+  _globals['_LISTPROFITLOSSRESPONSE']._serialized_start=6361
+  _globals['_LISTPROFITLOSSRESPONSE']._serialized_end=6424
+  _globals['_LISTPROFITLOSSDETAILREQUEST']._serialized_start=6426
+  _globals['_LISTPROFITLOSSDETAILREQUEST']._serialized_end=6504
+  _globals['_STOCKPROFITDETAIL']._serialized_start=6507
+  _globals['_STOCKPROFITDETAIL']._serialized_end=6886
+  _globals['_FUTUREPROFITDETAIL']._serialized_start=6889
+  _globals['_FUTUREPROFITDETAIL']._serialized_end=7133
+  _globals['_PROFITDETAIL']._serialized_start=7135
+  _globals['_PROFITDETAIL']._serialized_end=7255
+  _globals['_LISTPROFITLOSSDETAILRESPONSE']._serialized_start=7257
+  _globals['_LISTPROFITLOSSDETAILRESPONSE']._serialized_end=7322
+  _globals['_LISTPROFITLOSSSUMMARYREQUEST']._serialized_start=7324
+  _globals['_LISTPROFITLOSSSUMMARYREQUEST']._serialized_end=7384
+  _globals['_STOCKPROFITLOSSSUMMARY']._serialized_start=7387
+  _globals['_STOCKPROFITLOSSSUMMARY']._serialized_end=7659
+  _globals['_FUTUREPROFITLOSSSUMMARY']._serialized_start=7662
+  _globals['_FUTUREPROFITLOSSSUMMARY']._serialized_end=7863
+  _globals['_PROFITLOSSSUMMARY']._serialized_start=7866
+  _globals['_PROFITLOSSSUMMARY']._serialized_end=8004
+  _globals['_LISTPROFITLOSSSUMMARYRESPONSE']._serialized_start=8006
+  _globals['_LISTPROFITLOSSSUMMARYRESPONSE']._serialized_end=8079
+  _globals['_GETSETTLEMENTSREQUEST']._serialized_start=8081
+  _globals['_GETSETTLEMENTSREQUEST']._serialized_end=8134
+  _globals['_SETTLEMENT']._serialized_start=8137
+  _globals['_SETTLEMENT']._serialized_end=8312
+  _globals['_GETSETTLEMENTSRESPONSE']._serialized_start=8314
+  _globals['_GETSETTLEMENTSRESPONSE']._serialized_end=8375
+  _globals['_GETMARGINREQUEST']._serialized_start=8377
+  _globals['_GETMARGINREQUEST']._serialized_end=8425
+  _globals['_MARGIN']._serialized_start=8428
+  _globals['_MARGIN']._serialized_end=9156
+  _globals['_GETTRADINGLIMITSREQUEST']._serialized_start=9158
+  _globals['_GETTRADINGLIMITSREQUEST']._serialized_end=9213
+  _globals['_TRADINGLIMITS']._serialized_start=9216
+  _globals['_TRADINGLIMITS']._serialized_end=9471
+  _globals['_GETSTOCKRESERVESUMMARYREQUEST']._serialized_start=9473
+  _globals['_GETSTOCKRESERVESUMMARYREQUEST']._serialized_end=9534
+  _globals['_RESERVESTOCKSSUMMARYRESPONSE']._serialized_start=9536
+  _globals['_RESERVESTOCKSSUMMARYRESPONSE']._serialized_end=9589
+  _globals['_GETSTOCKRESERVEDETAILREQUEST']._serialized_start=9591
+  _globals['_GETSTOCKRESERVEDETAILREQUEST']._serialized_end=9651
+  _globals['_RESERVESTOCKSDETAILRESPONSE']._serialized_start=9653
+  _globals['_RESERVESTOCKSDETAILRESPONSE']._serialized_end=9705
+  _globals['_RESERVESTOCKREQUEST']._serialized_start=9707
+  _globals['_RESERVESTOCKREQUEST']._serialized_end=9805
+  _globals['_RESERVESTOCKRESPONSE']._serialized_start=9807
+  _globals['_RESERVESTOCKRESPONSE']._serialized_end=9852
+  _globals['_GETEARMARKINGDETAILREQUEST']._serialized_start=9854
+  _globals['_GETEARMARKINGDETAILREQUEST']._serialized_end=9912
+  _globals['_EARMARKSTOCKSDETAILRESPONSE']._serialized_start=9914
+  _globals['_EARMARKSTOCKSDETAILRESPONSE']._serialized_end=9966
+  _globals['_RESERVEEARMARKINGREQUEST']._serialized_start=9968
+  _globals['_RESERVEEARMARKINGREQUEST']._serialized_end=10086
+  _globals['_RESERVEEARMARKINGRESPONSE']._serialized_start=10088
+  _globals['_RESERVEEARMARKINGRESPONSE']._serialized_end=10138
+  _globals['_GETSNAPSHOTSREQUEST']._serialized_start=10140
+  _globals['_GETSNAPSHOTSREQUEST']._serialized_end=10185
+  _globals['_GETSNAPSHOTSRESPONSE']._serialized_start=10187
+  _globals['_GETSNAPSHOTSRESPONSE']._serialized_end=10242
+  _globals['_SNAPSHOT']._serialized_start=10245
+  _globals['_SNAPSHOT']._serialized_end=10709
+  _globals['_GETTICKSREQUEST']._serialized_start=10711
+  _globals['_GETTICKSREQUEST']._serialized_end=10802
+  _globals['_TICKS']._serialized_start=10805
+  _globals['_TICKS']._serialized_end=11093
+  _globals['_PRICEGRID']._serialized_start=11095
+  _globals['_PRICEGRID']._serialized_end=11152
+  _globals['_GETKBARSREQUEST']._serialized_start=11155
+  _globals['_GETKBARSREQUEST']._serialized_end=11330
+  _globals['_GETKBARSBATCHREQUEST']._serialized_start=11332
+  _globals['_GETKBARSBATCHREQUEST']._serialized_end=11435
+  _globals['_KBARSBATCHRESULT']._serialized_start=11437
+  _globals['_KBARSBATCHRESULT']._serialized_end=11519
+  _globals['_STREAMHISTORICALTICKSREQUEST']._serialized_start=11521
+  _globals['_STREAMHISTORICALTICKSREQUEST']._serialized_end=11607
+  _globals['_STREAMHISTORICALKBARSREQUEST']._serialized_start=11609
+  _globals['_STREAMHISTORICALKBARSREQUEST']._serialized_end=11695
+  _globals['_KBARS']._serialized_start=11698
+  _globals['_KBARS']._serialized_end=11955
+  _globals['_GETTICKBARSREQUEST']._serialized_start=11957
+  _globals['_GETTICKBARSREQUEST']._serialized_end=12076
+  _globals['_GETTICKANALYTICSREQUEST']._serialized_start=12078
+  _globals['_GETTICKANALYTICSREQUEST']._serialized_end=12174
+  _globals['_TICKANALYTICS']._serialized_start=12177
+  _globals['_TICKANALYTICS']._serialized_end=12402
+  _globals['_PRICEVOLUME']._serialized_start=12404
+  _globals['_PRICEVOLUME']._serialized_end=12504
+  _globals['_GETDAILYQUOTESREQUEST']._serialized_start=12506
+  _globals['_GETDAILYQUOTESREQUEST']._serialized_end=12543
+  _globals['_DAILYQUOTES']._serialized_start=12546
+  _globals['_DAILYQUOTES']._serialized_end=12696
+  _globals['_CREDITENQUIRESREQUEST']._serialized_start=12698
+  _globals['_CREDITENQUIRESREQUEST']._serialized_end=12745
+  _globals['_CREDITENQUIRESRESPONSE']._serialized_start=12747
+  _globals['_CREDITENQUIRESRESPONSE']._serialized_end=12815
+  _globals['_CREDITENQUIRE']._serialized_start=12817
+  _globals['_CREDITENQUIRE']._serialized_end=12928
+  _globals['_GETSHORTSTOCKSOURCESREQUEST']._serialized_start=12930
+  _globals['_GETSHORTSTOCKSOURCESREQUEST']._serialized_end=12983
+  _globals['_GETSHORTSTOCKSOURCESRESPONSE']._serialized_start=12985
+  _globals['_GETSHORTSTOCKSOURCESRESPONSE']._serialized_end=13054
+  _globals['_SHORTSTOCKSOURCE']._serialized_start=13056
+  _globals['_SHORTSTOCKSOURCE']._serialized_end=13128
+  _globals['_GETSCANNERSREQUEST']._serialized_start=13130
+  _globals['_GETSCANNERSREQUEST']._serialized_end=13237
+  _globals['_GETSCANNERSRESPONSE']._serialized_start=13239
+  _globals['_GETSCANNERSRESPONSE']._serialized_end=13295
+  _globals['_SCANNERITEM']._serialized_start=13298
+  _globals['_SCANNERITEM']._serialized_end=13863
+  _globals['_PUNISH']._serialized_start=13866
+  _globals['_PUNISH']._serialized_end=14050
+  _globals['_NOTICE']._serialized_start=14052
+  _globals['_NOTICE']._serialized_end=14149
+  _globals['_FETCHCONTRACTSREQUEST']._serialized_start=14151
+  _globals['_FETCHCONTRACTSREQUEST']._serialized_end=14201
+  _globals['_GETOPTIONCHAINREQUEST']._serialized_start=14204
+  _globals['_GETOPTIONCHAINREQUEST']._serialized_end=14355
+  _globals['_OPTIONSTRIKE']._serialized_start=14357
+  _globals['_OPTIONSTRIKE']._serialized_end=14472
+  _globals['_OPTIONCHAIN']._serialized_start=14474
+  _globals['_OPTIONCHAIN']._serialized_end=14522
+  _globals['_FINDCONTRACTSREQUEST']._serialized_start=14524
+  _globals['_FINDCONTRACTSREQUEST']._serialized_end=14629
+  _globals['_FINDCONTRACTSRESPONSE']._serialized_start=14631
+  _globals['_FINDCONTRACTSRESPONSE']._serialized_end=14687
+  _globals['_SINGLEFLIGHTMETHODSTATS']._serialized_start=14689
+  _globals['_SINGLEFLIGHTMETHODSTATS']._serialized_end=14780
+  _globals['_SINGLEFLIGHTSTATS']._serialized_start=14782
+  _globals['_SINGLEFLIGHTSTATS']._serialized_end=14847
+  _globals['_ACTIVATECAREQUEST']._serialized_start=14849
+  _globals['_ACTIVATECAREQUEST']._serialized_end=14923
+  _globals['_ACTIVATECARESPONSE']._serialized_start=14925
+  _globals['_ACTIVATECARESPONSE']._serialized_end=14962
+  _globals['_GETCAEXPIRETIMEREQUEST']._serialized_start=14964
+  _globals['_GETCAEXPIRETIMEREQUEST']._serialized_end=15007
+  _globals['_GETCAEXPIRETIMERESPONSE']._serialized_start=15009
+  _globals['_GETCAEXPIRETIMERESPONSE']._serialized_end=15055
+  _globals['_SUBSCRIBETRADEREQUEST']._serialized_start=15057
+  _globals['_SUBSCRIBETRADEREQUEST']._serialized_end=15110
+  _globals['_SUBSCRIBETRADERESPONSE']._serialized_start=15112
+  _globals['_SUBSCRIBETRADERESPONSE']._serialized_end=15153
+  _globals['_UNSUBSCRIBETRADEREQUEST']._serialized_start=15155
+  _globals['_UNSUBSCRIBETRADEREQUEST']._serialized_end=15210
+  _globals['_UNSUBSCRIBETRADERESPONSE']._serialized_start=15212
+  _globals['_UNSUBSCRIBETRADERESPONSE']._serialized_end=15255
+  _globals['_STREAMTICKSREQUEST']._serialized_start=15257
+  _globals['_STREAMTICKSREQUEST']._serialized_end=15321
+  _globals['_TICK']._serialized_start=15324
+  _globals['_TICK']._serialized_end=15784
+  _globals['_STREAMBIDASKREQUEST']._serialized_start=15786
+  _globals['_STREAMBIDASKREQUEST']._serialized_end=15852
+  _globals['_BIDASK']._serialized_start=15855
+  _globals['_BIDASK']._serialized_end=16146
+  _globals['_STREAMORDEREVENTSREQUEST']._serialized_start=16148
+  _globals['_STREAMORDEREVENTSREQUEST']._serialized_end=16244
+  _globals['_ORDEREVENT']._serialized_start=16247
+  _globals['_ORDEREVENT']._serialized_end=16405
+  _globals['_ORDERUPDATE']._serialized_start=16408
+  _globals['_ORDERUPDATE']._serialized_end=16887
+  _globals['_DEALUPDATE']._serialized_start=16890
+  _globals['_DEALUPDATE']._serialized_end=17262
+  _globals['_SHIOAJIPROVIDER']._serialized_start=20690
+  _globals['_SHIOAJIPROVIDER']._serialized_end=24510
 # @@protoc_insertion_point(module_scope)
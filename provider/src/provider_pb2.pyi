@@ -7,6 +7,13 @@ from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class TickBarType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    TICK_BAR_TYPE_UNSPECIFIED: _ClassVar[TickBarType]
+    TICK_BAR_TYPE_TIME: _ClassVar[TickBarType]
+    TICK_BAR_TYPE_VOLUME: _ClassVar[TickBarType]
+    TICK_BAR_TYPE_TICKS: _ClassVar[TickBarType]
+
 class Action(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
     __slots__ = ()
     ACTION_UNSPECIFIED: _ClassVar[Action]
@@ -196,6 +203,10 @@ class FetchStatus(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
     FETCH_STATUS_UNSPECIFIED: _ClassVar[FetchStatus]
     FETCH_STATUS_SUCCESS: _ClassVar[FetchStatus]
     FETCH_STATUS_FAIL: _ClassVar[FetchStatus]
+TICK_BAR_TYPE_UNSPECIFIED: TickBarType
+TICK_BAR_TYPE_TIME: TickBarType
+TICK_BAR_TYPE_VOLUME: TickBarType
+TICK_BAR_TYPE_TICKS: TickBarType
 ACTION_UNSPECIFIED: Action
 ACTION_BUY: Action
 ACTION_SELL: Action
@@ -626,6 +637,28 @@ class PlaceOrderRequest(_message.Message):
     order: Order
     def __init__(self, contract: _Optional[_Union[Contract, _Mapping]] = ..., order: _Optional[_Union[Order, _Mapping]] = ...) -> None: ...
 
+class PlaceOrdersRequest(_message.Message):
+    __slots__ = ("orders", "parallelism")
+    ORDERS_FIELD_NUMBER: _ClassVar[int]
+    PARALLELISM_FIELD_NUMBER: _ClassVar[int]
+    orders: _containers.RepeatedCompositeFieldContainer[PlaceOrderRequest]
+    parallelism: int
+    def __init__(self, orders: _Optional[_Iterable[_Union[PlaceOrderRequest, _Mapping]]] = ..., parallelism: _Optional[int] = ...) -> None: ...
+
+class PlaceOrderResult(_message.Message):
+    __slots__ = ("trade", "error")
+    TRADE_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    trade: Trade
+    error: str
+    def __init__(self, trade: _Optional[_Union[Trade, _Mapping]] = ..., error: _Optional[str] = ...) -> None: ...
+
+class PlaceOrdersResponse(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[PlaceOrderResult]
+    def __init__(self, results: _Optional[_Iterable[_Union[PlaceOrderResult, _Mapping]]] = ...) -> None: ...
+
 class PlaceComboOrderRequest(_message.Message):
     __slots__ = ("combo_contract", "order")
     COMBO_CONTRACT_FIELD_NUMBER: _ClassVar[int]
@@ -650,6 +683,30 @@ class CancelOrderRequest(_message.Message):
     trade: Trade
     def __init__(self, trade: _Optional[_Union[Trade, _Mapping]] = ...) -> None: ...
 
+class CancelOrdersRequest(_message.Message):
+    __slots__ = ("all", "codes", "action", "statuses", "account_id", "parallelism")
+    ALL_FIELD_NUMBER: _ClassVar[int]
+    CODES_FIELD_NUMBER: _ClassVar[int]
+    ACTION_FIELD_NUMBER: _ClassVar[int]
+    STATUSES_FIELD_NUMBER: _ClassVar[int]
+    ACCOUNT_ID_FIELD_NUMBER: _ClassVar[int]
+    PARALLELISM_FIELD_NUMBER: _ClassVar[int]
+    all: bool
+    codes: _containers.RepeatedScalarFieldContainer[str]
+    action: Action
+    statuses: _containers.RepeatedScalarFieldContainer[Status]
+    account_id: str
+    parallelism: int
+    def __init__(self, all: bool = ..., codes: _Optional[_Iterable[str]] = ..., action: _Optional[_Union[Action, str]] = ..., statuses: _Optional[_Iterable[_Union[Status, str]]] = ..., account_id: _Optional[str] = ..., parallelism: _Optional[int] = ...) -> None: ...
+
+class CancelOrderResult(_message.Message):
+    __slots__ = ("trade", "error")
+    TRADE_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    trade: Trade
+    error: str
+    def __init__(self, trade: _Optional[_Union[Trade, _Mapping]] = ..., error: _Optional[str] = ...) -> None: ...
+
 class CancelComboOrderRequest(_message.Message):
     __slots__ = ("combotrade",)
     COMBOTRADE_FIELD_NUMBER: _ClassVar[int]
@@ -663,16 +720,32 @@ class UpdateStatusRequest(_message.Message):
     def __init__(self, account: _Optional[_Union[Account, _Mapping]] = ...) -> None: ...
 
 class ListTradesResponse(_message.Message):
-    __slots__ = ("trades",)
+    __slots__ = ("trades", "version", "epoch")
     TRADES_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    EPOCH_FIELD_NUMBER: _ClassVar[int]
     trades: _containers.RepeatedCompositeFieldContainer[Trade]
-    def __init__(self, trades: _Optional[_Iterable[_Union[Trade, _Mapping]]] = ...) -> None: ...
+    version: int
+    epoch: str
+    def __init__(self, trades: _Optional[_Iterable[_Union[Trade, _Mapping]]] = ..., version: _Optional[int] = ..., epoch: _Optional[str] = ...) -> None: ...
 
 class ListComboTradesResponse(_message.Message):
-    __slots__ = ("combo_trades",)
+    __slots__ = ("combo_trades", "version", "epoch")
     COMBO_TRADES_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    EPOCH_FIELD_NUMBER: _ClassVar[int]
     combo_trades: _containers.RepeatedCompositeFieldContainer[ComboTrade]
-    def __init__(self, combo_trades: _Optional[_Iterable[_Union[ComboTrade, _Mapping]]] = ...) -> None: ...
+    version: int
+    epoch: str
+    def __init__(self, combo_trades: _Optional[_Iterable[_Union[ComboTrade, _Mapping]]] = ..., version: _Optional[int] = ..., epoch: _Optional[str] = ...) -> None: ...
+
+class ListTradesDeltaRequest(_message.Message):
+    __slots__ = ("since_version", "epoch")
+    SINCE_VERSION_FIELD_NUMBER: _ClassVar[int]
+    EPOCH_FIELD_NUMBER: _ClassVar[int]
+    since_version: int
+    epoch: str
+    def __init__(self, since_version: _Optional[int] = ..., epoch: _Optional[str] = ...) -> None: ...
 
 class GetOrderDealRecordsRequest(_message.Message):
     __slots__ = ("account",)
@@ -1339,15 +1412,19 @@ class Snapshot(_message.Message):
     def __init__(self, ts: _Optional[int] = ..., code: _Optional[str] = ..., exchange: _Optional[_Union[Exchange, str]] = ..., open: _Optional[float] = ..., high: _Optional[float] = ..., low: _Optional[float] = ..., close: _Optional[float] = ..., change_price: _Optional[float] = ..., change_rate: _Optional[float] = ..., average_price: _Optional[float] = ..., volume: _Optional[int] = ..., total_volume: _Optional[int] = ..., amount: _Optional[int] = ..., total_amount: _Optional[int] = ..., buy_price: _Optional[float] = ..., buy_volume: _Optional[float] = ..., sell_price: _Optional[float] = ..., sell_volume: _Optional[int] = ..., tick_type: _Optional[_Union[TickType, str]] = ..., change_type: _Optional[_Union[ChangeType, str]] = ..., yesterday_volume: _Optional[float] = ..., volume_ratio: _Optional[float] = ...) -> None: ...
 
 class GetTicksRequest(_message.Message):
-    __slots__ = ("contract_code", "date")
+    __slots__ = ("contract_code", "date", "compact", "max_points")
     CONTRACT_CODE_FIELD_NUMBER: _ClassVar[int]
     DATE_FIELD_NUMBER: _ClassVar[int]
+    COMPACT_FIELD_NUMBER: _ClassVar[int]
+    MAX_POINTS_FIELD_NUMBER: _ClassVar[int]
     contract_code: str
     date: str
-    def __init__(self, contract_code: _Optional[str] = ..., date: _Optional[str] = ...) -> None: ...
+    compact: bool
+    max_points: int
+    def __init__(self, contract_code: _Optional[str] = ..., date: _Optional[str] = ..., compact: bool = ..., max_points: _Optional[int] = ...) -> None: ...
 
 class Ticks(_message.Message):
-    __slots__ = ("ts", "close", "volume", "bid_price", "bid_volume", "ask_price", "ask_volume", "tick_type")
+    __slots__ = ("ts", "close", "volume", "bid_price", "bid_volume", "ask_price", "ask_volume", "tick_type", "ts_delta", "price_grid", "close_delta", "bid_price_delta", "ask_price_delta", "ts_unit")
     TS_FIELD_NUMBER: _ClassVar[int]
     CLOSE_FIELD_NUMBER: _ClassVar[int]
     VOLUME_FIELD_NUMBER: _ClassVar[int]
@@ -1356,6 +1433,12 @@ class Ticks(_message.Message):
     ASK_PRICE_FIELD_NUMBER: _ClassVar[int]
     ASK_VOLUME_FIELD_NUMBER: _ClassVar[int]
     TICK_TYPE_FIELD_NUMBER: _ClassVar[int]
+    TS_DELTA_FIELD_NUMBER: _ClassVar[int]
+    PRICE_GRID_FIELD_NUMBER: _ClassVar[int]
+    CLOSE_DELTA_FIELD_NUMBER: _ClassVar[int]
+    BID_PRICE_DELTA_FIELD_NUMBER: _ClassVar[int]
+    ASK_PRICE_DELTA_FIELD_NUMBER: _ClassVar[int]
+    TS_UNIT_FIELD_NUMBER: _ClassVar[int]
     ts: _containers.RepeatedScalarFieldContainer[int]
     close: _containers.RepeatedScalarFieldContainer[float]
     volume: _containers.RepeatedScalarFieldContainer[int]
@@ -1364,20 +1447,82 @@ class Ticks(_message.Message):
     ask_price: _containers.RepeatedScalarFieldContainer[float]
     ask_volume: _containers.RepeatedScalarFieldContainer[int]
     tick_type: _containers.RepeatedScalarFieldContainer[int]
-    def __init__(self, ts: _Optional[_Iterable[int]] = ..., close: _Optional[_Iterable[float]] = ..., volume: _Optional[_Iterable[int]] = ..., bid_price: _Optional[_Iterable[float]] = ..., bid_volume: _Optional[_Iterable[int]] = ..., ask_price: _Optional[_Iterable[float]] = ..., ask_volume: _Optional[_Iterable[int]] = ..., tick_type: _Optional[_Iterable[int]] = ...) -> None: ...
+    ts_delta: _containers.RepeatedScalarFieldContainer[int]
+    price_grid: PriceGrid
+    close_delta: _containers.RepeatedScalarFieldContainer[int]
+    bid_price_delta: _containers.RepeatedScalarFieldContainer[int]
+    ask_price_delta: _containers.RepeatedScalarFieldContainer[int]
+    ts_unit: int
+    def __init__(self, ts: _Optional[_Iterable[int]] = ..., close: _Optional[_Iterable[float]] = ..., volume: _Optional[_Iterable[int]] = ..., bid_price: _Optional[_Iterable[float]] = ..., bid_volume: _Optional[_Iterable[int]] = ..., ask_price: _Optional[_Iterable[float]] = ..., ask_volume: _Optional[_Iterable[int]] = ..., tick_type: _Optional[_Iterable[int]] = ..., ts_delta: _Optional[_Iterable[int]] = ..., price_grid: _Optional[_Union[PriceGrid, _Mapping]] = ..., close_delta: _Optional[_Iterable[int]] = ..., bid_price_delta: _Optional[_Iterable[int]] = ..., ask_price_delta: _Optional[_Iterable[int]] = ..., ts_unit: _Optional[int] = ...) -> None: ...
+
+class PriceGrid(_message.Message):
+    __slots__ = ("decimals", "base", "unit")
+    DECIMALS_FIELD_NUMBER: _ClassVar[int]
+    BASE_FIELD_NUMBER: _ClassVar[int]
+    UNIT_FIELD_NUMBER: _ClassVar[int]
+    decimals: int
+    base: int
+    unit: int
+    def __init__(self, decimals: _Optional[int] = ..., base: _Optional[int] = ..., unit: _Optional[int] = ...) -> None: ...
 
 class GetKbarsRequest(_message.Message):
-    __slots__ = ("contract_code", "start_date", "end_date")
+    __slots__ = ("contract_code", "start_date", "end_date", "start_ts", "end_ts", "compact", "resample_minutes", "max_points")
     CONTRACT_CODE_FIELD_NUMBER: _ClassVar[int]
     START_DATE_FIELD_NUMBER: _ClassVar[int]
     END_DATE_FIELD_NUMBER: _ClassVar[int]
+    START_TS_FIELD_NUMBER: _ClassVar[int]
+    END_TS_FIELD_NUMBER: _ClassVar[int]
+    COMPACT_FIELD_NUMBER: _ClassVar[int]
+    RESAMPLE_MINUTES_FIELD_NUMBER: _ClassVar[int]
+    MAX_POINTS_FIELD_NUMBER: _ClassVar[int]
     contract_code: str
     start_date: str
     end_date: str
-    def __init__(self, contract_code: _Optional[str] = ..., start_date: _Optional[str] = ..., end_date: _Optional[str] = ...) -> None: ...
+    start_ts: int
+    end_ts: int
+    compact: bool
+    resample_minutes: int
+    max_points: int
+    def __init__(self, contract_code: _Optional[str] = ..., start_date: _Optional[str] = ..., end_date: _Optional[str] = ..., start_ts: _Optional[int] = ..., end_ts: _Optional[int] = ..., compact: bool = ..., resample_minutes: _Optional[int] = ..., max_points: _Optional[int] = ...) -> None: ...
+
+class GetKbarsBatchRequest(_message.Message):
+    __slots__ = ("contract_codes", "query", "parallelism")
+    CONTRACT_CODES_FIELD_NUMBER: _ClassVar[int]
+    QUERY_FIELD_NUMBER: _ClassVar[int]
+    PARALLELISM_FIELD_NUMBER: _ClassVar[int]
+    contract_codes: _containers.RepeatedScalarFieldContainer[str]
+    query: GetKbarsRequest
+    parallelism: int
+    def __init__(self, contract_codes: _Optional[_Iterable[str]] = ..., query: _Optional[_Union[GetKbarsRequest, _Mapping]] = ..., parallelism: _Optional[int] = ...) -> None: ...
+
+class KbarsBatchResult(_message.Message):
+    __slots__ = ("contract_code", "kbars", "error")
+    CONTRACT_CODE_FIELD_NUMBER: _ClassVar[int]
+    KBARS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    contract_code: str
+    kbars: Kbars
+    error: str
+    def __init__(self, contract_code: _Optional[str] = ..., kbars: _Optional[_Union[Kbars, _Mapping]] = ..., error: _Optional[str] = ...) -> None: ...
+
+class StreamHistoricalTicksRequest(_message.Message):
+    __slots__ = ("query", "chunk_size")
+    QUERY_FIELD_NUMBER: _ClassVar[int]
+    CHUNK_SIZE_FIELD_NUMBER: _ClassVar[int]
+    query: GetTicksRequest
+    chunk_size: int
+    def __init__(self, query: _Optional[_Union[GetTicksRequest, _Mapping]] = ..., chunk_size: _Optional[int] = ...) -> None: ...
+
+class StreamHistoricalKbarsRequest(_message.Message):
+    __slots__ = ("query", "chunk_size")
+    QUERY_FIELD_NUMBER: _ClassVar[int]
+    CHUNK_SIZE_FIELD_NUMBER: _ClassVar[int]
+    query: GetKbarsRequest
+    chunk_size: int
+    def __init__(self, query: _Optional[_Union[GetKbarsRequest, _Mapping]] = ..., chunk_size: _Optional[int] = ...) -> None: ...
 
 class Kbars(_message.Message):
-    __slots__ = ("ts", "open", "high", "low", "close", "volume", "amount")
+    __slots__ = ("ts", "open", "high", "low", "close", "volume", "amount", "ts_delta", "price_grid", "open_delta", "high_delta", "low_delta", "close_delta", "ts_unit")
     TS_FIELD_NUMBER: _ClassVar[int]
     OPEN_FIELD_NUMBER: _ClassVar[int]
     HIGH_FIELD_NUMBER: _ClassVar[int]
@@ -1385,6 +1530,13 @@ class Kbars(_message.Message):
     CLOSE_FIELD_NUMBER: _ClassVar[int]
     VOLUME_FIELD_NUMBER: _ClassVar[int]
     AMOUNT_FIELD_NUMBER: _ClassVar[int]
+    TS_DELTA_FIELD_NUMBER: _ClassVar[int]
+    PRICE_GRID_FIELD_NUMBER: _ClassVar[int]
+    OPEN_DELTA_FIELD_NUMBER: _ClassVar[int]
+    HIGH_DELTA_FIELD_NUMBER: _ClassVar[int]
+    LOW_DELTA_FIELD_NUMBER: _ClassVar[int]
+    CLOSE_DELTA_FIELD_NUMBER: _ClassVar[int]
+    TS_UNIT_FIELD_NUMBER: _ClassVar[int]
     ts: _containers.RepeatedScalarFieldContainer[int]
     open: _containers.RepeatedScalarFieldContainer[float]
     high: _containers.RepeatedScalarFieldContainer[float]
@@ -1392,7 +1544,82 @@ class Kbars(_message.Message):
     close: _containers.RepeatedScalarFieldContainer[float]
     volume: _containers.RepeatedScalarFieldContainer[int]
     amount: _containers.RepeatedScalarFieldContainer[float]
-    def __init__(self, ts: _Optional[_Iterable[int]] = ..., open: _Optional[_Iterable[float]] = ..., high: _Optional[_Iterable[float]] = ..., low: _Optional[_Iterable[float]] = ..., close: _Optional[_Iterable[float]] = ..., volume: _Optional[_Iterable[int]] = ..., amount: _Optional[_Iterable[float]] = ...) -> None: ...
+    ts_delta: _containers.RepeatedScalarFieldContainer[int]
+    price_grid: PriceGrid
+    open_delta: _containers.RepeatedScalarFieldContainer[int]
+    high_delta: _containers.RepeatedScalarFieldContainer[int]
+    low_delta: _containers.RepeatedScalarFieldContainer[int]
+    close_delta: _containers.RepeatedScalarFieldContainer[int]
+    ts_unit: int
+    def __init__(self, ts: _Optional[_Iterable[int]] = ..., open: _Optional[_Iterable[float]] = ..., high: _Optional[_Iterable[float]] = ..., low: _Optional[_Iterable[float]] = ..., close: _Optional[_Iterable[float]] = ..., volume: _Optional[_Iterable[int]] = ..., amount: _Optional[_Iterable[float]] = ..., ts_delta: _Optional[_Iterable[int]] = ..., price_grid: _Optional[_Union[PriceGrid, _Mapping]] = ..., open_delta: _Optional[_Iterable[int]] = ..., high_delta: _Optional[_Iterable[int]] = ..., low_delta: _Optional[_Iterable[int]] = ..., close_delta: _Optional[_Iterable[int]] = ..., ts_unit: _Optional[int] = ...) -> None: ...
+
+class GetTickBarsRequest(_message.Message):
+    __slots__ = ("contract_code", "date", "type", "size", "compact")
+    CONTRACT_CODE_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    SIZE_FIELD_NUMBER: _ClassVar[int]
+    COMPACT_FIELD_NUMBER: _ClassVar[int]
+    contract_code: str
+    date: str
+    type: TickBarType
+    size: int
+    compact: bool
+    def __init__(self, contract_code: _Optional[str] = ..., date: _Optional[str] = ..., type: _Optional[_Union[TickBarType, str]] = ..., size: _Optional[int] = ..., compact: bool = ...) -> None: ...
+
+class GetTickAnalyticsRequest(_message.Message):
+    __slots__ = ("contract_code", "date", "start_ts", "end_ts")
+    CONTRACT_CODE_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    START_TS_FIELD_NUMBER: _ClassVar[int]
+    END_TS_FIELD_NUMBER: _ClassVar[int]
+    contract_code: str
+    date: str
+    start_ts: int
+    end_ts: int
+    def __init__(self, contract_code: _Optional[str] = ..., date: _Optional[str] = ..., start_ts: _Optional[int] = ..., end_ts: _Optional[int] = ...) -> None: ...
+
+class TickAnalytics(_message.Message):
+    __slots__ = ("ticks", "volume", "vwap", "open", "high", "low", "close", "buy_volume", "sell_volume", "first_ts", "last_ts", "levels")
+    TICKS_FIELD_NUMBER: _ClassVar[int]
+    VOLUME_FIELD_NUMBER: _ClassVar[int]
+    VWAP_FIELD_NUMBER: _ClassVar[int]
+    OPEN_FIELD_NUMBER: _ClassVar[int]
+    HIGH_FIELD_NUMBER: _ClassVar[int]
+    LOW_FIELD_NUMBER: _ClassVar[int]
+    CLOSE_FIELD_NUMBER: _ClassVar[int]
+    BUY_VOLUME_FIELD_NUMBER: _ClassVar[int]
+    SELL_VOLUME_FIELD_NUMBER: _ClassVar[int]
+    FIRST_TS_FIELD_NUMBER: _ClassVar[int]
+    LAST_TS_FIELD_NUMBER: _ClassVar[int]
+    LEVELS_FIELD_NUMBER: _ClassVar[int]
+    ticks: int
+    volume: int
+    vwap: float
+    open: float
+    high: float
+    low: float
+    close: float
+    buy_volume: int
+    sell_volume: int
+    first_ts: int
+    last_ts: int
+    levels: _containers.RepeatedCompositeFieldContainer[PriceVolume]
+    def __init__(self, ticks: _Optional[int] = ..., volume: _Optional[int] = ..., vwap: _Optional[float] = ..., open: _Optional[float] = ..., high: _Optional[float] = ..., low: _Optional[float] = ..., close: _Optional[float] = ..., buy_volume: _Optional[int] = ..., sell_volume: _Optional[int] = ..., first_ts: _Optional[int] = ..., last_ts: _Optional[int] = ..., levels: _Optional[_Iterable[_Union[PriceVolume, _Mapping]]] = ...) -> None: ...
+
+class PriceVolume(_message.Message):
+    __slots__ = ("price", "volume", "buy_volume", "sell_volume", "ticks")
+    PRICE_FIELD_NUMBER: _ClassVar[int]
+    VOLUME_FIELD_NUMBER: _ClassVar[int]
+    BUY_VOLUME_FIELD_NUMBER: _ClassVar[int]
+    SELL_VOLUME_FIELD_NUMBER: _ClassVar[int]
+    TICKS_FIELD_NUMBER: _ClassVar[int]
+    price: float
+    volume: int
+    buy_volume: int
+    sell_volume: int
+    ticks: int
+    def __init__(self, price: _Optional[float] = ..., volume: _Optional[int] = ..., buy_volume: _Optional[int] = ..., sell_volume: _Optional[int] = ..., ticks: _Optional[int] = ...) -> None: ...
 
 class GetDailyQuotesRequest(_message.Message):
     __slots__ = ("date",)
@@ -1590,6 +1817,76 @@ class FetchContractsRequest(_message.Message):
     contract_download: bool
     def __init__(self, contract_download: bool = ...) -> None: ...
 
+class GetOptionChainRequest(_message.Message):
+    __slots__ = ("underlying", "delivery_month", "strike_min", "strike_max", "center_strike", "num_strikes")
+    UNDERLYING_FIELD_NUMBER: _ClassVar[int]
+    DELIVERY_MONTH_FIELD_NUMBER: _ClassVar[int]
+    STRIKE_MIN_FIELD_NUMBER: _ClassVar[int]
+    STRIKE_MAX_FIELD_NUMBER: _ClassVar[int]
+    CENTER_STRIKE_FIELD_NUMBER: _ClassVar[int]
+    NUM_STRIKES_FIELD_NUMBER: _ClassVar[int]
+    underlying: str
+    delivery_month: str
+    strike_min: float
+    strike_max: float
+    center_strike: float
+    num_strikes: int
+    def __init__(self, underlying: _Optional[str] = ..., delivery_month: _Optional[str] = ..., strike_min: _Optional[float] = ..., strike_max: _Optional[float] = ..., center_strike: _Optional[float] = ..., num_strikes: _Optional[int] = ...) -> None: ...
+
+class OptionStrike(_message.Message):
+    __slots__ = ("delivery_month", "strike_price", "call", "put")
+    DELIVERY_MONTH_FIELD_NUMBER: _ClassVar[int]
+    STRIKE_PRICE_FIELD_NUMBER: _ClassVar[int]
+    CALL_FIELD_NUMBER: _ClassVar[int]
+    PUT_FIELD_NUMBER: _ClassVar[int]
+    delivery_month: str
+    strike_price: float
+    call: Contract
+    put: Contract
+    def __init__(self, delivery_month: _Optional[str] = ..., strike_price: _Optional[float] = ..., call: _Optional[_Union[Contract, _Mapping]] = ..., put: _Optional[_Union[Contract, _Mapping]] = ...) -> None: ...
+
+class OptionChain(_message.Message):
+    __slots__ = ("strikes",)
+    STRIKES_FIELD_NUMBER: _ClassVar[int]
+    strikes: _containers.RepeatedCompositeFieldContainer[OptionStrike]
+    def __init__(self, strikes: _Optional[_Iterable[_Union[OptionStrike, _Mapping]]] = ...) -> None: ...
+
+class FindContractsRequest(_message.Message):
+    __slots__ = ("symbol", "underlying_code", "category", "delivery_month")
+    SYMBOL_FIELD_NUMBER: _ClassVar[int]
+    UNDERLYING_CODE_FIELD_NUMBER: _ClassVar[int]
+    CATEGORY_FIELD_NUMBER: _ClassVar[int]
+    DELIVERY_MONTH_FIELD_NUMBER: _ClassVar[int]
+    symbol: str
+    underlying_code: str
+    category: str
+    delivery_month: str
+    def __init__(self, symbol: _Optional[str] = ..., underlying_code: _Optional[str] = ..., category: _Optional[str] = ..., delivery_month: _Optional[str] = ...) -> None: ...
+
+class FindContractsResponse(_message.Message):
+    __slots__ = ("contracts",)
+    CONTRACTS_FIELD_NUMBER: _ClassVar[int]
+    contracts: _containers.RepeatedCompositeFieldContainer[Contract]
+    def __init__(self, contracts: _Optional[_Iterable[_Union[Contract, _Mapping]]] = ...) -> None: ...
+
+class SingleflightMethodStats(_message.Message):
+    __slots__ = ("method", "calls", "shared", "hit_ratio")
+    METHOD_FIELD_NUMBER: _ClassVar[int]
+    CALLS_FIELD_NUMBER: _ClassVar[int]
+    SHARED_FIELD_NUMBER: _ClassVar[int]
+    HIT_RATIO_FIELD_NUMBER: _ClassVar[int]
+    method: str
+    calls: int
+    shared: int
+    hit_ratio: float
+    def __init__(self, method: _Optional[str] = ..., calls: _Optional[int] = ..., shared: _Optional[int] = ..., hit_ratio: _Optional[float] = ...) -> None: ...
+
+class SingleflightStats(_message.Message):
+    __slots__ = ("methods",)
+    METHODS_FIELD_NUMBER: _ClassVar[int]
+    methods: _containers.RepeatedCompositeFieldContainer[SingleflightMethodStats]
+    def __init__(self, methods: _Optional[_Iterable[_Union[SingleflightMethodStats, _Mapping]]] = ...) -> None: ...
+
 class ActivateCARequest(_message.Message):
     __slots__ = ("ca_path", "ca_passwd", "person_id")
     CA_PATH_FIELD_NUMBER: _ClassVar[int]
@@ -1641,3 +1938,213 @@ class UnsubscribeTradeResponse(_message.Message):
     SUCCESS_FIELD_NUMBER: _ClassVar[int]
     success: bool
     def __init__(self, success: bool = ...) -> None: ...
+
+class StreamTicksRequest(_message.Message):
+    __slots__ = ("contract_codes", "queue_size")
+    CONTRACT_CODES_FIELD_NUMBER: _ClassVar[int]
+    QUEUE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    contract_codes: _containers.RepeatedScalarFieldContainer[str]
+    queue_size: int
+    def __init__(self, contract_codes: _Optional[_Iterable[str]] = ..., queue_size: _Optional[int] = ...) -> None: ...
+
+class Tick(_message.Message):
+    __slots__ = ("code", "exchange", "ts", "open", "close", "high", "low", "avg_price", "volume", "total_volume", "amount", "total_amount", "tick_type", "change_type", "price_chg", "pct_chg", "bid_side_total_vol", "ask_side_total_vol", "underlying_price", "simtrade", "suspend", "intraday_odd")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    EXCHANGE_FIELD_NUMBER: _ClassVar[int]
+    TS_FIELD_NUMBER: _ClassVar[int]
+    OPEN_FIELD_NUMBER: _ClassVar[int]
+    CLOSE_FIELD_NUMBER: _ClassVar[int]
+    HIGH_FIELD_NUMBER: _ClassVar[int]
+    LOW_FIELD_NUMBER: _ClassVar[int]
+    AVG_PRICE_FIELD_NUMBER: _ClassVar[int]
+    VOLUME_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_VOLUME_FIELD_NUMBER: _ClassVar[int]
+    AMOUNT_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_AMOUNT_FIELD_NUMBER: _ClassVar[int]
+    TICK_TYPE_FIELD_NUMBER: _ClassVar[int]
+    CHANGE_TYPE_FIELD_NUMBER: _ClassVar[int]
+    PRICE_CHG_FIELD_NUMBER: _ClassVar[int]
+    PCT_CHG_FIELD_NUMBER: _ClassVar[int]
+    BID_SIDE_TOTAL_VOL_FIELD_NUMBER: _ClassVar[int]
+    ASK_SIDE_TOTAL_VOL_FIELD_NUMBER: _ClassVar[int]
+    UNDERLYING_PRICE_FIELD_NUMBER: _ClassVar[int]
+    SIMTRADE_FIELD_NUMBER: _ClassVar[int]
+    SUSPEND_FIELD_NUMBER: _ClassVar[int]
+    INTRADAY_ODD_FIELD_NUMBER: _ClassVar[int]
+    code: str
+    exchange: Exchange
+    ts: int
+    open: float
+    close: float
+    high: float
+    low: float
+    avg_price: float
+    volume: int
+    total_volume: int
+    amount: float
+    total_amount: float
+    tick_type: TickType
+    change_type: ChangeType
+    price_chg: float
+    pct_chg: float
+    bid_side_total_vol: int
+    ask_side_total_vol: int
+    underlying_price: float
+    simtrade: bool
+    suspend: bool
+    intraday_odd: bool
+    def __init__(self, code: _Optional[str] = ..., exchange: _Optional[_Union[Exchange, str]] = ..., ts: _Optional[int] = ..., open: _Optional[float] = ..., close: _Optional[float] = ..., high: _Optional[float] = ..., low: _Optional[float] = ..., avg_price: _Optional[float] = ..., volume: _Optional[int] = ..., total_volume: _Optional[int] = ..., amount: _Optional[float] = ..., total_amount: _Optional[float] = ..., tick_type: _Optional[_Union[TickType, str]] = ..., change_type: _Optional[_Union[ChangeType, str]] = ..., price_chg: _Optional[float] = ..., pct_chg: _Optional[float] = ..., bid_side_total_vol: _Optional[int] = ..., ask_side_total_vol: _Optional[int] = ..., underlying_price: _Optional[float] = ..., simtrade: bool = ..., suspend: bool = ..., intraday_odd: bool = ...) -> None: ...
+
+class StreamBidAskRequest(_message.Message):
+    __slots__ = ("contract_codes", "interval_ms")
+    CONTRACT_CODES_FIELD_NUMBER: _ClassVar[int]
+    INTERVAL_MS_FIELD_NUMBER: _ClassVar[int]
+    contract_codes: _containers.RepeatedScalarFieldContainer[str]
+    interval_ms: int
+    def __init__(self, contract_codes: _Optional[_Iterable[str]] = ..., interval_ms: _Optional[int] = ...) -> None: ...
+
+class BidAsk(_message.Message):
+    __slots__ = ("code", "exchange", "ts", "bid_price", "bid_volume", "diff_bid_vol", "ask_price", "ask_volume", "diff_ask_vol", "bid_total_vol", "ask_total_vol", "simtrade", "suspend", "intraday_odd")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    EXCHANGE_FIELD_NUMBER: _ClassVar[int]
+    TS_FIELD_NUMBER: _ClassVar[int]
+    BID_PRICE_FIELD_NUMBER: _ClassVar[int]
+    BID_VOLUME_FIELD_NUMBER: _ClassVar[int]
+    DIFF_BID_VOL_FIELD_NUMBER: _ClassVar[int]
+    ASK_PRICE_FIELD_NUMBER: _ClassVar[int]
+    ASK_VOLUME_FIELD_NUMBER: _ClassVar[int]
+    DIFF_ASK_VOL_FIELD_NUMBER: _ClassVar[int]
+    BID_TOTAL_VOL_FIELD_NUMBER: _ClassVar[int]
+    ASK_TOTAL_VOL_FIELD_NUMBER: _ClassVar[int]
+    SIMTRADE_FIELD_NUMBER: _ClassVar[int]
+    SUSPEND_FIELD_NUMBER: _ClassVar[int]
+    INTRADAY_ODD_FIELD_NUMBER: _ClassVar[int]
+    code: str
+    exchange: Exchange
+    ts: int
+    bid_price: _containers.RepeatedScalarFieldContainer[float]
+    bid_volume: _containers.RepeatedScalarFieldContainer[int]
+    diff_bid_vol: _containers.RepeatedScalarFieldContainer[int]
+    ask_price: _containers.RepeatedScalarFieldContainer[float]
+    ask_volume: _containers.RepeatedScalarFieldContainer[int]
+    diff_ask_vol: _containers.RepeatedScalarFieldContainer[int]
+    bid_total_vol: int
+    ask_total_vol: int
+    simtrade: bool
+    suspend: bool
+    intraday_odd: bool
+    def __init__(self, code: _Optional[str] = ..., exchange: _Optional[_Union[Exchange, str]] = ..., ts: _Optional[int] = ..., bid_price: _Optional[_Iterable[float]] = ..., bid_volume: _Optional[_Iterable[int]] = ..., diff_bid_vol: _Optional[_Iterable[int]] = ..., ask_price: _Optional[_Iterable[float]] = ..., ask_volume: _Optional[_Iterable[int]] = ..., diff_ask_vol: _Optional[_Iterable[int]] = ..., bid_total_vol: _Optional[int] = ..., ask_total_vol: _Optional[int] = ..., simtrade: bool = ..., suspend: bool = ..., intraday_odd: bool = ...) -> None: ...
+
+class StreamOrderEventsRequest(_message.Message):
+    __slots__ = ("since_seq", "replay", "queue_size", "epoch")
+    SINCE_SEQ_FIELD_NUMBER: _ClassVar[int]
+    REPLAY_FIELD_NUMBER: _ClassVar[int]
+    QUEUE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    EPOCH_FIELD_NUMBER: _ClassVar[int]
+    since_seq: int
+    replay: bool
+    queue_size: int
+    epoch: str
+    def __init__(self, since_seq: _Optional[int] = ..., replay: bool = ..., queue_size: _Optional[int] = ..., epoch: _Optional[str] = ...) -> None: ...
+
+class OrderEvent(_message.Message):
+    __slots__ = ("seq", "state", "ts", "order", "deal", "epoch")
+    SEQ_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    TS_FIELD_NUMBER: _ClassVar[int]
+    ORDER_FIELD_NUMBER: _ClassVar[int]
+    DEAL_FIELD_NUMBER: _ClassVar[int]
+    EPOCH_FIELD_NUMBER: _ClassVar[int]
+    seq: int
+    state: OrderState
+    ts: int
+    order: OrderUpdate
+    deal: DealUpdate
+    epoch: str
+    def __init__(self, seq: _Optional[int] = ..., state: _Optional[_Union[OrderState, str]] = ..., ts: _Optional[int] = ..., order: _Optional[_Union[OrderUpdate, _Mapping]] = ..., deal: _Optional[_Union[DealUpdate, _Mapping]] = ..., epoch: _Optional[str] = ...) -> None: ...
+
+class OrderUpdate(_message.Message):
+    __slots__ = ("op_type", "op_code", "op_msg", "id", "seqno", "ordno", "broker_id", "account_id", "action", "price", "quantity", "order_type", "price_type", "custom_field", "code", "security_type", "exchange", "exchange_ts", "modified_price", "cancel_quantity", "order_quantity", "web_id")
+    OP_TYPE_FIELD_NUMBER: _ClassVar[int]
+    OP_CODE_FIELD_NUMBER: _ClassVar[int]
+    OP_MSG_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    SEQNO_FIELD_NUMBER: _ClassVar[int]
+    ORDNO_FIELD_NUMBER: _ClassVar[int]
+    BROKER_ID_FIELD_NUMBER: _ClassVar[int]
+    ACCOUNT_ID_FIELD_NUMBER: _ClassVar[int]
+    ACTION_FIELD_NUMBER: _ClassVar[int]
+    PRICE_FIELD_NUMBER: _ClassVar[int]
+    QUANTITY_FIELD_NUMBER: _ClassVar[int]
+    ORDER_TYPE_FIELD_NUMBER: _ClassVar[int]
+    PRICE_TYPE_FIELD_NUMBER: _ClassVar[int]
+    CUSTOM_FIELD_FIELD_NUMBER: _ClassVar[int]
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    SECURITY_TYPE_FIELD_NUMBER: _ClassVar[int]
+    EXCHANGE_FIELD_NUMBER: _ClassVar[int]
+    EXCHANGE_TS_FIELD_NUMBER: _ClassVar[int]
+    MODIFIED_PRICE_FIELD_NUMBER: _ClassVar[int]
+    CANCEL_QUANTITY_FIELD_NUMBER: _ClassVar[int]
+    ORDER_QUANTITY_FIELD_NUMBER: _ClassVar[int]
+    WEB_ID_FIELD_NUMBER: _ClassVar[int]
+    op_type: str
+    op_code: str
+    op_msg: str
+    id: str
+    seqno: str
+    ordno: str
+    broker_id: str
+    account_id: str
+    action: Action
+    price: float
+    quantity: int
+    order_type: OrderType
+    price_type: str
+    custom_field: str
+    code: str
+    security_type: SecurityType
+    exchange: Exchange
+    exchange_ts: float
+    modified_price: float
+    cancel_quantity: int
+    order_quantity: int
+    web_id: str
+    def __init__(self, op_type: _Optional[str] = ..., op_code: _Optional[str] = ..., op_msg: _Optional[str] = ..., id: _Optional[str] = ..., seqno: _Optional[str] = ..., ordno: _Optional[str] = ..., broker_id: _Optional[str] = ..., account_id: _Optional[str] = ..., action: _Optional[_Union[Action, str]] = ..., price: _Optional[float] = ..., quantity: _Optional[int] = ..., order_type: _Optional[_Union[OrderType, str]] = ..., price_type: _Optional[str] = ..., custom_field: _Optional[str] = ..., code: _Optional[str] = ..., security_type: _Optional[_Union[SecurityType, str]] = ..., exchange: _Optional[_Union[Exchange, str]] = ..., exchange_ts: _Optional[float] = ..., modified_price: _Optional[float] = ..., cancel_quantity: _Optional[int] = ..., order_quantity: _Optional[int] = ..., web_id: _Optional[str] = ...) -> None: ...
+
+class DealUpdate(_message.Message):
+    __slots__ = ("trade_id", "seqno", "ordno", "exchange_seq", "broker_id", "account_id", "action", "code", "price", "quantity", "ts", "web_id", "custom_field", "security_type", "delivery_month", "strike_price", "option_right")
+    TRADE_ID_FIELD_NUMBER: _ClassVar[int]
+    SEQNO_FIELD_NUMBER: _ClassVar[int]
+    ORDNO_FIELD_NUMBER: _ClassVar[int]
+    EXCHANGE_SEQ_FIELD_NUMBER: _ClassVar[int]
+    BROKER_ID_FIELD_NUMBER: _ClassVar[int]
+    ACCOUNT_ID_FIELD_NUMBER: _ClassVar[int]
+    ACTION_FIELD_NUMBER: _ClassVar[int]
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    PRICE_FIELD_NUMBER: _ClassVar[int]
+    QUANTITY_FIELD_NUMBER: _ClassVar[int]
+    TS_FIELD_NUMBER: _ClassVar[int]
+    WEB_ID_FIELD_NUMBER: _ClassVar[int]
+    CUSTOM_FIELD_FIELD_NUMBER: _ClassVar[int]
+    SECURITY_TYPE_FIELD_NUMBER: _ClassVar[int]
+    DELIVERY_MONTH_FIELD_NUMBER: _ClassVar[int]
+    STRIKE_PRICE_FIELD_NUMBER: _ClassVar[int]
+    OPTION_RIGHT_FIELD_NUMBER: _ClassVar[int]
+    trade_id: str
+    seqno: str
+    ordno: str
+    exchange_seq: str
+    broker_id: str
+    account_id: str
+    action: Action
+    code: str
+    price: float
+    quantity: int
+    ts: float
+    web_id: str
+    custom_field: str
+    security_type: SecurityType
+    delivery_month: str
+    strike_price: float
+    option_right: OptionRight
+    def __init__(self, trade_id: _Optional[str] = ..., seqno: _Optional[str] = ..., ordno: _Optional[str] = ..., exchange_seq: _Optional[str] = ..., broker_id: _Optional[str] = ..., account_id: _Optional[str] = ..., action: _Optional[_Union[Action, str]] = ..., code: _Optional[str] = ..., price: _Optional[float] = ..., quantity: _Optional[int] = ..., ts: _Optional[float] = ..., web_id: _Optional[str] = ..., custom_field: _Optional[str] = ..., security_type: _Optional[_Union[SecurityType, str]] = ..., delivery_month: _Optional[str] = ..., strike_price: _Optional[float] = ..., option_right: _Optional[_Union[OptionRight, str]] = ...) -> None: ...
@@ -66,6 +66,11 @@ class ShioajiProviderStub(object):
                 request_serializer=provider__pb2.PlaceOrderRequest.SerializeToString,
                 response_deserializer=provider__pb2.Trade.FromString,
                 _registered_method=True)
+        self.PlaceOrders = channel.unary_unary(
+                '/v1.ShioajiProvider/PlaceOrders',
+                request_serializer=provider__pb2.PlaceOrdersRequest.SerializeToString,
+                response_deserializer=provider__pb2.PlaceOrdersResponse.FromString,
+                _registered_method=True)
         self.PlaceComboOrder = channel.unary_unary(
                 '/v1.ShioajiProvider/PlaceComboOrder',
                 request_serializer=provider__pb2.PlaceComboOrderRequest.SerializeToString,
@@ -81,6 +86,11 @@ class ShioajiProviderStub(object):
                 request_serializer=provider__pb2.CancelOrderRequest.SerializeToString,
                 response_deserializer=provider__pb2.Trade.FromString,
                 _registered_method=True)
+        self.CancelOrders = channel.unary_stream(
+                '/v1.ShioajiProvider/CancelOrders',
+                request_serializer=provider__pb2.CancelOrdersRequest.SerializeToString,
+                response_deserializer=provider__pb2.CancelOrderResult.FromString,
+                _registered_method=True)
         self.CancelComboOrder = channel.unary_unary(
                 '/v1.ShioajiProvider/CancelComboOrder',
                 request_serializer=provider__pb2.CancelComboOrderRequest.SerializeToString,
@@ -106,6 +116,16 @@ class ShioajiProviderStub(object):
                 request_serializer=provider__pb2.Empty.SerializeToString,
                 response_deserializer=provider__pb2.ListComboTradesResponse.FromString,
                 _registered_method=True)
+        self.ListTradesDelta = channel.unary_unary(
+                '/v1.ShioajiProvider/ListTradesDelta',
+                request_serializer=provider__pb2.ListTradesDeltaRequest.SerializeToString,
+                response_deserializer=provider__pb2.ListTradesResponse.FromString,
+                _registered_method=True)
+        self.ListComboTradesDelta = channel.unary_unary(
+                '/v1.ShioajiProvider/ListComboTradesDelta',
+                request_serializer=provider__pb2.ListTradesDeltaRequest.SerializeToString,
+                response_deserializer=provider__pb2.ListComboTradesResponse.FromString,
+                _registered_method=True)
         self.GetOrderDealRecords = channel.unary_unary(
                 '/v1.ShioajiProvider/GetOrderDealRecords',
                 request_serializer=provider__pb2.GetOrderDealRecordsRequest.SerializeToString,
@@ -196,6 +216,31 @@ class ShioajiProviderStub(object):
                 request_serializer=provider__pb2.GetKbarsRequest.SerializeToString,
                 response_deserializer=provider__pb2.Kbars.FromString,
                 _registered_method=True)
+        self.GetKbarsBatch = channel.unary_stream(
+                '/v1.ShioajiProvider/GetKbarsBatch',
+                request_serializer=provider__pb2.GetKbarsBatchRequest.SerializeToString,
+                response_deserializer=provider__pb2.KbarsBatchResult.FromString,
+                _registered_method=True)
+        self.StreamHistoricalTicks = channel.unary_stream(
+                '/v1.ShioajiProvider/StreamHistoricalTicks',
+                request_serializer=provider__pb2.StreamHistoricalTicksRequest.SerializeToString,
+                response_deserializer=provider__pb2.Ticks.FromString,
+                _registered_method=True)
+        self.StreamHistoricalKbars = channel.unary_stream(
+                '/v1.ShioajiProvider/StreamHistoricalKbars',
+                request_serializer=provider__pb2.StreamHistoricalKbarsRequest.SerializeToString,
+                response_deserializer=provider__pb2.Kbars.FromString,
+                _registered_method=True)
+        self.GetTickBars = channel.unary_unary(
+                '/v1.ShioajiProvider/GetTickBars',
+                request_serializer=provider__pb2.GetTickBarsRequest.SerializeToString,
+                response_deserializer=provider__pb2.Kbars.FromString,
+                _registered_method=True)
+        self.GetTickAnalytics = channel.unary_unary(
+                '/v1.ShioajiProvider/GetTickAnalytics',
+                request_serializer=provider__pb2.GetTickAnalyticsRequest.SerializeToString,
+                response_deserializer=provider__pb2.TickAnalytics.FromString,
+                _registered_method=True)
         self.GetDailyQuotes = channel.unary_unary(
                 '/v1.ShioajiProvider/GetDailyQuotes',
                 request_serializer=provider__pb2.GetDailyQuotesRequest.SerializeToString,
@@ -231,6 +276,21 @@ class ShioajiProviderStub(object):
                 request_serializer=provider__pb2.FetchContractsRequest.SerializeToString,
                 response_deserializer=provider__pb2.Empty.FromString,
                 _registered_method=True)
+        self.GetOptionChain = channel.unary_unary(
+                '/v1.ShioajiProvider/GetOptionChain',
+                request_serializer=provider__pb2.GetOptionChainRequest.SerializeToString,
+                response_deserializer=provider__pb2.OptionChain.FromString,
+                _registered_method=True)
+        self.FindContracts = channel.unary_unary(
+                '/v1.ShioajiProvider/FindContracts',
+                request_serializer=provider__pb2.FindContractsRequest.SerializeToString,
+                response_deserializer=provider__pb2.FindContractsResponse.FromString,
+                _registered_method=True)
+        self.GetSingleflightStats = channel.unary_unary(
+                '/v1.ShioajiProvider/GetSingleflightStats',
+                request_serializer=provider__pb2.Empty.SerializeToString,
+                response_deserializer=provider__pb2.SingleflightStats.FromString,
+                _registered_method=True)
         self.GetCAExpireTime = channel.unary_unary(
                 '/v1.ShioajiProvider/GetCAExpireTime',
                 request_serializer=provider__pb2.GetCAExpireTimeRequest.SerializeToString,
@@ -246,6 +306,21 @@ class ShioajiProviderStub(object):
                 request_serializer=provider__pb2.UnsubscribeTradeRequest.SerializeToString,
                 response_deserializer=provider__pb2.UnsubscribeTradeResponse.FromString,
                 _registered_method=True)
+        self.StreamTicks = channel.unary_stream(
+                '/v1.ShioajiProvider/StreamTicks',
+                request_serializer=provider__pb2.StreamTicksRequest.SerializeToString,
+                response_deserializer=provider__pb2.Tick.FromString,
+                _registered_method=True)
+        self.StreamBidAsk = channel.unary_stream(
+                '/v1.ShioajiProvider/StreamBidAsk',
+                request_serializer=provider__pb2.StreamBidAskRequest.SerializeToString,
+                response_deserializer=provider__pb2.BidAsk.FromString,
+                _registered_method=True)
+        self.StreamOrderEvents = channel.unary_stream(
+                '/v1.ShioajiProvider/StreamOrderEvents',
+                request_serializer=provider__pb2.StreamOrderEventsRequest.SerializeToString,
+                response_deserializer=provider__pb2.OrderEvent.FromString,
+                _registered_method=True)
 
 
 class ShioajiProviderServicer(object):
@@ -302,6 +377,15 @@ class ShioajiProviderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def PlaceOrders(self, request, context):
+        """Place a basket of orders concurrently. The whole basket is validated before
+        anything is sent; results come back in request order.
+        批次下單
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def PlaceComboOrder(self, request, context):
         """Place a combination order (e.g., multiple legs for futures or options).
         組合單下單
@@ -326,6 +410,15 @@ class ShioajiProviderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def CancelOrders(self, request, context):
+        """Cancel every open order matching a filter, streaming one result per order
+        as its cancel completes.
+        批次撤銷委託單
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CancelComboOrder(self, request, context):
         """Cancel an active combination order.
         撤銷組合單委託
@@ -366,6 +459,24 @@ class ShioajiProviderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ListTradesDelta(self, request, context):
+        """List only the trades whose status changed since a version watermark.
+        Pass since_version 0 for every trade; keep the returned version and epoch for the next call.
+        A watermark from another epoch (e.g. before a provider restart) returns every trade.
+        委託列表 (增量)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListComboTradesDelta(self, request, context):
+        """List only the combination trades whose status changed since a version watermark.
+        組合單委託列表 (增量)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetOrderDealRecords(self, request, context):
         """Retrieve deal records for orders associated with a specific account.
         委託成交紀錄
@@ -510,6 +621,48 @@ class ShioajiProviderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetKbarsBatch(self, request, context):
+        """Fetch K-bars of many contracts for one date range, streaming one result per
+        contract as it completes; upstream calls are paced by the quote rate limit.
+        批次獲取K線資料
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamHistoricalTicks(self, request, context):
+        """Stream the ticks of a contract and date as Ticks messages of at most
+        chunk_size rows each, so a full day never has to fit in one message.
+        分批串流逐筆報價
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamHistoricalKbars(self, request, context):
+        """Stream the K-bars of a contract and date range in chunks of at most chunk_size bars.
+        分批串流K線資料
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetTickBars(self, request, context):
+        """Build time, volume or tick-count bars from the ticks of a contract and date.
+        逐筆資料聚合K線
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetTickAnalytics(self, request, context):
+        """Summarize the ticks of a contract and date: VWAP, buy/sell volume and volume at price.
+        逐筆資料統計
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetDailyQuotes(self, request, context):
         """Get daily trading quotes (summary) for all contracts on a specific date.
         每日報價
@@ -566,6 +719,30 @@ class ShioajiProviderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetOptionChain(self, request, context):
+        """Get the option chain (calls and puts by delivery month and strike) of an underlying.
+        選擇權鏈
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def FindContracts(self, request, context):
+        """Find contracts by symbol, underlying code, category and/or delivery month.
+        商品查詢
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetSingleflightStats(self, request, context):
+        """Get request coalescing counters for the read RPCs that opt into it.
+        請求合併統計
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetCAExpireTime(self, request, context):
         """Get the expiration timestamp of the currently activated CA.
         憑證過期時間
@@ -590,6 +767,35 @@ class ShioajiProviderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamTicks(self, request, context):
+        """Stream real-time ticks for a list of contracts.
+        The stream is aborted with RESOURCE_EXHAUSTED if the client falls behind.
+        即時逐筆報價
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamBidAsk(self, request, context):
+        """Stream real-time bid/ask books for a list of contracts, conflated per code:
+        each update carries only the newest book for a code since the previous one.
+        即時五檔報價
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamOrderEvents(self, request, context):
+        """Stream order and deal events pushed by the order callback, each with a
+        monotonically increasing sequence number. Reconnecting clients resume
+        with since_seq and epoch of the last event; OUT_OF_RANGE means the gap is
+        gone or the provider restarted, and ListTrades is needed.
+        委託成交回報
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ShioajiProviderServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -623,6 +829,11 @@ def add_ShioajiProviderServicer_to_server(servicer, server):
                     request_deserializer=provider__pb2.PlaceOrderRequest.FromString,
                     response_serializer=provider__pb2.Trade.SerializeToString,
             ),
+            'PlaceOrders': grpc.unary_unary_rpc_method_handler(
+                    servicer.PlaceOrders,
+                    request_deserializer=provider__pb2.PlaceOrdersRequest.FromString,
+                    response_serializer=provider__pb2.PlaceOrdersResponse.SerializeToString,
+            ),
             'PlaceComboOrder': grpc.unary_unary_rpc_method_handler(
                     servicer.PlaceComboOrder,
                     request_deserializer=provider__pb2.PlaceComboOrderRequest.FromString,
@@ -638,6 +849,11 @@ def add_ShioajiProviderServicer_to_server(servicer, server):
                     request_deserializer=provider__pb2.CancelOrderRequest.FromString,
                     response_serializer=provider__pb2.Trade.SerializeToString,
             ),
+            'CancelOrders': grpc.unary_stream_rpc_method_handler(
+                    servicer.CancelOrders,
+                    request_deserializer=provider__pb2.CancelOrdersRequest.FromString,
+                    response_serializer=provider__pb2.CancelOrderResult.SerializeToString,
+            ),
             'CancelComboOrder': grpc.unary_unary_rpc_method_handler(
                     servicer.CancelComboOrder,
                     request_deserializer=provider__pb2.CancelComboOrderRequest.FromString,
@@ -663,6 +879,16 @@ def add_ShioajiProviderServicer_to_server(servicer, server):
                     request_deserializer=provider__pb2.Empty.FromString,
                     response_serializer=provider__pb2.ListComboTradesResponse.SerializeToString,
             ),
+            'ListTradesDelta': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListTradesDelta,
+                    request_deserializer=provider__pb2.ListTradesDeltaRequest.FromString,
+                    response_serializer=provider__pb2.ListTradesResponse.SerializeToString,
+            ),
+            'ListComboTradesDelta': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListComboTradesDelta,
+                    request_deserializer=provider__pb2.ListTradesDeltaRequest.FromString,
+                    response_serializer=provider__pb2.ListComboTradesResponse.SerializeToString,
+            ),
             'GetOrderDealRecords': grpc.unary_unary_rpc_method_handler(
                     servicer.GetOrderDealRecords,
                     request_deserializer=provider__pb2.GetOrderDealRecordsRequest.FromString,
@@ -753,6 +979,31 @@ def add_ShioajiProviderServicer_to_server(servicer, server):
                     request_deserializer=provider__pb2.GetKbarsRequest.FromString,
                     response_serializer=provider__pb2.Kbars.SerializeToString,
             ),
+            'GetKbarsBatch': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetKbarsBatch,
+                    request_deserializer=provider__pb2.GetKbarsBatchRequest.FromString,
+                    response_serializer=provider__pb2.KbarsBatchResult.SerializeToString,
+            ),
+            'StreamHistoricalTicks': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamHistoricalTicks,
+                    request_deserializer=provider__pb2.StreamHistoricalTicksRequest.FromString,
+                    response_serializer=provider__pb2.Ticks.SerializeToString,
+            ),
+            'StreamHistoricalKbars': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamHistoricalKbars,
+                    request_deserializer=provider__pb2.StreamHistoricalKbarsRequest.FromString,
+                    response_serializer=provider__pb2.Kbars.SerializeToString,
+            ),
+            'GetTickBars': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetTickBars,
+                    request_deserializer=provider__pb2.GetTickBarsRequest.FromString,
+                    response_serializer=provider__pb2.Kbars.SerializeToString,
+            ),
+            'GetTickAnalytics': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetTickAnalytics,
+                    request_deserializer=provider__pb2.GetTickAnalyticsRequest.FromString,
+                    response_serializer=provider__pb2.TickAnalytics.SerializeToString,
+            ),
             'GetDailyQuotes': grpc.unary_unary_rpc_method_handler(
                     servicer.GetDailyQuotes,
                     request_deserializer=provider__pb2.GetDailyQuotesRequest.FromString,
@@ -788,6 +1039,21 @@ def add_ShioajiProviderServicer_to_server(servicer, server):
                     request_deserializer=provider__pb2.FetchContractsRequest.FromString,
                     response_serializer=provider__pb2.Empty.SerializeToString,
             ),
+            'GetOptionChain': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetOptionChain,
+                    request_deserializer=provider__pb2.GetOptionChainRequest.FromString,
+                    response_serializer=provider__pb2.OptionChain.SerializeToString,
+            ),
+            'FindContracts': grpc.unary_unary_rpc_method_handler(
+                    servicer.FindContracts,
+                    request_deserializer=provider__pb2.FindContractsRequest.FromString,
+                    response_serializer=provider__pb2.FindContractsResponse.SerializeToString,
+            ),
+            'GetSingleflightStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetSingleflightStats,
+                    request_deserializer=provider__pb2.Empty.FromString,
+                    response_serializer=provider__pb2.SingleflightStats.SerializeToString,
+            ),
             'GetCAExpireTime': grpc.unary_unary_rpc_method_handler(
                     servicer.GetCAExpireTime,
                     request_deserializer=provider__pb2.GetCAExpireTimeRequest.FromString,
@@ -803,6 +1069,21 @@ def add_ShioajiProviderServicer_to_server(servicer, server):
                     request_deserializer=provider__pb2.UnsubscribeTradeRequest.FromString,
                     response_serializer=provider__pb2.UnsubscribeTradeResponse.SerializeToString,
             ),
+            'StreamTicks': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamTicks,
+                    request_deserializer=provider__pb2.StreamTicksRequest.FromString,
+                    response_serializer=provider__pb2.Tick.SerializeToString,
+            ),
+            'StreamBidAsk': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamBidAsk,
+                    request_deserializer=provider__pb2.StreamBidAskRequest.FromString,
+                    response_serializer=provider__pb2.BidAsk.SerializeToString,
+            ),
+            'StreamOrderEvents': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamOrderEvents,
+                    request_deserializer=provider__pb2.StreamOrderEventsRequest.FromString,
+                    response_serializer=provider__pb2.OrderEvent.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'v1.ShioajiProvider', rpc_method_handlers)
@@ -978,6 +1259,33 @@ class ShioajiProvider(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def PlaceOrders(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/v1.ShioajiProvider/PlaceOrders',
+            provider__pb2.PlaceOrdersRequest.SerializeToString,
+            provider__pb2.PlaceOrdersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def PlaceComboOrder(request,
             target,
@@ -1059,6 +1367,33 @@ class ShioajiProvider(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def CancelOrders(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/v1.ShioajiProvider/CancelOrders',
+            provider__pb2.CancelOrdersRequest.SerializeToString,
+            provider__pb2.CancelOrderResult.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def CancelComboOrder(request,
             target,
@@ -1194,6 +1529,60 @@ class ShioajiProvider(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ListTradesDelta(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/v1.ShioajiProvider/ListTradesDelta',
+            provider__pb2.ListTradesDeltaRequest.SerializeToString,
+            provider__pb2.ListTradesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListComboTradesDelta(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/v1.ShioajiProvider/ListComboTradesDelta',
+            provider__pb2.ListTradesDeltaRequest.SerializeToString,
+            provider__pb2.ListComboTradesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetOrderDealRecords(request,
             target,
@@ -1680,6 +2069,141 @@ class ShioajiProvider(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetKbarsBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/v1.ShioajiProvider/GetKbarsBatch',
+            provider__pb2.GetKbarsBatchRequest.SerializeToString,
+            provider__pb2.KbarsBatchResult.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamHistoricalTicks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/v1.ShioajiProvider/StreamHistoricalTicks',
+            provider__pb2.StreamHistoricalTicksRequest.SerializeToString,
+            provider__pb2.Ticks.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamHistoricalKbars(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/v1.ShioajiProvider/StreamHistoricalKbars',
+            provider__pb2.StreamHistoricalKbarsRequest.SerializeToString,
+            provider__pb2.Kbars.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetTickBars(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/v1.ShioajiProvider/GetTickBars',
+            provider__pb2.GetTickBarsRequest.SerializeToString,
+            provider__pb2.Kbars.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetTickAnalytics(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/v1.ShioajiProvider/GetTickAnalytics',
+            provider__pb2.GetTickAnalyticsRequest.SerializeToString,
+            provider__pb2.TickAnalytics.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetDailyQuotes(request,
             target,
@@ -1869,6 +2393,87 @@ class ShioajiProvider(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetOptionChain(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/v1.ShioajiProvider/GetOptionChain',
+            provider__pb2.GetOptionChainRequest.SerializeToString,
+            provider__pb2.OptionChain.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def FindContracts(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/v1.ShioajiProvider/FindContracts',
+            provider__pb2.FindContractsRequest.SerializeToString,
+            provider__pb2.FindContractsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetSingleflightStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/v1.ShioajiProvider/GetSingleflightStats',
+            provider__pb2.Empty.SerializeToString,
+            provider__pb2.SingleflightStats.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetCAExpireTime(request,
             target,
@@ -1949,3 +2554,84 @@ class ShioajiProvider(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def StreamTicks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/v1.ShioajiProvider/StreamTicks',
+            provider__pb2.StreamTicksRequest.SerializeToString,
+            provider__pb2.Tick.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamBidAsk(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/v1.ShioajiProvider/StreamBidAsk',
+            provider__pb2.StreamBidAskRequest.SerializeToString,
+            provider__pb2.BidAsk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamOrderEvents(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/v1.ShioajiProvider/StreamOrderEvents',
+            provider__pb2.StreamOrderEventsRequest.SerializeToString,
+            provider__pb2.OrderEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,149 @@
+"""
+provider.src.ratelimit -.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import grpc
+from log import logger
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a call cannot get a token before its deadline."""
+
+
+class TokenBucket:
+    """
+    TokenBucket -.
+    Token bucket that queues instead of rejecting: a caller reserves the
+    next token even when the bucket is empty (the balance goes negative)
+    and sleeps until that token is due, so concurrent callers are served
+    in reservation order at exactly the configured rate. A reservation that
+    would be due after the caller's deadline is given back and fails at once.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self, deadline: Optional[float] = None) -> float:
+        """Reserve a token; returns the seconds until it may be used."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            if deadline is not None and now + delay > deadline:
+                self._tokens += 1
+                raise RateLimitExceeded(
+                    f"rate limit queue is {delay:.2f}s deep, "
+                    f"deadline in {max(deadline - now, 0):.2f}s"
+                )
+            return delay
+
+    def acquire(self, deadline: Optional[float] = None):
+        """Wait for a token, or raise RateLimitExceeded if it would be too late."""
+        delay = self.reserve(deadline)
+        if delay > 0:
+            time.sleep(delay)
+
+    @classmethod
+    def from_spec(cls, spec: str) -> Optional["TokenBucket"]:
+        """Parse "rate/burst" (per second, e.g. "20/50"); "0" or "off" disables."""
+        if spec.strip().lower() in ("", "0", "off"):
+            return None
+        rate, _, burst = spec.partition("/")
+        return cls(float(rate), int(burst or max(float(rate), 1)))
+
+
+class RateLimiter:
+    """
+    RateLimiter -.
+    One TokenBucket per call class (e.g. orders, account, quote). Classes
+    without a bucket are not limited.
+    """
+
+    def __init__(self, buckets: Dict[str, Optional[TokenBucket]]):
+        self.buckets = {name: b for name, b in buckets.items() if b is not None}
+
+    def acquire(self, call_class: str, deadline: Optional[float] = None):
+        """Wait for a token of a call class before its deadline."""
+        bucket = self.buckets.get(call_class)
+        if bucket is not None:
+            bucket.acquire(deadline)
+
+    def reserve(self, call_class: str, deadline: Optional[float] = None) -> float:
+        """Reserve a token of a call class; returns the seconds until it is due."""
+        bucket = self.buckets.get(call_class)
+        return bucket.reserve(deadline) if bucket is not None else 0.0
+
+    def describe(self) -> str:
+        """Human-readable summary of the configured limits."""
+        return (
+            ", ".join(
+                f"{name}={b.rate:g}/s burst {b.burst}"
+                for name, b in self.buckets.items()
+            )
+            or "none"
+        )
+
+
+def deadline_of(context: Any) -> Optional[float]:
+    """The RPC deadline as a time.monotonic() value, None if it has none."""
+    remaining = context.time_remaining()
+    if remaining is None:
+        return None
+    return time.monotonic() + remaining
+
+
+def rate_limited(call_class: str) -> Callable:
+    """
+    Decorate a unary servicer method of an object with a rate_limiter so it
+    waits for a token of call_class first; RESOURCE_EXHAUSTED if the RPC
+    deadline would pass while queued. The wrapper's aio_layer does the same
+    for a coroutine handler, waiting on the event loop instead of a thread.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, request, context):
+            try:
+                self.rate_limiter.acquire(call_class, deadline_of(context))
+            except RateLimitExceeded as e:
+                logger.warning("Rejected %s: %s", method.__name__, e)
+                context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(e))
+            return method(self, request, context)
+
+        setattr(wrapper, "aio_layer", functools.partial(_aio_rate_limited, call_class))
+        return wrapper
+
+    return decorator
+
+
+def _aio_rate_limited(
+    call_class: str, service: Any, name: str, handler: Callable
+) -> Callable:
+    """Coroutine form of rate_limited around an async handler(request, context)."""
+
+    async def wrapper(request, context):
+        try:
+            delay = service.rate_limiter.reserve(call_class, deadline_of(context))
+        except RateLimitExceeded as e:
+            logger.warning("Rejected %s: %s", name, e)
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(e))
+            raise
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return await handler(request, context)
+
+    return wrapper
@@ -0,0 +1,202 @@
+"""
+provider.src.resample -.
+"""
+
+from bisect import bisect_left
+from types import SimpleNamespace
+from typing import Any, Sequence
+
+import numpy as np
+from column_store import TICK_COLUMNS
+
+# Session opens in minutes after midnight, the day session first.
+TAIFEX_SESSIONS = (8 * 60 + 45, 15 * 60)
+TWSE_SESSIONS = (9 * 60,)
+# Intervals of at least this many minutes give one bar per trading day.
+DAILY = 1440
+# Kinds of tick bars.
+TIME = "time"
+VOLUME = "volume"
+TICKS = "ticks"
+_KBAR_FIELDS = ("ts", "Open", "High", "Low", "Close", "Volume", "Amount")
+
+_MINUTE_NS = 60 * 10**9
+_DAY_NS = 1440 * _MINUTE_NS
+
+
+def session_starts(start: np.ndarray, opens: Sequence[int]) -> np.ndarray:
+    """
+    Start of the session each timestamp falls in. A time before the first
+    open of its day belongs to the previous day's last session (e.g. the
+    TAIFEX night session after midnight).
+    """
+    day = start - start % _DAY_NS
+    opens_ns = np.asarray(opens, dtype=np.int64) * _MINUTE_NS
+    index = np.searchsorted(opens_ns, start - day, side="right") - 1
+    return day + opens_ns[index] - np.where(index < 0, _DAY_NS, 0)
+
+
+def bucket_keys(bar_ts: np.ndarray, minutes: int, opens: Sequence[int]) -> np.ndarray:
+    """
+    Key of the output bar each 1-minute bar falls into: N-minute buckets
+    counted from each session's open, or with minutes >= DAILY the start of
+    the next day session, so a TAIFEX night session joins the trading day it
+    is settled with whatever weekend or holiday lies in between.
+    """
+    # Bars are labelled by their end, as Shioaji does.
+    sessions = session_starts(bar_ts - _MINUTE_NS, opens)
+    if minutes < DAILY:
+        width = minutes * _MINUTE_NS
+        return sessions + (bar_ts - _MINUTE_NS - sessions) // width * width
+    is_day = sessions % _DAY_NS == opens[0] * _MINUTE_NS
+    day_rows = np.flatnonzero(is_day)
+    if day_rows.size == 0:
+        return sessions
+    following = np.searchsorted(day_rows, np.arange(len(bar_ts)))
+    keys = sessions[day_rows[np.minimum(following, len(day_rows) - 1)]]
+    return np.where(following < len(day_rows), keys, sessions)
+
+
+def resample_kbars(kbars: Any, minutes: int, opens: Sequence[int]) -> SimpleNamespace:
+    """
+    Aggregate sorted 1-minute kbars into N-minute or daily bars: first open,
+    highest high, lowest low, last close, summed volume and amount, labelled
+    with the ts of the bucket's last 1-minute bar.
+    """
+    ts = np.asarray(kbars.ts, dtype=np.int64)
+    if ts.size == 0 or minutes <= 1:
+        return kbars
+    return _reduce(
+        _changes(bucket_keys(ts, minutes, opens)),
+        ts,
+        np.asarray(kbars.Open, dtype=np.float64),
+        np.asarray(kbars.High, dtype=np.float64),
+        np.asarray(kbars.Low, dtype=np.float64),
+        np.asarray(kbars.Close, dtype=np.float64),
+        np.asarray(kbars.Volume, dtype=np.int64),
+        np.asarray(kbars.Amount, dtype=np.float64),
+    )
+
+
+def tick_bars(
+    ticks: Any, kind: str, size: int, opens: Sequence[int]
+) -> SimpleNamespace:
+    """
+    Build kbars from ticks: TIME bars of size seconds aligned to the clock
+    and labelled with their end, or VOLUME bars of size volume and TICKS bars
+    of size ticks labelled with their last tick. A tick is never split, so a
+    volume bar closes with the tick that reaches size; volume and tick bars
+    restart at each session open. Amount is the sum of close * volume.
+    """
+    ts = np.asarray(ticks.ts, dtype=np.int64)
+    if ts.size == 0 or size <= 0:
+        return SimpleNamespace(**{name: [] for name in _KBAR_FIELDS})
+    close = np.asarray(ticks.close, dtype=np.float64)
+    volume = np.asarray(ticks.volume, dtype=np.int64)
+    if kind == TIME:
+        width = size * 10**9
+        keys = ts // width
+        starts = _changes(keys)
+        bars = _reduce(starts, ts, close, close, close, close, volume, close * volume)
+        bars.ts = ((keys[starts] + 1) * width).tolist()
+        return bars
+    counts = volume if kind == VOLUME else np.ones_like(volume)
+    starts = _count_starts(ts, counts, size, opens)
+    return _reduce(starts, ts, close, close, close, close, volume, close * volume)
+
+
+def downsample_kbars(kbars: Any, max_points: int) -> Any:
+    """
+    Merge runs of consecutive bars so at most max_points are left, keeping
+    each run's OHLC envelope and summed volume, labelled with its last bar.
+    """
+    ts = np.asarray(kbars.ts, dtype=np.int64)
+    if max_points <= 0 or ts.size <= max_points:
+        return kbars
+    width = -(-ts.size // max_points)
+    return _reduce(
+        np.arange(0, ts.size, width),
+        ts,
+        np.asarray(kbars.Open, dtype=np.float64),
+        np.asarray(kbars.High, dtype=np.float64),
+        np.asarray(kbars.Low, dtype=np.float64),
+        np.asarray(kbars.Close, dtype=np.float64),
+        np.asarray(kbars.Volume, dtype=np.int64),
+        np.asarray(kbars.Amount, dtype=np.float64),
+    )
+
+
+def downsample_ticks(ticks: Any, max_points: int) -> Any:
+    """
+    Keep at most max_points ticks (at least 4) that preserve the shape of the
+    close price: the ticks are split into max_points / 4 equal buckets and
+    the first, last, lowest and highest tick of each survive (M4).
+    """
+    close = np.asarray(ticks.close, dtype=np.float64)
+    if max_points <= 0 or close.size <= max_points:
+        return ticks
+    bucket = np.arange(close.size) * max(max_points // 4, 1) // close.size
+    starts = _changes(bucket)
+    ends = np.r_[starts[1:], close.size] - 1
+    by_price = np.lexsort((close, bucket))
+    keep = np.unique(np.r_[starts, ends, by_price[starts], by_price[ends]]).tolist()
+    # Pick the kept rows directly, converting only close to an array.
+    return SimpleNamespace(
+        **{name: [getattr(ticks, name)[i] for i in keep] for name, _ in TICK_COLUMNS}
+    )
+
+
+def _changes(keys: np.ndarray) -> np.ndarray:
+    """Indices where a run of equal keys starts."""
+    return np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+
+
+def _count_starts(
+    ts: np.ndarray, counts: np.ndarray, size: int, opens: Sequence[int]
+) -> np.ndarray:
+    """
+    First rows of bars closing with the row that brings the bar's own count
+    to size; the count restarts with each bar and each session.
+    """
+    sessions = session_starts(ts, opens)
+    first = _changes(sessions)
+    done = np.cumsum(counts) - counts
+    if counts.max() <= 1:
+        # No row overshoots size, so bars are cut at multiples of size.
+        done -= np.repeat(done[first], np.diff(np.r_[first, ts.size]))
+        keys = done // size
+        return np.flatnonzero(
+            np.r_[True, (keys[1:] != keys[:-1]) | (sessions[1:] != sessions[:-1])]
+        )
+    total = (done + counts).tolist()
+    done_list = done.tolist()
+    starts = []
+    start = 0
+    for end in np.r_[first[1:], ts.size].tolist():
+        while start < end:
+            starts.append(start)
+            start = min(bisect_left(total, done_list[start] + size, start) + 1, end)
+    return np.asarray(starts, dtype=np.int64)
+
+
+def _reduce(
+    starts: np.ndarray,
+    ts: np.ndarray,
+    opens: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    volume: np.ndarray,
+    amount: np.ndarray,
+) -> SimpleNamespace:
+    """Aggregate rows into bars starting at the given row indices."""
+    ends = np.r_[starts[1:], ts.size] - 1
+    return SimpleNamespace(
+        ts=ts[ends].tolist(),
+        Open=opens[starts].tolist(),
+        High=np.maximum.reduceat(highs, starts).tolist(),
+        Low=np.minimum.reduceat(lows, starts).tolist(),
+        Close=closes[ends].tolist(),
+        Volume=np.add.reduceat(volume, starts).tolist(),
+        Amount=np.add.reduceat(amount, starts).tolist(),
+    )
@@ -4,11 +4,11 @@ provider.src.shioaji_client -.
 
 from datetime import date as dt_date
 from datetime import datetime
-from typing import Any, Callable, List, Union
+from typing import Any, Callable, List, Union, cast
 
 import shioaji as sj
 from shioaji.account import Account
-from shioaji.constant import ScannerType
+from shioaji.constant import QuoteType, QuoteVersion, ScannerType
 from shioaji.contracts import (
     BaseContract,
     ComboContract,
@@ -794,7 +794,7 @@ class ShioajiClient:
         """
         return self.api.notice()
 
-    def fetch_contracts(self, contract_download: bool):
+    def fetch_contracts(self, contract_download: bool, **kwargs):
         """
         Manually fetch contracts.
         下載商品檔
@@ -806,8 +806,9 @@ class ShioajiClient:
 
         Args:
             contract_download (bool): Whether to download contracts.
+            **kwargs: Additional arguments to pass to the underlying fetch method.
         """
-        return self.api.fetch_contracts(contract_download)
+        return self.api.fetch_contracts(contract_download, **kwargs)
 
     def set_context(self, context: Any):
         """
@@ -891,6 +892,56 @@ class ShioajiClient:
         """
         return self.api.unsubscribe_trade(account)
 
+    def subscribe(
+        self,
+        contract: BaseContract,
+        quote_type: QuoteType = QuoteType.Tick,
+        version: QuoteVersion = QuoteVersion.v1,
+    ):
+        """
+        Subscribe to real-time quotes for a contract.
+        訂閱行情
+
+        Original Args:
+            contract: shioaji.contracts.Contract
+            quote_type: shioaji.constant.QuoteType = QuoteType.Tick
+            intraday_odd: bool = False
+            version: shioaji.constant.QuoteVersion = QuoteVersion.v1
+
+        Args:
+            contract (BaseContract): The contract to subscribe to.
+            quote_type (QuoteType): The quote type (Tick, BidAsk, Quote).
+            version (QuoteVersion): The quote version.
+        """
+        cast(Any, self.api).quote.subscribe(
+            contract, quote_type=quote_type, version=version
+        )
+
+    def unsubscribe(
+        self,
+        contract: BaseContract,
+        quote_type: QuoteType = QuoteType.Tick,
+        version: QuoteVersion = QuoteVersion.v1,
+    ):
+        """
+        Unsubscribe from real-time quotes for a contract.
+        取消訂閱行情
+
+        Original Args:
+            contract: shioaji.contracts.Contract
+            quote_type: shioaji.constant.QuoteType = QuoteType.Tick
+            intraday_odd: bool = False
+            version: shioaji.constant.QuoteVersion = QuoteVersion.v1
+
+        Args:
+            contract (BaseContract): The contract to unsubscribe from.
+            quote_type (QuoteType): The quote type (Tick, BidAsk, Quote).
+            version (QuoteVersion): The quote version.
+        """
+        cast(Any, self.api).quote.unsubscribe(
+            contract, quote_type=quote_type, version=version
+        )
+
     # Callbacks and Decorators
     def on_event(self, func: Callable) -> Callable:
         """
@@ -0,0 +1,289 @@
+"""
+provider.src.streaming -.
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from collections import deque
+from functools import partial
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+
+class Subscription:
+    """
+    Subscription -.
+    Bounded per-subscriber queue filled from Shioaji callback threads.
+    publish() never blocks: when the queue is full the subscription is closed
+    as overflowed, so one slow consumer cannot stall the callback thread.
+    Items are drained in batches with get() on a worker thread or aget() on
+    an event loop.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.overflowed = False
+        self._items: Deque[Any] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._event = asyncio.Event()
+        self._waker: Optional[Callable[[], Any]] = None
+
+    @property
+    def closed(self) -> bool:
+        """Whether the subscription no longer delivers items."""
+        return self._closed
+
+    def publish(self, item: Any) -> bool:
+        """Queue an item; close the subscription instead of blocking when full."""
+        with self._cond:
+            if self._closed:
+                return False
+            if not self._push(item):
+                self.overflowed = True
+                self._closed = True
+            self._notify()
+        return not self.overflowed
+
+    def close(self):
+        """Stop delivery and wake any waiting consumer."""
+        with self._cond:
+            self._closed = True
+            self._notify()
+
+    def get(self, timeout: Optional[float] = None) -> List[Any]:
+        """Block until items are available; empty on timeout or close."""
+        with self._cond:
+            delay = self._delay()
+            while delay > 0 and not self._closed:
+                self._cond.wait(delay)
+                delay = self._delay()
+            if not self._pending() and not self._closed:
+                self._cond.wait(timeout)
+            return self._take()
+
+    async def aget(self, timeout: Optional[float] = None) -> List[Any]:
+        """Await items without holding a thread; empty on timeout or close."""
+        delay = self._delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        with self._cond:
+            if self._pending() or self._closed:
+                return self._take()
+            self._event.clear()
+            self._waker = partial(
+                asyncio.get_running_loop().call_soon_threadsafe, self._event.set
+            )
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        with self._cond:
+            self._waker = None
+            return self._take()
+
+    def _push(self, item: Any) -> bool:
+        """Buffer an item; False when the buffer is full. Caller holds the lock."""
+        if len(self._items) >= self.maxsize:
+            self._items.clear()
+            return False
+        self._items.append(item)
+        return True
+
+    def _pending(self) -> bool:
+        """Whether items are buffered. Caller holds the lock."""
+        return bool(self._items)
+
+    def _take(self) -> List[Any]:
+        """Remove and return all buffered items. Caller holds the lock."""
+        items = list(self._items)
+        self._items.clear()
+        return items
+
+    def _delay(self) -> float:
+        """Seconds the consumer must wait before its next read."""
+        return 0.0
+
+    def _notify(self):
+        """Wake the consumer; caller holds the condition."""
+        self._cond.notify_all()
+        if self._waker is not None:
+            self._waker()
+            self._waker = None
+
+
+class ConflatedSubscription(Subscription):
+    """
+    ConflatedSubscription -.
+    Latest-value subscription keyed by contract code: each read returns only
+    the newest item per code since the previous read, and reads are paced to
+    at most one per interval. It never overflows, as the buffer is bounded
+    by the number of subscribed codes.
+    """
+
+    def __init__(self, interval: float):
+        super().__init__(maxsize=0)
+        self.interval = interval
+        self._latest: Dict[str, Any] = {}
+        self._due = 0.0
+
+    def _push(self, item: Any) -> bool:
+        self._latest[item.code] = item
+        return True
+
+    def _pending(self) -> bool:
+        return bool(self._latest)
+
+    def _take(self) -> List[Any]:
+        items = list(self._latest.values())
+        self._latest.clear()
+        if items:
+            self._due = time.monotonic() + self.interval
+        return items
+
+    def _delay(self) -> float:
+        return self._due - time.monotonic()
+
+
+class Broadcaster:
+    """
+    Broadcaster -.
+    Fans items keyed by contract code out to every subscription on that code.
+    The subscriber table is copy-on-write, so publish() from the callback
+    thread takes no lock. on_first/on_last fire when a code gains its first
+    or loses its last subscriber, to (un)subscribe upstream.
+    """
+
+    def __init__(
+        self,
+        on_first: Optional[Callable[[str], None]] = None,
+        on_last: Optional[Callable[[str], None]] = None,
+    ):
+        self._on_first = on_first
+        self._on_last = on_last
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Tuple[Any, ...]] = {}
+
+    def subscribe(self, codes: Iterable[str], subscription: Any):
+        """Attach a subscription to the given codes."""
+        added = []
+        with self._lock:
+            table = dict(self._subscribers)
+            for code in set(codes):
+                current = table.get(code, ())
+                if not current:
+                    added.append(code)
+                table[code] = current + (subscription,)
+            self._subscribers = table
+        if self._on_first:
+            for code in added:
+                self._on_first(code)
+
+    def unsubscribe(self, subscription: Any):
+        """Detach a subscription from every code."""
+        removed = []
+        with self._lock:
+            table = {}
+            for code, subs in self._subscribers.items():
+                remaining = tuple(s for s in subs if s is not subscription)
+                if remaining:
+                    table[code] = remaining
+                elif subs:
+                    removed.append(code)
+            self._subscribers = table
+        if self._on_last:
+            for code in removed:
+                self._on_last(code)
+
+    def publish(self, code: str, item: Any):
+        """Deliver an item to the subscriptions on a code."""
+        for subscription in self._subscribers.get(code, ()):
+            subscription.publish(item)
+
+    def has_subscribers(self, code: str) -> bool:
+        """Whether any subscription is attached to a code."""
+        return code in self._subscribers
+
+    def codes(self) -> Tuple[str, ...]:
+        """Codes that currently have subscribers."""
+        return tuple(self._subscribers)
+
+
+class ReplayGapError(Exception):
+    """Raised when a resume point is older than the retained event window."""
+
+
+class EventLog:
+    """
+    EventLog -.
+    Sequenced event stream with a bounded replay window. append() assigns a
+    monotonically increasing sequence number and delivers the event to every
+    subscription under one lock, so live delivery and replay stay in order.
+    Numbers restart with each EventLog, so every instance has a random epoch
+    and a resume point from another epoch is rejected.
+    """
+
+    def __init__(self, capacity: int):
+        self._lock = threading.Lock()
+        self.epoch = uuid.uuid4().hex
+        self._seq = 0
+        self._events: Deque[Tuple[int, Any]] = deque(maxlen=capacity)
+        self._subscribers: Tuple[Subscription, ...] = ()
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest event, 0 if none."""
+        return self._seq
+
+    def append(self, build: Callable[[int], Any]) -> Any:
+        """Build an event for the next sequence number, retain and deliver it."""
+        with self._lock:
+            item = build(self._seq + 1)
+            self._seq += 1
+            self._events.append((self._seq, item))
+            for subscription in self._subscribers:
+                subscription.publish(item)
+        return item
+
+    def subscribe(
+        self,
+        subscription: Subscription,
+        since_seq: int = 0,
+        replay: bool = False,
+        epoch: str = "",
+    ):
+        """
+        Attach a subscription, first replaying retained events after since_seq.
+        A since_seq from another epoch or beyond the newest event (e.g. saved
+        before a restart) raises ReplayGapError rather than skipping events.
+        """
+        with self._lock:
+            if since_seq and epoch and epoch != self.epoch:
+                raise ReplayGapError(
+                    f"Epoch {epoch} has ended (current is {self.epoch}); "
+                    "resume with since_seq 0"
+                )
+            if since_seq > self._seq:
+                raise ReplayGapError(
+                    f"Seq {since_seq} is ahead of the newest event {self._seq} "
+                    f"of epoch {self.epoch}"
+                )
+            if replay or since_seq:
+                oldest = self._events[0][0] if self._events else self._seq + 1
+                if since_seq and since_seq + 1 < oldest:
+                    raise ReplayGapError(
+                        f"Events after seq {since_seq} are no longer retained "
+                        f"(oldest is {oldest})"
+                    )
+                for seq, item in self._events:
+                    if seq > since_seq:
+                        subscription.publish(item)
+            self._subscribers += (subscription,)
+
+    def unsubscribe(self, subscription: Subscription):
+        """Detach a subscription."""
+        with self._lock:
+            self._subscribers = tuple(
+                s for s in self._subscribers if s is not subscription
+            )
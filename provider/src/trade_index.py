@@ -0,0 +1,134 @@
+"""
+provider.src.trade_index -.
+"""
+
+import threading
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class TradeIndex:
+    """
+    TradeIndex -.
+    Constant-time lookup of Shioaji trades by order seqno and order id.
+    Entries are the client's own Trade objects, which Shioaji updates in
+    place, so the index only has to learn about new trades. A miss falls
+    back to one reload from the client before giving up.
+    Every trade also carries a version taken from an index-wide counter,
+    bumped when the trade is first seen, when an order event touches it and
+    when its status is observed to have changed, so callers can fetch only
+    the trades that changed since a watermark. Versions restart with each
+    index, so every instance has a random epoch and a watermark from another
+    epoch is treated as no watermark at all.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, loader: Callable[[], Iterable[Any]]):
+        self._loader = loader
+        self.epoch = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._by_seqno: Dict[str, Any] = {}
+        self._by_id: Dict[str, Any] = {}
+        self._version = 0
+        self._versions: Dict[str, int] = {}
+        self._fingerprints: Dict[str, Tuple[Any, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    @property
+    def version(self) -> int:
+        """Highest version handed out so far."""
+        return self._version
+
+    def add(self, trade: Any):
+        """Index a single trade."""
+        with self._lock:
+            self._observe(trade)
+
+    def touch(self, seqno: str = "", trade_id: str = "") -> bool:
+        """Bump the version of an indexed trade; False if it is not indexed."""
+        with self._lock:
+            trade = self._get(seqno, trade_id)
+            if trade is None:
+                return False
+            self._bump(self._key(trade))
+            return True
+
+    def refresh(self):
+        """Rebuild the index from the client's current trade list."""
+        trades = list(self._loader())
+        with self._lock:
+            self._by_seqno = {}
+            self._by_id = {}
+            for trade in trades:
+                self._observe(trade)
+
+    def changed_since(self, version: int, epoch: str = "") -> Tuple[List[Any], int]:
+        """
+        Trades whose version is above the given watermark, and the new
+        watermark. A watermark from another epoch or from the future (e.g.
+        issued before a provider restart) returns every trade.
+        """
+        trades = list(self._loader())
+        with self._lock:
+            for trade in trades:
+                self._observe(trade)
+            if (epoch and epoch != self.epoch) or version > self._version:
+                version = 0
+            changed = [t for t in trades if self._versions[self._key(t)] > version]
+            return changed, self._version
+
+    def find(self, seqno: str = "", trade_id: str = "") -> Optional[Any]:
+        """Look a trade up by seqno, then id; reload once on a miss."""
+        trade = self._get(seqno, trade_id)
+        if trade is None and (seqno or trade_id):
+            self.refresh()
+            trade = self._get(seqno, trade_id)
+        return trade
+
+    def _get(self, seqno: str, trade_id: str) -> Optional[Any]:
+        """Look a trade up without reloading."""
+        if seqno and seqno in self._by_seqno:
+            return self._by_seqno[seqno]
+        if trade_id:
+            return self._by_id.get(trade_id)
+        return None
+
+    def _observe(self, trade: Any):
+        """Index a trade and bump it if new or its status moved. Caller holds the lock."""
+        order = trade.order
+        if order.seqno:
+            self._by_seqno[order.seqno] = trade
+        if order.id:
+            self._by_id[order.id] = trade
+        key = self._key(trade)
+        fingerprint = self._fingerprint(trade)
+        if self._fingerprints.get(key) != fingerprint:
+            self._fingerprints[key] = fingerprint
+            self._bump(key)
+
+    def _bump(self, key: str):
+        """Give a trade the next version. Caller holds the lock."""
+        self._version += 1
+        self._versions[key] = self._version
+
+    @staticmethod
+    def _key(trade: Any) -> str:
+        """Stable identity of a trade across reloads."""
+        return trade.order.id or trade.order.seqno
+
+    @staticmethod
+    def _fingerprint(trade: Any) -> Tuple[Any, ...]:
+        """The parts of a trade's status that change over its life."""
+        status = trade.status
+        return (
+            status.status,
+            status.msg,
+            status.modified_price,
+            status.order_quantity,
+            status.deal_quantity,
+            status.cancel_quantity,
+            len(status.deals or ()),
+        )
@@ -0,0 +1,164 @@
+"""
+provider.tests.conftest -.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent import futures
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Callable, Iterator, cast
+
+import grpc
+import pytest
+from shioaji.constant import SecurityType
+from shioaji.contracts import FetchStatus
+
+# The provider runs with src as its working directory; import its modules the same way.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+# pylint: disable=wrong-import-position
+import provider_pb2_grpc  # noqa: E402
+
+import provider  # noqa: E402
+
+
+def wait_for(predicate: Callable[[], bool], timeout: float = 5.0):
+    """Poll until predicate() holds; fail after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting"
+        time.sleep(0.01)
+
+
+def ns(stamp: str) -> int:
+    """A "YYYY-MM-DD HH:MM[:SS]" Taipei wall-clock time as a Shioaji ts (ns)."""
+    fmt = "%Y-%m-%d %H:%M:%S" if stamp.count(":") == 2 else "%Y-%m-%d %H:%M"
+    return (
+        int((datetime.strptime(stamp, fmt) - datetime(1970, 1, 1)).total_seconds())
+        * 10**9
+    )
+
+
+def contract_set(*contracts, status: FetchStatus = FetchStatus.Fetched) -> Any:
+    """A Shioaji Contracts stand-in holding the given contracts."""
+    groups = {
+        SecurityType.Stock: "Stocks",
+        SecurityType.Future: "Futures",
+        SecurityType.Option: "Options",
+        SecurityType.Index: "Indexs",
+    }
+    live = SimpleNamespace(status=status)
+    for group in groups.values():
+        setattr(live, group, [])
+    for contract in contracts:
+        getattr(live, groups[contract.security_type]).append([contract])
+    return live
+
+
+def load_contracts(service: provider.ShioajiService, *contracts):
+    """Install a fully fetched Contracts set holding the given contracts."""
+    live = contract_set(*contracts)
+    cast(Any, service.client).api.Contracts = live
+    service.contracts.rebuild(live)
+
+
+def pytest_configure(config):
+    """Register the markers used by these tests."""
+    config.addinivalue_line(
+        "markers", "aio_workers(n): executor threads of the aio server"
+    )
+
+
+@pytest.fixture(name="service")
+def fixture_service(mocker, monkeypatch, tmp_path) -> Iterator[provider.ShioajiService]:
+    """A ShioajiService over a mocked Shioaji client and empty on-disk stores."""
+    monkeypatch.setenv("PROVIDER_CONTRACT_SNAPSHOT", "")
+    monkeypatch.setenv("PROVIDER_TICK_STORE", str(tmp_path / "ticks"))
+    monkeypatch.setenv("PROVIDER_KBAR_STORE", str(tmp_path / "kbars"))
+    mocker.patch.object(provider, "ShioajiClient")
+    service = provider.ShioajiService()
+    service.stream_slots = threading.BoundedSemaphore(4)
+    yield service
+    service.close()
+
+
+@contextmanager
+def serve_sync(service: provider.ShioajiService, workers: int) -> Iterator[int]:
+    """Serve a service with the sync server; yields its port."""
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=workers),
+        interceptors=[provider._SyncContextInterceptor()],  # pylint: disable=protected-access
+    )
+    provider_pb2_grpc.add_ShioajiProviderServicer_to_server(service, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    try:
+        yield port
+    finally:
+        server.stop(None)
+
+
+@contextmanager
+def serve_aio(service: provider.ShioajiService, workers: int) -> Iterator[int]:
+    """Serve a service with the grpc.aio server on a loop thread; yields its port."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    executor = futures.ThreadPoolExecutor(max_workers=workers)
+    order_executor = futures.ThreadPoolExecutor(max_workers=workers)
+
+    async def start():
+        server = grpc.aio.server()
+        provider_pb2_grpc.add_ShioajiProviderServicer_to_server(
+            provider.AsyncShioajiService(service, executor, order_executor), server
+        )
+        port = server.add_insecure_port("localhost:0")
+        await server.start()
+        return server, port
+
+    async def stop():
+        await server.stop(None)
+        # Let cancelled RPCs unwind before the loop goes away.
+        tasks = asyncio.all_tasks() - {asyncio.current_task()}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    server, port = asyncio.run_coroutine_threadsafe(start(), loop).result()
+    try:
+        yield port
+    finally:
+        asyncio.run_coroutine_threadsafe(stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+        executor.shutdown()
+        order_executor.shutdown()
+
+
+@pytest.fixture(name="server", params=["sync", "aio"])
+def fixture_server(request, service) -> Iterator[SimpleNamespace]:
+    """
+    The service behind a real gRPC server in each server mode: mode, service
+    and a stub connected to it. @pytest.mark.aio_workers(n) sets the
+    executor threads of the aio server (default 4).
+    """
+    if request.param == "sync":
+        serving = serve_sync(service, 8)
+    else:
+        marker = request.node.get_closest_marker("aio_workers")
+        serving = serve_aio(service, marker.args[0] if marker else 4)
+    with (
+        serving as port,
+        grpc.insecure_channel(f"localhost:{port}") as channel,
+    ):
+        yield SimpleNamespace(
+            mode=request.param,
+            service=service,
+            stub=provider_pb2_grpc.ShioajiProviderStub(channel),
+        )
@@ -0,0 +1,71 @@
+"""
+provider.tests.test_analytics -.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from analytics import TICK_BUY, TICK_SELL, tick_summary
+from conftest import ns
+
+STAMPS = [f"2026-10-16 09:00:{s:02d}" for s in range(5)]
+
+
+def ticks() -> SimpleNamespace:
+    """Five ticks over two prices, both sides and one of unknown side."""
+    return SimpleNamespace(
+        ts=[ns(s) for s in STAMPS],
+        close=[100.0, 101.0, 100.0, 101.0, 100.5],
+        volume=[2, 3, 1, 4, 10],
+        tick_type=[TICK_BUY, TICK_BUY, TICK_SELL, TICK_SELL, 0],
+    )
+
+
+def test_summary():
+    """VWAP, OHLC and the side split cover every tick."""
+    summary = tick_summary(ticks())
+    assert summary.ticks == 5
+    assert summary.volume == 20
+    assert summary.vwap == pytest.approx(
+        (100.0 * 2 + 101.0 * 3 + 100.0 * 1 + 101.0 * 4 + 100.5 * 10) / 20
+    )
+    assert (summary.open, summary.high, summary.low, summary.close) == (
+        100.0,
+        101.0,
+        100.0,
+        100.5,
+    )
+    assert (summary.buy_volume, summary.sell_volume) == (5, 5)
+    assert (summary.first_ts, summary.last_ts) == (ns(STAMPS[0]), ns(STAMPS[-1]))
+
+
+def test_volume_at_price():
+    """One level per traded price, ascending, with its own side split."""
+    assert tick_summary(ticks()).levels == [
+        (100.0, 3, 2, 1, 2),
+        (100.5, 10, 0, 0, 1),
+        (101.0, 7, 3, 4, 2),
+    ]
+
+
+def test_range_bounds_are_inclusive():
+    """start_ts and end_ts keep the ticks stamped exactly at them."""
+    summary = tick_summary(ticks(), ns(STAMPS[1]), ns(STAMPS[3]))
+    assert summary.ticks == 3
+    assert (summary.open, summary.close) == (101.0, 101.0)
+    assert (summary.first_ts, summary.last_ts) == (ns(STAMPS[1]), ns(STAMPS[3]))
+    assert tick_summary(ticks(), start_ts=ns(STAMPS[4])).volume == 10
+    assert tick_summary(ticks(), end_ts=ns(STAMPS[0])).volume == 2
+
+
+def test_empty_range():
+    """A range without ticks is an empty summary."""
+    summary = tick_summary(ticks(), start_ts=ns("2026-10-16 10:00"))
+    assert (summary.ticks, summary.volume, summary.levels) == (0, 0, [])
+
+
+def test_zero_volume_has_no_vwap():
+    """Ticks without volume give a zero VWAP instead of dividing by zero."""
+    data = ticks()
+    data.volume = [0] * 5
+    assert tick_summary(data).vwap == 0.0
@@ -0,0 +1,176 @@
+"""
+provider.tests.test_batch -.
+"""
+
+import threading
+import time
+from concurrent import futures
+
+import pytest
+from batch import MicroBatcher, submit_bounded
+
+
+@pytest.fixture(name="executor")
+def fixture_executor():
+    """A pool larger than any limit under test."""
+    with futures.ThreadPoolExecutor(max_workers=8) as executor:
+        yield executor
+
+
+def test_results_follow_item_order(executor):
+    """Futures line up with items even when later items finish first."""
+    placed = submit_bounded(
+        executor, lambda delay: time.sleep(delay) or delay, [0.1, 0.05, 0.0], 3
+    )
+    assert [f.result(timeout=5) for f in placed] == [0.1, 0.05, 0.0]
+
+
+def test_in_flight_calls_never_exceed_the_limit(executor):
+    """At most limit calls run at once, and every item still runs."""
+    lock = threading.Lock()
+    running, peak = [0], [0]
+
+    def work(item):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return item
+
+    placed = submit_bounded(executor, work, list(range(10)), 3)
+    assert [f.result(timeout=5) for f in placed] == list(range(10))
+    assert peak[0] == 3
+
+
+def test_items_start_in_order(executor):
+    """With a limit of one, items run strictly one after another."""
+    started = []
+    placed = submit_bounded(executor, started.append, ["a", "b", "c"], 1)
+    futures.wait(placed, timeout=5)
+    assert started == ["a", "b", "c"]
+
+
+def test_a_failure_stays_with_its_item(executor):
+    """One failing call does not stop or fail the others."""
+
+    def work(item):
+        if item == "bad":
+            raise ValueError(item)
+        return item
+
+    placed = submit_bounded(executor, work, ["a", "bad", "c"], 1)
+    assert placed[0].result(timeout=5) == "a"
+    assert isinstance(placed[1].exception(timeout=5), ValueError)
+    assert placed[2].result(timeout=5) == "c"
+
+
+def test_no_items(executor):
+    """An empty batch submits nothing."""
+    assert not submit_bounded(executor, print, [], 4)
+
+
+class Upstream:
+    """A fetch function recording each call; "hold" blocks until released."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+
+    def __call__(self, items, deadline):
+        self.calls.append((list(items), deadline))
+        if "hold" in items:
+            self.release.wait(5)
+        if "broken" in items:
+            raise RuntimeError("upstream down")
+        if "garbled" in items:
+            return None
+        return [item for item in items if item != "missing"]
+
+
+@pytest.fixture(name="upstream")
+def fixture_upstream():
+    """The upstream behind the batcher; released at teardown."""
+    upstream = Upstream()
+    yield upstream
+    upstream.release.set()
+
+
+@pytest.fixture(name="batcher")
+def fixture_batcher(upstream):
+    """A batcher with a window long enough to gather a test's callers."""
+    batcher = MicroBatcher(upstream, key=str, window=0.3, chunk_size=2, workers=4)
+    yield batcher
+    batcher.close()
+
+
+def behind_a_fetch(batcher, upstream, *lookups):
+    """
+    Run lookups while a first fetch is in flight, so they share the next
+    batch; returns each lookup's result or exception.
+    """
+    with futures.ThreadPoolExecutor(max_workers=len(lookups) + 1) as pool:
+        held = pool.submit(batcher.get, ["hold"])
+        while not upstream.calls:
+            time.sleep(0.01)
+        pending = [pool.submit(batcher.get, *lookup) for lookup in lookups]
+        upstream.release.set()
+        held.result(timeout=5)
+        return [f.exception(timeout=5) or f.result() for f in pending]
+
+
+def test_idle_batcher_fetches_at_once(upstream):
+    """With nothing in flight the first caller does not wait out the window."""
+    batcher = MicroBatcher(upstream, key=str, window=5.0, chunk_size=2, workers=1)
+    started = time.monotonic()
+    assert batcher.get(["a"]) == ["a"]
+    assert time.monotonic() - started < 1.0
+    batcher.close()
+
+
+def test_callers_share_deduplicated_chunks(batcher, upstream):
+    """Overlapping lookups are fetched once and each gets its own keys back."""
+    results = behind_a_fetch(batcher, upstream, (["b", "a"],), (["a", "c"],))
+    assert results == [["b", "a"], ["a", "c"]]
+    fetched = sorted(item for items, _ in upstream.calls[1:] for item in items)
+    assert fetched == ["a", "b", "c"]
+    assert max(len(items) for items, _ in upstream.calls) <= 2
+
+
+def test_missing_results_are_left_out(batcher):
+    """A key the upstream does not return is simply absent."""
+    assert batcher.get(["a", "missing", "b"]) == ["a", "b"]
+
+
+def test_a_failed_chunk_fails_only_its_callers(upstream):
+    """Callers whose keys were all fetched are unaffected by another chunk."""
+    batcher = MicroBatcher(upstream, key=str, window=0.3, chunk_size=1, workers=4)
+    results = behind_a_fetch(batcher, upstream, (["a"],), (["b", "broken"],))
+    assert results[0] == ["a"]
+    assert isinstance(results[1], RuntimeError)
+    batcher.close()
+
+
+def test_a_failed_flush_fails_every_caller(batcher, upstream):
+    """An error outside any chunk still reaches every caller of the batch."""
+    results = behind_a_fetch(batcher, upstream, (["a"],), (["garbled"],))
+    assert all(isinstance(r, TypeError) for r in results)
+
+
+def test_each_caller_keeps_its_own_deadline(batcher, upstream):
+    """A caller stops waiting at its deadline; the fetch runs for the latest."""
+    with futures.ThreadPoolExecutor(max_workers=2) as pool:
+        held = pool.submit(batcher.get, ["hold"])
+        while not upstream.calls:
+            time.sleep(0.01)
+        patient = pool.submit(batcher.get, ["hold", "b"], time.monotonic() + 5)
+        started = time.monotonic()
+        with pytest.raises(TimeoutError):
+            batcher.get(["a"], started + 0.5)
+        assert time.monotonic() - started < 1.5
+        upstream.release.set()
+        assert patient.result(timeout=5) == ["hold", "b"]
+        held.result(timeout=5)
+    _, deadline = upstream.calls[-1]
+    assert deadline == pytest.approx(started + 5, abs=0.5)
@@ -0,0 +1,211 @@
+"""
+provider.tests.test_cache -.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent import futures
+
+import cache
+import pytest
+from cache import SingleFlight, TTLCache, coalesced
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(mocker):
+    """A frozen time.monotonic() that the test advances by hand."""
+    now = [1000.0]
+    mocker.patch.object(cache.time, "monotonic", side_effect=lambda: now[0])
+    return now
+
+
+class Loader:
+    """A load function counting its calls; returns the call number."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self) -> int:
+        self.calls += 1
+        return self.calls
+
+
+def test_hit_within_ttl_then_expiry(clock):
+    """A key is loaded once per TTL."""
+    responses = TTLCache({"GetMargin": 2.0})
+    load = Loader()
+    assert responses.call("GetMargin", b"k", load) == 1
+    clock[0] += 1.9
+    assert responses.call("GetMargin", b"k", load) == 1
+    clock[0] += 0.2
+    assert responses.call("GetMargin", b"k", load) == 2
+
+
+@pytest.mark.usefixtures("clock")
+def test_keys_and_untimed_methods():
+    """Keys are cached apart; a method without a TTL always loads."""
+    responses = TTLCache({"GetMargin": 2.0})
+    load = Loader()
+    assert responses.call("GetMargin", b"a", load) == 1
+    assert responses.call("GetMargin", b"b", load) == 2
+    assert responses.call("ListTrades", b"a", load) == 3
+    assert responses.call("ListTrades", b"a", load) == 4
+
+
+@pytest.mark.usefixtures("clock")
+def test_invalidate_drops_only_named_methods():
+    """invalidate() forces a reload of the named methods only."""
+    responses = TTLCache({"GetMargin": 2.0, "GetAccountBalance": 2.0})
+    margin, balance = Loader(), Loader()
+    responses.call("GetMargin", b"", margin)
+    responses.call("GetAccountBalance", b"", balance)
+    responses.invalidate("GetMargin")
+    assert responses.call("GetMargin", b"", margin) == 2
+    assert responses.call("GetAccountBalance", b"", balance) == 1
+
+
+@pytest.mark.usefixtures("clock")
+def test_load_in_flight_during_invalidate_is_not_stored():
+    """A value loaded before an invalidation reaches its caller but not the cache."""
+    responses = TTLCache({"GetMargin": 2.0})
+
+    def stale_load():
+        responses.invalidate("GetMargin")
+        return "stale"
+
+    assert responses.call("GetMargin", b"", stale_load) == "stale"
+    assert responses.call("GetMargin", b"", lambda: "fresh") == "fresh"
+    assert responses.call("GetMargin", b"", lambda: "later") == "fresh"
+
+
+@pytest.mark.usefixtures("clock")
+def test_acall_shares_the_cache():
+    """acall() reads and fills the same entries as call()."""
+    responses = TTLCache({"GetMargin": 2.0})
+
+    async def load():
+        return "async"
+
+    assert asyncio.run(responses.acall("GetMargin", b"", load)) == "async"
+    assert responses.call("GetMargin", b"", lambda: "sync") == "async"
+
+
+def run_concurrently(call, count: int, started: threading.Event, release: threading.Event):
+    """Start count calls, wait until the first is in its load, then release it."""
+    with futures.ThreadPoolExecutor(max_workers=count) as pool:
+        pending = [pool.submit(call) for _ in range(count)]
+        assert started.wait(5)
+        # Give the other callers time to join the flight before it lands.
+        time.sleep(0.1)
+        release.set()
+        return [f.exception() or f.result() for f in pending]
+
+
+def test_concurrent_calls_share_one_load():
+    """Callers arriving while a load is in flight get its result."""
+    flights = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    loads = []
+
+    def load():
+        loads.append(1)
+        started.set()
+        release.wait(5)
+        return "value"
+
+    results = run_concurrently(
+        lambda: flights.call("GetMargin", b"", load), 3, started, release
+    )
+    assert results == ["value"] * 3
+    assert len(loads) == 1
+    assert flights.stats() == {"GetMargin": (3, 2)}
+
+
+def test_exception_is_shared_and_flight_lands():
+    """Every waiter gets the leader's exception; the next call loads afresh."""
+    flights = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def load():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("down")
+
+    results = run_concurrently(
+        lambda: flights.call("GetMargin", b"", load), 3, started, release
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flights.call("GetMargin", b"", lambda: "back") == "back"
+
+
+def test_cancelled_async_waiter_leaves_the_flight_running():
+    """Cancelling one waiting coroutine does not cancel the shared load."""
+    flights = SingleFlight()
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            return "value"
+
+        leader = asyncio.ensure_future(flights.acall("GetMargin", b"", load))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(flights.acall("GetMargin", b"", load))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        return await leader, waiter.cancelled()
+
+    assert asyncio.run(scenario()) == ("value", True)
+
+
+class AbortingContext:
+    """A servicer context recording the abort it receives."""
+
+    def __init__(self):
+        self.aborted = None
+
+    def abort(self, code, details):
+        """Record and raise, as grpc does."""
+        self.aborted = (code, details)
+        raise RuntimeError("aborted")
+
+
+class Request:
+    """A request message with a fixed serialization."""
+
+    def SerializeToString(self, deterministic: bool = False) -> bytes:  # pylint: disable=invalid-name,unused-argument
+        """The coalescing key."""
+        return b"request"
+
+
+def test_coalesced_replays_the_abort_on_every_caller():
+    """A leader's abort is re-raised on each waiting caller's own context."""
+    started, release = threading.Event(), threading.Event()
+
+    class Service:
+        """A servicer whose handler aborts after a slow upstream call."""
+
+        singleflight = SingleFlight()
+
+        @coalesced
+        def GetMargin(self, request, context):  # pylint: disable=invalid-name,unused-argument
+            """Abort with NOT_FOUND once released."""
+            started.set()
+            release.wait(5)
+            context.abort("NOT_FOUND", "no account")
+
+    service, contexts = Service(), [AbortingContext() for _ in range(3)]
+    calls = iter(contexts)
+    lock = threading.Lock()
+
+    def call():
+        with lock:
+            context = next(calls)
+        return service.GetMargin(Request(), context)
+
+    results = run_concurrently(call, 3, started, release)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert [c.aborted for c in contexts] == [("NOT_FOUND", "no account")] * 3
@@ -0,0 +1,101 @@
+"""
+provider.tests.test_column_store -.
+"""
+
+import os
+import threading
+from types import SimpleNamespace
+
+import pytest
+from column_store import KBAR_COLUMNS, ColumnStore
+
+
+def kbars(rows: int, scale: float = 1.0) -> SimpleNamespace:
+    """Kbar columns with rows bars."""
+    return SimpleNamespace(
+        ts=[60_000_000_000 * i for i in range(rows)],
+        Open=[scale * i for i in range(rows)],
+        High=[scale * i + 1 for i in range(rows)],
+        Low=[scale * i - 1 for i in range(rows)],
+        Close=[scale * i + 0.5 for i in range(rows)],
+        Volume=list(range(rows)),
+        Amount=[scale * i * 10 for i in range(rows)],
+    )
+
+
+@pytest.fixture(name="store")
+def fixture_store(tmp_path) -> ColumnStore:
+    """A kbar store under a temporary directory."""
+    return ColumnStore(str(tmp_path), KBAR_COLUMNS, ".kbars")
+
+
+def test_round_trip(store):
+    """Stored columns read back equal, and only the stored key is present."""
+    source = kbars(100)
+    assert store.put("2330", "2026-10-16", source) > 0
+    assert ("2330", "2026-10-16") in store
+    assert ("2330", "2026-10-15") not in store
+    stored = store.get("2330", "2026-10-16")
+    for name, _ in KBAR_COLUMNS:
+        assert list(getattr(stored, name)) == getattr(source, name)
+    assert store.get("2330", "2026-10-15") is None
+
+
+def test_get_inflates_only_named_columns(store):
+    """A reader naming columns gets only those."""
+    store.put("2330", "2026-10-16", kbars(10))
+    stored = store.get("2330", "2026-10-16", ("ts", "Close"))
+    assert sorted(vars(stored)) == ["Close", "ts"]
+    assert list(stored.Close) == kbars(10).Close
+
+
+def test_empty_columns_round_trip(store):
+    """A day without rows is stored and read back as empty columns."""
+    store.put("2330", "2026-10-16", kbars(0))
+    assert not store.get("2330", "2026-10-16").ts
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        lambda data: data[: len(data) // 2],
+        lambda data: b"NOTCOLS!" + data[8:],
+        lambda data: data[:-8] + b"\0" * 8,
+        lambda data: b"",
+    ],
+    ids=["truncated", "magic", "garbled", "empty"],
+)
+def test_corrupt_file_reads_as_missing(store, damage):
+    """A damaged file is treated as not stored instead of failing the read."""
+    store.put("2330", "2026-10-16", kbars(1_000))
+    path = store.path("2330", "2026-10-16")
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(damage(data))
+    assert store.get("2330", "2026-10-16") is None
+
+
+def test_concurrent_puts_of_one_key(store):
+    """Writers of the same key never interleave; the file is one of theirs."""
+    sources = [kbars(5_000, scale) for scale in range(1, 9)]
+    threads = [
+        threading.Thread(target=store.put, args=("2330", "2026-10-16", source))
+        for source in sources
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stored = store.get("2330", "2026-10-16")
+    assert list(stored.Open) in [source.Open for source in sources]
+    assert os.listdir(os.path.dirname(store.path("2330", "2026-10-16"))) == [
+        "2026-10-16.kbars"
+    ]
+
+
+@pytest.mark.parametrize("code", ["../2330", ".hidden", f"a{os.sep}b"])
+def test_rejects_keys_outside_the_root(store, code):
+    """Keys cannot name paths outside the store."""
+    with pytest.raises(ValueError, match="invalid store key"):
+        store.path(code, "2026-10-16")
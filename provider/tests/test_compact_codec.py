@@ -0,0 +1,62 @@
+"""
+provider.tests.test_compact_codec -.
+"""
+
+from itertools import accumulate
+from typing import Any, Dict, List
+
+import compact_codec
+
+
+def decode(fields: Dict[str, Any], names: List[str]) -> Dict[str, List[float]]:
+    """Invert compact_codec.encode as a client would."""
+    columns: Dict[str, List[float]] = {
+        "ts": [d * fields["ts_unit"] for d in accumulate(fields["ts_delta"])]
+    }
+    grid = fields.get("price_grid")
+    for name in names:
+        if grid is None:
+            columns[name] = list(fields[name])
+            continue
+        columns[name] = [
+            (grid.base + steps * grid.unit) / 10**grid.decimals
+            for steps in accumulate(fields[f"{name}_delta"])
+        ]
+    return columns
+
+
+def test_round_trip():
+    """Timestamps and prices on a tick grid decode back exactly."""
+    ts = [1_700_000_000_000_000_000 + n * 250_000_000 for n in (0, 1, 2, 6, 7)]
+    prices = {
+        "close": [585.0, 586.0, 585.5, 590.0, 584.0],
+        "high": [586.0, 586.5, 586.0, 591.0, 585.0],
+    }
+    fields = compact_codec.encode(ts, prices)
+    assert fields["ts_unit"] == 250_000_000
+    assert fields["price_grid"].decimals == 1
+    assert fields["price_grid"].unit == 5
+    assert decode(fields, list(prices)) == {"ts": ts, **prices}
+
+
+def test_round_trip_without_grid():
+    """Prices finer than MAX_DECIMALS are passed through unchanged."""
+    ts = [10, 20, 30]
+    prices = {"close": [1 / 3, 2 / 3, 1.0]}
+    fields = compact_codec.encode(ts, prices)
+    assert "price_grid" not in fields
+    assert decode(fields, ["close"]) == {"ts": ts, **prices}
+
+
+def test_price_grid():
+    """The coarsest grid holding every price is found."""
+    assert compact_codec.price_grid([100, 102, 110]) == (0, 100, 2)
+    assert compact_codec.price_grid([0.05, 0.15]) == (2, 5, 10)
+    assert compact_codec.price_grid([]) == (0, 0, 1)
+    assert compact_codec.price_grid([1 / 3]) is None
+
+
+def test_delta_encode():
+    """Deltas start from zero."""
+    assert compact_codec.delta_encode([5, 7, 6]) == [5, 2, -1]
+    assert compact_codec.delta_encode([]) == []
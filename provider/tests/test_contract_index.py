@@ -0,0 +1,175 @@
+"""
+provider.tests.test_contract_index -.
+"""
+
+import pytest
+from conftest import contract_set
+from contract_index import ContractIndex
+from shioaji.constant import Exchange, OptionRight
+from shioaji.contracts import FetchStatus, Future, Index, Option, Stock
+
+TSMC = Stock(
+    exchange=Exchange.TSE, code="2330", symbol="TSE2330", category="24", name="台積電"
+)
+TXF = Future(code="TXFK6", symbol="TXF202611", category="TXF", delivery_month="202611")
+TXF_NEXT = Future(
+    code="TXFL6", symbol="TXF202612", category="TXF", delivery_month="202612"
+)
+CDF = Future(
+    code="CDFK6",
+    symbol="CDF202611",
+    category="CDF",
+    delivery_month="202611",
+    underlying_code="2330",
+)
+TSE = Index(exchange=Exchange.TSE, code="001", symbol="TSE001")
+CONTRACTS = (TSMC, TXF, TXF_NEXT, CDF, TSE)
+
+
+@pytest.fixture(name="index")
+def fixture_index() -> ContractIndex:
+    """An index over CONTRACTS converting each contract to its code."""
+    index = ContractIndex(convert=lambda contract: f"pb:{contract.code}")
+    index.rebuild(contract_set(*CONTRACTS))
+    return index
+
+
+def test_lookup_by_code_and_symbol(index):
+    """Codes and symbols resolve across product groups."""
+    assert len(index) == 5
+    assert index.get("TXFK6") is TXF
+    assert index.get("001") is TSE
+    assert index.by_symbol("TSE2330") is TSMC
+    assert index.get("TSE2330") is None
+    assert index.by_symbol("2330") is None
+
+
+def test_first_group_wins_a_code_clash():
+    """A code listed in two groups resolves to the higher-priority group."""
+    clash = Index(exchange=Exchange.TSE, code="2330", symbol="IDX2330")
+    index = ContractIndex()
+    index.rebuild(contract_set(clash, TSMC))
+    assert index.get("2330") is TSMC
+
+
+def test_find_by_secondary_fields(index):
+    """Each filter uses its secondary index; several filters intersect."""
+    assert index.find(category="TXF") == [TXF, TXF_NEXT]
+    assert index.find(delivery_month="202611") == [TXF, CDF]
+    assert index.find(underlying_code="2330") == [CDF]
+    assert index.find(category="TXF", delivery_month="202612") == [TXF_NEXT]
+    assert index.find(symbol="TXF202611", category="CDF") == []
+    assert index.find(category="missing") == []
+    with pytest.raises(ValueError, match="filter"):
+        index.find()
+
+
+def test_to_pb_is_memoized_until_rebuild(index):
+    """A contract is converted once per rebuild."""
+    first = index.to_pb(TXF)
+    assert first == "pb:TXFK6"
+    assert index.to_pb(TXF) is first
+    index.rebuild(contract_set(*CONTRACTS))
+    assert index.to_pb(TXF) is not first
+
+
+def test_sync_skips_an_unchanged_complete_set(index):
+    """Syncing with the contract set already indexed does not rebuild."""
+    live = contract_set(*CONTRACTS)
+    assert index.sync(live)
+    converted = index.to_pb(TSMC)
+    assert not index.sync(live)
+    assert index.to_pb(TSMC) is converted
+
+
+def test_sync_picks_up_groups_while_loading():
+    """A loading set is re-indexed on every sync until it is fetched."""
+    index = ContractIndex()
+    live = contract_set(TSMC, status=FetchStatus.Fetching)
+    assert index.sync(live)
+    assert not index.complete
+    live.Futures.append([TXF])
+    live.status = FetchStatus.Fetched
+    assert index.sync(live)
+    assert index.complete
+    assert index.get("TXFK6") is TXF
+
+
+def test_sync_keeps_a_complete_index_over_a_loading_set(index):
+    """A refetch still in progress does not replace a complete index."""
+    index.sync(contract_set(*CONTRACTS))
+    assert not index.sync(contract_set(TSMC, status=FetchStatus.Fetching))
+    assert len(index) == 5
+
+
+def option(strike: float, right: OptionRight, month: str = "202611", **fields):
+    """A TXO option contract."""
+    side = "C" if right == OptionRight.Call else "P"
+    return Option(
+        code=f"TXO{int(strike)}{side}{month[-2:]}",
+        symbol=f"TXO{month}{int(strike)}{side}",
+        category=fields.pop("category", "TXO"),
+        delivery_month=month,
+        strike_price=strike,
+        option_right=right,
+        **fields,
+    )
+
+
+@pytest.fixture(name="chain")
+def fixture_chain() -> ContractIndex:
+    """TXO strikes 22000-22400 in November plus one December strike."""
+    options = [
+        option(strike, right)
+        for strike in (22000, 22100, 22200, 22300, 22400)
+        for right in (OptionRight.Call, OptionRight.Put)
+    ]
+    options.append(option(22200, OptionRight.Call, month="202612"))
+    index = ContractIndex()
+    index.rebuild(contract_set(*options))
+    return index
+
+
+def strikes(rows):
+    """(month, strike) of chain rows."""
+    return [(month, strike) for month, strike, _, _ in rows]
+
+
+def test_chain_rows_by_month_then_strike(chain):
+    """Every listed month, ascending; a missing leg is None."""
+    rows = chain.option_chain("TXO")
+    assert strikes(rows)[:2] == [("202611", 22000.0), ("202611", 22100.0)]
+    assert strikes(rows)[-1] == ("202612", 22200.0)
+    _, _, call, put = rows[-1]
+    assert call.code == "TXO22200C12"
+    assert put is None
+
+
+def test_chain_strike_range(chain):
+    """strike_min and strike_max bound the ladder inclusively."""
+    rows = chain.option_chain("TXO", "202611", strike_min=22100, strike_max=22300)
+    assert [s for _, s in strikes(rows)] == [22100.0, 22200.0, 22300.0]
+
+
+def test_chain_strikes_around_center(chain):
+    """num_strikes on each side of a listed or unlisted center strike."""
+    rows = chain.option_chain("TXO", "202611", center_strike=22200, num_strikes=1)
+    assert [s for _, s in strikes(rows)] == [22100.0, 22200.0, 22300.0]
+    rows = chain.option_chain("TXO", "202611", center_strike=22150, num_strikes=1)
+    assert [s for _, s in strikes(rows)] == [22100.0, 22200.0]
+    rows = chain.option_chain("TXO", "202611", center_strike=22000, num_strikes=2)
+    assert [s for _, s in strikes(rows)] == [22000.0, 22100.0, 22200.0]
+
+
+def test_chain_by_underlying_code():
+    """A stock option chain is also listed under its underlying code."""
+    index = ContractIndex()
+    index.rebuild(
+        contract_set(
+            option(1000, OptionRight.Call, category="CDO", underlying_code="2330"),
+            option(1000, OptionRight.Put, category="CDO", underlying_code="2330"),
+        )
+    )
+    assert strikes(index.option_chain("2330")) == [("202611", 1000.0)]
+    assert index.option_chain("2330") == index.option_chain("CDO")
+    assert not index.option_chain("2317")
@@ -0,0 +1,85 @@
+"""
+provider.tests.test_contract_snapshot -.
+"""
+
+import struct
+import zlib
+
+import contract_snapshot
+import pytest
+import shioaji
+from conftest import contract_set
+from shioaji.constant import DayTrade, Exchange, OptionRight
+from shioaji.contracts import FetchStatus, Future, Option, Stock
+
+CONTRACTS = (
+    Stock(
+        exchange=Exchange.TSE, code="2330", symbol="TSE2330", name="台積電",
+        category="24", unit=1000, limit_up=1100.0, limit_down=900.0,
+        reference=1000.0, day_trade=DayTrade.Yes,
+    ),
+    Future(
+        code="TXFK6", symbol="TXF202611", name="臺股期貨", category="TXF",
+        delivery_month="202611", delivery_date="2026/11/18", multiplier=200,
+    ),
+    Option(
+        code="TXO22000K6", symbol="TXO20261122000C", category="TXO",
+        delivery_month="202611", strike_price=22000, option_right=OptionRight.Call,
+    ),
+)  # fmt: skip
+
+
+@pytest.fixture(name="path")
+def fixture_path(tmp_path) -> str:
+    """A snapshot of CONTRACTS on disk."""
+    path = str(tmp_path / "contracts.snapshot")
+    assert contract_snapshot.save(path, contract_set(*CONTRACTS)) == 3
+    return path
+
+
+def test_round_trip(path):
+    """Loading rebuilds equal shioaji contracts, enums included."""
+    snapshot = contract_snapshot.load(path)
+    assert snapshot is not None
+    assert snapshot.status == FetchStatus.Fetched
+    loaded = [
+        c for group in ("Stocks", "Futures", "Options") for c in getattr(snapshot, group)[0]
+    ]
+    assert loaded == list(CONTRACTS)
+    assert [type(c) for c in loaded] == [Stock, Future, Option]
+    assert loaded[2].option_right is OptionRight.Call
+    assert snapshot.Indexs == ((),)
+
+
+def test_missing_file(tmp_path):
+    """No snapshot yet is not an error."""
+    assert contract_snapshot.load(str(tmp_path / "none")) is None
+
+
+def test_other_shioaji_version_is_ignored(path, monkeypatch):
+    """A snapshot from another Shioaji version is not trusted to match its models."""
+    monkeypatch.setattr(shioaji, "__version__", "0.0.0")
+    assert contract_snapshot.load(path) is None
+
+
+def test_other_format_version_is_ignored(path):
+    """A snapshot written in another format version is ignored."""
+    with open(path, "r+b") as f:
+        f.seek(8)
+        f.write(struct.pack("<H", contract_snapshot.FORMAT_VERSION - 1))
+    assert contract_snapshot.load(path) is None
+
+
+def test_corrupt_payload_raises(path):
+    """A damaged body fails loudly instead of yielding a partial index."""
+    with open(path, "r+b") as f:
+        f.seek(-4, 2)
+        f.write(b"\0\0\0\0")
+    with pytest.raises(zlib.error):
+        contract_snapshot.load(path)
+
+
+def test_save_leaves_no_temp_files(path, tmp_path):
+    """Each save writes a private temp file and renames it over the snapshot."""
+    contract_snapshot.save(path, contract_set(*CONTRACTS[:1]))
+    assert [p.name for p in tmp_path.iterdir()] == ["contracts.snapshot"]
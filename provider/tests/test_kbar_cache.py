@@ -0,0 +1,132 @@
+"""
+provider.tests.test_kbar_cache -.
+"""
+
+from concurrent import futures
+from datetime import date, timedelta
+from types import SimpleNamespace
+from typing import List
+
+import kbar_cache
+import pytest
+from column_store import KBAR_COLUMNS, ColumnStore
+from conftest import ns
+from kbar_cache import KbarCache
+
+FRIDAY = date(2026, 9, 18)
+MONDAY = date(2026, 9, 21)
+
+
+def session_bars(day: date, previous: date) -> List[int]:
+    """First and last bar of a trading day's night and day sessions."""
+    return [
+        ns(f"{previous} 15:01"),
+        ns(f"{previous + timedelta(days=1)} 05:00"),
+        ns(f"{day} 08:46"),
+        ns(f"{day} 13:45"),
+    ]
+
+
+class FakeUpstream:
+    """
+    FakeUpstream -.
+    api.kbars over TAIFEX trading days Monday 2026-09-14 to Monday
+    2026-09-21: each day holds the night session before it.
+    """
+
+    def __init__(self):
+        days = [date(2026, 9, 14) + timedelta(days=n) for n in range(5)] + [MONDAY]
+        previous = [date(2026, 9, 11), *days]
+        self.bars = {day: session_bars(day, prev) for day, prev in zip(days, previous)}
+        self.calls = []
+
+    def __call__(self, contract, start: str, end: str, deadline) -> SimpleNamespace:
+        self.calls.append((start, end))
+        return self.kbars(date.fromisoformat(start), date.fromisoformat(end))
+
+    def kbars(self, start: date, end: date) -> SimpleNamespace:
+        """What api.kbars(start, end) returns."""
+        ts = sorted(
+            t for day, bars in self.bars.items() if start <= day <= end for t in bars
+        )
+        return SimpleNamespace(
+            **{name: ts if name == "ts" else [1] * len(ts) for name, _ in KBAR_COLUMNS}
+        )
+
+
+@pytest.fixture(name="upstream")
+def fixture_upstream() -> FakeUpstream:
+    """A fresh fake upstream."""
+    return FakeUpstream()
+
+
+@pytest.fixture(name="cache")
+def fixture_cache(tmp_path, upstream):
+    """A KbarCache over a temporary store."""
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        yield KbarCache(
+            ColumnStore(str(tmp_path), KBAR_COLUMNS, ".kbars"), upstream, executor
+        )
+
+
+CONTRACT = SimpleNamespace(code="TXFR1")
+
+
+def test_range_matches_upstream(cache, upstream):
+    """A range is exactly api.kbars(start, end), with no trailing night session."""
+    got = cache.get(CONTRACT, date(2026, 9, 15), MONDAY)
+    assert got.ts == upstream.kbars(date(2026, 9, 15), MONDAY).ts
+    assert upstream.calls == [("2026-09-15", "2026-09-21")]
+
+
+def test_weekend_night_session_belongs_to_monday(cache, upstream):
+    """Friday night bars are filed under Monday, not Friday or Saturday."""
+    assert cache.get(CONTRACT, FRIDAY, FRIDAY).ts == upstream.bars[FRIDAY]
+    assert cache.get(CONTRACT, MONDAY, MONDAY).ts == upstream.bars[MONDAY]
+    assert not cache.get(CONTRACT, date(2026, 9, 19), date(2026, 9, 20)).ts
+
+
+def test_only_missing_runs_are_fetched(cache, upstream):
+    """Stored days are read back; each gap is one upstream call."""
+    cache.get(CONTRACT, date(2026, 9, 15), date(2026, 9, 15))
+    cache.get(CONTRACT, FRIDAY, FRIDAY)
+    upstream.calls.clear()
+    got = cache.get(CONTRACT, date(2026, 9, 14), MONDAY)
+    assert got.ts == upstream.kbars(date(2026, 9, 14), MONDAY).ts
+    assert sorted(upstream.calls) == [
+        ("2026-09-14", "2026-09-14"),
+        ("2026-09-16", "2026-09-17"),
+        ("2026-09-19", "2026-09-21"),
+    ]
+    upstream.calls.clear()
+    cache.get(CONTRACT, date(2026, 9, 14), MONDAY)
+    assert upstream.calls == [("2026-09-19", "2026-09-20")]
+
+
+def test_empty_settled_days_are_not_stored(cache, upstream):
+    """A settled day that came back empty is fetched again, not cached as empty."""
+    del upstream.bars[date(2026, 9, 16)]
+    assert not cache.get(CONTRACT, date(2026, 9, 16), date(2026, 9, 16)).ts
+    assert ("TXFR1", "2026-09-16") not in cache.store
+    upstream.bars[date(2026, 9, 16)] = session_bars(
+        date(2026, 9, 16), date(2026, 9, 15)
+    )
+    got = cache.get(CONTRACT, date(2026, 9, 16), date(2026, 9, 16))
+    assert got.ts == upstream.bars[date(2026, 9, 16)]
+    assert upstream.calls == [("2026-09-16", "2026-09-16")] * 2
+
+
+def test_unsettled_days_are_not_stored(cache, upstream):
+    """A trading day is stored only once its day session is over."""
+    tomorrow = date.today() + timedelta(days=1)
+    assert not kbar_cache.is_settled(tomorrow)
+    assert kbar_cache.is_settled(FRIDAY)
+    cache.get(CONTRACT, tomorrow, tomorrow)
+    cache.get(CONTRACT, tomorrow, tomorrow)
+    assert len(upstream.calls) == 2
+
+
+def test_trailing_night_session_goes_to_next_weekday():
+    """Without a following day session, night bars go to the next weekday."""
+    days = kbar_cache.trading_days(session_bars(MONDAY, FRIDAY)[:2])
+    assert days == [(MONDAY - date(1970, 1, 1)).days] * 2
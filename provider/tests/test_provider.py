@@ -0,0 +1,812 @@
+"""
+provider.tests.test_provider -.
+"""
+
+import threading
+import time
+from concurrent import futures
+from datetime import datetime
+from itertools import accumulate
+from types import SimpleNamespace
+
+import contract_snapshot
+import grpc
+import provider_pb2
+import pytest
+from conftest import contract_set, load_contracts, ns, wait_for
+from kbar_cache import TAIPEI
+from ratelimit import RateLimiter, TokenBucket
+from shioaji.constant import (
+    Action,
+    Exchange,
+    FuturesOCType,
+    FuturesPriceType,
+    OptionRight,
+    OrderState,
+    OrderType,
+    Status,
+    StockPriceType,
+)
+from shioaji.contracts import ComboBase, ComboContract, Future, Option, Stock
+from shioaji.order import ComboOrder, ComboStatus, ComboTrade, Order, OrderStatus, Trade
+
+TSMC = Stock(exchange=Exchange.TSE, code="2330", symbol="TSE2330", name="台積電")
+TXF = Future(code="TXFK6", symbol="TXF202611", category="TXF", delivery_month="202611")
+
+
+def balance(value: float = 1.0) -> SimpleNamespace:
+    """A Shioaji AccountBalance."""
+    return SimpleNamespace(acc_balance=value, date="2026-10-16", errmsg="")
+
+
+def tick(code: str, close: float) -> SimpleNamespace:
+    """A Shioaji TickSTKv1."""
+    return SimpleNamespace(
+        code=code, datetime=datetime(2026, 10, 16, 9, 0), open=close, close=close,
+        high=close, low=close, avg_price=close, volume=1, total_volume=1,
+        amount=close, total_amount=close, tick_type=1, chg_type=2, price_chg=0,
+        pct_chg=0, bid_side_total_vol=0, ask_side_total_vol=0, simtrade=False,
+    )  # fmt: skip
+
+
+def bidask(code: str, bid: float) -> SimpleNamespace:
+    """A Shioaji BidAskSTKv1 with one level a side."""
+    return SimpleNamespace(
+        code=code, datetime=datetime(2026, 10, 16, 9, 0), bid_price=[bid],
+        bid_volume=[1], diff_bid_vol=[0], ask_price=[bid + 5], ask_volume=[1],
+        diff_ask_vol=[0], simtrade=False,
+    )  # fmt: skip
+
+
+def order_msg(seqno: str) -> dict:
+    """A Shioaji order callback message for a new order."""
+    return {
+        "operation": {"op_type": "New", "op_code": "00", "op_msg": ""},
+        "order": {"id": seqno, "seqno": seqno, "action": "Buy", "quantity": 1},
+        "status": {},
+        "contract": {"code": "2330"},
+    }
+
+
+def trade(seqno: str, status: Status = Status.Submitted) -> Trade:
+    """A Shioaji Trade for one lot of TSMC."""
+    return Trade(
+        contract=TSMC,
+        order=Order(
+            action=Action.Buy, price=1000, quantity=1, id=f"id-{seqno}",
+            seqno=seqno, price_type=StockPriceType.LMT, order_type=OrderType.ROD,
+        ),
+        status=OrderStatus(id=f"id-{seqno}", status=status, deals=[]),
+    )  # fmt: skip
+
+
+def pb_trade(seqno: str) -> provider_pb2.Trade:
+    """A Protobuf Trade naming an order by seqno."""
+    return provider_pb2.Trade(order=provider_pb2.Order(seqno=seqno))
+
+
+def test_handler_abort_status_wins(server):
+    """An abort inside a handler's try block keeps its own status in both modes."""
+    with pytest.raises(grpc.RpcError) as error:
+        server.stub.GetDailyQuotes(provider_pb2.GetDailyQuotesRequest(date="bad"))
+    assert error.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+
+
+def test_unexpected_error_is_internal(server):
+    """Upstream failures are reported as INTERNAL."""
+    server.service.client.daily_quotes.side_effect = RuntimeError("down")
+    with pytest.raises(grpc.RpcError) as error:
+        server.stub.GetDailyQuotes(provider_pb2.GetDailyQuotesRequest(date="2026-10-16"))
+    assert error.value.code() == grpc.StatusCode.INTERNAL
+    assert "down" in str(error.value.details())
+
+
+def test_cached_account_query(server):
+    """A repeated account query within its TTL is answered from the cache."""
+    server.service.client.account_balance.return_value = balance(5.0)
+    for _ in range(3):
+        reply = server.stub.GetAccountBalance(provider_pb2.Empty())
+        assert reply.acc_balance == 5.0
+    assert server.service.client.account_balance.call_count == 1
+
+
+@pytest.mark.aio_workers(1)
+def test_deal_invalidates_cached_account_queries(server):
+    """A deal event drops cached account queries, so the next call reloads."""
+    server.service.client.account_balance.return_value = balance(5.0)
+    server.stub.GetAccountBalance(provider_pb2.Empty())
+    server.service._on_order(OrderState.StockDeal, {"seqno": "s1", "code": "2330"})  # pylint: disable=protected-access
+    server.stub.GetAccountBalance(provider_pb2.Empty())
+    assert server.service.client.account_balance.call_count == 2
+
+
+def test_concurrent_calls_share_one_upstream_call(server):
+    """Identical calls in flight together share the first one's result."""
+    release = threading.Event()
+
+    def slow_balance():
+        release.wait(5)
+        return balance(7.0)
+
+    server.service.client.account_balance.side_effect = slow_balance
+    with futures.ThreadPoolExecutor(max_workers=3) as pool:
+        calls = [
+            pool.submit(server.stub.GetAccountBalance, provider_pb2.Empty())
+            for _ in range(3)
+        ]
+        wait_for(
+            lambda: server.service.singleflight.stats().get("GetAccountBalance")
+            == (3, 2)
+        )
+        release.set()
+        assert [c.result().acc_balance for c in calls] == [7.0] * 3
+    assert server.service.client.account_balance.call_count == 1
+    assert server.service.singleflight.stats()["GetAccountBalance"] == (3, 2)
+
+
+def test_shared_call_failure_aborts_every_caller(server):
+    """Callers sharing a failed upstream call all get its INTERNAL status."""
+    release = threading.Event()
+
+    def failing_balance():
+        release.wait(5)
+        raise RuntimeError("down")
+
+    server.service.client.account_balance.side_effect = failing_balance
+    with futures.ThreadPoolExecutor(max_workers=3) as pool:
+        calls = [
+            pool.submit(server.stub.GetAccountBalance, provider_pb2.Empty())
+            for _ in range(3)
+        ]
+        wait_for(
+            lambda: server.service.singleflight.stats().get("GetAccountBalance")
+            == (3, 2)
+        )
+        release.set()
+        for call in calls:
+            with pytest.raises(grpc.RpcError) as error:
+                call.result()
+            assert error.value.code() == grpc.StatusCode.INTERNAL
+    assert server.service.client.account_balance.call_count == 1
+
+
+@pytest.mark.aio_workers(1)
+def test_rate_limit_queue_does_not_hold_a_worker(server):
+    """
+    In aio mode a call queued for a token waits on the event loop, so an
+    unrelated RPC still gets the only executor thread meanwhile.
+    """
+    if server.mode != "aio":
+        pytest.skip("the sync server holds a thread per call by design")
+    server.service.rate_limiter = RateLimiter({"quote": TokenBucket(rate=1, burst=1)})
+    server.service.client.daily_quotes.return_value = SimpleNamespace(
+        Code=[], Open=[], High=[], Low=[], Close=[], Volume=[], Date=[],
+        Transaction=[], Amount=[],
+    )  # fmt: skip
+    server.stub.GetDailyQuotes(provider_pb2.GetDailyQuotesRequest(date="2026-10-15"))
+    with futures.ThreadPoolExecutor(max_workers=1) as pool:
+        queued = pool.submit(
+            server.stub.GetDailyQuotes,
+            provider_pb2.GetDailyQuotesRequest(date="2026-10-16"),
+        )
+        time.sleep(0.2)
+        started = time.monotonic()
+        server.stub.GetSingleflightStats(provider_pb2.Empty())
+        assert time.monotonic() - started < 0.5
+        assert not queued.done()
+        queued.result(timeout=5)
+
+
+def test_rate_limit_rejects_past_the_deadline(server):
+    """A call that would wait past its deadline is rejected at once."""
+    server.service.rate_limiter = RateLimiter({"quote": TokenBucket(rate=0.1, burst=1)})
+    server.service.rate_limiter.reserve("quote")
+    with pytest.raises(grpc.RpcError) as error:
+        server.stub.GetDailyQuotes(
+            provider_pb2.GetDailyQuotesRequest(date="2026-10-16"), timeout=2
+        )
+    assert error.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+
+def test_stream_ticks(server):
+    """A tick stream subscribes upstream once and delivers ticks until cancelled."""
+    load_contracts(server.service, TSMC)
+    hub = server.service.tick_hub
+    stream = server.stub.StreamTicks(
+        provider_pb2.StreamTicksRequest(contract_codes=["2330"])
+    )
+    wait_for(lambda: hub.has_subscribers("2330"))
+    server.service._on_tick(Exchange.TSE, tick("2330", 1000.0))  # pylint: disable=protected-access
+    reply = next(stream)
+    assert (reply.code, reply.close) == ("2330", 1000.0)
+    server.service.client.subscribe.assert_called_once()
+    stream.cancel()
+    wait_for(lambda: not hub.has_subscribers("2330"))
+    server.service.client.unsubscribe.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "codes, status",
+    [([], grpc.StatusCode.INVALID_ARGUMENT), (["0000"], grpc.StatusCode.NOT_FOUND)],
+)
+def test_stream_ticks_rejects_bad_codes(server, codes, status):
+    """A tick stream on no codes or an unknown code fails before subscribing."""
+    load_contracts(server.service, TSMC)
+    stream = server.stub.StreamTicks(
+        provider_pb2.StreamTicksRequest(contract_codes=codes)
+    )
+    with pytest.raises(grpc.RpcError) as error:
+        next(stream)
+    assert error.value.code() == status
+    server.service.client.subscribe.assert_not_called()
+
+
+def test_sync_streams_are_capped(server):
+    """The sync server refuses a stream once every stream slot is taken."""
+    if server.mode != "sync":
+        pytest.skip("aio streams hold no thread")
+    load_contracts(server.service, TSMC)
+    server.service.stream_slots = threading.BoundedSemaphore(1)
+    held = server.stub.StreamTicks(
+        provider_pb2.StreamTicksRequest(contract_codes=["2330"])
+    )
+    wait_for(lambda: server.service.tick_hub.has_subscribers("2330"))
+    with pytest.raises(grpc.RpcError) as error:
+        next(
+            server.stub.StreamTicks(
+                provider_pb2.StreamTicksRequest(contract_codes=["2330"])
+            )
+        )
+    assert error.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+    held.cancel()
+
+
+def test_stream_bidask_conflates(server):
+    """Books arriving within the interval reach the client as the latest one."""
+    load_contracts(server.service, TSMC)
+    service = server.service
+    stream = server.stub.StreamBidAsk(
+        provider_pb2.StreamBidAskRequest(contract_codes=["2330"], interval_ms=500)
+    )
+    wait_for(lambda: service.bidask_hub.has_subscribers("2330"))
+    service._on_bidask(Exchange.TSE, bidask("2330", 1000.0))  # pylint: disable=protected-access
+    assert next(stream).bid_price == [1000.0]
+    for bid in (1001.0, 1002.0, 1003.0):
+        service._on_bidask(Exchange.TSE, bidask("2330", bid))  # pylint: disable=protected-access
+    assert next(stream).bid_price == [1003.0]
+    stream.cancel()
+
+
+def test_stream_order_events_replays_then_goes_live(server):
+    """A replaying stream gets retained events in order, then live ones."""
+    service = server.service
+    for seqno in ("a", "b"):
+        service._on_order(OrderState.StockOrder, order_msg(seqno))  # pylint: disable=protected-access
+    stream = server.stub.StreamOrderEvents(
+        provider_pb2.StreamOrderEventsRequest(replay=True)
+    )
+    replayed = [next(stream), next(stream)]
+    assert [(e.seq, e.order.seqno) for e in replayed] == [(1, "a"), (2, "b")]
+    assert {e.epoch for e in replayed} == {service.order_events.epoch}
+    service._on_order(OrderState.StockOrder, order_msg("c"))  # pylint: disable=protected-access
+    assert next(stream).seq == 3
+    stream.cancel()
+
+
+def test_stream_order_events_rejects_another_epoch(server):
+    """Resuming with a since_seq from an earlier provider fails with OUT_OF_RANGE."""
+    server.service._on_order(OrderState.StockOrder, order_msg("a"))  # pylint: disable=protected-access
+    stream = server.stub.StreamOrderEvents(
+        provider_pb2.StreamOrderEventsRequest(since_seq=1, epoch="previous")
+    )
+    with pytest.raises(grpc.RpcError) as error:
+        next(stream)
+    assert error.value.code() == grpc.StatusCode.OUT_OF_RANGE
+
+
+def test_cancel_order_finds_trades_placed_elsewhere(server):
+    """A trade the index has not seen is found after one reload of the client."""
+    placed = trade("s1")
+    server.service.client.list_trades.return_value = [placed]
+    server.service.client.cancel_order.side_effect = lambda t: t
+    reply = server.stub.CancelOrder(provider_pb2.CancelOrderRequest(trade=pb_trade("s1")))
+    assert reply.order.seqno == "s1"
+    server.service.client.cancel_order.assert_called_once_with(placed)
+    with pytest.raises(grpc.RpcError) as error:
+        server.stub.CancelOrder(provider_pb2.CancelOrderRequest(trade=pb_trade("s9")))
+    assert error.value.code() == grpc.StatusCode.NOT_FOUND
+
+
+def test_stream_ticks_by_symbol(server):
+    """A stream named by symbol receives the ticks of the contract's code."""
+    load_contracts(server.service, TSMC)
+    stream = server.stub.StreamTicks(
+        provider_pb2.StreamTicksRequest(contract_codes=["TSE2330"])
+    )
+    wait_for(lambda: server.service.tick_hub.has_subscribers("2330"))
+    server.service._on_tick(Exchange.TSE, tick("2330", 1000.0))  # pylint: disable=protected-access
+    assert next(stream).code == "2330"
+    stream.cancel()
+
+
+def test_find_contracts(server):
+    """FindContracts filters the index; a request without filters is invalid."""
+    load_contracts(server.service, TSMC, TXF)
+    reply = server.stub.FindContracts(
+        provider_pb2.FindContractsRequest(category="TXF", delivery_month="202611")
+    )
+    assert [c.code for c in reply.contracts] == ["TXFK6"]
+    reply = server.stub.FindContracts(
+        provider_pb2.FindContractsRequest(symbol="TSE2330")
+    )
+    assert [c.name for c in reply.contracts] == ["台積電"]
+    with pytest.raises(grpc.RpcError) as error:
+        server.stub.FindContracts(provider_pb2.FindContractsRequest())
+    assert error.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+
+
+def test_get_option_chain(server):
+    """GetOptionChain returns converted call/put rows of the indexed options."""
+    legs = [
+        Option(
+            code=f"TXO22000{side}K6", symbol=f"TXO20261122000{side}", category="TXO",
+            delivery_month="202611", strike_price=22000, option_right=right,
+        )  # fmt: skip
+        for side, right in (("C", OptionRight.Call), ("P", OptionRight.Put))
+    ]
+    load_contracts(server.service, TSMC, *legs)
+    reply = server.stub.GetOptionChain(
+        provider_pb2.GetOptionChainRequest(underlying="TXO")
+    )
+    assert [(r.strike_price, r.call.code, r.put.code) for r in reply.strikes] == [
+        (22000.0, "TXO22000CK6", "TXO22000PK6")
+    ]
+    reply = server.stub.GetOptionChain(
+        provider_pb2.GetOptionChainRequest(underlying="TEO")
+    )
+    assert not reply.strikes
+
+
+def test_contracts_served_from_snapshot_before_login(server, tmp_path):
+    """A saved snapshot answers contract queries before any download."""
+    service = server.service
+    service.snapshot_path = str(tmp_path / "contracts.snapshot")
+    contract_snapshot.save(service.snapshot_path, contract_set(TSMC, TXF))
+    service._load_contract_snapshot()  # pylint: disable=protected-access
+    reply = server.stub.FindContracts(provider_pb2.FindContractsRequest(category="TXF"))
+    assert [c.symbol for c in reply.contracts] == ["TXF202611"]
+
+
+def test_list_trades_delta(server):
+    """Only trades changed since the watermark come back; another epoch gets all."""
+    service = server.service
+    first, second = trade("s1"), trade("s2")
+    service.client.list_trades.return_value = [first, second]
+    reply = server.stub.ListTradesDelta(provider_pb2.ListTradesDeltaRequest())
+    assert [t.order.seqno for t in reply.trades] == ["s1", "s2"]
+    assert reply.epoch == service.trades.epoch
+    watermark = provider_pb2.ListTradesDeltaRequest(
+        since_version=reply.version, epoch=reply.epoch
+    )
+    assert not server.stub.ListTradesDelta(watermark).trades
+    second.status.deal_quantity = 1
+    reply = server.stub.ListTradesDelta(watermark)
+    assert [t.order.seqno for t in reply.trades] == ["s2"]
+    stale = provider_pb2.ListTradesDeltaRequest(since_version=1, epoch="previous")
+    assert len(server.stub.ListTradesDelta(stale).trades) == 2
+
+
+def combo_trade(seqno: str) -> ComboTrade:
+    """A Shioaji ComboTrade buying one TXO call."""
+    call = Option(
+        code="TXO22000CK6", symbol="TXO20261122000C", category="TXO",
+        delivery_month="202611", strike_price=22000, option_right=OptionRight.Call,
+    )  # fmt: skip
+    return ComboTrade(
+        contract=ComboContract(legs=[ComboBase(action=Action.Buy, **call.model_dump())]),
+        order=ComboOrder(
+            action=Action.Buy, price=10, quantity=1, id=f"id-{seqno}", seqno=seqno,
+            price_type=FuturesPriceType.LMT, order_type=OrderType.IOC,
+            octype=FuturesOCType.Auto,
+        ),
+        status=ComboStatus(id=f"id-{seqno}", status=Status.Submitted, deals={}),
+    )  # fmt: skip
+
+
+def test_list_combo_trades_delta(server):
+    """Combination trades follow their own watermark."""
+    service = server.service
+    first, second = combo_trade("c1"), combo_trade("c2")
+    service.client.list_combotrades.return_value = [first, second]
+    reply = server.stub.ListComboTradesDelta(provider_pb2.ListTradesDeltaRequest())
+    assert [t.order.seqno for t in reply.combo_trades] == ["c1", "c2"]
+    assert reply.epoch == service.combo_trades.epoch
+    watermark = provider_pb2.ListTradesDeltaRequest(
+        since_version=reply.version, epoch=reply.epoch
+    )
+    assert not server.stub.ListComboTradesDelta(watermark).combo_trades
+    first.status.status = Status.Filled
+    reply = server.stub.ListComboTradesDelta(watermark)
+    assert [t.order.seqno for t in reply.combo_trades] == ["c1"]
+    assert reply.combo_trades[0].contract.legs[0].code == "TXO22000CK6"
+
+
+def place_request(code: str) -> provider_pb2.PlaceOrderRequest:
+    """A request to buy one lot of a stock."""
+    return provider_pb2.PlaceOrderRequest(
+        contract=provider_pb2.Contract(code=code),
+        order=provider_pb2.Order(action=provider_pb2.ACTION_BUY, price=1000, quantity=1),
+    )
+
+
+def test_place_orders_reports_each_leg(server):
+    """Every leg is placed; a rejected leg carries its error in request order."""
+    load_contracts(server.service, TSMC)
+    placed = iter([trade("s1"), RuntimeError("rejected"), trade("s3")])
+
+    def place_order(contract, order):  # pylint: disable=unused-argument
+        outcome = next(placed)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    server.service.client.place_order.side_effect = place_order
+    reply = server.stub.PlaceOrders(
+        provider_pb2.PlaceOrdersRequest(
+            orders=[place_request("2330")] * 3, parallelism=1
+        )
+    )
+    assert [(r.trade.order.seqno, r.error) for r in reply.results] == [
+        ("s1", ""),
+        ("", "rejected"),
+        ("s3", ""),
+    ]
+    assert server.service.trades.find(seqno="s3") is not None
+
+
+def test_place_orders_rejects_the_basket_up_front(server):
+    """A basket with an unknown contract is refused before any order is sent."""
+    load_contracts(server.service, TSMC)
+    with pytest.raises(grpc.RpcError) as error:
+        server.stub.PlaceOrders(
+            provider_pb2.PlaceOrdersRequest(
+                orders=[place_request("2330"), place_request("0000")]
+            )
+        )
+    assert error.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+    assert "order 1" in str(error.value.details())
+    server.service.client.place_order.assert_not_called()
+
+
+def test_cancel_orders_by_filter(server):
+    """Only open trades matching the filter are cancelled, each reported once."""
+    service = server.service
+    bought, filled, sold = trade("s1"), trade("s2", Status.Filled), trade("s3")
+    sold.order.action = Action.Sell
+    service.client.list_trades.return_value = [bought, filled, sold]
+
+    def cancel_order(target):
+        if target is sold:
+            raise RuntimeError("too late")
+        return target
+
+    service.client.cancel_order.side_effect = cancel_order
+    results = list(server.stub.CancelOrders(provider_pb2.CancelOrdersRequest(all=True)))
+    assert sorted((r.trade.order.seqno, r.error) for r in results) == [
+        ("s1", ""),
+        ("s3", "too late"),
+    ]
+    service.client.cancel_order.reset_mock()
+    results = list(
+        server.stub.CancelOrders(
+            provider_pb2.CancelOrdersRequest(action=provider_pb2.ACTION_BUY)
+        )
+    )
+    assert [r.trade.order.seqno for r in results] == ["s1"]
+    service.client.cancel_order.assert_called_once_with(bought)
+
+
+def test_cancel_orders_needs_a_filter(server):
+    """An empty filter is refused rather than cancelling everything."""
+    with pytest.raises(grpc.RpcError) as error:
+        list(server.stub.CancelOrders(provider_pb2.CancelOrdersRequest()))
+    assert error.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+    server.service.client.cancel_order.assert_not_called()
+
+
+def test_settlements_alias_takes_one_token(server):
+    """ListSettlements goes through GetSettlements' limit only once."""
+    server.service.rate_limiter = RateLimiter({"account": TokenBucket(rate=0.1, burst=1)})
+    server.service.client.settlements.return_value = []
+    server.stub.ListSettlements(provider_pb2.GetSettlementsRequest(), timeout=2)
+    server.service.client.settlements.assert_called_once()
+
+
+def snapshot(code: str, close: float) -> SimpleNamespace:
+    """A Shioaji snapshot."""
+    return SimpleNamespace(
+        ts=0, code=code, exchange="TSE", open=close, high=close, low=close,
+        close=close, change_price=0.0, change_rate=0.0, average_price=close,
+        volume=1, total_volume=1, amount=1, total_amount=1, buy_price=close,
+        buy_volume=1.0, sell_price=close, sell_volume=1, tick_type="Buy",
+        change_type="Up", yesterday_volume=1.0, volume_ratio=1.0,
+    )  # fmt: skip
+
+
+def test_get_snapshots(server):
+    """Snapshots come back for the requested codes from one upstream call."""
+    load_contracts(server.service, TSMC, TXF)
+    server.service.client.snapshots.side_effect = lambda contracts: [
+        snapshot(c.code, 100.0) for c in contracts
+    ]
+    reply = server.stub.GetSnapshots(
+        provider_pb2.GetSnapshotsRequest(contract_codes=["TXFK6", "2330"])
+    )
+    assert [s.code for s in reply.snapshots] == ["TXFK6", "2330"]
+    server.service.client.snapshots.assert_called_once()
+    with pytest.raises(grpc.RpcError) as error:
+        server.stub.GetSnapshots(
+            provider_pb2.GetSnapshotsRequest(contract_codes=["0000"])
+        )
+    assert error.value.code() == grpc.StatusCode.NOT_FOUND
+
+
+def ticks(closes) -> SimpleNamespace:
+    """Shioaji ticks, one per close, a second apart on a settled day."""
+    rows = range(len(closes))
+    return SimpleNamespace(
+        ts=[ns("2026-10-16 09:00") + i * 10**9 for i in rows],
+        close=list(closes),
+        volume=[1 for _ in rows],
+        bid_price=[c - 1 for c in closes],
+        bid_volume=[2 for _ in rows],
+        ask_price=[c + 1 for c in closes],
+        ask_volume=[3 for _ in rows],
+        tick_type=[1 for _ in rows],
+    )
+
+
+def test_stream_historical_ticks_in_chunks(server, monkeypatch):
+    """
+    A day of ticks arrives as chunks of at most chunk_size rows, in order,
+    each converted on a worker thread rather than the aio event loop.
+    """
+    load_contracts(server.service, TSMC)
+    converted_on = []
+    convert = server.service._to_pb_ticks  # pylint: disable=protected-access
+
+    def record(*args):
+        converted_on.append(threading.current_thread().name)
+        return convert(*args)
+
+    monkeypatch.setattr(server.service, "_to_pb_ticks", record)
+    server.service.client.ticks.return_value = ticks([100.0, 101.0, 102.0, 103.0, 104.0])
+    chunks = list(
+        server.stub.StreamHistoricalTicks(
+            provider_pb2.StreamHistoricalTicksRequest(
+                query=provider_pb2.GetTicksRequest(
+                    contract_code="2330", date="2026-10-16"
+                ),
+                chunk_size=2,
+            ),
+            timeout=5,
+        )
+    )
+    assert [len(c.ts) for c in chunks] == [2, 2, 1]
+    assert [p for c in chunks for p in c.close] == [100.0, 101.0, 102.0, 103.0, 104.0]
+    assert all(name.startswith("ThreadPoolExecutor") for name in converted_on)
+    with pytest.raises(grpc.RpcError) as error:
+        list(
+            server.stub.StreamHistoricalTicks(
+                provider_pb2.StreamHistoricalTicksRequest(
+                    query=provider_pb2.GetTicksRequest(
+                        contract_code="0000", date="2026-10-16"
+                    )
+                ),
+                timeout=5,
+            )
+        )
+    assert error.value.code() == grpc.StatusCode.NOT_FOUND
+
+
+def test_stream_historical_kbars_in_chunks(server):
+    """A kbar range arrives as chunks of at most chunk_size bars, in order."""
+    load_contracts(server.service, TSMC)
+    ts = [ns(f"2026-10-16 09:0{m}") for m in range(5)]
+    server.service.client.kbars.return_value = SimpleNamespace(
+        ts=ts, Open=[1.0] * 5, High=[2.0] * 5, Low=[0.5] * 5,
+        Close=[1.5] * 5, Volume=[10] * 5, Amount=[15.0] * 5,
+    )  # fmt: skip
+    chunks = list(
+        server.stub.StreamHistoricalKbars(
+            provider_pb2.StreamHistoricalKbarsRequest(
+                query=provider_pb2.GetKbarsRequest(
+                    contract_code="2330", start_date="2026-10-16", end_date="2026-10-16"
+                ),
+                chunk_size=3,
+            ),
+            timeout=5,
+        )
+    )
+    assert [len(c.ts) for c in chunks] == [3, 2]
+    assert [t for c in chunks for t in c.ts] == ts
+
+
+def test_get_ticks_of_a_past_date_are_stored(server):
+    """Ticks of a completed day are fetched once and then served from the store."""
+    load_contracts(server.service, TSMC)
+    server.service.client.ticks.return_value = ticks([100.0, 100.5])
+    request = provider_pb2.GetTicksRequest(contract_code="2330", date="2026-10-16")
+    for _ in range(2):
+        reply = server.stub.GetTicks(request, timeout=5)
+        assert list(reply.close) == [100.0, 100.5]
+        assert list(reply.ts) == ticks([0, 0]).ts
+    server.service.client.ticks.assert_called_once()
+    today = datetime.now(TAIPEI).strftime("%Y-%m-%d")
+    for _ in range(2):
+        server.stub.GetTicks(
+            provider_pb2.GetTicksRequest(contract_code="2330", date=today), timeout=5
+        )
+    assert server.service.client.ticks.call_count == 3
+
+
+def test_get_ticks_compact(server):
+    """A compact Ticks reply carries deltas that decode to the plain columns."""
+    load_contracts(server.service, TSMC)
+    plain = ticks([585.0, 586.0, 585.5])
+    server.service.client.ticks.return_value = plain
+    reply = server.stub.GetTicks(
+        provider_pb2.GetTicksRequest(
+            contract_code="2330", date="2026-10-16", compact=True
+        ),
+        timeout=5,
+    )
+    assert not reply.ts and not reply.close
+    assert [d * reply.ts_unit for d in accumulate(reply.ts_delta)] == plain.ts
+    grid = reply.price_grid
+    assert [
+        (grid.base + n * grid.unit) / 10**grid.decimals
+        for n in accumulate(reply.close_delta)
+    ] == plain.close
+    assert list(reply.volume) == plain.volume
+
+
+def minute_kbars(first: str, count: int) -> SimpleNamespace:
+    """count 1-minute kbars of a settled day, the first ending at first."""
+    start = ns(f"2026-10-16 {first}")
+    rows = range(count)
+    return SimpleNamespace(
+        ts=[start + m * 60 * 10**9 for m in rows],
+        Open=[100.0 + m for m in rows],
+        High=[101.0 + m for m in rows],
+        Low=[99.0 + m for m in rows],
+        Close=[100.5 + m for m in rows],
+        Volume=[1 for _ in rows],
+        Amount=[100.0 for _ in rows],
+    )
+
+
+def test_get_kbars_resampled(server):
+    """resample_minutes buckets 1-minute kbars from the session open."""
+    load_contracts(server.service, TSMC)
+    server.service.client.kbars.return_value = minute_kbars("09:01", 10)
+    reply = server.stub.GetKbars(
+        provider_pb2.GetKbarsRequest(
+            contract_code="2330",
+            start_date="2026-10-16",
+            end_date="2026-10-16",
+            resample_minutes=5,
+        ),
+        timeout=5,
+    )
+    assert list(reply.ts) == [ns("2026-10-16 09:05"), ns("2026-10-16 09:10")]
+    assert list(reply.open) == [100.0, 105.0]
+    assert list(reply.high) == [105.0, 110.0]
+    assert list(reply.close) == [104.5, 109.5]
+    assert list(reply.volume) == [5, 5]
+
+
+def test_get_tick_bars(server):
+    """Volume bars close with the tick that fills them; bad requests are rejected."""
+    load_contracts(server.service, TSMC)
+    data = ticks([100.0, 101.0, 102.0, 103.0, 104.0])
+    data.volume = [4, 1, 1, 1, 1]
+    server.service.client.ticks.return_value = data
+    request = provider_pb2.GetTickBarsRequest(
+        contract_code="2330",
+        date="2026-10-16",
+        type=provider_pb2.TICK_BAR_TYPE_VOLUME,
+        size=3,
+    )
+    reply = server.stub.GetTickBars(request, timeout=5)
+    assert list(reply.volume) == [4, 3, 1]
+    assert list(reply.open) == [100.0, 101.0, 104.0]
+    assert list(reply.close) == [100.0, 103.0, 104.0]
+    assert list(reply.ts) == [data.ts[0], data.ts[3], data.ts[4]]
+    request.size = 0
+    with pytest.raises(grpc.RpcError) as error:
+        server.stub.GetTickBars(request, timeout=5)
+    assert error.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+
+
+def test_get_tick_analytics(server):
+    """A summary of the ticks in range comes back with its price levels."""
+    load_contracts(server.service, TSMC)
+    data = ticks([100.0, 101.0, 100.0, 102.0])
+    data.volume = [1, 2, 3, 4]
+    data.tick_type = [1, 2, 1, 2]
+    server.service.client.ticks.return_value = data
+    reply = server.stub.GetTickAnalytics(
+        provider_pb2.GetTickAnalyticsRequest(
+            contract_code="2330", date="2026-10-16", end_ts=data.ts[2]
+        ),
+        timeout=5,
+    )
+    assert (reply.ticks, reply.volume) == (3, 6)
+    assert reply.vwap == pytest.approx((100.0 * 4 + 101.0 * 2) / 6)
+    assert (reply.buy_volume, reply.sell_volume) == (4, 2)
+    assert [(level.price, level.volume, level.ticks) for level in reply.levels] == [
+        (100.0, 4, 2),
+        (101.0, 2, 1),
+    ]
+
+
+def test_max_points_downsamples_replies(server):
+    """max_points caps the rows of GetTicks and GetKbars replies."""
+    load_contracts(server.service, TSMC)
+    server.service.client.ticks.return_value = ticks([100.0 + n % 7 for n in range(100)])
+    reply = server.stub.GetTicks(
+        provider_pb2.GetTicksRequest(
+            contract_code="2330", date="2026-10-16", max_points=8
+        ),
+        timeout=5,
+    )
+    assert 0 < len(reply.ts) <= 8
+    assert max(reply.close) == 106.0 and min(reply.close) == 100.0
+    server.service.client.kbars.return_value = minute_kbars("09:01", 10)
+    reply = server.stub.GetKbars(
+        provider_pb2.GetKbarsRequest(
+            contract_code="2330",
+            start_date="2026-10-16",
+            end_date="2026-10-16",
+            max_points=3,
+        ),
+        timeout=5,
+    )
+    assert list(reply.volume) == [4, 4, 2]
+    assert list(reply.high) == [104.0, 108.0, 110.0]
+
+
+def test_get_kbars_batch(server):
+    """Each distinct contract gets one result; a bad code fails only itself."""
+    load_contracts(server.service, TSMC, TXF)
+    server.service.client.kbars.side_effect = lambda contract, start, end: (
+        minute_kbars("09:01", 3 if contract.code == "2330" else 2)
+    )
+    query = provider_pb2.GetKbarsRequest(
+        start_date="2026-10-16", end_date="2026-10-16"
+    )
+    results = {
+        r.contract_code: r
+        for r in server.stub.GetKbarsBatch(
+            provider_pb2.GetKbarsBatchRequest(
+                contract_codes=["2330", "TXFK6", "2330", "0000"],
+                query=query,
+                parallelism=2,
+            ),
+            timeout=5,
+        )
+    }
+    assert sorted(results) == ["0000", "2330", "TXFK6"]
+    assert len(results["2330"].kbars.ts) == 3
+    assert len(results["TXFK6"].kbars.ts) == 2
+    assert not results["2330"].error
+    assert "Contract not found" in results["0000"].error
+    assert server.service.client.kbars.call_count == 2
+    with pytest.raises(grpc.RpcError) as error:
+        list(
+            server.stub.GetKbarsBatch(
+                provider_pb2.GetKbarsBatchRequest(query=query), timeout=5
+            )
+        )
+    assert error.value.code() == grpc.StatusCode.INVALID_ARGUMENT
@@ -0,0 +1,94 @@
+"""
+provider.tests.test_ratelimit -.
+"""
+
+import pytest
+import ratelimit
+from ratelimit import RateLimitExceeded, TokenBucket
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(mocker):
+    """A frozen time.monotonic() that the test advances by hand."""
+    now = [1000.0]
+    mocker.patch.object(ratelimit.time, "monotonic", side_effect=lambda: now[0])
+    return now
+
+
+def test_burst_then_paced(clock):
+    """The burst is free; later callers queue one interval apart."""
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+    clock[0] += 0.2
+    assert bucket.reserve() == pytest.approx(0.1)
+
+
+def test_refill_is_capped_at_burst(clock):
+    """An idle bucket never holds more than burst tokens."""
+    bucket = TokenBucket(rate=10, burst=2)
+    clock[0] += 60
+    delays = [bucket.reserve() for _ in range(3)]
+    assert delays == [0.0, 0.0, pytest.approx(0.1)]
+
+
+def test_deadline_rejects_and_returns_the_token(clock):
+    """A reservation due after the deadline fails and leaves the queue as it was."""
+    bucket = TokenBucket(rate=10, burst=1)
+    bucket.reserve()
+    with pytest.raises(RateLimitExceeded):
+        bucket.reserve(deadline=clock[0] + 0.05)
+    assert bucket.reserve(deadline=clock[0] + 0.1) == pytest.approx(0.1)
+
+
+def test_acquire_sleeps_for_the_delay(clock, mocker):
+    """acquire() sleeps only when the bucket is empty."""
+    sleep = mocker.patch.object(ratelimit.time, "sleep")
+    bucket = TokenBucket(rate=4, burst=1)
+    bucket.acquire()
+    sleep.assert_not_called()
+    bucket.acquire()
+    sleep.assert_called_once_with(pytest.approx(0.25))
+    assert clock[0] == 1000.0
+
+
+@pytest.mark.parametrize(
+    "spec, expected",
+    [
+        ("20/50", (20.0, 50)),
+        ("4", (4.0, 4)),
+        ("0.5", (0.5, 1)),
+        ("off", None),
+        ("0", None),
+        ("", None),
+    ],
+)
+def test_from_spec(spec, expected):
+    """Specs are "rate/burst"; the burst defaults to the rate."""
+    bucket = TokenBucket.from_spec(spec)
+    if expected is None:
+        assert bucket is None
+    else:
+        assert bucket is not None
+        assert (bucket.rate, bucket.burst) == expected
+
+
+def test_rate_limiter_skips_unlimited_classes():
+    """Classes without a bucket are never limited."""
+    limiter = ratelimit.RateLimiter({"orders": TokenBucket(1, 1), "quote": None})
+    assert list(limiter.buckets) == ["orders"]
+    limiter.acquire("quote")
+    limiter.acquire("account")
+    assert limiter.describe() == "orders=1/s burst 1"
+
+
+def test_rate_limiter_reserve_returns_the_delay(clock):
+    """RateLimiter.reserve() hands back the wait instead of sleeping."""
+    limiter = ratelimit.RateLimiter({"orders": TokenBucket(10, 1)})
+    assert limiter.reserve("orders") == 0.0
+    assert limiter.reserve("orders") == pytest.approx(0.1)
+    assert limiter.reserve("account") == 0.0
+    with pytest.raises(RateLimitExceeded):
+        limiter.reserve("orders", deadline=clock[0] + 0.1)
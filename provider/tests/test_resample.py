@@ -0,0 +1,187 @@
+"""
+provider.tests.test_resample -.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import resample
+from column_store import TICK_COLUMNS
+from conftest import ns
+
+
+def kbars(stamps, closes, volumes=None):
+    """1-minute kbars labelled by the given end times."""
+    volumes = volumes or [1] * len(stamps)
+    return SimpleNamespace(
+        ts=[ns(s) for s in stamps],
+        Open=list(closes),
+        High=[c + 1 for c in closes],
+        Low=[c - 1 for c in closes],
+        Close=list(closes),
+        Volume=list(volumes),
+        Amount=[c * v for c, v in zip(closes, volumes)],
+    )
+
+
+def ticks(stamps, closes, volumes):
+    """Ticks at the given times."""
+    return SimpleNamespace(
+        ts=[ns(s) for s in stamps], close=list(closes), volume=list(volumes)
+    )
+
+
+def test_resample_minutes_from_session_open():
+    """5-minute buckets count from 08:45, labelled with their last bar."""
+    bars = kbars(
+        [
+            "2026-10-16 08:46",
+            "2026-10-16 08:50",
+            "2026-10-16 08:51",
+            "2026-10-16 08:53",
+        ],
+        [100.0, 103.0, 99.0, 101.0],
+        [1, 2, 3, 4],
+    )
+    out = resample.resample_kbars(bars, 5, resample.TAIFEX_SESSIONS)
+    assert out.ts == [ns("2026-10-16 08:50"), ns("2026-10-16 08:53")]
+    assert out.Open == [100.0, 99.0]
+    assert out.High == [104.0, 102.0]
+    assert out.Low == [99.0, 98.0]
+    assert out.Close == [103.0, 101.0]
+    assert out.Volume == [3, 7]
+
+
+def test_resample_daily_joins_night_session_to_next_day():
+    """A Friday night session is settled with Monday's day session."""
+    bars = kbars(
+        [
+            "2026-10-15 13:45",
+            "2026-10-16 15:01",
+            "2026-10-17 04:59",
+            "2026-10-19 08:46",
+            "2026-10-19 13:45",
+        ],
+        [10.0, 11.0, 12.0, 13.0, 14.0],
+    )
+    out = resample.resample_kbars(bars, resample.DAILY, resample.TAIFEX_SESSIONS)
+    assert out.ts == [ns("2026-10-15 13:45"), ns("2026-10-19 13:45")]
+    assert out.Open == [10.0, 11.0]
+    assert out.Volume == [1, 4]
+
+
+def test_resample_one_minute_is_identity():
+    """Nothing to aggregate at the source interval."""
+    bars = kbars(["2026-10-16 08:46"], [1.0])
+    assert resample.resample_kbars(bars, 1, resample.TAIFEX_SESSIONS) is bars
+
+
+def test_time_bars_are_labelled_with_their_end():
+    """TIME bars are aligned to the clock."""
+    data = ticks(
+        ["2026-10-16 09:00:01", "2026-10-16 09:00:59", "2026-10-16 09:01:30"],
+        [10.0, 12.0, 11.0],
+        [1, 2, 3],
+    )
+    out = resample.tick_bars(data, resample.TIME, 60, resample.TWSE_SESSIONS)
+    assert out.ts == [ns("2026-10-16 09:01"), ns("2026-10-16 09:02")]
+    assert out.Open == [10.0, 11.0]
+    assert out.High == [12.0, 11.0]
+    assert out.Close == [12.0, 11.0]
+    assert out.Volume == [3, 3]
+    assert out.Amount == [34.0, 33.0]
+
+
+def test_tick_count_bars():
+    """TICKS bars close every size ticks; the last one may be short."""
+    stamps = [f"2026-10-16 09:00:{s:02d}" for s in range(7)]
+    data = ticks(stamps, [float(n) for n in range(7)], [1] * 7)
+    out = resample.tick_bars(data, resample.TICKS, 3, resample.TWSE_SESSIONS)
+    assert out.Open == [0.0, 3.0, 6.0]
+    assert out.Close == [2.0, 5.0, 6.0]
+    assert out.ts == [ns(stamps[2]), ns(stamps[5]), ns(stamps[6])]
+
+
+def test_tick_bars_restart_at_session_open():
+    """The count starts over with the night session."""
+    data = ticks(
+        [
+            "2026-10-16 13:44",
+            "2026-10-16 13:45",
+            "2026-10-16 15:00",
+            "2026-10-16 15:01",
+        ],
+        [1.0, 2.0, 3.0, 4.0],
+        [1, 1, 1, 1],
+    )
+    out = resample.tick_bars(data, resample.TICKS, 3, resample.TAIFEX_SESSIONS)
+    assert out.Volume == [2, 2]
+    assert out.Open == [1.0, 3.0]
+
+
+def test_tick_bars_empty():
+    """No ticks give no bars."""
+    data = ticks([], [], [])
+    out = resample.tick_bars(data, resample.VOLUME, 10, resample.TWSE_SESSIONS)
+    assert not out.ts
+
+
+def test_volume_bars_restart_count_at_each_bar():
+    """A large tick does not shorten the bars after it."""
+    stamps = [f"2026-10-16 09:00:{s:02d}" for s in range(6)]
+    data = ticks(stamps, [1.0] * 6, [9, 1, 1, 1, 1, 1])
+    out = resample.tick_bars(data, resample.VOLUME, 5, resample.TWSE_SESSIONS)
+    assert out.Volume == [9, 5]
+
+
+def test_volume_bars_reach_size():
+    """Every bar but the last holds at least size volume."""
+    rng = np.random.default_rng(7)
+    volume = rng.integers(1, 40, size=500)
+    start = ns("2026-10-16 09:00")
+    data = SimpleNamespace(
+        ts=[start + n * 10**9 for n in range(volume.size)],
+        close=rng.uniform(100, 110, size=volume.size).tolist(),
+        volume=volume.tolist(),
+    )
+    out = resample.tick_bars(data, resample.VOLUME, 50, resample.TWSE_SESSIONS)
+    assert all(v >= 50 for v in out.Volume[:-1])
+    assert sum(out.Volume) == volume.sum()
+    # Each bar closes with the tick that reaches size, never later.
+    ends = np.searchsorted(data.ts, out.ts)
+    assert all(v - volume[e] < 50 for v, e in zip(out.Volume, ends))
+
+
+def test_downsample_kbars_keeps_envelope():
+    """Merged runs keep the highest high, lowest low and total volume."""
+    bars = kbars(
+        [f"2026-10-16 09:{m:02d}" for m in range(1, 7)], [5.0, 9.0, 1.0, 4.0, 4.0, 6.0]
+    )
+    out = resample.downsample_kbars(bars, 2)
+    assert out.ts == [bars.ts[2], bars.ts[5]]
+    assert out.High == [10.0, 7.0]
+    assert out.Low == [0.0, 3.0]
+    assert out.Volume == [3, 3]
+
+
+def test_downsample_ticks_keeps_extremes():
+    """M4 keeps each bucket's first, last, lowest and highest tick, in order."""
+    closes = [100.0] * 100
+    closes[10], closes[30], closes[70] = 120.0, 80.0, 90.0
+    data = SimpleNamespace(**{name: list(range(100)) for name, _ in TICK_COLUMNS})
+    data.close = closes
+    out = resample.downsample_ticks(data, 8)
+    assert len(out.ts) <= 8
+    assert out.ts == sorted(out.ts)
+    assert {0, 10, 30, 49, 50, 70, 99} <= set(out.ts)
+    assert out.close[out.ts.index(10)] == 120.0
+    assert out.volume == out.ts
+
+
+def test_downsample_leaves_small_inputs():
+    """Inputs within max_points, or without a limit, come back unchanged."""
+    bars = kbars(["2026-10-16 09:01", "2026-10-16 09:02"], [1.0, 2.0])
+    assert resample.downsample_kbars(bars, 2) is bars
+    assert resample.downsample_kbars(bars, 0) is bars
+    data = ticks(["2026-10-16 09:00:01"], [1.0], [1])
+    assert resample.downsample_ticks(data, 4) is data
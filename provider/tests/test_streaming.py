@@ -0,0 +1,217 @@
+"""
+provider.tests.test_streaming -.
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from streaming import (
+    Broadcaster,
+    ConflatedSubscription,
+    EventLog,
+    ReplayGapError,
+    Subscription,
+)
+
+
+def test_get_drains_everything_queued():
+    """A read returns every queued item in publish order."""
+    subscription = Subscription(10)
+    for item in range(3):
+        assert subscription.publish(item)
+    assert subscription.get(timeout=0) == [0, 1, 2]
+    assert not subscription.get(timeout=0)
+
+
+def test_get_wakes_on_publish():
+    """A blocked reader is woken by a publish from another thread."""
+    subscription = Subscription(10)
+    threading.Timer(0.05, subscription.publish, args=("tick",)).start()
+    assert subscription.get(timeout=5) == ["tick"]
+
+
+def test_full_queue_overflows_instead_of_blocking():
+    """Publishing past maxsize closes the subscription and drops its backlog."""
+    subscription = Subscription(2)
+    assert subscription.publish(1)
+    assert subscription.publish(2)
+    assert not subscription.publish(3)
+    assert subscription.overflowed
+    assert subscription.closed
+    assert not subscription.get(timeout=0)
+    assert not subscription.publish(4)
+
+
+def test_close_wakes_reader():
+    """Closing a subscription releases a blocked reader with nothing."""
+    subscription = Subscription(10)
+    threading.Timer(0.05, subscription.close).start()
+    assert not subscription.get(timeout=5)
+    assert subscription.closed
+    assert not subscription.overflowed
+
+
+def test_aget_wakes_on_publish_from_another_thread():
+    """An awaiting reader is woken through its loop by a callback thread."""
+    subscription = Subscription(10)
+
+    async def read():
+        threading.Timer(0.05, subscription.publish, args=("tick",)).start()
+        return await subscription.aget(timeout=5)
+
+    assert asyncio.run(read()) == ["tick"]
+
+
+def test_aget_times_out_empty():
+    """aget returns nothing once its timeout passes."""
+    assert not asyncio.run(Subscription(10).aget(timeout=0.01))
+
+
+def test_broadcaster_fans_out_by_code():
+    """Each subscription gets only the codes it subscribed to."""
+    hub = Broadcaster()
+    both, first = Subscription(10), Subscription(10)
+    hub.subscribe(["2330", "2317"], both)
+    hub.subscribe(["2330"], first)
+    hub.publish("2330", "a")
+    hub.publish("2317", "b")
+    hub.publish("2454", "c")
+    assert both.get(timeout=0) == ["a", "b"]
+    assert first.get(timeout=0) == ["a"]
+
+
+def test_broadcaster_upstream_hooks_fire_on_first_and_last():
+    """Upstream (un)subscribes happen once per code, not once per stream."""
+    events = []
+    hub = Broadcaster(
+        on_first=lambda code: events.append(("first", code)),
+        on_last=lambda code: events.append(("last", code)),
+    )
+    one, two = Subscription(10), Subscription(10)
+    hub.subscribe(["2330"], one)
+    hub.subscribe(["2330"], two)
+    hub.unsubscribe(one)
+    assert events == [("first", "2330")]
+    hub.unsubscribe(two)
+    assert events == [("first", "2330"), ("last", "2330")]
+    assert not hub.has_subscribers("2330")
+    assert not hub.codes()
+
+
+def book(code: str, price: float) -> SimpleNamespace:
+    """A bid/ask update; only the code matters to a subscription."""
+    return SimpleNamespace(code=code, price=price)
+
+
+def test_conflated_keeps_latest_per_code():
+    """A read returns only the newest item of each code since the last read."""
+    subscription = ConflatedSubscription(interval=0)
+    for price in (1.0, 2.0, 3.0):
+        subscription.publish(book("2330", price))
+    subscription.publish(book("2317", 9.0))
+    assert [(b.code, b.price) for b in subscription.get(timeout=0)] == [
+        ("2330", 3.0),
+        ("2317", 9.0),
+    ]
+
+
+def test_conflated_never_overflows():
+    """Conflation bounds the buffer by codes, so a slow reader is not dropped."""
+    subscription = ConflatedSubscription(interval=0)
+    for price in range(10_000):
+        assert subscription.publish(book("2330", price))
+    assert not subscription.overflowed
+    assert [b.price for b in subscription.get(timeout=0)] == [9_999]
+
+
+def test_conflated_reads_are_paced():
+    """A read within interval of the previous one waits out the interval."""
+    subscription = ConflatedSubscription(interval=0.2)
+    subscription.publish(book("2330", 1.0))
+    subscription.get(timeout=0)
+    subscription.publish(book("2330", 2.0))
+    started = time.monotonic()
+    assert [b.price for b in subscription.get(timeout=0)] == [2.0]
+    assert time.monotonic() - started >= 0.15
+
+
+def filled(capacity: int, count: int) -> EventLog:
+    """An event log holding events 1..count, each event being its own seq."""
+    log = EventLog(capacity)
+    for _ in range(count):
+        log.append(lambda seq: seq)
+    return log
+
+
+def test_new_events_only_by_default():
+    """A plain subscription sees only events appended after it."""
+    log = filled(10, 3)
+    subscription = Subscription(10)
+    log.subscribe(subscription)
+    log.append(lambda seq: seq)
+    assert subscription.get(timeout=0) == [4]
+
+
+def test_replay_after_since_seq_then_live():
+    """Retained events after since_seq come first, then live ones, in order."""
+    log = filled(10, 5)
+    subscription = Subscription(10)
+    log.subscribe(subscription, since_seq=3, epoch=log.epoch)
+    log.append(lambda seq: seq)
+    assert subscription.get(timeout=0) == [4, 5, 6]
+    assert log.last_seq == 6
+
+
+def test_replay_everything():
+    """replay with since_seq 0 sends every retained event."""
+    log = filled(3, 5)
+    subscription = Subscription(10)
+    log.subscribe(subscription, replay=True)
+    assert subscription.get(timeout=0) == [3, 4, 5]
+
+
+def test_evicted_resume_point_is_a_gap():
+    """Resuming before the retained window fails instead of skipping events."""
+    log = filled(3, 5)
+    with pytest.raises(ReplayGapError, match="no longer retained"):
+        log.subscribe(Subscription(10), since_seq=1)
+    log.subscribe(Subscription(10), since_seq=2)
+
+
+def test_resume_from_another_epoch_is_a_gap():
+    """A since_seq numbered by a previous provider is rejected."""
+    log = filled(10, 5)
+    with pytest.raises(ReplayGapError, match="has ended"):
+        log.subscribe(Subscription(10), since_seq=2, epoch="previous")
+    assert EventLog(10).epoch != log.epoch
+
+
+def test_resume_ahead_of_newest_is_a_gap():
+    """A since_seq the log never issued is rejected."""
+    log = filled(10, 2)
+    with pytest.raises(ReplayGapError, match="ahead"):
+        log.subscribe(Subscription(10), since_seq=7)
+
+
+def test_unsubscribe_stops_delivery():
+    """A detached subscription gets nothing more."""
+    log = EventLog(10)
+    subscription = Subscription(10)
+    log.subscribe(subscription)
+    log.unsubscribe(subscription)
+    log.append(lambda seq: seq)
+    assert not subscription.get(timeout=0)
+
+
+def test_overflow_closes_the_subscription():
+    """A full subscription is closed instead of blocking the publisher."""
+    log = EventLog(10)
+    subscription = Subscription(2)
+    log.subscribe(subscription)
+    for _ in range(3):
+        log.append(lambda seq: seq)
+    assert subscription.overflowed
+    assert subscription.closed
@@ -0,0 +1,100 @@
+"""
+provider.tests.test_trade_index -.
+"""
+
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+from trade_index import TradeIndex
+
+
+def trade(order_id: str, status: str = "Submitted") -> SimpleNamespace:
+    """A minimal Shioaji-like trade."""
+    return SimpleNamespace(
+        order=SimpleNamespace(id=order_id, seqno=f"s{order_id}"),
+        status=SimpleNamespace(
+            status=status,
+            msg="",
+            modified_price=0,
+            order_quantity=1,
+            deal_quantity=0,
+            cancel_quantity=0,
+            deals=[],
+        ),
+    )
+
+
+@pytest.fixture(name="trades")
+def fixture_trades() -> List[SimpleNamespace]:
+    """The client's trade list, mutated by tests."""
+    return [trade("a"), trade("b"), trade("c")]
+
+
+def test_add_indexes_by_seqno_and_id(trades):
+    """A trade added after placing is found by either key without a reload."""
+    index = TradeIndex(list)
+    index.add(trades[0])
+    assert index.find(seqno="sa") is trades[0]
+    assert index.find(trade_id="a") is trades[0]
+    assert len(index) == 1
+
+
+def test_find_reloads_once_on_a_miss(trades):
+    """A trade placed outside the index is found after one reload."""
+    index = TradeIndex(lambda: trades)
+    index.refresh()
+    late = trade("z")
+    trades.append(late)
+    assert index.find(trade_id="z") is late
+    assert index.find(seqno="sa") is trades[0]
+    assert index.find(seqno="nope") is None
+
+
+def ids(trades) -> List[str]:
+    """Order ids of trades."""
+    return [t.order.id for t in trades]
+
+
+def test_first_call_returns_everything(trades):
+    """Watermark 0 lists every trade and one version per trade."""
+    index = TradeIndex(lambda: trades)
+    changed, version = index.changed_since(0)
+    assert ids(changed) == ["a", "b", "c"]
+    assert version == index.version == 3
+
+
+def test_only_changed_trades_after_a_watermark(trades):
+    """A status change bumps just that trade; an unchanged poll is empty."""
+    index = TradeIndex(lambda: trades)
+    _, version = index.changed_since(0)
+    assert index.changed_since(version, index.epoch) == ([], version)
+    trades[1].status.deal_quantity = 1
+    trades.append(trade("d"))
+    changed, newer = index.changed_since(version, index.epoch)
+    assert ids(changed) == ["b", "d"]
+    assert newer == version + 2
+
+
+def test_touch_bumps_a_trade(trades):
+    """An order event touching a trade makes it show up in the next delta."""
+    index = TradeIndex(lambda: trades)
+    _, version = index.changed_since(0)
+    assert index.touch(seqno="sc")
+    assert not index.touch(trade_id="missing")
+    changed, _ = index.changed_since(version)
+    assert ids(changed) == ["c"]
+
+
+def test_watermark_from_another_index_returns_everything(trades):
+    """After a restart, an old watermark must not hide trades."""
+    old = TradeIndex(lambda: trades)
+    old.changed_since(0)
+    old.touch(trade_id="a")
+    index = TradeIndex(lambda: trades)
+    index.changed_since(0)
+    changed, _ = index.changed_since(2, old.epoch)
+    assert ids(changed) == ["a", "b", "c"]
+    # Without an epoch, only a watermark from the future is caught.
+    changed, _ = index.changed_since(old.version)
+    assert ids(changed) == ["a", "b", "c"]